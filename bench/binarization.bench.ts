@@ -0,0 +1,116 @@
+/**
+ * Benchmark the binary encoding and decoding against JSON.
+ */
+
+import * as AasBinarization from "../src/binarization";
+import * as AasJsonization from "../src/jsonization";
+import * as AasTypes from "../src/types";
+
+import * as BenchCommon from "./common";
+
+/**
+ * Generate an environment with a submodel of many numeric properties and
+ * a blob, as is typical for the exchange between the services.
+ */
+function generateTimeSeriesEnvironment(): AasTypes.Environment {
+  const elements = new Array<AasTypes.ISubmodelElement>();
+  for (let i = 0; i < 1000; i++) {
+    const property = new AasTypes.Property(AasTypes.DataTypeDefXsd.Double);
+    property.idShort = `sample${i}`;
+    property.value = `${(i * 0.125).toFixed(3)}`;
+    property.semanticId = new AasTypes.Reference(
+      AasTypes.ReferenceTypes.GlobalReference,
+      [
+        new AasTypes.Key(
+          AasTypes.KeyTypes.GlobalReference,
+          "urn:something:measurement:temperature"
+        )
+      ]
+    );
+    elements.push(property);
+  }
+
+  const blob = new AasTypes.Blob("application/octet-stream");
+  blob.idShort = "snapshot";
+  blob.value = new Uint8Array(64 * 1024);
+  for (let i = 0; i < blob.value.length; i++) {
+    blob.value[i] = (i * 31) % 256;
+  }
+  elements.push(blob);
+
+  const submodel = new AasTypes.Submodel("urn:something:time-series");
+  submodel.submodelElements = elements;
+
+  return new AasTypes.Environment(null, [submodel]);
+}
+
+test("binary against JSON", () => {
+  const cases: Array<[string, Array<AasTypes.Environment>]> = [
+    ["test data", BenchCommon.loadExpectedEnvironments()],
+    ["time series", [generateTimeSeriesEnvironment()]]
+  ];
+
+  const measurements = new Array<BenchCommon.Measurement>();
+  const sizes = new Array<string>();
+
+  for (const [name, environments] of cases) {
+    const texts = environments.map((environment) =>
+      JSON.stringify(AasJsonization.toJsonable(environment))
+    );
+    const binaries = environments.map((environment) =>
+      AasBinarization.toBinary(environment)
+    );
+
+    // Test the benchmark
+    for (const binary of binaries) {
+      expect(AasBinarization.environmentFromBinary(binary).error).toBeNull();
+    }
+
+    let textSize = 0;
+    for (const text of texts) {
+      textSize += text.length;
+    }
+    let binarySize = 0;
+    for (const binary of binaries) {
+      binarySize += binary.length;
+    }
+    sizes.push(
+      `${name}: ${textSize} characters of JSON, ${binarySize} bytes of binary`
+    );
+
+    measurements.push(
+      BenchCommon.measure(`${name}: encode JSON`, () => {
+        for (const environment of environments) {
+          JSON.stringify(AasJsonization.toJsonable(environment));
+        }
+      })
+    );
+
+    measurements.push(
+      BenchCommon.measure(`${name}: encode binary`, () => {
+        for (const environment of environments) {
+          AasBinarization.toBinary(environment);
+        }
+      })
+    );
+
+    measurements.push(
+      BenchCommon.measure(`${name}: decode JSON`, () => {
+        for (const text of texts) {
+          AasJsonization.environmentFromJsonable(JSON.parse(text));
+        }
+      })
+    );
+
+    measurements.push(
+      BenchCommon.measure(`${name}: decode binary`, () => {
+        for (const binary of binaries) {
+          AasBinarization.environmentFromBinary(binary);
+        }
+      })
+    );
+  }
+
+  BenchCommon.report("binarization", measurements);
+  process.stdout.write(sizes.join("\n") + "\n\n");
+});
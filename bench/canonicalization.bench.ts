@@ -0,0 +1,60 @@
+/**
+ * Benchmark the canonical JSON against `JSON.stringify`.
+ */
+
+import * as AasCanonicalization from "../src/canonicalization";
+import * as AasCommon from "../src/common";
+import * as AasJsonization from "../src/jsonization";
+import * as AasTypes from "../src/types";
+
+import * as BenchCommon from "./common";
+
+/**
+ * Generate a submodel with `count` properties with a semantic ID.
+ */
+function generateSubmodel(count: number): AasTypes.Submodel {
+  const submodel = new AasTypes.Submodel("urn:something:submodel");
+  submodel.submodelElements = new Array<AasTypes.ISubmodelElement>();
+
+  for (let i = 0; i < count; i++) {
+    const property = new AasTypes.Property(AasTypes.DataTypeDefXsd.String);
+    property.idShort = `property${i}`;
+    property.value = `Größe ${i}`;
+    property.semanticId = new AasTypes.Reference(
+      AasTypes.ReferenceTypes.GlobalReference,
+      [
+        new AasTypes.Key(
+          AasTypes.KeyTypes.GlobalReference,
+          `urn:something:property${i}`
+        )
+      ]
+    );
+    submodel.submodelElements.push(property);
+  }
+
+  return submodel;
+}
+
+test("canonical JSON against JSON.stringify", () => {
+  const submodel = generateSubmodel(1000);
+  const jsonable = AasJsonization.toJsonable(submodel);
+
+  // Test the benchmark
+  const bytes = AasCanonicalization.canonicalize(jsonable);
+  const text = Buffer.from(bytes).toString("utf-8");
+  expect(JSON.parse(text)).toEqual(jsonable);
+
+  const measurements = [
+    BenchCommon.measure("JSON.stringify and UTF-8 encoding", () => {
+      AasCommon.utf8Encode(JSON.stringify(jsonable));
+    }),
+    BenchCommon.measure("canonical JSON", () => {
+      AasCanonicalization.canonicalize(jsonable);
+    }),
+    BenchCommon.measure("digest of the instance", () => {
+      AasCanonicalization.digest(submodel);
+    })
+  ];
+
+  BenchCommon.report("canonicalization", measurements);
+});
@@ -0,0 +1,235 @@
+/**
+ * Provide common functionality to be re-used across different benchmarks.
+ *
+ * @remarks
+ * The benchmarks are run with `npm run bench`. They expect the same environment
+ * variables as the tests, most importantly `AAS_CORE3_0_RC02_TYPESCRIPT_TEST_DATA_DIR`.
+ *
+ * If `AAS_CORE3_0_RC02_TYPESCRIPT_BENCH_OUTPUT_DIR` is set, the measurements are
+ * stored as JSON in that directory. If `AAS_CORE3_0_RC02_TYPESCRIPT_BENCH_BASELINE_DIR`
+ * is set, the measurements are compared against the ones previously stored there,
+ * so that you can run a benchmark on two revisions and see the speed-up.
+ */
+
+import * as fs from "fs";
+import * as path from "path";
+import { performance } from "perf_hooks";
+
+import * as AasJsonization from "../src/jsonization";
+import * as AasStringification from "../src/stringification";
+import * as AasTypes from "../src/types";
+
+import * as TestCommon from "../test/common";
+
+const BENCH_OUTPUT_DIR = process.env["AAS_CORE3_0_RC02_TYPESCRIPT_BENCH_OUTPUT_DIR"];
+const BENCH_BASELINE_DIR =
+  process.env["AAS_CORE3_0_RC02_TYPESCRIPT_BENCH_BASELINE_DIR"];
+
+/**
+ * Represent a single measurement of a benchmarked operation.
+ */
+export class Measurement {
+  /**
+   * Human-readable name of the measured operation
+   */
+  readonly name: string;
+
+  /**
+   * Number of times the operation has been executed
+   */
+  readonly iterations: number;
+
+  /**
+   * Total time spent in the operation, in milliseconds
+   */
+  readonly elapsed: number;
+
+  constructor(name: string, iterations: number, elapsed: number) {
+    this.name = name;
+    this.iterations = iterations;
+    this.elapsed = elapsed;
+  }
+
+  /**
+   * @returns average time of a single operation in nanoseconds
+   */
+  nanosecondsPerOperation(): number {
+    return (this.elapsed * 1e6) / this.iterations;
+  }
+}
+
+/**
+ * Measure the time of `operation` by repeating it until at least `budget`
+ * milliseconds elapsed.
+ *
+ * @remarks
+ * We execute the operation a couple of times before the measurement so that
+ * the JIT compiler can kick in.
+ *
+ * @param name - human-readable name of the operation
+ * @param operation - to be measured
+ * @param budget - minimum time in milliseconds to spend in the measurement
+ * @returns the measurement
+ */
+export function measure(
+  name: string,
+  operation: () => void,
+  budget = 200
+): Measurement {
+  for (let i = 0; i < 10; i++) {
+    operation();
+  }
+
+  let iterations = 0;
+  let batch = 1;
+  const start = performance.now();
+  let elapsed = 0;
+  while (elapsed < budget) {
+    for (let i = 0; i < batch; i++) {
+      operation();
+    }
+    iterations += batch;
+    batch *= 2;
+    elapsed = performance.now() - start;
+  }
+
+  return new Measurement(name, iterations, elapsed);
+}
+
+/**
+ * Format `nanoseconds` in a human-readable manner.
+ */
+function formatDuration(nanoseconds: number): string {
+  if (nanoseconds < 1e3) {
+    return `${nanoseconds.toFixed(1)} ns`;
+  } else if (nanoseconds < 1e6) {
+    return `${(nanoseconds / 1e3).toFixed(1)} µs`;
+  } else {
+    return `${(nanoseconds / 1e6).toFixed(1)} ms`;
+  }
+}
+
+/**
+ * Pad `text` with spaces on the right up to `width`.
+ */
+function padRight(text: string, width: number): string {
+  return text.length >= width ? text : text + " ".repeat(width - text.length);
+}
+
+/**
+ * Pad `text` with spaces on the left up to `width`.
+ */
+function padLeft(text: string, width: number): string {
+  return text.length >= width ? text : " ".repeat(width - text.length) + text;
+}
+
+/**
+ * Print the `measurements` as a table, store them and compare them against
+ * the baseline, if specified.
+ *
+ * @param title - of the benchmark, also used as file name for storing the results
+ * @param measurements - to be reported
+ */
+export function report(title: string, measurements: Array<Measurement>): void {
+  let baseline: Map<string, number> | null = null;
+  if (BENCH_BASELINE_DIR !== undefined) {
+    const baselinePath = path.join(BENCH_BASELINE_DIR, `${title}.json`);
+    if (fs.existsSync(baselinePath)) {
+      baseline = new Map<string, number>(
+        JSON.parse(fs.readFileSync(baselinePath, "utf-8"))
+      );
+    }
+  }
+
+  const lines = new Array<string>();
+  lines.push(`# ${title}`);
+  for (const measurement of measurements) {
+    const nsPerOp = measurement.nanosecondsPerOperation();
+    let line = padRight(measurement.name, 48) + padLeft(formatDuration(nsPerOp), 12);
+
+    const baselineNsPerOp = baseline?.get(measurement.name);
+    if (baselineNsPerOp !== undefined) {
+      line +=
+        ` (baseline: ${formatDuration(baselineNsPerOp)}, ` +
+        `speed-up: ${(baselineNsPerOp / nsPerOp).toFixed(2)}x)`;
+    }
+    lines.push(line);
+  }
+  process.stdout.write(lines.join("\n") + "\n\n");
+
+  if (BENCH_OUTPUT_DIR !== undefined) {
+    fs.mkdirSync(BENCH_OUTPUT_DIR, { recursive: true });
+    fs.writeFileSync(
+      path.join(BENCH_OUTPUT_DIR, `${title}.json`),
+      JSON.stringify(
+        measurements.map((measurement) => [
+          measurement.name,
+          measurement.nanosecondsPerOperation()
+        ])
+      ),
+      "utf-8"
+    );
+  }
+}
+
+/**
+ * Load all the environments from the expected JSON examples of the test data.
+ *
+ * @returns environments de-serialized from the test data
+ */
+export function loadExpectedEnvironments(): Array<AasTypes.Environment> {
+  const result = new Array<AasTypes.Environment>();
+
+  const directory = path.join(
+    TestCommon.TEST_DATA_DIR,
+    "Json",
+    "ContainedInEnvironment",
+    "Expected"
+  );
+
+  for (const aPath of TestCommon.findFilesBySuffixRecursively(directory, ".json")) {
+    const jsonable = TestCommon.readJsonFromFileSync(aPath);
+    const environmentOrError = AasJsonization.environmentFromJsonable(jsonable);
+    if (environmentOrError.error !== null) {
+      throw new Error(
+        `Failed to de-serialize ${aPath}: ` +
+          `${environmentOrError.error.path}: ${environmentOrError.error.message}`
+      );
+    }
+    result.push(environmentOrError.mustValue());
+  }
+
+  return result;
+}
+
+/**
+ * Group all the instances beneath and including the `environments`
+ * by the names of their classes, as given by their model types.
+ *
+ * @param environments - to be iterated over
+ * @returns instances grouped by their class names
+ */
+export function groupInstancesByClass(
+  environments: Iterable<AasTypes.Environment>
+): Map<string, Array<AasTypes.Class>> {
+  const result = new Map<string, Array<AasTypes.Class>>();
+
+  const add = (instance: AasTypes.Class) => {
+    const name = AasStringification.mustModelTypeToString(instance);
+    let instances = result.get(name);
+    if (instances === undefined) {
+      instances = new Array<AasTypes.Class>();
+      result.set(name, instances);
+    }
+    instances.push(instance);
+  };
+
+  for (const environment of environments) {
+    add(environment);
+    for (const instance of environment.descend()) {
+      add(instance);
+    }
+  }
+
+  return result;
+}
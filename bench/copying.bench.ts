@@ -0,0 +1,82 @@
+/**
+ * Benchmark the deep copy against the round trip through JSON.
+ */
+
+import * as AasCopying from "../src/copying";
+import * as AasEquality from "../src/equality";
+import * as AasJsonization from "../src/jsonization";
+import * as AasTypes from "../src/types";
+
+import * as BenchCommon from "./common";
+
+/**
+ * Generate an environment with `count` submodels, each holding `fanOut`
+ * properties with a semantic ID and a blob.
+ */
+function generateEnvironment(count: number, fanOut: number): AasTypes.Environment {
+  const submodels = new Array<AasTypes.Submodel>();
+  for (let i = 0; i < count; i++) {
+    const submodel = new AasTypes.Submodel(`urn:something:submodel${i}`);
+    submodel.submodelElements = new Array<AasTypes.ISubmodelElement>();
+
+    for (let j = 0; j < fanOut; j++) {
+      const property = new AasTypes.Property(AasTypes.DataTypeDefXsd.Int);
+      property.idShort = `property${j}`;
+      property.value = `${j}`;
+      property.semanticId = new AasTypes.Reference(
+        AasTypes.ReferenceTypes.GlobalReference,
+        [
+          new AasTypes.Key(
+            AasTypes.KeyTypes.GlobalReference,
+            `urn:something:property${j}`
+          )
+        ]
+      );
+      submodel.submodelElements.push(property);
+    }
+
+    const blob = new AasTypes.Blob("application/octet-stream");
+    blob.idShort = "blob";
+    blob.value = new Uint8Array(1024);
+    submodel.submodelElements.push(blob);
+
+    submodels.push(submodel);
+  }
+
+  return new AasTypes.Environment(null, submodels);
+}
+
+function copyThroughJson(that: AasTypes.Environment): AasTypes.Environment {
+  return AasJsonization.environmentFromJsonable(
+    AasJsonization.toJsonable(that)
+  ).mustValue();
+}
+
+test("deep copy against the round trip through JSON", () => {
+  const environment = generateEnvironment(100, 50);
+
+  // Test the benchmark
+  expect(AasEquality.deepEquals(environment, copyThroughJson(environment))).toBe(
+    true
+  );
+  expect(AasEquality.deepEquals(environment, AasCopying.deepCopy(environment))).toBe(
+    true
+  );
+
+  const measurements = [
+    BenchCommon.measure("round trip through JSON", () => {
+      copyThroughJson(environment);
+    }),
+    BenchCommon.measure("deep copy", () => {
+      AasCopying.deepCopy(environment);
+    }),
+    BenchCommon.measure("deep copy with the blob values", () => {
+      AasCopying.deepCopy(environment, { copyBlobValues: true });
+    }),
+    BenchCommon.measure("deep copy sharing the leaves", () => {
+      AasCopying.deepCopy(environment, { shareLeaves: true });
+    })
+  ];
+
+  BenchCommon.report("deep copy", measurements);
+});
@@ -0,0 +1,106 @@
+/**
+ * Benchmark the de-serialization of {@link deserialization} per concrete class.
+ *
+ * @remarks
+ * The measurements are named the same as in `jsonization.fromJsonable`, so that
+ * you can compare the two reports line by line.
+ */
+
+import * as AasCommon from "../src/common";
+import * as AasDeserialization from "../src/deserialization";
+import * as AasJsonization from "../src/jsonization";
+import * as AasTypes from "../src/types";
+
+import * as BenchCommon from "./common";
+
+type Deserializer = (
+  jsonable: AasJsonization.JsonValue
+) => AasCommon.Either<AasTypes.Class, AasJsonization.DeserializationError>;
+
+const DESERIALIZERS = new Map<string, Deserializer>([
+  ["Extension", AasDeserialization.extensionFromJsonable],
+  [
+    "AdministrativeInformation",
+    AasDeserialization.administrativeInformationFromJsonable
+  ],
+  ["Qualifier", AasDeserialization.qualifierFromJsonable],
+  ["AssetAdministrationShell", AasDeserialization.assetAdministrationShellFromJsonable],
+  ["AssetInformation", AasDeserialization.assetInformationFromJsonable],
+  ["Resource", AasDeserialization.resourceFromJsonable],
+  ["SpecificAssetId", AasDeserialization.specificAssetIdFromJsonable],
+  ["Submodel", AasDeserialization.submodelFromJsonable],
+  ["RelationshipElement", AasDeserialization.relationshipElementFromJsonable],
+  ["SubmodelElementList", AasDeserialization.submodelElementListFromJsonable],
+  [
+    "SubmodelElementCollection",
+    AasDeserialization.submodelElementCollectionFromJsonable
+  ],
+  ["Property", AasDeserialization.propertyFromJsonable],
+  ["MultiLanguageProperty", AasDeserialization.multiLanguagePropertyFromJsonable],
+  ["Range", AasDeserialization.rangeFromJsonable],
+  ["ReferenceElement", AasDeserialization.referenceElementFromJsonable],
+  ["Blob", AasDeserialization.blobFromJsonable],
+  ["File", AasDeserialization.fileFromJsonable],
+  [
+    "AnnotatedRelationshipElement",
+    AasDeserialization.annotatedRelationshipElementFromJsonable
+  ],
+  ["Entity", AasDeserialization.entityFromJsonable],
+  ["EventPayload", AasDeserialization.eventPayloadFromJsonable],
+  ["BasicEventElement", AasDeserialization.basicEventElementFromJsonable],
+  ["Operation", AasDeserialization.operationFromJsonable],
+  ["OperationVariable", AasDeserialization.operationVariableFromJsonable],
+  ["Capability", AasDeserialization.capabilityFromJsonable],
+  ["ConceptDescription", AasDeserialization.conceptDescriptionFromJsonable],
+  ["Reference", AasDeserialization.referenceFromJsonable],
+  ["Key", AasDeserialization.keyFromJsonable],
+  ["LangString", AasDeserialization.langStringFromJsonable],
+  ["Environment", AasDeserialization.environmentFromJsonable],
+  [
+    "EmbeddedDataSpecification",
+    AasDeserialization.embeddedDataSpecificationFromJsonable
+  ],
+  ["ValueReferencePair", AasDeserialization.valueReferencePairFromJsonable],
+  ["ValueList", AasDeserialization.valueListFromJsonable],
+  [
+    "DataSpecificationIec61360",
+    AasDeserialization.dataSpecificationIec61360FromJsonable
+  ],
+  [
+    "DataSpecificationPhysicalUnit",
+    AasDeserialization.dataSpecificationPhysicalUnitFromJsonable
+  ]
+]);
+
+test("de-serialization per class", () => {
+  const instancesByClass = BenchCommon.groupInstancesByClass(
+    BenchCommon.loadExpectedEnvironments()
+  );
+
+  const measurements = new Array<BenchCommon.Measurement>();
+
+  for (const [className, deserializer] of DESERIALIZERS) {
+    const instances = instancesByClass.get(className);
+    if (instances === undefined) {
+      // There are no examples of this class contained in an environment.
+      continue;
+    }
+
+    const jsonables = instances.map((instance) => AasJsonization.toJsonable(instance));
+
+    // Test the benchmark
+    for (const jsonable of jsonables) {
+      expect(deserializer(jsonable).error).toBeNull();
+    }
+
+    measurements.push(
+      BenchCommon.measure(className, () => {
+        for (const jsonable of jsonables) {
+          deserializer(jsonable);
+        }
+      })
+    );
+  }
+
+  BenchCommon.report("deserialization.fromJsonable", measurements);
+});
@@ -0,0 +1,124 @@
+/**
+ * Benchmark the de-serialization with the interning against the one without,
+ * both in time and in memory.
+ *
+ * @remarks
+ * Run node with `--expose-gc` to get more reliable measurements of the memory.
+ */
+
+import * as AasDeserialization from "../src/deserialization";
+import * as AasJsonization from "../src/jsonization";
+import * as AasTypes from "../src/types";
+
+import * as BenchCommon from "./common";
+
+/**
+ * Generate the JSON of an environment with `count` submodels, each holding
+ * `fanOut` properties, where the semantic IDs and the descriptions repeat
+ * across the submodels as they do in practice.
+ */
+function generateJsonable(count: number, fanOut: number): AasJsonization.JsonValue {
+  const submodels = new Array<AasTypes.Submodel>();
+  for (let i = 0; i < count; i++) {
+    const submodel = new AasTypes.Submodel(`urn:something:submodel${i}`);
+    submodel.submodelElements = new Array<AasTypes.ISubmodelElement>();
+
+    for (let j = 0; j < fanOut; j++) {
+      const property = new AasTypes.Property(AasTypes.DataTypeDefXsd.Int);
+      property.idShort = `property${j}`;
+      property.value = `${i * fanOut + j}`;
+      property.semanticId = new AasTypes.Reference(
+        AasTypes.ReferenceTypes.GlobalReference,
+        [
+          new AasTypes.Key(
+            AasTypes.KeyTypes.GlobalReference,
+            `https://example.com/ids/cd/${j}`
+          )
+        ]
+      );
+      property.description = [
+        new AasTypes.LangString("en", `Description of the property ${j}`),
+        new AasTypes.LangString("de", `Beschreibung der Eigenschaft ${j}`)
+      ];
+      submodel.submodelElements.push(property);
+    }
+
+    submodels.push(submodel);
+  }
+
+  return AasJsonization.toJsonable(new AasTypes.Environment(null, submodels));
+}
+
+/**
+ * Collect the garbage, if node runs with `--expose-gc`.
+ */
+function collectGarbage(): void {
+  const gc = (<{ gc?: () => void }>(<unknown>globalThis)).gc;
+  if (gc !== undefined) {
+    gc();
+  }
+}
+
+/**
+ * Measure the heap retained by the result of `deserialize` in bytes.
+ */
+function measureRetainedHeap(deserialize: () => AasTypes.Environment): number {
+  collectGarbage();
+  const before = process.memoryUsage().heapUsed;
+
+  const environment = deserialize();
+
+  collectGarbage();
+  const after = process.memoryUsage().heapUsed;
+
+  // Keep the environment alive up to this point
+  expect(environment).not.toBeNull();
+
+  return after - before;
+}
+
+/**
+ * Count the distinct instances in `that` environment.
+ */
+function countInstances(that: AasTypes.Environment): number {
+  return new Set<AasTypes.Class>(that.descend()).size + 1;
+}
+
+test("de-serialization with the interning", () => {
+  const jsonable = generateJsonable(100, 100);
+
+  const plain = () => AasDeserialization.environmentFromJsonable(jsonable).mustValue();
+  const interned = () =>
+    AasDeserialization.environmentFromJsonable(jsonable, {
+      interning: new AasDeserialization.InterningPool()
+    }).mustValue();
+
+  // Test the benchmark
+  expect(AasJsonization.toJsonable(interned())).toEqual(jsonable);
+
+  const plainInstances = countInstances(plain());
+  const internedInstances = countInstances(interned());
+  expect(internedInstances).toBeLessThan(plainInstances);
+
+  const plainHeap = measureRetainedHeap(plain);
+  const internedHeap = measureRetainedHeap(interned);
+
+  process.stdout.write(
+    "# memory of the de-serialization with the interning\n" +
+      `instances without interning: ${plainInstances}\n` +
+      `instances with interning:    ${internedInstances}\n` +
+      `heap without interning:      ${(plainHeap / 1024 / 1024).toFixed(1)} MiB\n` +
+      `heap with interning:         ${(internedHeap / 1024 / 1024).toFixed(1)} MiB\n\n`
+  );
+
+  const measurements = [
+    BenchCommon.measure("without interning", () => {
+      plain();
+    }),
+    BenchCommon.measure("with interning", () => {
+      interned();
+    })
+  ];
+
+  BenchCommon.report("de-serialization with the interning", measurements);
+});
@@ -0,0 +1,86 @@
+/**
+ * Benchmark the diff of a small change in a large environment against sending
+ * the whole environment.
+ */
+
+import * as AasDiffing from "../src/diffing";
+import * as AasJsonization from "../src/jsonization";
+import * as AasTypes from "../src/types";
+
+import * as BenchCommon from "./common";
+
+/**
+ * Generate an environment with `count` submodels, each holding `fanOut`
+ * properties.
+ */
+function generateEnvironment(count: number, fanOut: number): AasTypes.Environment {
+  const submodels = new Array<AasTypes.Submodel>();
+  for (let i = 0; i < count; i++) {
+    const submodel = new AasTypes.Submodel(`urn:something:submodel${i}`);
+    submodel.submodelElements = new Array<AasTypes.ISubmodelElement>();
+
+    for (let j = 0; j < fanOut; j++) {
+      const property = new AasTypes.Property(AasTypes.DataTypeDefXsd.Int);
+      property.idShort = `property${j}`;
+      property.value = `${j}`;
+      submodel.submodelElements.push(property);
+    }
+
+    submodels.push(submodel);
+  }
+
+  return new AasTypes.Environment(null, submodels);
+}
+
+/**
+ * Change the value of the last property of the last submodel of `that`.
+ *
+ * @remarks
+ * Only the changed path is copied, the rest is shared with `that`.
+ */
+function changeLastProperty(that: AasTypes.Environment): AasTypes.Environment {
+  const submodels = [...(that.submodels ?? [])];
+  const last = submodels[submodels.length - 1];
+
+  const elements = [...(last.submodelElements ?? [])];
+  const property = new AasTypes.Property(AasTypes.DataTypeDefXsd.Int);
+  property.idShort = elements[elements.length - 1].idShort;
+  property.value = "changed";
+  elements[elements.length - 1] = property;
+
+  const submodel = new AasTypes.Submodel(last.id);
+  submodel.submodelElements = elements;
+  submodels[submodels.length - 1] = submodel;
+
+  return new AasTypes.Environment(null, submodels);
+}
+
+test("diff of a small change against the whole environment", () => {
+  const environment = generateEnvironment(100, 100);
+  const shared = changeLastProperty(environment);
+
+  // The same change without sharing anything with the original environment
+  const separate = changeLastProperty(generateEnvironment(100, 100));
+
+  // Test the benchmark
+  expect(AasDiffing.diff(environment, shared)).toHaveLength(1);
+  expect(AasDiffing.diff(environment, separate)).toHaveLength(1);
+
+  const measurements = [
+    BenchCommon.measure("whole environment as JSON text", () => {
+      JSON.stringify(AasJsonization.toJsonable(shared));
+    }),
+    BenchCommon.measure("diff with shared sub-trees as JSON text", () => {
+      JSON.stringify(
+        AasDiffing.changesToJsonable(AasDiffing.diff(environment, shared))
+      );
+    }),
+    BenchCommon.measure("diff without shared sub-trees as JSON text", () => {
+      JSON.stringify(
+        AasDiffing.changesToJsonable(AasDiffing.diff(environment, separate))
+      );
+    })
+  ];
+
+  BenchCommon.report("diff of a small change", measurements);
+});
@@ -0,0 +1,100 @@
+/**
+ * Benchmark the structural comparison against the comparison of the serialized
+ * JSON.
+ */
+
+import * as AasEquality from "../src/equality";
+import * as AasJsonization from "../src/jsonization";
+import * as AasTypes from "../src/types";
+
+import * as BenchCommon from "./common";
+
+/**
+ * Generate a submodel with `count` collections, each holding `fanOut` properties
+ * and a blob.
+ */
+function generateSubmodel(count: number, fanOut: number): AasTypes.Submodel {
+  const elements = new Array<AasTypes.ISubmodelElement>();
+
+  for (let i = 0; i < count; i++) {
+    const collection = new AasTypes.SubmodelElementCollection();
+    collection.idShort = `collection${i}`;
+    collection.value = new Array<AasTypes.ISubmodelElement>();
+
+    for (let j = 0; j < fanOut; j++) {
+      const property = new AasTypes.Property(AasTypes.DataTypeDefXsd.Int);
+      property.idShort = `property${j}`;
+      property.value = `${i * fanOut + j}`;
+      collection.value.push(property);
+    }
+
+    const blob = new AasTypes.Blob("application/octet-stream");
+    blob.idShort = "blob";
+    blob.value = new Uint8Array(256).fill(i % 256);
+    collection.value.push(blob);
+
+    elements.push(collection);
+  }
+
+  const submodel = new AasTypes.Submodel("urn:something:submodel");
+  submodel.submodelElements = elements;
+  return submodel;
+}
+
+test("structural comparison against JSON", () => {
+  const submodel = generateSubmodel(100, 20);
+  const other = generateSubmodel(100, 20);
+
+  // Test the benchmark
+  expect(AasEquality.deepEquals(submodel, other)).toBe(true);
+  expect(JSON.stringify(AasJsonization.toJsonable(submodel))).toEqual(
+    JSON.stringify(AasJsonization.toJsonable(other))
+  );
+
+  // Change a single property deep down in the copy
+  const changed = generateSubmodel(100, 20);
+  const lastCollection = <AasTypes.SubmodelElementCollection>(
+    (changed.submodelElements ?? [])[99]
+  );
+  (<AasTypes.Property>(lastCollection.value ?? [])[19]).value = "changed";
+  expect(AasEquality.deepEquals(submodel, changed)).toBe(false);
+
+  const memo = new WeakMap<AasTypes.Class, number>();
+  AasEquality.hash(submodel, memo);
+  AasEquality.hash(other, memo);
+  AasEquality.hash(changed, memo);
+
+  let equalCount = 0;
+
+  const measurements = [
+    BenchCommon.measure("equal by JSON", () => {
+      if (
+        JSON.stringify(AasJsonization.toJsonable(submodel)) ===
+        JSON.stringify(AasJsonization.toJsonable(other))
+      ) {
+        equalCount++;
+      }
+    }),
+    BenchCommon.measure("equal by deepEquals", () => {
+      if (AasEquality.deepEquals(submodel, other)) {
+        equalCount++;
+      }
+    }),
+    BenchCommon.measure("hash", () => {
+      AasEquality.hash(submodel);
+    }),
+    BenchCommon.measure("hash with a warm memo", () => {
+      AasEquality.hash(submodel, memo);
+    }),
+    BenchCommon.measure("unequal by deepEquals", () => {
+      AasEquality.deepEquals(submodel, changed);
+    }),
+    BenchCommon.measure("unequal by deepEquals with a warm memo", () => {
+      AasEquality.deepEquals(submodel, changed, memo);
+    })
+  ];
+
+  expect(equalCount).toBeGreaterThan(0);
+
+  BenchCommon.report("structural comparison", measurements);
+});
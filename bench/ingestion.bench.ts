@@ -0,0 +1,74 @@
+/**
+ * Benchmark the de-serialization and the verification in a single pass against
+ * the separate calls.
+ */
+
+import * as AasIngestion from "../src/ingestion";
+import * as AasJsonization from "../src/jsonization";
+import * as AasTypes from "../src/types";
+import * as AasVerification from "../src/verification";
+
+import * as BenchCommon from "./common";
+
+/**
+ * Generate an environment with `count` submodels, each holding `fanOut`
+ * properties with a semantic ID.
+ */
+function generateEnvironment(count: number, fanOut: number): AasTypes.Environment {
+  const submodels = new Array<AasTypes.Submodel>();
+  for (let i = 0; i < count; i++) {
+    const submodel = new AasTypes.Submodel(`urn:something:submodel${i}`);
+    submodel.submodelElements = new Array<AasTypes.ISubmodelElement>();
+
+    for (let j = 0; j < fanOut; j++) {
+      const property = new AasTypes.Property(AasTypes.DataTypeDefXsd.Int);
+      property.idShort = `property${j}`;
+      property.value = `${j}`;
+      property.semanticId = new AasTypes.Reference(
+        AasTypes.ReferenceTypes.GlobalReference,
+        [
+          new AasTypes.Key(
+            AasTypes.KeyTypes.GlobalReference,
+            `urn:something:property${j}`
+          )
+        ]
+      );
+      submodel.submodelElements.push(property);
+    }
+
+    submodels.push(submodel);
+  }
+
+  return new AasTypes.Environment(null, submodels);
+}
+
+test("single pass against the separate de-serialization and verification", () => {
+  const jsonable = AasJsonization.toJsonable(generateEnvironment(100, 50));
+
+  const separately = (): Array<AasVerification.VerificationError> =>
+    Array.from(
+      AasVerification.verify(
+        AasJsonization.environmentFromJsonable(jsonable).mustValue()
+      )
+    );
+
+  // Test the benchmark
+  expect(separately()).toEqual([]);
+  expect(AasIngestion.environmentFromJsonable(jsonable).mustValue().errors).toEqual(
+    []
+  );
+
+  const measurements = [
+    BenchCommon.measure("de-serialize only", () => {
+      AasJsonization.environmentFromJsonable(jsonable);
+    }),
+    BenchCommon.measure("de-serialize, then verify", () => {
+      separately();
+    }),
+    BenchCommon.measure("de-serialize and verify in a single pass", () => {
+      AasIngestion.environmentFromJsonable(jsonable);
+    })
+  ];
+
+  BenchCommon.report("ingestion", measurements);
+});
@@ -0,0 +1,94 @@
+/**
+ * Benchmark the JSON de-serialization per concrete class.
+ *
+ * @remarks
+ * The benchmark uses only the public API, so that you can run it on different
+ * revisions of the SDK and compare the results with
+ * `AAS_CORE3_0_RC02_TYPESCRIPT_BENCH_BASELINE_DIR`.
+ */
+
+import * as AasCommon from "../src/common";
+import * as AasJsonization from "../src/jsonization";
+import * as AasTypes from "../src/types";
+
+import * as BenchCommon from "./common";
+
+type Deserializer = (
+  jsonable: AasJsonization.JsonValue
+) => AasCommon.Either<AasTypes.Class, AasJsonization.DeserializationError>;
+
+const DESERIALIZERS = new Map<string, Deserializer>([
+  ["Extension", AasJsonization.extensionFromJsonable],
+  ["AdministrativeInformation", AasJsonization.administrativeInformationFromJsonable],
+  ["Qualifier", AasJsonization.qualifierFromJsonable],
+  ["AssetAdministrationShell", AasJsonization.assetAdministrationShellFromJsonable],
+  ["AssetInformation", AasJsonization.assetInformationFromJsonable],
+  ["Resource", AasJsonization.resourceFromJsonable],
+  ["SpecificAssetId", AasJsonization.specificAssetIdFromJsonable],
+  ["Submodel", AasJsonization.submodelFromJsonable],
+  ["RelationshipElement", AasJsonization.relationshipElementFromJsonable],
+  ["SubmodelElementList", AasJsonization.submodelElementListFromJsonable],
+  ["SubmodelElementCollection", AasJsonization.submodelElementCollectionFromJsonable],
+  ["Property", AasJsonization.propertyFromJsonable],
+  ["MultiLanguageProperty", AasJsonization.multiLanguagePropertyFromJsonable],
+  ["Range", AasJsonization.rangeFromJsonable],
+  ["ReferenceElement", AasJsonization.referenceElementFromJsonable],
+  ["Blob", AasJsonization.blobFromJsonable],
+  ["File", AasJsonization.fileFromJsonable],
+  [
+    "AnnotatedRelationshipElement",
+    AasJsonization.annotatedRelationshipElementFromJsonable
+  ],
+  ["Entity", AasJsonization.entityFromJsonable],
+  ["EventPayload", AasJsonization.eventPayloadFromJsonable],
+  ["BasicEventElement", AasJsonization.basicEventElementFromJsonable],
+  ["Operation", AasJsonization.operationFromJsonable],
+  ["OperationVariable", AasJsonization.operationVariableFromJsonable],
+  ["Capability", AasJsonization.capabilityFromJsonable],
+  ["ConceptDescription", AasJsonization.conceptDescriptionFromJsonable],
+  ["Reference", AasJsonization.referenceFromJsonable],
+  ["Key", AasJsonization.keyFromJsonable],
+  ["LangString", AasJsonization.langStringFromJsonable],
+  ["Environment", AasJsonization.environmentFromJsonable],
+  ["EmbeddedDataSpecification", AasJsonization.embeddedDataSpecificationFromJsonable],
+  ["ValueReferencePair", AasJsonization.valueReferencePairFromJsonable],
+  ["ValueList", AasJsonization.valueListFromJsonable],
+  ["DataSpecificationIec61360", AasJsonization.dataSpecificationIec61360FromJsonable],
+  [
+    "DataSpecificationPhysicalUnit",
+    AasJsonization.dataSpecificationPhysicalUnitFromJsonable
+  ]
+]);
+
+test("de-serialization per class", () => {
+  const instancesByClass = BenchCommon.groupInstancesByClass(
+    BenchCommon.loadExpectedEnvironments()
+  );
+
+  const measurements = new Array<BenchCommon.Measurement>();
+
+  for (const [className, deserializer] of DESERIALIZERS) {
+    const instances = instancesByClass.get(className);
+    if (instances === undefined) {
+      // There are no examples of this class contained in an environment.
+      continue;
+    }
+
+    const jsonables = instances.map((instance) => AasJsonization.toJsonable(instance));
+
+    // Test the benchmark
+    for (const jsonable of jsonables) {
+      expect(deserializer(jsonable).error).toBeNull();
+    }
+
+    measurements.push(
+      BenchCommon.measure(className, () => {
+        for (const jsonable of jsonables) {
+          deserializer(jsonable);
+        }
+      })
+    );
+  }
+
+  BenchCommon.report("jsonization.fromJsonable", measurements);
+});
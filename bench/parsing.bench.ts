@@ -0,0 +1,90 @@
+/**
+ * Benchmark the parsing of JSON text against `JSON.parse` followed by
+ * the de-serialization.
+ */
+
+import * as AasJsonization from "../src/jsonization";
+import * as AasParsing from "../src/parsing";
+import * as AasTypes from "../src/types";
+
+import * as BenchCommon from "./common";
+
+/**
+ * Generate an environment with `count` submodels, each holding `fanOut`
+ * collections of properties with a semantic ID.
+ */
+function generateEnvironment(count: number, fanOut: number): AasTypes.Environment {
+  const submodels = new Array<AasTypes.Submodel>();
+  for (let i = 0; i < count; i++) {
+    const submodel = new AasTypes.Submodel(`urn:something:submodel${i}`);
+    submodel.submodelElements = new Array<AasTypes.ISubmodelElement>();
+
+    for (let j = 0; j < fanOut; j++) {
+      const collection = new AasTypes.SubmodelElementCollection();
+      collection.idShort = `collection${j}`;
+      collection.value = new Array<AasTypes.ISubmodelElement>();
+
+      for (let k = 0; k < fanOut; k++) {
+        const property = new AasTypes.Property(AasTypes.DataTypeDefXsd.Int);
+        property.idShort = `property${k}`;
+        property.value = `${k}`;
+        property.semanticId = new AasTypes.Reference(
+          AasTypes.ReferenceTypes.GlobalReference,
+          [
+            new AasTypes.Key(
+              AasTypes.KeyTypes.GlobalReference,
+              `urn:something:property${k}`
+            )
+          ]
+        );
+        collection.value.push(property);
+      }
+
+      submodel.submodelElements.push(collection);
+    }
+
+    submodels.push(submodel);
+  }
+
+  return new AasTypes.Environment(null, submodels);
+}
+
+test("parsing against JSON.parse and de-serialization", () => {
+  const environment = generateEnvironment(20, 20);
+
+  // The serializer writes the model types last. We also measure the text where
+  // the model types come first, as written by some other tools.
+  const text = JSON.stringify(AasJsonization.toJsonable(environment));
+  const textModelTypesFirst = JSON.stringify(
+    AasJsonization.toJsonable(environment),
+    (key, value) =>
+      value !== null && typeof value === "object" && "modelType" in value
+        ? { modelType: value["modelType"], ...value }
+        : value
+  );
+
+  // Test the benchmark
+  const expected = AasJsonization.toJsonable(environment);
+  for (const aText of [text, textModelTypesFirst]) {
+    expect(
+      AasJsonization.toJsonable(AasParsing.environmentFromText(aText).mustValue())
+    ).toEqual(expected);
+  }
+
+  const measurements = [
+    BenchCommon.measure("JSON.parse only", () => {
+      JSON.parse(text);
+    }),
+    BenchCommon.measure("JSON.parse and de-serialization", () => {
+      AasJsonization.environmentFromJsonable(JSON.parse(text));
+    }),
+    BenchCommon.measure("parsing", () => {
+      AasParsing.environmentFromText(text);
+    }),
+    BenchCommon.measure("parsing with the model types first", () => {
+      AasParsing.environmentFromText(textModelTypesFirst);
+    })
+  ];
+
+  BenchCommon.report("parsing", measurements);
+});
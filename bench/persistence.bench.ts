@@ -0,0 +1,68 @@
+/**
+ * Benchmark the verification with the persisted results against the full one.
+ */
+
+import * as AasPersistence from "../src/persistence";
+import * as AasTypes from "../src/types";
+import * as AasVerification from "../src/verification";
+
+import * as BenchCommon from "./common";
+
+/**
+ * Generate an environment with `count` submodels, each holding `fanOut`
+ * properties with a semantic ID.
+ */
+function generateEnvironment(count: number, fanOut: number): AasTypes.Environment {
+  const submodels = new Array<AasTypes.Submodel>();
+  for (let i = 0; i < count; i++) {
+    const submodel = new AasTypes.Submodel(`urn:something:submodel${i}`);
+    submodel.submodelElements = new Array<AasTypes.ISubmodelElement>();
+
+    for (let j = 0; j < fanOut; j++) {
+      const property = new AasTypes.Property(AasTypes.DataTypeDefXsd.DateTime);
+      property.idShort = `property${j}`;
+      property.value = `2022-11-23T12:00:${j < 10 ? "0" : ""}${j % 60}Z`;
+      property.semanticId = new AasTypes.Reference(
+        AasTypes.ReferenceTypes.GlobalReference,
+        [
+          new AasTypes.Key(
+            AasTypes.KeyTypes.GlobalReference,
+            `urn:something:property${j}`
+          )
+        ]
+      );
+      submodel.submodelElements.push(property);
+    }
+
+    submodels.push(submodel);
+  }
+
+  return new AasTypes.Environment(null, submodels);
+}
+
+test("verification with the persisted results against the full one", () => {
+  const environment = generateEnvironment(100, 50);
+
+  const store = new AasPersistence.MemoryResultStore();
+
+  // Test the benchmark
+  expect(Array.from(AasVerification.verify(environment))).toEqual([]);
+  expect(Array.from(AasPersistence.verify(environment, store))).toEqual([]);
+  expect(store.size).toEqual(100);
+
+  const measurements = [
+    BenchCommon.measure("full verification", () => {
+      Array.from(AasVerification.verify(environment));
+    }),
+    BenchCommon.measure("keys of the submodels", () => {
+      for (const submodel of environment.submodels ?? []) {
+        AasPersistence.keyOf(submodel);
+      }
+    }),
+    BenchCommon.measure("verification with the persisted results", () => {
+      Array.from(AasPersistence.verify(environment, store));
+    })
+  ];
+
+  BenchCommon.report("persistence", measurements);
+});
@@ -0,0 +1,93 @@
+/**
+ * Benchmark the serialization limited in depth and without the blob values
+ * against the serialization in full followed by pruning.
+ */
+
+import * as AasJsonization from "../src/jsonization";
+import * as AasSerialization from "../src/serialization";
+import * as AasTypes from "../src/types";
+
+import * as BenchCommon from "./common";
+
+/**
+ * Generate a tree of collections `depth` levels deep, where each collection
+ * holds `fanOut` sub-collections, or properties and a blob at the bottom.
+ */
+function generateCollections(
+  depth: number,
+  fanOut: number,
+  prefix: string
+): Array<AasTypes.ISubmodelElement> {
+  const elements = new Array<AasTypes.ISubmodelElement>();
+
+  if (depth === 0) {
+    for (let i = 0; i < fanOut; i++) {
+      const property = new AasTypes.Property(AasTypes.DataTypeDefXsd.Int);
+      property.idShort = `${prefix}property${i}`;
+      property.value = `${i}`;
+      elements.push(property);
+    }
+
+    const blob = new AasTypes.Blob("application/octet-stream");
+    blob.idShort = `${prefix}blob`;
+    blob.value = new Uint8Array(256);
+    elements.push(blob);
+
+    return elements;
+  }
+
+  for (let i = 0; i < fanOut; i++) {
+    const collection = new AasTypes.SubmodelElementCollection();
+    collection.idShort = `${prefix}collection${i}`;
+    collection.value = generateCollections(depth - 1, fanOut, `${prefix}${i}_`);
+    elements.push(collection);
+  }
+
+  return elements;
+}
+
+/**
+ * Remove the values of the nested collections and the blobs from the serialized
+ * submodel, as one would without the serialization options.
+ */
+function pruneToCore(jsonable: AasJsonization.JsonObject): void {
+  for (const element of <Array<AasJsonization.JsonObject>>(
+    jsonable["submodelElements"]
+  )) {
+    if (element["modelType"] === "SubmodelElementCollection") {
+      delete element["value"];
+    }
+  }
+}
+
+test("serialization limited in depth against pruning", () => {
+  const submodel = new AasTypes.Submodel("urn:something:deep-submodel");
+  submodel.submodelElements = generateCollections(5, 4, "");
+
+  const core: AasSerialization.SerializationOptions = {
+    depth: 1,
+    withoutBlobValue: true
+  };
+
+  // Test the benchmark
+  const pruned = AasSerialization.toJsonable(submodel);
+  pruneToCore(pruned);
+  expect(AasSerialization.toJsonable(submodel, core)).toEqual(pruned);
+
+  const measurements = [
+    BenchCommon.measure("deep", () => {
+      AasSerialization.toJsonable(submodel);
+    }),
+    BenchCommon.measure("deep without blob values", () => {
+      AasSerialization.toJsonable(submodel, { withoutBlobValue: true });
+    }),
+    BenchCommon.measure("core by pruning the deep serialization", () => {
+      pruneToCore(AasSerialization.toJsonable(submodel));
+    }),
+    BenchCommon.measure("core with the options", () => {
+      AasSerialization.toJsonable(submodel, core);
+    })
+  ];
+
+  BenchCommon.report("serialization by level and extent", measurements);
+});
@@ -0,0 +1,85 @@
+/**
+ * Benchmark the ValueOnly and the Metadata representations against the full
+ * serialization.
+ */
+
+import * as AasSerialization from "../src/serialization";
+import * as AasTypes from "../src/types";
+
+import * as BenchCommon from "./common";
+
+/**
+ * Generate `count` collections, each holding `fanOut` properties.
+ */
+function generateCollections(
+  count: number,
+  fanOut: number
+): Array<AasTypes.ISubmodelElement> {
+  const elements = new Array<AasTypes.ISubmodelElement>();
+
+  for (let i = 0; i < count; i++) {
+    const collection = new AasTypes.SubmodelElementCollection();
+    collection.idShort = `collection${i}`;
+    collection.value = new Array<AasTypes.ISubmodelElement>();
+
+    for (let j = 0; j < fanOut; j++) {
+      const property = new AasTypes.Property(AasTypes.DataTypeDefXsd.Double);
+      property.idShort = `property${j}`;
+      property.value = `${i}.${j}`;
+      property.semanticId = new AasTypes.Reference(
+        AasTypes.ReferenceTypes.GlobalReference,
+        [
+          new AasTypes.Key(
+            AasTypes.KeyTypes.GlobalReference,
+            `urn:something:property${j}`
+          )
+        ]
+      );
+      collection.value.push(property);
+    }
+
+    elements.push(collection);
+  }
+
+  return elements;
+}
+
+test("ValueOnly and Metadata against the full serialization", () => {
+  const submodel = new AasTypes.Submodel("urn:something:submodel");
+  submodel.submodelElements = generateCollections(100, 20);
+
+  // Test the benchmark
+  expect(Array.from(AasSerialization.toValueOnlyText(submodel)).join("")).toEqual(
+    JSON.stringify(AasSerialization.toValueOnlyJsonable(submodel))
+  );
+
+  // We count the characters so that the chunks are actually consumed.
+  let characters = 0;
+
+  const measurements = [
+    BenchCommon.measure("full", () => {
+      AasSerialization.toJsonable(submodel);
+    }),
+    BenchCommon.measure("ValueOnly", () => {
+      AasSerialization.toValueOnlyJsonable(submodel);
+    }),
+    BenchCommon.measure("Metadata", () => {
+      AasSerialization.toMetadataJsonable(submodel);
+    }),
+    BenchCommon.measure("full as text", () => {
+      JSON.stringify(AasSerialization.toJsonable(submodel));
+    }),
+    BenchCommon.measure("ValueOnly as text", () => {
+      JSON.stringify(AasSerialization.toValueOnlyJsonable(submodel));
+    }),
+    BenchCommon.measure("ValueOnly as text in chunks", () => {
+      for (const chunk of AasSerialization.toValueOnlyText(submodel)) {
+        characters += chunk.length;
+      }
+    })
+  ];
+
+  expect(characters).toBeGreaterThan(0);
+
+  BenchCommon.report("ValueOnly and Metadata", measurements);
+});
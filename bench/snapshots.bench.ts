@@ -0,0 +1,79 @@
+/**
+ * Benchmark the copy-on-write snapshots against the deep copies.
+ */
+
+import * as AasCopying from "../src/copying";
+import * as AasSnapshots from "../src/snapshots";
+import * as AasTypes from "../src/types";
+
+import * as BenchCommon from "./common";
+
+/**
+ * Generate an environment with `count` submodels, each holding `fanOut`
+ * properties.
+ */
+function generateEnvironment(count: number, fanOut: number): AasTypes.Environment {
+  const submodels = new Array<AasTypes.Submodel>();
+  for (let i = 0; i < count; i++) {
+    const submodel = new AasTypes.Submodel(`urn:something:submodel${i}`);
+    submodel.submodelElements = new Array<AasTypes.ISubmodelElement>();
+
+    for (let j = 0; j < fanOut; j++) {
+      const property = new AasTypes.Property(AasTypes.DataTypeDefXsd.Int);
+      property.idShort = `property${j}`;
+      property.value = `${j}`;
+      submodel.submodelElements.push(property);
+    }
+
+    submodels.push(submodel);
+  }
+
+  return new AasTypes.Environment(null, submodels);
+}
+
+test("copy-on-write snapshots against the deep copies", () => {
+  const environment = generateEnvironment(100, 50);
+
+  const path = [
+    "submodels",
+    "urn:something:submodel50",
+    "submodelElements",
+    "property25"
+  ];
+
+  let value = 0;
+  const store = new AasSnapshots.SnapshotStore(environment);
+
+  // Test the benchmark
+  expect(
+    store.update(path, (copy) => {
+      (<AasTypes.Property>copy).value = `${value++}`;
+    })
+  ).toBeNull();
+  expect(store.changesSince(environment)).toHaveLength(1);
+
+  let snapshot = store.current;
+
+  const measurements = [
+    BenchCommon.measure("deep copy and edit", () => {
+      const copy = AasCopying.deepCopy(snapshot);
+      const submodel = (copy.submodels ?? [])[50];
+      (<AasTypes.Property>(submodel.submodelElements ?? [])[25]).value = `${value++}`;
+      snapshot = copy;
+    }),
+    BenchCommon.measure("copy-on-write update", () => {
+      store.update(path, (copy) => {
+        (<AasTypes.Property>copy).value = `${value++}`;
+      });
+    }),
+    BenchCommon.measure("changes since the previous snapshot", () => {
+      const previous = store.current;
+      store.update(path, (copy) => {
+        (<AasTypes.Property>copy).value = `${value++}`;
+      });
+      store.changesSince(previous);
+    })
+  ];
+
+  BenchCommon.report("copy-on-write snapshots", measurements);
+});
@@ -0,0 +1,59 @@
+/**
+ * Benchmark the cold start, *i.e.*, the time needed to evaluate the modules
+ * on import.
+ *
+ * @remarks
+ * Each import is executed in an isolated module registry so that the modules are
+ * evaluated anew on every iteration. The transpilation is cached by Jest after
+ * the warm-up, so only the evaluation of the modules is measured.
+ */
+
+import * as BenchCommon from "./common";
+
+/**
+ * Evaluate the module at `modulePath` in a fresh module registry and pass it
+ * on to `use`, if specified.
+ */
+function importFresh(
+  modulePath: string,
+  // eslint-disable-next-line @typescript-eslint/no-explicit-any
+  use: ((module: any) => void) | null = null
+): void {
+  jest.isolateModules(() => {
+    // eslint-disable-next-line @typescript-eslint/no-var-requires
+    const module = require(modulePath);
+    if (use !== null) {
+      use(module);
+    }
+  });
+}
+
+test("cold start", () => {
+  const measurements = new Array<BenchCommon.Measurement>();
+
+  for (const modulePath of [
+    "../src/common",
+    "../src/types",
+    "../src/jsonization",
+    "../src/verification",
+    "../src/index"
+  ]) {
+    measurements.push(
+      BenchCommon.measure(`import ${modulePath.replace("../src/", "")}`, () => {
+        importFresh(modulePath);
+      })
+    );
+  }
+
+  // The patterns are compiled on first use, so we report the cost of the first
+  // check as well in order not to hide it.
+  measurements.push(
+    BenchCommon.measure("import verification and check a value", () => {
+      importFresh("../src/verification", (AasVerification) => {
+        AasVerification.matchesXsDateTime("2022-11-23T12:34:56Z");
+      });
+    })
+  );
+
+  BenchCommon.report("startup", measurements);
+});
@@ -0,0 +1,101 @@
+/**
+ * Benchmark an index kept up-to-date through the tracking against rebuilding it.
+ */
+
+import * as AasTracking from "../src/tracking";
+import * as AasTypes from "../src/types";
+
+import * as BenchCommon from "./common";
+
+/**
+ * Generate an environment with `count` submodels, each holding `fanOut`
+ * properties with a semantic ID.
+ */
+function generateEnvironment(count: number, fanOut: number): AasTypes.Environment {
+  const submodels = new Array<AasTypes.Submodel>();
+  for (let i = 0; i < count; i++) {
+    const submodel = new AasTypes.Submodel(`urn:something:submodel${i}`);
+    submodel.submodelElements = new Array<AasTypes.ISubmodelElement>();
+
+    for (let j = 0; j < fanOut; j++) {
+      const property = new AasTypes.Property(AasTypes.DataTypeDefXsd.Int);
+      property.idShort = `property${j}`;
+      property.value = `${j}`;
+      property.semanticId = new AasTypes.Reference(
+        AasTypes.ReferenceTypes.GlobalReference,
+        [
+          new AasTypes.Key(
+            AasTypes.KeyTypes.GlobalReference,
+            `urn:something:property${j}`
+          )
+        ]
+      );
+      submodel.submodelElements.push(property);
+    }
+
+    submodels.push(submodel);
+  }
+
+  return new AasTypes.Environment(null, submodels);
+}
+
+/**
+ * Index the properties by their values.
+ */
+function indexProperties(
+  that: AasTypes.Class,
+  index: Map<string, Set<AasTypes.Property>>
+): void {
+  const instances = [that, ...that.descend()];
+  for (const instance of instances) {
+    if (AasTypes.isProperty(instance) && instance.value !== null) {
+      let properties = index.get(instance.value);
+      if (properties === undefined) {
+        properties = new Set<AasTypes.Property>();
+        index.set(instance.value, properties);
+      }
+      properties.add(instance);
+    }
+  }
+}
+
+test("tracked index against the rebuild", () => {
+  const environment = generateEnvironment(100, 50);
+  const submodel = (environment.submodels ?? [])[50];
+  const property = <AasTypes.Property>(submodel.submodelElements ?? [])[25];
+
+  let value = 0;
+
+  const tracker = new AasTracking.ChangeTracker(environment);
+  const index = new Map<string, Set<AasTypes.Property>>();
+  indexProperties(environment, index);
+
+  let previous = property.value;
+  tracker.subscribe((event) => {
+    if (AasTypes.isProperty(event.instance) && event.property === "value") {
+      if (previous !== null) {
+        index.get(previous)?.delete(event.instance);
+      }
+      indexProperties(event.instance, index);
+      previous = event.instance.value;
+    }
+  });
+
+  // Test the benchmark
+  tracker.set(property, "value", "something");
+  expect(index.get("something")).toEqual(new Set<AasTypes.Property>([property]));
+  expect(index.get("25")?.has(property)).toBe(false);
+
+  const measurements = [
+    BenchCommon.measure("modify and rebuild the index", () => {
+      property.value = `${value++}`;
+      indexProperties(environment, new Map<string, Set<AasTypes.Property>>());
+    }),
+    BenchCommon.measure("modify through the tracker", () => {
+      tracker.set(property, "value", `${value++}`);
+      tracker.takeDirty();
+    })
+  ];
+
+  BenchCommon.report("tracking", measurements);
+});
@@ -0,0 +1,67 @@
+/**
+ * Benchmark the incremental verification against the full one after a small edit.
+ */
+
+import * as AasTracking from "../src/tracking";
+import * as AasTypes from "../src/types";
+import * as AasVerification from "../src/verification";
+
+import * as BenchCommon from "./common";
+
+/**
+ * Generate an environment with `count` submodels, each holding `fanOut`
+ * properties.
+ */
+function generateEnvironment(count: number, fanOut: number): AasTypes.Environment {
+  const submodels = new Array<AasTypes.Submodel>();
+  for (let i = 0; i < count; i++) {
+    const submodel = new AasTypes.Submodel(`urn:something:submodel${i}`);
+    submodel.submodelElements = new Array<AasTypes.ISubmodelElement>();
+
+    for (let j = 0; j < fanOut; j++) {
+      const property = new AasTypes.Property(AasTypes.DataTypeDefXsd.Int);
+      property.idShort = `property${j}`;
+      property.value = `${j}`;
+      submodel.submodelElements.push(property);
+    }
+
+    submodels.push(submodel);
+  }
+
+  return new AasTypes.Environment(null, submodels);
+}
+
+function countErrors(errors: Iterable<AasVerification.VerificationError>): number {
+  return Array.from(errors).length;
+}
+
+test("incremental against the full verification", () => {
+  const environment = generateEnvironment(100, 50);
+  const submodel = (environment.submodels ?? [])[50];
+  const property = <AasTypes.Property>(submodel.submodelElements ?? [])[25];
+
+  const tracker = new AasTracking.ChangeTracker(environment);
+  const verifier = new AasVerification.IncrementalVerifier();
+
+  // Test the benchmark
+  expect(countErrors(verifier.verify(environment))).toEqual(0);
+  tracker.set(property, "value", "not a number");
+  verifier.invalidate(tracker.takeDirty());
+  expect(countErrors(verifier.verify(environment))).toEqual(1);
+
+  let value = 0;
+
+  const measurements = [
+    BenchCommon.measure("edit and verify fully", () => {
+      property.value = `${value++}`;
+      countErrors(AasVerification.verify(environment));
+    }),
+    BenchCommon.measure("edit and verify incrementally", () => {
+      tracker.set(property, "value", `${value++}`);
+      verifier.invalidate(tracker.takeDirty());
+      countErrors(verifier.verify(environment));
+    })
+  ];
+
+  BenchCommon.report("incremental verification", measurements);
+});
@@ -0,0 +1,151 @@
+/**
+ * Benchmark the checks of values against XSD types on numeric and
+ * time-series-heavy submodels.
+ */
+
+import * as AasTypes from "../src/types";
+import * as AasVerification from "../src/verification";
+
+import * as BenchCommon from "./common";
+
+const SAMPLES = 1000;
+
+function twoDigits(n: number): string {
+  return n < 10 ? `0${n}` : `${n}`;
+}
+
+/**
+ * Generate a time series of the given value type.
+ */
+function generateValues(valueType: AasTypes.DataTypeDefXsd): Array<string> {
+  const values = new Array<string>();
+
+  // We avoid `Date` on purpose so that the values are the same on every run.
+  for (let i = 0; i < SAMPLES; i++) {
+    const second = i % 60;
+    const minute = Math.floor(i / 60) % 60;
+
+    switch (valueType) {
+      case AasTypes.DataTypeDefXsd.Date:
+        values.push(`2022-${twoDigits((i % 12) + 1)}-${twoDigits((i % 28) + 1)}`);
+        break;
+      case AasTypes.DataTypeDefXsd.DateTime:
+        values.push(
+          `2022-11-23T12:${twoDigits(minute)}:${twoDigits(second)}.${i % 1000}Z`
+        );
+        break;
+      case AasTypes.DataTypeDefXsd.DateTimeStamp:
+        values.push(`2022-11-23T12:${twoDigits(minute)}:${twoDigits(second)}+01:00`);
+        break;
+      case AasTypes.DataTypeDefXsd.Double:
+      case AasTypes.DataTypeDefXsd.Float:
+        values.push(`${(i * 0.123456789).toFixed(6)}E-3`);
+        break;
+      case AasTypes.DataTypeDefXsd.Long:
+        values.push(`${i * 7919 - 3000000}`);
+        break;
+      case AasTypes.DataTypeDefXsd.UnsignedLong:
+        values.push(`1844674407370955${i % 1000}`);
+        break;
+      default:
+        values.push(`${i % 128}`);
+        break;
+    }
+  }
+
+  return values;
+}
+
+const VALUE_TYPES = new Map<string, AasTypes.DataTypeDefXsd>([
+  ["xs:date", AasTypes.DataTypeDefXsd.Date],
+  ["xs:dateTime", AasTypes.DataTypeDefXsd.DateTime],
+  ["xs:dateTimeStamp", AasTypes.DataTypeDefXsd.DateTimeStamp],
+  ["xs:double", AasTypes.DataTypeDefXsd.Double],
+  ["xs:float", AasTypes.DataTypeDefXsd.Float],
+  ["xs:long", AasTypes.DataTypeDefXsd.Long],
+  ["xs:int", AasTypes.DataTypeDefXsd.Int],
+  ["xs:unsignedLong", AasTypes.DataTypeDefXsd.UnsignedLong],
+  ["xs:unsignedByte", AasTypes.DataTypeDefXsd.UnsignedByte]
+]);
+
+test("value consistency per XSD type", () => {
+  const measurements = new Array<BenchCommon.Measurement>();
+
+  for (const [name, valueType] of VALUE_TYPES) {
+    const values = generateValues(valueType);
+
+    // Test the benchmark
+    for (const value of values) {
+      expect(AasVerification.valueConsistentWithXsdType(value, valueType)).toBe(true);
+    }
+
+    measurements.push(
+      BenchCommon.measure(name, () => {
+        for (const value of values) {
+          AasVerification.valueConsistentWithXsdType(value, valueType);
+        }
+      })
+    );
+  }
+
+  BenchCommon.report("verification.valueConsistentWithXsdType", measurements);
+});
+
+test("verification of a time-series submodel", () => {
+  const measurements = new Array<BenchCommon.Measurement>();
+
+  for (const [name, valueType] of VALUE_TYPES) {
+    const elements = new Array<AasTypes.ISubmodelElement>();
+    let i = 0;
+    for (const value of generateValues(valueType)) {
+      elements.push(
+        new AasTypes.Property(
+          valueType,
+          null,
+          null,
+          `sample${i}`,
+          null,
+          null,
+          null,
+          null,
+          null,
+          null,
+          null,
+          null,
+          value
+        )
+      );
+      i++;
+    }
+
+    const submodel = new AasTypes.Submodel(
+      "urn:something:time-series",
+      null,
+      null,
+      null,
+      null,
+      null,
+      null,
+      null,
+      null,
+      null,
+      null,
+      null,
+      null,
+      elements
+    );
+
+    // Test the benchmark
+    expect(Array.from(AasVerification.verify(submodel))).toEqual([]);
+
+    measurements.push(
+      BenchCommon.measure(name, () => {
+        for (const error of AasVerification.verify(submodel)) {
+          throw new Error(`Unexpected error: ${error.message}`);
+        }
+      })
+    );
+  }
+
+  BenchCommon.report("verification.verify.timeSeries", measurements);
+});
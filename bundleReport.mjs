@@ -0,0 +1,143 @@
+/**
+ * Report the size and the parse time of the code that typical users end up
+ * bundling.
+ *
+ * Each scenario imports only a part of the library, as a downstream application
+ * would, and is bundled with rollup and minified with terser. We report the
+ * minified and gzipped sizes, the time to parse (compile) the bundle and the time
+ * to load it, *i.e.*, to parse and evaluate it.
+ *
+ * The script expects `npm run build:esm` to have been run. The report is printed
+ * and stored to `dist/bundleReport.json`.
+ */
+
+import * as fs from "fs";
+import * as path from "path";
+import { performance } from "perf_hooks";
+import * as vm from "vm";
+import * as zlib from "zlib";
+
+import resolve from "@rollup/plugin-node-resolve";
+import terser from "@rollup/plugin-terser";
+import { rollup } from "rollup";
+
+const ESM_DIR = path.resolve("dist/lib/esm");
+
+const SCENARIOS = [
+  {
+    name: "everything",
+    code: `export * from "${ESM_DIR}/index.js";`
+  },
+  {
+    name: "types of Submodel and Property",
+    code: `export { Submodel, Property } from "${ESM_DIR}/types.js";`
+  },
+  {
+    name: "de-serialize Submodel and Property",
+    code:
+      "export { submodelFromJsonable, propertyFromJsonable } " +
+      `from "${ESM_DIR}/jsonization.js";`
+  },
+  {
+    name: "serialize",
+    code: `export { toJsonable } from "${ESM_DIR}/jsonization.js";`
+  },
+  {
+    name: "verify",
+    code: `export { verify } from "${ESM_DIR}/verification.js";`
+  }
+];
+
+const ENTRY = "\0bundleReportEntry";
+
+/**
+ * Bundle the `code` of a scenario as an IIFE so that we can evaluate it in a
+ * fresh context.
+ */
+async function bundle(code) {
+  const build = await rollup({
+    input: ENTRY,
+    // This is what the bundlers do for packages marked with `sideEffects: false`.
+    treeshake: { moduleSideEffects: (id) => id === ENTRY },
+    plugins: [
+      {
+        name: "bundle-report-entry",
+        resolveId: (id) => (id === ENTRY ? id : null),
+        load: (id) => (id === ENTRY ? code : null)
+      },
+      resolve({ extensions: [".js"] })
+    ]
+  });
+
+  const { output } = await build.generate({
+    format: "iife",
+    name: "aas",
+    plugins: [terser()]
+  });
+  await build.close();
+
+  return output[0].code;
+}
+
+/**
+ * Measure the median time of `operation` in milliseconds.
+ */
+function median(operation, repetitions = 21) {
+  const times = [];
+  for (let i = 0; i < repetitions; i++) {
+    const start = performance.now();
+    operation(i);
+    times.push(performance.now() - start);
+  }
+  times.sort((a, b) => a - b);
+  return times[Math.floor(times.length / 2)];
+}
+
+function formatSize(bytes) {
+  return `${(bytes / 1024).toFixed(1)} KiB`;
+}
+
+async function main() {
+  const results = [];
+  for (const scenario of SCENARIOS) {
+    const code = await bundle(scenario.code);
+
+    // V8 caches the compilation of the same source, so we make each source
+    // unique by a trailing comment.
+    const parseTime = median((i) => new vm.Script(`${code}\n//${i}`));
+    const loadTime = median((i) =>
+      new vm.Script(`${code}\n//${i}`).runInNewContext({})
+    );
+
+    results.push({
+      name: scenario.name,
+      minified: Buffer.byteLength(code, "utf-8"),
+      gzipped: zlib.gzipSync(code).length,
+      parseTime,
+      loadTime
+    });
+  }
+
+  const lines = ["# Bundle report"];
+  for (const result of results) {
+    lines.push(
+      result.name.padEnd(40) +
+        formatSize(result.minified).padStart(12) +
+        formatSize(result.gzipped).padStart(12) +
+        `${result.parseTime.toFixed(2)} ms parse`.padStart(16) +
+        `${result.loadTime.toFixed(2)} ms load`.padStart(16)
+    );
+  }
+  process.stdout.write(lines.join("\n") + "\n");
+
+  fs.writeFileSync(
+    path.join("dist", "bundleReport.json"),
+    JSON.stringify(results, null, 2),
+    "utf-8"
+  );
+}
+
+main().catch((error) => {
+  process.stderr.write(`${error.stack}\n`);
+  process.exit(1);
+});
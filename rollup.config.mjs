@@ -4,28 +4,81 @@ import terser from "@rollup/plugin-terser";
 
 const extensions = [".js", ".ts"];
 
-export default {
-  input: "src/index.ts",
-  output: [
-    {
-      file: "dist/bundles/bundle.esm.js",
-      format: "esm",
-      sourcemap: true
-    },
-    {
-      file: "dist/bundles/bundle.esm.min.js",
-      format: "esm",
-      plugins: [terser()],
-      sourcemap: true
-    }
-  ],
-  plugins: [
-    resolve({ extensions }),
-    babel({
-      babelHelpers: "bundled",
-      include: ["src/**/*.ts"],
-      extensions,
-      exclude: "./node_modules/**"
-    })
-  ]
-}
\ No newline at end of file
+const plugins = [
+  resolve({ extensions }),
+  babel({
+    babelHelpers: "bundled",
+    include: ["src/**/*.ts"],
+    extensions,
+    exclude: "./node_modules/**"
+  })
+];
+
+// Each feature is an entry point of its own so that the users who need only,
+// say, the types and the de-serialization do not have to load the verification.
+// The code shared between the features goes into common chunks.
+const features = [
+  "asyncDeserialization",
+  "binarization",
+  "canonicalization",
+  "common",
+  "constants",
+  "copying",
+  "deserialization",
+  "diffing",
+  "equality",
+  "ingestion",
+  "jsonization",
+  "ndjson",
+  "parsing",
+  "persistence",
+  "serialization",
+  "snapshots",
+  "stringification",
+  "tracking",
+  "types",
+  "verification"
+];
+
+export default [
+  {
+    input: "src/index.ts",
+    output: [
+      {
+        file: "dist/bundles/bundle.esm.js",
+        format: "esm",
+        sourcemap: true
+      },
+      {
+        file: "dist/bundles/bundle.esm.min.js",
+        format: "esm",
+        plugins: [terser()],
+        sourcemap: true
+      }
+    ],
+    plugins
+  },
+  {
+    input: Object.fromEntries(
+      features.map((feature) => [feature, `src/${feature}.ts`])
+    ),
+    output: [
+      {
+        dir: "dist/bundles/esm",
+        format: "esm",
+        entryFileNames: "[name].js",
+        chunkFileNames: "chunks/[name]-[hash].js",
+        sourcemap: true
+      },
+      {
+        dir: "dist/bundles/esm-min",
+        format: "esm",
+        entryFileNames: "[name].min.js",
+        chunkFileNames: "chunks/[name]-[hash].min.js",
+        plugins: [terser()],
+        sourcemap: true
+      }
+    ],
+    plugins
+  }
+];
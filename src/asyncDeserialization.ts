@@ -0,0 +1,219 @@
+/**
+ * De-serialize an environment from JSON without blocking the event loop.
+ *
+ * @remarks
+ * The de-serialization is split into the asset administration shells,
+ * the submodels and the concept descriptions of the environment. Each of them is
+ * de-serialized with the functions of the module `deserialization`, and we yield
+ * to the event loop in between as configured by {@link common!TimeSlicingOptions}.
+ */
+
+import * as AasCommon from "./common";
+import * as AasDeserialization from "./deserialization";
+import * as AasJsonization from "./jsonization";
+import * as AasTypes from "./types";
+
+/**
+ * De-serialize the items of the property `key` of `container` one by one,
+ * and yield to the event loop in between.
+ *
+ * @param container - JSON object of the environment
+ * @param key - name of the property holding the items
+ * @param itemFromJsonable - to de-serialize a single item
+ * @param options - to control the de-serialization, if any
+ * @param slicer - to split the work in time slices
+ * @returns the de-serialized items, or an error with the path relative
+ * to `container`
+ * @typeParam T - type of the items
+ */
+async function itemsFromJsonable<T>(
+  container: AasJsonization.JsonObject,
+  key: string,
+  itemFromJsonable: (
+    jsonable: AasJsonization.JsonValue,
+    options: AasDeserialization.DeserializationOptions | null
+  ) => AasCommon.Either<T, AasJsonization.DeserializationError>,
+  options: AasDeserialization.DeserializationOptions | null,
+  slicer: AasCommon.TimeSlicer
+): Promise<AasCommon.Either<Array<T>, AasJsonization.DeserializationError>> {
+  const array = <AasJsonization.JsonArray>container[key];
+
+  const items = new Array<T>();
+  for (let i = 0; i < array.length; i++) {
+    const itemOrError = itemFromJsonable(array[i], options);
+    if (itemOrError.error !== null) {
+      itemOrError.error.path.prepend(new AasJsonization.IndexSegment(array, i));
+      itemOrError.error.path.prepend(
+        new AasJsonization.PropertySegment(container, key)
+      );
+      return new AasCommon.Either<Array<T>, AasJsonization.DeserializationError>(
+        null,
+        itemOrError.error
+      );
+    }
+
+    items.push(itemOrError.mustValue());
+
+    if (slicer.tick()) {
+      await slicer.pause();
+    }
+  }
+
+  return new AasCommon.Either<Array<T>, AasJsonization.DeserializationError>(
+    items,
+    null
+  );
+}
+
+/**
+ * Parse `jsonable` as an instance of {@link types!Environment} without
+ * blocking the event loop.
+ *
+ * @remarks
+ * The de-serialization runs in time slices, and yields to the event loop in
+ * between. The asset administration shells, the submodels and the concept
+ * descriptions are the units of work. The result, including the error and its
+ * path, is exactly the same as in {@link deserialization!environmentFromJsonable}.
+ *
+ * If {@link deserialization!DeserializationOptions.lazySubmodelElements} is set,
+ * the submodels are cheap to de-serialize, and the environment is de-serialized
+ * in a single slice.
+ *
+ * @param jsonable - to be parsed
+ * @param options - to control the de-serialization, if any
+ * @param slicing - to control the time slices and the abort, if any
+ * @returns parsed instance of {@link types!Environment},
+ * or an error if any
+ * @throws the reason of the abort, if the de-serialization has been aborted
+ */
+export async function environmentFromJsonableAsync(
+  jsonable: AasJsonization.JsonValue,
+  options: AasDeserialization.DeserializationOptions | null = null,
+  slicing: AasCommon.TimeSlicingOptions | null = null
+): Promise<
+  AasCommon.Either<AasTypes.Environment, AasJsonization.DeserializationError>
+> {
+  const slicer = new AasCommon.TimeSlicer(slicing);
+  slicer.throwIfAborted();
+
+  // NOTE:
+  // We leave all the cases which are not split into the slices to the synchronous
+  // de-serialization, so that the errors are reported exactly the same. This
+  // includes the invalid environments which fail before any item is decoded.
+  if (
+    jsonable === null ||
+    typeof jsonable !== "object" ||
+    Array.isArray(jsonable) ||
+    (options !== null && options.lazySubmodelElements === true)
+  ) {
+    return AasDeserialization.environmentFromJsonable(jsonable, options);
+  }
+
+  const projected =
+    options !== null && options.projection !== undefined
+      ? options.projection["Environment"]
+      : undefined;
+
+  for (const key in jsonable) {
+    if (projected !== undefined && projected.indexOf(key) === -1) {
+      continue;
+    }
+
+    switch (key) {
+      case "assetAdministrationShells":
+      case "submodels":
+      case "conceptDescriptions":
+        if (!Array.isArray(jsonable[key])) {
+          return AasDeserialization.environmentFromJsonable(jsonable, options);
+        }
+        break;
+      default:
+        break;
+    }
+  }
+
+  let assetAdministrationShells: Array<AasTypes.AssetAdministrationShell> | null = null;
+  let submodels: Array<AasTypes.Submodel> | null = null;
+  let conceptDescriptions: Array<AasTypes.ConceptDescription> | null = null;
+
+  for (const key in jsonable) {
+    if (projected !== undefined && projected.indexOf(key) === -1) {
+      continue;
+    }
+
+    switch (key) {
+      case "assetAdministrationShells": {
+        const itemsOrError = await itemsFromJsonable(
+          jsonable,
+          key,
+          AasDeserialization.assetAdministrationShellFromJsonable,
+          options,
+          slicer
+        );
+        if (itemsOrError.error !== null) {
+          return new AasCommon.Either<
+            AasTypes.Environment,
+            AasJsonization.DeserializationError
+          >(null, itemsOrError.error);
+        }
+        assetAdministrationShells = itemsOrError.mustValue();
+        break;
+      }
+
+      case "submodels": {
+        const itemsOrError = await itemsFromJsonable(
+          jsonable,
+          key,
+          AasDeserialization.submodelFromJsonable,
+          options,
+          slicer
+        );
+        if (itemsOrError.error !== null) {
+          return new AasCommon.Either<
+            AasTypes.Environment,
+            AasJsonization.DeserializationError
+          >(null, itemsOrError.error);
+        }
+        submodels = itemsOrError.mustValue();
+        break;
+      }
+
+      case "conceptDescriptions": {
+        const itemsOrError = await itemsFromJsonable(
+          jsonable,
+          key,
+          AasDeserialization.conceptDescriptionFromJsonable,
+          options,
+          slicer
+        );
+        if (itemsOrError.error !== null) {
+          return new AasCommon.Either<
+            AasTypes.Environment,
+            AasJsonization.DeserializationError
+          >(null, itemsOrError.error);
+        }
+        conceptDescriptions = itemsOrError.mustValue();
+        break;
+      }
+
+      default:
+        // We ignore the unknown properties as the synchronous de-serialization does.
+        break;
+    }
+  }
+
+  const environment = new AasTypes.Environment(
+    assetAdministrationShells,
+    submodels,
+    conceptDescriptions
+  );
+
+  if (options !== null && options.onInstance !== undefined) {
+    options.onInstance(environment);
+  }
+
+  return new AasCommon.Either<
+    AasTypes.Environment,
+    AasJsonization.DeserializationError
+  >(environment, null);
+}
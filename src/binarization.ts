@@ -0,0 +1,4336 @@
+/**
+ * Provide de/serialization of AAS classes to/from a compact binary format.
+ *
+ * @remarks
+ * The format is meant for exchange and caching between the applications which
+ * both use this SDK. Use JSON for everything else.
+ *
+ * The format is driven by the meta-model. An encoded instance starts with the
+ * magic bytes `AASB` and the format version, followed by the tag of the instance's
+ * class and the instance itself.
+ *
+ * An instance is written as a bit mask of the optional properties which are set,
+ * followed by the set properties in the order of the meta-model. The property
+ * names are never written. The values are written as follows:
+ *
+ * * Integers, such as lengths, counts, bit masks and class tags, are written as
+ *   unsigned LEB128 variable-length integers.
+ * * Strings are written as the number of bytes followed by the UTF-8 encoding.
+ *   Unpaired surrogates are written as if they were code points so that no
+ *   string is ever altered.
+ * * Literals of enumerations are written as their numeric values.
+ * * Booleans are written as a single byte, 0 or 1.
+ * * Byte arrays are written as the number of bytes followed by the raw bytes.
+ * * Lists are written as the number of items followed by the items.
+ * * Instances of classes are written without the class tag where the class is
+ *   fixed by the meta-model, and with the class tag where an interface is expected.
+ *
+ * The format round-trips losslessly with JSON, *i.e.*, any instance which you
+ * can serialize to JSON you can encode, and the decoded instance will serialize
+ * to exactly the same JSON.
+ *
+ * The decoder checks the structure and the types of the values, but does not
+ * verify the decoded instances. Use the module `verification` for that.
+ */
+
+import * as AasCommon from "./common";
+import * as AasStringification from "./stringification";
+import * as AasTypes from "./types";
+
+/**
+ * Represent an error during the decoding.
+ */
+export class DecodingError {
+  /**
+   * Human-readable description of the error
+   */
+  readonly message: string;
+
+  /**
+   * Offset in the input at which the error has been detected
+   */
+  readonly offset: number;
+
+  constructor(message: string, offset: number) {
+    this.message = message;
+    this.offset = offset;
+  }
+}
+
+const MAGIC = [0x41, 0x41, 0x53, 0x42];
+
+/**
+ * Version of the format, incremented on every incompatible change
+ */
+const FORMAT_VERSION = 1;
+
+/**
+ * Maximum number of arguments we pass to `String.fromCharCode` in a single call
+ */
+const FROM_CHAR_CODE_CHUNK = 0x8000;
+
+/**
+ * Compute the length of `text` in UTF-8.
+ *
+ * @remarks
+ * The unpaired surrogates are counted as if they were code points.
+ */
+function utf8Length(text: string): number {
+  let length = 0;
+  for (let i = 0; i < text.length; i++) {
+    const code = text.charCodeAt(i);
+    if (code < 0x80) {
+      length += 1;
+    } else if (code < 0x800) {
+      length += 2;
+    } else if (
+      code >= 0xd800 &&
+      code <= 0xdbff &&
+      i + 1 < text.length &&
+      (text.charCodeAt(i + 1) & 0xfc00) === 0xdc00
+    ) {
+      length += 4;
+      i++;
+    } else {
+      length += 3;
+    }
+  }
+  return length;
+}
+
+/**
+ * Accumulate the encoded bytes in a growing buffer.
+ */
+class Writer {
+  private bytes: Uint8Array;
+  private length: number;
+
+  constructor(capacity = 1024) {
+    this.bytes = new Uint8Array(capacity);
+    this.length = 0;
+  }
+
+  /**
+   * Make room for at least `additional` bytes.
+   */
+  private reserve(additional: number): void {
+    const needed = this.length + additional;
+    if (needed <= this.bytes.length) {
+      return;
+    }
+
+    const grown = new Uint8Array(Math.max(needed, 2 * this.bytes.length));
+    grown.set(this.bytes.subarray(0, this.length));
+    this.bytes = grown;
+  }
+
+  writeVarUint32(value: number): void {
+    this.reserve(5);
+    const bytes = this.bytes;
+    let length = this.length;
+    while (value >= 0x80) {
+      bytes[length++] = (value & 0x7f) | 0x80;
+      value >>>= 7;
+    }
+    bytes[length++] = value;
+    this.length = length;
+  }
+
+  writeBoolean(value: boolean): void {
+    this.reserve(1);
+    this.bytes[this.length++] = value ? 1 : 0;
+  }
+
+  writeString(text: string): void {
+    const byteLength = utf8Length(text);
+    this.writeVarUint32(byteLength);
+    this.reserve(byteLength);
+
+    const bytes = this.bytes;
+    let length = this.length;
+    for (let i = 0; i < text.length; i++) {
+      let code = text.charCodeAt(i);
+      if (code < 0x80) {
+        bytes[length++] = code;
+      } else if (code < 0x800) {
+        bytes[length++] = 0xc0 | (code >> 6);
+        bytes[length++] = 0x80 | (code & 0x3f);
+      } else if (
+        code >= 0xd800 &&
+        code <= 0xdbff &&
+        i + 1 < text.length &&
+        (text.charCodeAt(i + 1) & 0xfc00) === 0xdc00
+      ) {
+        i++;
+        code = 0x10000 + ((code - 0xd800) << 10) + (text.charCodeAt(i) - 0xdc00);
+        bytes[length++] = 0xf0 | (code >> 18);
+        bytes[length++] = 0x80 | ((code >> 12) & 0x3f);
+        bytes[length++] = 0x80 | ((code >> 6) & 0x3f);
+        bytes[length++] = 0x80 | (code & 0x3f);
+      } else {
+        bytes[length++] = 0xe0 | (code >> 12);
+        bytes[length++] = 0x80 | ((code >> 6) & 0x3f);
+        bytes[length++] = 0x80 | (code & 0x3f);
+      }
+    }
+    this.length = length;
+  }
+
+  writeBytes(value: Uint8Array): void {
+    this.writeVarUint32(value.length);
+    this.reserve(value.length);
+    this.bytes.set(value, this.length);
+    this.length += value.length;
+  }
+
+  writeRaw(values: Array<number>): void {
+    this.reserve(values.length);
+    for (const value of values) {
+      this.bytes[this.length++] = value;
+    }
+  }
+
+  /**
+   * @returns a copy of the written bytes
+   */
+  finish(): Uint8Array {
+    return this.bytes.slice(0, this.length);
+  }
+}
+
+/**
+ * Read the values from the encoded bytes.
+ *
+ * @remarks
+ * All the reads throw a {@link DecodingError} if the input is malformed.
+ */
+class Reader {
+  private readonly bytes: Uint8Array;
+
+  /**
+   * Offset of the next byte to be read
+   */
+  offset: number;
+
+  /**
+   * Buffer to collect the UTF-16 code units of the decoded strings
+   */
+  private units: Uint16Array;
+
+  constructor(bytes: Uint8Array) {
+    this.bytes = bytes;
+    this.offset = 0;
+    this.units = new Uint16Array(256);
+  }
+
+  get remaining(): number {
+    return this.bytes.length - this.offset;
+  }
+
+  readByte(): number {
+    if (this.offset >= this.bytes.length) {
+      throw new DecodingError("Unexpected end of input", this.offset);
+    }
+    return this.bytes[this.offset++];
+  }
+
+  readVarUint32(): number {
+    const start = this.offset;
+    let result = 0;
+    for (let shift = 0; shift < 35; shift += 7) {
+      const byte = this.readByte();
+      if (shift === 28 && byte > 0x0f) {
+        throw new DecodingError(
+          "Expected a variable-length integer of at most 32 bits",
+          start
+        );
+      }
+
+      result |= (byte & 0x7f) << shift;
+      if (byte < 0x80) {
+        return result >>> 0;
+      }
+    }
+
+    // We can not get here since the fifth byte is checked above.
+    throw new DecodingError("Unexpected variable-length integer", start);
+  }
+
+  /**
+   * Read the bit mask of the set optional properties.
+   *
+   * @param count - number of the optional properties
+   */
+  readPresence(count: number): number {
+    const offset = this.offset;
+    const present = this.readVarUint32();
+    if (present >>> count !== 0) {
+      throw new DecodingError(
+        `Expected a bit mask of ${count} optional properties, but got: ${present}`,
+        offset
+      );
+    }
+    return present;
+  }
+
+  /**
+   * Read the number of items in a list.
+   *
+   * @remarks
+   * Every item takes at least one byte, so we can reject the impossible counts
+   * before allocating anything.
+   */
+  readCount(): number {
+    const offset = this.offset;
+    const count = this.readVarUint32();
+    if (count > this.remaining) {
+      throw new DecodingError(
+        `Expected at most ${this.remaining} item(s), but got: ${count}`,
+        offset
+      );
+    }
+    return count;
+  }
+
+  readBoolean(): boolean {
+    const offset = this.offset;
+    const byte = this.readByte();
+    if (byte > 1) {
+      throw new DecodingError(`Expected a boolean, 0 or 1, but got: ${byte}`, offset);
+    }
+    return byte === 1;
+  }
+
+  readBytes(): Uint8Array {
+    const length = this.readCount();
+    const result = this.bytes.slice(this.offset, this.offset + length);
+    this.offset += length;
+    return result;
+  }
+
+  readString(): string {
+    const byteLength = this.readCount();
+    const bytes = this.bytes;
+    const start = this.offset;
+    const end = start + byteLength;
+
+    if (this.units.length < byteLength) {
+      this.units = new Uint16Array(Math.max(byteLength, 2 * this.units.length));
+    }
+    const units = this.units;
+    let count = 0;
+
+    let i = start;
+    while (i < end) {
+      const byte = bytes[i];
+      if (byte < 0x80) {
+        units[count++] = byte;
+        i++;
+        continue;
+      }
+
+      let code: number;
+      let size: number;
+      let smallest: number;
+      if ((byte & 0xe0) === 0xc0) {
+        code = byte & 0x1f;
+        size = 2;
+        smallest = 0x80;
+      } else if ((byte & 0xf0) === 0xe0) {
+        code = byte & 0x0f;
+        size = 3;
+        smallest = 0x800;
+      } else if ((byte & 0xf8) === 0xf0) {
+        code = byte & 0x07;
+        size = 4;
+        smallest = 0x10000;
+      } else {
+        throw new DecodingError(`Unexpected byte ${byte} in a UTF-8 string`, i);
+      }
+
+      if (i + size > end) {
+        throw new DecodingError("Unexpected end of a UTF-8 string", i);
+      }
+
+      for (let j = 1; j < size; j++) {
+        const continuation = bytes[i + j];
+        if ((continuation & 0xc0) !== 0x80) {
+          throw new DecodingError(
+            `Unexpected byte ${continuation} in a UTF-8 string`,
+            i + j
+          );
+        }
+        code = (code << 6) | (continuation & 0x3f);
+      }
+
+      if (code < smallest || code > 0x10ffff) {
+        throw new DecodingError("Unexpected over-long or out-of-range code point", i);
+      }
+
+      if (code >= 0x10000) {
+        code -= 0x10000;
+        units[count++] = 0xd800 + (code >> 10);
+        units[count++] = 0xdc00 + (code & 0x3ff);
+      } else {
+        units[count++] = code;
+      }
+
+      i += size;
+    }
+
+    this.offset = end;
+
+    if (count <= FROM_CHAR_CODE_CHUNK) {
+      // eslint-disable-next-line @typescript-eslint/no-explicit-any
+      return String.fromCharCode.apply(null, <any>units.subarray(0, count));
+    }
+
+    const parts = new Array<string>();
+    for (let j = 0; j < count; j += FROM_CHAR_CODE_CHUNK) {
+      parts.push(
+        String.fromCharCode.apply(
+          null,
+          // eslint-disable-next-line @typescript-eslint/no-explicit-any
+          <any>units.subarray(j, Math.min(j + FROM_CHAR_CODE_CHUNK, count))
+        )
+      );
+    }
+    return parts.join("");
+  }
+}
+
+/**
+ * Read a list whose items are read with `readItem`.
+ */
+function readArray<T>(reader: Reader, readItem: (reader: Reader) => T): Array<T> {
+  const count = reader.readCount();
+  const result = new Array<T>(count);
+  for (let i = 0; i < count; i++) {
+    result[i] = readItem(reader);
+  }
+  return result;
+}
+
+// region Class tags
+
+/**
+ * Identify the concrete classes in the binary format.
+ *
+ * @remarks
+ * The tags are part of the format. Append new classes at the end and never
+ * re-order the existing ones.
+ */
+enum ClassTag {
+  Extension = 0,
+  AdministrativeInformation = 1,
+  Qualifier = 2,
+  AssetAdministrationShell = 3,
+  AssetInformation = 4,
+  Resource = 5,
+  SpecificAssetId = 6,
+  Submodel = 7,
+  RelationshipElement = 8,
+  SubmodelElementList = 9,
+  SubmodelElementCollection = 10,
+  Property = 11,
+  MultiLanguageProperty = 12,
+  Range = 13,
+  ReferenceElement = 14,
+  Blob = 15,
+  File = 16,
+  AnnotatedRelationshipElement = 17,
+  Entity = 18,
+  EventPayload = 19,
+  BasicEventElement = 20,
+  Operation = 21,
+  OperationVariable = 22,
+  Capability = 23,
+  ConceptDescription = 24,
+  Reference = 25,
+  Key = 26,
+  LangString = 27,
+  Environment = 28,
+  EmbeddedDataSpecification = 29,
+  ValueReferencePair = 30,
+  ValueList = 31,
+  DataSpecificationIec61360 = 32,
+  DataSpecificationPhysicalUnit = 33
+}
+
+/**
+ * Map the instances to their class tags.
+ */
+class Tagger extends AasTypes.AbstractTransformer<ClassTag> {
+  /* eslint-disable @typescript-eslint/no-unused-vars */
+  transformExtension(that: AasTypes.Extension): ClassTag {
+    return ClassTag.Extension;
+  }
+  /* eslint-enable @typescript-eslint/no-unused-vars */
+
+  /* eslint-disable @typescript-eslint/no-unused-vars */
+  transformAdministrativeInformation(
+    that: AasTypes.AdministrativeInformation
+  ): ClassTag {
+    return ClassTag.AdministrativeInformation;
+  }
+  /* eslint-enable @typescript-eslint/no-unused-vars */
+
+  /* eslint-disable @typescript-eslint/no-unused-vars */
+  transformQualifier(that: AasTypes.Qualifier): ClassTag {
+    return ClassTag.Qualifier;
+  }
+  /* eslint-enable @typescript-eslint/no-unused-vars */
+
+  /* eslint-disable @typescript-eslint/no-unused-vars */
+  transformAssetAdministrationShell(that: AasTypes.AssetAdministrationShell): ClassTag {
+    return ClassTag.AssetAdministrationShell;
+  }
+  /* eslint-enable @typescript-eslint/no-unused-vars */
+
+  /* eslint-disable @typescript-eslint/no-unused-vars */
+  transformAssetInformation(that: AasTypes.AssetInformation): ClassTag {
+    return ClassTag.AssetInformation;
+  }
+  /* eslint-enable @typescript-eslint/no-unused-vars */
+
+  /* eslint-disable @typescript-eslint/no-unused-vars */
+  transformResource(that: AasTypes.Resource): ClassTag {
+    return ClassTag.Resource;
+  }
+  /* eslint-enable @typescript-eslint/no-unused-vars */
+
+  /* eslint-disable @typescript-eslint/no-unused-vars */
+  transformSpecificAssetId(that: AasTypes.SpecificAssetId): ClassTag {
+    return ClassTag.SpecificAssetId;
+  }
+  /* eslint-enable @typescript-eslint/no-unused-vars */
+
+  /* eslint-disable @typescript-eslint/no-unused-vars */
+  transformSubmodel(that: AasTypes.Submodel): ClassTag {
+    return ClassTag.Submodel;
+  }
+  /* eslint-enable @typescript-eslint/no-unused-vars */
+
+  /* eslint-disable @typescript-eslint/no-unused-vars */
+  transformRelationshipElement(that: AasTypes.RelationshipElement): ClassTag {
+    return ClassTag.RelationshipElement;
+  }
+  /* eslint-enable @typescript-eslint/no-unused-vars */
+
+  /* eslint-disable @typescript-eslint/no-unused-vars */
+  transformSubmodelElementList(that: AasTypes.SubmodelElementList): ClassTag {
+    return ClassTag.SubmodelElementList;
+  }
+  /* eslint-enable @typescript-eslint/no-unused-vars */
+
+  /* eslint-disable @typescript-eslint/no-unused-vars */
+  transformSubmodelElementCollection(
+    that: AasTypes.SubmodelElementCollection
+  ): ClassTag {
+    return ClassTag.SubmodelElementCollection;
+  }
+  /* eslint-enable @typescript-eslint/no-unused-vars */
+
+  /* eslint-disable @typescript-eslint/no-unused-vars */
+  transformProperty(that: AasTypes.Property): ClassTag {
+    return ClassTag.Property;
+  }
+  /* eslint-enable @typescript-eslint/no-unused-vars */
+
+  /* eslint-disable @typescript-eslint/no-unused-vars */
+  transformMultiLanguageProperty(that: AasTypes.MultiLanguageProperty): ClassTag {
+    return ClassTag.MultiLanguageProperty;
+  }
+  /* eslint-enable @typescript-eslint/no-unused-vars */
+
+  /* eslint-disable @typescript-eslint/no-unused-vars */
+  transformRange(that: AasTypes.Range): ClassTag {
+    return ClassTag.Range;
+  }
+  /* eslint-enable @typescript-eslint/no-unused-vars */
+
+  /* eslint-disable @typescript-eslint/no-unused-vars */
+  transformReferenceElement(that: AasTypes.ReferenceElement): ClassTag {
+    return ClassTag.ReferenceElement;
+  }
+  /* eslint-enable @typescript-eslint/no-unused-vars */
+
+  /* eslint-disable @typescript-eslint/no-unused-vars */
+  transformBlob(that: AasTypes.Blob): ClassTag {
+    return ClassTag.Blob;
+  }
+  /* eslint-enable @typescript-eslint/no-unused-vars */
+
+  /* eslint-disable @typescript-eslint/no-unused-vars */
+  transformFile(that: AasTypes.File): ClassTag {
+    return ClassTag.File;
+  }
+  /* eslint-enable @typescript-eslint/no-unused-vars */
+
+  /* eslint-disable @typescript-eslint/no-unused-vars */
+  transformAnnotatedRelationshipElement(
+    that: AasTypes.AnnotatedRelationshipElement
+  ): ClassTag {
+    return ClassTag.AnnotatedRelationshipElement;
+  }
+  /* eslint-enable @typescript-eslint/no-unused-vars */
+
+  /* eslint-disable @typescript-eslint/no-unused-vars */
+  transformEntity(that: AasTypes.Entity): ClassTag {
+    return ClassTag.Entity;
+  }
+  /* eslint-enable @typescript-eslint/no-unused-vars */
+
+  /* eslint-disable @typescript-eslint/no-unused-vars */
+  transformEventPayload(that: AasTypes.EventPayload): ClassTag {
+    return ClassTag.EventPayload;
+  }
+  /* eslint-enable @typescript-eslint/no-unused-vars */
+
+  /* eslint-disable @typescript-eslint/no-unused-vars */
+  transformBasicEventElement(that: AasTypes.BasicEventElement): ClassTag {
+    return ClassTag.BasicEventElement;
+  }
+  /* eslint-enable @typescript-eslint/no-unused-vars */
+
+  /* eslint-disable @typescript-eslint/no-unused-vars */
+  transformOperation(that: AasTypes.Operation): ClassTag {
+    return ClassTag.Operation;
+  }
+  /* eslint-enable @typescript-eslint/no-unused-vars */
+
+  /* eslint-disable @typescript-eslint/no-unused-vars */
+  transformOperationVariable(that: AasTypes.OperationVariable): ClassTag {
+    return ClassTag.OperationVariable;
+  }
+  /* eslint-enable @typescript-eslint/no-unused-vars */
+
+  /* eslint-disable @typescript-eslint/no-unused-vars */
+  transformCapability(that: AasTypes.Capability): ClassTag {
+    return ClassTag.Capability;
+  }
+  /* eslint-enable @typescript-eslint/no-unused-vars */
+
+  /* eslint-disable @typescript-eslint/no-unused-vars */
+  transformConceptDescription(that: AasTypes.ConceptDescription): ClassTag {
+    return ClassTag.ConceptDescription;
+  }
+  /* eslint-enable @typescript-eslint/no-unused-vars */
+
+  /* eslint-disable @typescript-eslint/no-unused-vars */
+  transformReference(that: AasTypes.Reference): ClassTag {
+    return ClassTag.Reference;
+  }
+  /* eslint-enable @typescript-eslint/no-unused-vars */
+
+  /* eslint-disable @typescript-eslint/no-unused-vars */
+  transformKey(that: AasTypes.Key): ClassTag {
+    return ClassTag.Key;
+  }
+  /* eslint-enable @typescript-eslint/no-unused-vars */
+
+  /* eslint-disable @typescript-eslint/no-unused-vars */
+  transformLangString(that: AasTypes.LangString): ClassTag {
+    return ClassTag.LangString;
+  }
+  /* eslint-enable @typescript-eslint/no-unused-vars */
+
+  /* eslint-disable @typescript-eslint/no-unused-vars */
+  transformEnvironment(that: AasTypes.Environment): ClassTag {
+    return ClassTag.Environment;
+  }
+  /* eslint-enable @typescript-eslint/no-unused-vars */
+
+  /* eslint-disable @typescript-eslint/no-unused-vars */
+  transformEmbeddedDataSpecification(
+    that: AasTypes.EmbeddedDataSpecification
+  ): ClassTag {
+    return ClassTag.EmbeddedDataSpecification;
+  }
+  /* eslint-enable @typescript-eslint/no-unused-vars */
+
+  /* eslint-disable @typescript-eslint/no-unused-vars */
+  transformValueReferencePair(that: AasTypes.ValueReferencePair): ClassTag {
+    return ClassTag.ValueReferencePair;
+  }
+  /* eslint-enable @typescript-eslint/no-unused-vars */
+
+  /* eslint-disable @typescript-eslint/no-unused-vars */
+  transformValueList(that: AasTypes.ValueList): ClassTag {
+    return ClassTag.ValueList;
+  }
+  /* eslint-enable @typescript-eslint/no-unused-vars */
+
+  /* eslint-disable @typescript-eslint/no-unused-vars */
+  transformDataSpecificationIec61360(
+    that: AasTypes.DataSpecificationIec61360
+  ): ClassTag {
+    return ClassTag.DataSpecificationIec61360;
+  }
+  /* eslint-enable @typescript-eslint/no-unused-vars */
+
+  /* eslint-disable @typescript-eslint/no-unused-vars */
+  transformDataSpecificationPhysicalUnit(
+    that: AasTypes.DataSpecificationPhysicalUnit
+  ): ClassTag {
+    return ClassTag.DataSpecificationPhysicalUnit;
+  }
+  /* eslint-enable @typescript-eslint/no-unused-vars */
+}
+
+const TAGGER = /*@__PURE__*/ new Tagger();
+
+// endregion
+
+// region Encoding
+
+/**
+ * Write the instances to a {@link Writer} without their class tags.
+ *
+ * @remarks
+ * The class of a property is fixed by the meta-model, so the tags are written
+ * only where an interface is expected.
+ */
+class Encoder extends AasTypes.AbstractVisitorWithContext<Writer> {
+  /**
+   * Write the class tag of `that` followed by `that`.
+   */
+  writeTagged(that: AasTypes.Class, writer: Writer): void {
+    writer.writeVarUint32(TAGGER.transform(that));
+    this.visitWithContext(that, writer);
+  }
+
+  /**
+   * Write `that` to the `writer`.
+   *
+   * @param that - instance to be written
+   * @param writer - where to write to
+   */
+  visitExtensionWithContext(that: AasTypes.Extension, writer: Writer): void {
+    writer.writeVarUint32(
+      (that.semanticId !== null ? 0x1 : 0) |
+        (that.supplementalSemanticIds !== null ? 0x2 : 0) |
+        (that.valueType !== null ? 0x4 : 0) |
+        (that.value !== null ? 0x8 : 0) |
+        (that.refersTo !== null ? 0x10 : 0)
+    );
+
+    if (that.semanticId !== null) {
+      this.visitReferenceWithContext(that.semanticId, writer);
+    }
+
+    if (that.supplementalSemanticIds !== null) {
+      writer.writeVarUint32(that.supplementalSemanticIds.length);
+      for (const item of that.supplementalSemanticIds) {
+        this.visitReferenceWithContext(item, writer);
+      }
+    }
+
+    writer.writeString(that.name);
+
+    if (that.valueType !== null) {
+      writer.writeVarUint32(that.valueType);
+    }
+
+    if (that.value !== null) {
+      writer.writeString(that.value);
+    }
+
+    if (that.refersTo !== null) {
+      this.visitReferenceWithContext(that.refersTo, writer);
+    }
+  }
+
+  /**
+   * Write `that` to the `writer`.
+   *
+   * @param that - instance to be written
+   * @param writer - where to write to
+   */
+  visitAdministrativeInformationWithContext(
+    that: AasTypes.AdministrativeInformation,
+    writer: Writer
+  ): void {
+    writer.writeVarUint32(
+      (that.embeddedDataSpecifications !== null ? 0x1 : 0) |
+        (that.version !== null ? 0x2 : 0) |
+        (that.revision !== null ? 0x4 : 0)
+    );
+
+    if (that.embeddedDataSpecifications !== null) {
+      writer.writeVarUint32(that.embeddedDataSpecifications.length);
+      for (const item of that.embeddedDataSpecifications) {
+        this.visitEmbeddedDataSpecificationWithContext(item, writer);
+      }
+    }
+
+    if (that.version !== null) {
+      writer.writeString(that.version);
+    }
+
+    if (that.revision !== null) {
+      writer.writeString(that.revision);
+    }
+  }
+
+  /**
+   * Write `that` to the `writer`.
+   *
+   * @param that - instance to be written
+   * @param writer - where to write to
+   */
+  visitQualifierWithContext(that: AasTypes.Qualifier, writer: Writer): void {
+    writer.writeVarUint32(
+      (that.semanticId !== null ? 0x1 : 0) |
+        (that.supplementalSemanticIds !== null ? 0x2 : 0) |
+        (that.kind !== null ? 0x4 : 0) |
+        (that.value !== null ? 0x8 : 0) |
+        (that.valueId !== null ? 0x10 : 0)
+    );
+
+    if (that.semanticId !== null) {
+      this.visitReferenceWithContext(that.semanticId, writer);
+    }
+
+    if (that.supplementalSemanticIds !== null) {
+      writer.writeVarUint32(that.supplementalSemanticIds.length);
+      for (const item of that.supplementalSemanticIds) {
+        this.visitReferenceWithContext(item, writer);
+      }
+    }
+
+    if (that.kind !== null) {
+      writer.writeVarUint32(that.kind);
+    }
+
+    writer.writeString(that.type);
+
+    writer.writeVarUint32(that.valueType);
+
+    if (that.value !== null) {
+      writer.writeString(that.value);
+    }
+
+    if (that.valueId !== null) {
+      this.visitReferenceWithContext(that.valueId, writer);
+    }
+  }
+
+  /**
+   * Write `that` to the `writer`.
+   *
+   * @param that - instance to be written
+   * @param writer - where to write to
+   */
+  visitAssetAdministrationShellWithContext(
+    that: AasTypes.AssetAdministrationShell,
+    writer: Writer
+  ): void {
+    writer.writeVarUint32(
+      (that.extensions !== null ? 0x1 : 0) |
+        (that.category !== null ? 0x2 : 0) |
+        (that.idShort !== null ? 0x4 : 0) |
+        (that.displayName !== null ? 0x8 : 0) |
+        (that.description !== null ? 0x10 : 0) |
+        (that.checksum !== null ? 0x20 : 0) |
+        (that.administration !== null ? 0x40 : 0) |
+        (that.embeddedDataSpecifications !== null ? 0x80 : 0) |
+        (that.derivedFrom !== null ? 0x100 : 0) |
+        (that.submodels !== null ? 0x200 : 0)
+    );
+
+    if (that.extensions !== null) {
+      writer.writeVarUint32(that.extensions.length);
+      for (const item of that.extensions) {
+        this.visitExtensionWithContext(item, writer);
+      }
+    }
+
+    if (that.category !== null) {
+      writer.writeString(that.category);
+    }
+
+    if (that.idShort !== null) {
+      writer.writeString(that.idShort);
+    }
+
+    if (that.displayName !== null) {
+      writer.writeVarUint32(that.displayName.length);
+      for (const item of that.displayName) {
+        this.visitLangStringWithContext(item, writer);
+      }
+    }
+
+    if (that.description !== null) {
+      writer.writeVarUint32(that.description.length);
+      for (const item of that.description) {
+        this.visitLangStringWithContext(item, writer);
+      }
+    }
+
+    if (that.checksum !== null) {
+      writer.writeString(that.checksum);
+    }
+
+    if (that.administration !== null) {
+      this.visitAdministrativeInformationWithContext(that.administration, writer);
+    }
+
+    writer.writeString(that.id);
+
+    if (that.embeddedDataSpecifications !== null) {
+      writer.writeVarUint32(that.embeddedDataSpecifications.length);
+      for (const item of that.embeddedDataSpecifications) {
+        this.visitEmbeddedDataSpecificationWithContext(item, writer);
+      }
+    }
+
+    if (that.derivedFrom !== null) {
+      this.visitReferenceWithContext(that.derivedFrom, writer);
+    }
+
+    this.visitAssetInformationWithContext(that.assetInformation, writer);
+
+    if (that.submodels !== null) {
+      writer.writeVarUint32(that.submodels.length);
+      for (const item of that.submodels) {
+        this.visitReferenceWithContext(item, writer);
+      }
+    }
+  }
+
+  /**
+   * Write `that` to the `writer`.
+   *
+   * @param that - instance to be written
+   * @param writer - where to write to
+   */
+  visitAssetInformationWithContext(
+    that: AasTypes.AssetInformation,
+    writer: Writer
+  ): void {
+    writer.writeVarUint32(
+      (that.globalAssetId !== null ? 0x1 : 0) |
+        (that.specificAssetIds !== null ? 0x2 : 0) |
+        (that.defaultThumbnail !== null ? 0x4 : 0)
+    );
+
+    writer.writeVarUint32(that.assetKind);
+
+    if (that.globalAssetId !== null) {
+      this.visitReferenceWithContext(that.globalAssetId, writer);
+    }
+
+    if (that.specificAssetIds !== null) {
+      writer.writeVarUint32(that.specificAssetIds.length);
+      for (const item of that.specificAssetIds) {
+        this.visitSpecificAssetIdWithContext(item, writer);
+      }
+    }
+
+    if (that.defaultThumbnail !== null) {
+      this.visitResourceWithContext(that.defaultThumbnail, writer);
+    }
+  }
+
+  /**
+   * Write `that` to the `writer`.
+   *
+   * @param that - instance to be written
+   * @param writer - where to write to
+   */
+  visitResourceWithContext(that: AasTypes.Resource, writer: Writer): void {
+    writer.writeVarUint32((that.contentType !== null ? 0x1 : 0));
+
+    writer.writeString(that.path);
+
+    if (that.contentType !== null) {
+      writer.writeString(that.contentType);
+    }
+  }
+
+  /**
+   * Write `that` to the `writer`.
+   *
+   * @param that - instance to be written
+   * @param writer - where to write to
+   */
+  visitSpecificAssetIdWithContext(
+    that: AasTypes.SpecificAssetId,
+    writer: Writer
+  ): void {
+    writer.writeVarUint32(
+      (that.semanticId !== null ? 0x1 : 0) |
+        (that.supplementalSemanticIds !== null ? 0x2 : 0)
+    );
+
+    if (that.semanticId !== null) {
+      this.visitReferenceWithContext(that.semanticId, writer);
+    }
+
+    if (that.supplementalSemanticIds !== null) {
+      writer.writeVarUint32(that.supplementalSemanticIds.length);
+      for (const item of that.supplementalSemanticIds) {
+        this.visitReferenceWithContext(item, writer);
+      }
+    }
+
+    writer.writeString(that.name);
+
+    writer.writeString(that.value);
+
+    this.visitReferenceWithContext(that.externalSubjectId, writer);
+  }
+
+  /**
+   * Write `that` to the `writer`.
+   *
+   * @param that - instance to be written
+   * @param writer - where to write to
+   */
+  visitSubmodelWithContext(that: AasTypes.Submodel, writer: Writer): void {
+    writer.writeVarUint32(
+      (that.extensions !== null ? 0x1 : 0) |
+        (that.category !== null ? 0x2 : 0) |
+        (that.idShort !== null ? 0x4 : 0) |
+        (that.displayName !== null ? 0x8 : 0) |
+        (that.description !== null ? 0x10 : 0) |
+        (that.checksum !== null ? 0x20 : 0) |
+        (that.administration !== null ? 0x40 : 0) |
+        (that.kind !== null ? 0x80 : 0) |
+        (that.semanticId !== null ? 0x100 : 0) |
+        (that.supplementalSemanticIds !== null ? 0x200 : 0) |
+        (that.qualifiers !== null ? 0x400 : 0) |
+        (that.embeddedDataSpecifications !== null ? 0x800 : 0) |
+        (that.submodelElements !== null ? 0x1000 : 0)
+    );
+
+    if (that.extensions !== null) {
+      writer.writeVarUint32(that.extensions.length);
+      for (const item of that.extensions) {
+        this.visitExtensionWithContext(item, writer);
+      }
+    }
+
+    if (that.category !== null) {
+      writer.writeString(that.category);
+    }
+
+    if (that.idShort !== null) {
+      writer.writeString(that.idShort);
+    }
+
+    if (that.displayName !== null) {
+      writer.writeVarUint32(that.displayName.length);
+      for (const item of that.displayName) {
+        this.visitLangStringWithContext(item, writer);
+      }
+    }
+
+    if (that.description !== null) {
+      writer.writeVarUint32(that.description.length);
+      for (const item of that.description) {
+        this.visitLangStringWithContext(item, writer);
+      }
+    }
+
+    if (that.checksum !== null) {
+      writer.writeString(that.checksum);
+    }
+
+    if (that.administration !== null) {
+      this.visitAdministrativeInformationWithContext(that.administration, writer);
+    }
+
+    writer.writeString(that.id);
+
+    if (that.kind !== null) {
+      writer.writeVarUint32(that.kind);
+    }
+
+    if (that.semanticId !== null) {
+      this.visitReferenceWithContext(that.semanticId, writer);
+    }
+
+    if (that.supplementalSemanticIds !== null) {
+      writer.writeVarUint32(that.supplementalSemanticIds.length);
+      for (const item of that.supplementalSemanticIds) {
+        this.visitReferenceWithContext(item, writer);
+      }
+    }
+
+    if (that.qualifiers !== null) {
+      writer.writeVarUint32(that.qualifiers.length);
+      for (const item of that.qualifiers) {
+        this.visitQualifierWithContext(item, writer);
+      }
+    }
+
+    if (that.embeddedDataSpecifications !== null) {
+      writer.writeVarUint32(that.embeddedDataSpecifications.length);
+      for (const item of that.embeddedDataSpecifications) {
+        this.visitEmbeddedDataSpecificationWithContext(item, writer);
+      }
+    }
+
+    if (that.submodelElements !== null) {
+      writer.writeVarUint32(that.submodelElements.length);
+      for (const item of that.submodelElements) {
+        this.writeTagged(item, writer);
+      }
+    }
+  }
+
+  /**
+   * Write `that` to the `writer`.
+   *
+   * @param that - instance to be written
+   * @param writer - where to write to
+   */
+  visitRelationshipElementWithContext(
+    that: AasTypes.RelationshipElement,
+    writer: Writer
+  ): void {
+    writer.writeVarUint32(
+      (that.extensions !== null ? 0x1 : 0) |
+        (that.category !== null ? 0x2 : 0) |
+        (that.idShort !== null ? 0x4 : 0) |
+        (that.displayName !== null ? 0x8 : 0) |
+        (that.description !== null ? 0x10 : 0) |
+        (that.checksum !== null ? 0x20 : 0) |
+        (that.kind !== null ? 0x40 : 0) |
+        (that.semanticId !== null ? 0x80 : 0) |
+        (that.supplementalSemanticIds !== null ? 0x100 : 0) |
+        (that.qualifiers !== null ? 0x200 : 0) |
+        (that.embeddedDataSpecifications !== null ? 0x400 : 0)
+    );
+
+    if (that.extensions !== null) {
+      writer.writeVarUint32(that.extensions.length);
+      for (const item of that.extensions) {
+        this.visitExtensionWithContext(item, writer);
+      }
+    }
+
+    if (that.category !== null) {
+      writer.writeString(that.category);
+    }
+
+    if (that.idShort !== null) {
+      writer.writeString(that.idShort);
+    }
+
+    if (that.displayName !== null) {
+      writer.writeVarUint32(that.displayName.length);
+      for (const item of that.displayName) {
+        this.visitLangStringWithContext(item, writer);
+      }
+    }
+
+    if (that.description !== null) {
+      writer.writeVarUint32(that.description.length);
+      for (const item of that.description) {
+        this.visitLangStringWithContext(item, writer);
+      }
+    }
+
+    if (that.checksum !== null) {
+      writer.writeString(that.checksum);
+    }
+
+    if (that.kind !== null) {
+      writer.writeVarUint32(that.kind);
+    }
+
+    if (that.semanticId !== null) {
+      this.visitReferenceWithContext(that.semanticId, writer);
+    }
+
+    if (that.supplementalSemanticIds !== null) {
+      writer.writeVarUint32(that.supplementalSemanticIds.length);
+      for (const item of that.supplementalSemanticIds) {
+        this.visitReferenceWithContext(item, writer);
+      }
+    }
+
+    if (that.qualifiers !== null) {
+      writer.writeVarUint32(that.qualifiers.length);
+      for (const item of that.qualifiers) {
+        this.visitQualifierWithContext(item, writer);
+      }
+    }
+
+    if (that.embeddedDataSpecifications !== null) {
+      writer.writeVarUint32(that.embeddedDataSpecifications.length);
+      for (const item of that.embeddedDataSpecifications) {
+        this.visitEmbeddedDataSpecificationWithContext(item, writer);
+      }
+    }
+
+    this.visitReferenceWithContext(that.first, writer);
+
+    this.visitReferenceWithContext(that.second, writer);
+  }
+
+  /**
+   * Write `that` to the `writer`.
+   *
+   * @param that - instance to be written
+   * @param writer - where to write to
+   */
+  visitSubmodelElementListWithContext(
+    that: AasTypes.SubmodelElementList,
+    writer: Writer
+  ): void {
+    writer.writeVarUint32(
+      (that.extensions !== null ? 0x1 : 0) |
+        (that.category !== null ? 0x2 : 0) |
+        (that.idShort !== null ? 0x4 : 0) |
+        (that.displayName !== null ? 0x8 : 0) |
+        (that.description !== null ? 0x10 : 0) |
+        (that.checksum !== null ? 0x20 : 0) |
+        (that.kind !== null ? 0x40 : 0) |
+        (that.semanticId !== null ? 0x80 : 0) |
+        (that.supplementalSemanticIds !== null ? 0x100 : 0) |
+        (that.qualifiers !== null ? 0x200 : 0) |
+        (that.embeddedDataSpecifications !== null ? 0x400 : 0) |
+        (that.orderRelevant !== null ? 0x800 : 0) |
+        (that.value !== null ? 0x1000 : 0) |
+        (that.semanticIdListElement !== null ? 0x2000 : 0) |
+        (that.valueTypeListElement !== null ? 0x4000 : 0)
+    );
+
+    if (that.extensions !== null) {
+      writer.writeVarUint32(that.extensions.length);
+      for (const item of that.extensions) {
+        this.visitExtensionWithContext(item, writer);
+      }
+    }
+
+    if (that.category !== null) {
+      writer.writeString(that.category);
+    }
+
+    if (that.idShort !== null) {
+      writer.writeString(that.idShort);
+    }
+
+    if (that.displayName !== null) {
+      writer.writeVarUint32(that.displayName.length);
+      for (const item of that.displayName) {
+        this.visitLangStringWithContext(item, writer);
+      }
+    }
+
+    if (that.description !== null) {
+      writer.writeVarUint32(that.description.length);
+      for (const item of that.description) {
+        this.visitLangStringWithContext(item, writer);
+      }
+    }
+
+    if (that.checksum !== null) {
+      writer.writeString(that.checksum);
+    }
+
+    if (that.kind !== null) {
+      writer.writeVarUint32(that.kind);
+    }
+
+    if (that.semanticId !== null) {
+      this.visitReferenceWithContext(that.semanticId, writer);
+    }
+
+    if (that.supplementalSemanticIds !== null) {
+      writer.writeVarUint32(that.supplementalSemanticIds.length);
+      for (const item of that.supplementalSemanticIds) {
+        this.visitReferenceWithContext(item, writer);
+      }
+    }
+
+    if (that.qualifiers !== null) {
+      writer.writeVarUint32(that.qualifiers.length);
+      for (const item of that.qualifiers) {
+        this.visitQualifierWithContext(item, writer);
+      }
+    }
+
+    if (that.embeddedDataSpecifications !== null) {
+      writer.writeVarUint32(that.embeddedDataSpecifications.length);
+      for (const item of that.embeddedDataSpecifications) {
+        this.visitEmbeddedDataSpecificationWithContext(item, writer);
+      }
+    }
+
+    if (that.orderRelevant !== null) {
+      writer.writeBoolean(that.orderRelevant);
+    }
+
+    if (that.value !== null) {
+      writer.writeVarUint32(that.value.length);
+      for (const item of that.value) {
+        this.writeTagged(item, writer);
+      }
+    }
+
+    if (that.semanticIdListElement !== null) {
+      this.visitReferenceWithContext(that.semanticIdListElement, writer);
+    }
+
+    writer.writeVarUint32(that.typeValueListElement);
+
+    if (that.valueTypeListElement !== null) {
+      writer.writeVarUint32(that.valueTypeListElement);
+    }
+  }
+
+  /**
+   * Write `that` to the `writer`.
+   *
+   * @param that - instance to be written
+   * @param writer - where to write to
+   */
+  visitSubmodelElementCollectionWithContext(
+    that: AasTypes.SubmodelElementCollection,
+    writer: Writer
+  ): void {
+    writer.writeVarUint32(
+      (that.extensions !== null ? 0x1 : 0) |
+        (that.category !== null ? 0x2 : 0) |
+        (that.idShort !== null ? 0x4 : 0) |
+        (that.displayName !== null ? 0x8 : 0) |
+        (that.description !== null ? 0x10 : 0) |
+        (that.checksum !== null ? 0x20 : 0) |
+        (that.kind !== null ? 0x40 : 0) |
+        (that.semanticId !== null ? 0x80 : 0) |
+        (that.supplementalSemanticIds !== null ? 0x100 : 0) |
+        (that.qualifiers !== null ? 0x200 : 0) |
+        (that.embeddedDataSpecifications !== null ? 0x400 : 0) |
+        (that.value !== null ? 0x800 : 0)
+    );
+
+    if (that.extensions !== null) {
+      writer.writeVarUint32(that.extensions.length);
+      for (const item of that.extensions) {
+        this.visitExtensionWithContext(item, writer);
+      }
+    }
+
+    if (that.category !== null) {
+      writer.writeString(that.category);
+    }
+
+    if (that.idShort !== null) {
+      writer.writeString(that.idShort);
+    }
+
+    if (that.displayName !== null) {
+      writer.writeVarUint32(that.displayName.length);
+      for (const item of that.displayName) {
+        this.visitLangStringWithContext(item, writer);
+      }
+    }
+
+    if (that.description !== null) {
+      writer.writeVarUint32(that.description.length);
+      for (const item of that.description) {
+        this.visitLangStringWithContext(item, writer);
+      }
+    }
+
+    if (that.checksum !== null) {
+      writer.writeString(that.checksum);
+    }
+
+    if (that.kind !== null) {
+      writer.writeVarUint32(that.kind);
+    }
+
+    if (that.semanticId !== null) {
+      this.visitReferenceWithContext(that.semanticId, writer);
+    }
+
+    if (that.supplementalSemanticIds !== null) {
+      writer.writeVarUint32(that.supplementalSemanticIds.length);
+      for (const item of that.supplementalSemanticIds) {
+        this.visitReferenceWithContext(item, writer);
+      }
+    }
+
+    if (that.qualifiers !== null) {
+      writer.writeVarUint32(that.qualifiers.length);
+      for (const item of that.qualifiers) {
+        this.visitQualifierWithContext(item, writer);
+      }
+    }
+
+    if (that.embeddedDataSpecifications !== null) {
+      writer.writeVarUint32(that.embeddedDataSpecifications.length);
+      for (const item of that.embeddedDataSpecifications) {
+        this.visitEmbeddedDataSpecificationWithContext(item, writer);
+      }
+    }
+
+    if (that.value !== null) {
+      writer.writeVarUint32(that.value.length);
+      for (const item of that.value) {
+        this.writeTagged(item, writer);
+      }
+    }
+  }
+
+  /**
+   * Write `that` to the `writer`.
+   *
+   * @param that - instance to be written
+   * @param writer - where to write to
+   */
+  visitPropertyWithContext(that: AasTypes.Property, writer: Writer): void {
+    writer.writeVarUint32(
+      (that.extensions !== null ? 0x1 : 0) |
+        (that.category !== null ? 0x2 : 0) |
+        (that.idShort !== null ? 0x4 : 0) |
+        (that.displayName !== null ? 0x8 : 0) |
+        (that.description !== null ? 0x10 : 0) |
+        (that.checksum !== null ? 0x20 : 0) |
+        (that.kind !== null ? 0x40 : 0) |
+        (that.semanticId !== null ? 0x80 : 0) |
+        (that.supplementalSemanticIds !== null ? 0x100 : 0) |
+        (that.qualifiers !== null ? 0x200 : 0) |
+        (that.embeddedDataSpecifications !== null ? 0x400 : 0) |
+        (that.value !== null ? 0x800 : 0) |
+        (that.valueId !== null ? 0x1000 : 0)
+    );
+
+    if (that.extensions !== null) {
+      writer.writeVarUint32(that.extensions.length);
+      for (const item of that.extensions) {
+        this.visitExtensionWithContext(item, writer);
+      }
+    }
+
+    if (that.category !== null) {
+      writer.writeString(that.category);
+    }
+
+    if (that.idShort !== null) {
+      writer.writeString(that.idShort);
+    }
+
+    if (that.displayName !== null) {
+      writer.writeVarUint32(that.displayName.length);
+      for (const item of that.displayName) {
+        this.visitLangStringWithContext(item, writer);
+      }
+    }
+
+    if (that.description !== null) {
+      writer.writeVarUint32(that.description.length);
+      for (const item of that.description) {
+        this.visitLangStringWithContext(item, writer);
+      }
+    }
+
+    if (that.checksum !== null) {
+      writer.writeString(that.checksum);
+    }
+
+    if (that.kind !== null) {
+      writer.writeVarUint32(that.kind);
+    }
+
+    if (that.semanticId !== null) {
+      this.visitReferenceWithContext(that.semanticId, writer);
+    }
+
+    if (that.supplementalSemanticIds !== null) {
+      writer.writeVarUint32(that.supplementalSemanticIds.length);
+      for (const item of that.supplementalSemanticIds) {
+        this.visitReferenceWithContext(item, writer);
+      }
+    }
+
+    if (that.qualifiers !== null) {
+      writer.writeVarUint32(that.qualifiers.length);
+      for (const item of that.qualifiers) {
+        this.visitQualifierWithContext(item, writer);
+      }
+    }
+
+    if (that.embeddedDataSpecifications !== null) {
+      writer.writeVarUint32(that.embeddedDataSpecifications.length);
+      for (const item of that.embeddedDataSpecifications) {
+        this.visitEmbeddedDataSpecificationWithContext(item, writer);
+      }
+    }
+
+    writer.writeVarUint32(that.valueType);
+
+    if (that.value !== null) {
+      writer.writeString(that.value);
+    }
+
+    if (that.valueId !== null) {
+      this.visitReferenceWithContext(that.valueId, writer);
+    }
+  }
+
+  /**
+   * Write `that` to the `writer`.
+   *
+   * @param that - instance to be written
+   * @param writer - where to write to
+   */
+  visitMultiLanguagePropertyWithContext(
+    that: AasTypes.MultiLanguageProperty,
+    writer: Writer
+  ): void {
+    writer.writeVarUint32(
+      (that.extensions !== null ? 0x1 : 0) |
+        (that.category !== null ? 0x2 : 0) |
+        (that.idShort !== null ? 0x4 : 0) |
+        (that.displayName !== null ? 0x8 : 0) |
+        (that.description !== null ? 0x10 : 0) |
+        (that.checksum !== null ? 0x20 : 0) |
+        (that.kind !== null ? 0x40 : 0) |
+        (that.semanticId !== null ? 0x80 : 0) |
+        (that.supplementalSemanticIds !== null ? 0x100 : 0) |
+        (that.qualifiers !== null ? 0x200 : 0) |
+        (that.embeddedDataSpecifications !== null ? 0x400 : 0) |
+        (that.value !== null ? 0x800 : 0) |
+        (that.valueId !== null ? 0x1000 : 0)
+    );
+
+    if (that.extensions !== null) {
+      writer.writeVarUint32(that.extensions.length);
+      for (const item of that.extensions) {
+        this.visitExtensionWithContext(item, writer);
+      }
+    }
+
+    if (that.category !== null) {
+      writer.writeString(that.category);
+    }
+
+    if (that.idShort !== null) {
+      writer.writeString(that.idShort);
+    }
+
+    if (that.displayName !== null) {
+      writer.writeVarUint32(that.displayName.length);
+      for (const item of that.displayName) {
+        this.visitLangStringWithContext(item, writer);
+      }
+    }
+
+    if (that.description !== null) {
+      writer.writeVarUint32(that.description.length);
+      for (const item of that.description) {
+        this.visitLangStringWithContext(item, writer);
+      }
+    }
+
+    if (that.checksum !== null) {
+      writer.writeString(that.checksum);
+    }
+
+    if (that.kind !== null) {
+      writer.writeVarUint32(that.kind);
+    }
+
+    if (that.semanticId !== null) {
+      this.visitReferenceWithContext(that.semanticId, writer);
+    }
+
+    if (that.supplementalSemanticIds !== null) {
+      writer.writeVarUint32(that.supplementalSemanticIds.length);
+      for (const item of that.supplementalSemanticIds) {
+        this.visitReferenceWithContext(item, writer);
+      }
+    }
+
+    if (that.qualifiers !== null) {
+      writer.writeVarUint32(that.qualifiers.length);
+      for (const item of that.qualifiers) {
+        this.visitQualifierWithContext(item, writer);
+      }
+    }
+
+    if (that.embeddedDataSpecifications !== null) {
+      writer.writeVarUint32(that.embeddedDataSpecifications.length);
+      for (const item of that.embeddedDataSpecifications) {
+        this.visitEmbeddedDataSpecificationWithContext(item, writer);
+      }
+    }
+
+    if (that.value !== null) {
+      writer.writeVarUint32(that.value.length);
+      for (const item of that.value) {
+        this.visitLangStringWithContext(item, writer);
+      }
+    }
+
+    if (that.valueId !== null) {
+      this.visitReferenceWithContext(that.valueId, writer);
+    }
+  }
+
+  /**
+   * Write `that` to the `writer`.
+   *
+   * @param that - instance to be written
+   * @param writer - where to write to
+   */
+  visitRangeWithContext(that: AasTypes.Range, writer: Writer): void {
+    writer.writeVarUint32(
+      (that.extensions !== null ? 0x1 : 0) |
+        (that.category !== null ? 0x2 : 0) |
+        (that.idShort !== null ? 0x4 : 0) |
+        (that.displayName !== null ? 0x8 : 0) |
+        (that.description !== null ? 0x10 : 0) |
+        (that.checksum !== null ? 0x20 : 0) |
+        (that.kind !== null ? 0x40 : 0) |
+        (that.semanticId !== null ? 0x80 : 0) |
+        (that.supplementalSemanticIds !== null ? 0x100 : 0) |
+        (that.qualifiers !== null ? 0x200 : 0) |
+        (that.embeddedDataSpecifications !== null ? 0x400 : 0) |
+        (that.min !== null ? 0x800 : 0) |
+        (that.max !== null ? 0x1000 : 0)
+    );
+
+    if (that.extensions !== null) {
+      writer.writeVarUint32(that.extensions.length);
+      for (const item of that.extensions) {
+        this.visitExtensionWithContext(item, writer);
+      }
+    }
+
+    if (that.category !== null) {
+      writer.writeString(that.category);
+    }
+
+    if (that.idShort !== null) {
+      writer.writeString(that.idShort);
+    }
+
+    if (that.displayName !== null) {
+      writer.writeVarUint32(that.displayName.length);
+      for (const item of that.displayName) {
+        this.visitLangStringWithContext(item, writer);
+      }
+    }
+
+    if (that.description !== null) {
+      writer.writeVarUint32(that.description.length);
+      for (const item of that.description) {
+        this.visitLangStringWithContext(item, writer);
+      }
+    }
+
+    if (that.checksum !== null) {
+      writer.writeString(that.checksum);
+    }
+
+    if (that.kind !== null) {
+      writer.writeVarUint32(that.kind);
+    }
+
+    if (that.semanticId !== null) {
+      this.visitReferenceWithContext(that.semanticId, writer);
+    }
+
+    if (that.supplementalSemanticIds !== null) {
+      writer.writeVarUint32(that.supplementalSemanticIds.length);
+      for (const item of that.supplementalSemanticIds) {
+        this.visitReferenceWithContext(item, writer);
+      }
+    }
+
+    if (that.qualifiers !== null) {
+      writer.writeVarUint32(that.qualifiers.length);
+      for (const item of that.qualifiers) {
+        this.visitQualifierWithContext(item, writer);
+      }
+    }
+
+    if (that.embeddedDataSpecifications !== null) {
+      writer.writeVarUint32(that.embeddedDataSpecifications.length);
+      for (const item of that.embeddedDataSpecifications) {
+        this.visitEmbeddedDataSpecificationWithContext(item, writer);
+      }
+    }
+
+    writer.writeVarUint32(that.valueType);
+
+    if (that.min !== null) {
+      writer.writeString(that.min);
+    }
+
+    if (that.max !== null) {
+      writer.writeString(that.max);
+    }
+  }
+
+  /**
+   * Write `that` to the `writer`.
+   *
+   * @param that - instance to be written
+   * @param writer - where to write to
+   */
+  visitReferenceElementWithContext(
+    that: AasTypes.ReferenceElement,
+    writer: Writer
+  ): void {
+    writer.writeVarUint32(
+      (that.extensions !== null ? 0x1 : 0) |
+        (that.category !== null ? 0x2 : 0) |
+        (that.idShort !== null ? 0x4 : 0) |
+        (that.displayName !== null ? 0x8 : 0) |
+        (that.description !== null ? 0x10 : 0) |
+        (that.checksum !== null ? 0x20 : 0) |
+        (that.kind !== null ? 0x40 : 0) |
+        (that.semanticId !== null ? 0x80 : 0) |
+        (that.supplementalSemanticIds !== null ? 0x100 : 0) |
+        (that.qualifiers !== null ? 0x200 : 0) |
+        (that.embeddedDataSpecifications !== null ? 0x400 : 0) |
+        (that.value !== null ? 0x800 : 0)
+    );
+
+    if (that.extensions !== null) {
+      writer.writeVarUint32(that.extensions.length);
+      for (const item of that.extensions) {
+        this.visitExtensionWithContext(item, writer);
+      }
+    }
+
+    if (that.category !== null) {
+      writer.writeString(that.category);
+    }
+
+    if (that.idShort !== null) {
+      writer.writeString(that.idShort);
+    }
+
+    if (that.displayName !== null) {
+      writer.writeVarUint32(that.displayName.length);
+      for (const item of that.displayName) {
+        this.visitLangStringWithContext(item, writer);
+      }
+    }
+
+    if (that.description !== null) {
+      writer.writeVarUint32(that.description.length);
+      for (const item of that.description) {
+        this.visitLangStringWithContext(item, writer);
+      }
+    }
+
+    if (that.checksum !== null) {
+      writer.writeString(that.checksum);
+    }
+
+    if (that.kind !== null) {
+      writer.writeVarUint32(that.kind);
+    }
+
+    if (that.semanticId !== null) {
+      this.visitReferenceWithContext(that.semanticId, writer);
+    }
+
+    if (that.supplementalSemanticIds !== null) {
+      writer.writeVarUint32(that.supplementalSemanticIds.length);
+      for (const item of that.supplementalSemanticIds) {
+        this.visitReferenceWithContext(item, writer);
+      }
+    }
+
+    if (that.qualifiers !== null) {
+      writer.writeVarUint32(that.qualifiers.length);
+      for (const item of that.qualifiers) {
+        this.visitQualifierWithContext(item, writer);
+      }
+    }
+
+    if (that.embeddedDataSpecifications !== null) {
+      writer.writeVarUint32(that.embeddedDataSpecifications.length);
+      for (const item of that.embeddedDataSpecifications) {
+        this.visitEmbeddedDataSpecificationWithContext(item, writer);
+      }
+    }
+
+    if (that.value !== null) {
+      this.visitReferenceWithContext(that.value, writer);
+    }
+  }
+
+  /**
+   * Write `that` to the `writer`.
+   *
+   * @param that - instance to be written
+   * @param writer - where to write to
+   */
+  visitBlobWithContext(that: AasTypes.Blob, writer: Writer): void {
+    writer.writeVarUint32(
+      (that.extensions !== null ? 0x1 : 0) |
+        (that.category !== null ? 0x2 : 0) |
+        (that.idShort !== null ? 0x4 : 0) |
+        (that.displayName !== null ? 0x8 : 0) |
+        (that.description !== null ? 0x10 : 0) |
+        (that.checksum !== null ? 0x20 : 0) |
+        (that.kind !== null ? 0x40 : 0) |
+        (that.semanticId !== null ? 0x80 : 0) |
+        (that.supplementalSemanticIds !== null ? 0x100 : 0) |
+        (that.qualifiers !== null ? 0x200 : 0) |
+        (that.embeddedDataSpecifications !== null ? 0x400 : 0) |
+        (that.value !== null ? 0x800 : 0)
+    );
+
+    if (that.extensions !== null) {
+      writer.writeVarUint32(that.extensions.length);
+      for (const item of that.extensions) {
+        this.visitExtensionWithContext(item, writer);
+      }
+    }
+
+    if (that.category !== null) {
+      writer.writeString(that.category);
+    }
+
+    if (that.idShort !== null) {
+      writer.writeString(that.idShort);
+    }
+
+    if (that.displayName !== null) {
+      writer.writeVarUint32(that.displayName.length);
+      for (const item of that.displayName) {
+        this.visitLangStringWithContext(item, writer);
+      }
+    }
+
+    if (that.description !== null) {
+      writer.writeVarUint32(that.description.length);
+      for (const item of that.description) {
+        this.visitLangStringWithContext(item, writer);
+      }
+    }
+
+    if (that.checksum !== null) {
+      writer.writeString(that.checksum);
+    }
+
+    if (that.kind !== null) {
+      writer.writeVarUint32(that.kind);
+    }
+
+    if (that.semanticId !== null) {
+      this.visitReferenceWithContext(that.semanticId, writer);
+    }
+
+    if (that.supplementalSemanticIds !== null) {
+      writer.writeVarUint32(that.supplementalSemanticIds.length);
+      for (const item of that.supplementalSemanticIds) {
+        this.visitReferenceWithContext(item, writer);
+      }
+    }
+
+    if (that.qualifiers !== null) {
+      writer.writeVarUint32(that.qualifiers.length);
+      for (const item of that.qualifiers) {
+        this.visitQualifierWithContext(item, writer);
+      }
+    }
+
+    if (that.embeddedDataSpecifications !== null) {
+      writer.writeVarUint32(that.embeddedDataSpecifications.length);
+      for (const item of that.embeddedDataSpecifications) {
+        this.visitEmbeddedDataSpecificationWithContext(item, writer);
+      }
+    }
+
+    if (that.value !== null) {
+      writer.writeBytes(that.value);
+    }
+
+    writer.writeString(that.contentType);
+  }
+
+  /**
+   * Write `that` to the `writer`.
+   *
+   * @param that - instance to be written
+   * @param writer - where to write to
+   */
+  visitFileWithContext(that: AasTypes.File, writer: Writer): void {
+    writer.writeVarUint32(
+      (that.extensions !== null ? 0x1 : 0) |
+        (that.category !== null ? 0x2 : 0) |
+        (that.idShort !== null ? 0x4 : 0) |
+        (that.displayName !== null ? 0x8 : 0) |
+        (that.description !== null ? 0x10 : 0) |
+        (that.checksum !== null ? 0x20 : 0) |
+        (that.kind !== null ? 0x40 : 0) |
+        (that.semanticId !== null ? 0x80 : 0) |
+        (that.supplementalSemanticIds !== null ? 0x100 : 0) |
+        (that.qualifiers !== null ? 0x200 : 0) |
+        (that.embeddedDataSpecifications !== null ? 0x400 : 0) |
+        (that.value !== null ? 0x800 : 0)
+    );
+
+    if (that.extensions !== null) {
+      writer.writeVarUint32(that.extensions.length);
+      for (const item of that.extensions) {
+        this.visitExtensionWithContext(item, writer);
+      }
+    }
+
+    if (that.category !== null) {
+      writer.writeString(that.category);
+    }
+
+    if (that.idShort !== null) {
+      writer.writeString(that.idShort);
+    }
+
+    if (that.displayName !== null) {
+      writer.writeVarUint32(that.displayName.length);
+      for (const item of that.displayName) {
+        this.visitLangStringWithContext(item, writer);
+      }
+    }
+
+    if (that.description !== null) {
+      writer.writeVarUint32(that.description.length);
+      for (const item of that.description) {
+        this.visitLangStringWithContext(item, writer);
+      }
+    }
+
+    if (that.checksum !== null) {
+      writer.writeString(that.checksum);
+    }
+
+    if (that.kind !== null) {
+      writer.writeVarUint32(that.kind);
+    }
+
+    if (that.semanticId !== null) {
+      this.visitReferenceWithContext(that.semanticId, writer);
+    }
+
+    if (that.supplementalSemanticIds !== null) {
+      writer.writeVarUint32(that.supplementalSemanticIds.length);
+      for (const item of that.supplementalSemanticIds) {
+        this.visitReferenceWithContext(item, writer);
+      }
+    }
+
+    if (that.qualifiers !== null) {
+      writer.writeVarUint32(that.qualifiers.length);
+      for (const item of that.qualifiers) {
+        this.visitQualifierWithContext(item, writer);
+      }
+    }
+
+    if (that.embeddedDataSpecifications !== null) {
+      writer.writeVarUint32(that.embeddedDataSpecifications.length);
+      for (const item of that.embeddedDataSpecifications) {
+        this.visitEmbeddedDataSpecificationWithContext(item, writer);
+      }
+    }
+
+    if (that.value !== null) {
+      writer.writeString(that.value);
+    }
+
+    writer.writeString(that.contentType);
+  }
+
+  /**
+   * Write `that` to the `writer`.
+   *
+   * @param that - instance to be written
+   * @param writer - where to write to
+   */
+  visitAnnotatedRelationshipElementWithContext(
+    that: AasTypes.AnnotatedRelationshipElement,
+    writer: Writer
+  ): void {
+    writer.writeVarUint32(
+      (that.extensions !== null ? 0x1 : 0) |
+        (that.category !== null ? 0x2 : 0) |
+        (that.idShort !== null ? 0x4 : 0) |
+        (that.displayName !== null ? 0x8 : 0) |
+        (that.description !== null ? 0x10 : 0) |
+        (that.checksum !== null ? 0x20 : 0) |
+        (that.kind !== null ? 0x40 : 0) |
+        (that.semanticId !== null ? 0x80 : 0) |
+        (that.supplementalSemanticIds !== null ? 0x100 : 0) |
+        (that.qualifiers !== null ? 0x200 : 0) |
+        (that.embeddedDataSpecifications !== null ? 0x400 : 0) |
+        (that.annotations !== null ? 0x800 : 0)
+    );
+
+    if (that.extensions !== null) {
+      writer.writeVarUint32(that.extensions.length);
+      for (const item of that.extensions) {
+        this.visitExtensionWithContext(item, writer);
+      }
+    }
+
+    if (that.category !== null) {
+      writer.writeString(that.category);
+    }
+
+    if (that.idShort !== null) {
+      writer.writeString(that.idShort);
+    }
+
+    if (that.displayName !== null) {
+      writer.writeVarUint32(that.displayName.length);
+      for (const item of that.displayName) {
+        this.visitLangStringWithContext(item, writer);
+      }
+    }
+
+    if (that.description !== null) {
+      writer.writeVarUint32(that.description.length);
+      for (const item of that.description) {
+        this.visitLangStringWithContext(item, writer);
+      }
+    }
+
+    if (that.checksum !== null) {
+      writer.writeString(that.checksum);
+    }
+
+    if (that.kind !== null) {
+      writer.writeVarUint32(that.kind);
+    }
+
+    if (that.semanticId !== null) {
+      this.visitReferenceWithContext(that.semanticId, writer);
+    }
+
+    if (that.supplementalSemanticIds !== null) {
+      writer.writeVarUint32(that.supplementalSemanticIds.length);
+      for (const item of that.supplementalSemanticIds) {
+        this.visitReferenceWithContext(item, writer);
+      }
+    }
+
+    if (that.qualifiers !== null) {
+      writer.writeVarUint32(that.qualifiers.length);
+      for (const item of that.qualifiers) {
+        this.visitQualifierWithContext(item, writer);
+      }
+    }
+
+    if (that.embeddedDataSpecifications !== null) {
+      writer.writeVarUint32(that.embeddedDataSpecifications.length);
+      for (const item of that.embeddedDataSpecifications) {
+        this.visitEmbeddedDataSpecificationWithContext(item, writer);
+      }
+    }
+
+    this.visitReferenceWithContext(that.first, writer);
+
+    this.visitReferenceWithContext(that.second, writer);
+
+    if (that.annotations !== null) {
+      writer.writeVarUint32(that.annotations.length);
+      for (const item of that.annotations) {
+        this.writeTagged(item, writer);
+      }
+    }
+  }
+
+  /**
+   * Write `that` to the `writer`.
+   *
+   * @param that - instance to be written
+   * @param writer - where to write to
+   */
+  visitEntityWithContext(that: AasTypes.Entity, writer: Writer): void {
+    writer.writeVarUint32(
+      (that.extensions !== null ? 0x1 : 0) |
+        (that.category !== null ? 0x2 : 0) |
+        (that.idShort !== null ? 0x4 : 0) |
+        (that.displayName !== null ? 0x8 : 0) |
+        (that.description !== null ? 0x10 : 0) |
+        (that.checksum !== null ? 0x20 : 0) |
+        (that.kind !== null ? 0x40 : 0) |
+        (that.semanticId !== null ? 0x80 : 0) |
+        (that.supplementalSemanticIds !== null ? 0x100 : 0) |
+        (that.qualifiers !== null ? 0x200 : 0) |
+        (that.embeddedDataSpecifications !== null ? 0x400 : 0) |
+        (that.statements !== null ? 0x800 : 0) |
+        (that.globalAssetId !== null ? 0x1000 : 0) |
+        (that.specificAssetId !== null ? 0x2000 : 0)
+    );
+
+    if (that.extensions !== null) {
+      writer.writeVarUint32(that.extensions.length);
+      for (const item of that.extensions) {
+        this.visitExtensionWithContext(item, writer);
+      }
+    }
+
+    if (that.category !== null) {
+      writer.writeString(that.category);
+    }
+
+    if (that.idShort !== null) {
+      writer.writeString(that.idShort);
+    }
+
+    if (that.displayName !== null) {
+      writer.writeVarUint32(that.displayName.length);
+      for (const item of that.displayName) {
+        this.visitLangStringWithContext(item, writer);
+      }
+    }
+
+    if (that.description !== null) {
+      writer.writeVarUint32(that.description.length);
+      for (const item of that.description) {
+        this.visitLangStringWithContext(item, writer);
+      }
+    }
+
+    if (that.checksum !== null) {
+      writer.writeString(that.checksum);
+    }
+
+    if (that.kind !== null) {
+      writer.writeVarUint32(that.kind);
+    }
+
+    if (that.semanticId !== null) {
+      this.visitReferenceWithContext(that.semanticId, writer);
+    }
+
+    if (that.supplementalSemanticIds !== null) {
+      writer.writeVarUint32(that.supplementalSemanticIds.length);
+      for (const item of that.supplementalSemanticIds) {
+        this.visitReferenceWithContext(item, writer);
+      }
+    }
+
+    if (that.qualifiers !== null) {
+      writer.writeVarUint32(that.qualifiers.length);
+      for (const item of that.qualifiers) {
+        this.visitQualifierWithContext(item, writer);
+      }
+    }
+
+    if (that.embeddedDataSpecifications !== null) {
+      writer.writeVarUint32(that.embeddedDataSpecifications.length);
+      for (const item of that.embeddedDataSpecifications) {
+        this.visitEmbeddedDataSpecificationWithContext(item, writer);
+      }
+    }
+
+    if (that.statements !== null) {
+      writer.writeVarUint32(that.statements.length);
+      for (const item of that.statements) {
+        this.writeTagged(item, writer);
+      }
+    }
+
+    writer.writeVarUint32(that.entityType);
+
+    if (that.globalAssetId !== null) {
+      this.visitReferenceWithContext(that.globalAssetId, writer);
+    }
+
+    if (that.specificAssetId !== null) {
+      this.visitSpecificAssetIdWithContext(that.specificAssetId, writer);
+    }
+  }
+
+  /**
+   * Write `that` to the `writer`.
+   *
+   * @param that - instance to be written
+   * @param writer - where to write to
+   */
+  visitEventPayloadWithContext(that: AasTypes.EventPayload, writer: Writer): void {
+    writer.writeVarUint32(
+      (that.sourceSemanticId !== null ? 0x1 : 0) |
+        (that.observableSemanticId !== null ? 0x2 : 0) |
+        (that.topic !== null ? 0x4 : 0) |
+        (that.subjectId !== null ? 0x8 : 0) |
+        (that.payload !== null ? 0x10 : 0)
+    );
+
+    this.visitReferenceWithContext(that.source, writer);
+
+    if (that.sourceSemanticId !== null) {
+      this.visitReferenceWithContext(that.sourceSemanticId, writer);
+    }
+
+    this.visitReferenceWithContext(that.observableReference, writer);
+
+    if (that.observableSemanticId !== null) {
+      this.visitReferenceWithContext(that.observableSemanticId, writer);
+    }
+
+    if (that.topic !== null) {
+      writer.writeString(that.topic);
+    }
+
+    if (that.subjectId !== null) {
+      this.visitReferenceWithContext(that.subjectId, writer);
+    }
+
+    writer.writeString(that.timeStamp);
+
+    if (that.payload !== null) {
+      writer.writeString(that.payload);
+    }
+  }
+
+  /**
+   * Write `that` to the `writer`.
+   *
+   * @param that - instance to be written
+   * @param writer - where to write to
+   */
+  visitBasicEventElementWithContext(
+    that: AasTypes.BasicEventElement,
+    writer: Writer
+  ): void {
+    writer.writeVarUint32(
+      (that.extensions !== null ? 0x1 : 0) |
+        (that.category !== null ? 0x2 : 0) |
+        (that.idShort !== null ? 0x4 : 0) |
+        (that.displayName !== null ? 0x8 : 0) |
+        (that.description !== null ? 0x10 : 0) |
+        (that.checksum !== null ? 0x20 : 0) |
+        (that.kind !== null ? 0x40 : 0) |
+        (that.semanticId !== null ? 0x80 : 0) |
+        (that.supplementalSemanticIds !== null ? 0x100 : 0) |
+        (that.qualifiers !== null ? 0x200 : 0) |
+        (that.embeddedDataSpecifications !== null ? 0x400 : 0) |
+        (that.messageTopic !== null ? 0x800 : 0) |
+        (that.messageBroker !== null ? 0x1000 : 0) |
+        (that.lastUpdate !== null ? 0x2000 : 0) |
+        (that.minInterval !== null ? 0x4000 : 0) |
+        (that.maxInterval !== null ? 0x8000 : 0)
+    );
+
+    if (that.extensions !== null) {
+      writer.writeVarUint32(that.extensions.length);
+      for (const item of that.extensions) {
+        this.visitExtensionWithContext(item, writer);
+      }
+    }
+
+    if (that.category !== null) {
+      writer.writeString(that.category);
+    }
+
+    if (that.idShort !== null) {
+      writer.writeString(that.idShort);
+    }
+
+    if (that.displayName !== null) {
+      writer.writeVarUint32(that.displayName.length);
+      for (const item of that.displayName) {
+        this.visitLangStringWithContext(item, writer);
+      }
+    }
+
+    if (that.description !== null) {
+      writer.writeVarUint32(that.description.length);
+      for (const item of that.description) {
+        this.visitLangStringWithContext(item, writer);
+      }
+    }
+
+    if (that.checksum !== null) {
+      writer.writeString(that.checksum);
+    }
+
+    if (that.kind !== null) {
+      writer.writeVarUint32(that.kind);
+    }
+
+    if (that.semanticId !== null) {
+      this.visitReferenceWithContext(that.semanticId, writer);
+    }
+
+    if (that.supplementalSemanticIds !== null) {
+      writer.writeVarUint32(that.supplementalSemanticIds.length);
+      for (const item of that.supplementalSemanticIds) {
+        this.visitReferenceWithContext(item, writer);
+      }
+    }
+
+    if (that.qualifiers !== null) {
+      writer.writeVarUint32(that.qualifiers.length);
+      for (const item of that.qualifiers) {
+        this.visitQualifierWithContext(item, writer);
+      }
+    }
+
+    if (that.embeddedDataSpecifications !== null) {
+      writer.writeVarUint32(that.embeddedDataSpecifications.length);
+      for (const item of that.embeddedDataSpecifications) {
+        this.visitEmbeddedDataSpecificationWithContext(item, writer);
+      }
+    }
+
+    this.visitReferenceWithContext(that.observed, writer);
+
+    writer.writeVarUint32(that.direction);
+
+    writer.writeVarUint32(that.state);
+
+    if (that.messageTopic !== null) {
+      writer.writeString(that.messageTopic);
+    }
+
+    if (that.messageBroker !== null) {
+      this.visitReferenceWithContext(that.messageBroker, writer);
+    }
+
+    if (that.lastUpdate !== null) {
+      writer.writeString(that.lastUpdate);
+    }
+
+    if (that.minInterval !== null) {
+      writer.writeString(that.minInterval);
+    }
+
+    if (that.maxInterval !== null) {
+      writer.writeString(that.maxInterval);
+    }
+  }
+
+  /**
+   * Write `that` to the `writer`.
+   *
+   * @param that - instance to be written
+   * @param writer - where to write to
+   */
+  visitOperationWithContext(that: AasTypes.Operation, writer: Writer): void {
+    writer.writeVarUint32(
+      (that.extensions !== null ? 0x1 : 0) |
+        (that.category !== null ? 0x2 : 0) |
+        (that.idShort !== null ? 0x4 : 0) |
+        (that.displayName !== null ? 0x8 : 0) |
+        (that.description !== null ? 0x10 : 0) |
+        (that.checksum !== null ? 0x20 : 0) |
+        (that.kind !== null ? 0x40 : 0) |
+        (that.semanticId !== null ? 0x80 : 0) |
+        (that.supplementalSemanticIds !== null ? 0x100 : 0) |
+        (that.qualifiers !== null ? 0x200 : 0) |
+        (that.embeddedDataSpecifications !== null ? 0x400 : 0) |
+        (that.inputVariables !== null ? 0x800 : 0) |
+        (that.outputVariables !== null ? 0x1000 : 0) |
+        (that.inoutputVariables !== null ? 0x2000 : 0)
+    );
+
+    if (that.extensions !== null) {
+      writer.writeVarUint32(that.extensions.length);
+      for (const item of that.extensions) {
+        this.visitExtensionWithContext(item, writer);
+      }
+    }
+
+    if (that.category !== null) {
+      writer.writeString(that.category);
+    }
+
+    if (that.idShort !== null) {
+      writer.writeString(that.idShort);
+    }
+
+    if (that.displayName !== null) {
+      writer.writeVarUint32(that.displayName.length);
+      for (const item of that.displayName) {
+        this.visitLangStringWithContext(item, writer);
+      }
+    }
+
+    if (that.description !== null) {
+      writer.writeVarUint32(that.description.length);
+      for (const item of that.description) {
+        this.visitLangStringWithContext(item, writer);
+      }
+    }
+
+    if (that.checksum !== null) {
+      writer.writeString(that.checksum);
+    }
+
+    if (that.kind !== null) {
+      writer.writeVarUint32(that.kind);
+    }
+
+    if (that.semanticId !== null) {
+      this.visitReferenceWithContext(that.semanticId, writer);
+    }
+
+    if (that.supplementalSemanticIds !== null) {
+      writer.writeVarUint32(that.supplementalSemanticIds.length);
+      for (const item of that.supplementalSemanticIds) {
+        this.visitReferenceWithContext(item, writer);
+      }
+    }
+
+    if (that.qualifiers !== null) {
+      writer.writeVarUint32(that.qualifiers.length);
+      for (const item of that.qualifiers) {
+        this.visitQualifierWithContext(item, writer);
+      }
+    }
+
+    if (that.embeddedDataSpecifications !== null) {
+      writer.writeVarUint32(that.embeddedDataSpecifications.length);
+      for (const item of that.embeddedDataSpecifications) {
+        this.visitEmbeddedDataSpecificationWithContext(item, writer);
+      }
+    }
+
+    if (that.inputVariables !== null) {
+      writer.writeVarUint32(that.inputVariables.length);
+      for (const item of that.inputVariables) {
+        this.visitOperationVariableWithContext(item, writer);
+      }
+    }
+
+    if (that.outputVariables !== null) {
+      writer.writeVarUint32(that.outputVariables.length);
+      for (const item of that.outputVariables) {
+        this.visitOperationVariableWithContext(item, writer);
+      }
+    }
+
+    if (that.inoutputVariables !== null) {
+      writer.writeVarUint32(that.inoutputVariables.length);
+      for (const item of that.inoutputVariables) {
+        this.visitOperationVariableWithContext(item, writer);
+      }
+    }
+  }
+
+  /**
+   * Write `that` to the `writer`.
+   *
+   * @param that - instance to be written
+   * @param writer - where to write to
+   */
+  visitOperationVariableWithContext(
+    that: AasTypes.OperationVariable,
+    writer: Writer
+  ): void {
+    this.writeTagged(that.value, writer);
+  }
+
+  /**
+   * Write `that` to the `writer`.
+   *
+   * @param that - instance to be written
+   * @param writer - where to write to
+   */
+  visitCapabilityWithContext(that: AasTypes.Capability, writer: Writer): void {
+    writer.writeVarUint32(
+      (that.extensions !== null ? 0x1 : 0) |
+        (that.category !== null ? 0x2 : 0) |
+        (that.idShort !== null ? 0x4 : 0) |
+        (that.displayName !== null ? 0x8 : 0) |
+        (that.description !== null ? 0x10 : 0) |
+        (that.checksum !== null ? 0x20 : 0) |
+        (that.kind !== null ? 0x40 : 0) |
+        (that.semanticId !== null ? 0x80 : 0) |
+        (that.supplementalSemanticIds !== null ? 0x100 : 0) |
+        (that.qualifiers !== null ? 0x200 : 0) |
+        (that.embeddedDataSpecifications !== null ? 0x400 : 0)
+    );
+
+    if (that.extensions !== null) {
+      writer.writeVarUint32(that.extensions.length);
+      for (const item of that.extensions) {
+        this.visitExtensionWithContext(item, writer);
+      }
+    }
+
+    if (that.category !== null) {
+      writer.writeString(that.category);
+    }
+
+    if (that.idShort !== null) {
+      writer.writeString(that.idShort);
+    }
+
+    if (that.displayName !== null) {
+      writer.writeVarUint32(that.displayName.length);
+      for (const item of that.displayName) {
+        this.visitLangStringWithContext(item, writer);
+      }
+    }
+
+    if (that.description !== null) {
+      writer.writeVarUint32(that.description.length);
+      for (const item of that.description) {
+        this.visitLangStringWithContext(item, writer);
+      }
+    }
+
+    if (that.checksum !== null) {
+      writer.writeString(that.checksum);
+    }
+
+    if (that.kind !== null) {
+      writer.writeVarUint32(that.kind);
+    }
+
+    if (that.semanticId !== null) {
+      this.visitReferenceWithContext(that.semanticId, writer);
+    }
+
+    if (that.supplementalSemanticIds !== null) {
+      writer.writeVarUint32(that.supplementalSemanticIds.length);
+      for (const item of that.supplementalSemanticIds) {
+        this.visitReferenceWithContext(item, writer);
+      }
+    }
+
+    if (that.qualifiers !== null) {
+      writer.writeVarUint32(that.qualifiers.length);
+      for (const item of that.qualifiers) {
+        this.visitQualifierWithContext(item, writer);
+      }
+    }
+
+    if (that.embeddedDataSpecifications !== null) {
+      writer.writeVarUint32(that.embeddedDataSpecifications.length);
+      for (const item of that.embeddedDataSpecifications) {
+        this.visitEmbeddedDataSpecificationWithContext(item, writer);
+      }
+    }
+  }
+
+  /**
+   * Write `that` to the `writer`.
+   *
+   * @param that - instance to be written
+   * @param writer - where to write to
+   */
+  visitConceptDescriptionWithContext(
+    that: AasTypes.ConceptDescription,
+    writer: Writer
+  ): void {
+    writer.writeVarUint32(
+      (that.extensions !== null ? 0x1 : 0) |
+        (that.category !== null ? 0x2 : 0) |
+        (that.idShort !== null ? 0x4 : 0) |
+        (that.displayName !== null ? 0x8 : 0) |
+        (that.description !== null ? 0x10 : 0) |
+        (that.checksum !== null ? 0x20 : 0) |
+        (that.administration !== null ? 0x40 : 0) |
+        (that.embeddedDataSpecifications !== null ? 0x80 : 0) |
+        (that.isCaseOf !== null ? 0x100 : 0)
+    );
+
+    if (that.extensions !== null) {
+      writer.writeVarUint32(that.extensions.length);
+      for (const item of that.extensions) {
+        this.visitExtensionWithContext(item, writer);
+      }
+    }
+
+    if (that.category !== null) {
+      writer.writeString(that.category);
+    }
+
+    if (that.idShort !== null) {
+      writer.writeString(that.idShort);
+    }
+
+    if (that.displayName !== null) {
+      writer.writeVarUint32(that.displayName.length);
+      for (const item of that.displayName) {
+        this.visitLangStringWithContext(item, writer);
+      }
+    }
+
+    if (that.description !== null) {
+      writer.writeVarUint32(that.description.length);
+      for (const item of that.description) {
+        this.visitLangStringWithContext(item, writer);
+      }
+    }
+
+    if (that.checksum !== null) {
+      writer.writeString(that.checksum);
+    }
+
+    if (that.administration !== null) {
+      this.visitAdministrativeInformationWithContext(that.administration, writer);
+    }
+
+    writer.writeString(that.id);
+
+    if (that.embeddedDataSpecifications !== null) {
+      writer.writeVarUint32(that.embeddedDataSpecifications.length);
+      for (const item of that.embeddedDataSpecifications) {
+        this.visitEmbeddedDataSpecificationWithContext(item, writer);
+      }
+    }
+
+    if (that.isCaseOf !== null) {
+      writer.writeVarUint32(that.isCaseOf.length);
+      for (const item of that.isCaseOf) {
+        this.visitReferenceWithContext(item, writer);
+      }
+    }
+  }
+
+  /**
+   * Write `that` to the `writer`.
+   *
+   * @param that - instance to be written
+   * @param writer - where to write to
+   */
+  visitReferenceWithContext(that: AasTypes.Reference, writer: Writer): void {
+    writer.writeVarUint32((that.referredSemanticId !== null ? 0x1 : 0));
+
+    writer.writeVarUint32(that.type);
+
+    if (that.referredSemanticId !== null) {
+      this.visitReferenceWithContext(that.referredSemanticId, writer);
+    }
+
+    writer.writeVarUint32(that.keys.length);
+    for (const item of that.keys) {
+      this.visitKeyWithContext(item, writer);
+    }
+  }
+
+  /**
+   * Write `that` to the `writer`.
+   *
+   * @param that - instance to be written
+   * @param writer - where to write to
+   */
+  visitKeyWithContext(that: AasTypes.Key, writer: Writer): void {
+    writer.writeVarUint32(that.type);
+
+    writer.writeString(that.value);
+  }
+
+  /**
+   * Write `that` to the `writer`.
+   *
+   * @param that - instance to be written
+   * @param writer - where to write to
+   */
+  visitLangStringWithContext(that: AasTypes.LangString, writer: Writer): void {
+    writer.writeString(that.language);
+
+    writer.writeString(that.text);
+  }
+
+  /**
+   * Write `that` to the `writer`.
+   *
+   * @param that - instance to be written
+   * @param writer - where to write to
+   */
+  visitEnvironmentWithContext(that: AasTypes.Environment, writer: Writer): void {
+    writer.writeVarUint32(
+      (that.assetAdministrationShells !== null ? 0x1 : 0) |
+        (that.submodels !== null ? 0x2 : 0) |
+        (that.conceptDescriptions !== null ? 0x4 : 0)
+    );
+
+    if (that.assetAdministrationShells !== null) {
+      writer.writeVarUint32(that.assetAdministrationShells.length);
+      for (const item of that.assetAdministrationShells) {
+        this.visitAssetAdministrationShellWithContext(item, writer);
+      }
+    }
+
+    if (that.submodels !== null) {
+      writer.writeVarUint32(that.submodels.length);
+      for (const item of that.submodels) {
+        this.visitSubmodelWithContext(item, writer);
+      }
+    }
+
+    if (that.conceptDescriptions !== null) {
+      writer.writeVarUint32(that.conceptDescriptions.length);
+      for (const item of that.conceptDescriptions) {
+        this.visitConceptDescriptionWithContext(item, writer);
+      }
+    }
+  }
+
+  /**
+   * Write `that` to the `writer`.
+   *
+   * @param that - instance to be written
+   * @param writer - where to write to
+   */
+  visitEmbeddedDataSpecificationWithContext(
+    that: AasTypes.EmbeddedDataSpecification,
+    writer: Writer
+  ): void {
+    this.visitReferenceWithContext(that.dataSpecification, writer);
+
+    this.writeTagged(that.dataSpecificationContent, writer);
+  }
+
+  /**
+   * Write `that` to the `writer`.
+   *
+   * @param that - instance to be written
+   * @param writer - where to write to
+   */
+  visitValueReferencePairWithContext(
+    that: AasTypes.ValueReferencePair,
+    writer: Writer
+  ): void {
+    writer.writeString(that.value);
+
+    this.visitReferenceWithContext(that.valueId, writer);
+  }
+
+  /**
+   * Write `that` to the `writer`.
+   *
+   * @param that - instance to be written
+   * @param writer - where to write to
+   */
+  visitValueListWithContext(that: AasTypes.ValueList, writer: Writer): void {
+    writer.writeVarUint32(that.valueReferencePairs.length);
+    for (const item of that.valueReferencePairs) {
+      this.visitValueReferencePairWithContext(item, writer);
+    }
+  }
+
+  /**
+   * Write `that` to the `writer`.
+   *
+   * @param that - instance to be written
+   * @param writer - where to write to
+   */
+  visitDataSpecificationIec61360WithContext(
+    that: AasTypes.DataSpecificationIec61360,
+    writer: Writer
+  ): void {
+    writer.writeVarUint32(
+      (that.shortName !== null ? 0x1 : 0) |
+        (that.unit !== null ? 0x2 : 0) |
+        (that.unitId !== null ? 0x4 : 0) |
+        (that.sourceOfDefinition !== null ? 0x8 : 0) |
+        (that.symbol !== null ? 0x10 : 0) |
+        (that.dataType !== null ? 0x20 : 0) |
+        (that.definition !== null ? 0x40 : 0) |
+        (that.valueFormat !== null ? 0x80 : 0) |
+        (that.valueList !== null ? 0x100 : 0) |
+        (that.value !== null ? 0x200 : 0) |
+        (that.levelType !== null ? 0x400 : 0)
+    );
+
+    writer.writeVarUint32(that.preferredName.length);
+    for (const item of that.preferredName) {
+      this.visitLangStringWithContext(item, writer);
+    }
+
+    if (that.shortName !== null) {
+      writer.writeVarUint32(that.shortName.length);
+      for (const item of that.shortName) {
+        this.visitLangStringWithContext(item, writer);
+      }
+    }
+
+    if (that.unit !== null) {
+      writer.writeString(that.unit);
+    }
+
+    if (that.unitId !== null) {
+      this.visitReferenceWithContext(that.unitId, writer);
+    }
+
+    if (that.sourceOfDefinition !== null) {
+      writer.writeString(that.sourceOfDefinition);
+    }
+
+    if (that.symbol !== null) {
+      writer.writeString(that.symbol);
+    }
+
+    if (that.dataType !== null) {
+      writer.writeVarUint32(that.dataType);
+    }
+
+    if (that.definition !== null) {
+      writer.writeVarUint32(that.definition.length);
+      for (const item of that.definition) {
+        this.visitLangStringWithContext(item, writer);
+      }
+    }
+
+    if (that.valueFormat !== null) {
+      writer.writeString(that.valueFormat);
+    }
+
+    if (that.valueList !== null) {
+      this.visitValueListWithContext(that.valueList, writer);
+    }
+
+    if (that.value !== null) {
+      writer.writeString(that.value);
+    }
+
+    if (that.levelType !== null) {
+      writer.writeVarUint32(that.levelType);
+    }
+  }
+
+  /**
+   * Write `that` to the `writer`.
+   *
+   * @param that - instance to be written
+   * @param writer - where to write to
+   */
+  visitDataSpecificationPhysicalUnitWithContext(
+    that: AasTypes.DataSpecificationPhysicalUnit,
+    writer: Writer
+  ): void {
+    writer.writeVarUint32(
+      (that.siNotation !== null ? 0x1 : 0) |
+        (that.siName !== null ? 0x2 : 0) |
+        (that.dinNotation !== null ? 0x4 : 0) |
+        (that.eceName !== null ? 0x8 : 0) |
+        (that.eceCode !== null ? 0x10 : 0) |
+        (that.nistName !== null ? 0x20 : 0) |
+        (that.sourceOfDefinition !== null ? 0x40 : 0) |
+        (that.conversionFactor !== null ? 0x80 : 0) |
+        (that.registrationAuthorityId !== null ? 0x100 : 0) |
+        (that.supplier !== null ? 0x200 : 0)
+    );
+
+    writer.writeString(that.unitName);
+
+    writer.writeString(that.unitSymbol);
+
+    writer.writeVarUint32(that.definition.length);
+    for (const item of that.definition) {
+      this.visitLangStringWithContext(item, writer);
+    }
+
+    if (that.siNotation !== null) {
+      writer.writeString(that.siNotation);
+    }
+
+    if (that.siName !== null) {
+      writer.writeString(that.siName);
+    }
+
+    if (that.dinNotation !== null) {
+      writer.writeString(that.dinNotation);
+    }
+
+    if (that.eceName !== null) {
+      writer.writeString(that.eceName);
+    }
+
+    if (that.eceCode !== null) {
+      writer.writeString(that.eceCode);
+    }
+
+    if (that.nistName !== null) {
+      writer.writeString(that.nistName);
+    }
+
+    if (that.sourceOfDefinition !== null) {
+      writer.writeString(that.sourceOfDefinition);
+    }
+
+    if (that.conversionFactor !== null) {
+      writer.writeString(that.conversionFactor);
+    }
+
+    if (that.registrationAuthorityId !== null) {
+      writer.writeString(that.registrationAuthorityId);
+    }
+
+    if (that.supplier !== null) {
+      writer.writeString(that.supplier);
+    }
+  }
+}
+
+const ENCODER = /*@__PURE__*/ new Encoder();
+
+/**
+ * Encode `that` instance, including all its descendants, to bytes.
+ *
+ * @param that - AAS data to be encoded
+ * @returns encoded bytes which can be decoded with {@link fromBinary}
+ */
+export function toBinary(that: AasTypes.Class): Uint8Array {
+  const writer = new Writer();
+  writer.writeRaw(MAGIC);
+  writer.writeVarUint32(FORMAT_VERSION);
+  ENCODER.writeTagged(that, writer);
+  return writer.finish();
+}
+
+// endregion
+
+// region Decoding
+
+/**
+ * Read a literal of `ModelingKind`.
+ */
+function readModelingKind(reader: Reader): AasTypes.ModelingKind {
+  const offset = reader.offset;
+  const value = reader.readVarUint32();
+  if (AasStringification.modelingKindToString(value) === null) {
+    throw new DecodingError(
+      `Expected a literal of ModelingKind, but got: ${value}`,
+      offset
+    );
+  }
+  return value;
+}
+
+/**
+ * Read a literal of `QualifierKind`.
+ */
+function readQualifierKind(reader: Reader): AasTypes.QualifierKind {
+  const offset = reader.offset;
+  const value = reader.readVarUint32();
+  if (AasStringification.qualifierKindToString(value) === null) {
+    throw new DecodingError(
+      `Expected a literal of QualifierKind, but got: ${value}`,
+      offset
+    );
+  }
+  return value;
+}
+
+/**
+ * Read a literal of `AssetKind`.
+ */
+function readAssetKind(reader: Reader): AasTypes.AssetKind {
+  const offset = reader.offset;
+  const value = reader.readVarUint32();
+  if (AasStringification.assetKindToString(value) === null) {
+    throw new DecodingError(
+      `Expected a literal of AssetKind, but got: ${value}`,
+      offset
+    );
+  }
+  return value;
+}
+
+/**
+ * Read a literal of `AasSubmodelElements`.
+ */
+function readAasSubmodelElements(reader: Reader): AasTypes.AasSubmodelElements {
+  const offset = reader.offset;
+  const value = reader.readVarUint32();
+  if (AasStringification.aasSubmodelElementsToString(value) === null) {
+    throw new DecodingError(
+      `Expected a literal of AasSubmodelElements, but got: ${value}`,
+      offset
+    );
+  }
+  return value;
+}
+
+/**
+ * Read a literal of `EntityType`.
+ */
+function readEntityType(reader: Reader): AasTypes.EntityType {
+  const offset = reader.offset;
+  const value = reader.readVarUint32();
+  if (AasStringification.entityTypeToString(value) === null) {
+    throw new DecodingError(
+      `Expected a literal of EntityType, but got: ${value}`,
+      offset
+    );
+  }
+  return value;
+}
+
+/**
+ * Read a literal of `Direction`.
+ */
+function readDirection(reader: Reader): AasTypes.Direction {
+  const offset = reader.offset;
+  const value = reader.readVarUint32();
+  if (AasStringification.directionToString(value) === null) {
+    throw new DecodingError(
+      `Expected a literal of Direction, but got: ${value}`,
+      offset
+    );
+  }
+  return value;
+}
+
+/**
+ * Read a literal of `StateOfEvent`.
+ */
+function readStateOfEvent(reader: Reader): AasTypes.StateOfEvent {
+  const offset = reader.offset;
+  const value = reader.readVarUint32();
+  if (AasStringification.stateOfEventToString(value) === null) {
+    throw new DecodingError(
+      `Expected a literal of StateOfEvent, but got: ${value}`,
+      offset
+    );
+  }
+  return value;
+}
+
+/**
+ * Read a literal of `ReferenceTypes`.
+ */
+function readReferenceTypes(reader: Reader): AasTypes.ReferenceTypes {
+  const offset = reader.offset;
+  const value = reader.readVarUint32();
+  if (AasStringification.referenceTypesToString(value) === null) {
+    throw new DecodingError(
+      `Expected a literal of ReferenceTypes, but got: ${value}`,
+      offset
+    );
+  }
+  return value;
+}
+
+/**
+ * Read a literal of `KeyTypes`.
+ */
+function readKeyTypes(reader: Reader): AasTypes.KeyTypes {
+  const offset = reader.offset;
+  const value = reader.readVarUint32();
+  if (AasStringification.keyTypesToString(value) === null) {
+    throw new DecodingError(
+      `Expected a literal of KeyTypes, but got: ${value}`,
+      offset
+    );
+  }
+  return value;
+}
+
+/**
+ * Read a literal of `DataTypeDefXsd`.
+ */
+function readDataTypeDefXsd(reader: Reader): AasTypes.DataTypeDefXsd {
+  const offset = reader.offset;
+  const value = reader.readVarUint32();
+  if (AasStringification.dataTypeDefXsdToString(value) === null) {
+    throw new DecodingError(
+      `Expected a literal of DataTypeDefXsd, but got: ${value}`,
+      offset
+    );
+  }
+  return value;
+}
+
+/**
+ * Read a literal of `DataTypeIec61360`.
+ */
+function readDataTypeIec61360(reader: Reader): AasTypes.DataTypeIec61360 {
+  const offset = reader.offset;
+  const value = reader.readVarUint32();
+  if (AasStringification.dataTypeIec61360ToString(value) === null) {
+    throw new DecodingError(
+      `Expected a literal of DataTypeIec61360, but got: ${value}`,
+      offset
+    );
+  }
+  return value;
+}
+
+/**
+ * Read a literal of `LevelType`.
+ */
+function readLevelType(reader: Reader): AasTypes.LevelType {
+  const offset = reader.offset;
+  const value = reader.readVarUint32();
+  if (AasStringification.levelTypeToString(value) === null) {
+    throw new DecodingError(
+      `Expected a literal of LevelType, but got: ${value}`,
+      offset
+    );
+  }
+  return value;
+}
+
+/**
+ * Read an instance of `Extension` without the class tag.
+ */
+function readExtension(reader: Reader): AasTypes.Extension {
+  const present = reader.readPresence(5);
+
+  const semanticId = (present & 0x1) !== 0 ? readReference(reader) : null;
+  const supplementalSemanticIds =
+    (present & 0x2) !== 0 ? readArray(reader, readReference) : null;
+  const name = reader.readString();
+  const valueType = (present & 0x4) !== 0 ? readDataTypeDefXsd(reader) : null;
+  const value = (present & 0x8) !== 0 ? reader.readString() : null;
+  const refersTo = (present & 0x10) !== 0 ? readReference(reader) : null;
+
+  return new AasTypes.Extension(
+    name,
+    semanticId,
+    supplementalSemanticIds,
+    valueType,
+    value,
+    refersTo
+  );
+}
+
+/**
+ * Read an instance of `AdministrativeInformation` without the class tag.
+ */
+function readAdministrativeInformation(
+  reader: Reader
+): AasTypes.AdministrativeInformation {
+  const present = reader.readPresence(3);
+
+  const embeddedDataSpecifications =
+    (present & 0x1) !== 0 ? readArray(reader, readEmbeddedDataSpecification) : null;
+  const version = (present & 0x2) !== 0 ? reader.readString() : null;
+  const revision = (present & 0x4) !== 0 ? reader.readString() : null;
+
+  return new AasTypes.AdministrativeInformation(
+    embeddedDataSpecifications,
+    version,
+    revision
+  );
+}
+
+/**
+ * Read an instance of `Qualifier` without the class tag.
+ */
+function readQualifier(reader: Reader): AasTypes.Qualifier {
+  const present = reader.readPresence(5);
+
+  const semanticId = (present & 0x1) !== 0 ? readReference(reader) : null;
+  const supplementalSemanticIds =
+    (present & 0x2) !== 0 ? readArray(reader, readReference) : null;
+  const kind = (present & 0x4) !== 0 ? readQualifierKind(reader) : null;
+  const type = reader.readString();
+  const valueType = readDataTypeDefXsd(reader);
+  const value = (present & 0x8) !== 0 ? reader.readString() : null;
+  const valueId = (present & 0x10) !== 0 ? readReference(reader) : null;
+
+  return new AasTypes.Qualifier(
+    type,
+    valueType,
+    semanticId,
+    supplementalSemanticIds,
+    kind,
+    value,
+    valueId
+  );
+}
+
+/**
+ * Read an instance of `AssetAdministrationShell` without the class tag.
+ */
+function readAssetAdministrationShell(
+  reader: Reader
+): AasTypes.AssetAdministrationShell {
+  const present = reader.readPresence(10);
+
+  const extensions = (present & 0x1) !== 0 ? readArray(reader, readExtension) : null;
+  const category = (present & 0x2) !== 0 ? reader.readString() : null;
+  const idShort = (present & 0x4) !== 0 ? reader.readString() : null;
+  const displayName = (present & 0x8) !== 0 ? readArray(reader, readLangString) : null;
+  const description = (present & 0x10) !== 0 ? readArray(reader, readLangString) : null;
+  const checksum = (present & 0x20) !== 0 ? reader.readString() : null;
+  const administration =
+    (present & 0x40) !== 0 ? readAdministrativeInformation(reader) : null;
+  const id = reader.readString();
+  const embeddedDataSpecifications =
+    (present & 0x80) !== 0 ? readArray(reader, readEmbeddedDataSpecification) : null;
+  const derivedFrom = (present & 0x100) !== 0 ? readReference(reader) : null;
+  const assetInformation = readAssetInformation(reader);
+  const submodels = (present & 0x200) !== 0 ? readArray(reader, readReference) : null;
+
+  return new AasTypes.AssetAdministrationShell(
+    id,
+    assetInformation,
+    extensions,
+    category,
+    idShort,
+    displayName,
+    description,
+    checksum,
+    administration,
+    embeddedDataSpecifications,
+    derivedFrom,
+    submodels
+  );
+}
+
+/**
+ * Read an instance of `AssetInformation` without the class tag.
+ */
+function readAssetInformation(reader: Reader): AasTypes.AssetInformation {
+  const present = reader.readPresence(3);
+
+  const assetKind = readAssetKind(reader);
+  const globalAssetId = (present & 0x1) !== 0 ? readReference(reader) : null;
+  const specificAssetIds =
+    (present & 0x2) !== 0 ? readArray(reader, readSpecificAssetId) : null;
+  const defaultThumbnail = (present & 0x4) !== 0 ? readResource(reader) : null;
+
+  return new AasTypes.AssetInformation(
+    assetKind,
+    globalAssetId,
+    specificAssetIds,
+    defaultThumbnail
+  );
+}
+
+/**
+ * Read an instance of `Resource` without the class tag.
+ */
+function readResource(reader: Reader): AasTypes.Resource {
+  const present = reader.readPresence(1);
+
+  const path = reader.readString();
+  const contentType = (present & 0x1) !== 0 ? reader.readString() : null;
+
+  return new AasTypes.Resource(path, contentType);
+}
+
+/**
+ * Read an instance of `SpecificAssetId` without the class tag.
+ */
+function readSpecificAssetId(reader: Reader): AasTypes.SpecificAssetId {
+  const present = reader.readPresence(2);
+
+  const semanticId = (present & 0x1) !== 0 ? readReference(reader) : null;
+  const supplementalSemanticIds =
+    (present & 0x2) !== 0 ? readArray(reader, readReference) : null;
+  const name = reader.readString();
+  const value = reader.readString();
+  const externalSubjectId = readReference(reader);
+
+  return new AasTypes.SpecificAssetId(
+    name,
+    value,
+    externalSubjectId,
+    semanticId,
+    supplementalSemanticIds
+  );
+}
+
+/**
+ * Read an instance of `Submodel` without the class tag.
+ */
+function readSubmodel(reader: Reader): AasTypes.Submodel {
+  const present = reader.readPresence(13);
+
+  const extensions = (present & 0x1) !== 0 ? readArray(reader, readExtension) : null;
+  const category = (present & 0x2) !== 0 ? reader.readString() : null;
+  const idShort = (present & 0x4) !== 0 ? reader.readString() : null;
+  const displayName = (present & 0x8) !== 0 ? readArray(reader, readLangString) : null;
+  const description = (present & 0x10) !== 0 ? readArray(reader, readLangString) : null;
+  const checksum = (present & 0x20) !== 0 ? reader.readString() : null;
+  const administration =
+    (present & 0x40) !== 0 ? readAdministrativeInformation(reader) : null;
+  const id = reader.readString();
+  const kind = (present & 0x80) !== 0 ? readModelingKind(reader) : null;
+  const semanticId = (present & 0x100) !== 0 ? readReference(reader) : null;
+  const supplementalSemanticIds =
+    (present & 0x200) !== 0 ? readArray(reader, readReference) : null;
+  const qualifiers = (present & 0x400) !== 0 ? readArray(reader, readQualifier) : null;
+  const embeddedDataSpecifications =
+    (present & 0x800) !== 0 ? readArray(reader, readEmbeddedDataSpecification) : null;
+  const submodelElements =
+    (present & 0x1000) !== 0 ? readArray(reader, readISubmodelElement) : null;
+
+  return new AasTypes.Submodel(
+    id,
+    extensions,
+    category,
+    idShort,
+    displayName,
+    description,
+    checksum,
+    administration,
+    kind,
+    semanticId,
+    supplementalSemanticIds,
+    qualifiers,
+    embeddedDataSpecifications,
+    submodelElements
+  );
+}
+
+/**
+ * Read an instance of `RelationshipElement` without the class tag.
+ */
+function readRelationshipElement(reader: Reader): AasTypes.RelationshipElement {
+  const present = reader.readPresence(11);
+
+  const extensions = (present & 0x1) !== 0 ? readArray(reader, readExtension) : null;
+  const category = (present & 0x2) !== 0 ? reader.readString() : null;
+  const idShort = (present & 0x4) !== 0 ? reader.readString() : null;
+  const displayName = (present & 0x8) !== 0 ? readArray(reader, readLangString) : null;
+  const description = (present & 0x10) !== 0 ? readArray(reader, readLangString) : null;
+  const checksum = (present & 0x20) !== 0 ? reader.readString() : null;
+  const kind = (present & 0x40) !== 0 ? readModelingKind(reader) : null;
+  const semanticId = (present & 0x80) !== 0 ? readReference(reader) : null;
+  const supplementalSemanticIds =
+    (present & 0x100) !== 0 ? readArray(reader, readReference) : null;
+  const qualifiers = (present & 0x200) !== 0 ? readArray(reader, readQualifier) : null;
+  const embeddedDataSpecifications =
+    (present & 0x400) !== 0 ? readArray(reader, readEmbeddedDataSpecification) : null;
+  const first = readReference(reader);
+  const second = readReference(reader);
+
+  return new AasTypes.RelationshipElement(
+    first,
+    second,
+    extensions,
+    category,
+    idShort,
+    displayName,
+    description,
+    checksum,
+    kind,
+    semanticId,
+    supplementalSemanticIds,
+    qualifiers,
+    embeddedDataSpecifications
+  );
+}
+
+/**
+ * Read an instance of `SubmodelElementList` without the class tag.
+ */
+function readSubmodelElementList(reader: Reader): AasTypes.SubmodelElementList {
+  const present = reader.readPresence(15);
+
+  const extensions = (present & 0x1) !== 0 ? readArray(reader, readExtension) : null;
+  const category = (present & 0x2) !== 0 ? reader.readString() : null;
+  const idShort = (present & 0x4) !== 0 ? reader.readString() : null;
+  const displayName = (present & 0x8) !== 0 ? readArray(reader, readLangString) : null;
+  const description = (present & 0x10) !== 0 ? readArray(reader, readLangString) : null;
+  const checksum = (present & 0x20) !== 0 ? reader.readString() : null;
+  const kind = (present & 0x40) !== 0 ? readModelingKind(reader) : null;
+  const semanticId = (present & 0x80) !== 0 ? readReference(reader) : null;
+  const supplementalSemanticIds =
+    (present & 0x100) !== 0 ? readArray(reader, readReference) : null;
+  const qualifiers = (present & 0x200) !== 0 ? readArray(reader, readQualifier) : null;
+  const embeddedDataSpecifications =
+    (present & 0x400) !== 0 ? readArray(reader, readEmbeddedDataSpecification) : null;
+  const orderRelevant = (present & 0x800) !== 0 ? reader.readBoolean() : null;
+  const value =
+    (present & 0x1000) !== 0 ? readArray(reader, readISubmodelElement) : null;
+  const semanticIdListElement = (present & 0x2000) !== 0 ? readReference(reader) : null;
+  const typeValueListElement = readAasSubmodelElements(reader);
+  const valueTypeListElement =
+    (present & 0x4000) !== 0 ? readDataTypeDefXsd(reader) : null;
+
+  return new AasTypes.SubmodelElementList(
+    typeValueListElement,
+    extensions,
+    category,
+    idShort,
+    displayName,
+    description,
+    checksum,
+    kind,
+    semanticId,
+    supplementalSemanticIds,
+    qualifiers,
+    embeddedDataSpecifications,
+    orderRelevant,
+    value,
+    semanticIdListElement,
+    valueTypeListElement
+  );
+}
+
+/**
+ * Read an instance of `SubmodelElementCollection` without the class tag.
+ */
+function readSubmodelElementCollection(
+  reader: Reader
+): AasTypes.SubmodelElementCollection {
+  const present = reader.readPresence(12);
+
+  const extensions = (present & 0x1) !== 0 ? readArray(reader, readExtension) : null;
+  const category = (present & 0x2) !== 0 ? reader.readString() : null;
+  const idShort = (present & 0x4) !== 0 ? reader.readString() : null;
+  const displayName = (present & 0x8) !== 0 ? readArray(reader, readLangString) : null;
+  const description = (present & 0x10) !== 0 ? readArray(reader, readLangString) : null;
+  const checksum = (present & 0x20) !== 0 ? reader.readString() : null;
+  const kind = (present & 0x40) !== 0 ? readModelingKind(reader) : null;
+  const semanticId = (present & 0x80) !== 0 ? readReference(reader) : null;
+  const supplementalSemanticIds =
+    (present & 0x100) !== 0 ? readArray(reader, readReference) : null;
+  const qualifiers = (present & 0x200) !== 0 ? readArray(reader, readQualifier) : null;
+  const embeddedDataSpecifications =
+    (present & 0x400) !== 0 ? readArray(reader, readEmbeddedDataSpecification) : null;
+  const value =
+    (present & 0x800) !== 0 ? readArray(reader, readISubmodelElement) : null;
+
+  return new AasTypes.SubmodelElementCollection(
+    extensions,
+    category,
+    idShort,
+    displayName,
+    description,
+    checksum,
+    kind,
+    semanticId,
+    supplementalSemanticIds,
+    qualifiers,
+    embeddedDataSpecifications,
+    value
+  );
+}
+
+/**
+ * Read an instance of `Property` without the class tag.
+ */
+function readProperty(reader: Reader): AasTypes.Property {
+  const present = reader.readPresence(13);
+
+  const extensions = (present & 0x1) !== 0 ? readArray(reader, readExtension) : null;
+  const category = (present & 0x2) !== 0 ? reader.readString() : null;
+  const idShort = (present & 0x4) !== 0 ? reader.readString() : null;
+  const displayName = (present & 0x8) !== 0 ? readArray(reader, readLangString) : null;
+  const description = (present & 0x10) !== 0 ? readArray(reader, readLangString) : null;
+  const checksum = (present & 0x20) !== 0 ? reader.readString() : null;
+  const kind = (present & 0x40) !== 0 ? readModelingKind(reader) : null;
+  const semanticId = (present & 0x80) !== 0 ? readReference(reader) : null;
+  const supplementalSemanticIds =
+    (present & 0x100) !== 0 ? readArray(reader, readReference) : null;
+  const qualifiers = (present & 0x200) !== 0 ? readArray(reader, readQualifier) : null;
+  const embeddedDataSpecifications =
+    (present & 0x400) !== 0 ? readArray(reader, readEmbeddedDataSpecification) : null;
+  const valueType = readDataTypeDefXsd(reader);
+  const value = (present & 0x800) !== 0 ? reader.readString() : null;
+  const valueId = (present & 0x1000) !== 0 ? readReference(reader) : null;
+
+  return new AasTypes.Property(
+    valueType,
+    extensions,
+    category,
+    idShort,
+    displayName,
+    description,
+    checksum,
+    kind,
+    semanticId,
+    supplementalSemanticIds,
+    qualifiers,
+    embeddedDataSpecifications,
+    value,
+    valueId
+  );
+}
+
+/**
+ * Read an instance of `MultiLanguageProperty` without the class tag.
+ */
+function readMultiLanguageProperty(reader: Reader): AasTypes.MultiLanguageProperty {
+  const present = reader.readPresence(13);
+
+  const extensions = (present & 0x1) !== 0 ? readArray(reader, readExtension) : null;
+  const category = (present & 0x2) !== 0 ? reader.readString() : null;
+  const idShort = (present & 0x4) !== 0 ? reader.readString() : null;
+  const displayName = (present & 0x8) !== 0 ? readArray(reader, readLangString) : null;
+  const description = (present & 0x10) !== 0 ? readArray(reader, readLangString) : null;
+  const checksum = (present & 0x20) !== 0 ? reader.readString() : null;
+  const kind = (present & 0x40) !== 0 ? readModelingKind(reader) : null;
+  const semanticId = (present & 0x80) !== 0 ? readReference(reader) : null;
+  const supplementalSemanticIds =
+    (present & 0x100) !== 0 ? readArray(reader, readReference) : null;
+  const qualifiers = (present & 0x200) !== 0 ? readArray(reader, readQualifier) : null;
+  const embeddedDataSpecifications =
+    (present & 0x400) !== 0 ? readArray(reader, readEmbeddedDataSpecification) : null;
+  const value = (present & 0x800) !== 0 ? readArray(reader, readLangString) : null;
+  const valueId = (present & 0x1000) !== 0 ? readReference(reader) : null;
+
+  return new AasTypes.MultiLanguageProperty(
+    extensions,
+    category,
+    idShort,
+    displayName,
+    description,
+    checksum,
+    kind,
+    semanticId,
+    supplementalSemanticIds,
+    qualifiers,
+    embeddedDataSpecifications,
+    value,
+    valueId
+  );
+}
+
+/**
+ * Read an instance of `Range` without the class tag.
+ */
+function readRange(reader: Reader): AasTypes.Range {
+  const present = reader.readPresence(13);
+
+  const extensions = (present & 0x1) !== 0 ? readArray(reader, readExtension) : null;
+  const category = (present & 0x2) !== 0 ? reader.readString() : null;
+  const idShort = (present & 0x4) !== 0 ? reader.readString() : null;
+  const displayName = (present & 0x8) !== 0 ? readArray(reader, readLangString) : null;
+  const description = (present & 0x10) !== 0 ? readArray(reader, readLangString) : null;
+  const checksum = (present & 0x20) !== 0 ? reader.readString() : null;
+  const kind = (present & 0x40) !== 0 ? readModelingKind(reader) : null;
+  const semanticId = (present & 0x80) !== 0 ? readReference(reader) : null;
+  const supplementalSemanticIds =
+    (present & 0x100) !== 0 ? readArray(reader, readReference) : null;
+  const qualifiers = (present & 0x200) !== 0 ? readArray(reader, readQualifier) : null;
+  const embeddedDataSpecifications =
+    (present & 0x400) !== 0 ? readArray(reader, readEmbeddedDataSpecification) : null;
+  const valueType = readDataTypeDefXsd(reader);
+  const min = (present & 0x800) !== 0 ? reader.readString() : null;
+  const max = (present & 0x1000) !== 0 ? reader.readString() : null;
+
+  return new AasTypes.Range(
+    valueType,
+    extensions,
+    category,
+    idShort,
+    displayName,
+    description,
+    checksum,
+    kind,
+    semanticId,
+    supplementalSemanticIds,
+    qualifiers,
+    embeddedDataSpecifications,
+    min,
+    max
+  );
+}
+
+/**
+ * Read an instance of `ReferenceElement` without the class tag.
+ */
+function readReferenceElement(reader: Reader): AasTypes.ReferenceElement {
+  const present = reader.readPresence(12);
+
+  const extensions = (present & 0x1) !== 0 ? readArray(reader, readExtension) : null;
+  const category = (present & 0x2) !== 0 ? reader.readString() : null;
+  const idShort = (present & 0x4) !== 0 ? reader.readString() : null;
+  const displayName = (present & 0x8) !== 0 ? readArray(reader, readLangString) : null;
+  const description = (present & 0x10) !== 0 ? readArray(reader, readLangString) : null;
+  const checksum = (present & 0x20) !== 0 ? reader.readString() : null;
+  const kind = (present & 0x40) !== 0 ? readModelingKind(reader) : null;
+  const semanticId = (present & 0x80) !== 0 ? readReference(reader) : null;
+  const supplementalSemanticIds =
+    (present & 0x100) !== 0 ? readArray(reader, readReference) : null;
+  const qualifiers = (present & 0x200) !== 0 ? readArray(reader, readQualifier) : null;
+  const embeddedDataSpecifications =
+    (present & 0x400) !== 0 ? readArray(reader, readEmbeddedDataSpecification) : null;
+  const value = (present & 0x800) !== 0 ? readReference(reader) : null;
+
+  return new AasTypes.ReferenceElement(
+    extensions,
+    category,
+    idShort,
+    displayName,
+    description,
+    checksum,
+    kind,
+    semanticId,
+    supplementalSemanticIds,
+    qualifiers,
+    embeddedDataSpecifications,
+    value
+  );
+}
+
+/**
+ * Read an instance of `Blob` without the class tag.
+ */
+function readBlob(reader: Reader): AasTypes.Blob {
+  const present = reader.readPresence(12);
+
+  const extensions = (present & 0x1) !== 0 ? readArray(reader, readExtension) : null;
+  const category = (present & 0x2) !== 0 ? reader.readString() : null;
+  const idShort = (present & 0x4) !== 0 ? reader.readString() : null;
+  const displayName = (present & 0x8) !== 0 ? readArray(reader, readLangString) : null;
+  const description = (present & 0x10) !== 0 ? readArray(reader, readLangString) : null;
+  const checksum = (present & 0x20) !== 0 ? reader.readString() : null;
+  const kind = (present & 0x40) !== 0 ? readModelingKind(reader) : null;
+  const semanticId = (present & 0x80) !== 0 ? readReference(reader) : null;
+  const supplementalSemanticIds =
+    (present & 0x100) !== 0 ? readArray(reader, readReference) : null;
+  const qualifiers = (present & 0x200) !== 0 ? readArray(reader, readQualifier) : null;
+  const embeddedDataSpecifications =
+    (present & 0x400) !== 0 ? readArray(reader, readEmbeddedDataSpecification) : null;
+  const value = (present & 0x800) !== 0 ? reader.readBytes() : null;
+  const contentType = reader.readString();
+
+  return new AasTypes.Blob(
+    contentType,
+    extensions,
+    category,
+    idShort,
+    displayName,
+    description,
+    checksum,
+    kind,
+    semanticId,
+    supplementalSemanticIds,
+    qualifiers,
+    embeddedDataSpecifications,
+    value
+  );
+}
+
+/**
+ * Read an instance of `File` without the class tag.
+ */
+function readFile(reader: Reader): AasTypes.File {
+  const present = reader.readPresence(12);
+
+  const extensions = (present & 0x1) !== 0 ? readArray(reader, readExtension) : null;
+  const category = (present & 0x2) !== 0 ? reader.readString() : null;
+  const idShort = (present & 0x4) !== 0 ? reader.readString() : null;
+  const displayName = (present & 0x8) !== 0 ? readArray(reader, readLangString) : null;
+  const description = (present & 0x10) !== 0 ? readArray(reader, readLangString) : null;
+  const checksum = (present & 0x20) !== 0 ? reader.readString() : null;
+  const kind = (present & 0x40) !== 0 ? readModelingKind(reader) : null;
+  const semanticId = (present & 0x80) !== 0 ? readReference(reader) : null;
+  const supplementalSemanticIds =
+    (present & 0x100) !== 0 ? readArray(reader, readReference) : null;
+  const qualifiers = (present & 0x200) !== 0 ? readArray(reader, readQualifier) : null;
+  const embeddedDataSpecifications =
+    (present & 0x400) !== 0 ? readArray(reader, readEmbeddedDataSpecification) : null;
+  const value = (present & 0x800) !== 0 ? reader.readString() : null;
+  const contentType = reader.readString();
+
+  return new AasTypes.File(
+    contentType,
+    extensions,
+    category,
+    idShort,
+    displayName,
+    description,
+    checksum,
+    kind,
+    semanticId,
+    supplementalSemanticIds,
+    qualifiers,
+    embeddedDataSpecifications,
+    value
+  );
+}
+
+/**
+ * Read an instance of `AnnotatedRelationshipElement` without the class tag.
+ */
+function readAnnotatedRelationshipElement(
+  reader: Reader
+): AasTypes.AnnotatedRelationshipElement {
+  const present = reader.readPresence(12);
+
+  const extensions = (present & 0x1) !== 0 ? readArray(reader, readExtension) : null;
+  const category = (present & 0x2) !== 0 ? reader.readString() : null;
+  const idShort = (present & 0x4) !== 0 ? reader.readString() : null;
+  const displayName = (present & 0x8) !== 0 ? readArray(reader, readLangString) : null;
+  const description = (present & 0x10) !== 0 ? readArray(reader, readLangString) : null;
+  const checksum = (present & 0x20) !== 0 ? reader.readString() : null;
+  const kind = (present & 0x40) !== 0 ? readModelingKind(reader) : null;
+  const semanticId = (present & 0x80) !== 0 ? readReference(reader) : null;
+  const supplementalSemanticIds =
+    (present & 0x100) !== 0 ? readArray(reader, readReference) : null;
+  const qualifiers = (present & 0x200) !== 0 ? readArray(reader, readQualifier) : null;
+  const embeddedDataSpecifications =
+    (present & 0x400) !== 0 ? readArray(reader, readEmbeddedDataSpecification) : null;
+  const first = readReference(reader);
+  const second = readReference(reader);
+  const annotations =
+    (present & 0x800) !== 0 ? readArray(reader, readIDataElement) : null;
+
+  return new AasTypes.AnnotatedRelationshipElement(
+    first,
+    second,
+    extensions,
+    category,
+    idShort,
+    displayName,
+    description,
+    checksum,
+    kind,
+    semanticId,
+    supplementalSemanticIds,
+    qualifiers,
+    embeddedDataSpecifications,
+    annotations
+  );
+}
+
+/**
+ * Read an instance of `Entity` without the class tag.
+ */
+function readEntity(reader: Reader): AasTypes.Entity {
+  const present = reader.readPresence(14);
+
+  const extensions = (present & 0x1) !== 0 ? readArray(reader, readExtension) : null;
+  const category = (present & 0x2) !== 0 ? reader.readString() : null;
+  const idShort = (present & 0x4) !== 0 ? reader.readString() : null;
+  const displayName = (present & 0x8) !== 0 ? readArray(reader, readLangString) : null;
+  const description = (present & 0x10) !== 0 ? readArray(reader, readLangString) : null;
+  const checksum = (present & 0x20) !== 0 ? reader.readString() : null;
+  const kind = (present & 0x40) !== 0 ? readModelingKind(reader) : null;
+  const semanticId = (present & 0x80) !== 0 ? readReference(reader) : null;
+  const supplementalSemanticIds =
+    (present & 0x100) !== 0 ? readArray(reader, readReference) : null;
+  const qualifiers = (present & 0x200) !== 0 ? readArray(reader, readQualifier) : null;
+  const embeddedDataSpecifications =
+    (present & 0x400) !== 0 ? readArray(reader, readEmbeddedDataSpecification) : null;
+  const statements =
+    (present & 0x800) !== 0 ? readArray(reader, readISubmodelElement) : null;
+  const entityType = readEntityType(reader);
+  const globalAssetId = (present & 0x1000) !== 0 ? readReference(reader) : null;
+  const specificAssetId = (present & 0x2000) !== 0 ? readSpecificAssetId(reader) : null;
+
+  return new AasTypes.Entity(
+    entityType,
+    extensions,
+    category,
+    idShort,
+    displayName,
+    description,
+    checksum,
+    kind,
+    semanticId,
+    supplementalSemanticIds,
+    qualifiers,
+    embeddedDataSpecifications,
+    statements,
+    globalAssetId,
+    specificAssetId
+  );
+}
+
+/**
+ * Read an instance of `EventPayload` without the class tag.
+ */
+function readEventPayload(reader: Reader): AasTypes.EventPayload {
+  const present = reader.readPresence(5);
+
+  const source = readReference(reader);
+  const sourceSemanticId = (present & 0x1) !== 0 ? readReference(reader) : null;
+  const observableReference = readReference(reader);
+  const observableSemanticId = (present & 0x2) !== 0 ? readReference(reader) : null;
+  const topic = (present & 0x4) !== 0 ? reader.readString() : null;
+  const subjectId = (present & 0x8) !== 0 ? readReference(reader) : null;
+  const timeStamp = reader.readString();
+  const payload = (present & 0x10) !== 0 ? reader.readString() : null;
+
+  return new AasTypes.EventPayload(
+    source,
+    observableReference,
+    timeStamp,
+    sourceSemanticId,
+    observableSemanticId,
+    topic,
+    subjectId,
+    payload
+  );
+}
+
+/**
+ * Read an instance of `BasicEventElement` without the class tag.
+ */
+function readBasicEventElement(reader: Reader): AasTypes.BasicEventElement {
+  const present = reader.readPresence(16);
+
+  const extensions = (present & 0x1) !== 0 ? readArray(reader, readExtension) : null;
+  const category = (present & 0x2) !== 0 ? reader.readString() : null;
+  const idShort = (present & 0x4) !== 0 ? reader.readString() : null;
+  const displayName = (present & 0x8) !== 0 ? readArray(reader, readLangString) : null;
+  const description = (present & 0x10) !== 0 ? readArray(reader, readLangString) : null;
+  const checksum = (present & 0x20) !== 0 ? reader.readString() : null;
+  const kind = (present & 0x40) !== 0 ? readModelingKind(reader) : null;
+  const semanticId = (present & 0x80) !== 0 ? readReference(reader) : null;
+  const supplementalSemanticIds =
+    (present & 0x100) !== 0 ? readArray(reader, readReference) : null;
+  const qualifiers = (present & 0x200) !== 0 ? readArray(reader, readQualifier) : null;
+  const embeddedDataSpecifications =
+    (present & 0x400) !== 0 ? readArray(reader, readEmbeddedDataSpecification) : null;
+  const observed = readReference(reader);
+  const direction = readDirection(reader);
+  const state = readStateOfEvent(reader);
+  const messageTopic = (present & 0x800) !== 0 ? reader.readString() : null;
+  const messageBroker = (present & 0x1000) !== 0 ? readReference(reader) : null;
+  const lastUpdate = (present & 0x2000) !== 0 ? reader.readString() : null;
+  const minInterval = (present & 0x4000) !== 0 ? reader.readString() : null;
+  const maxInterval = (present & 0x8000) !== 0 ? reader.readString() : null;
+
+  return new AasTypes.BasicEventElement(
+    observed,
+    direction,
+    state,
+    extensions,
+    category,
+    idShort,
+    displayName,
+    description,
+    checksum,
+    kind,
+    semanticId,
+    supplementalSemanticIds,
+    qualifiers,
+    embeddedDataSpecifications,
+    messageTopic,
+    messageBroker,
+    lastUpdate,
+    minInterval,
+    maxInterval
+  );
+}
+
+/**
+ * Read an instance of `Operation` without the class tag.
+ */
+function readOperation(reader: Reader): AasTypes.Operation {
+  const present = reader.readPresence(14);
+
+  const extensions = (present & 0x1) !== 0 ? readArray(reader, readExtension) : null;
+  const category = (present & 0x2) !== 0 ? reader.readString() : null;
+  const idShort = (present & 0x4) !== 0 ? reader.readString() : null;
+  const displayName = (present & 0x8) !== 0 ? readArray(reader, readLangString) : null;
+  const description = (present & 0x10) !== 0 ? readArray(reader, readLangString) : null;
+  const checksum = (present & 0x20) !== 0 ? reader.readString() : null;
+  const kind = (present & 0x40) !== 0 ? readModelingKind(reader) : null;
+  const semanticId = (present & 0x80) !== 0 ? readReference(reader) : null;
+  const supplementalSemanticIds =
+    (present & 0x100) !== 0 ? readArray(reader, readReference) : null;
+  const qualifiers = (present & 0x200) !== 0 ? readArray(reader, readQualifier) : null;
+  const embeddedDataSpecifications =
+    (present & 0x400) !== 0 ? readArray(reader, readEmbeddedDataSpecification) : null;
+  const inputVariables =
+    (present & 0x800) !== 0 ? readArray(reader, readOperationVariable) : null;
+  const outputVariables =
+    (present & 0x1000) !== 0 ? readArray(reader, readOperationVariable) : null;
+  const inoutputVariables =
+    (present & 0x2000) !== 0 ? readArray(reader, readOperationVariable) : null;
+
+  return new AasTypes.Operation(
+    extensions,
+    category,
+    idShort,
+    displayName,
+    description,
+    checksum,
+    kind,
+    semanticId,
+    supplementalSemanticIds,
+    qualifiers,
+    embeddedDataSpecifications,
+    inputVariables,
+    outputVariables,
+    inoutputVariables
+  );
+}
+
+/**
+ * Read an instance of `OperationVariable` without the class tag.
+ */
+function readOperationVariable(reader: Reader): AasTypes.OperationVariable {
+  const value = readISubmodelElement(reader);
+
+  return new AasTypes.OperationVariable(value);
+}
+
+/**
+ * Read an instance of `Capability` without the class tag.
+ */
+function readCapability(reader: Reader): AasTypes.Capability {
+  const present = reader.readPresence(11);
+
+  const extensions = (present & 0x1) !== 0 ? readArray(reader, readExtension) : null;
+  const category = (present & 0x2) !== 0 ? reader.readString() : null;
+  const idShort = (present & 0x4) !== 0 ? reader.readString() : null;
+  const displayName = (present & 0x8) !== 0 ? readArray(reader, readLangString) : null;
+  const description = (present & 0x10) !== 0 ? readArray(reader, readLangString) : null;
+  const checksum = (present & 0x20) !== 0 ? reader.readString() : null;
+  const kind = (present & 0x40) !== 0 ? readModelingKind(reader) : null;
+  const semanticId = (present & 0x80) !== 0 ? readReference(reader) : null;
+  const supplementalSemanticIds =
+    (present & 0x100) !== 0 ? readArray(reader, readReference) : null;
+  const qualifiers = (present & 0x200) !== 0 ? readArray(reader, readQualifier) : null;
+  const embeddedDataSpecifications =
+    (present & 0x400) !== 0 ? readArray(reader, readEmbeddedDataSpecification) : null;
+
+  return new AasTypes.Capability(
+    extensions,
+    category,
+    idShort,
+    displayName,
+    description,
+    checksum,
+    kind,
+    semanticId,
+    supplementalSemanticIds,
+    qualifiers,
+    embeddedDataSpecifications
+  );
+}
+
+/**
+ * Read an instance of `ConceptDescription` without the class tag.
+ */
+function readConceptDescription(reader: Reader): AasTypes.ConceptDescription {
+  const present = reader.readPresence(9);
+
+  const extensions = (present & 0x1) !== 0 ? readArray(reader, readExtension) : null;
+  const category = (present & 0x2) !== 0 ? reader.readString() : null;
+  const idShort = (present & 0x4) !== 0 ? reader.readString() : null;
+  const displayName = (present & 0x8) !== 0 ? readArray(reader, readLangString) : null;
+  const description = (present & 0x10) !== 0 ? readArray(reader, readLangString) : null;
+  const checksum = (present & 0x20) !== 0 ? reader.readString() : null;
+  const administration =
+    (present & 0x40) !== 0 ? readAdministrativeInformation(reader) : null;
+  const id = reader.readString();
+  const embeddedDataSpecifications =
+    (present & 0x80) !== 0 ? readArray(reader, readEmbeddedDataSpecification) : null;
+  const isCaseOf = (present & 0x100) !== 0 ? readArray(reader, readReference) : null;
+
+  return new AasTypes.ConceptDescription(
+    id,
+    extensions,
+    category,
+    idShort,
+    displayName,
+    description,
+    checksum,
+    administration,
+    embeddedDataSpecifications,
+    isCaseOf
+  );
+}
+
+/**
+ * Read an instance of `Reference` without the class tag.
+ */
+function readReference(reader: Reader): AasTypes.Reference {
+  const present = reader.readPresence(1);
+
+  const type = readReferenceTypes(reader);
+  const referredSemanticId = (present & 0x1) !== 0 ? readReference(reader) : null;
+  const keys = readArray(reader, readKey);
+
+  return new AasTypes.Reference(type, keys, referredSemanticId);
+}
+
+/**
+ * Read an instance of `Key` without the class tag.
+ */
+function readKey(reader: Reader): AasTypes.Key {
+  const type = readKeyTypes(reader);
+  const value = reader.readString();
+
+  return new AasTypes.Key(type, value);
+}
+
+/**
+ * Read an instance of `LangString` without the class tag.
+ */
+function readLangString(reader: Reader): AasTypes.LangString {
+  const language = reader.readString();
+  const text = reader.readString();
+
+  return new AasTypes.LangString(language, text);
+}
+
+/**
+ * Read an instance of `Environment` without the class tag.
+ */
+function readEnvironment(reader: Reader): AasTypes.Environment {
+  const present = reader.readPresence(3);
+
+  const assetAdministrationShells =
+    (present & 0x1) !== 0 ? readArray(reader, readAssetAdministrationShell) : null;
+  const submodels = (present & 0x2) !== 0 ? readArray(reader, readSubmodel) : null;
+  const conceptDescriptions =
+    (present & 0x4) !== 0 ? readArray(reader, readConceptDescription) : null;
+
+  return new AasTypes.Environment(
+    assetAdministrationShells,
+    submodels,
+    conceptDescriptions
+  );
+}
+
+/**
+ * Read an instance of `EmbeddedDataSpecification` without the class tag.
+ */
+function readEmbeddedDataSpecification(
+  reader: Reader
+): AasTypes.EmbeddedDataSpecification {
+  const dataSpecification = readReference(reader);
+  const dataSpecificationContent = readIDataSpecificationContent(reader);
+
+  return new AasTypes.EmbeddedDataSpecification(
+    dataSpecification,
+    dataSpecificationContent
+  );
+}
+
+/**
+ * Read an instance of `ValueReferencePair` without the class tag.
+ */
+function readValueReferencePair(reader: Reader): AasTypes.ValueReferencePair {
+  const value = reader.readString();
+  const valueId = readReference(reader);
+
+  return new AasTypes.ValueReferencePair(value, valueId);
+}
+
+/**
+ * Read an instance of `ValueList` without the class tag.
+ */
+function readValueList(reader: Reader): AasTypes.ValueList {
+  const valueReferencePairs = readArray(reader, readValueReferencePair);
+
+  return new AasTypes.ValueList(valueReferencePairs);
+}
+
+/**
+ * Read an instance of `DataSpecificationIec61360` without the class tag.
+ */
+function readDataSpecificationIec61360(
+  reader: Reader
+): AasTypes.DataSpecificationIec61360 {
+  const present = reader.readPresence(11);
+
+  const preferredName = readArray(reader, readLangString);
+  const shortName = (present & 0x1) !== 0 ? readArray(reader, readLangString) : null;
+  const unit = (present & 0x2) !== 0 ? reader.readString() : null;
+  const unitId = (present & 0x4) !== 0 ? readReference(reader) : null;
+  const sourceOfDefinition = (present & 0x8) !== 0 ? reader.readString() : null;
+  const symbol = (present & 0x10) !== 0 ? reader.readString() : null;
+  const dataType = (present & 0x20) !== 0 ? readDataTypeIec61360(reader) : null;
+  const definition = (present & 0x40) !== 0 ? readArray(reader, readLangString) : null;
+  const valueFormat = (present & 0x80) !== 0 ? reader.readString() : null;
+  const valueList = (present & 0x100) !== 0 ? readValueList(reader) : null;
+  const value = (present & 0x200) !== 0 ? reader.readString() : null;
+  const levelType = (present & 0x400) !== 0 ? readLevelType(reader) : null;
+
+  return new AasTypes.DataSpecificationIec61360(
+    preferredName,
+    shortName,
+    unit,
+    unitId,
+    sourceOfDefinition,
+    symbol,
+    dataType,
+    definition,
+    valueFormat,
+    valueList,
+    value,
+    levelType
+  );
+}
+
+/**
+ * Read an instance of `DataSpecificationPhysicalUnit` without the class tag.
+ */
+function readDataSpecificationPhysicalUnit(
+  reader: Reader
+): AasTypes.DataSpecificationPhysicalUnit {
+  const present = reader.readPresence(10);
+
+  const unitName = reader.readString();
+  const unitSymbol = reader.readString();
+  const definition = readArray(reader, readLangString);
+  const siNotation = (present & 0x1) !== 0 ? reader.readString() : null;
+  const siName = (present & 0x2) !== 0 ? reader.readString() : null;
+  const dinNotation = (present & 0x4) !== 0 ? reader.readString() : null;
+  const eceName = (present & 0x8) !== 0 ? reader.readString() : null;
+  const eceCode = (present & 0x10) !== 0 ? reader.readString() : null;
+  const nistName = (present & 0x20) !== 0 ? reader.readString() : null;
+  const sourceOfDefinition = (present & 0x40) !== 0 ? reader.readString() : null;
+  const conversionFactor = (present & 0x80) !== 0 ? reader.readString() : null;
+  const registrationAuthorityId = (present & 0x100) !== 0 ? reader.readString() : null;
+  const supplier = (present & 0x200) !== 0 ? reader.readString() : null;
+
+  return new AasTypes.DataSpecificationPhysicalUnit(
+    unitName,
+    unitSymbol,
+    definition,
+    siNotation,
+    siName,
+    dinNotation,
+    eceName,
+    eceCode,
+    nistName,
+    sourceOfDefinition,
+    conversionFactor,
+    registrationAuthorityId,
+    supplier
+  );
+}
+
+/**
+ * Read an instance of `IDataElement` including its class tag.
+ */
+function readIDataElement(reader: Reader): AasTypes.IDataElement {
+  const offset = reader.offset;
+  const tag = reader.readVarUint32();
+  switch (tag) {
+    case ClassTag.Property:
+      return readProperty(reader);
+    case ClassTag.MultiLanguageProperty:
+      return readMultiLanguageProperty(reader);
+    case ClassTag.Range:
+      return readRange(reader);
+    case ClassTag.ReferenceElement:
+      return readReferenceElement(reader);
+    case ClassTag.Blob:
+      return readBlob(reader);
+    case ClassTag.File:
+      return readFile(reader);
+    default:
+      throw new DecodingError(
+        `Expected a class tag of IDataElement, but got: ${tag}`,
+        offset
+      );
+  }
+}
+
+/**
+ * Read an instance of `IDataSpecificationContent` including its class tag.
+ */
+function readIDataSpecificationContent(
+  reader: Reader
+): AasTypes.IDataSpecificationContent {
+  const offset = reader.offset;
+  const tag = reader.readVarUint32();
+  switch (tag) {
+    case ClassTag.DataSpecificationIec61360:
+      return readDataSpecificationIec61360(reader);
+    case ClassTag.DataSpecificationPhysicalUnit:
+      return readDataSpecificationPhysicalUnit(reader);
+    default:
+      throw new DecodingError(
+        `Expected a class tag of IDataSpecificationContent, but got: ${tag}`,
+        offset
+      );
+  }
+}
+
+/**
+ * Read an instance of `ISubmodelElement` including its class tag.
+ */
+function readISubmodelElement(reader: Reader): AasTypes.ISubmodelElement {
+  const offset = reader.offset;
+  const tag = reader.readVarUint32();
+  switch (tag) {
+    case ClassTag.RelationshipElement:
+      return readRelationshipElement(reader);
+    case ClassTag.SubmodelElementList:
+      return readSubmodelElementList(reader);
+    case ClassTag.SubmodelElementCollection:
+      return readSubmodelElementCollection(reader);
+    case ClassTag.Property:
+      return readProperty(reader);
+    case ClassTag.MultiLanguageProperty:
+      return readMultiLanguageProperty(reader);
+    case ClassTag.Range:
+      return readRange(reader);
+    case ClassTag.ReferenceElement:
+      return readReferenceElement(reader);
+    case ClassTag.Blob:
+      return readBlob(reader);
+    case ClassTag.File:
+      return readFile(reader);
+    case ClassTag.AnnotatedRelationshipElement:
+      return readAnnotatedRelationshipElement(reader);
+    case ClassTag.Entity:
+      return readEntity(reader);
+    case ClassTag.BasicEventElement:
+      return readBasicEventElement(reader);
+    case ClassTag.Operation:
+      return readOperation(reader);
+    case ClassTag.Capability:
+      return readCapability(reader);
+    default:
+      throw new DecodingError(
+        `Expected a class tag of ISubmodelElement, but got: ${tag}`,
+        offset
+      );
+  }
+}
+
+/**
+ * Read an instance of any class including its class tag.
+ */
+function readClass(reader: Reader): AasTypes.Class {
+  const offset = reader.offset;
+  const tag = reader.readVarUint32();
+  switch (tag) {
+    case ClassTag.Extension:
+      return readExtension(reader);
+    case ClassTag.AdministrativeInformation:
+      return readAdministrativeInformation(reader);
+    case ClassTag.Qualifier:
+      return readQualifier(reader);
+    case ClassTag.AssetAdministrationShell:
+      return readAssetAdministrationShell(reader);
+    case ClassTag.AssetInformation:
+      return readAssetInformation(reader);
+    case ClassTag.Resource:
+      return readResource(reader);
+    case ClassTag.SpecificAssetId:
+      return readSpecificAssetId(reader);
+    case ClassTag.Submodel:
+      return readSubmodel(reader);
+    case ClassTag.RelationshipElement:
+      return readRelationshipElement(reader);
+    case ClassTag.SubmodelElementList:
+      return readSubmodelElementList(reader);
+    case ClassTag.SubmodelElementCollection:
+      return readSubmodelElementCollection(reader);
+    case ClassTag.Property:
+      return readProperty(reader);
+    case ClassTag.MultiLanguageProperty:
+      return readMultiLanguageProperty(reader);
+    case ClassTag.Range:
+      return readRange(reader);
+    case ClassTag.ReferenceElement:
+      return readReferenceElement(reader);
+    case ClassTag.Blob:
+      return readBlob(reader);
+    case ClassTag.File:
+      return readFile(reader);
+    case ClassTag.AnnotatedRelationshipElement:
+      return readAnnotatedRelationshipElement(reader);
+    case ClassTag.Entity:
+      return readEntity(reader);
+    case ClassTag.EventPayload:
+      return readEventPayload(reader);
+    case ClassTag.BasicEventElement:
+      return readBasicEventElement(reader);
+    case ClassTag.Operation:
+      return readOperation(reader);
+    case ClassTag.OperationVariable:
+      return readOperationVariable(reader);
+    case ClassTag.Capability:
+      return readCapability(reader);
+    case ClassTag.ConceptDescription:
+      return readConceptDescription(reader);
+    case ClassTag.Reference:
+      return readReference(reader);
+    case ClassTag.Key:
+      return readKey(reader);
+    case ClassTag.LangString:
+      return readLangString(reader);
+    case ClassTag.Environment:
+      return readEnvironment(reader);
+    case ClassTag.EmbeddedDataSpecification:
+      return readEmbeddedDataSpecification(reader);
+    case ClassTag.ValueReferencePair:
+      return readValueReferencePair(reader);
+    case ClassTag.ValueList:
+      return readValueList(reader);
+    case ClassTag.DataSpecificationIec61360:
+      return readDataSpecificationIec61360(reader);
+    case ClassTag.DataSpecificationPhysicalUnit:
+      return readDataSpecificationPhysicalUnit(reader);
+    default:
+      throw new DecodingError(`Expected a class tag, but got: ${tag}`, offset);
+  }
+}
+
+/**
+ * Decode an instance of any class from `bytes`.
+ *
+ * @param bytes - encoded with {@link toBinary}
+ * @returns the decoded instance, or an error if any
+ */
+export function fromBinary(
+  bytes: Uint8Array
+): AasCommon.Either<AasTypes.Class, DecodingError> {
+  const reader = new Reader(bytes);
+  try {
+    for (const expected of MAGIC) {
+      const offset = reader.offset;
+      if (reader.readByte() !== expected) {
+        throw new DecodingError(
+          "Expected the magic bytes of the binary format at the start",
+          offset
+        );
+      }
+    }
+
+    const offset = reader.offset;
+    const version = reader.readVarUint32();
+    if (version !== FORMAT_VERSION) {
+      throw new DecodingError(
+        `Expected the format version ${FORMAT_VERSION}, but got: ${version}`,
+        offset
+      );
+    }
+
+    const instance = readClass(reader);
+    if (reader.remaining !== 0) {
+      throw new DecodingError(
+        `Unexpected ${reader.remaining} trailing byte(s) after the instance`,
+        reader.offset
+      );
+    }
+
+    return new AasCommon.Either<AasTypes.Class, DecodingError>(instance, null);
+  } catch (error) {
+    if (error instanceof DecodingError) {
+      return new AasCommon.Either<AasTypes.Class, DecodingError>(null, error);
+    }
+    throw error;
+  }
+}
+
+/**
+ * Decode an instance of {@link types!Environment} from `bytes`.
+ *
+ * @param bytes - encoded with {@link toBinary}
+ * @returns the decoded environment, or an error if any
+ */
+export function environmentFromBinary(
+  bytes: Uint8Array
+): AasCommon.Either<AasTypes.Environment, DecodingError> {
+  const instanceOrError = fromBinary(bytes);
+  if (instanceOrError.error !== null) {
+    return new AasCommon.Either<AasTypes.Environment, DecodingError>(
+      null,
+      instanceOrError.error
+    );
+  }
+
+  const instance = instanceOrError.mustValue();
+  if (!AasTypes.isEnvironment(instance)) {
+    return new AasCommon.Either<AasTypes.Environment, DecodingError>(
+      null,
+      new DecodingError(
+        "Expected an Environment, but got an instance of " +
+          AasStringification.mustModelTypeToString(instance),
+        MAGIC.length + 1
+      )
+    );
+  }
+
+  return new AasCommon.Either<AasTypes.Environment, DecodingError>(instance, null);
+}
+
+// endregion
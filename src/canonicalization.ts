@@ -0,0 +1,268 @@
+/**
+ * Serialize AAS instances to canonical JSON and digest them.
+ *
+ * @remarks
+ * `JSON.stringify` writes the properties of an object in the order of their
+ * insertion. Once a JSON-able structure has been modified, or if it comes from
+ * another tool, equal content can thus result in different bytes, which defeats
+ * the content hashing, HTTP ETags and de-duplication.
+ *
+ * The canonical form follows the JSON Canonicalization Scheme (RFC 8785):
+ *
+ * * There is no whitespace between the tokens.
+ * * The properties of the objects are sorted by the UTF-16 code units of
+ *   their names.
+ * * The numbers are written as by `Number.prototype.toString`, with `-0`
+ *   written as `0`.
+ * * The strings escape only `"`, `\` and the control characters. `\b`, `\t`,
+ *   `\n`, `\f` and `\r` are written in their short forms, and the remaining
+ *   control characters as `\u00xx` in lowercase hexadecimal.
+ * * The output is encoded as UTF-8.
+ *
+ * RFC 8785 rejects the unpaired surrogates. We escape them as `\udxxx` instead,
+ * like `JSON.stringify` does, so that any instance can be digested.
+ *
+ * See: https://www.rfc-editor.org/rfc/rfc8785
+ */
+
+import * as AasCommon from "./common";
+import * as AasJsonization from "./jsonization";
+import * as AasSerialization from "./serialization";
+import * as AasTypes from "./types";
+
+/**
+ * Lowercase hexadecimal digits
+ */
+const HEX_DIGITS = "0123456789abcdef";
+
+/**
+ * Map the characters below 0x80 to their escapes, or to `null` if they are
+ * written as-is.
+ */
+const ESCAPES: Array<string | null> = /*@__PURE__*/ (() => {
+  const result = new Array<string | null>(0x80).fill(null);
+  for (let code = 0; code < 0x20; code++) {
+    result[code] = "\\u00" + HEX_DIGITS[code >> 4] + HEX_DIGITS[code & 0xf];
+  }
+  result[0x08] = "\\b";
+  result[0x09] = "\\t";
+  result[0x0a] = "\\n";
+  result[0x0c] = "\\f";
+  result[0x0d] = "\\r";
+  result[0x22] = '\\"';
+  result[0x5c] = "\\\\";
+  return result;
+})();
+
+/**
+ * Accumulate the canonical JSON in a growing buffer of UTF-8 bytes.
+ */
+class Writer {
+  private bytes: Uint8Array;
+  private length: number;
+
+  constructor(capacity = 1024) {
+    this.bytes = new Uint8Array(capacity);
+    this.length = 0;
+  }
+
+  /**
+   * Make room for at least `additional` bytes.
+   */
+  private reserve(additional: number): void {
+    const needed = this.length + additional;
+    if (needed <= this.bytes.length) {
+      return;
+    }
+
+    const grown = new Uint8Array(Math.max(needed, 2 * this.bytes.length));
+    grown.set(this.bytes.subarray(0, this.length));
+    this.bytes = grown;
+  }
+
+  /**
+   * Write `text` which consists only of ASCII characters.
+   */
+  writeAscii(text: string): void {
+    this.reserve(text.length);
+    const bytes = this.bytes;
+    let length = this.length;
+    for (let i = 0; i < text.length; i++) {
+      bytes[length++] = text.charCodeAt(i);
+    }
+    this.length = length;
+  }
+
+  /**
+   * Write `text` as a quoted and escaped JSON string.
+   */
+  writeString(text: string): void {
+    // Each code unit takes at most 6 bytes, namely as `\uXXXX`.
+    this.reserve(6 * text.length + 2);
+
+    const bytes = this.bytes;
+    let length = this.length;
+
+    bytes[length++] = 0x22;
+    for (let i = 0; i < text.length; i++) {
+      let code = text.charCodeAt(i);
+      if (code < 0x80) {
+        const escape = ESCAPES[code];
+        if (escape === null) {
+          bytes[length++] = code;
+        } else {
+          for (let j = 0; j < escape.length; j++) {
+            bytes[length++] = escape.charCodeAt(j);
+          }
+        }
+      } else if (code < 0x800) {
+        bytes[length++] = 0xc0 | (code >> 6);
+        bytes[length++] = 0x80 | (code & 0x3f);
+      } else if (code < 0xd800 || code > 0xdfff) {
+        bytes[length++] = 0xe0 | (code >> 12);
+        bytes[length++] = 0x80 | ((code >> 6) & 0x3f);
+        bytes[length++] = 0x80 | (code & 0x3f);
+      } else if (
+        code <= 0xdbff &&
+        i + 1 < text.length &&
+        (text.charCodeAt(i + 1) & 0xfc00) === 0xdc00
+      ) {
+        i++;
+        code = 0x10000 + ((code - 0xd800) << 10) + (text.charCodeAt(i) - 0xdc00);
+        bytes[length++] = 0xf0 | (code >> 18);
+        bytes[length++] = 0x80 | ((code >> 12) & 0x3f);
+        bytes[length++] = 0x80 | ((code >> 6) & 0x3f);
+        bytes[length++] = 0x80 | (code & 0x3f);
+      } else {
+        // Unpaired surrogate
+        bytes[length++] = 0x5c;
+        bytes[length++] = 0x75;
+        for (let shift = 12; shift >= 0; shift -= 4) {
+          bytes[length++] = HEX_DIGITS.charCodeAt((code >> shift) & 0xf);
+        }
+      }
+    }
+    bytes[length++] = 0x22;
+
+    this.length = length;
+  }
+
+  /**
+   * @returns a copy of the written bytes
+   */
+  finish(): Uint8Array {
+    return this.bytes.slice(0, this.length);
+  }
+}
+
+/**
+ * Write `value` in the canonical form to `writer`.
+ *
+ * @throws an {@link Error} if `value` contains a non-finite number or is not
+ * JSON-able
+ */
+function write(value: AasJsonization.JsonValue, writer: Writer): void {
+  switch (typeof value) {
+    case "string":
+      writer.writeString(value);
+      return;
+
+    case "number":
+      if (!Number.isFinite(value)) {
+        throw new Error(`Expected only finite numbers, but got: ${value}`);
+      }
+      // String(-0) gives "0" as required by RFC 8785.
+      writer.writeAscii(String(value));
+      return;
+
+    case "boolean":
+      writer.writeAscii(value ? "true" : "false");
+      return;
+
+    case "object":
+      break;
+
+    default:
+      throw new Error(`Expected a JSON-able value, but got: ${typeof value}`);
+  }
+
+  if (value === null) {
+    writer.writeAscii("null");
+    return;
+  }
+
+  if (typeof value[Symbol.iterator] === "function") {
+    writer.writeAscii("[");
+    let first = true;
+    for (const item of <Iterable<AasJsonization.JsonValue>>value) {
+      if (!first) {
+        writer.writeAscii(",");
+      }
+      first = false;
+      write(item, writer);
+    }
+    writer.writeAscii("]");
+    return;
+  }
+
+  const jsonObject = <AasJsonization.JsonObject>value;
+
+  // The default sort compares the UTF-16 code units as required by RFC 8785.
+  const keys = Object.keys(jsonObject).sort();
+
+  writer.writeAscii("{");
+  for (let i = 0; i < keys.length; i++) {
+    if (i > 0) {
+      writer.writeAscii(",");
+    }
+    writer.writeString(keys[i]);
+    writer.writeAscii(":");
+    write(jsonObject[keys[i]], writer);
+  }
+  writer.writeAscii("}");
+}
+
+/**
+ * Serialize `jsonable` to canonical JSON.
+ *
+ * @param jsonable - JSON-able structure to be serialized
+ * @returns UTF-8 encoded canonical JSON
+ * @throws an {@link Error} if `jsonable` contains a non-finite number
+ */
+export function canonicalize(jsonable: AasJsonization.JsonValue): Uint8Array {
+  const writer = new Writer();
+  write(jsonable, writer);
+  return writer.finish();
+}
+
+/**
+ * Serialize `that` instance to canonical JSON.
+ *
+ * @param that - AAS data to be serialized
+ * @param options - to control the serialization, if any
+ * @returns UTF-8 encoded canonical JSON
+ */
+export function toCanonicalJson(
+  that: AasTypes.Class,
+  options: AasSerialization.SerializationOptions | null = null
+): Uint8Array {
+  return canonicalize(AasSerialization.toJsonable(that, options));
+}
+
+/**
+ * Digest `that` instance based on its canonical JSON.
+ *
+ * @remarks
+ * Two instances which serialize to equal JSON have the same digest. Use
+ * the digest, *e.g.*, as a key in a cache or as an HTTP ETag.
+ *
+ * @param that - AAS data to be digested
+ * @param options - to control the serialization, if any
+ * @returns hexadecimal SHA-256 digest of the canonical JSON
+ */
+export function digest(
+  that: AasTypes.Class,
+  options: AasSerialization.SerializationOptions | null = null
+): string {
+  return AasCommon.hexEncode(AasCommon.sha256(toCanonicalJson(that, options)));
+}
@@ -147,22 +147,32 @@ export class Either<ValueT, ErrorT> {
 }
 
 const BASE64_CHARS = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/";
-const BASE64_LOOKUP = new Uint8Array(256);
 
-// NOTE (mristin, 2022-11-25):
-// Initialize to 255 so that we can detect invalid values in the input during decoding.
-for (let i = 0; i < BASE64_LOOKUP.length; i++) {
-  BASE64_LOOKUP[i] = 255;
-}
+function constructBase64Lookup(): Uint8Array {
+  const lookup = new Uint8Array(256);
+
+  // NOTE (mristin, 2022-11-25):
+  // Initialize to 255 so that we can detect invalid values in the input during
+  // decoding.
+  for (let i = 0; i < lookup.length; i++) {
+    lookup[i] = 255;
+  }
 
-// NOTE (mristin, 2022-11-25):
-// Initialize valid values to the corresponding decoding points.
-for (let i = 0; i < BASE64_CHARS.length; i++) {
-  BASE64_LOOKUP[BASE64_CHARS.charCodeAt(i)] = i;
+  // NOTE (mristin, 2022-11-25):
+  // Initialize valid values to the corresponding decoding points.
+  for (let i = 0; i < BASE64_CHARS.length; i++) {
+    lookup[BASE64_CHARS.charCodeAt(i)] = i;
+  }
+
+  return lookup;
 }
 
+// The table is built in a function call marked as pure so that the bundlers can
+// drop it together with the decoder.
+const BASE64_LOOKUP = /*@__PURE__*/ constructBase64Lookup();
+
 /**
- * Encode a byte array in base64.
+ * Encode a byte array in base64 using our own implementation.
  *
  * @remarks
  * We provide our own implementation so that we do not run into compatibility
@@ -173,7 +183,7 @@ for (let i = 0; i < BASE64_CHARS.length; i++) {
  * @param bytes - to be encoded
  * @returns `bytes` encoded as base64 text
  */
-export function base64Encode(bytes: Uint8Array): string {
+function base64EncodeWithLookup(bytes: Uint8Array): string {
   // NOTE (mristin, 2022-11-25):
   // This implementation is vaguely based on:
   // https://github.com/danguer/blog-examples/blob/master/js/base64-binary.js,
@@ -216,7 +226,7 @@ export function base64Encode(bytes: Uint8Array): string {
 }
 
 /**
- * Decode a base64-encoded byte array.
+ * Decode a base64-encoded byte array using our own implementation.
  *
  * @remarks
  * We provide our own implementation so that we do not run into compatibility
@@ -227,7 +237,7 @@ export function base64Encode(bytes: Uint8Array): string {
  * @param text - to be decoded
  * @returns either the array or an error, if `text` is not a valid base64 encoding
  */
-export function base64Decode(text: string): Either<Uint8Array, string> {
+function base64DecodeWithLookup(text: string): Either<Uint8Array, string> {
   // NOTE (mristin, 2022-11-25):
   // This implementation is vaguely based on:
   // https://github.com/danguer/blog-examples/blob/master/js/base64-binary.js,
@@ -240,16 +250,17 @@ export function base64Decode(text: string): Either<Uint8Array, string> {
   // NOTE (mristin, 2022-11-25):
   // Some implementations forget the padding, so we try to be robust and check
   // for the padding manually.
-  let bytesLength = text.length * 0.75;
   if (text[len - 1] === "=") {
-    bytesLength--;
     lenWoPad--;
     if (text[len - 2] === "=") {
-      bytesLength--;
       lenWoPad--;
     }
   }
 
+  // The incomplete last quadruple of a text without the padding encodes
+  // only as many bytes as it has complete octets.
+  const bytesLength = Math.floor((lenWoPad * 3) / 4);
+
   const bytes = new Uint8Array(bytesLength);
 
   const base64LookupLen = BASE64_LOOKUP.length;
@@ -353,5 +364,727 @@ export function base64Decode(text: string): Either<Uint8Array, string> {
   return new Either<Uint8Array, string>(bytes, null);
 }
 
+/**
+ * Find the first invalid character in the base64-encoded `text`.
+ *
+ * @remarks
+ * The check is equivalent to the one in {@link base64DecodeWithLookup}.
+ *
+ * @param text - to be checked
+ * @param paddingAllowed - if set, `text` may end with the padding
+ * @returns index of the first invalid character, or -1 if there is none
+ */
+function indexOfInvalidBase64Character(text: string, paddingAllowed: boolean): number {
+  const len = text.length;
+  let lenWoPad = len;
+  if (paddingAllowed && text[len - 1] === "=") {
+    lenWoPad--;
+    if (text[len - 2] === "=") {
+      lenWoPad--;
+    }
+  }
+
+  const base64LookupLen = BASE64_LOOKUP.length;
+
+  for (let i = 0; i < len; i++) {
+    // The first two characters of each quadruple are always checked, while
+    // the last two are skipped if they belong to the padding, see
+    // base64DecodeWithLookup.
+    if (i % 4 >= 2 && i >= lenWoPad) {
+      continue;
+    }
+
+    const charCode = text.charCodeAt(i);
+    if (charCode >= base64LookupLen || BASE64_LOOKUP[charCode] === 255) {
+      return i;
+    }
+  }
+
+  return -1;
+}
+
+/**
+ * Generate the message about an invalid character in a base64-encoded text.
+ *
+ * @param text - containing the invalid character
+ * @param index - of the invalid character in `text`
+ * @param offset - of `text` in the whole base64-encoded text
+ * @returns human-readable message
+ */
+function invalidBase64CharacterMessage(
+  text: string,
+  index: number,
+  offset: number
+): string {
+  return (
+    "Expected a valid character from base64-encoded string, " +
+    `but got at index ${offset + index}: ${text[index]} ` +
+    `(code: ${text.charCodeAt(index)})`
+  );
+}
+
+/**
+ * Check the padding and the length of the base64-encoded `text`.
+ *
+ * @remarks
+ * The padding consists of at most two characters and completes the last
+ * quadruple. A last quadruple with a single character can not encode a byte,
+ * so the text is invalid whether it is padded or not.
+ *
+ * The characters themselves are expected to have been checked with
+ * {@link indexOfInvalidBase64Character}.
+ *
+ * @param text - to be checked
+ * @param offset - of `text` in the whole base64-encoded text
+ * @returns error message, or `null` if the padding and the length are valid
+ */
+function base64PaddingError(text: string, offset: number): string | null {
+  const len = text.length;
+  let lenWoPad = len;
+  while (lenWoPad > 0 && text[lenWoPad - 1] === "=") {
+    lenWoPad--;
+  }
+
+  if (len - lenWoPad > 2) {
+    return (
+      "Expected at most two padding characters in a base64-encoded string, " +
+      `but got ${len - lenWoPad} starting at index ${offset + lenWoPad}`
+    );
+  }
+
+  if (lenWoPad % 4 === 1) {
+    return (
+      "Expected at least two characters in the last quadruple " +
+      "of a base64-encoded string, but got only one " +
+      `at index ${offset + lenWoPad - 1}`
+    );
+  }
+
+  if (lenWoPad < len && len % 4 !== 0) {
+    return (
+      "Expected the length of a padded base64-encoded string to be divisible by 4, " +
+      `but got: ${offset + len}`
+    );
+  }
+
+  return null;
+}
+
+/**
+ * Check that the text is a valid base64 encoding without decoding it.
+ *
+ * @remarks
+ * The check is equivalent to {@link base64Decode}, and the error messages are
+ * the same, but no bytes are allocated.
+ *
+ * @param text - to be checked
+ * @returns error message, or `null` if `text` is a valid base64 encoding
+ */
+export function base64Validate(text: string): string | null {
+  const index = indexOfInvalidBase64Character(text, true);
+  if (index !== -1) {
+    return invalidBase64CharacterMessage(text, index, 0);
+  }
+
+  return base64PaddingError(text, 0);
+}
+
+/**
+ * Node's `Buffer`, or `null` if we do not run on Node
+ */
+const NODE_BUFFER: typeof Buffer | null = typeof Buffer === "function" ? Buffer : null;
+
+/**
+ * Signal that `atob` and `btoa` are available, as is usually the case in browsers
+ */
+const HAS_ATOB_AND_BTOA = typeof atob === "function" && typeof btoa === "function";
+
+/**
+ * Maximum number of arguments we pass to `String.fromCharCode` in a single call
+ *
+ * @remarks
+ * The engines limit the number of arguments of a function call, so we have to
+ * convert large byte arrays in slices.
+ */
+const FROM_CHAR_CODE_SLICE = 0x8000;
+
+/**
+ * Encode a byte array in base64.
+ *
+ * @remarks
+ * We use `Buffer` on Node and `btoa` in the browsers as they are much faster
+ * than our own implementation for large arrays. If none of them is available,
+ * we fall back to our own implementation.
+ *
+ * @param bytes - to be encoded
+ * @returns `bytes` encoded as base64 text
+ */
+export function base64Encode(bytes: Uint8Array): string {
+  if (NODE_BUFFER !== null) {
+    // This does not copy the bytes, but only creates a view on them.
+    const buffer = NODE_BUFFER.from(bytes.buffer, bytes.byteOffset, bytes.length);
+    return buffer.toString("base64");
+  }
+
+  if (HAS_ATOB_AND_BTOA) {
+    let binary = "";
+    for (let i = 0; i < bytes.length; i += FROM_CHAR_CODE_SLICE) {
+      binary += String.fromCharCode.apply(
+        null,
+        bytes.subarray(i, i + FROM_CHAR_CODE_SLICE)
+      );
+    }
+    return btoa(binary);
+  }
+
+  return base64EncodeWithLookup(bytes);
+}
+
+/**
+ * Decode the base64-encoded `text` which has been already validated.
+ *
+ * @param text - valid base64 encoding whose length is divisible by 4
+ * @returns decoded bytes
+ */
+function decodeValidatedBase64(text: string): Uint8Array {
+  const len = text.length;
+
+  let bytesLength = (len / 4) * 3;
+  if (text[len - 1] === "=") {
+    bytesLength--;
+    if (text[len - 2] === "=") {
+      bytesLength--;
+    }
+  }
+
+  if (NODE_BUFFER !== null) {
+    // We decode directly into our own array instead of calling
+    // `Buffer.from(text, "base64")`. Node allocates small buffers from a shared
+    // pool, and we do not want to hand out the whole pool as `bytes.buffer`.
+    const bytes = new Uint8Array(bytesLength);
+    NODE_BUFFER.from(bytes.buffer).write(text, "base64");
+    return bytes;
+  }
+
+  if (HAS_ATOB_AND_BTOA) {
+    const binary = atob(text);
+    const bytes = new Uint8Array(binary.length);
+    for (let i = 0; i < binary.length; i++) {
+      bytes[i] = binary.charCodeAt(i);
+    }
+    return bytes;
+  }
+
+  return base64DecodeWithLookup(text).mustValue();
+}
+
+/**
+ * Decode a base64-encoded byte array.
+ *
+ * @remarks
+ * We use `Buffer` on Node and `atob` in the browsers as they are much faster
+ * than our own implementation for large texts. Since these decoders are
+ * lenient about invalid characters, we validate the text ourselves beforehand.
+ * If no native decoder is available, or if the text lacks the padding,
+ * we fall back to our own implementation.
+ *
+ * @param text - to be decoded
+ * @returns either the array or an error, if `text` is not a valid base64 encoding
+ */
+export function base64Decode(text: string): Either<Uint8Array, string> {
+  const error = base64Validate(text);
+  if (error !== null) {
+    return new Either<Uint8Array, string>(null, error);
+  }
+
+  if (text.length % 4 !== 0) {
+    return base64DecodeWithLookup(text);
+  }
+
+  return new Either<Uint8Array, string>(decodeValidatedBase64(text), null);
+}
+
+/**
+ * Encode a byte array in base64 chunk by chunk.
+ *
+ * @remarks
+ * Concatenating the outputs of {@link update} calls and the final {@link finish}
+ * gives the same text as {@link base64Encode} on the concatenated chunks.
+ * This allows you to stream large byte arrays without building the whole
+ * text in memory.
+ *
+ * The encoder can be re-used after {@link finish}.
+ */
+export class Base64Encoder {
+  /**
+   * Bytes of the previous chunks which do not complete a triple yet
+   */
+  private readonly remainder: Uint8Array;
+
+  /**
+   * Number of bytes in {@link remainder}
+   */
+  private remainderLength: number;
+
+  constructor() {
+    this.remainder = new Uint8Array(3);
+    this.remainderLength = 0;
+  }
+
+  /**
+   * Encode the next chunk.
+   *
+   * @param bytes - next chunk to be encoded
+   * @returns encoded text of all the complete triples so far
+   */
+  update(bytes: Uint8Array): string {
+    let encoded = "";
+    let start = 0;
+
+    if (this.remainderLength > 0) {
+      while (this.remainderLength < 3 && start < bytes.length) {
+        this.remainder[this.remainderLength] = bytes[start];
+        this.remainderLength++;
+        start++;
+      }
+
+      if (this.remainderLength < 3) {
+        return encoded;
+      }
+
+      encoded = base64Encode(this.remainder);
+      this.remainderLength = 0;
+    }
+
+    const end = bytes.length - ((bytes.length - start) % 3);
+    if (end > start) {
+      encoded += base64Encode(bytes.subarray(start, end));
+    }
+
+    for (let i = end; i < bytes.length; i++) {
+      this.remainder[this.remainderLength] = bytes[i];
+      this.remainderLength++;
+    }
+
+    return encoded;
+  }
+
+  /**
+   * Encode the remaining bytes including the padding, and reset the encoder.
+   *
+   * @returns the final piece of the encoded text
+   */
+  finish(): string {
+    const encoded = base64Encode(this.remainder.subarray(0, this.remainderLength));
+    this.remainderLength = 0;
+    return encoded;
+  }
+}
+
+/**
+ * Decode a base64-encoded text chunk by chunk.
+ *
+ * @remarks
+ * Concatenating the outputs of {@link update} calls and the final {@link finish}
+ * gives the same bytes as {@link base64Decode} on the concatenated chunks.
+ * The indices in the error messages refer to the concatenated text as well.
+ *
+ * Unlike {@link base64Decode}, the decoder expects the padding. Do not use
+ * the decoder anymore after it reported an error.
+ *
+ * The decoder can be re-used after {@link finish}.
+ */
+export class Base64Decoder {
+  /**
+   * Text of the previous chunks which has not been decoded yet
+   */
+  private pending: string;
+
+  /**
+   * Index of {@link pending} in the whole text
+   */
+  private offset: number;
+
+  constructor() {
+    this.pending = "";
+    this.offset = 0;
+  }
+
+  /**
+   * Decode the next chunk.
+   *
+   * @param text - next chunk to be decoded
+   * @returns either the bytes decoded from all the complete quadruples so far,
+   * or an error if the text is not a valid base64 encoding
+   */
+  update(text: string): Either<Uint8Array, string> {
+    this.pending += text;
+
+    let end = this.pending.length - (this.pending.length % 4);
+
+    // A quadruple with padding is only valid at the very end, so we
+    // postpone it until we know whether more text follows.
+    if (end > 0 && end === this.pending.length && this.pending[end - 1] === "=") {
+      end -= 4;
+    }
+
+    const chunk = this.pending.substring(0, end);
+
+    const index = indexOfInvalidBase64Character(chunk, false);
+    if (index !== -1) {
+      return new Either<Uint8Array, string>(
+        null,
+        invalidBase64CharacterMessage(chunk, index, this.offset)
+      );
+    }
+
+    this.pending = this.pending.substring(end);
+    this.offset += end;
+
+    return new Either<Uint8Array, string>(decodeValidatedBase64(chunk), null);
+  }
+
+  /**
+   * Decode the remaining text, and reset the decoder.
+   *
+   * @returns either the final bytes, or an error if the text is not a valid
+   * base64 encoding
+   */
+  finish(): Either<Uint8Array, string> {
+    const text = this.pending;
+    const offset = this.offset;
+
+    this.pending = "";
+    this.offset = 0;
+
+    const index = indexOfInvalidBase64Character(text, true);
+    if (index !== -1) {
+      return new Either<Uint8Array, string>(
+        null,
+        invalidBase64CharacterMessage(text, index, offset)
+      );
+    }
+
+    const paddingError = base64PaddingError(text, offset);
+    if (paddingError !== null) {
+      return new Either<Uint8Array, string>(null, paddingError);
+    }
+
+    if (text.length % 4 !== 0) {
+      return new Either<Uint8Array, string>(
+        null,
+        "Expected the length of a base64-encoded string to be divisible by 4, " +
+          `but got: ${offset + text.length}`
+      );
+    }
+
+    return new Either<Uint8Array, string>(decodeValidatedBase64(text), null);
+  }
+}
+
+/**
+ * Encode `text` in UTF-8.
+ *
+ * @remarks
+ * The unpaired surrogates are encoded as if they were code points, so that
+ * the encoding never fails.
+ *
+ * @param text - to be encoded
+ * @returns UTF-8 bytes of `text`
+ */
+export function utf8Encode(text: string): Uint8Array {
+  const bytes = new Uint8Array(3 * text.length);
+
+  let length = 0;
+  for (let i = 0; i < text.length; i++) {
+    let code = text.charCodeAt(i);
+    if (code < 0x80) {
+      bytes[length++] = code;
+    } else if (code < 0x800) {
+      bytes[length++] = 0xc0 | (code >> 6);
+      bytes[length++] = 0x80 | (code & 0x3f);
+    } else if (
+      code >= 0xd800 &&
+      code <= 0xdbff &&
+      i + 1 < text.length &&
+      (text.charCodeAt(i + 1) & 0xfc00) === 0xdc00
+    ) {
+      i++;
+      code = 0x10000 + ((code - 0xd800) << 10) + (text.charCodeAt(i) - 0xdc00);
+      bytes[length++] = 0xf0 | (code >> 18);
+      bytes[length++] = 0x80 | ((code >> 12) & 0x3f);
+      bytes[length++] = 0x80 | ((code >> 6) & 0x3f);
+      bytes[length++] = 0x80 | (code & 0x3f);
+    } else {
+      bytes[length++] = 0xe0 | (code >> 12);
+      bytes[length++] = 0x80 | ((code >> 6) & 0x3f);
+      bytes[length++] = 0x80 | (code & 0x3f);
+    }
+  }
+
+  return bytes.subarray(0, length);
+}
+
+/**
+ * Round constants of SHA-256
+ */
+const SHA256_K = /*@__PURE__*/ new Int32Array([
+  0x428a2f98, 0x71374491, 0xb5c0fbcf, 0xe9b5dba5, 0x3956c25b, 0x59f111f1, 0x923f82a4,
+  0xab1c5ed5, 0xd807aa98, 0x12835b01, 0x243185be, 0x550c7dc3, 0x72be5d74, 0x80deb1fe,
+  0x9bdc06a7, 0xc19bf174, 0xe49b69c1, 0xefbe4786, 0x0fc19dc6, 0x240ca1cc, 0x2de92c6f,
+  0x4a7484aa, 0x5cb0a9dc, 0x76f988da, 0x983e5152, 0xa831c66d, 0xb00327c8, 0xbf597fc7,
+  0xc6e00bf3, 0xd5a79147, 0x06ca6351, 0x14292967, 0x27b70a85, 0x2e1b2138, 0x4d2c6dfc,
+  0x53380d13, 0x650a7354, 0x766a0abb, 0x81c2c92e, 0x92722c85, 0xa2bfe8a1, 0xa81a664b,
+  0xc24b8b70, 0xc76c51a3, 0xd192e819, 0xd6990624, 0xf40e3585, 0x106aa070, 0x19a4c116,
+  0x1e376c08, 0x2748774c, 0x34b0bcb5, 0x391c0cb3, 0x4ed8aa4a, 0x5b9cca4f, 0x682e6ff3,
+  0x748f82ee, 0x78a5636f, 0x84c87814, 0x8cc70208, 0x90befffa, 0xa4506ceb, 0xbef9a3f7,
+  0xc67178f2
+]);
+
+/**
+ * Compute the SHA-256 digest of `bytes`.
+ *
+ * @remarks
+ * We implement the hash ourselves as the Web Crypto API is asynchronous and
+ * the `crypto` module is only available on Node.
+ *
+ * See: https://doi.org/10.6028/NIST.FIPS.180-4
+ *
+ * @param bytes - to be hashed
+ * @returns 32 bytes of the digest
+ */
+export function sha256(bytes: Uint8Array): Uint8Array {
+  // Pad with a single one bit, zeros and the bit length as a 64-bit big-endian
+  // integer to a multiple of 64 bytes.
+  const paddedLength = (((bytes.length + 8) >> 6) + 1) << 6;
+  const padded = new Uint8Array(paddedLength);
+  padded.set(bytes);
+  padded[bytes.length] = 0x80;
+
+  const view = new DataView(padded.buffer);
+  view.setUint32(paddedLength - 8, Math.floor(bytes.length / 0x20000000));
+  view.setUint32(paddedLength - 4, (bytes.length << 3) >>> 0);
+
+  let h0 = 0x6a09e667;
+  let h1 = 0xbb67ae85 | 0;
+  let h2 = 0x3c6ef372;
+  let h3 = 0xa54ff53a | 0;
+  let h4 = 0x510e527f;
+  let h5 = 0x9b05688c | 0;
+  let h6 = 0x1f83d9ab;
+  let h7 = 0x5be0cd19;
+
+  const w = new Int32Array(64);
+
+  for (let offset = 0; offset < paddedLength; offset += 64) {
+    for (let t = 0; t < 16; t++) {
+      w[t] = view.getInt32(offset + 4 * t);
+    }
+    for (let t = 16; t < 64; t++) {
+      const x = w[t - 15];
+      const y = w[t - 2];
+      const sigma0 = ((x >>> 7) | (x << 25)) ^ ((x >>> 18) | (x << 14)) ^ (x >>> 3);
+      const sigma1 = ((y >>> 17) | (y << 15)) ^ ((y >>> 19) | (y << 13)) ^ (y >>> 10);
+      w[t] = (w[t - 16] + sigma0 + w[t - 7] + sigma1) | 0;
+    }
+
+    let a = h0;
+    let b = h1;
+    let c = h2;
+    let d = h3;
+    let e = h4;
+    let f = h5;
+    let g = h6;
+    let h = h7;
+
+    for (let t = 0; t < 64; t++) {
+      const bigSigma1 =
+        ((e >>> 6) | (e << 26)) ^ ((e >>> 11) | (e << 21)) ^ ((e >>> 25) | (e << 7));
+      const choice = (e & f) ^ (~e & g);
+      const temp1 = (h + bigSigma1 + choice + SHA256_K[t] + w[t]) | 0;
+
+      const bigSigma0 =
+        ((a >>> 2) | (a << 30)) ^ ((a >>> 13) | (a << 19)) ^ ((a >>> 22) | (a << 10));
+      const majority = (a & b) ^ (a & c) ^ (b & c);
+      const temp2 = (bigSigma0 + majority) | 0;
+
+      h = g;
+      g = f;
+      f = e;
+      e = (d + temp1) | 0;
+      d = c;
+      c = b;
+      b = a;
+      a = (temp1 + temp2) | 0;
+    }
+
+    h0 = (h0 + a) | 0;
+    h1 = (h1 + b) | 0;
+    h2 = (h2 + c) | 0;
+    h3 = (h3 + d) | 0;
+    h4 = (h4 + e) | 0;
+    h5 = (h5 + f) | 0;
+    h6 = (h6 + g) | 0;
+    h7 = (h7 + h) | 0;
+  }
+
+  const digest = new Uint8Array(32);
+  const digestView = new DataView(digest.buffer);
+  digestView.setInt32(0, h0);
+  digestView.setInt32(4, h1);
+  digestView.setInt32(8, h2);
+  digestView.setInt32(12, h3);
+  digestView.setInt32(16, h4);
+  digestView.setInt32(20, h5);
+  digestView.setInt32(24, h6);
+  digestView.setInt32(28, h7);
+  return digest;
+}
+
+/**
+ * Encode `bytes` as lowercase hexadecimal text.
+ *
+ * @param bytes - to be encoded
+ * @returns two hexadecimal digits per byte
+ */
+export function hexEncode(bytes: Uint8Array): string {
+  const parts = new Array<string>(bytes.length);
+  for (let i = 0; i < bytes.length; i++) {
+    parts[i] = (bytes[i] < 0x10 ? "0" : "") + bytes[i].toString(16);
+  }
+  return parts.join("");
+}
+
+/**
+ * Control how long an asynchronous operation may run before it yields
+ * to the event loop.
+ *
+ * @remarks
+ * If both budgets are given, the operation yields as soon as either of them is
+ * exhausted. If none is given, the operation yields after every 1000 nodes.
+ */
+export interface TimeSlicingOptions {
+  /**
+   * Number of nodes to be processed before yielding
+   */
+  readonly nodeBudget?: number;
+
+  /**
+   * Milliseconds to run before yielding
+   */
+  readonly timeBudget?: number;
+
+  /**
+   * Signal to abort the operation
+   */
+  readonly signal?: AbortSignal;
+}
+
+/**
+ * Default number of nodes to be processed before yielding
+ */
+const DEFAULT_NODE_BUDGET = 1000;
+
+/**
+ * Number of nodes between two readings of the clock
+ */
+const CLOCK_INTERVAL = 64;
+
+/**
+ * Give the event loop a chance to run the pending I/O and timers.
+ */
+function yieldToEventLoop(): Promise<void> {
+  return new Promise<void>((resolve) => {
+    if (typeof setImmediate === "function") {
+      setImmediate(resolve);
+    } else {
+      setTimeout(resolve, 0);
+    }
+  });
+}
+
+/**
+ * Split a long-running operation into time slices.
+ *
+ * @remarks
+ * The operation calls {@link tick} for every processed node, and awaits
+ * {@link pause} whenever {@link tick} tells it that the current slice is over.
+ */
+export class TimeSlicer {
+  private readonly nodeBudget: number;
+  private readonly timeBudget: number | null;
+  private readonly signal: AbortSignal | null;
+
+  private nodes = 0;
+  private sliceStart: number;
+
+  constructor(options: TimeSlicingOptions | null = null) {
+    const nodeBudget = options !== null ? options.nodeBudget : undefined;
+    const timeBudget = options !== null ? options.timeBudget : undefined;
+    const signal = options !== null ? options.signal : undefined;
+
+    if (nodeBudget !== undefined && !(nodeBudget >= 1)) {
+      throw new Error(`Expected a node budget of at least 1, but got: ${nodeBudget}`);
+    }
+    if (timeBudget !== undefined && !(timeBudget >= 0)) {
+      throw new Error(`Expected a non-negative time budget, but got: ${timeBudget}`);
+    }
+
+    this.nodeBudget =
+      nodeBudget !== undefined
+        ? nodeBudget
+        : timeBudget !== undefined
+        ? Infinity
+        : DEFAULT_NODE_BUDGET;
+    this.timeBudget = timeBudget !== undefined ? timeBudget : null;
+    this.signal = signal !== undefined ? signal : null;
+    this.sliceStart = Date.now();
+  }
+
+  /**
+   * Count a processed node.
+   *
+   * @returns `true` if the current slice is over
+   */
+  tick(): boolean {
+    this.nodes++;
+
+    if (this.nodes >= this.nodeBudget) {
+      return true;
+    }
+
+    return (
+      this.timeBudget !== null &&
+      this.nodes % CLOCK_INTERVAL === 0 &&
+      Date.now() - this.sliceStart >= this.timeBudget
+    );
+  }
+
+  /**
+   * Yield to the event loop, and start a new slice.
+   *
+   * @throws the reason of the abort, if the operation has been aborted
+   */
+  async pause(): Promise<void> {
+    this.throwIfAborted();
+    await yieldToEventLoop();
+    this.throwIfAborted();
+
+    this.nodes = 0;
+    this.sliceStart = Date.now();
+  }
+
+  /**
+   * @throws the reason of the abort, if the operation has been aborted
+   */
+  throwIfAborted(): void {
+    if (this.signal !== null && this.signal.aborted) {
+      throw this.signal.reason !== undefined
+        ? this.signal.reason
+        : new Error("The operation has been aborted");
+    }
+  }
+}
+
 // This code has been automatically generated by aas-core-codegen.
 // Do NOT edit or append.
@@ -0,0 +1,1114 @@
+/**
+ * Copy AAS instances without a round trip through JSON.
+ *
+ * @remarks
+ * A deep copy is a tree of new instances which shares no instance with
+ * the original, so you can modify either one without affecting the other.
+ * Strings, numbers and booleans are immutable in JavaScript and hence simply
+ * assigned. The byte arrays of the blobs are shared unless you ask for a copy,
+ * since they are rarely modified in place.
+ *
+ * A shallow copy copies only the instance itself and its lists, and shares
+ * the instances it holds with the original. It is the building block for
+ * copy-on-write, where only the path from the root to a changed instance needs
+ * to be copied.
+ *
+ * The copies are not verified, just as the originals were not.
+ */
+
+import * as AasTypes from "./types";
+
+/**
+ * Control the copying.
+ */
+export interface CopyOptions {
+  /**
+   * If set, the instances of the classes which hold no other instances, such as
+   * {@link types!Key}, {@link types!LangString} and {@link types!Resource}, are
+   * shared with the original instead of copied.
+   *
+   * @remarks
+   * This saves time and memory if you never modify these instances in place,
+   * but replace them as a whole.
+   */
+  shareLeaves?: boolean;
+
+  /**
+   * If set, the bytes of {@link types!Blob.value} are copied. Otherwise, the copy
+   * shares the byte array with the original.
+   */
+  copyBlobValues?: boolean;
+}
+
+/**
+ * Copy the instances recursively.
+ */
+class Copier extends AasTypes.AbstractTransformer<AasTypes.Class> {
+  /**
+   * If set, share the instances which hold no other instances
+   */
+  private readonly shareLeaves: boolean;
+
+  /**
+   * If set, copy the bytes of the blobs
+   */
+  private readonly copyBlobValues: boolean;
+
+  constructor(options: CopyOptions | null = null) {
+    super();
+    this.shareLeaves = options !== null && options.shareLeaves === true;
+    this.copyBlobValues = options !== null && options.copyBlobValues === true;
+  }
+
+  /**
+   * Copy `that` instance.
+   */
+  copyOf<ClassT extends AasTypes.Class>(that: ClassT): ClassT {
+    return <ClassT>this.transform(that);
+  }
+
+  /**
+   * Copy `that` instance, if any.
+   */
+  copyOptional<ClassT extends AasTypes.Class>(that: ClassT | null): ClassT | null {
+    return that !== null ? <ClassT>this.transform(that) : null;
+  }
+
+  /**
+   * Copy the `items` and the list itself, if any.
+   */
+  copyArray<ClassT extends AasTypes.Class>(
+    items: Array<ClassT> | null
+  ): Array<ClassT> | null {
+    if (items === null) {
+      return null;
+    }
+
+    const result = new Array<ClassT>(items.length);
+    for (let i = 0; i < items.length; i++) {
+      result[i] = <ClassT>this.transform(items[i]);
+    }
+    return result;
+  }
+
+  /**
+   * Copy the `bytes` if so requested, or share them otherwise.
+   */
+  copyBytes(bytes: Uint8Array | null): Uint8Array | null {
+    return bytes !== null && this.copyBlobValues ? bytes.slice() : bytes;
+  }
+
+  transformExtension(that: AasTypes.Extension): AasTypes.Class {
+    return new AasTypes.Extension(
+      that.name,
+      this.copyOptional(that.semanticId),
+      this.copyArray(that.supplementalSemanticIds),
+      that.valueType,
+      that.value,
+      this.copyOptional(that.refersTo)
+    );
+  }
+
+  transformAdministrativeInformation(
+    that: AasTypes.AdministrativeInformation
+  ): AasTypes.Class {
+    return new AasTypes.AdministrativeInformation(
+      this.copyArray(that.embeddedDataSpecifications),
+      that.version,
+      that.revision
+    );
+  }
+
+  transformQualifier(that: AasTypes.Qualifier): AasTypes.Class {
+    return new AasTypes.Qualifier(
+      that.type,
+      that.valueType,
+      this.copyOptional(that.semanticId),
+      this.copyArray(that.supplementalSemanticIds),
+      that.kind,
+      that.value,
+      this.copyOptional(that.valueId)
+    );
+  }
+
+  transformAssetAdministrationShell(
+    that: AasTypes.AssetAdministrationShell
+  ): AasTypes.Class {
+    return new AasTypes.AssetAdministrationShell(
+      that.id,
+      this.copyOf(that.assetInformation),
+      this.copyArray(that.extensions),
+      that.category,
+      that.idShort,
+      this.copyArray(that.displayName),
+      this.copyArray(that.description),
+      that.checksum,
+      this.copyOptional(that.administration),
+      this.copyArray(that.embeddedDataSpecifications),
+      this.copyOptional(that.derivedFrom),
+      this.copyArray(that.submodels)
+    );
+  }
+
+  transformAssetInformation(that: AasTypes.AssetInformation): AasTypes.Class {
+    return new AasTypes.AssetInformation(
+      that.assetKind,
+      this.copyOptional(that.globalAssetId),
+      this.copyArray(that.specificAssetIds),
+      this.copyOptional(that.defaultThumbnail)
+    );
+  }
+
+  transformResource(that: AasTypes.Resource): AasTypes.Class {
+    if (this.shareLeaves) {
+      return that;
+    }
+
+    return new AasTypes.Resource(that.path, that.contentType);
+  }
+
+  transformSpecificAssetId(that: AasTypes.SpecificAssetId): AasTypes.Class {
+    return new AasTypes.SpecificAssetId(
+      that.name,
+      that.value,
+      this.copyOf(that.externalSubjectId),
+      this.copyOptional(that.semanticId),
+      this.copyArray(that.supplementalSemanticIds)
+    );
+  }
+
+  transformSubmodel(that: AasTypes.Submodel): AasTypes.Class {
+    return new AasTypes.Submodel(
+      that.id,
+      this.copyArray(that.extensions),
+      that.category,
+      that.idShort,
+      this.copyArray(that.displayName),
+      this.copyArray(that.description),
+      that.checksum,
+      this.copyOptional(that.administration),
+      that.kind,
+      this.copyOptional(that.semanticId),
+      this.copyArray(that.supplementalSemanticIds),
+      this.copyArray(that.qualifiers),
+      this.copyArray(that.embeddedDataSpecifications),
+      this.copyArray(that.submodelElements)
+    );
+  }
+
+  transformRelationshipElement(that: AasTypes.RelationshipElement): AasTypes.Class {
+    return new AasTypes.RelationshipElement(
+      this.copyOf(that.first),
+      this.copyOf(that.second),
+      this.copyArray(that.extensions),
+      that.category,
+      that.idShort,
+      this.copyArray(that.displayName),
+      this.copyArray(that.description),
+      that.checksum,
+      that.kind,
+      this.copyOptional(that.semanticId),
+      this.copyArray(that.supplementalSemanticIds),
+      this.copyArray(that.qualifiers),
+      this.copyArray(that.embeddedDataSpecifications)
+    );
+  }
+
+  transformSubmodelElementList(that: AasTypes.SubmodelElementList): AasTypes.Class {
+    return new AasTypes.SubmodelElementList(
+      that.typeValueListElement,
+      this.copyArray(that.extensions),
+      that.category,
+      that.idShort,
+      this.copyArray(that.displayName),
+      this.copyArray(that.description),
+      that.checksum,
+      that.kind,
+      this.copyOptional(that.semanticId),
+      this.copyArray(that.supplementalSemanticIds),
+      this.copyArray(that.qualifiers),
+      this.copyArray(that.embeddedDataSpecifications),
+      that.orderRelevant,
+      this.copyArray(that.value),
+      this.copyOptional(that.semanticIdListElement),
+      that.valueTypeListElement
+    );
+  }
+
+  transformSubmodelElementCollection(
+    that: AasTypes.SubmodelElementCollection
+  ): AasTypes.Class {
+    return new AasTypes.SubmodelElementCollection(
+      this.copyArray(that.extensions),
+      that.category,
+      that.idShort,
+      this.copyArray(that.displayName),
+      this.copyArray(that.description),
+      that.checksum,
+      that.kind,
+      this.copyOptional(that.semanticId),
+      this.copyArray(that.supplementalSemanticIds),
+      this.copyArray(that.qualifiers),
+      this.copyArray(that.embeddedDataSpecifications),
+      this.copyArray(that.value)
+    );
+  }
+
+  transformProperty(that: AasTypes.Property): AasTypes.Class {
+    return new AasTypes.Property(
+      that.valueType,
+      this.copyArray(that.extensions),
+      that.category,
+      that.idShort,
+      this.copyArray(that.displayName),
+      this.copyArray(that.description),
+      that.checksum,
+      that.kind,
+      this.copyOptional(that.semanticId),
+      this.copyArray(that.supplementalSemanticIds),
+      this.copyArray(that.qualifiers),
+      this.copyArray(that.embeddedDataSpecifications),
+      that.value,
+      this.copyOptional(that.valueId)
+    );
+  }
+
+  transformMultiLanguageProperty(that: AasTypes.MultiLanguageProperty): AasTypes.Class {
+    return new AasTypes.MultiLanguageProperty(
+      this.copyArray(that.extensions),
+      that.category,
+      that.idShort,
+      this.copyArray(that.displayName),
+      this.copyArray(that.description),
+      that.checksum,
+      that.kind,
+      this.copyOptional(that.semanticId),
+      this.copyArray(that.supplementalSemanticIds),
+      this.copyArray(that.qualifiers),
+      this.copyArray(that.embeddedDataSpecifications),
+      this.copyArray(that.value),
+      this.copyOptional(that.valueId)
+    );
+  }
+
+  transformRange(that: AasTypes.Range): AasTypes.Class {
+    return new AasTypes.Range(
+      that.valueType,
+      this.copyArray(that.extensions),
+      that.category,
+      that.idShort,
+      this.copyArray(that.displayName),
+      this.copyArray(that.description),
+      that.checksum,
+      that.kind,
+      this.copyOptional(that.semanticId),
+      this.copyArray(that.supplementalSemanticIds),
+      this.copyArray(that.qualifiers),
+      this.copyArray(that.embeddedDataSpecifications),
+      that.min,
+      that.max
+    );
+  }
+
+  transformReferenceElement(that: AasTypes.ReferenceElement): AasTypes.Class {
+    return new AasTypes.ReferenceElement(
+      this.copyArray(that.extensions),
+      that.category,
+      that.idShort,
+      this.copyArray(that.displayName),
+      this.copyArray(that.description),
+      that.checksum,
+      that.kind,
+      this.copyOptional(that.semanticId),
+      this.copyArray(that.supplementalSemanticIds),
+      this.copyArray(that.qualifiers),
+      this.copyArray(that.embeddedDataSpecifications),
+      this.copyOptional(that.value)
+    );
+  }
+
+  transformBlob(that: AasTypes.Blob): AasTypes.Class {
+    return new AasTypes.Blob(
+      that.contentType,
+      this.copyArray(that.extensions),
+      that.category,
+      that.idShort,
+      this.copyArray(that.displayName),
+      this.copyArray(that.description),
+      that.checksum,
+      that.kind,
+      this.copyOptional(that.semanticId),
+      this.copyArray(that.supplementalSemanticIds),
+      this.copyArray(that.qualifiers),
+      this.copyArray(that.embeddedDataSpecifications),
+      this.copyBytes(that.value)
+    );
+  }
+
+  transformFile(that: AasTypes.File): AasTypes.Class {
+    return new AasTypes.File(
+      that.contentType,
+      this.copyArray(that.extensions),
+      that.category,
+      that.idShort,
+      this.copyArray(that.displayName),
+      this.copyArray(that.description),
+      that.checksum,
+      that.kind,
+      this.copyOptional(that.semanticId),
+      this.copyArray(that.supplementalSemanticIds),
+      this.copyArray(that.qualifiers),
+      this.copyArray(that.embeddedDataSpecifications),
+      that.value
+    );
+  }
+
+  transformAnnotatedRelationshipElement(
+    that: AasTypes.AnnotatedRelationshipElement
+  ): AasTypes.Class {
+    return new AasTypes.AnnotatedRelationshipElement(
+      this.copyOf(that.first),
+      this.copyOf(that.second),
+      this.copyArray(that.extensions),
+      that.category,
+      that.idShort,
+      this.copyArray(that.displayName),
+      this.copyArray(that.description),
+      that.checksum,
+      that.kind,
+      this.copyOptional(that.semanticId),
+      this.copyArray(that.supplementalSemanticIds),
+      this.copyArray(that.qualifiers),
+      this.copyArray(that.embeddedDataSpecifications),
+      this.copyArray(that.annotations)
+    );
+  }
+
+  transformEntity(that: AasTypes.Entity): AasTypes.Class {
+    return new AasTypes.Entity(
+      that.entityType,
+      this.copyArray(that.extensions),
+      that.category,
+      that.idShort,
+      this.copyArray(that.displayName),
+      this.copyArray(that.description),
+      that.checksum,
+      that.kind,
+      this.copyOptional(that.semanticId),
+      this.copyArray(that.supplementalSemanticIds),
+      this.copyArray(that.qualifiers),
+      this.copyArray(that.embeddedDataSpecifications),
+      this.copyArray(that.statements),
+      this.copyOptional(that.globalAssetId),
+      this.copyOptional(that.specificAssetId)
+    );
+  }
+
+  transformEventPayload(that: AasTypes.EventPayload): AasTypes.Class {
+    return new AasTypes.EventPayload(
+      this.copyOf(that.source),
+      this.copyOf(that.observableReference),
+      that.timeStamp,
+      this.copyOptional(that.sourceSemanticId),
+      this.copyOptional(that.observableSemanticId),
+      that.topic,
+      this.copyOptional(that.subjectId),
+      that.payload
+    );
+  }
+
+  transformBasicEventElement(that: AasTypes.BasicEventElement): AasTypes.Class {
+    return new AasTypes.BasicEventElement(
+      this.copyOf(that.observed),
+      that.direction,
+      that.state,
+      this.copyArray(that.extensions),
+      that.category,
+      that.idShort,
+      this.copyArray(that.displayName),
+      this.copyArray(that.description),
+      that.checksum,
+      that.kind,
+      this.copyOptional(that.semanticId),
+      this.copyArray(that.supplementalSemanticIds),
+      this.copyArray(that.qualifiers),
+      this.copyArray(that.embeddedDataSpecifications),
+      that.messageTopic,
+      this.copyOptional(that.messageBroker),
+      that.lastUpdate,
+      that.minInterval,
+      that.maxInterval
+    );
+  }
+
+  transformOperation(that: AasTypes.Operation): AasTypes.Class {
+    return new AasTypes.Operation(
+      this.copyArray(that.extensions),
+      that.category,
+      that.idShort,
+      this.copyArray(that.displayName),
+      this.copyArray(that.description),
+      that.checksum,
+      that.kind,
+      this.copyOptional(that.semanticId),
+      this.copyArray(that.supplementalSemanticIds),
+      this.copyArray(that.qualifiers),
+      this.copyArray(that.embeddedDataSpecifications),
+      this.copyArray(that.inputVariables),
+      this.copyArray(that.outputVariables),
+      this.copyArray(that.inoutputVariables)
+    );
+  }
+
+  transformOperationVariable(that: AasTypes.OperationVariable): AasTypes.Class {
+    return new AasTypes.OperationVariable(this.copyOf(that.value));
+  }
+
+  transformCapability(that: AasTypes.Capability): AasTypes.Class {
+    return new AasTypes.Capability(
+      this.copyArray(that.extensions),
+      that.category,
+      that.idShort,
+      this.copyArray(that.displayName),
+      this.copyArray(that.description),
+      that.checksum,
+      that.kind,
+      this.copyOptional(that.semanticId),
+      this.copyArray(that.supplementalSemanticIds),
+      this.copyArray(that.qualifiers),
+      this.copyArray(that.embeddedDataSpecifications)
+    );
+  }
+
+  transformConceptDescription(that: AasTypes.ConceptDescription): AasTypes.Class {
+    return new AasTypes.ConceptDescription(
+      that.id,
+      this.copyArray(that.extensions),
+      that.category,
+      that.idShort,
+      this.copyArray(that.displayName),
+      this.copyArray(that.description),
+      that.checksum,
+      this.copyOptional(that.administration),
+      this.copyArray(that.embeddedDataSpecifications),
+      this.copyArray(that.isCaseOf)
+    );
+  }
+
+  transformReference(that: AasTypes.Reference): AasTypes.Class {
+    return new AasTypes.Reference(
+      that.type,
+      this.copyArray(that.keys),
+      this.copyOptional(that.referredSemanticId)
+    );
+  }
+
+  transformKey(that: AasTypes.Key): AasTypes.Class {
+    if (this.shareLeaves) {
+      return that;
+    }
+
+    return new AasTypes.Key(that.type, that.value);
+  }
+
+  transformLangString(that: AasTypes.LangString): AasTypes.Class {
+    if (this.shareLeaves) {
+      return that;
+    }
+
+    return new AasTypes.LangString(that.language, that.text);
+  }
+
+  transformEnvironment(that: AasTypes.Environment): AasTypes.Class {
+    return new AasTypes.Environment(
+      this.copyArray(that.assetAdministrationShells),
+      this.copyArray(that.submodels),
+      this.copyArray(that.conceptDescriptions)
+    );
+  }
+
+  transformEmbeddedDataSpecification(
+    that: AasTypes.EmbeddedDataSpecification
+  ): AasTypes.Class {
+    return new AasTypes.EmbeddedDataSpecification(
+      this.copyOf(that.dataSpecification),
+      this.copyOf(that.dataSpecificationContent)
+    );
+  }
+
+  transformValueReferencePair(that: AasTypes.ValueReferencePair): AasTypes.Class {
+    return new AasTypes.ValueReferencePair(that.value, this.copyOf(that.valueId));
+  }
+
+  transformValueList(that: AasTypes.ValueList): AasTypes.Class {
+    return new AasTypes.ValueList(this.copyArray(that.valueReferencePairs));
+  }
+
+  transformDataSpecificationIec61360(
+    that: AasTypes.DataSpecificationIec61360
+  ): AasTypes.Class {
+    return new AasTypes.DataSpecificationIec61360(
+      this.copyArray(that.preferredName),
+      this.copyArray(that.shortName),
+      that.unit,
+      this.copyOptional(that.unitId),
+      that.sourceOfDefinition,
+      that.symbol,
+      that.dataType,
+      this.copyArray(that.definition),
+      that.valueFormat,
+      this.copyOptional(that.valueList),
+      that.value,
+      that.levelType
+    );
+  }
+
+  transformDataSpecificationPhysicalUnit(
+    that: AasTypes.DataSpecificationPhysicalUnit
+  ): AasTypes.Class {
+    return new AasTypes.DataSpecificationPhysicalUnit(
+      that.unitName,
+      that.unitSymbol,
+      this.copyArray(that.definition),
+      that.siNotation,
+      that.siName,
+      that.dinNotation,
+      that.eceName,
+      that.eceCode,
+      that.nistName,
+      that.sourceOfDefinition,
+      that.conversionFactor,
+      that.registrationAuthorityId,
+      that.supplier
+    );
+  }
+}
+
+/**
+ * Copy the instances without the instances they hold.
+ *
+ * @remarks
+ * The lists are copied so that the copy can add and remove the items without
+ * affecting the original, but the items themselves are shared.
+ */
+class ShallowCopier extends AasTypes.AbstractTransformer<AasTypes.Class> {
+  /**
+   * Copy the list of the `items`, if any, but share the items.
+   */
+  copyArray<ClassT extends AasTypes.Class>(
+    items: Array<ClassT> | null
+  ): Array<ClassT> | null {
+    return items !== null ? items.slice() : null;
+  }
+
+  transformExtension(that: AasTypes.Extension): AasTypes.Class {
+    return new AasTypes.Extension(
+      that.name,
+      that.semanticId,
+      this.copyArray(that.supplementalSemanticIds),
+      that.valueType,
+      that.value,
+      that.refersTo
+    );
+  }
+
+  transformAdministrativeInformation(
+    that: AasTypes.AdministrativeInformation
+  ): AasTypes.Class {
+    return new AasTypes.AdministrativeInformation(
+      this.copyArray(that.embeddedDataSpecifications),
+      that.version,
+      that.revision
+    );
+  }
+
+  transformQualifier(that: AasTypes.Qualifier): AasTypes.Class {
+    return new AasTypes.Qualifier(
+      that.type,
+      that.valueType,
+      that.semanticId,
+      this.copyArray(that.supplementalSemanticIds),
+      that.kind,
+      that.value,
+      that.valueId
+    );
+  }
+
+  transformAssetAdministrationShell(
+    that: AasTypes.AssetAdministrationShell
+  ): AasTypes.Class {
+    return new AasTypes.AssetAdministrationShell(
+      that.id,
+      that.assetInformation,
+      this.copyArray(that.extensions),
+      that.category,
+      that.idShort,
+      this.copyArray(that.displayName),
+      this.copyArray(that.description),
+      that.checksum,
+      that.administration,
+      this.copyArray(that.embeddedDataSpecifications),
+      that.derivedFrom,
+      this.copyArray(that.submodels)
+    );
+  }
+
+  transformAssetInformation(that: AasTypes.AssetInformation): AasTypes.Class {
+    return new AasTypes.AssetInformation(
+      that.assetKind,
+      that.globalAssetId,
+      this.copyArray(that.specificAssetIds),
+      that.defaultThumbnail
+    );
+  }
+
+  transformResource(that: AasTypes.Resource): AasTypes.Class {
+    return new AasTypes.Resource(that.path, that.contentType);
+  }
+
+  transformSpecificAssetId(that: AasTypes.SpecificAssetId): AasTypes.Class {
+    return new AasTypes.SpecificAssetId(
+      that.name,
+      that.value,
+      that.externalSubjectId,
+      that.semanticId,
+      this.copyArray(that.supplementalSemanticIds)
+    );
+  }
+
+  transformSubmodel(that: AasTypes.Submodel): AasTypes.Class {
+    return new AasTypes.Submodel(
+      that.id,
+      this.copyArray(that.extensions),
+      that.category,
+      that.idShort,
+      this.copyArray(that.displayName),
+      this.copyArray(that.description),
+      that.checksum,
+      that.administration,
+      that.kind,
+      that.semanticId,
+      this.copyArray(that.supplementalSemanticIds),
+      this.copyArray(that.qualifiers),
+      this.copyArray(that.embeddedDataSpecifications),
+      this.copyArray(that.submodelElements)
+    );
+  }
+
+  transformRelationshipElement(that: AasTypes.RelationshipElement): AasTypes.Class {
+    return new AasTypes.RelationshipElement(
+      that.first,
+      that.second,
+      this.copyArray(that.extensions),
+      that.category,
+      that.idShort,
+      this.copyArray(that.displayName),
+      this.copyArray(that.description),
+      that.checksum,
+      that.kind,
+      that.semanticId,
+      this.copyArray(that.supplementalSemanticIds),
+      this.copyArray(that.qualifiers),
+      this.copyArray(that.embeddedDataSpecifications)
+    );
+  }
+
+  transformSubmodelElementList(that: AasTypes.SubmodelElementList): AasTypes.Class {
+    return new AasTypes.SubmodelElementList(
+      that.typeValueListElement,
+      this.copyArray(that.extensions),
+      that.category,
+      that.idShort,
+      this.copyArray(that.displayName),
+      this.copyArray(that.description),
+      that.checksum,
+      that.kind,
+      that.semanticId,
+      this.copyArray(that.supplementalSemanticIds),
+      this.copyArray(that.qualifiers),
+      this.copyArray(that.embeddedDataSpecifications),
+      that.orderRelevant,
+      this.copyArray(that.value),
+      that.semanticIdListElement,
+      that.valueTypeListElement
+    );
+  }
+
+  transformSubmodelElementCollection(
+    that: AasTypes.SubmodelElementCollection
+  ): AasTypes.Class {
+    return new AasTypes.SubmodelElementCollection(
+      this.copyArray(that.extensions),
+      that.category,
+      that.idShort,
+      this.copyArray(that.displayName),
+      this.copyArray(that.description),
+      that.checksum,
+      that.kind,
+      that.semanticId,
+      this.copyArray(that.supplementalSemanticIds),
+      this.copyArray(that.qualifiers),
+      this.copyArray(that.embeddedDataSpecifications),
+      this.copyArray(that.value)
+    );
+  }
+
+  transformProperty(that: AasTypes.Property): AasTypes.Class {
+    return new AasTypes.Property(
+      that.valueType,
+      this.copyArray(that.extensions),
+      that.category,
+      that.idShort,
+      this.copyArray(that.displayName),
+      this.copyArray(that.description),
+      that.checksum,
+      that.kind,
+      that.semanticId,
+      this.copyArray(that.supplementalSemanticIds),
+      this.copyArray(that.qualifiers),
+      this.copyArray(that.embeddedDataSpecifications),
+      that.value,
+      that.valueId
+    );
+  }
+
+  transformMultiLanguageProperty(that: AasTypes.MultiLanguageProperty): AasTypes.Class {
+    return new AasTypes.MultiLanguageProperty(
+      this.copyArray(that.extensions),
+      that.category,
+      that.idShort,
+      this.copyArray(that.displayName),
+      this.copyArray(that.description),
+      that.checksum,
+      that.kind,
+      that.semanticId,
+      this.copyArray(that.supplementalSemanticIds),
+      this.copyArray(that.qualifiers),
+      this.copyArray(that.embeddedDataSpecifications),
+      this.copyArray(that.value),
+      that.valueId
+    );
+  }
+
+  transformRange(that: AasTypes.Range): AasTypes.Class {
+    return new AasTypes.Range(
+      that.valueType,
+      this.copyArray(that.extensions),
+      that.category,
+      that.idShort,
+      this.copyArray(that.displayName),
+      this.copyArray(that.description),
+      that.checksum,
+      that.kind,
+      that.semanticId,
+      this.copyArray(that.supplementalSemanticIds),
+      this.copyArray(that.qualifiers),
+      this.copyArray(that.embeddedDataSpecifications),
+      that.min,
+      that.max
+    );
+  }
+
+  transformReferenceElement(that: AasTypes.ReferenceElement): AasTypes.Class {
+    return new AasTypes.ReferenceElement(
+      this.copyArray(that.extensions),
+      that.category,
+      that.idShort,
+      this.copyArray(that.displayName),
+      this.copyArray(that.description),
+      that.checksum,
+      that.kind,
+      that.semanticId,
+      this.copyArray(that.supplementalSemanticIds),
+      this.copyArray(that.qualifiers),
+      this.copyArray(that.embeddedDataSpecifications),
+      that.value
+    );
+  }
+
+  transformBlob(that: AasTypes.Blob): AasTypes.Class {
+    return new AasTypes.Blob(
+      that.contentType,
+      this.copyArray(that.extensions),
+      that.category,
+      that.idShort,
+      this.copyArray(that.displayName),
+      this.copyArray(that.description),
+      that.checksum,
+      that.kind,
+      that.semanticId,
+      this.copyArray(that.supplementalSemanticIds),
+      this.copyArray(that.qualifiers),
+      this.copyArray(that.embeddedDataSpecifications),
+      that.value
+    );
+  }
+
+  transformFile(that: AasTypes.File): AasTypes.Class {
+    return new AasTypes.File(
+      that.contentType,
+      this.copyArray(that.extensions),
+      that.category,
+      that.idShort,
+      this.copyArray(that.displayName),
+      this.copyArray(that.description),
+      that.checksum,
+      that.kind,
+      that.semanticId,
+      this.copyArray(that.supplementalSemanticIds),
+      this.copyArray(that.qualifiers),
+      this.copyArray(that.embeddedDataSpecifications),
+      that.value
+    );
+  }
+
+  transformAnnotatedRelationshipElement(
+    that: AasTypes.AnnotatedRelationshipElement
+  ): AasTypes.Class {
+    return new AasTypes.AnnotatedRelationshipElement(
+      that.first,
+      that.second,
+      this.copyArray(that.extensions),
+      that.category,
+      that.idShort,
+      this.copyArray(that.displayName),
+      this.copyArray(that.description),
+      that.checksum,
+      that.kind,
+      that.semanticId,
+      this.copyArray(that.supplementalSemanticIds),
+      this.copyArray(that.qualifiers),
+      this.copyArray(that.embeddedDataSpecifications),
+      this.copyArray(that.annotations)
+    );
+  }
+
+  transformEntity(that: AasTypes.Entity): AasTypes.Class {
+    return new AasTypes.Entity(
+      that.entityType,
+      this.copyArray(that.extensions),
+      that.category,
+      that.idShort,
+      this.copyArray(that.displayName),
+      this.copyArray(that.description),
+      that.checksum,
+      that.kind,
+      that.semanticId,
+      this.copyArray(that.supplementalSemanticIds),
+      this.copyArray(that.qualifiers),
+      this.copyArray(that.embeddedDataSpecifications),
+      this.copyArray(that.statements),
+      that.globalAssetId,
+      that.specificAssetId
+    );
+  }
+
+  transformEventPayload(that: AasTypes.EventPayload): AasTypes.Class {
+    return new AasTypes.EventPayload(
+      that.source,
+      that.observableReference,
+      that.timeStamp,
+      that.sourceSemanticId,
+      that.observableSemanticId,
+      that.topic,
+      that.subjectId,
+      that.payload
+    );
+  }
+
+  transformBasicEventElement(that: AasTypes.BasicEventElement): AasTypes.Class {
+    return new AasTypes.BasicEventElement(
+      that.observed,
+      that.direction,
+      that.state,
+      this.copyArray(that.extensions),
+      that.category,
+      that.idShort,
+      this.copyArray(that.displayName),
+      this.copyArray(that.description),
+      that.checksum,
+      that.kind,
+      that.semanticId,
+      this.copyArray(that.supplementalSemanticIds),
+      this.copyArray(that.qualifiers),
+      this.copyArray(that.embeddedDataSpecifications),
+      that.messageTopic,
+      that.messageBroker,
+      that.lastUpdate,
+      that.minInterval,
+      that.maxInterval
+    );
+  }
+
+  transformOperation(that: AasTypes.Operation): AasTypes.Class {
+    return new AasTypes.Operation(
+      this.copyArray(that.extensions),
+      that.category,
+      that.idShort,
+      this.copyArray(that.displayName),
+      this.copyArray(that.description),
+      that.checksum,
+      that.kind,
+      that.semanticId,
+      this.copyArray(that.supplementalSemanticIds),
+      this.copyArray(that.qualifiers),
+      this.copyArray(that.embeddedDataSpecifications),
+      this.copyArray(that.inputVariables),
+      this.copyArray(that.outputVariables),
+      this.copyArray(that.inoutputVariables)
+    );
+  }
+
+  transformOperationVariable(that: AasTypes.OperationVariable): AasTypes.Class {
+    return new AasTypes.OperationVariable(that.value);
+  }
+
+  transformCapability(that: AasTypes.Capability): AasTypes.Class {
+    return new AasTypes.Capability(
+      this.copyArray(that.extensions),
+      that.category,
+      that.idShort,
+      this.copyArray(that.displayName),
+      this.copyArray(that.description),
+      that.checksum,
+      that.kind,
+      that.semanticId,
+      this.copyArray(that.supplementalSemanticIds),
+      this.copyArray(that.qualifiers),
+      this.copyArray(that.embeddedDataSpecifications)
+    );
+  }
+
+  transformConceptDescription(that: AasTypes.ConceptDescription): AasTypes.Class {
+    return new AasTypes.ConceptDescription(
+      that.id,
+      this.copyArray(that.extensions),
+      that.category,
+      that.idShort,
+      this.copyArray(that.displayName),
+      this.copyArray(that.description),
+      that.checksum,
+      that.administration,
+      this.copyArray(that.embeddedDataSpecifications),
+      this.copyArray(that.isCaseOf)
+    );
+  }
+
+  transformReference(that: AasTypes.Reference): AasTypes.Class {
+    return new AasTypes.Reference(
+      that.type,
+      this.copyArray(that.keys),
+      that.referredSemanticId
+    );
+  }
+
+  transformKey(that: AasTypes.Key): AasTypes.Class {
+    return new AasTypes.Key(that.type, that.value);
+  }
+
+  transformLangString(that: AasTypes.LangString): AasTypes.Class {
+    return new AasTypes.LangString(that.language, that.text);
+  }
+
+  transformEnvironment(that: AasTypes.Environment): AasTypes.Class {
+    return new AasTypes.Environment(
+      this.copyArray(that.assetAdministrationShells),
+      this.copyArray(that.submodels),
+      this.copyArray(that.conceptDescriptions)
+    );
+  }
+
+  transformEmbeddedDataSpecification(
+    that: AasTypes.EmbeddedDataSpecification
+  ): AasTypes.Class {
+    return new AasTypes.EmbeddedDataSpecification(
+      that.dataSpecification,
+      that.dataSpecificationContent
+    );
+  }
+
+  transformValueReferencePair(that: AasTypes.ValueReferencePair): AasTypes.Class {
+    return new AasTypes.ValueReferencePair(that.value, that.valueId);
+  }
+
+  transformValueList(that: AasTypes.ValueList): AasTypes.Class {
+    return new AasTypes.ValueList(this.copyArray(that.valueReferencePairs));
+  }
+
+  transformDataSpecificationIec61360(
+    that: AasTypes.DataSpecificationIec61360
+  ): AasTypes.Class {
+    return new AasTypes.DataSpecificationIec61360(
+      this.copyArray(that.preferredName),
+      this.copyArray(that.shortName),
+      that.unit,
+      that.unitId,
+      that.sourceOfDefinition,
+      that.symbol,
+      that.dataType,
+      this.copyArray(that.definition),
+      that.valueFormat,
+      that.valueList,
+      that.value,
+      that.levelType
+    );
+  }
+
+  transformDataSpecificationPhysicalUnit(
+    that: AasTypes.DataSpecificationPhysicalUnit
+  ): AasTypes.Class {
+    return new AasTypes.DataSpecificationPhysicalUnit(
+      that.unitName,
+      that.unitSymbol,
+      this.copyArray(that.definition),
+      that.siNotation,
+      that.siName,
+      that.dinNotation,
+      that.eceName,
+      that.eceCode,
+      that.nistName,
+      that.sourceOfDefinition,
+      that.conversionFactor,
+      that.registrationAuthorityId,
+      that.supplier
+    );
+  }
+}
+
+const COPIER = /*@__PURE__*/ new Copier();
+
+/**
+ * Copy `that` instance deeply.
+ *
+ * @param that - instance to be copied
+ * @param options - to control the copying, if any
+ * @returns the copy
+ */
+export function deepCopy<ClassT extends AasTypes.Class>(
+  that: ClassT,
+  options: CopyOptions | null = null
+): ClassT {
+  if (options === null) {
+    return COPIER.copyOf(that);
+  }
+
+  return new Copier(options).copyOf(that);
+}
+
+const SHALLOW_COPIER = /*@__PURE__*/ new ShallowCopier();
+
+/**
+ * Copy `that` instance without copying the instances it holds.
+ *
+ * @remarks
+ * The lists of `that` instance are copied as well, but their items are shared
+ * with the original. Hence you can set the properties of the copy and add or
+ * remove the items of its lists without affecting the original, but you must not
+ * modify the shared items in place.
+ *
+ * @param that - instance to be copied
+ * @returns the copy
+ */
+export function shallowCopy<ClassT extends AasTypes.Class>(that: ClassT): ClassT {
+  return <ClassT>SHALLOW_COPIER.transform(that);
+}
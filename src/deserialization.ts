@@ -0,0 +1,12387 @@
+/**
+ * De-serialize AAS classes from JSON with options.
+ *
+ * @remarks
+ * The functions mirror the ones in the module `jsonization` and give the same
+ * results when no options are given. In addition, they accept
+ * {@link DeserializationOptions} to decode the blob values and the submodel
+ * elements lazily, to skip the properties which are not needed, to intern
+ * the repeated instances and to observe the de-serialized instances.
+ *
+ * The JSON objects are decoded with a single switch over their properties,
+ * which is considerably faster than the generic decoders of the module
+ * `jsonization`.
+ *
+ * The module `jsonization` is generated from the meta-model, so we write this
+ * module by hand on top of it and re-use its types.
+ */
+
+import * as AasCommon from "./common";
+import * as AasJsonization from "./jsonization";
+import * as AasTypes from "./types";
+
+/**
+ * Select the properties to be de-serialized for each concrete class.
+ *
+ * @remarks
+ * The keys are the names of the concrete classes, *e.g.*, `Submodel` or
+ * `Reference`. The values are the names of the JSON properties to be
+ * de-serialized. The instances of the classes which are not listed are
+ * de-serialized in full.
+ *
+ * The required properties are always de-serialized, as the instances can not be
+ * constructed without them.
+ *
+ * @example
+ * ```ts
+ * const projection: Projection = {
+ *   Submodel: ["id", "idShort", "semanticId"]
+ * };
+ * ```
+ */
+export type Projection = { readonly [className: string]: ReadonlyArray<string> };
+
+/**
+ * Control how the JSON de-serialization is performed.
+ *
+ * @remarks
+ * All the options are optional. If an option is not specified, the
+ * de-serialization behaves as if no options were given at all.
+ */
+export interface DeserializationOptions {
+  /**
+   * If set, the base64-encoded values of {@link types!Blob.value} are only
+   * validated, but not decoded during the de-serialization. They are decoded
+   * on the first access instead.
+   *
+   * @remarks
+   * As long as you do not access the value, the serialization reuses
+   * the original base64-encoded text.
+   */
+  readonly lazyBlobValues?: boolean;
+
+  /**
+   * If set, {@link types!Submodel.submodelElements} are kept as JSON during
+   * the de-serialization, and de-serialized on the first access instead.
+   *
+   * @remarks
+   * If the kept JSON turns out to be invalid, the first access throws
+   * a {@link MaterializationError}.
+   */
+  readonly lazySubmodelElements?: boolean;
+
+  /**
+   * If set, only the selected properties are de-serialized, and the other
+   * properties are skipped without being decoded.
+   *
+   * @remarks
+   * The skipped properties are left unset, *i.e.*, `null`.
+   */
+  readonly projection?: Projection;
+
+  /**
+   * If set, the structurally equal instances of {@link types!Reference},
+   * {@link types!Key} and {@link types!LangString} are de-serialized as one
+   * shared instance from the pool.
+   *
+   * @remarks
+   * See {@link InterningPool} for what the sharing means for the later changes.
+   */
+  readonly interning?: InterningPool;
+
+  /**
+   * If set, called on each instance right after it has been de-serialized
+   *
+   * @remarks
+   * The children are reported before their parents. Once the parent has been
+   * reported, its children are not going to change anymore. See
+   * {@link verification!ConstructionVerifier} for a use case.
+   *
+   * If the de-serialization fails, the instances reported so far are discarded.
+   *
+   * The instances of {@link types!Submodel.submodelElements} deferred with
+   * {@link lazySubmodelElements} are reported on the first access.
+   */
+  readonly onInstance?: (instance: AasTypes.Class) => void;
+}
+
+/**
+ * Signal that a part of the model kept as JSON could not be de-serialized on
+ * the first access.
+ *
+ * @remarks
+ * See {@link DeserializationOptions.lazySubmodelElements}.
+ */
+export class MaterializationError extends Error {
+  /**
+   * Error of the de-serialization, with the path from the JSON value which
+   * the de-serialization started at
+   */
+  readonly error: AasJsonization.DeserializationError;
+
+  constructor(error: AasJsonization.DeserializationError) {
+    super(`${error.path}: ${error.message}`);
+    this.error = error;
+  }
+}
+
+/**
+ * Pool the structurally equal instances of {@link types!Reference},
+ * {@link types!Key} and {@link types!LangString} so that they are de-serialized
+ * only once.
+ *
+ * @remarks
+ * The same semantic IDs, keys and descriptions tend to repeat thousands of times
+ * in an environment. With a pool, all the repetitions are de-serialized as
+ * one and the same instance, which saves memory.
+ *
+ * Pass a new pool to each de-serialization to share the instances only within
+ * its result, or the same pool to several de-serializations to share
+ * the instances among their results as well. The pool keeps the instances alive
+ * as long as the pool itself is alive.
+ *
+ * The shared instances are aliased. If you modify such an instance in place,
+ * the change shows up everywhere the instance is used. Replace the instances
+ * as a whole instead, or copy the model with {@link copying!deepCopy} before
+ * you modify it.
+ */
+export class InterningPool {
+  /**
+   * Pooled language codes
+   */
+  private readonly languages = new Map<string, string>();
+
+  /**
+   * Pooled keys by their type and value
+   */
+  private readonly keys = new Map<string, AasTypes.Key>();
+
+  /**
+   * Pooled language strings by their language and text
+   */
+  private readonly langStrings = new Map<string, AasTypes.LangString>();
+
+  /**
+   * Pooled references by their type and the serial numbers of their parts
+   */
+  private readonly references = new Map<string, AasTypes.Reference>();
+
+  /**
+   * Serial numbers of the pooled keys and references
+   */
+  private readonly serials = new Map<AasTypes.Class, number>();
+
+  /**
+   * Number of the instances de-serialized so far which have been replaced by
+   * a pooled instance
+   */
+  private _hits = 0;
+
+  /**
+   * Number of the instances de-serialized so far which have been replaced by
+   * a pooled instance
+   */
+  get hits(): number {
+    return this._hits;
+  }
+
+  /**
+   * Number of the distinct instances in the pool
+   */
+  get size(): number {
+    return this.keys.size + this.langStrings.size + this.references.size;
+  }
+
+  /**
+   * Get the serial number of the pooled `that` instance.
+   */
+  private serialOf(that: AasTypes.Class): number {
+    let serial = this.serials.get(that);
+    if (serial === undefined) {
+      serial = this.serials.size;
+      this.serials.set(that, serial);
+    }
+    return serial;
+  }
+
+  /**
+   * Get the pooled key structurally equal to `that` key, or pool `that` key.
+   */
+  internKey(that: AasTypes.Key): AasTypes.Key {
+    const poolKey = `${that.type}:${that.value}`;
+
+    const pooled = this.keys.get(poolKey);
+    if (pooled !== undefined) {
+      if (pooled !== that) {
+        this._hits++;
+      }
+      return pooled;
+    }
+
+    this.keys.set(poolKey, that);
+    return that;
+  }
+
+  /**
+   * Get the pooled language string structurally equal to `that` language
+   * string, or pool `that` language string.
+   */
+  internLangString(that: AasTypes.LangString): AasTypes.LangString {
+    // We prefix the length of the language to keep the key unambiguous.
+    const poolKey = `${that.language.length}:${that.language}${that.text}`;
+
+    const pooled = this.langStrings.get(poolKey);
+    if (pooled !== undefined) {
+      if (pooled !== that) {
+        this._hits++;
+      }
+      return pooled;
+    }
+
+    // Different texts in the same language can still share the language code.
+    const language = this.languages.get(that.language);
+    if (language !== undefined) {
+      that.language = language;
+    } else {
+      this.languages.set(that.language, that.language);
+    }
+
+    this.langStrings.set(poolKey, that);
+    return that;
+  }
+
+  /**
+   * Get the pooled reference structurally equal to `that` reference, or pool
+   * `that` reference.
+   *
+   * @remarks
+   * The keys and the referred semantic ID of `that` reference are pooled
+   * as well.
+   */
+  internReference(that: AasTypes.Reference): AasTypes.Reference {
+    const parts = new Array<number>(that.keys.length + 1);
+    for (let i = 0; i < that.keys.length; i++) {
+      const key = this.internKey(that.keys[i]);
+      that.keys[i] = key;
+      parts[i] = this.serialOf(key);
+    }
+
+    if (that.referredSemanticId !== null) {
+      that.referredSemanticId = this.internReference(that.referredSemanticId);
+      parts[that.keys.length] = this.serialOf(that.referredSemanticId);
+    } else {
+      parts[that.keys.length] = -1;
+    }
+
+    const poolKey = `${that.type}:${parts.join(",")}`;
+
+    const pooled = this.references.get(poolKey);
+    if (pooled !== undefined) {
+      if (pooled !== that) {
+        this._hits++;
+      }
+      return pooled;
+    }
+
+    this.references.set(poolKey, that);
+    return that;
+  }
+}
+
+/**
+ * List the required properties of the concrete classes, which are
+ * de-serialized regardless of the projection.
+ */
+const REQUIRED_PROPERTIES = /*@__PURE__*/ new Map<string, Array<string>>([
+  ["Extension", ["name"]],
+  ["AdministrativeInformation", []],
+  ["Qualifier", ["type", "valueType"]],
+  ["AssetAdministrationShell", ["id", "assetInformation"]],
+  ["AssetInformation", ["assetKind"]],
+  ["Resource", ["path"]],
+  ["SpecificAssetId", ["name", "value", "externalSubjectId"]],
+  ["Submodel", ["id"]],
+  ["RelationshipElement", ["first", "second"]],
+  ["SubmodelElementList", ["typeValueListElement"]],
+  ["SubmodelElementCollection", []],
+  ["Property", ["valueType"]],
+  ["MultiLanguageProperty", []],
+  ["Range", ["valueType"]],
+  ["ReferenceElement", []],
+  ["Blob", ["contentType"]],
+  ["File", ["contentType"]],
+  ["AnnotatedRelationshipElement", ["first", "second"]],
+  ["Entity", ["entityType"]],
+  ["EventPayload", ["source", "observableReference", "timeStamp"]],
+  ["BasicEventElement", ["observed", "direction", "state"]],
+  ["Operation", []],
+  ["OperationVariable", ["value"]],
+  ["Capability", []],
+  ["ConceptDescription", ["id"]],
+  ["Reference", ["type", "keys"]],
+  ["Key", ["type", "value"]],
+  ["LangString", ["language", "text"]],
+  ["Environment", []],
+  ["EmbeddedDataSpecification", ["dataSpecification", "dataSpecificationContent"]],
+  ["ValueReferencePair", ["value", "valueId"]],
+  ["ValueList", ["valueReferencePairs"]],
+  ["DataSpecificationIec61360", ["preferredName"]],
+  ["DataSpecificationPhysicalUnit", ["unitName", "unitSymbol", "definition"]]
+]);
+
+/**
+ * Map the projections to the properties to be de-serialized, per class.
+ *
+ * @remarks
+ * We compute the properties of a class once per projection, and use
+ * a weak map so that we do not keep the projections alive.
+ */
+const PROJECTED_PROPERTIES = /*@__PURE__*/ new WeakMap<
+  Projection,
+  Map<string, Set<string> | null>
+>();
+
+/**
+ * Determine which properties of the class `className` are to be
+ * de-serialized.
+ *
+ * @param options - of the de-serialization
+ * @param className - name of the concrete class
+ * @returns names of the JSON properties, or `null` if all the properties are
+ * to be de-serialized
+ */
+function projectedProperties(
+  options: DeserializationOptions | null,
+  className: string
+): Set<string> | null {
+  if (options === null || options.projection === undefined) {
+    return null;
+  }
+  const projection = options.projection;
+
+  let perClass = PROJECTED_PROPERTIES.get(projection);
+  if (perClass === undefined) {
+    perClass = new Map<string, Set<string> | null>();
+    PROJECTED_PROPERTIES.set(projection, perClass);
+  }
+
+  let properties = perClass.get(className);
+  if (properties === undefined) {
+    const selected = projection[className];
+    if (selected === undefined) {
+      properties = null;
+    } else {
+      properties = new Set<string>(selected);
+      for (const name of REQUIRED_PROPERTIES.get(className) ?? []) {
+        properties.add(name);
+      }
+    }
+    perClass.set(className, properties);
+  }
+
+  return properties;
+}
+
+/**
+ * Create an error as {@link common.Either}.
+ *
+ * @param message - human-readable explanation of the error
+ * @returns An {@link common.Either } with the error set
+ * @typeParam T - type of the value if there had been no error
+ */
+function newDeserializationError<T>(
+  message: string
+): AasCommon.Either<T, AasJsonization.DeserializationError> {
+  return new AasCommon.Either<T, AasJsonization.DeserializationError>(
+    null,
+    new AasJsonization.DeserializationError(message)
+  );
+}
+
+/**
+ * Wrap the de-serialized `instance` as {@link common.Either}, and report it to
+ * {@link DeserializationOptions.onInstance}, if set.
+ *
+ * @param instance - de-serialized instance
+ * @param options - of the de-serialization, if any
+ * @returns An {@link common.Either } with the value set
+ * @typeParam T - type of the instance
+ */
+function newDeserialized<T extends AasTypes.Class>(
+  instance: T,
+  options: DeserializationOptions | null
+): AasCommon.Either<T, AasJsonization.DeserializationError> {
+  if (options !== null && options.onInstance !== undefined) {
+    options.onInstance(instance);
+  }
+
+  return new AasCommon.Either<T, AasJsonization.DeserializationError>(instance, null);
+}
+
+/**
+ * Parse `jsonable` as a boolean.
+ *
+ * @param jsonable - to be parsed
+ * @returns parsed boolean value, or an error
+ */
+function booleanFromJsonable(
+  jsonable: AasJsonization.JsonValue
+): AasCommon.Either<boolean, AasJsonization.DeserializationError> {
+  // `typeof` seems to be optimized these days, so we use it instead of
+  // literal comparison, see:
+  // https://stackoverflow.com/questions/61786250/is-typeof-faster-than-literal-comparison
+
+  if (jsonable === null) {
+    return newDeserializationError<boolean>("Expected a boolean, but got null");
+  }
+  if (typeof jsonable !== "boolean") {
+    return newDeserializationError<boolean>(
+      `Expected a boolean, but got ${typeof jsonable}`
+    );
+  }
+
+  return new AasCommon.Either<boolean, AasJsonization.DeserializationError>(
+    jsonable,
+    null
+  );
+}
+
+/**
+ * Parse `jsonable` as an integer.
+ *
+ * @param jsonable - to be parsed
+ * @returns parsed integer value, or an error
+ */
+// eslint-disable-next-line @typescript-eslint/no-unused-vars
+function integerFromJsonable(
+  jsonable: AasJsonization.JsonValue
+): AasCommon.Either<number, AasJsonization.DeserializationError> {
+  if (jsonable === null) {
+    return newDeserializationError<number>("Expected an integer number, but got null");
+  }
+  if (typeof jsonable !== "number") {
+    return newDeserializationError<number>(
+      `Expected an integer number, but got: ${typeof jsonable}`
+    );
+  }
+
+  if (!Number.isInteger(jsonable)) {
+    return newDeserializationError<number>(
+      `Expected an integer number, but got: ${jsonable}`
+    );
+  }
+
+  return new AasCommon.Either<number, AasJsonization.DeserializationError>(
+    jsonable,
+    null
+  );
+}
+
+/**
+ * Parse `jsonable` as a number.
+ *
+ * @param jsonable - to be parsed
+ * @returns parsed numeric value, or an error
+ */
+// eslint-disable-next-line @typescript-eslint/no-unused-vars
+function numberFromJsonable(
+  jsonable: AasJsonization.JsonValue
+): AasCommon.Either<number, AasJsonization.DeserializationError> {
+  if (jsonable === null) {
+    return newDeserializationError<number>("Expected a number, but got null");
+  }
+  if (typeof jsonable !== "number") {
+    return newDeserializationError<number>(
+      `Expected a number, but got: ${typeof jsonable}`
+    );
+  }
+
+  return new AasCommon.Either<number, AasJsonization.DeserializationError>(
+    jsonable,
+    null
+  );
+}
+
+/**
+ * Parse `jsonable` as a string.
+ *
+ * @param jsonable - to be parsed
+ * @returns parsed string value, or an error
+ */
+function stringFromJsonable(
+  jsonable: AasJsonization.JsonValue
+): AasCommon.Either<string, AasJsonization.DeserializationError> {
+  if (jsonable === null) {
+    return newDeserializationError<string>("Expected a string, but got null");
+  }
+  if (typeof jsonable !== "string") {
+    return newDeserializationError<string>(
+      `Expected a string, but got: ${typeof jsonable}`
+    );
+  }
+
+  return new AasCommon.Either<string, AasJsonization.DeserializationError>(
+    jsonable,
+    null
+  );
+}
+
+/**
+ * Parse `jsonable` as a byte array.
+ *
+ * @param jsonable - to be parsed
+ * @returns parsed byte array, or an error
+ */
+function bytesFromJsonable(
+  jsonable: AasJsonization.JsonValue
+): AasCommon.Either<Uint8Array, AasJsonization.DeserializationError> {
+  if (jsonable === null) {
+    return newDeserializationError<Uint8Array>(
+      "Expected a base64-encoded string, but got null"
+    );
+  }
+  if (typeof jsonable !== "string") {
+    return newDeserializationError<Uint8Array>(
+      `Expected a base64-encoded string, but got: ${typeof jsonable}`
+    );
+  }
+
+  const either = AasCommon.base64Decode(jsonable);
+  if (either.error !== null) {
+    return newDeserializationError<Uint8Array>(either.error);
+  }
+  return new AasCommon.Either<Uint8Array, AasJsonization.DeserializationError>(
+    either.mustValue(),
+    null
+  );
+}
+
+/**
+ * Parse `jsonable` as a base64-encoded text without decoding it.
+ *
+ * @remarks
+ * The text is validated in the same way as in {@link bytesFromJsonable}, so that
+ * the lazy decoding can not fail later on.
+ *
+ * @param jsonable - to be parsed
+ * @returns the base64-encoded text, or an error
+ */
+function base64TextFromJsonable(
+  jsonable: AasJsonization.JsonValue
+): AasCommon.Either<string, AasJsonization.DeserializationError> {
+  if (jsonable === null) {
+    return newDeserializationError<string>(
+      "Expected a base64-encoded string, but got null"
+    );
+  }
+  if (typeof jsonable !== "string") {
+    return newDeserializationError<string>(
+      `Expected a base64-encoded string, but got: ${typeof jsonable}`
+    );
+  }
+
+  const error = AasCommon.base64Validate(jsonable);
+  if (error !== null) {
+    return newDeserializationError<string>(error);
+  }
+  return new AasCommon.Either<string, AasJsonization.DeserializationError>(
+    jsonable,
+    null
+  );
+}
+
+/**
+ * Map blobs, whose values have not been decoded yet, to their original
+ * base64-encoded text.
+ *
+ * @remarks
+ * We use a weak map so that we neither change the shape of {@link types!Blob}
+ * nor keep the blobs alive longer than necessary.
+ */
+const ENCODED_BLOB_VALUES = /*@__PURE__*/ new WeakMap<AasTypes.Blob, string>();
+
+/**
+ * Get the original base64-encoded text of {@link types!Blob.value} if the value
+ * has been de-serialized with {@link DeserializationOptions.lazyBlobValues}, but
+ * not decoded yet.
+ *
+ * @remarks
+ * The serialization uses the text as-is so that it neither decodes nor
+ * encodes the value again.
+ *
+ * @param blob - whose value is to be encoded
+ * @returns the original text, or `null` if there is none
+ */
+export function encodedBlobValue(blob: AasTypes.Blob): string | null {
+  return ENCODED_BLOB_VALUES.get(blob) ?? null;
+}
+
+/**
+ * Replace {@link types!Blob.value} of `blob` with an accessor which decodes
+ * `text` on first access.
+ *
+ * @remarks
+ * Once the value has been read or written, we replace the accessor with
+ * a plain property and forget the original text, since the bytes might
+ * have been changed in the meanwhile.
+ *
+ * @param blob - to be patched
+ * @param text - valid base64-encoded value of `blob`
+ */
+function deferBlobValue(blob: AasTypes.Blob, text: string): void {
+  ENCODED_BLOB_VALUES.set(blob, text);
+
+  const settle = (value: Uint8Array | null) => {
+    ENCODED_BLOB_VALUES.delete(blob);
+    Object.defineProperty(blob, "value", {
+      configurable: true,
+      enumerable: true,
+      writable: true,
+      value: value
+    });
+  };
+
+  Object.defineProperty(blob, "value", {
+    configurable: true,
+    enumerable: true,
+    get: () => {
+      const value = AasCommon.base64Decode(text).mustValue();
+      settle(value);
+      return value;
+    },
+    set: settle
+  });
+}
+
+/**
+ * Keep the JSON of {@link types!Submodel.submodelElements} until
+ * the first access.
+ */
+class DeferredSubmodelElements {
+  /**
+   * JSON object of the submodel
+   */
+  readonly container: AasJsonization.JsonObject;
+
+  /**
+   * Options of the de-serialization of the submodel
+   */
+  readonly options: DeserializationOptions | null;
+
+  /**
+   * Path from the JSON value, which the de-serialization started at,
+   * to {@link container}
+   */
+  location = new Array<AasJsonization.Segment>();
+
+  constructor(
+    container: AasJsonization.JsonObject,
+    options: DeserializationOptions | null
+  ) {
+    this.container = container;
+    this.options = options;
+  }
+}
+
+/**
+ * Map the submodels, whose elements have not been de-serialized yet, to
+ * their JSON.
+ */
+const DEFERRED_SUBMODEL_ELEMENTS = /*@__PURE__*/ new WeakMap<
+  AasTypes.Submodel,
+  DeferredSubmodelElements
+>();
+
+/**
+ * Parse the kept JSON of the submodel elements.
+ *
+ * @param deferred - kept JSON of the submodel elements
+ * @returns parsed submodel elements
+ * @throws a {@link MaterializationError} if the JSON is invalid
+ */
+function materializeSubmodelElements(
+  deferred: DeferredSubmodelElements
+): Array<AasTypes.ISubmodelElement> {
+  const key = "submodelElements";
+
+  const fail = (error: AasJsonization.DeserializationError): never => {
+    error.path.prepend(new AasJsonization.PropertySegment(deferred.container, key));
+    for (let i = deferred.location.length - 1; i >= 0; i--) {
+      error.path.prepend(deferred.location[i]);
+    }
+    throw new MaterializationError(error);
+  };
+
+  const iterableOrError = iterableFromJsonable(deferred.container[key]);
+  if (iterableOrError.error !== null) {
+    return fail(iterableOrError.error);
+  }
+  const iterable = iterableOrError.mustValue();
+
+  const items = new Array<AasTypes.ISubmodelElement>();
+
+  let i = 0;
+  for (const jsonableItem of iterable) {
+    const itemOrError = submodelElementFromJsonable(jsonableItem, deferred.options);
+    if (itemOrError.error !== null) {
+      itemOrError.error.path.prepend(new AasJsonization.IndexSegment(iterable, i));
+      return fail(itemOrError.error);
+    }
+
+    items.push(itemOrError.mustValue());
+    i++;
+  }
+
+  return items;
+}
+
+/**
+ * Replace {@link types!Submodel.submodelElements} of `submodel` with
+ * an accessor which de-serializes them from `container` on first access.
+ *
+ * @remarks
+ * Once the elements have been read or written, we replace the accessor with
+ * a plain property and forget the JSON.
+ *
+ * @param submodel - to be patched
+ * @param container - JSON object of the submodel
+ * @param options - of the de-serialization of the submodel
+ */
+function deferSubmodelElements(
+  submodel: AasTypes.Submodel,
+  container: AasJsonization.JsonObject,
+  options: DeserializationOptions | null
+): void {
+  const deferred = new DeferredSubmodelElements(container, options);
+  DEFERRED_SUBMODEL_ELEMENTS.set(submodel, deferred);
+
+  const settle = (value: Array<AasTypes.ISubmodelElement> | null) => {
+    DEFERRED_SUBMODEL_ELEMENTS.delete(submodel);
+    Object.defineProperty(submodel, "submodelElements", {
+      configurable: true,
+      enumerable: true,
+      writable: true,
+      value: value
+    });
+  };
+
+  Object.defineProperty(submodel, "submodelElements", {
+    configurable: true,
+    enumerable: true,
+    get: () => {
+      const value = materializeSubmodelElements(deferred);
+      settle(value);
+      return value;
+    },
+    set: settle
+  });
+}
+
+/**
+ * Record where the deferred elements of the `submodels` are located
+ * in the JSON of the environment.
+ *
+ * @param container - JSON object of the environment
+ * @param submodels - de-serialized from `container`
+ */
+function locateDeferredSubmodelElements(
+  container: AasJsonization.JsonObject,
+  submodels: Array<AasTypes.Submodel>
+): void {
+  const key = "submodels";
+  const jsonableSubmodels = <AasJsonization.JsonArray>container[key];
+
+  for (let i = 0; i < submodels.length; i++) {
+    const deferred = DEFERRED_SUBMODEL_ELEMENTS.get(submodels[i]);
+    if (deferred !== undefined) {
+      deferred.location = [
+        new AasJsonization.PropertySegment(container, key),
+        new AasJsonization.IndexSegment(jsonableSubmodels, i)
+      ];
+    }
+  }
+}
+
+/**
+ * Parse `jsonable` as an iterable of JSON values.
+ *
+ * @param jsonable - to be parsed
+ * @returns parsed iterable, or an error
+ */
+function iterableFromJsonable(
+  jsonable: AasJsonization.JsonValue
+): AasCommon.Either<
+  Iterable<AasJsonization.JsonValue>,
+  AasJsonization.DeserializationError
+> {
+  if (jsonable === null) {
+    return newDeserializationError<Iterable<AasJsonization.JsonValue>>(
+      "Expected an iterable, but got null"
+    );
+  }
+  if (typeof jsonable !== "object") {
+    return newDeserializationError<Iterable<AasJsonization.JsonValue>>(
+      `Expected an iterable, but got: ${typeof jsonable}`
+    );
+  }
+  if (typeof jsonable[Symbol.iterator] !== "function") {
+    return newDeserializationError<Iterable<AasJsonization.JsonValue>>(
+      "Expected an iterable with iterator function, " +
+        `but got iterator of type: ${typeof jsonable[Symbol.iterator]}`
+    );
+  }
+
+  return new AasCommon.Either<
+    Iterable<AasJsonization.JsonValue>,
+    AasJsonization.DeserializationError
+  >(
+    <Iterable<AasJsonization.JsonValue>>jsonable,
+    null
+  );
+}
+
+/**
+ * Prepend the property `key` of `container` to the path of `error`
+ * and wrap the `error` as {@link common.Either}.
+ *
+ * @remarks
+ * The object de-serializers switch directly on the property names instead of
+ * dispatching through a map of setter methods. This keeps the call sites of
+ * the nested de-serializers monomorphic, and spares us an allocation of
+ * an intermediate setter object per de-serialized instance.
+ *
+ * @param error - which occurred while parsing the property
+ * @param container - JSON object which contains the property
+ * @param key - name of the property
+ * @returns An {@link common.Either } with the error set
+ * @typeParam T - type of the value if there had been no error
+ */
+function propagatePropertyError<T>(
+  error: AasJsonization.DeserializationError,
+  container: AasJsonization.JsonObject,
+  key: string
+): AasCommon.Either<T, AasJsonization.DeserializationError> {
+  error.path.prepend(new AasJsonization.PropertySegment(container, key));
+  return new AasCommon.Either<T, AasJsonization.DeserializationError>(null, error);
+}
+
+/**
+ * Parse `jsonable` as an instance
+ * of {@link types!IHasSemantics}.
+ *
+ * @param jsonable - to be parsed
+ * @param options - to control the de-serialization, if any
+ * @returns parsed instance, or error if `jsonable` is invalid
+ */
+export function hasSemanticsFromJsonable(
+  jsonable: AasJsonization.JsonValue,
+  options: DeserializationOptions | null = null
+): AasCommon.Either<AasTypes.IHasSemantics, AasJsonization.DeserializationError> {
+  if (jsonable === null) {
+    return newDeserializationError<AasTypes.IHasSemantics>(
+      "Expected a JSON object, but got null"
+    );
+  }
+  if (Array.isArray(jsonable)) {
+    return newDeserializationError<AasTypes.IHasSemantics>(
+      "Expected a JSON object, but got a JSON array"
+    );
+  }
+  if (typeof jsonable !== "object") {
+    return newDeserializationError<AasTypes.IHasSemantics>(
+      `Expected a JSON object, but got: ${typeof jsonable}`
+    );
+  }
+
+  const modelType = jsonable["modelType"];
+  if (modelType === undefined) {
+    return newDeserializationError<AasTypes.IHasSemantics>(
+      "Expected the property modelType, but got none"
+    );
+  }
+
+  if (typeof modelType !== "string") {
+    return newDeserializationError<AasTypes.IHasSemantics>(
+      `Expected the property modelType to be a string, but got: ${typeof modelType}`
+    );
+  }
+
+  const dispatch = HAS_SEMANTICS_FROM_JSONABLE_DISPATCH.get(modelType);
+  if (dispatch === undefined) {
+    return newDeserializationError<AasTypes.IHasSemantics>(
+      `Unexpected model type for IHasSemantics: ${modelType}`
+    );
+  }
+
+  return dispatch(jsonable, options);
+}
+
+/**
+ * Parse an instance of {@link types!Extension} from the JSON-able
+ * structure `jsonable`.
+ *
+ * @param jsonable - structure to be parsed
+ * @param options - to control the de-serialization, if any
+ * @returns parsed instance of {@link types!Extension},
+ * or an error if any
+ */
+export function extensionFromJsonable(
+  jsonable: AasJsonization.JsonValue,
+  options: DeserializationOptions | null = null
+): AasCommon.Either<AasTypes.Extension, AasJsonization.DeserializationError> {
+  if (jsonable === null) {
+    return newDeserializationError<AasTypes.Extension>(
+      "Expected a JSON object, but got null"
+    );
+  }
+  if (Array.isArray(jsonable)) {
+    return newDeserializationError<AasTypes.Extension>(
+      "Expected a JSON object, but got a JSON array"
+    );
+  }
+  if (typeof jsonable !== "object") {
+    return newDeserializationError<AasTypes.Extension>(
+      `Expected a JSON object, but got: ${typeof jsonable}`
+    );
+  }
+
+  let semanticId: AasTypes.Reference | null = null;
+  let supplementalSemanticIds: Array<AasTypes.Reference> | null = null;
+  let name: string | null = null;
+  let valueType: AasTypes.DataTypeDefXsd | null = null;
+  let value: string | null = null;
+  let refersTo: AasTypes.Reference | null = null;
+
+  const projected = projectedProperties(options, "Extension");
+
+  for (const key in jsonable) {
+    if (projected !== null && !projected.has(key)) {
+      continue;
+    }
+
+    const jsonableValue = jsonable[key];
+
+    switch (key) {
+      case "semanticId": {
+        const parsedOrError = referenceFromJsonable(jsonableValue, options);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Extension>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        semanticId = parsedOrError.mustValue();
+        break;
+      }
+
+      case "supplementalSemanticIds": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Extension>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.Reference>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = referenceFromJsonable(jsonableItem, options);
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.Extension>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        supplementalSemanticIds = items;
+        break;
+      }
+
+      case "name": {
+        const parsedOrError = stringFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Extension>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        name = parsedOrError.mustValue();
+        break;
+      }
+
+      case "valueType": {
+        const parsedOrError = AasJsonization.dataTypeDefXsdFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Extension>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        valueType = parsedOrError.mustValue();
+        break;
+      }
+
+      case "value": {
+        const parsedOrError = stringFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Extension>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        value = parsedOrError.mustValue();
+        break;
+      }
+
+      case "refersTo": {
+        const parsedOrError = referenceFromJsonable(jsonableValue, options);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Extension>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        refersTo = parsedOrError.mustValue();
+        break;
+      }
+
+      default:
+        // NOTE (mristin, 2022-11-30):
+        // Since we conflate here a JavaScript object with a JSON object, we ignore
+        // properties which we do not know how to de-serialize and assume they are
+        // related to the *JavaScript* properties of the object or `Object` prototype.
+        // The property `modelType` is only relevant for the dispatch, so we skip it.
+        break;
+    }
+  }
+
+  if (name === null) {
+    return newDeserializationError<AasTypes.Extension>(
+      "The required property 'name' is missing"
+    );
+  }
+
+  return newDeserialized<AasTypes.Extension>(
+    new AasTypes.Extension(
+      name,
+      semanticId,
+      supplementalSemanticIds,
+      valueType,
+      value,
+      refersTo
+    ),
+    options
+  );
+}
+
+/**
+ * Parse `jsonable` as an instance
+ * of {@link types!IHasExtensions}.
+ *
+ * @param jsonable - to be parsed
+ * @param options - to control the de-serialization, if any
+ * @returns parsed instance, or error if `jsonable` is invalid
+ */
+export function hasExtensionsFromJsonable(
+  jsonable: AasJsonization.JsonValue,
+  options: DeserializationOptions | null = null
+): AasCommon.Either<AasTypes.IHasExtensions, AasJsonization.DeserializationError> {
+  if (jsonable === null) {
+    return newDeserializationError<AasTypes.IHasExtensions>(
+      "Expected a JSON object, but got null"
+    );
+  }
+  if (Array.isArray(jsonable)) {
+    return newDeserializationError<AasTypes.IHasExtensions>(
+      "Expected a JSON object, but got a JSON array"
+    );
+  }
+  if (typeof jsonable !== "object") {
+    return newDeserializationError<AasTypes.IHasExtensions>(
+      `Expected a JSON object, but got: ${typeof jsonable}`
+    );
+  }
+
+  const modelType = jsonable["modelType"];
+  if (modelType === undefined) {
+    return newDeserializationError<AasTypes.IHasExtensions>(
+      "Expected the property modelType, but got none"
+    );
+  }
+
+  if (typeof modelType !== "string") {
+    return newDeserializationError<AasTypes.IHasExtensions>(
+      `Expected the property modelType to be a string, but got: ${typeof modelType}`
+    );
+  }
+
+  const dispatch = HAS_EXTENSIONS_FROM_JSONABLE_DISPATCH.get(modelType);
+  if (dispatch === undefined) {
+    return newDeserializationError<AasTypes.IHasExtensions>(
+      `Unexpected model type for IHasExtensions: ${modelType}`
+    );
+  }
+
+  return dispatch(jsonable, options);
+}
+
+/**
+ * Parse `jsonable` as an instance
+ * of {@link types!IReferable}.
+ *
+ * @param jsonable - to be parsed
+ * @param options - to control the de-serialization, if any
+ * @returns parsed instance, or error if `jsonable` is invalid
+ */
+export function referableFromJsonable(
+  jsonable: AasJsonization.JsonValue,
+  options: DeserializationOptions | null = null
+): AasCommon.Either<AasTypes.IReferable, AasJsonization.DeserializationError> {
+  if (jsonable === null) {
+    return newDeserializationError<AasTypes.IReferable>(
+      "Expected a JSON object, but got null"
+    );
+  }
+  if (Array.isArray(jsonable)) {
+    return newDeserializationError<AasTypes.IReferable>(
+      "Expected a JSON object, but got a JSON array"
+    );
+  }
+  if (typeof jsonable !== "object") {
+    return newDeserializationError<AasTypes.IReferable>(
+      `Expected a JSON object, but got: ${typeof jsonable}`
+    );
+  }
+
+  const modelType = jsonable["modelType"];
+  if (modelType === undefined) {
+    return newDeserializationError<AasTypes.IReferable>(
+      "Expected the property modelType, but got none"
+    );
+  }
+
+  if (typeof modelType !== "string") {
+    return newDeserializationError<AasTypes.IReferable>(
+      `Expected the property modelType to be a string, but got: ${typeof modelType}`
+    );
+  }
+
+  const dispatch = REFERABLE_FROM_JSONABLE_DISPATCH.get(modelType);
+  if (dispatch === undefined) {
+    return newDeserializationError<AasTypes.IReferable>(
+      `Unexpected model type for IReferable: ${modelType}`
+    );
+  }
+
+  return dispatch(jsonable, options);
+}
+
+/**
+ * Parse `jsonable` as an instance
+ * of {@link types!IIdentifiable}.
+ *
+ * @param jsonable - to be parsed
+ * @param options - to control the de-serialization, if any
+ * @returns parsed instance, or error if `jsonable` is invalid
+ */
+export function identifiableFromJsonable(
+  jsonable: AasJsonization.JsonValue,
+  options: DeserializationOptions | null = null
+): AasCommon.Either<AasTypes.IIdentifiable, AasJsonization.DeserializationError> {
+  if (jsonable === null) {
+    return newDeserializationError<AasTypes.IIdentifiable>(
+      "Expected a JSON object, but got null"
+    );
+  }
+  if (Array.isArray(jsonable)) {
+    return newDeserializationError<AasTypes.IIdentifiable>(
+      "Expected a JSON object, but got a JSON array"
+    );
+  }
+  if (typeof jsonable !== "object") {
+    return newDeserializationError<AasTypes.IIdentifiable>(
+      `Expected a JSON object, but got: ${typeof jsonable}`
+    );
+  }
+
+  const modelType = jsonable["modelType"];
+  if (modelType === undefined) {
+    return newDeserializationError<AasTypes.IIdentifiable>(
+      "Expected the property modelType, but got none"
+    );
+  }
+
+  if (typeof modelType !== "string") {
+    return newDeserializationError<AasTypes.IIdentifiable>(
+      `Expected the property modelType to be a string, but got: ${typeof modelType}`
+    );
+  }
+
+  const dispatch = IDENTIFIABLE_FROM_JSONABLE_DISPATCH.get(modelType);
+  if (dispatch === undefined) {
+    return newDeserializationError<AasTypes.IIdentifiable>(
+      `Unexpected model type for IIdentifiable: ${modelType}`
+    );
+  }
+
+  return dispatch(jsonable, options);
+}
+
+/**
+ * Parse `jsonable` as an instance
+ * of {@link types!IHasKind}.
+ *
+ * @param jsonable - to be parsed
+ * @param options - to control the de-serialization, if any
+ * @returns parsed instance, or error if `jsonable` is invalid
+ */
+export function hasKindFromJsonable(
+  jsonable: AasJsonization.JsonValue,
+  options: DeserializationOptions | null = null
+): AasCommon.Either<AasTypes.IHasKind, AasJsonization.DeserializationError> {
+  if (jsonable === null) {
+    return newDeserializationError<AasTypes.IHasKind>(
+      "Expected a JSON object, but got null"
+    );
+  }
+  if (Array.isArray(jsonable)) {
+    return newDeserializationError<AasTypes.IHasKind>(
+      "Expected a JSON object, but got a JSON array"
+    );
+  }
+  if (typeof jsonable !== "object") {
+    return newDeserializationError<AasTypes.IHasKind>(
+      `Expected a JSON object, but got: ${typeof jsonable}`
+    );
+  }
+
+  const modelType = jsonable["modelType"];
+  if (modelType === undefined) {
+    return newDeserializationError<AasTypes.IHasKind>(
+      "Expected the property modelType, but got none"
+    );
+  }
+
+  if (typeof modelType !== "string") {
+    return newDeserializationError<AasTypes.IHasKind>(
+      `Expected the property modelType to be a string, but got: ${typeof modelType}`
+    );
+  }
+
+  const dispatch = HAS_KIND_FROM_JSONABLE_DISPATCH.get(modelType);
+  if (dispatch === undefined) {
+    return newDeserializationError<AasTypes.IHasKind>(
+      `Unexpected model type for IHasKind: ${modelType}`
+    );
+  }
+
+  return dispatch(jsonable, options);
+}
+
+/**
+ * Parse `jsonable` as an instance
+ * of {@link types!IHasDataSpecification}.
+ *
+ * @param jsonable - to be parsed
+ * @param options - to control the de-serialization, if any
+ * @returns parsed instance, or error if `jsonable` is invalid
+ */
+export function hasDataSpecificationFromJsonable(
+  jsonable: AasJsonization.JsonValue,
+  options: DeserializationOptions | null = null
+): AasCommon.Either<
+  AasTypes.IHasDataSpecification,
+  AasJsonization.DeserializationError
+> {
+  if (jsonable === null) {
+    return newDeserializationError<AasTypes.IHasDataSpecification>(
+      "Expected a JSON object, but got null"
+    );
+  }
+  if (Array.isArray(jsonable)) {
+    return newDeserializationError<AasTypes.IHasDataSpecification>(
+      "Expected a JSON object, but got a JSON array"
+    );
+  }
+  if (typeof jsonable !== "object") {
+    return newDeserializationError<AasTypes.IHasDataSpecification>(
+      `Expected a JSON object, but got: ${typeof jsonable}`
+    );
+  }
+
+  const modelType = jsonable["modelType"];
+  if (modelType === undefined) {
+    return newDeserializationError<AasTypes.IHasDataSpecification>(
+      "Expected the property modelType, but got none"
+    );
+  }
+
+  if (typeof modelType !== "string") {
+    return newDeserializationError<AasTypes.IHasDataSpecification>(
+      `Expected the property modelType to be a string, but got: ${typeof modelType}`
+    );
+  }
+
+  const dispatch = HAS_DATA_SPECIFICATION_FROM_JSONABLE_DISPATCH.get(modelType);
+  if (dispatch === undefined) {
+    return newDeserializationError<AasTypes.IHasDataSpecification>(
+      `Unexpected model type for IHasDataSpecification: ${modelType}`
+    );
+  }
+
+  return dispatch(jsonable, options);
+}
+
+/**
+ * Parse an instance of {@link types!AdministrativeInformation} from the JSON-able
+ * structure `jsonable`.
+ *
+ * @param jsonable - structure to be parsed
+ * @param options - to control the de-serialization, if any
+ * @returns parsed instance of {@link types!AdministrativeInformation},
+ * or an error if any
+ */
+export function administrativeInformationFromJsonable(
+  jsonable: AasJsonization.JsonValue,
+  options: DeserializationOptions | null = null
+): AasCommon.Either<
+  AasTypes.AdministrativeInformation,
+  AasJsonization.DeserializationError
+> {
+  if (jsonable === null) {
+    return newDeserializationError<AasTypes.AdministrativeInformation>(
+      "Expected a JSON object, but got null"
+    );
+  }
+  if (Array.isArray(jsonable)) {
+    return newDeserializationError<AasTypes.AdministrativeInformation>(
+      "Expected a JSON object, but got a JSON array"
+    );
+  }
+  if (typeof jsonable !== "object") {
+    return newDeserializationError<AasTypes.AdministrativeInformation>(
+      `Expected a JSON object, but got: ${typeof jsonable}`
+    );
+  }
+
+  let embeddedDataSpecifications: Array<AasTypes.EmbeddedDataSpecification> | null =
+    null;
+  let version: string | null = null;
+  let revision: string | null = null;
+
+  const projected = projectedProperties(options, "AdministrativeInformation");
+
+  for (const key in jsonable) {
+    if (projected !== null && !projected.has(key)) {
+      continue;
+    }
+
+    const jsonableValue = jsonable[key];
+
+    switch (key) {
+      case "embeddedDataSpecifications": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.AdministrativeInformation>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.EmbeddedDataSpecification>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = embeddedDataSpecificationFromJsonable(
+            jsonableItem,
+            options
+          );
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.AdministrativeInformation>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        embeddedDataSpecifications = items;
+        break;
+      }
+
+      case "version": {
+        const parsedOrError = stringFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.AdministrativeInformation>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        version = parsedOrError.mustValue();
+        break;
+      }
+
+      case "revision": {
+        const parsedOrError = stringFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.AdministrativeInformation>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        revision = parsedOrError.mustValue();
+        break;
+      }
+
+      default:
+        // NOTE (mristin, 2022-11-30):
+        // Since we conflate here a JavaScript object with a JSON object, we ignore
+        // properties which we do not know how to de-serialize and assume they are
+        // related to the *JavaScript* properties of the object or `Object` prototype.
+        // The property `modelType` is only relevant for the dispatch, so we skip it.
+        break;
+    }
+  }
+
+  return newDeserialized<AasTypes.AdministrativeInformation>(
+    new AasTypes.AdministrativeInformation(
+      embeddedDataSpecifications,
+      version,
+      revision
+    ),
+    options
+  );
+}
+
+/**
+ * Parse `jsonable` as an instance
+ * of {@link types!IQualifiable}.
+ *
+ * @param jsonable - to be parsed
+ * @param options - to control the de-serialization, if any
+ * @returns parsed instance, or error if `jsonable` is invalid
+ */
+export function qualifiableFromJsonable(
+  jsonable: AasJsonization.JsonValue,
+  options: DeserializationOptions | null = null
+): AasCommon.Either<AasTypes.IQualifiable, AasJsonization.DeserializationError> {
+  if (jsonable === null) {
+    return newDeserializationError<AasTypes.IQualifiable>(
+      "Expected a JSON object, but got null"
+    );
+  }
+  if (Array.isArray(jsonable)) {
+    return newDeserializationError<AasTypes.IQualifiable>(
+      "Expected a JSON object, but got a JSON array"
+    );
+  }
+  if (typeof jsonable !== "object") {
+    return newDeserializationError<AasTypes.IQualifiable>(
+      `Expected a JSON object, but got: ${typeof jsonable}`
+    );
+  }
+
+  const modelType = jsonable["modelType"];
+  if (modelType === undefined) {
+    return newDeserializationError<AasTypes.IQualifiable>(
+      "Expected the property modelType, but got none"
+    );
+  }
+
+  if (typeof modelType !== "string") {
+    return newDeserializationError<AasTypes.IQualifiable>(
+      `Expected the property modelType to be a string, but got: ${typeof modelType}`
+    );
+  }
+
+  const dispatch = QUALIFIABLE_FROM_JSONABLE_DISPATCH.get(modelType);
+  if (dispatch === undefined) {
+    return newDeserializationError<AasTypes.IQualifiable>(
+      `Unexpected model type for IQualifiable: ${modelType}`
+    );
+  }
+
+  return dispatch(jsonable, options);
+}
+
+/**
+ * Parse an instance of {@link types!Qualifier} from the JSON-able
+ * structure `jsonable`.
+ *
+ * @param jsonable - structure to be parsed
+ * @param options - to control the de-serialization, if any
+ * @returns parsed instance of {@link types!Qualifier},
+ * or an error if any
+ */
+export function qualifierFromJsonable(
+  jsonable: AasJsonization.JsonValue,
+  options: DeserializationOptions | null = null
+): AasCommon.Either<AasTypes.Qualifier, AasJsonization.DeserializationError> {
+  if (jsonable === null) {
+    return newDeserializationError<AasTypes.Qualifier>(
+      "Expected a JSON object, but got null"
+    );
+  }
+  if (Array.isArray(jsonable)) {
+    return newDeserializationError<AasTypes.Qualifier>(
+      "Expected a JSON object, but got a JSON array"
+    );
+  }
+  if (typeof jsonable !== "object") {
+    return newDeserializationError<AasTypes.Qualifier>(
+      `Expected a JSON object, but got: ${typeof jsonable}`
+    );
+  }
+
+  let semanticId: AasTypes.Reference | null = null;
+  let supplementalSemanticIds: Array<AasTypes.Reference> | null = null;
+  let kind: AasTypes.QualifierKind | null = null;
+  let type: string | null = null;
+  let valueType: AasTypes.DataTypeDefXsd | null = null;
+  let value: string | null = null;
+  let valueId: AasTypes.Reference | null = null;
+
+  const projected = projectedProperties(options, "Qualifier");
+
+  for (const key in jsonable) {
+    if (projected !== null && !projected.has(key)) {
+      continue;
+    }
+
+    const jsonableValue = jsonable[key];
+
+    switch (key) {
+      case "semanticId": {
+        const parsedOrError = referenceFromJsonable(jsonableValue, options);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Qualifier>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        semanticId = parsedOrError.mustValue();
+        break;
+      }
+
+      case "supplementalSemanticIds": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Qualifier>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.Reference>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = referenceFromJsonable(jsonableItem, options);
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.Qualifier>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        supplementalSemanticIds = items;
+        break;
+      }
+
+      case "kind": {
+        const parsedOrError = AasJsonization.qualifierKindFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Qualifier>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        kind = parsedOrError.mustValue();
+        break;
+      }
+
+      case "type": {
+        const parsedOrError = stringFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Qualifier>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        type = parsedOrError.mustValue();
+        break;
+      }
+
+      case "valueType": {
+        const parsedOrError = AasJsonization.dataTypeDefXsdFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Qualifier>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        valueType = parsedOrError.mustValue();
+        break;
+      }
+
+      case "value": {
+        const parsedOrError = stringFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Qualifier>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        value = parsedOrError.mustValue();
+        break;
+      }
+
+      case "valueId": {
+        const parsedOrError = referenceFromJsonable(jsonableValue, options);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Qualifier>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        valueId = parsedOrError.mustValue();
+        break;
+      }
+
+      default:
+        // NOTE (mristin, 2022-11-30):
+        // Since we conflate here a JavaScript object with a JSON object, we ignore
+        // properties which we do not know how to de-serialize and assume they are
+        // related to the *JavaScript* properties of the object or `Object` prototype.
+        // The property `modelType` is only relevant for the dispatch, so we skip it.
+        break;
+    }
+  }
+
+  if (type === null) {
+    return newDeserializationError<AasTypes.Qualifier>(
+      "The required property 'type' is missing"
+    );
+  }
+
+  if (valueType === null) {
+    return newDeserializationError<AasTypes.Qualifier>(
+      "The required property 'valueType' is missing"
+    );
+  }
+
+  return newDeserialized<AasTypes.Qualifier>(
+    new AasTypes.Qualifier(
+      type,
+      valueType,
+      semanticId,
+      supplementalSemanticIds,
+      kind,
+      value,
+      valueId
+    ),
+    options
+  );
+}
+
+/**
+ * Parse an instance of {@link types!AssetAdministrationShell} from the JSON-able
+ * structure `jsonable`.
+ *
+ * @param jsonable - structure to be parsed
+ * @param options - to control the de-serialization, if any
+ * @returns parsed instance of {@link types!AssetAdministrationShell},
+ * or an error if any
+ */
+export function assetAdministrationShellFromJsonable(
+  jsonable: AasJsonization.JsonValue,
+  options: DeserializationOptions | null = null
+): AasCommon.Either<
+  AasTypes.AssetAdministrationShell,
+  AasJsonization.DeserializationError
+> {
+  if (jsonable === null) {
+    return newDeserializationError<AasTypes.AssetAdministrationShell>(
+      "Expected a JSON object, but got null"
+    );
+  }
+  if (Array.isArray(jsonable)) {
+    return newDeserializationError<AasTypes.AssetAdministrationShell>(
+      "Expected a JSON object, but got a JSON array"
+    );
+  }
+  if (typeof jsonable !== "object") {
+    return newDeserializationError<AasTypes.AssetAdministrationShell>(
+      `Expected a JSON object, but got: ${typeof jsonable}`
+    );
+  }
+
+  let extensions: Array<AasTypes.Extension> | null = null;
+  let category: string | null = null;
+  let idShort: string | null = null;
+  let displayName: Array<AasTypes.LangString> | null = null;
+  let description: Array<AasTypes.LangString> | null = null;
+  let checksum: string | null = null;
+  let administration: AasTypes.AdministrativeInformation | null = null;
+  let id: string | null = null;
+  let embeddedDataSpecifications: Array<AasTypes.EmbeddedDataSpecification> | null =
+    null;
+  let derivedFrom: AasTypes.Reference | null = null;
+  let assetInformation: AasTypes.AssetInformation | null = null;
+  let submodels: Array<AasTypes.Reference> | null = null;
+
+  const projected = projectedProperties(options, "AssetAdministrationShell");
+
+  for (const key in jsonable) {
+    if (projected !== null && !projected.has(key)) {
+      continue;
+    }
+
+    const jsonableValue = jsonable[key];
+
+    switch (key) {
+      case "extensions": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.AssetAdministrationShell>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.Extension>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = extensionFromJsonable(jsonableItem, options);
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.AssetAdministrationShell>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        extensions = items;
+        break;
+      }
+
+      case "category": {
+        const parsedOrError = stringFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.AssetAdministrationShell>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        category = parsedOrError.mustValue();
+        break;
+      }
+
+      case "idShort": {
+        const parsedOrError = stringFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.AssetAdministrationShell>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        idShort = parsedOrError.mustValue();
+        break;
+      }
+
+      case "displayName": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.AssetAdministrationShell>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.LangString>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = langStringFromJsonable(jsonableItem, options);
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.AssetAdministrationShell>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        displayName = items;
+        break;
+      }
+
+      case "description": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.AssetAdministrationShell>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.LangString>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = langStringFromJsonable(jsonableItem, options);
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.AssetAdministrationShell>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        description = items;
+        break;
+      }
+
+      case "checksum": {
+        const parsedOrError = stringFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.AssetAdministrationShell>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        checksum = parsedOrError.mustValue();
+        break;
+      }
+
+      case "administration": {
+        const parsedOrError = administrativeInformationFromJsonable(
+          jsonableValue,
+          options
+        );
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.AssetAdministrationShell>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        administration = parsedOrError.mustValue();
+        break;
+      }
+
+      case "id": {
+        const parsedOrError = stringFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.AssetAdministrationShell>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        id = parsedOrError.mustValue();
+        break;
+      }
+
+      case "embeddedDataSpecifications": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.AssetAdministrationShell>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.EmbeddedDataSpecification>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = embeddedDataSpecificationFromJsonable(
+            jsonableItem,
+            options
+          );
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.AssetAdministrationShell>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        embeddedDataSpecifications = items;
+        break;
+      }
+
+      case "derivedFrom": {
+        const parsedOrError = referenceFromJsonable(jsonableValue, options);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.AssetAdministrationShell>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        derivedFrom = parsedOrError.mustValue();
+        break;
+      }
+
+      case "assetInformation": {
+        const parsedOrError = assetInformationFromJsonable(jsonableValue, options);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.AssetAdministrationShell>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        assetInformation = parsedOrError.mustValue();
+        break;
+      }
+
+      case "submodels": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.AssetAdministrationShell>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.Reference>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = referenceFromJsonable(jsonableItem, options);
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.AssetAdministrationShell>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        submodels = items;
+        break;
+      }
+
+      default:
+        // NOTE (mristin, 2022-11-30):
+        // Since we conflate here a JavaScript object with a JSON object, we ignore
+        // properties which we do not know how to de-serialize and assume they are
+        // related to the *JavaScript* properties of the object or `Object` prototype.
+        // The property `modelType` is only relevant for the dispatch, so we skip it.
+        break;
+    }
+  }
+
+  if (id === null) {
+    return newDeserializationError<AasTypes.AssetAdministrationShell>(
+      "The required property 'id' is missing"
+    );
+  }
+
+  if (assetInformation === null) {
+    return newDeserializationError<AasTypes.AssetAdministrationShell>(
+      "The required property 'assetInformation' is missing"
+    );
+  }
+
+  return newDeserialized<AasTypes.AssetAdministrationShell>(
+    new AasTypes.AssetAdministrationShell(
+      id,
+      assetInformation,
+      extensions,
+      category,
+      idShort,
+      displayName,
+      description,
+      checksum,
+      administration,
+      embeddedDataSpecifications,
+      derivedFrom,
+      submodels
+    ),
+    options
+  );
+}
+
+/**
+ * Parse an instance of {@link types!AssetInformation} from the JSON-able
+ * structure `jsonable`.
+ *
+ * @param jsonable - structure to be parsed
+ * @param options - to control the de-serialization, if any
+ * @returns parsed instance of {@link types!AssetInformation},
+ * or an error if any
+ */
+export function assetInformationFromJsonable(
+  jsonable: AasJsonization.JsonValue,
+  options: DeserializationOptions | null = null
+): AasCommon.Either<AasTypes.AssetInformation, AasJsonization.DeserializationError> {
+  if (jsonable === null) {
+    return newDeserializationError<AasTypes.AssetInformation>(
+      "Expected a JSON object, but got null"
+    );
+  }
+  if (Array.isArray(jsonable)) {
+    return newDeserializationError<AasTypes.AssetInformation>(
+      "Expected a JSON object, but got a JSON array"
+    );
+  }
+  if (typeof jsonable !== "object") {
+    return newDeserializationError<AasTypes.AssetInformation>(
+      `Expected a JSON object, but got: ${typeof jsonable}`
+    );
+  }
+
+  let assetKind: AasTypes.AssetKind | null = null;
+  let globalAssetId: AasTypes.Reference | null = null;
+  let specificAssetIds: Array<AasTypes.SpecificAssetId> | null = null;
+  let defaultThumbnail: AasTypes.Resource | null = null;
+
+  const projected = projectedProperties(options, "AssetInformation");
+
+  for (const key in jsonable) {
+    if (projected !== null && !projected.has(key)) {
+      continue;
+    }
+
+    const jsonableValue = jsonable[key];
+
+    switch (key) {
+      case "assetKind": {
+        const parsedOrError = AasJsonization.assetKindFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.AssetInformation>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        assetKind = parsedOrError.mustValue();
+        break;
+      }
+
+      case "globalAssetId": {
+        const parsedOrError = referenceFromJsonable(jsonableValue, options);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.AssetInformation>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        globalAssetId = parsedOrError.mustValue();
+        break;
+      }
+
+      case "specificAssetIds": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.AssetInformation>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.SpecificAssetId>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = specificAssetIdFromJsonable(jsonableItem, options);
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.AssetInformation>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        specificAssetIds = items;
+        break;
+      }
+
+      case "defaultThumbnail": {
+        const parsedOrError = resourceFromJsonable(jsonableValue, options);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.AssetInformation>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        defaultThumbnail = parsedOrError.mustValue();
+        break;
+      }
+
+      default:
+        // NOTE (mristin, 2022-11-30):
+        // Since we conflate here a JavaScript object with a JSON object, we ignore
+        // properties which we do not know how to de-serialize and assume they are
+        // related to the *JavaScript* properties of the object or `Object` prototype.
+        // The property `modelType` is only relevant for the dispatch, so we skip it.
+        break;
+    }
+  }
+
+  if (assetKind === null) {
+    return newDeserializationError<AasTypes.AssetInformation>(
+      "The required property 'assetKind' is missing"
+    );
+  }
+
+  return newDeserialized<AasTypes.AssetInformation>(
+    new AasTypes.AssetInformation(
+      assetKind,
+      globalAssetId,
+      specificAssetIds,
+      defaultThumbnail
+    ),
+    options
+  );
+}
+
+/**
+ * Parse an instance of {@link types!Resource} from the JSON-able
+ * structure `jsonable`.
+ *
+ * @param jsonable - structure to be parsed
+ * @param options - to control the de-serialization, if any
+ * @returns parsed instance of {@link types!Resource},
+ * or an error if any
+ */
+export function resourceFromJsonable(
+  jsonable: AasJsonization.JsonValue,
+  options: DeserializationOptions | null = null
+): AasCommon.Either<AasTypes.Resource, AasJsonization.DeserializationError> {
+  if (jsonable === null) {
+    return newDeserializationError<AasTypes.Resource>(
+      "Expected a JSON object, but got null"
+    );
+  }
+  if (Array.isArray(jsonable)) {
+    return newDeserializationError<AasTypes.Resource>(
+      "Expected a JSON object, but got a JSON array"
+    );
+  }
+  if (typeof jsonable !== "object") {
+    return newDeserializationError<AasTypes.Resource>(
+      `Expected a JSON object, but got: ${typeof jsonable}`
+    );
+  }
+
+  let path: string | null = null;
+  let contentType: string | null = null;
+
+  const projected = projectedProperties(options, "Resource");
+
+  for (const key in jsonable) {
+    if (projected !== null && !projected.has(key)) {
+      continue;
+    }
+
+    const jsonableValue = jsonable[key];
+
+    switch (key) {
+      case "path": {
+        const parsedOrError = stringFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Resource>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        path = parsedOrError.mustValue();
+        break;
+      }
+
+      case "contentType": {
+        const parsedOrError = stringFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Resource>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        contentType = parsedOrError.mustValue();
+        break;
+      }
+
+      default:
+        // NOTE (mristin, 2022-11-30):
+        // Since we conflate here a JavaScript object with a JSON object, we ignore
+        // properties which we do not know how to de-serialize and assume they are
+        // related to the *JavaScript* properties of the object or `Object` prototype.
+        // The property `modelType` is only relevant for the dispatch, so we skip it.
+        break;
+    }
+  }
+
+  if (path === null) {
+    return newDeserializationError<AasTypes.Resource>(
+      "The required property 'path' is missing"
+    );
+  }
+
+  return newDeserialized<AasTypes.Resource>(
+    new AasTypes.Resource(path, contentType),
+    options
+  );
+}
+
+/**
+ * Parse an instance of {@link types!SpecificAssetId} from the JSON-able
+ * structure `jsonable`.
+ *
+ * @param jsonable - structure to be parsed
+ * @param options - to control the de-serialization, if any
+ * @returns parsed instance of {@link types!SpecificAssetId},
+ * or an error if any
+ */
+export function specificAssetIdFromJsonable(
+  jsonable: AasJsonization.JsonValue,
+  options: DeserializationOptions | null = null
+): AasCommon.Either<AasTypes.SpecificAssetId, AasJsonization.DeserializationError> {
+  if (jsonable === null) {
+    return newDeserializationError<AasTypes.SpecificAssetId>(
+      "Expected a JSON object, but got null"
+    );
+  }
+  if (Array.isArray(jsonable)) {
+    return newDeserializationError<AasTypes.SpecificAssetId>(
+      "Expected a JSON object, but got a JSON array"
+    );
+  }
+  if (typeof jsonable !== "object") {
+    return newDeserializationError<AasTypes.SpecificAssetId>(
+      `Expected a JSON object, but got: ${typeof jsonable}`
+    );
+  }
+
+  let semanticId: AasTypes.Reference | null = null;
+  let supplementalSemanticIds: Array<AasTypes.Reference> | null = null;
+  let name: string | null = null;
+  let value: string | null = null;
+  let externalSubjectId: AasTypes.Reference | null = null;
+
+  const projected = projectedProperties(options, "SpecificAssetId");
+
+  for (const key in jsonable) {
+    if (projected !== null && !projected.has(key)) {
+      continue;
+    }
+
+    const jsonableValue = jsonable[key];
+
+    switch (key) {
+      case "semanticId": {
+        const parsedOrError = referenceFromJsonable(jsonableValue, options);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.SpecificAssetId>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        semanticId = parsedOrError.mustValue();
+        break;
+      }
+
+      case "supplementalSemanticIds": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.SpecificAssetId>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.Reference>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = referenceFromJsonable(jsonableItem, options);
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.SpecificAssetId>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        supplementalSemanticIds = items;
+        break;
+      }
+
+      case "name": {
+        const parsedOrError = stringFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.SpecificAssetId>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        name = parsedOrError.mustValue();
+        break;
+      }
+
+      case "value": {
+        const parsedOrError = stringFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.SpecificAssetId>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        value = parsedOrError.mustValue();
+        break;
+      }
+
+      case "externalSubjectId": {
+        const parsedOrError = referenceFromJsonable(jsonableValue, options);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.SpecificAssetId>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        externalSubjectId = parsedOrError.mustValue();
+        break;
+      }
+
+      default:
+        // NOTE (mristin, 2022-11-30):
+        // Since we conflate here a JavaScript object with a JSON object, we ignore
+        // properties which we do not know how to de-serialize and assume they are
+        // related to the *JavaScript* properties of the object or `Object` prototype.
+        // The property `modelType` is only relevant for the dispatch, so we skip it.
+        break;
+    }
+  }
+
+  if (name === null) {
+    return newDeserializationError<AasTypes.SpecificAssetId>(
+      "The required property 'name' is missing"
+    );
+  }
+
+  if (value === null) {
+    return newDeserializationError<AasTypes.SpecificAssetId>(
+      "The required property 'value' is missing"
+    );
+  }
+
+  if (externalSubjectId === null) {
+    return newDeserializationError<AasTypes.SpecificAssetId>(
+      "The required property 'externalSubjectId' is missing"
+    );
+  }
+
+  return newDeserialized<AasTypes.SpecificAssetId>(
+    new AasTypes.SpecificAssetId(
+      name,
+      value,
+      externalSubjectId,
+      semanticId,
+      supplementalSemanticIds
+    ),
+    options
+  );
+}
+
+/**
+ * Parse an instance of {@link types!Submodel} from the JSON-able
+ * structure `jsonable`.
+ *
+ * @param jsonable - structure to be parsed
+ * @param options - to control the de-serialization, if any
+ * @returns parsed instance of {@link types!Submodel},
+ * or an error if any
+ */
+export function submodelFromJsonable(
+  jsonable: AasJsonization.JsonValue,
+  options: DeserializationOptions | null = null
+): AasCommon.Either<AasTypes.Submodel, AasJsonization.DeserializationError> {
+  if (jsonable === null) {
+    return newDeserializationError<AasTypes.Submodel>(
+      "Expected a JSON object, but got null"
+    );
+  }
+  if (Array.isArray(jsonable)) {
+    return newDeserializationError<AasTypes.Submodel>(
+      "Expected a JSON object, but got a JSON array"
+    );
+  }
+  if (typeof jsonable !== "object") {
+    return newDeserializationError<AasTypes.Submodel>(
+      `Expected a JSON object, but got: ${typeof jsonable}`
+    );
+  }
+
+  let extensions: Array<AasTypes.Extension> | null = null;
+  let category: string | null = null;
+  let idShort: string | null = null;
+  let displayName: Array<AasTypes.LangString> | null = null;
+  let description: Array<AasTypes.LangString> | null = null;
+  let checksum: string | null = null;
+  let administration: AasTypes.AdministrativeInformation | null = null;
+  let id: string | null = null;
+  let kind: AasTypes.ModelingKind | null = null;
+  let semanticId: AasTypes.Reference | null = null;
+  let supplementalSemanticIds: Array<AasTypes.Reference> | null = null;
+  let qualifiers: Array<AasTypes.Qualifier> | null = null;
+  let embeddedDataSpecifications: Array<AasTypes.EmbeddedDataSpecification> | null =
+    null;
+  let submodelElements: Array<AasTypes.ISubmodelElement> | null = null;
+  let deferElements = false;
+
+  const projected = projectedProperties(options, "Submodel");
+
+  for (const key in jsonable) {
+    if (projected !== null && !projected.has(key)) {
+      continue;
+    }
+
+    const jsonableValue = jsonable[key];
+
+    switch (key) {
+      case "extensions": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Submodel>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.Extension>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = extensionFromJsonable(jsonableItem, options);
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.Submodel>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        extensions = items;
+        break;
+      }
+
+      case "category": {
+        const parsedOrError = stringFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Submodel>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        category = parsedOrError.mustValue();
+        break;
+      }
+
+      case "idShort": {
+        const parsedOrError = stringFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Submodel>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        idShort = parsedOrError.mustValue();
+        break;
+      }
+
+      case "displayName": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Submodel>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.LangString>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = langStringFromJsonable(jsonableItem, options);
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.Submodel>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        displayName = items;
+        break;
+      }
+
+      case "description": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Submodel>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.LangString>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = langStringFromJsonable(jsonableItem, options);
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.Submodel>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        description = items;
+        break;
+      }
+
+      case "checksum": {
+        const parsedOrError = stringFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Submodel>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        checksum = parsedOrError.mustValue();
+        break;
+      }
+
+      case "administration": {
+        const parsedOrError = administrativeInformationFromJsonable(
+          jsonableValue,
+          options
+        );
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Submodel>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        administration = parsedOrError.mustValue();
+        break;
+      }
+
+      case "id": {
+        const parsedOrError = stringFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Submodel>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        id = parsedOrError.mustValue();
+        break;
+      }
+
+      case "kind": {
+        const parsedOrError = AasJsonization.modelingKindFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Submodel>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        kind = parsedOrError.mustValue();
+        break;
+      }
+
+      case "semanticId": {
+        const parsedOrError = referenceFromJsonable(jsonableValue, options);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Submodel>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        semanticId = parsedOrError.mustValue();
+        break;
+      }
+
+      case "supplementalSemanticIds": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Submodel>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.Reference>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = referenceFromJsonable(jsonableItem, options);
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.Submodel>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        supplementalSemanticIds = items;
+        break;
+      }
+
+      case "qualifiers": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Submodel>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.Qualifier>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = qualifierFromJsonable(jsonableItem, options);
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.Submodel>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        qualifiers = items;
+        break;
+      }
+
+      case "embeddedDataSpecifications": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Submodel>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.EmbeddedDataSpecification>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = embeddedDataSpecificationFromJsonable(
+            jsonableItem,
+            options
+          );
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.Submodel>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        embeddedDataSpecifications = items;
+        break;
+      }
+
+      case "submodelElements": {
+        if (options !== null && options.lazySubmodelElements === true) {
+          deferElements = true;
+          break;
+        }
+
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Submodel>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.ISubmodelElement>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = submodelElementFromJsonable(jsonableItem, options);
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.Submodel>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        submodelElements = items;
+        break;
+      }
+
+      default:
+        // NOTE (mristin, 2022-11-30):
+        // Since we conflate here a JavaScript object with a JSON object, we ignore
+        // properties which we do not know how to de-serialize and assume they are
+        // related to the *JavaScript* properties of the object or `Object` prototype.
+        // The property `modelType` is only relevant for the dispatch, so we skip it.
+        break;
+    }
+  }
+
+  if (id === null) {
+    return newDeserializationError<AasTypes.Submodel>(
+      "The required property 'id' is missing"
+    );
+  }
+
+  const submodel = new AasTypes.Submodel(
+    id,
+    extensions,
+    category,
+    idShort,
+    displayName,
+    description,
+    checksum,
+    administration,
+    kind,
+    semanticId,
+    supplementalSemanticIds,
+    qualifiers,
+    embeddedDataSpecifications,
+    submodelElements
+  );
+
+  if (deferElements) {
+    deferSubmodelElements(submodel, <AasJsonization.JsonObject>jsonable, options);
+  }
+
+  return newDeserialized<AasTypes.Submodel>(submodel, options);
+}
+
+/**
+ * Parse `jsonable` as an instance
+ * of {@link types!ISubmodelElement}.
+ *
+ * @param jsonable - to be parsed
+ * @param options - to control the de-serialization, if any
+ * @returns parsed instance, or error if `jsonable` is invalid
+ */
+export function submodelElementFromJsonable(
+  jsonable: AasJsonization.JsonValue,
+  options: DeserializationOptions | null = null
+): AasCommon.Either<AasTypes.ISubmodelElement, AasJsonization.DeserializationError> {
+  if (jsonable === null) {
+    return newDeserializationError<AasTypes.ISubmodelElement>(
+      "Expected a JSON object, but got null"
+    );
+  }
+  if (Array.isArray(jsonable)) {
+    return newDeserializationError<AasTypes.ISubmodelElement>(
+      "Expected a JSON object, but got a JSON array"
+    );
+  }
+  if (typeof jsonable !== "object") {
+    return newDeserializationError<AasTypes.ISubmodelElement>(
+      `Expected a JSON object, but got: ${typeof jsonable}`
+    );
+  }
+
+  const modelType = jsonable["modelType"];
+  if (modelType === undefined) {
+    return newDeserializationError<AasTypes.ISubmodelElement>(
+      "Expected the property modelType, but got none"
+    );
+  }
+
+  if (typeof modelType !== "string") {
+    return newDeserializationError<AasTypes.ISubmodelElement>(
+      `Expected the property modelType to be a string, but got: ${typeof modelType}`
+    );
+  }
+
+  const dispatch = SUBMODEL_ELEMENT_FROM_JSONABLE_DISPATCH.get(modelType);
+  if (dispatch === undefined) {
+    return newDeserializationError<AasTypes.ISubmodelElement>(
+      `Unexpected model type for ISubmodelElement: ${modelType}`
+    );
+  }
+
+  return dispatch(jsonable, options);
+}
+
+/**
+ * Parse `jsonable` as an instance
+ * of {@link types!IRelationshipElement}.
+ *
+ * @param jsonable - to be parsed
+ * @param options - to control the de-serialization, if any
+ * @returns parsed instance, or error if `jsonable` is invalid
+ */
+export function relationshipElementFromJsonable(
+  jsonable: AasJsonization.JsonValue,
+  options: DeserializationOptions | null = null
+): AasCommon.Either<
+  AasTypes.IRelationshipElement,
+  AasJsonization.DeserializationError
+> {
+  if (jsonable === null) {
+    return newDeserializationError<AasTypes.IRelationshipElement>(
+      "Expected a JSON object, but got null"
+    );
+  }
+  if (Array.isArray(jsonable)) {
+    return newDeserializationError<AasTypes.IRelationshipElement>(
+      "Expected a JSON object, but got a JSON array"
+    );
+  }
+  if (typeof jsonable !== "object") {
+    return newDeserializationError<AasTypes.IRelationshipElement>(
+      `Expected a JSON object, but got: ${typeof jsonable}`
+    );
+  }
+
+  const modelType = jsonable["modelType"];
+  if (modelType === undefined) {
+    return newDeserializationError<AasTypes.IRelationshipElement>(
+      "Expected the property modelType, but got none"
+    );
+  }
+
+  if (typeof modelType !== "string") {
+    return newDeserializationError<AasTypes.IRelationshipElement>(
+      `Expected the property modelType to be a string, but got: ${typeof modelType}`
+    );
+  }
+
+  const dispatch = RELATIONSHIP_ELEMENT_FROM_JSONABLE_DISPATCH.get(modelType);
+  if (dispatch === undefined) {
+    return newDeserializationError<AasTypes.IRelationshipElement>(
+      `Unexpected model type for IRelationshipElement: ${modelType}`
+    );
+  }
+
+  return dispatch(jsonable, options);
+}
+
+/**
+ * Parse an instance of {@link types!RelationshipElement} from the JSON-able
+ * structure `jsonable`.
+ *
+ * This function performs no dispatch! It is used to parse the properties
+ * as-are, and already assumes the exact model type. Usually, this function
+ * is called from within a dispatching function, and you never call it
+ * directly. If you want to de-serialize an instance of
+ * {@link types!RelationshipElement}, call
+ * {@link relationshipElementFromJsonable}.
+ *
+ * @param jsonable - structure to be parsed
+ * @param options - to control the de-serialization, if any
+ * @returns parsed instance of {@link types!RelationshipElement},
+ * or an error if any
+ */
+function relationshipElementFromJsonableWithoutDispatch(
+  jsonable: AasJsonization.JsonValue,
+  options: DeserializationOptions | null = null
+): AasCommon.Either<AasTypes.RelationshipElement, AasJsonization.DeserializationError> {
+  if (jsonable === null) {
+    return newDeserializationError<AasTypes.RelationshipElement>(
+      "Expected a JSON object, but got null"
+    );
+  }
+  if (Array.isArray(jsonable)) {
+    return newDeserializationError<AasTypes.RelationshipElement>(
+      "Expected a JSON object, but got a JSON array"
+    );
+  }
+  if (typeof jsonable !== "object") {
+    return newDeserializationError<AasTypes.RelationshipElement>(
+      `Expected a JSON object, but got: ${typeof jsonable}`
+    );
+  }
+
+  let extensions: Array<AasTypes.Extension> | null = null;
+  let category: string | null = null;
+  let idShort: string | null = null;
+  let displayName: Array<AasTypes.LangString> | null = null;
+  let description: Array<AasTypes.LangString> | null = null;
+  let checksum: string | null = null;
+  let kind: AasTypes.ModelingKind | null = null;
+  let semanticId: AasTypes.Reference | null = null;
+  let supplementalSemanticIds: Array<AasTypes.Reference> | null = null;
+  let qualifiers: Array<AasTypes.Qualifier> | null = null;
+  let embeddedDataSpecifications: Array<AasTypes.EmbeddedDataSpecification> | null =
+    null;
+  let first: AasTypes.Reference | null = null;
+  let second: AasTypes.Reference | null = null;
+
+  const projected = projectedProperties(options, "RelationshipElement");
+
+  for (const key in jsonable) {
+    if (projected !== null && !projected.has(key)) {
+      continue;
+    }
+
+    const jsonableValue = jsonable[key];
+
+    switch (key) {
+      case "extensions": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.RelationshipElement>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.Extension>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = extensionFromJsonable(jsonableItem, options);
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.RelationshipElement>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        extensions = items;
+        break;
+      }
+
+      case "category": {
+        const parsedOrError = stringFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.RelationshipElement>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        category = parsedOrError.mustValue();
+        break;
+      }
+
+      case "idShort": {
+        const parsedOrError = stringFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.RelationshipElement>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        idShort = parsedOrError.mustValue();
+        break;
+      }
+
+      case "displayName": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.RelationshipElement>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.LangString>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = langStringFromJsonable(jsonableItem, options);
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.RelationshipElement>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        displayName = items;
+        break;
+      }
+
+      case "description": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.RelationshipElement>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.LangString>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = langStringFromJsonable(jsonableItem, options);
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.RelationshipElement>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        description = items;
+        break;
+      }
+
+      case "checksum": {
+        const parsedOrError = stringFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.RelationshipElement>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        checksum = parsedOrError.mustValue();
+        break;
+      }
+
+      case "kind": {
+        const parsedOrError = AasJsonization.modelingKindFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.RelationshipElement>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        kind = parsedOrError.mustValue();
+        break;
+      }
+
+      case "semanticId": {
+        const parsedOrError = referenceFromJsonable(jsonableValue, options);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.RelationshipElement>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        semanticId = parsedOrError.mustValue();
+        break;
+      }
+
+      case "supplementalSemanticIds": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.RelationshipElement>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.Reference>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = referenceFromJsonable(jsonableItem, options);
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.RelationshipElement>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        supplementalSemanticIds = items;
+        break;
+      }
+
+      case "qualifiers": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.RelationshipElement>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.Qualifier>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = qualifierFromJsonable(jsonableItem, options);
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.RelationshipElement>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        qualifiers = items;
+        break;
+      }
+
+      case "embeddedDataSpecifications": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.RelationshipElement>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.EmbeddedDataSpecification>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = embeddedDataSpecificationFromJsonable(
+            jsonableItem,
+            options
+          );
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.RelationshipElement>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        embeddedDataSpecifications = items;
+        break;
+      }
+
+      case "first": {
+        const parsedOrError = referenceFromJsonable(jsonableValue, options);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.RelationshipElement>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        first = parsedOrError.mustValue();
+        break;
+      }
+
+      case "second": {
+        const parsedOrError = referenceFromJsonable(jsonableValue, options);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.RelationshipElement>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        second = parsedOrError.mustValue();
+        break;
+      }
+
+      default:
+        // NOTE (mristin, 2022-11-30):
+        // Since we conflate here a JavaScript object with a JSON object, we ignore
+        // properties which we do not know how to de-serialize and assume they are
+        // related to the *JavaScript* properties of the object or `Object` prototype.
+        // The property `modelType` is only relevant for the dispatch, so we skip it.
+        break;
+    }
+  }
+
+  if (first === null) {
+    return newDeserializationError<AasTypes.RelationshipElement>(
+      "The required property 'first' is missing"
+    );
+  }
+
+  if (second === null) {
+    return newDeserializationError<AasTypes.RelationshipElement>(
+      "The required property 'second' is missing"
+    );
+  }
+
+  return newDeserialized<AasTypes.RelationshipElement>(
+    new AasTypes.RelationshipElement(
+      first,
+      second,
+      extensions,
+      category,
+      idShort,
+      displayName,
+      description,
+      checksum,
+      kind,
+      semanticId,
+      supplementalSemanticIds,
+      qualifiers,
+      embeddedDataSpecifications
+    ),
+    options
+  );
+}
+
+/**
+ * Parse an instance of {@link types!SubmodelElementList} from the JSON-able
+ * structure `jsonable`.
+ *
+ * @param jsonable - structure to be parsed
+ * @param options - to control the de-serialization, if any
+ * @returns parsed instance of {@link types!SubmodelElementList},
+ * or an error if any
+ */
+export function submodelElementListFromJsonable(
+  jsonable: AasJsonization.JsonValue,
+  options: DeserializationOptions | null = null
+): AasCommon.Either<AasTypes.SubmodelElementList, AasJsonization.DeserializationError> {
+  if (jsonable === null) {
+    return newDeserializationError<AasTypes.SubmodelElementList>(
+      "Expected a JSON object, but got null"
+    );
+  }
+  if (Array.isArray(jsonable)) {
+    return newDeserializationError<AasTypes.SubmodelElementList>(
+      "Expected a JSON object, but got a JSON array"
+    );
+  }
+  if (typeof jsonable !== "object") {
+    return newDeserializationError<AasTypes.SubmodelElementList>(
+      `Expected a JSON object, but got: ${typeof jsonable}`
+    );
+  }
+
+  let extensions: Array<AasTypes.Extension> | null = null;
+  let category: string | null = null;
+  let idShort: string | null = null;
+  let displayName: Array<AasTypes.LangString> | null = null;
+  let description: Array<AasTypes.LangString> | null = null;
+  let checksum: string | null = null;
+  let kind: AasTypes.ModelingKind | null = null;
+  let semanticId: AasTypes.Reference | null = null;
+  let supplementalSemanticIds: Array<AasTypes.Reference> | null = null;
+  let qualifiers: Array<AasTypes.Qualifier> | null = null;
+  let embeddedDataSpecifications: Array<AasTypes.EmbeddedDataSpecification> | null =
+    null;
+  let orderRelevant: boolean | null = null;
+  let value: Array<AasTypes.ISubmodelElement> | null = null;
+  let semanticIdListElement: AasTypes.Reference | null = null;
+  let typeValueListElement: AasTypes.AasSubmodelElements | null = null;
+  let valueTypeListElement: AasTypes.DataTypeDefXsd | null = null;
+
+  const projected = projectedProperties(options, "SubmodelElementList");
+
+  for (const key in jsonable) {
+    if (projected !== null && !projected.has(key)) {
+      continue;
+    }
+
+    const jsonableValue = jsonable[key];
+
+    switch (key) {
+      case "extensions": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.SubmodelElementList>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.Extension>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = extensionFromJsonable(jsonableItem, options);
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.SubmodelElementList>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        extensions = items;
+        break;
+      }
+
+      case "category": {
+        const parsedOrError = stringFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.SubmodelElementList>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        category = parsedOrError.mustValue();
+        break;
+      }
+
+      case "idShort": {
+        const parsedOrError = stringFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.SubmodelElementList>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        idShort = parsedOrError.mustValue();
+        break;
+      }
+
+      case "displayName": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.SubmodelElementList>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.LangString>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = langStringFromJsonable(jsonableItem, options);
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.SubmodelElementList>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        displayName = items;
+        break;
+      }
+
+      case "description": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.SubmodelElementList>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.LangString>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = langStringFromJsonable(jsonableItem, options);
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.SubmodelElementList>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        description = items;
+        break;
+      }
+
+      case "checksum": {
+        const parsedOrError = stringFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.SubmodelElementList>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        checksum = parsedOrError.mustValue();
+        break;
+      }
+
+      case "kind": {
+        const parsedOrError = AasJsonization.modelingKindFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.SubmodelElementList>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        kind = parsedOrError.mustValue();
+        break;
+      }
+
+      case "semanticId": {
+        const parsedOrError = referenceFromJsonable(jsonableValue, options);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.SubmodelElementList>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        semanticId = parsedOrError.mustValue();
+        break;
+      }
+
+      case "supplementalSemanticIds": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.SubmodelElementList>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.Reference>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = referenceFromJsonable(jsonableItem, options);
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.SubmodelElementList>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        supplementalSemanticIds = items;
+        break;
+      }
+
+      case "qualifiers": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.SubmodelElementList>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.Qualifier>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = qualifierFromJsonable(jsonableItem, options);
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.SubmodelElementList>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        qualifiers = items;
+        break;
+      }
+
+      case "embeddedDataSpecifications": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.SubmodelElementList>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.EmbeddedDataSpecification>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = embeddedDataSpecificationFromJsonable(
+            jsonableItem,
+            options
+          );
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.SubmodelElementList>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        embeddedDataSpecifications = items;
+        break;
+      }
+
+      case "orderRelevant": {
+        const parsedOrError = booleanFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.SubmodelElementList>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        orderRelevant = parsedOrError.mustValue();
+        break;
+      }
+
+      case "value": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.SubmodelElementList>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.ISubmodelElement>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = submodelElementFromJsonable(jsonableItem, options);
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.SubmodelElementList>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        value = items;
+        break;
+      }
+
+      case "semanticIdListElement": {
+        const parsedOrError = referenceFromJsonable(jsonableValue, options);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.SubmodelElementList>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        semanticIdListElement = parsedOrError.mustValue();
+        break;
+      }
+
+      case "typeValueListElement": {
+        const parsedOrError =
+          AasJsonization.aasSubmodelElementsFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.SubmodelElementList>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        typeValueListElement = parsedOrError.mustValue();
+        break;
+      }
+
+      case "valueTypeListElement": {
+        const parsedOrError = AasJsonization.dataTypeDefXsdFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.SubmodelElementList>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        valueTypeListElement = parsedOrError.mustValue();
+        break;
+      }
+
+      default:
+        // NOTE (mristin, 2022-11-30):
+        // Since we conflate here a JavaScript object with a JSON object, we ignore
+        // properties which we do not know how to de-serialize and assume they are
+        // related to the *JavaScript* properties of the object or `Object` prototype.
+        // The property `modelType` is only relevant for the dispatch, so we skip it.
+        break;
+    }
+  }
+
+  if (typeValueListElement === null) {
+    return newDeserializationError<AasTypes.SubmodelElementList>(
+      "The required property 'typeValueListElement' is missing"
+    );
+  }
+
+  return newDeserialized<AasTypes.SubmodelElementList>(
+    new AasTypes.SubmodelElementList(
+      typeValueListElement,
+      extensions,
+      category,
+      idShort,
+      displayName,
+      description,
+      checksum,
+      kind,
+      semanticId,
+      supplementalSemanticIds,
+      qualifiers,
+      embeddedDataSpecifications,
+      orderRelevant,
+      value,
+      semanticIdListElement,
+      valueTypeListElement
+    ),
+    options
+  );
+}
+
+/**
+ * Parse an instance of {@link types!SubmodelElementCollection} from the JSON-able
+ * structure `jsonable`.
+ *
+ * @param jsonable - structure to be parsed
+ * @param options - to control the de-serialization, if any
+ * @returns parsed instance of {@link types!SubmodelElementCollection},
+ * or an error if any
+ */
+export function submodelElementCollectionFromJsonable(
+  jsonable: AasJsonization.JsonValue,
+  options: DeserializationOptions | null = null
+): AasCommon.Either<
+  AasTypes.SubmodelElementCollection,
+  AasJsonization.DeserializationError
+> {
+  if (jsonable === null) {
+    return newDeserializationError<AasTypes.SubmodelElementCollection>(
+      "Expected a JSON object, but got null"
+    );
+  }
+  if (Array.isArray(jsonable)) {
+    return newDeserializationError<AasTypes.SubmodelElementCollection>(
+      "Expected a JSON object, but got a JSON array"
+    );
+  }
+  if (typeof jsonable !== "object") {
+    return newDeserializationError<AasTypes.SubmodelElementCollection>(
+      `Expected a JSON object, but got: ${typeof jsonable}`
+    );
+  }
+
+  let extensions: Array<AasTypes.Extension> | null = null;
+  let category: string | null = null;
+  let idShort: string | null = null;
+  let displayName: Array<AasTypes.LangString> | null = null;
+  let description: Array<AasTypes.LangString> | null = null;
+  let checksum: string | null = null;
+  let kind: AasTypes.ModelingKind | null = null;
+  let semanticId: AasTypes.Reference | null = null;
+  let supplementalSemanticIds: Array<AasTypes.Reference> | null = null;
+  let qualifiers: Array<AasTypes.Qualifier> | null = null;
+  let embeddedDataSpecifications: Array<AasTypes.EmbeddedDataSpecification> | null =
+    null;
+  let value: Array<AasTypes.ISubmodelElement> | null = null;
+
+  const projected = projectedProperties(options, "SubmodelElementCollection");
+
+  for (const key in jsonable) {
+    if (projected !== null && !projected.has(key)) {
+      continue;
+    }
+
+    const jsonableValue = jsonable[key];
+
+    switch (key) {
+      case "extensions": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.SubmodelElementCollection>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.Extension>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = extensionFromJsonable(jsonableItem, options);
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.SubmodelElementCollection>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        extensions = items;
+        break;
+      }
+
+      case "category": {
+        const parsedOrError = stringFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.SubmodelElementCollection>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        category = parsedOrError.mustValue();
+        break;
+      }
+
+      case "idShort": {
+        const parsedOrError = stringFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.SubmodelElementCollection>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        idShort = parsedOrError.mustValue();
+        break;
+      }
+
+      case "displayName": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.SubmodelElementCollection>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.LangString>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = langStringFromJsonable(jsonableItem, options);
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.SubmodelElementCollection>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        displayName = items;
+        break;
+      }
+
+      case "description": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.SubmodelElementCollection>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.LangString>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = langStringFromJsonable(jsonableItem, options);
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.SubmodelElementCollection>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        description = items;
+        break;
+      }
+
+      case "checksum": {
+        const parsedOrError = stringFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.SubmodelElementCollection>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        checksum = parsedOrError.mustValue();
+        break;
+      }
+
+      case "kind": {
+        const parsedOrError = AasJsonization.modelingKindFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.SubmodelElementCollection>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        kind = parsedOrError.mustValue();
+        break;
+      }
+
+      case "semanticId": {
+        const parsedOrError = referenceFromJsonable(jsonableValue, options);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.SubmodelElementCollection>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        semanticId = parsedOrError.mustValue();
+        break;
+      }
+
+      case "supplementalSemanticIds": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.SubmodelElementCollection>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.Reference>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = referenceFromJsonable(jsonableItem, options);
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.SubmodelElementCollection>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        supplementalSemanticIds = items;
+        break;
+      }
+
+      case "qualifiers": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.SubmodelElementCollection>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.Qualifier>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = qualifierFromJsonable(jsonableItem, options);
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.SubmodelElementCollection>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        qualifiers = items;
+        break;
+      }
+
+      case "embeddedDataSpecifications": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.SubmodelElementCollection>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.EmbeddedDataSpecification>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = embeddedDataSpecificationFromJsonable(
+            jsonableItem,
+            options
+          );
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.SubmodelElementCollection>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        embeddedDataSpecifications = items;
+        break;
+      }
+
+      case "value": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.SubmodelElementCollection>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.ISubmodelElement>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = submodelElementFromJsonable(jsonableItem, options);
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.SubmodelElementCollection>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        value = items;
+        break;
+      }
+
+      default:
+        // NOTE (mristin, 2022-11-30):
+        // Since we conflate here a JavaScript object with a JSON object, we ignore
+        // properties which we do not know how to de-serialize and assume they are
+        // related to the *JavaScript* properties of the object or `Object` prototype.
+        // The property `modelType` is only relevant for the dispatch, so we skip it.
+        break;
+    }
+  }
+
+  return newDeserialized<AasTypes.SubmodelElementCollection>(
+    new AasTypes.SubmodelElementCollection(
+      extensions,
+      category,
+      idShort,
+      displayName,
+      description,
+      checksum,
+      kind,
+      semanticId,
+      supplementalSemanticIds,
+      qualifiers,
+      embeddedDataSpecifications,
+      value
+    ),
+    options
+  );
+}
+
+/**
+ * Parse `jsonable` as an instance
+ * of {@link types!IDataElement}.
+ *
+ * @param jsonable - to be parsed
+ * @param options - to control the de-serialization, if any
+ * @returns parsed instance, or error if `jsonable` is invalid
+ */
+export function dataElementFromJsonable(
+  jsonable: AasJsonization.JsonValue,
+  options: DeserializationOptions | null = null
+): AasCommon.Either<AasTypes.IDataElement, AasJsonization.DeserializationError> {
+  if (jsonable === null) {
+    return newDeserializationError<AasTypes.IDataElement>(
+      "Expected a JSON object, but got null"
+    );
+  }
+  if (Array.isArray(jsonable)) {
+    return newDeserializationError<AasTypes.IDataElement>(
+      "Expected a JSON object, but got a JSON array"
+    );
+  }
+  if (typeof jsonable !== "object") {
+    return newDeserializationError<AasTypes.IDataElement>(
+      `Expected a JSON object, but got: ${typeof jsonable}`
+    );
+  }
+
+  const modelType = jsonable["modelType"];
+  if (modelType === undefined) {
+    return newDeserializationError<AasTypes.IDataElement>(
+      "Expected the property modelType, but got none"
+    );
+  }
+
+  if (typeof modelType !== "string") {
+    return newDeserializationError<AasTypes.IDataElement>(
+      `Expected the property modelType to be a string, but got: ${typeof modelType}`
+    );
+  }
+
+  const dispatch = DATA_ELEMENT_FROM_JSONABLE_DISPATCH.get(modelType);
+  if (dispatch === undefined) {
+    return newDeserializationError<AasTypes.IDataElement>(
+      `Unexpected model type for IDataElement: ${modelType}`
+    );
+  }
+
+  return dispatch(jsonable, options);
+}
+
+/**
+ * Parse an instance of {@link types!Property} from the JSON-able
+ * structure `jsonable`.
+ *
+ * @param jsonable - structure to be parsed
+ * @param options - to control the de-serialization, if any
+ * @returns parsed instance of {@link types!Property},
+ * or an error if any
+ */
+export function propertyFromJsonable(
+  jsonable: AasJsonization.JsonValue,
+  options: DeserializationOptions | null = null
+): AasCommon.Either<AasTypes.Property, AasJsonization.DeserializationError> {
+  if (jsonable === null) {
+    return newDeserializationError<AasTypes.Property>(
+      "Expected a JSON object, but got null"
+    );
+  }
+  if (Array.isArray(jsonable)) {
+    return newDeserializationError<AasTypes.Property>(
+      "Expected a JSON object, but got a JSON array"
+    );
+  }
+  if (typeof jsonable !== "object") {
+    return newDeserializationError<AasTypes.Property>(
+      `Expected a JSON object, but got: ${typeof jsonable}`
+    );
+  }
+
+  let extensions: Array<AasTypes.Extension> | null = null;
+  let category: string | null = null;
+  let idShort: string | null = null;
+  let displayName: Array<AasTypes.LangString> | null = null;
+  let description: Array<AasTypes.LangString> | null = null;
+  let checksum: string | null = null;
+  let kind: AasTypes.ModelingKind | null = null;
+  let semanticId: AasTypes.Reference | null = null;
+  let supplementalSemanticIds: Array<AasTypes.Reference> | null = null;
+  let qualifiers: Array<AasTypes.Qualifier> | null = null;
+  let embeddedDataSpecifications: Array<AasTypes.EmbeddedDataSpecification> | null =
+    null;
+  let valueType: AasTypes.DataTypeDefXsd | null = null;
+  let value: string | null = null;
+  let valueId: AasTypes.Reference | null = null;
+
+  const projected = projectedProperties(options, "Property");
+
+  for (const key in jsonable) {
+    if (projected !== null && !projected.has(key)) {
+      continue;
+    }
+
+    const jsonableValue = jsonable[key];
+
+    switch (key) {
+      case "extensions": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Property>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.Extension>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = extensionFromJsonable(jsonableItem, options);
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.Property>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        extensions = items;
+        break;
+      }
+
+      case "category": {
+        const parsedOrError = stringFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Property>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        category = parsedOrError.mustValue();
+        break;
+      }
+
+      case "idShort": {
+        const parsedOrError = stringFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Property>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        idShort = parsedOrError.mustValue();
+        break;
+      }
+
+      case "displayName": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Property>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.LangString>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = langStringFromJsonable(jsonableItem, options);
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.Property>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        displayName = items;
+        break;
+      }
+
+      case "description": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Property>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.LangString>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = langStringFromJsonable(jsonableItem, options);
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.Property>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        description = items;
+        break;
+      }
+
+      case "checksum": {
+        const parsedOrError = stringFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Property>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        checksum = parsedOrError.mustValue();
+        break;
+      }
+
+      case "kind": {
+        const parsedOrError = AasJsonization.modelingKindFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Property>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        kind = parsedOrError.mustValue();
+        break;
+      }
+
+      case "semanticId": {
+        const parsedOrError = referenceFromJsonable(jsonableValue, options);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Property>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        semanticId = parsedOrError.mustValue();
+        break;
+      }
+
+      case "supplementalSemanticIds": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Property>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.Reference>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = referenceFromJsonable(jsonableItem, options);
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.Property>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        supplementalSemanticIds = items;
+        break;
+      }
+
+      case "qualifiers": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Property>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.Qualifier>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = qualifierFromJsonable(jsonableItem, options);
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.Property>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        qualifiers = items;
+        break;
+      }
+
+      case "embeddedDataSpecifications": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Property>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.EmbeddedDataSpecification>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = embeddedDataSpecificationFromJsonable(
+            jsonableItem,
+            options
+          );
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.Property>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        embeddedDataSpecifications = items;
+        break;
+      }
+
+      case "valueType": {
+        const parsedOrError = AasJsonization.dataTypeDefXsdFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Property>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        valueType = parsedOrError.mustValue();
+        break;
+      }
+
+      case "value": {
+        const parsedOrError = stringFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Property>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        value = parsedOrError.mustValue();
+        break;
+      }
+
+      case "valueId": {
+        const parsedOrError = referenceFromJsonable(jsonableValue, options);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Property>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        valueId = parsedOrError.mustValue();
+        break;
+      }
+
+      default:
+        // NOTE (mristin, 2022-11-30):
+        // Since we conflate here a JavaScript object with a JSON object, we ignore
+        // properties which we do not know how to de-serialize and assume they are
+        // related to the *JavaScript* properties of the object or `Object` prototype.
+        // The property `modelType` is only relevant for the dispatch, so we skip it.
+        break;
+    }
+  }
+
+  if (valueType === null) {
+    return newDeserializationError<AasTypes.Property>(
+      "The required property 'valueType' is missing"
+    );
+  }
+
+  return newDeserialized<AasTypes.Property>(
+    new AasTypes.Property(
+      valueType,
+      extensions,
+      category,
+      idShort,
+      displayName,
+      description,
+      checksum,
+      kind,
+      semanticId,
+      supplementalSemanticIds,
+      qualifiers,
+      embeddedDataSpecifications,
+      value,
+      valueId
+    ),
+    options
+  );
+}
+
+/**
+ * Parse an instance of {@link types!MultiLanguageProperty} from the JSON-able
+ * structure `jsonable`.
+ *
+ * @param jsonable - structure to be parsed
+ * @param options - to control the de-serialization, if any
+ * @returns parsed instance of {@link types!MultiLanguageProperty},
+ * or an error if any
+ */
+export function multiLanguagePropertyFromJsonable(
+  jsonable: AasJsonization.JsonValue,
+  options: DeserializationOptions | null = null
+): AasCommon.Either<
+  AasTypes.MultiLanguageProperty,
+  AasJsonization.DeserializationError
+> {
+  if (jsonable === null) {
+    return newDeserializationError<AasTypes.MultiLanguageProperty>(
+      "Expected a JSON object, but got null"
+    );
+  }
+  if (Array.isArray(jsonable)) {
+    return newDeserializationError<AasTypes.MultiLanguageProperty>(
+      "Expected a JSON object, but got a JSON array"
+    );
+  }
+  if (typeof jsonable !== "object") {
+    return newDeserializationError<AasTypes.MultiLanguageProperty>(
+      `Expected a JSON object, but got: ${typeof jsonable}`
+    );
+  }
+
+  let extensions: Array<AasTypes.Extension> | null = null;
+  let category: string | null = null;
+  let idShort: string | null = null;
+  let displayName: Array<AasTypes.LangString> | null = null;
+  let description: Array<AasTypes.LangString> | null = null;
+  let checksum: string | null = null;
+  let kind: AasTypes.ModelingKind | null = null;
+  let semanticId: AasTypes.Reference | null = null;
+  let supplementalSemanticIds: Array<AasTypes.Reference> | null = null;
+  let qualifiers: Array<AasTypes.Qualifier> | null = null;
+  let embeddedDataSpecifications: Array<AasTypes.EmbeddedDataSpecification> | null =
+    null;
+  let value: Array<AasTypes.LangString> | null = null;
+  let valueId: AasTypes.Reference | null = null;
+
+  const projected = projectedProperties(options, "MultiLanguageProperty");
+
+  for (const key in jsonable) {
+    if (projected !== null && !projected.has(key)) {
+      continue;
+    }
+
+    const jsonableValue = jsonable[key];
+
+    switch (key) {
+      case "extensions": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.MultiLanguageProperty>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.Extension>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = extensionFromJsonable(jsonableItem, options);
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.MultiLanguageProperty>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        extensions = items;
+        break;
+      }
+
+      case "category": {
+        const parsedOrError = stringFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.MultiLanguageProperty>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        category = parsedOrError.mustValue();
+        break;
+      }
+
+      case "idShort": {
+        const parsedOrError = stringFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.MultiLanguageProperty>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        idShort = parsedOrError.mustValue();
+        break;
+      }
+
+      case "displayName": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.MultiLanguageProperty>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.LangString>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = langStringFromJsonable(jsonableItem, options);
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.MultiLanguageProperty>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        displayName = items;
+        break;
+      }
+
+      case "description": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.MultiLanguageProperty>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.LangString>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = langStringFromJsonable(jsonableItem, options);
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.MultiLanguageProperty>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        description = items;
+        break;
+      }
+
+      case "checksum": {
+        const parsedOrError = stringFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.MultiLanguageProperty>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        checksum = parsedOrError.mustValue();
+        break;
+      }
+
+      case "kind": {
+        const parsedOrError = AasJsonization.modelingKindFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.MultiLanguageProperty>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        kind = parsedOrError.mustValue();
+        break;
+      }
+
+      case "semanticId": {
+        const parsedOrError = referenceFromJsonable(jsonableValue, options);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.MultiLanguageProperty>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        semanticId = parsedOrError.mustValue();
+        break;
+      }
+
+      case "supplementalSemanticIds": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.MultiLanguageProperty>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.Reference>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = referenceFromJsonable(jsonableItem, options);
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.MultiLanguageProperty>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        supplementalSemanticIds = items;
+        break;
+      }
+
+      case "qualifiers": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.MultiLanguageProperty>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.Qualifier>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = qualifierFromJsonable(jsonableItem, options);
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.MultiLanguageProperty>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        qualifiers = items;
+        break;
+      }
+
+      case "embeddedDataSpecifications": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.MultiLanguageProperty>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.EmbeddedDataSpecification>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = embeddedDataSpecificationFromJsonable(
+            jsonableItem,
+            options
+          );
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.MultiLanguageProperty>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        embeddedDataSpecifications = items;
+        break;
+      }
+
+      case "value": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.MultiLanguageProperty>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.LangString>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = langStringFromJsonable(jsonableItem, options);
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.MultiLanguageProperty>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        value = items;
+        break;
+      }
+
+      case "valueId": {
+        const parsedOrError = referenceFromJsonable(jsonableValue, options);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.MultiLanguageProperty>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        valueId = parsedOrError.mustValue();
+        break;
+      }
+
+      default:
+        // NOTE (mristin, 2022-11-30):
+        // Since we conflate here a JavaScript object with a JSON object, we ignore
+        // properties which we do not know how to de-serialize and assume they are
+        // related to the *JavaScript* properties of the object or `Object` prototype.
+        // The property `modelType` is only relevant for the dispatch, so we skip it.
+        break;
+    }
+  }
+
+  return newDeserialized<AasTypes.MultiLanguageProperty>(
+    new AasTypes.MultiLanguageProperty(
+      extensions,
+      category,
+      idShort,
+      displayName,
+      description,
+      checksum,
+      kind,
+      semanticId,
+      supplementalSemanticIds,
+      qualifiers,
+      embeddedDataSpecifications,
+      value,
+      valueId
+    ),
+    options
+  );
+}
+
+/**
+ * Parse an instance of {@link types!Range} from the JSON-able
+ * structure `jsonable`.
+ *
+ * @param jsonable - structure to be parsed
+ * @param options - to control the de-serialization, if any
+ * @returns parsed instance of {@link types!Range},
+ * or an error if any
+ */
+export function rangeFromJsonable(
+  jsonable: AasJsonization.JsonValue,
+  options: DeserializationOptions | null = null
+): AasCommon.Either<AasTypes.Range, AasJsonization.DeserializationError> {
+  if (jsonable === null) {
+    return newDeserializationError<AasTypes.Range>(
+      "Expected a JSON object, but got null"
+    );
+  }
+  if (Array.isArray(jsonable)) {
+    return newDeserializationError<AasTypes.Range>(
+      "Expected a JSON object, but got a JSON array"
+    );
+  }
+  if (typeof jsonable !== "object") {
+    return newDeserializationError<AasTypes.Range>(
+      `Expected a JSON object, but got: ${typeof jsonable}`
+    );
+  }
+
+  let extensions: Array<AasTypes.Extension> | null = null;
+  let category: string | null = null;
+  let idShort: string | null = null;
+  let displayName: Array<AasTypes.LangString> | null = null;
+  let description: Array<AasTypes.LangString> | null = null;
+  let checksum: string | null = null;
+  let kind: AasTypes.ModelingKind | null = null;
+  let semanticId: AasTypes.Reference | null = null;
+  let supplementalSemanticIds: Array<AasTypes.Reference> | null = null;
+  let qualifiers: Array<AasTypes.Qualifier> | null = null;
+  let embeddedDataSpecifications: Array<AasTypes.EmbeddedDataSpecification> | null =
+    null;
+  let valueType: AasTypes.DataTypeDefXsd | null = null;
+  let min: string | null = null;
+  let max: string | null = null;
+
+  const projected = projectedProperties(options, "Range");
+
+  for (const key in jsonable) {
+    if (projected !== null && !projected.has(key)) {
+      continue;
+    }
+
+    const jsonableValue = jsonable[key];
+
+    switch (key) {
+      case "extensions": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Range>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.Extension>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = extensionFromJsonable(jsonableItem, options);
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.Range>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        extensions = items;
+        break;
+      }
+
+      case "category": {
+        const parsedOrError = stringFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Range>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        category = parsedOrError.mustValue();
+        break;
+      }
+
+      case "idShort": {
+        const parsedOrError = stringFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Range>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        idShort = parsedOrError.mustValue();
+        break;
+      }
+
+      case "displayName": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Range>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.LangString>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = langStringFromJsonable(jsonableItem, options);
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.Range>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        displayName = items;
+        break;
+      }
+
+      case "description": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Range>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.LangString>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = langStringFromJsonable(jsonableItem, options);
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.Range>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        description = items;
+        break;
+      }
+
+      case "checksum": {
+        const parsedOrError = stringFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Range>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        checksum = parsedOrError.mustValue();
+        break;
+      }
+
+      case "kind": {
+        const parsedOrError = AasJsonization.modelingKindFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Range>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        kind = parsedOrError.mustValue();
+        break;
+      }
+
+      case "semanticId": {
+        const parsedOrError = referenceFromJsonable(jsonableValue, options);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Range>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        semanticId = parsedOrError.mustValue();
+        break;
+      }
+
+      case "supplementalSemanticIds": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Range>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.Reference>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = referenceFromJsonable(jsonableItem, options);
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.Range>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        supplementalSemanticIds = items;
+        break;
+      }
+
+      case "qualifiers": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Range>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.Qualifier>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = qualifierFromJsonable(jsonableItem, options);
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.Range>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        qualifiers = items;
+        break;
+      }
+
+      case "embeddedDataSpecifications": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Range>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.EmbeddedDataSpecification>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = embeddedDataSpecificationFromJsonable(
+            jsonableItem,
+            options
+          );
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.Range>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        embeddedDataSpecifications = items;
+        break;
+      }
+
+      case "valueType": {
+        const parsedOrError = AasJsonization.dataTypeDefXsdFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Range>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        valueType = parsedOrError.mustValue();
+        break;
+      }
+
+      case "min": {
+        const parsedOrError = stringFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Range>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        min = parsedOrError.mustValue();
+        break;
+      }
+
+      case "max": {
+        const parsedOrError = stringFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Range>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        max = parsedOrError.mustValue();
+        break;
+      }
+
+      default:
+        // NOTE (mristin, 2022-11-30):
+        // Since we conflate here a JavaScript object with a JSON object, we ignore
+        // properties which we do not know how to de-serialize and assume they are
+        // related to the *JavaScript* properties of the object or `Object` prototype.
+        // The property `modelType` is only relevant for the dispatch, so we skip it.
+        break;
+    }
+  }
+
+  if (valueType === null) {
+    return newDeserializationError<AasTypes.Range>(
+      "The required property 'valueType' is missing"
+    );
+  }
+
+  return newDeserialized<AasTypes.Range>(
+    new AasTypes.Range(
+      valueType,
+      extensions,
+      category,
+      idShort,
+      displayName,
+      description,
+      checksum,
+      kind,
+      semanticId,
+      supplementalSemanticIds,
+      qualifiers,
+      embeddedDataSpecifications,
+      min,
+      max
+    ),
+    options
+  );
+}
+
+/**
+ * Parse an instance of {@link types!ReferenceElement} from the JSON-able
+ * structure `jsonable`.
+ *
+ * @param jsonable - structure to be parsed
+ * @param options - to control the de-serialization, if any
+ * @returns parsed instance of {@link types!ReferenceElement},
+ * or an error if any
+ */
+export function referenceElementFromJsonable(
+  jsonable: AasJsonization.JsonValue,
+  options: DeserializationOptions | null = null
+): AasCommon.Either<AasTypes.ReferenceElement, AasJsonization.DeserializationError> {
+  if (jsonable === null) {
+    return newDeserializationError<AasTypes.ReferenceElement>(
+      "Expected a JSON object, but got null"
+    );
+  }
+  if (Array.isArray(jsonable)) {
+    return newDeserializationError<AasTypes.ReferenceElement>(
+      "Expected a JSON object, but got a JSON array"
+    );
+  }
+  if (typeof jsonable !== "object") {
+    return newDeserializationError<AasTypes.ReferenceElement>(
+      `Expected a JSON object, but got: ${typeof jsonable}`
+    );
+  }
+
+  let extensions: Array<AasTypes.Extension> | null = null;
+  let category: string | null = null;
+  let idShort: string | null = null;
+  let displayName: Array<AasTypes.LangString> | null = null;
+  let description: Array<AasTypes.LangString> | null = null;
+  let checksum: string | null = null;
+  let kind: AasTypes.ModelingKind | null = null;
+  let semanticId: AasTypes.Reference | null = null;
+  let supplementalSemanticIds: Array<AasTypes.Reference> | null = null;
+  let qualifiers: Array<AasTypes.Qualifier> | null = null;
+  let embeddedDataSpecifications: Array<AasTypes.EmbeddedDataSpecification> | null =
+    null;
+  let value: AasTypes.Reference | null = null;
+
+  const projected = projectedProperties(options, "ReferenceElement");
+
+  for (const key in jsonable) {
+    if (projected !== null && !projected.has(key)) {
+      continue;
+    }
+
+    const jsonableValue = jsonable[key];
+
+    switch (key) {
+      case "extensions": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.ReferenceElement>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.Extension>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = extensionFromJsonable(jsonableItem, options);
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.ReferenceElement>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        extensions = items;
+        break;
+      }
+
+      case "category": {
+        const parsedOrError = stringFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.ReferenceElement>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        category = parsedOrError.mustValue();
+        break;
+      }
+
+      case "idShort": {
+        const parsedOrError = stringFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.ReferenceElement>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        idShort = parsedOrError.mustValue();
+        break;
+      }
+
+      case "displayName": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.ReferenceElement>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.LangString>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = langStringFromJsonable(jsonableItem, options);
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.ReferenceElement>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        displayName = items;
+        break;
+      }
+
+      case "description": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.ReferenceElement>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.LangString>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = langStringFromJsonable(jsonableItem, options);
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.ReferenceElement>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        description = items;
+        break;
+      }
+
+      case "checksum": {
+        const parsedOrError = stringFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.ReferenceElement>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        checksum = parsedOrError.mustValue();
+        break;
+      }
+
+      case "kind": {
+        const parsedOrError = AasJsonization.modelingKindFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.ReferenceElement>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        kind = parsedOrError.mustValue();
+        break;
+      }
+
+      case "semanticId": {
+        const parsedOrError = referenceFromJsonable(jsonableValue, options);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.ReferenceElement>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        semanticId = parsedOrError.mustValue();
+        break;
+      }
+
+      case "supplementalSemanticIds": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.ReferenceElement>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.Reference>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = referenceFromJsonable(jsonableItem, options);
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.ReferenceElement>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        supplementalSemanticIds = items;
+        break;
+      }
+
+      case "qualifiers": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.ReferenceElement>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.Qualifier>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = qualifierFromJsonable(jsonableItem, options);
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.ReferenceElement>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        qualifiers = items;
+        break;
+      }
+
+      case "embeddedDataSpecifications": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.ReferenceElement>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.EmbeddedDataSpecification>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = embeddedDataSpecificationFromJsonable(
+            jsonableItem,
+            options
+          );
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.ReferenceElement>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        embeddedDataSpecifications = items;
+        break;
+      }
+
+      case "value": {
+        const parsedOrError = referenceFromJsonable(jsonableValue, options);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.ReferenceElement>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        value = parsedOrError.mustValue();
+        break;
+      }
+
+      default:
+        // NOTE (mristin, 2022-11-30):
+        // Since we conflate here a JavaScript object with a JSON object, we ignore
+        // properties which we do not know how to de-serialize and assume they are
+        // related to the *JavaScript* properties of the object or `Object` prototype.
+        // The property `modelType` is only relevant for the dispatch, so we skip it.
+        break;
+    }
+  }
+
+  return newDeserialized<AasTypes.ReferenceElement>(
+    new AasTypes.ReferenceElement(
+      extensions,
+      category,
+      idShort,
+      displayName,
+      description,
+      checksum,
+      kind,
+      semanticId,
+      supplementalSemanticIds,
+      qualifiers,
+      embeddedDataSpecifications,
+      value
+    ),
+    options
+  );
+}
+
+/**
+ * Parse an instance of {@link types!Blob} from the JSON-able
+ * structure `jsonable`.
+ *
+ * @param jsonable - structure to be parsed
+ * @param options - to control the de-serialization, if any
+ * @returns parsed instance of {@link types!Blob},
+ * or an error if any
+ */
+export function blobFromJsonable(
+  jsonable: AasJsonization.JsonValue,
+  options: DeserializationOptions | null = null
+): AasCommon.Either<AasTypes.Blob, AasJsonization.DeserializationError> {
+  if (jsonable === null) {
+    return newDeserializationError<AasTypes.Blob>(
+      "Expected a JSON object, but got null"
+    );
+  }
+  if (Array.isArray(jsonable)) {
+    return newDeserializationError<AasTypes.Blob>(
+      "Expected a JSON object, but got a JSON array"
+    );
+  }
+  if (typeof jsonable !== "object") {
+    return newDeserializationError<AasTypes.Blob>(
+      `Expected a JSON object, but got: ${typeof jsonable}`
+    );
+  }
+
+  let extensions: Array<AasTypes.Extension> | null = null;
+  let category: string | null = null;
+  let idShort: string | null = null;
+  let displayName: Array<AasTypes.LangString> | null = null;
+  let description: Array<AasTypes.LangString> | null = null;
+  let checksum: string | null = null;
+  let kind: AasTypes.ModelingKind | null = null;
+  let semanticId: AasTypes.Reference | null = null;
+  let supplementalSemanticIds: Array<AasTypes.Reference> | null = null;
+  let qualifiers: Array<AasTypes.Qualifier> | null = null;
+  let embeddedDataSpecifications: Array<AasTypes.EmbeddedDataSpecification> | null =
+    null;
+  let value: Uint8Array | null = null;
+  let encodedValue: string | null = null;
+  let contentType: string | null = null;
+
+  const projected = projectedProperties(options, "Blob");
+
+  for (const key in jsonable) {
+    if (projected !== null && !projected.has(key)) {
+      continue;
+    }
+
+    const jsonableValue = jsonable[key];
+
+    switch (key) {
+      case "extensions": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Blob>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.Extension>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = extensionFromJsonable(jsonableItem, options);
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.Blob>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        extensions = items;
+        break;
+      }
+
+      case "category": {
+        const parsedOrError = stringFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Blob>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        category = parsedOrError.mustValue();
+        break;
+      }
+
+      case "idShort": {
+        const parsedOrError = stringFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Blob>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        idShort = parsedOrError.mustValue();
+        break;
+      }
+
+      case "displayName": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Blob>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.LangString>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = langStringFromJsonable(jsonableItem, options);
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.Blob>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        displayName = items;
+        break;
+      }
+
+      case "description": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Blob>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.LangString>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = langStringFromJsonable(jsonableItem, options);
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.Blob>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        description = items;
+        break;
+      }
+
+      case "checksum": {
+        const parsedOrError = stringFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Blob>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        checksum = parsedOrError.mustValue();
+        break;
+      }
+
+      case "kind": {
+        const parsedOrError = AasJsonization.modelingKindFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Blob>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        kind = parsedOrError.mustValue();
+        break;
+      }
+
+      case "semanticId": {
+        const parsedOrError = referenceFromJsonable(jsonableValue, options);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Blob>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        semanticId = parsedOrError.mustValue();
+        break;
+      }
+
+      case "supplementalSemanticIds": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Blob>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.Reference>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = referenceFromJsonable(jsonableItem, options);
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.Blob>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        supplementalSemanticIds = items;
+        break;
+      }
+
+      case "qualifiers": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Blob>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.Qualifier>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = qualifierFromJsonable(jsonableItem, options);
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.Blob>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        qualifiers = items;
+        break;
+      }
+
+      case "embeddedDataSpecifications": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Blob>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.EmbeddedDataSpecification>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = embeddedDataSpecificationFromJsonable(
+            jsonableItem,
+            options
+          );
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.Blob>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        embeddedDataSpecifications = items;
+        break;
+      }
+
+      case "value": {
+        if (options !== null && options.lazyBlobValues === true) {
+          const textOrError = base64TextFromJsonable(jsonableValue);
+          if (textOrError.error !== null) {
+            return propagatePropertyError<AasTypes.Blob>(
+              textOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+          encodedValue = textOrError.mustValue();
+          break;
+        }
+
+        const parsedOrError = bytesFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Blob>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        value = parsedOrError.mustValue();
+        break;
+      }
+
+      case "contentType": {
+        const parsedOrError = stringFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Blob>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        contentType = parsedOrError.mustValue();
+        break;
+      }
+
+      default:
+        // NOTE (mristin, 2022-11-30):
+        // Since we conflate here a JavaScript object with a JSON object, we ignore
+        // properties which we do not know how to de-serialize and assume they are
+        // related to the *JavaScript* properties of the object or `Object` prototype.
+        // The property `modelType` is only relevant for the dispatch, so we skip it.
+        break;
+    }
+  }
+
+  if (contentType === null) {
+    return newDeserializationError<AasTypes.Blob>(
+      "The required property 'contentType' is missing"
+    );
+  }
+
+  const blob = new AasTypes.Blob(
+    contentType,
+    extensions,
+    category,
+    idShort,
+    displayName,
+    description,
+    checksum,
+    kind,
+    semanticId,
+    supplementalSemanticIds,
+    qualifiers,
+    embeddedDataSpecifications,
+    value
+  );
+
+  if (encodedValue !== null) {
+    deferBlobValue(blob, encodedValue);
+  }
+
+  return newDeserialized<AasTypes.Blob>(blob, options);
+}
+
+/**
+ * Parse an instance of {@link types!File} from the JSON-able
+ * structure `jsonable`.
+ *
+ * @param jsonable - structure to be parsed
+ * @param options - to control the de-serialization, if any
+ * @returns parsed instance of {@link types!File},
+ * or an error if any
+ */
+export function fileFromJsonable(
+  jsonable: AasJsonization.JsonValue,
+  options: DeserializationOptions | null = null
+): AasCommon.Either<AasTypes.File, AasJsonization.DeserializationError> {
+  if (jsonable === null) {
+    return newDeserializationError<AasTypes.File>(
+      "Expected a JSON object, but got null"
+    );
+  }
+  if (Array.isArray(jsonable)) {
+    return newDeserializationError<AasTypes.File>(
+      "Expected a JSON object, but got a JSON array"
+    );
+  }
+  if (typeof jsonable !== "object") {
+    return newDeserializationError<AasTypes.File>(
+      `Expected a JSON object, but got: ${typeof jsonable}`
+    );
+  }
+
+  let extensions: Array<AasTypes.Extension> | null = null;
+  let category: string | null = null;
+  let idShort: string | null = null;
+  let displayName: Array<AasTypes.LangString> | null = null;
+  let description: Array<AasTypes.LangString> | null = null;
+  let checksum: string | null = null;
+  let kind: AasTypes.ModelingKind | null = null;
+  let semanticId: AasTypes.Reference | null = null;
+  let supplementalSemanticIds: Array<AasTypes.Reference> | null = null;
+  let qualifiers: Array<AasTypes.Qualifier> | null = null;
+  let embeddedDataSpecifications: Array<AasTypes.EmbeddedDataSpecification> | null =
+    null;
+  let value: string | null = null;
+  let contentType: string | null = null;
+
+  const projected = projectedProperties(options, "File");
+
+  for (const key in jsonable) {
+    if (projected !== null && !projected.has(key)) {
+      continue;
+    }
+
+    const jsonableValue = jsonable[key];
+
+    switch (key) {
+      case "extensions": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.File>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.Extension>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = extensionFromJsonable(jsonableItem, options);
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.File>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        extensions = items;
+        break;
+      }
+
+      case "category": {
+        const parsedOrError = stringFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.File>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        category = parsedOrError.mustValue();
+        break;
+      }
+
+      case "idShort": {
+        const parsedOrError = stringFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.File>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        idShort = parsedOrError.mustValue();
+        break;
+      }
+
+      case "displayName": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.File>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.LangString>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = langStringFromJsonable(jsonableItem, options);
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.File>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        displayName = items;
+        break;
+      }
+
+      case "description": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.File>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.LangString>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = langStringFromJsonable(jsonableItem, options);
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.File>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        description = items;
+        break;
+      }
+
+      case "checksum": {
+        const parsedOrError = stringFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.File>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        checksum = parsedOrError.mustValue();
+        break;
+      }
+
+      case "kind": {
+        const parsedOrError = AasJsonization.modelingKindFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.File>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        kind = parsedOrError.mustValue();
+        break;
+      }
+
+      case "semanticId": {
+        const parsedOrError = referenceFromJsonable(jsonableValue, options);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.File>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        semanticId = parsedOrError.mustValue();
+        break;
+      }
+
+      case "supplementalSemanticIds": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.File>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.Reference>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = referenceFromJsonable(jsonableItem, options);
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.File>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        supplementalSemanticIds = items;
+        break;
+      }
+
+      case "qualifiers": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.File>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.Qualifier>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = qualifierFromJsonable(jsonableItem, options);
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.File>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        qualifiers = items;
+        break;
+      }
+
+      case "embeddedDataSpecifications": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.File>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.EmbeddedDataSpecification>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = embeddedDataSpecificationFromJsonable(
+            jsonableItem,
+            options
+          );
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.File>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        embeddedDataSpecifications = items;
+        break;
+      }
+
+      case "value": {
+        const parsedOrError = stringFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.File>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        value = parsedOrError.mustValue();
+        break;
+      }
+
+      case "contentType": {
+        const parsedOrError = stringFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.File>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        contentType = parsedOrError.mustValue();
+        break;
+      }
+
+      default:
+        // NOTE (mristin, 2022-11-30):
+        // Since we conflate here a JavaScript object with a JSON object, we ignore
+        // properties which we do not know how to de-serialize and assume they are
+        // related to the *JavaScript* properties of the object or `Object` prototype.
+        // The property `modelType` is only relevant for the dispatch, so we skip it.
+        break;
+    }
+  }
+
+  if (contentType === null) {
+    return newDeserializationError<AasTypes.File>(
+      "The required property 'contentType' is missing"
+    );
+  }
+
+  return newDeserialized<AasTypes.File>(
+    new AasTypes.File(
+      contentType,
+      extensions,
+      category,
+      idShort,
+      displayName,
+      description,
+      checksum,
+      kind,
+      semanticId,
+      supplementalSemanticIds,
+      qualifiers,
+      embeddedDataSpecifications,
+      value
+    ),
+    options
+  );
+}
+
+/**
+ * Parse an instance of {@link types!AnnotatedRelationshipElement} from the JSON-able
+ * structure `jsonable`.
+ *
+ * @param jsonable - structure to be parsed
+ * @param options - to control the de-serialization, if any
+ * @returns parsed instance of {@link types!AnnotatedRelationshipElement},
+ * or an error if any
+ */
+export function annotatedRelationshipElementFromJsonable(
+  jsonable: AasJsonization.JsonValue,
+  options: DeserializationOptions | null = null
+): AasCommon.Either<
+  AasTypes.AnnotatedRelationshipElement,
+  AasJsonization.DeserializationError
+> {
+  if (jsonable === null) {
+    return newDeserializationError<AasTypes.AnnotatedRelationshipElement>(
+      "Expected a JSON object, but got null"
+    );
+  }
+  if (Array.isArray(jsonable)) {
+    return newDeserializationError<AasTypes.AnnotatedRelationshipElement>(
+      "Expected a JSON object, but got a JSON array"
+    );
+  }
+  if (typeof jsonable !== "object") {
+    return newDeserializationError<AasTypes.AnnotatedRelationshipElement>(
+      `Expected a JSON object, but got: ${typeof jsonable}`
+    );
+  }
+
+  let extensions: Array<AasTypes.Extension> | null = null;
+  let category: string | null = null;
+  let idShort: string | null = null;
+  let displayName: Array<AasTypes.LangString> | null = null;
+  let description: Array<AasTypes.LangString> | null = null;
+  let checksum: string | null = null;
+  let kind: AasTypes.ModelingKind | null = null;
+  let semanticId: AasTypes.Reference | null = null;
+  let supplementalSemanticIds: Array<AasTypes.Reference> | null = null;
+  let qualifiers: Array<AasTypes.Qualifier> | null = null;
+  let embeddedDataSpecifications: Array<AasTypes.EmbeddedDataSpecification> | null =
+    null;
+  let first: AasTypes.Reference | null = null;
+  let second: AasTypes.Reference | null = null;
+  let annotations: Array<AasTypes.IDataElement> | null = null;
+
+  const projected = projectedProperties(options, "AnnotatedRelationshipElement");
+
+  for (const key in jsonable) {
+    if (projected !== null && !projected.has(key)) {
+      continue;
+    }
+
+    const jsonableValue = jsonable[key];
+
+    switch (key) {
+      case "extensions": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.AnnotatedRelationshipElement>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.Extension>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = extensionFromJsonable(jsonableItem, options);
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.AnnotatedRelationshipElement>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        extensions = items;
+        break;
+      }
+
+      case "category": {
+        const parsedOrError = stringFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.AnnotatedRelationshipElement>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        category = parsedOrError.mustValue();
+        break;
+      }
+
+      case "idShort": {
+        const parsedOrError = stringFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.AnnotatedRelationshipElement>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        idShort = parsedOrError.mustValue();
+        break;
+      }
+
+      case "displayName": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.AnnotatedRelationshipElement>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.LangString>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = langStringFromJsonable(jsonableItem, options);
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.AnnotatedRelationshipElement>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        displayName = items;
+        break;
+      }
+
+      case "description": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.AnnotatedRelationshipElement>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.LangString>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = langStringFromJsonable(jsonableItem, options);
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.AnnotatedRelationshipElement>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        description = items;
+        break;
+      }
+
+      case "checksum": {
+        const parsedOrError = stringFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.AnnotatedRelationshipElement>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        checksum = parsedOrError.mustValue();
+        break;
+      }
+
+      case "kind": {
+        const parsedOrError = AasJsonization.modelingKindFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.AnnotatedRelationshipElement>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        kind = parsedOrError.mustValue();
+        break;
+      }
+
+      case "semanticId": {
+        const parsedOrError = referenceFromJsonable(jsonableValue, options);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.AnnotatedRelationshipElement>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        semanticId = parsedOrError.mustValue();
+        break;
+      }
+
+      case "supplementalSemanticIds": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.AnnotatedRelationshipElement>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.Reference>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = referenceFromJsonable(jsonableItem, options);
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.AnnotatedRelationshipElement>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        supplementalSemanticIds = items;
+        break;
+      }
+
+      case "qualifiers": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.AnnotatedRelationshipElement>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.Qualifier>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = qualifierFromJsonable(jsonableItem, options);
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.AnnotatedRelationshipElement>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        qualifiers = items;
+        break;
+      }
+
+      case "embeddedDataSpecifications": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.AnnotatedRelationshipElement>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.EmbeddedDataSpecification>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = embeddedDataSpecificationFromJsonable(
+            jsonableItem,
+            options
+          );
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.AnnotatedRelationshipElement>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        embeddedDataSpecifications = items;
+        break;
+      }
+
+      case "first": {
+        const parsedOrError = referenceFromJsonable(jsonableValue, options);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.AnnotatedRelationshipElement>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        first = parsedOrError.mustValue();
+        break;
+      }
+
+      case "second": {
+        const parsedOrError = referenceFromJsonable(jsonableValue, options);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.AnnotatedRelationshipElement>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        second = parsedOrError.mustValue();
+        break;
+      }
+
+      case "annotations": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.AnnotatedRelationshipElement>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.IDataElement>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = dataElementFromJsonable(jsonableItem, options);
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.AnnotatedRelationshipElement>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        annotations = items;
+        break;
+      }
+
+      default:
+        // NOTE (mristin, 2022-11-30):
+        // Since we conflate here a JavaScript object with a JSON object, we ignore
+        // properties which we do not know how to de-serialize and assume they are
+        // related to the *JavaScript* properties of the object or `Object` prototype.
+        // The property `modelType` is only relevant for the dispatch, so we skip it.
+        break;
+    }
+  }
+
+  if (first === null) {
+    return newDeserializationError<AasTypes.AnnotatedRelationshipElement>(
+      "The required property 'first' is missing"
+    );
+  }
+
+  if (second === null) {
+    return newDeserializationError<AasTypes.AnnotatedRelationshipElement>(
+      "The required property 'second' is missing"
+    );
+  }
+
+  return newDeserialized<AasTypes.AnnotatedRelationshipElement>(
+    new AasTypes.AnnotatedRelationshipElement(
+      first,
+      second,
+      extensions,
+      category,
+      idShort,
+      displayName,
+      description,
+      checksum,
+      kind,
+      semanticId,
+      supplementalSemanticIds,
+      qualifiers,
+      embeddedDataSpecifications,
+      annotations
+    ),
+    options
+  );
+}
+
+/**
+ * Parse an instance of {@link types!Entity} from the JSON-able
+ * structure `jsonable`.
+ *
+ * @param jsonable - structure to be parsed
+ * @param options - to control the de-serialization, if any
+ * @returns parsed instance of {@link types!Entity},
+ * or an error if any
+ */
+export function entityFromJsonable(
+  jsonable: AasJsonization.JsonValue,
+  options: DeserializationOptions | null = null
+): AasCommon.Either<AasTypes.Entity, AasJsonization.DeserializationError> {
+  if (jsonable === null) {
+    return newDeserializationError<AasTypes.Entity>(
+      "Expected a JSON object, but got null"
+    );
+  }
+  if (Array.isArray(jsonable)) {
+    return newDeserializationError<AasTypes.Entity>(
+      "Expected a JSON object, but got a JSON array"
+    );
+  }
+  if (typeof jsonable !== "object") {
+    return newDeserializationError<AasTypes.Entity>(
+      `Expected a JSON object, but got: ${typeof jsonable}`
+    );
+  }
+
+  let extensions: Array<AasTypes.Extension> | null = null;
+  let category: string | null = null;
+  let idShort: string | null = null;
+  let displayName: Array<AasTypes.LangString> | null = null;
+  let description: Array<AasTypes.LangString> | null = null;
+  let checksum: string | null = null;
+  let kind: AasTypes.ModelingKind | null = null;
+  let semanticId: AasTypes.Reference | null = null;
+  let supplementalSemanticIds: Array<AasTypes.Reference> | null = null;
+  let qualifiers: Array<AasTypes.Qualifier> | null = null;
+  let embeddedDataSpecifications: Array<AasTypes.EmbeddedDataSpecification> | null =
+    null;
+  let statements: Array<AasTypes.ISubmodelElement> | null = null;
+  let entityType: AasTypes.EntityType | null = null;
+  let globalAssetId: AasTypes.Reference | null = null;
+  let specificAssetId: AasTypes.SpecificAssetId | null = null;
+
+  const projected = projectedProperties(options, "Entity");
+
+  for (const key in jsonable) {
+    if (projected !== null && !projected.has(key)) {
+      continue;
+    }
+
+    const jsonableValue = jsonable[key];
+
+    switch (key) {
+      case "extensions": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Entity>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.Extension>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = extensionFromJsonable(jsonableItem, options);
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.Entity>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        extensions = items;
+        break;
+      }
+
+      case "category": {
+        const parsedOrError = stringFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Entity>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        category = parsedOrError.mustValue();
+        break;
+      }
+
+      case "idShort": {
+        const parsedOrError = stringFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Entity>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        idShort = parsedOrError.mustValue();
+        break;
+      }
+
+      case "displayName": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Entity>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.LangString>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = langStringFromJsonable(jsonableItem, options);
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.Entity>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        displayName = items;
+        break;
+      }
+
+      case "description": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Entity>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.LangString>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = langStringFromJsonable(jsonableItem, options);
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.Entity>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        description = items;
+        break;
+      }
+
+      case "checksum": {
+        const parsedOrError = stringFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Entity>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        checksum = parsedOrError.mustValue();
+        break;
+      }
+
+      case "kind": {
+        const parsedOrError = AasJsonization.modelingKindFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Entity>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        kind = parsedOrError.mustValue();
+        break;
+      }
+
+      case "semanticId": {
+        const parsedOrError = referenceFromJsonable(jsonableValue, options);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Entity>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        semanticId = parsedOrError.mustValue();
+        break;
+      }
+
+      case "supplementalSemanticIds": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Entity>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.Reference>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = referenceFromJsonable(jsonableItem, options);
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.Entity>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        supplementalSemanticIds = items;
+        break;
+      }
+
+      case "qualifiers": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Entity>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.Qualifier>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = qualifierFromJsonable(jsonableItem, options);
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.Entity>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        qualifiers = items;
+        break;
+      }
+
+      case "embeddedDataSpecifications": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Entity>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.EmbeddedDataSpecification>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = embeddedDataSpecificationFromJsonable(
+            jsonableItem,
+            options
+          );
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.Entity>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        embeddedDataSpecifications = items;
+        break;
+      }
+
+      case "statements": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Entity>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.ISubmodelElement>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = submodelElementFromJsonable(jsonableItem, options);
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.Entity>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        statements = items;
+        break;
+      }
+
+      case "entityType": {
+        const parsedOrError = AasJsonization.entityTypeFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Entity>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        entityType = parsedOrError.mustValue();
+        break;
+      }
+
+      case "globalAssetId": {
+        const parsedOrError = referenceFromJsonable(jsonableValue, options);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Entity>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        globalAssetId = parsedOrError.mustValue();
+        break;
+      }
+
+      case "specificAssetId": {
+        const parsedOrError = specificAssetIdFromJsonable(jsonableValue, options);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Entity>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        specificAssetId = parsedOrError.mustValue();
+        break;
+      }
+
+      default:
+        // NOTE (mristin, 2022-11-30):
+        // Since we conflate here a JavaScript object with a JSON object, we ignore
+        // properties which we do not know how to de-serialize and assume they are
+        // related to the *JavaScript* properties of the object or `Object` prototype.
+        // The property `modelType` is only relevant for the dispatch, so we skip it.
+        break;
+    }
+  }
+
+  if (entityType === null) {
+    return newDeserializationError<AasTypes.Entity>(
+      "The required property 'entityType' is missing"
+    );
+  }
+
+  return newDeserialized<AasTypes.Entity>(
+    new AasTypes.Entity(
+      entityType,
+      extensions,
+      category,
+      idShort,
+      displayName,
+      description,
+      checksum,
+      kind,
+      semanticId,
+      supplementalSemanticIds,
+      qualifiers,
+      embeddedDataSpecifications,
+      statements,
+      globalAssetId,
+      specificAssetId
+    ),
+    options
+  );
+}
+
+/**
+ * Parse an instance of {@link types!EventPayload} from the JSON-able
+ * structure `jsonable`.
+ *
+ * @param jsonable - structure to be parsed
+ * @param options - to control the de-serialization, if any
+ * @returns parsed instance of {@link types!EventPayload},
+ * or an error if any
+ */
+export function eventPayloadFromJsonable(
+  jsonable: AasJsonization.JsonValue,
+  options: DeserializationOptions | null = null
+): AasCommon.Either<AasTypes.EventPayload, AasJsonization.DeserializationError> {
+  if (jsonable === null) {
+    return newDeserializationError<AasTypes.EventPayload>(
+      "Expected a JSON object, but got null"
+    );
+  }
+  if (Array.isArray(jsonable)) {
+    return newDeserializationError<AasTypes.EventPayload>(
+      "Expected a JSON object, but got a JSON array"
+    );
+  }
+  if (typeof jsonable !== "object") {
+    return newDeserializationError<AasTypes.EventPayload>(
+      `Expected a JSON object, but got: ${typeof jsonable}`
+    );
+  }
+
+  let source: AasTypes.Reference | null = null;
+  let sourceSemanticId: AasTypes.Reference | null = null;
+  let observableReference: AasTypes.Reference | null = null;
+  let observableSemanticId: AasTypes.Reference | null = null;
+  let topic: string | null = null;
+  let subjectId: AasTypes.Reference | null = null;
+  let timeStamp: string | null = null;
+  let payload: string | null = null;
+
+  const projected = projectedProperties(options, "EventPayload");
+
+  for (const key in jsonable) {
+    if (projected !== null && !projected.has(key)) {
+      continue;
+    }
+
+    const jsonableValue = jsonable[key];
+
+    switch (key) {
+      case "source": {
+        const parsedOrError = referenceFromJsonable(jsonableValue, options);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.EventPayload>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        source = parsedOrError.mustValue();
+        break;
+      }
+
+      case "sourceSemanticId": {
+        const parsedOrError = referenceFromJsonable(jsonableValue, options);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.EventPayload>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        sourceSemanticId = parsedOrError.mustValue();
+        break;
+      }
+
+      case "observableReference": {
+        const parsedOrError = referenceFromJsonable(jsonableValue, options);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.EventPayload>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        observableReference = parsedOrError.mustValue();
+        break;
+      }
+
+      case "observableSemanticId": {
+        const parsedOrError = referenceFromJsonable(jsonableValue, options);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.EventPayload>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        observableSemanticId = parsedOrError.mustValue();
+        break;
+      }
+
+      case "topic": {
+        const parsedOrError = stringFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.EventPayload>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        topic = parsedOrError.mustValue();
+        break;
+      }
+
+      case "subjectId": {
+        const parsedOrError = referenceFromJsonable(jsonableValue, options);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.EventPayload>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        subjectId = parsedOrError.mustValue();
+        break;
+      }
+
+      case "timeStamp": {
+        const parsedOrError = stringFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.EventPayload>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        timeStamp = parsedOrError.mustValue();
+        break;
+      }
+
+      case "payload": {
+        const parsedOrError = stringFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.EventPayload>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        payload = parsedOrError.mustValue();
+        break;
+      }
+
+      default:
+        // NOTE (mristin, 2022-11-30):
+        // Since we conflate here a JavaScript object with a JSON object, we ignore
+        // properties which we do not know how to de-serialize and assume they are
+        // related to the *JavaScript* properties of the object or `Object` prototype.
+        // The property `modelType` is only relevant for the dispatch, so we skip it.
+        break;
+    }
+  }
+
+  if (source === null) {
+    return newDeserializationError<AasTypes.EventPayload>(
+      "The required property 'source' is missing"
+    );
+  }
+
+  if (observableReference === null) {
+    return newDeserializationError<AasTypes.EventPayload>(
+      "The required property 'observableReference' is missing"
+    );
+  }
+
+  if (timeStamp === null) {
+    return newDeserializationError<AasTypes.EventPayload>(
+      "The required property 'timeStamp' is missing"
+    );
+  }
+
+  return newDeserialized<AasTypes.EventPayload>(
+    new AasTypes.EventPayload(
+      source,
+      observableReference,
+      timeStamp,
+      sourceSemanticId,
+      observableSemanticId,
+      topic,
+      subjectId,
+      payload
+    ),
+    options
+  );
+}
+
+/**
+ * Parse `jsonable` as an instance
+ * of {@link types!IEventElement}.
+ *
+ * @param jsonable - to be parsed
+ * @param options - to control the de-serialization, if any
+ * @returns parsed instance, or error if `jsonable` is invalid
+ */
+export function eventElementFromJsonable(
+  jsonable: AasJsonization.JsonValue,
+  options: DeserializationOptions | null = null
+): AasCommon.Either<AasTypes.IEventElement, AasJsonization.DeserializationError> {
+  if (jsonable === null) {
+    return newDeserializationError<AasTypes.IEventElement>(
+      "Expected a JSON object, but got null"
+    );
+  }
+  if (Array.isArray(jsonable)) {
+    return newDeserializationError<AasTypes.IEventElement>(
+      "Expected a JSON object, but got a JSON array"
+    );
+  }
+  if (typeof jsonable !== "object") {
+    return newDeserializationError<AasTypes.IEventElement>(
+      `Expected a JSON object, but got: ${typeof jsonable}`
+    );
+  }
+
+  const modelType = jsonable["modelType"];
+  if (modelType === undefined) {
+    return newDeserializationError<AasTypes.IEventElement>(
+      "Expected the property modelType, but got none"
+    );
+  }
+
+  if (typeof modelType !== "string") {
+    return newDeserializationError<AasTypes.IEventElement>(
+      `Expected the property modelType to be a string, but got: ${typeof modelType}`
+    );
+  }
+
+  const dispatch = EVENT_ELEMENT_FROM_JSONABLE_DISPATCH.get(modelType);
+  if (dispatch === undefined) {
+    return newDeserializationError<AasTypes.IEventElement>(
+      `Unexpected model type for IEventElement: ${modelType}`
+    );
+  }
+
+  return dispatch(jsonable, options);
+}
+
+/**
+ * Parse an instance of {@link types!BasicEventElement} from the JSON-able
+ * structure `jsonable`.
+ *
+ * @param jsonable - structure to be parsed
+ * @param options - to control the de-serialization, if any
+ * @returns parsed instance of {@link types!BasicEventElement},
+ * or an error if any
+ */
+export function basicEventElementFromJsonable(
+  jsonable: AasJsonization.JsonValue,
+  options: DeserializationOptions | null = null
+): AasCommon.Either<AasTypes.BasicEventElement, AasJsonization.DeserializationError> {
+  if (jsonable === null) {
+    return newDeserializationError<AasTypes.BasicEventElement>(
+      "Expected a JSON object, but got null"
+    );
+  }
+  if (Array.isArray(jsonable)) {
+    return newDeserializationError<AasTypes.BasicEventElement>(
+      "Expected a JSON object, but got a JSON array"
+    );
+  }
+  if (typeof jsonable !== "object") {
+    return newDeserializationError<AasTypes.BasicEventElement>(
+      `Expected a JSON object, but got: ${typeof jsonable}`
+    );
+  }
+
+  let extensions: Array<AasTypes.Extension> | null = null;
+  let category: string | null = null;
+  let idShort: string | null = null;
+  let displayName: Array<AasTypes.LangString> | null = null;
+  let description: Array<AasTypes.LangString> | null = null;
+  let checksum: string | null = null;
+  let kind: AasTypes.ModelingKind | null = null;
+  let semanticId: AasTypes.Reference | null = null;
+  let supplementalSemanticIds: Array<AasTypes.Reference> | null = null;
+  let qualifiers: Array<AasTypes.Qualifier> | null = null;
+  let embeddedDataSpecifications: Array<AasTypes.EmbeddedDataSpecification> | null =
+    null;
+  let observed: AasTypes.Reference | null = null;
+  let direction: AasTypes.Direction | null = null;
+  let state: AasTypes.StateOfEvent | null = null;
+  let messageTopic: string | null = null;
+  let messageBroker: AasTypes.Reference | null = null;
+  let lastUpdate: string | null = null;
+  let minInterval: string | null = null;
+  let maxInterval: string | null = null;
+
+  const projected = projectedProperties(options, "BasicEventElement");
+
+  for (const key in jsonable) {
+    if (projected !== null && !projected.has(key)) {
+      continue;
+    }
+
+    const jsonableValue = jsonable[key];
+
+    switch (key) {
+      case "extensions": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.BasicEventElement>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.Extension>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = extensionFromJsonable(jsonableItem, options);
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.BasicEventElement>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        extensions = items;
+        break;
+      }
+
+      case "category": {
+        const parsedOrError = stringFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.BasicEventElement>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        category = parsedOrError.mustValue();
+        break;
+      }
+
+      case "idShort": {
+        const parsedOrError = stringFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.BasicEventElement>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        idShort = parsedOrError.mustValue();
+        break;
+      }
+
+      case "displayName": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.BasicEventElement>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.LangString>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = langStringFromJsonable(jsonableItem, options);
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.BasicEventElement>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        displayName = items;
+        break;
+      }
+
+      case "description": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.BasicEventElement>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.LangString>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = langStringFromJsonable(jsonableItem, options);
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.BasicEventElement>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        description = items;
+        break;
+      }
+
+      case "checksum": {
+        const parsedOrError = stringFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.BasicEventElement>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        checksum = parsedOrError.mustValue();
+        break;
+      }
+
+      case "kind": {
+        const parsedOrError = AasJsonization.modelingKindFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.BasicEventElement>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        kind = parsedOrError.mustValue();
+        break;
+      }
+
+      case "semanticId": {
+        const parsedOrError = referenceFromJsonable(jsonableValue, options);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.BasicEventElement>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        semanticId = parsedOrError.mustValue();
+        break;
+      }
+
+      case "supplementalSemanticIds": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.BasicEventElement>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.Reference>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = referenceFromJsonable(jsonableItem, options);
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.BasicEventElement>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        supplementalSemanticIds = items;
+        break;
+      }
+
+      case "qualifiers": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.BasicEventElement>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.Qualifier>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = qualifierFromJsonable(jsonableItem, options);
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.BasicEventElement>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        qualifiers = items;
+        break;
+      }
+
+      case "embeddedDataSpecifications": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.BasicEventElement>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.EmbeddedDataSpecification>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = embeddedDataSpecificationFromJsonable(
+            jsonableItem,
+            options
+          );
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.BasicEventElement>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        embeddedDataSpecifications = items;
+        break;
+      }
+
+      case "observed": {
+        const parsedOrError = referenceFromJsonable(jsonableValue, options);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.BasicEventElement>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        observed = parsedOrError.mustValue();
+        break;
+      }
+
+      case "direction": {
+        const parsedOrError = AasJsonization.directionFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.BasicEventElement>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        direction = parsedOrError.mustValue();
+        break;
+      }
+
+      case "state": {
+        const parsedOrError = AasJsonization.stateOfEventFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.BasicEventElement>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        state = parsedOrError.mustValue();
+        break;
+      }
+
+      case "messageTopic": {
+        const parsedOrError = stringFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.BasicEventElement>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        messageTopic = parsedOrError.mustValue();
+        break;
+      }
+
+      case "messageBroker": {
+        const parsedOrError = referenceFromJsonable(jsonableValue, options);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.BasicEventElement>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        messageBroker = parsedOrError.mustValue();
+        break;
+      }
+
+      case "lastUpdate": {
+        const parsedOrError = stringFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.BasicEventElement>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        lastUpdate = parsedOrError.mustValue();
+        break;
+      }
+
+      case "minInterval": {
+        const parsedOrError = stringFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.BasicEventElement>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        minInterval = parsedOrError.mustValue();
+        break;
+      }
+
+      case "maxInterval": {
+        const parsedOrError = stringFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.BasicEventElement>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        maxInterval = parsedOrError.mustValue();
+        break;
+      }
+
+      default:
+        // NOTE (mristin, 2022-11-30):
+        // Since we conflate here a JavaScript object with a JSON object, we ignore
+        // properties which we do not know how to de-serialize and assume they are
+        // related to the *JavaScript* properties of the object or `Object` prototype.
+        // The property `modelType` is only relevant for the dispatch, so we skip it.
+        break;
+    }
+  }
+
+  if (observed === null) {
+    return newDeserializationError<AasTypes.BasicEventElement>(
+      "The required property 'observed' is missing"
+    );
+  }
+
+  if (direction === null) {
+    return newDeserializationError<AasTypes.BasicEventElement>(
+      "The required property 'direction' is missing"
+    );
+  }
+
+  if (state === null) {
+    return newDeserializationError<AasTypes.BasicEventElement>(
+      "The required property 'state' is missing"
+    );
+  }
+
+  return newDeserialized<AasTypes.BasicEventElement>(
+    new AasTypes.BasicEventElement(
+      observed,
+      direction,
+      state,
+      extensions,
+      category,
+      idShort,
+      displayName,
+      description,
+      checksum,
+      kind,
+      semanticId,
+      supplementalSemanticIds,
+      qualifiers,
+      embeddedDataSpecifications,
+      messageTopic,
+      messageBroker,
+      lastUpdate,
+      minInterval,
+      maxInterval
+    ),
+    options
+  );
+}
+
+/**
+ * Parse an instance of {@link types!Operation} from the JSON-able
+ * structure `jsonable`.
+ *
+ * @param jsonable - structure to be parsed
+ * @param options - to control the de-serialization, if any
+ * @returns parsed instance of {@link types!Operation},
+ * or an error if any
+ */
+export function operationFromJsonable(
+  jsonable: AasJsonization.JsonValue,
+  options: DeserializationOptions | null = null
+): AasCommon.Either<AasTypes.Operation, AasJsonization.DeserializationError> {
+  if (jsonable === null) {
+    return newDeserializationError<AasTypes.Operation>(
+      "Expected a JSON object, but got null"
+    );
+  }
+  if (Array.isArray(jsonable)) {
+    return newDeserializationError<AasTypes.Operation>(
+      "Expected a JSON object, but got a JSON array"
+    );
+  }
+  if (typeof jsonable !== "object") {
+    return newDeserializationError<AasTypes.Operation>(
+      `Expected a JSON object, but got: ${typeof jsonable}`
+    );
+  }
+
+  let extensions: Array<AasTypes.Extension> | null = null;
+  let category: string | null = null;
+  let idShort: string | null = null;
+  let displayName: Array<AasTypes.LangString> | null = null;
+  let description: Array<AasTypes.LangString> | null = null;
+  let checksum: string | null = null;
+  let kind: AasTypes.ModelingKind | null = null;
+  let semanticId: AasTypes.Reference | null = null;
+  let supplementalSemanticIds: Array<AasTypes.Reference> | null = null;
+  let qualifiers: Array<AasTypes.Qualifier> | null = null;
+  let embeddedDataSpecifications: Array<AasTypes.EmbeddedDataSpecification> | null =
+    null;
+  let inputVariables: Array<AasTypes.OperationVariable> | null = null;
+  let outputVariables: Array<AasTypes.OperationVariable> | null = null;
+  let inoutputVariables: Array<AasTypes.OperationVariable> | null = null;
+
+  const projected = projectedProperties(options, "Operation");
+
+  for (const key in jsonable) {
+    if (projected !== null && !projected.has(key)) {
+      continue;
+    }
+
+    const jsonableValue = jsonable[key];
+
+    switch (key) {
+      case "extensions": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Operation>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.Extension>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = extensionFromJsonable(jsonableItem, options);
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.Operation>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        extensions = items;
+        break;
+      }
+
+      case "category": {
+        const parsedOrError = stringFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Operation>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        category = parsedOrError.mustValue();
+        break;
+      }
+
+      case "idShort": {
+        const parsedOrError = stringFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Operation>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        idShort = parsedOrError.mustValue();
+        break;
+      }
+
+      case "displayName": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Operation>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.LangString>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = langStringFromJsonable(jsonableItem, options);
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.Operation>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        displayName = items;
+        break;
+      }
+
+      case "description": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Operation>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.LangString>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = langStringFromJsonable(jsonableItem, options);
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.Operation>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        description = items;
+        break;
+      }
+
+      case "checksum": {
+        const parsedOrError = stringFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Operation>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        checksum = parsedOrError.mustValue();
+        break;
+      }
+
+      case "kind": {
+        const parsedOrError = AasJsonization.modelingKindFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Operation>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        kind = parsedOrError.mustValue();
+        break;
+      }
+
+      case "semanticId": {
+        const parsedOrError = referenceFromJsonable(jsonableValue, options);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Operation>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        semanticId = parsedOrError.mustValue();
+        break;
+      }
+
+      case "supplementalSemanticIds": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Operation>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.Reference>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = referenceFromJsonable(jsonableItem, options);
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.Operation>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        supplementalSemanticIds = items;
+        break;
+      }
+
+      case "qualifiers": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Operation>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.Qualifier>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = qualifierFromJsonable(jsonableItem, options);
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.Operation>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        qualifiers = items;
+        break;
+      }
+
+      case "embeddedDataSpecifications": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Operation>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.EmbeddedDataSpecification>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = embeddedDataSpecificationFromJsonable(
+            jsonableItem,
+            options
+          );
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.Operation>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        embeddedDataSpecifications = items;
+        break;
+      }
+
+      case "inputVariables": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Operation>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.OperationVariable>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = operationVariableFromJsonable(jsonableItem, options);
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.Operation>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        inputVariables = items;
+        break;
+      }
+
+      case "outputVariables": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Operation>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.OperationVariable>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = operationVariableFromJsonable(jsonableItem, options);
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.Operation>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        outputVariables = items;
+        break;
+      }
+
+      case "inoutputVariables": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Operation>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.OperationVariable>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = operationVariableFromJsonable(jsonableItem, options);
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.Operation>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        inoutputVariables = items;
+        break;
+      }
+
+      default:
+        // NOTE (mristin, 2022-11-30):
+        // Since we conflate here a JavaScript object with a JSON object, we ignore
+        // properties which we do not know how to de-serialize and assume they are
+        // related to the *JavaScript* properties of the object or `Object` prototype.
+        // The property `modelType` is only relevant for the dispatch, so we skip it.
+        break;
+    }
+  }
+
+  return newDeserialized<AasTypes.Operation>(
+    new AasTypes.Operation(
+      extensions,
+      category,
+      idShort,
+      displayName,
+      description,
+      checksum,
+      kind,
+      semanticId,
+      supplementalSemanticIds,
+      qualifiers,
+      embeddedDataSpecifications,
+      inputVariables,
+      outputVariables,
+      inoutputVariables
+    ),
+    options
+  );
+}
+
+/**
+ * Parse an instance of {@link types!OperationVariable} from the JSON-able
+ * structure `jsonable`.
+ *
+ * @param jsonable - structure to be parsed
+ * @param options - to control the de-serialization, if any
+ * @returns parsed instance of {@link types!OperationVariable},
+ * or an error if any
+ */
+export function operationVariableFromJsonable(
+  jsonable: AasJsonization.JsonValue,
+  options: DeserializationOptions | null = null
+): AasCommon.Either<AasTypes.OperationVariable, AasJsonization.DeserializationError> {
+  if (jsonable === null) {
+    return newDeserializationError<AasTypes.OperationVariable>(
+      "Expected a JSON object, but got null"
+    );
+  }
+  if (Array.isArray(jsonable)) {
+    return newDeserializationError<AasTypes.OperationVariable>(
+      "Expected a JSON object, but got a JSON array"
+    );
+  }
+  if (typeof jsonable !== "object") {
+    return newDeserializationError<AasTypes.OperationVariable>(
+      `Expected a JSON object, but got: ${typeof jsonable}`
+    );
+  }
+
+  let value: AasTypes.ISubmodelElement | null = null;
+
+  const projected = projectedProperties(options, "OperationVariable");
+
+  for (const key in jsonable) {
+    if (projected !== null && !projected.has(key)) {
+      continue;
+    }
+
+    const jsonableValue = jsonable[key];
+
+    switch (key) {
+      case "value": {
+        const parsedOrError = submodelElementFromJsonable(jsonableValue, options);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.OperationVariable>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        value = parsedOrError.mustValue();
+        break;
+      }
+
+      default:
+        // NOTE (mristin, 2022-11-30):
+        // Since we conflate here a JavaScript object with a JSON object, we ignore
+        // properties which we do not know how to de-serialize and assume they are
+        // related to the *JavaScript* properties of the object or `Object` prototype.
+        // The property `modelType` is only relevant for the dispatch, so we skip it.
+        break;
+    }
+  }
+
+  if (value === null) {
+    return newDeserializationError<AasTypes.OperationVariable>(
+      "The required property 'value' is missing"
+    );
+  }
+
+  return newDeserialized<AasTypes.OperationVariable>(
+    new AasTypes.OperationVariable(value),
+    options
+  );
+}
+
+/**
+ * Parse an instance of {@link types!Capability} from the JSON-able
+ * structure `jsonable`.
+ *
+ * @param jsonable - structure to be parsed
+ * @param options - to control the de-serialization, if any
+ * @returns parsed instance of {@link types!Capability},
+ * or an error if any
+ */
+export function capabilityFromJsonable(
+  jsonable: AasJsonization.JsonValue,
+  options: DeserializationOptions | null = null
+): AasCommon.Either<AasTypes.Capability, AasJsonization.DeserializationError> {
+  if (jsonable === null) {
+    return newDeserializationError<AasTypes.Capability>(
+      "Expected a JSON object, but got null"
+    );
+  }
+  if (Array.isArray(jsonable)) {
+    return newDeserializationError<AasTypes.Capability>(
+      "Expected a JSON object, but got a JSON array"
+    );
+  }
+  if (typeof jsonable !== "object") {
+    return newDeserializationError<AasTypes.Capability>(
+      `Expected a JSON object, but got: ${typeof jsonable}`
+    );
+  }
+
+  let extensions: Array<AasTypes.Extension> | null = null;
+  let category: string | null = null;
+  let idShort: string | null = null;
+  let displayName: Array<AasTypes.LangString> | null = null;
+  let description: Array<AasTypes.LangString> | null = null;
+  let checksum: string | null = null;
+  let kind: AasTypes.ModelingKind | null = null;
+  let semanticId: AasTypes.Reference | null = null;
+  let supplementalSemanticIds: Array<AasTypes.Reference> | null = null;
+  let qualifiers: Array<AasTypes.Qualifier> | null = null;
+  let embeddedDataSpecifications: Array<AasTypes.EmbeddedDataSpecification> | null =
+    null;
+
+  const projected = projectedProperties(options, "Capability");
+
+  for (const key in jsonable) {
+    if (projected !== null && !projected.has(key)) {
+      continue;
+    }
+
+    const jsonableValue = jsonable[key];
+
+    switch (key) {
+      case "extensions": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Capability>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.Extension>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = extensionFromJsonable(jsonableItem, options);
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.Capability>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        extensions = items;
+        break;
+      }
+
+      case "category": {
+        const parsedOrError = stringFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Capability>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        category = parsedOrError.mustValue();
+        break;
+      }
+
+      case "idShort": {
+        const parsedOrError = stringFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Capability>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        idShort = parsedOrError.mustValue();
+        break;
+      }
+
+      case "displayName": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Capability>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.LangString>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = langStringFromJsonable(jsonableItem, options);
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.Capability>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        displayName = items;
+        break;
+      }
+
+      case "description": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Capability>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.LangString>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = langStringFromJsonable(jsonableItem, options);
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.Capability>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        description = items;
+        break;
+      }
+
+      case "checksum": {
+        const parsedOrError = stringFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Capability>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        checksum = parsedOrError.mustValue();
+        break;
+      }
+
+      case "kind": {
+        const parsedOrError = AasJsonization.modelingKindFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Capability>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        kind = parsedOrError.mustValue();
+        break;
+      }
+
+      case "semanticId": {
+        const parsedOrError = referenceFromJsonable(jsonableValue, options);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Capability>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        semanticId = parsedOrError.mustValue();
+        break;
+      }
+
+      case "supplementalSemanticIds": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Capability>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.Reference>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = referenceFromJsonable(jsonableItem, options);
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.Capability>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        supplementalSemanticIds = items;
+        break;
+      }
+
+      case "qualifiers": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Capability>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.Qualifier>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = qualifierFromJsonable(jsonableItem, options);
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.Capability>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        qualifiers = items;
+        break;
+      }
+
+      case "embeddedDataSpecifications": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Capability>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.EmbeddedDataSpecification>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = embeddedDataSpecificationFromJsonable(
+            jsonableItem,
+            options
+          );
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.Capability>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        embeddedDataSpecifications = items;
+        break;
+      }
+
+      default:
+        // NOTE (mristin, 2022-11-30):
+        // Since we conflate here a JavaScript object with a JSON object, we ignore
+        // properties which we do not know how to de-serialize and assume they are
+        // related to the *JavaScript* properties of the object or `Object` prototype.
+        // The property `modelType` is only relevant for the dispatch, so we skip it.
+        break;
+    }
+  }
+
+  return newDeserialized<AasTypes.Capability>(
+    new AasTypes.Capability(
+      extensions,
+      category,
+      idShort,
+      displayName,
+      description,
+      checksum,
+      kind,
+      semanticId,
+      supplementalSemanticIds,
+      qualifiers,
+      embeddedDataSpecifications
+    ),
+    options
+  );
+}
+
+/**
+ * Parse an instance of {@link types!ConceptDescription} from the JSON-able
+ * structure `jsonable`.
+ *
+ * @param jsonable - structure to be parsed
+ * @param options - to control the de-serialization, if any
+ * @returns parsed instance of {@link types!ConceptDescription},
+ * or an error if any
+ */
+export function conceptDescriptionFromJsonable(
+  jsonable: AasJsonization.JsonValue,
+  options: DeserializationOptions | null = null
+): AasCommon.Either<AasTypes.ConceptDescription, AasJsonization.DeserializationError> {
+  if (jsonable === null) {
+    return newDeserializationError<AasTypes.ConceptDescription>(
+      "Expected a JSON object, but got null"
+    );
+  }
+  if (Array.isArray(jsonable)) {
+    return newDeserializationError<AasTypes.ConceptDescription>(
+      "Expected a JSON object, but got a JSON array"
+    );
+  }
+  if (typeof jsonable !== "object") {
+    return newDeserializationError<AasTypes.ConceptDescription>(
+      `Expected a JSON object, but got: ${typeof jsonable}`
+    );
+  }
+
+  let extensions: Array<AasTypes.Extension> | null = null;
+  let category: string | null = null;
+  let idShort: string | null = null;
+  let displayName: Array<AasTypes.LangString> | null = null;
+  let description: Array<AasTypes.LangString> | null = null;
+  let checksum: string | null = null;
+  let administration: AasTypes.AdministrativeInformation | null = null;
+  let id: string | null = null;
+  let embeddedDataSpecifications: Array<AasTypes.EmbeddedDataSpecification> | null =
+    null;
+  let isCaseOf: Array<AasTypes.Reference> | null = null;
+
+  const projected = projectedProperties(options, "ConceptDescription");
+
+  for (const key in jsonable) {
+    if (projected !== null && !projected.has(key)) {
+      continue;
+    }
+
+    const jsonableValue = jsonable[key];
+
+    switch (key) {
+      case "extensions": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.ConceptDescription>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.Extension>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = extensionFromJsonable(jsonableItem, options);
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.ConceptDescription>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        extensions = items;
+        break;
+      }
+
+      case "category": {
+        const parsedOrError = stringFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.ConceptDescription>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        category = parsedOrError.mustValue();
+        break;
+      }
+
+      case "idShort": {
+        const parsedOrError = stringFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.ConceptDescription>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        idShort = parsedOrError.mustValue();
+        break;
+      }
+
+      case "displayName": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.ConceptDescription>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.LangString>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = langStringFromJsonable(jsonableItem, options);
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.ConceptDescription>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        displayName = items;
+        break;
+      }
+
+      case "description": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.ConceptDescription>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.LangString>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = langStringFromJsonable(jsonableItem, options);
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.ConceptDescription>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        description = items;
+        break;
+      }
+
+      case "checksum": {
+        const parsedOrError = stringFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.ConceptDescription>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        checksum = parsedOrError.mustValue();
+        break;
+      }
+
+      case "administration": {
+        const parsedOrError = administrativeInformationFromJsonable(
+          jsonableValue,
+          options
+        );
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.ConceptDescription>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        administration = parsedOrError.mustValue();
+        break;
+      }
+
+      case "id": {
+        const parsedOrError = stringFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.ConceptDescription>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        id = parsedOrError.mustValue();
+        break;
+      }
+
+      case "embeddedDataSpecifications": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.ConceptDescription>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.EmbeddedDataSpecification>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = embeddedDataSpecificationFromJsonable(
+            jsonableItem,
+            options
+          );
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.ConceptDescription>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        embeddedDataSpecifications = items;
+        break;
+      }
+
+      case "isCaseOf": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.ConceptDescription>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.Reference>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = referenceFromJsonable(jsonableItem, options);
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.ConceptDescription>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        isCaseOf = items;
+        break;
+      }
+
+      default:
+        // NOTE (mristin, 2022-11-30):
+        // Since we conflate here a JavaScript object with a JSON object, we ignore
+        // properties which we do not know how to de-serialize and assume they are
+        // related to the *JavaScript* properties of the object or `Object` prototype.
+        // The property `modelType` is only relevant for the dispatch, so we skip it.
+        break;
+    }
+  }
+
+  if (id === null) {
+    return newDeserializationError<AasTypes.ConceptDescription>(
+      "The required property 'id' is missing"
+    );
+  }
+
+  return newDeserialized<AasTypes.ConceptDescription>(
+    new AasTypes.ConceptDescription(
+      id,
+      extensions,
+      category,
+      idShort,
+      displayName,
+      description,
+      checksum,
+      administration,
+      embeddedDataSpecifications,
+      isCaseOf
+    ),
+    options
+  );
+}
+
+/**
+ * Parse an instance of {@link types!Reference} from the JSON-able
+ * structure `jsonable`.
+ *
+ * @param jsonable - structure to be parsed
+ * @param options - to control the de-serialization, if any
+ * @returns parsed instance of {@link types!Reference},
+ * or an error if any
+ */
+export function referenceFromJsonable(
+  jsonable: AasJsonization.JsonValue,
+  options: DeserializationOptions | null = null
+): AasCommon.Either<AasTypes.Reference, AasJsonization.DeserializationError> {
+  if (jsonable === null) {
+    return newDeserializationError<AasTypes.Reference>(
+      "Expected a JSON object, but got null"
+    );
+  }
+  if (Array.isArray(jsonable)) {
+    return newDeserializationError<AasTypes.Reference>(
+      "Expected a JSON object, but got a JSON array"
+    );
+  }
+  if (typeof jsonable !== "object") {
+    return newDeserializationError<AasTypes.Reference>(
+      `Expected a JSON object, but got: ${typeof jsonable}`
+    );
+  }
+
+  let type: AasTypes.ReferenceTypes | null = null;
+  let referredSemanticId: AasTypes.Reference | null = null;
+  let keys: Array<AasTypes.Key> | null = null;
+
+  const projected = projectedProperties(options, "Reference");
+
+  for (const key in jsonable) {
+    if (projected !== null && !projected.has(key)) {
+      continue;
+    }
+
+    const jsonableValue = jsonable[key];
+
+    switch (key) {
+      case "type": {
+        const parsedOrError = AasJsonization.referenceTypesFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Reference>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        type = parsedOrError.mustValue();
+        break;
+      }
+
+      case "referredSemanticId": {
+        const parsedOrError = referenceFromJsonable(jsonableValue, options);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Reference>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        referredSemanticId = parsedOrError.mustValue();
+        break;
+      }
+
+      case "keys": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Reference>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.Key>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = keyFromJsonable(jsonableItem, options);
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.Reference>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        keys = items;
+        break;
+      }
+
+      default:
+        // NOTE (mristin, 2022-11-30):
+        // Since we conflate here a JavaScript object with a JSON object, we ignore
+        // properties which we do not know how to de-serialize and assume they are
+        // related to the *JavaScript* properties of the object or `Object` prototype.
+        // The property `modelType` is only relevant for the dispatch, so we skip it.
+        break;
+    }
+  }
+
+  if (type === null) {
+    return newDeserializationError<AasTypes.Reference>(
+      "The required property 'type' is missing"
+    );
+  }
+
+  if (keys === null) {
+    return newDeserializationError<AasTypes.Reference>(
+      "The required property 'keys' is missing"
+    );
+  }
+
+  const instance = new AasTypes.Reference(type, keys, referredSemanticId);
+
+  return newDeserialized<AasTypes.Reference>(
+    options !== null && options.interning !== undefined
+      ? options.interning.internReference(instance)
+      : instance,
+    options
+  );
+}
+
+/**
+ * Parse an instance of {@link types!Key} from the JSON-able
+ * structure `jsonable`.
+ *
+ * @param jsonable - structure to be parsed
+ * @param options - to control the de-serialization, if any
+ * @returns parsed instance of {@link types!Key},
+ * or an error if any
+ */
+export function keyFromJsonable(
+  jsonable: AasJsonization.JsonValue,
+  options: DeserializationOptions | null = null
+): AasCommon.Either<AasTypes.Key, AasJsonization.DeserializationError> {
+  if (jsonable === null) {
+    return newDeserializationError<AasTypes.Key>(
+      "Expected a JSON object, but got null"
+    );
+  }
+  if (Array.isArray(jsonable)) {
+    return newDeserializationError<AasTypes.Key>(
+      "Expected a JSON object, but got a JSON array"
+    );
+  }
+  if (typeof jsonable !== "object") {
+    return newDeserializationError<AasTypes.Key>(
+      `Expected a JSON object, but got: ${typeof jsonable}`
+    );
+  }
+
+  let type: AasTypes.KeyTypes | null = null;
+  let value: string | null = null;
+
+  const projected = projectedProperties(options, "Key");
+
+  for (const key in jsonable) {
+    if (projected !== null && !projected.has(key)) {
+      continue;
+    }
+
+    const jsonableValue = jsonable[key];
+
+    switch (key) {
+      case "type": {
+        const parsedOrError = AasJsonization.keyTypesFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Key>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        type = parsedOrError.mustValue();
+        break;
+      }
+
+      case "value": {
+        const parsedOrError = stringFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Key>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        value = parsedOrError.mustValue();
+        break;
+      }
+
+      default:
+        // NOTE (mristin, 2022-11-30):
+        // Since we conflate here a JavaScript object with a JSON object, we ignore
+        // properties which we do not know how to de-serialize and assume they are
+        // related to the *JavaScript* properties of the object or `Object` prototype.
+        // The property `modelType` is only relevant for the dispatch, so we skip it.
+        break;
+    }
+  }
+
+  if (type === null) {
+    return newDeserializationError<AasTypes.Key>(
+      "The required property 'type' is missing"
+    );
+  }
+
+  if (value === null) {
+    return newDeserializationError<AasTypes.Key>(
+      "The required property 'value' is missing"
+    );
+  }
+
+  const instance = new AasTypes.Key(type, value);
+
+  return newDeserialized<AasTypes.Key>(
+    options !== null && options.interning !== undefined
+      ? options.interning.internKey(instance)
+      : instance,
+    options
+  );
+}
+
+/**
+ * Parse an instance of {@link types!LangString} from the JSON-able
+ * structure `jsonable`.
+ *
+ * @param jsonable - structure to be parsed
+ * @param options - to control the de-serialization, if any
+ * @returns parsed instance of {@link types!LangString},
+ * or an error if any
+ */
+export function langStringFromJsonable(
+  jsonable: AasJsonization.JsonValue,
+  options: DeserializationOptions | null = null
+): AasCommon.Either<AasTypes.LangString, AasJsonization.DeserializationError> {
+  if (jsonable === null) {
+    return newDeserializationError<AasTypes.LangString>(
+      "Expected a JSON object, but got null"
+    );
+  }
+  if (Array.isArray(jsonable)) {
+    return newDeserializationError<AasTypes.LangString>(
+      "Expected a JSON object, but got a JSON array"
+    );
+  }
+  if (typeof jsonable !== "object") {
+    return newDeserializationError<AasTypes.LangString>(
+      `Expected a JSON object, but got: ${typeof jsonable}`
+    );
+  }
+
+  let language: string | null = null;
+  let text: string | null = null;
+
+  const projected = projectedProperties(options, "LangString");
+
+  for (const key in jsonable) {
+    if (projected !== null && !projected.has(key)) {
+      continue;
+    }
+
+    const jsonableValue = jsonable[key];
+
+    switch (key) {
+      case "language": {
+        const parsedOrError = stringFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.LangString>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        language = parsedOrError.mustValue();
+        break;
+      }
+
+      case "text": {
+        const parsedOrError = stringFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.LangString>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        text = parsedOrError.mustValue();
+        break;
+      }
+
+      default:
+        // NOTE (mristin, 2022-11-30):
+        // Since we conflate here a JavaScript object with a JSON object, we ignore
+        // properties which we do not know how to de-serialize and assume they are
+        // related to the *JavaScript* properties of the object or `Object` prototype.
+        // The property `modelType` is only relevant for the dispatch, so we skip it.
+        break;
+    }
+  }
+
+  if (language === null) {
+    return newDeserializationError<AasTypes.LangString>(
+      "The required property 'language' is missing"
+    );
+  }
+
+  if (text === null) {
+    return newDeserializationError<AasTypes.LangString>(
+      "The required property 'text' is missing"
+    );
+  }
+
+  const instance = new AasTypes.LangString(language, text);
+
+  return newDeserialized<AasTypes.LangString>(
+    options !== null && options.interning !== undefined
+      ? options.interning.internLangString(instance)
+      : instance,
+    options
+  );
+}
+
+/**
+ * Parse an instance of {@link types!Environment} from the JSON-able
+ * structure `jsonable`.
+ *
+ * @param jsonable - structure to be parsed
+ * @param options - to control the de-serialization, if any
+ * @returns parsed instance of {@link types!Environment},
+ * or an error if any
+ */
+export function environmentFromJsonable(
+  jsonable: AasJsonization.JsonValue,
+  options: DeserializationOptions | null = null
+): AasCommon.Either<AasTypes.Environment, AasJsonization.DeserializationError> {
+  if (jsonable === null) {
+    return newDeserializationError<AasTypes.Environment>(
+      "Expected a JSON object, but got null"
+    );
+  }
+  if (Array.isArray(jsonable)) {
+    return newDeserializationError<AasTypes.Environment>(
+      "Expected a JSON object, but got a JSON array"
+    );
+  }
+  if (typeof jsonable !== "object") {
+    return newDeserializationError<AasTypes.Environment>(
+      `Expected a JSON object, but got: ${typeof jsonable}`
+    );
+  }
+
+  let assetAdministrationShells: Array<AasTypes.AssetAdministrationShell> | null = null;
+  let submodels: Array<AasTypes.Submodel> | null = null;
+  let conceptDescriptions: Array<AasTypes.ConceptDescription> | null = null;
+
+  const projected = projectedProperties(options, "Environment");
+
+  for (const key in jsonable) {
+    if (projected !== null && !projected.has(key)) {
+      continue;
+    }
+
+    const jsonableValue = jsonable[key];
+
+    switch (key) {
+      case "assetAdministrationShells": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Environment>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.AssetAdministrationShell>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = assetAdministrationShellFromJsonable(
+            jsonableItem,
+            options
+          );
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.Environment>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        assetAdministrationShells = items;
+        break;
+      }
+
+      case "submodels": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Environment>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.Submodel>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = submodelFromJsonable(jsonableItem, options);
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.Environment>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        submodels = items;
+        break;
+      }
+
+      case "conceptDescriptions": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.Environment>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.ConceptDescription>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = conceptDescriptionFromJsonable(jsonableItem, options);
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.Environment>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        conceptDescriptions = items;
+        break;
+      }
+
+      default:
+        // NOTE (mristin, 2022-11-30):
+        // Since we conflate here a JavaScript object with a JSON object, we ignore
+        // properties which we do not know how to de-serialize and assume they are
+        // related to the *JavaScript* properties of the object or `Object` prototype.
+        // The property `modelType` is only relevant for the dispatch, so we skip it.
+        break;
+    }
+  }
+
+  if (submodels !== null && options !== null && options.lazySubmodelElements === true) {
+    locateDeferredSubmodelElements(<AasJsonization.JsonObject>jsonable, submodels);
+  }
+
+  return newDeserialized<AasTypes.Environment>(
+    new AasTypes.Environment(assetAdministrationShells, submodels, conceptDescriptions),
+    options
+  );
+}
+
+/**
+ * Parse `jsonable` as an instance
+ * of {@link types!IDataSpecificationContent}.
+ *
+ * @param jsonable - to be parsed
+ * @param options - to control the de-serialization, if any
+ * @returns parsed instance, or error if `jsonable` is invalid
+ */
+export function dataSpecificationContentFromJsonable(
+  jsonable: AasJsonization.JsonValue,
+  options: DeserializationOptions | null = null
+): AasCommon.Either<
+  AasTypes.IDataSpecificationContent,
+  AasJsonization.DeserializationError
+> {
+  if (jsonable === null) {
+    return newDeserializationError<AasTypes.IDataSpecificationContent>(
+      "Expected a JSON object, but got null"
+    );
+  }
+  if (Array.isArray(jsonable)) {
+    return newDeserializationError<AasTypes.IDataSpecificationContent>(
+      "Expected a JSON object, but got a JSON array"
+    );
+  }
+  if (typeof jsonable !== "object") {
+    return newDeserializationError<AasTypes.IDataSpecificationContent>(
+      `Expected a JSON object, but got: ${typeof jsonable}`
+    );
+  }
+
+  const modelType = jsonable["modelType"];
+  if (modelType === undefined) {
+    return newDeserializationError<AasTypes.IDataSpecificationContent>(
+      "Expected the property modelType, but got none"
+    );
+  }
+
+  if (typeof modelType !== "string") {
+    return newDeserializationError<AasTypes.IDataSpecificationContent>(
+      `Expected the property modelType to be a string, but got: ${typeof modelType}`
+    );
+  }
+
+  const dispatch = DATA_SPECIFICATION_CONTENT_FROM_JSONABLE_DISPATCH.get(modelType);
+  if (dispatch === undefined) {
+    return newDeserializationError<AasTypes.IDataSpecificationContent>(
+      `Unexpected model type for IDataSpecificationContent: ${modelType}`
+    );
+  }
+
+  return dispatch(jsonable, options);
+}
+
+/**
+ * Parse an instance of {@link types!EmbeddedDataSpecification} from the JSON-able
+ * structure `jsonable`.
+ *
+ * @param jsonable - structure to be parsed
+ * @param options - to control the de-serialization, if any
+ * @returns parsed instance of {@link types!EmbeddedDataSpecification},
+ * or an error if any
+ */
+export function embeddedDataSpecificationFromJsonable(
+  jsonable: AasJsonization.JsonValue,
+  options: DeserializationOptions | null = null
+): AasCommon.Either<
+  AasTypes.EmbeddedDataSpecification,
+  AasJsonization.DeserializationError
+> {
+  if (jsonable === null) {
+    return newDeserializationError<AasTypes.EmbeddedDataSpecification>(
+      "Expected a JSON object, but got null"
+    );
+  }
+  if (Array.isArray(jsonable)) {
+    return newDeserializationError<AasTypes.EmbeddedDataSpecification>(
+      "Expected a JSON object, but got a JSON array"
+    );
+  }
+  if (typeof jsonable !== "object") {
+    return newDeserializationError<AasTypes.EmbeddedDataSpecification>(
+      `Expected a JSON object, but got: ${typeof jsonable}`
+    );
+  }
+
+  let dataSpecification: AasTypes.Reference | null = null;
+  let dataSpecificationContent: AasTypes.IDataSpecificationContent | null = null;
+
+  const projected = projectedProperties(options, "EmbeddedDataSpecification");
+
+  for (const key in jsonable) {
+    if (projected !== null && !projected.has(key)) {
+      continue;
+    }
+
+    const jsonableValue = jsonable[key];
+
+    switch (key) {
+      case "dataSpecification": {
+        const parsedOrError = referenceFromJsonable(jsonableValue, options);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.EmbeddedDataSpecification>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        dataSpecification = parsedOrError.mustValue();
+        break;
+      }
+
+      case "dataSpecificationContent": {
+        const parsedOrError = dataSpecificationContentFromJsonable(
+          jsonableValue,
+          options
+        );
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.EmbeddedDataSpecification>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        dataSpecificationContent = parsedOrError.mustValue();
+        break;
+      }
+
+      default:
+        // NOTE (mristin, 2022-11-30):
+        // Since we conflate here a JavaScript object with a JSON object, we ignore
+        // properties which we do not know how to de-serialize and assume they are
+        // related to the *JavaScript* properties of the object or `Object` prototype.
+        // The property `modelType` is only relevant for the dispatch, so we skip it.
+        break;
+    }
+  }
+
+  if (dataSpecification === null) {
+    return newDeserializationError<AasTypes.EmbeddedDataSpecification>(
+      "The required property 'dataSpecification' is missing"
+    );
+  }
+
+  if (dataSpecificationContent === null) {
+    return newDeserializationError<AasTypes.EmbeddedDataSpecification>(
+      "The required property 'dataSpecificationContent' is missing"
+    );
+  }
+
+  return newDeserialized<AasTypes.EmbeddedDataSpecification>(
+    new AasTypes.EmbeddedDataSpecification(dataSpecification, dataSpecificationContent),
+    options
+  );
+}
+
+/**
+ * Parse an instance of {@link types!ValueReferencePair} from the JSON-able
+ * structure `jsonable`.
+ *
+ * @param jsonable - structure to be parsed
+ * @param options - to control the de-serialization, if any
+ * @returns parsed instance of {@link types!ValueReferencePair},
+ * or an error if any
+ */
+export function valueReferencePairFromJsonable(
+  jsonable: AasJsonization.JsonValue,
+  options: DeserializationOptions | null = null
+): AasCommon.Either<AasTypes.ValueReferencePair, AasJsonization.DeserializationError> {
+  if (jsonable === null) {
+    return newDeserializationError<AasTypes.ValueReferencePair>(
+      "Expected a JSON object, but got null"
+    );
+  }
+  if (Array.isArray(jsonable)) {
+    return newDeserializationError<AasTypes.ValueReferencePair>(
+      "Expected a JSON object, but got a JSON array"
+    );
+  }
+  if (typeof jsonable !== "object") {
+    return newDeserializationError<AasTypes.ValueReferencePair>(
+      `Expected a JSON object, but got: ${typeof jsonable}`
+    );
+  }
+
+  let value: string | null = null;
+  let valueId: AasTypes.Reference | null = null;
+
+  const projected = projectedProperties(options, "ValueReferencePair");
+
+  for (const key in jsonable) {
+    if (projected !== null && !projected.has(key)) {
+      continue;
+    }
+
+    const jsonableValue = jsonable[key];
+
+    switch (key) {
+      case "value": {
+        const parsedOrError = stringFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.ValueReferencePair>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        value = parsedOrError.mustValue();
+        break;
+      }
+
+      case "valueId": {
+        const parsedOrError = referenceFromJsonable(jsonableValue, options);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.ValueReferencePair>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        valueId = parsedOrError.mustValue();
+        break;
+      }
+
+      default:
+        // NOTE (mristin, 2022-11-30):
+        // Since we conflate here a JavaScript object with a JSON object, we ignore
+        // properties which we do not know how to de-serialize and assume they are
+        // related to the *JavaScript* properties of the object or `Object` prototype.
+        // The property `modelType` is only relevant for the dispatch, so we skip it.
+        break;
+    }
+  }
+
+  if (value === null) {
+    return newDeserializationError<AasTypes.ValueReferencePair>(
+      "The required property 'value' is missing"
+    );
+  }
+
+  if (valueId === null) {
+    return newDeserializationError<AasTypes.ValueReferencePair>(
+      "The required property 'valueId' is missing"
+    );
+  }
+
+  return newDeserialized<AasTypes.ValueReferencePair>(
+    new AasTypes.ValueReferencePair(value, valueId),
+    options
+  );
+}
+
+/**
+ * Parse an instance of {@link types!ValueList} from the JSON-able
+ * structure `jsonable`.
+ *
+ * @param jsonable - structure to be parsed
+ * @param options - to control the de-serialization, if any
+ * @returns parsed instance of {@link types!ValueList},
+ * or an error if any
+ */
+export function valueListFromJsonable(
+  jsonable: AasJsonization.JsonValue,
+  options: DeserializationOptions | null = null
+): AasCommon.Either<AasTypes.ValueList, AasJsonization.DeserializationError> {
+  if (jsonable === null) {
+    return newDeserializationError<AasTypes.ValueList>(
+      "Expected a JSON object, but got null"
+    );
+  }
+  if (Array.isArray(jsonable)) {
+    return newDeserializationError<AasTypes.ValueList>(
+      "Expected a JSON object, but got a JSON array"
+    );
+  }
+  if (typeof jsonable !== "object") {
+    return newDeserializationError<AasTypes.ValueList>(
+      `Expected a JSON object, but got: ${typeof jsonable}`
+    );
+  }
+
+  let valueReferencePairs: Array<AasTypes.ValueReferencePair> | null = null;
+
+  const projected = projectedProperties(options, "ValueList");
+
+  for (const key in jsonable) {
+    if (projected !== null && !projected.has(key)) {
+      continue;
+    }
+
+    const jsonableValue = jsonable[key];
+
+    switch (key) {
+      case "valueReferencePairs": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.ValueList>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.ValueReferencePair>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = valueReferencePairFromJsonable(jsonableItem, options);
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.ValueList>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        valueReferencePairs = items;
+        break;
+      }
+
+      default:
+        // NOTE (mristin, 2022-11-30):
+        // Since we conflate here a JavaScript object with a JSON object, we ignore
+        // properties which we do not know how to de-serialize and assume they are
+        // related to the *JavaScript* properties of the object or `Object` prototype.
+        // The property `modelType` is only relevant for the dispatch, so we skip it.
+        break;
+    }
+  }
+
+  if (valueReferencePairs === null) {
+    return newDeserializationError<AasTypes.ValueList>(
+      "The required property 'valueReferencePairs' is missing"
+    );
+  }
+
+  return newDeserialized<AasTypes.ValueList>(
+    new AasTypes.ValueList(valueReferencePairs),
+    options
+  );
+}
+
+/**
+ * Parse an instance of {@link types!DataSpecificationIec61360} from the JSON-able
+ * structure `jsonable`.
+ *
+ * @param jsonable - structure to be parsed
+ * @param options - to control the de-serialization, if any
+ * @returns parsed instance of {@link types!DataSpecificationIec61360},
+ * or an error if any
+ */
+export function dataSpecificationIec61360FromJsonable(
+  jsonable: AasJsonization.JsonValue,
+  options: DeserializationOptions | null = null
+): AasCommon.Either<
+  AasTypes.DataSpecificationIec61360,
+  AasJsonization.DeserializationError
+> {
+  if (jsonable === null) {
+    return newDeserializationError<AasTypes.DataSpecificationIec61360>(
+      "Expected a JSON object, but got null"
+    );
+  }
+  if (Array.isArray(jsonable)) {
+    return newDeserializationError<AasTypes.DataSpecificationIec61360>(
+      "Expected a JSON object, but got a JSON array"
+    );
+  }
+  if (typeof jsonable !== "object") {
+    return newDeserializationError<AasTypes.DataSpecificationIec61360>(
+      `Expected a JSON object, but got: ${typeof jsonable}`
+    );
+  }
+
+  let preferredName: Array<AasTypes.LangString> | null = null;
+  let shortName: Array<AasTypes.LangString> | null = null;
+  let unit: string | null = null;
+  let unitId: AasTypes.Reference | null = null;
+  let sourceOfDefinition: string | null = null;
+  let symbol: string | null = null;
+  let dataType: AasTypes.DataTypeIec61360 | null = null;
+  let definition: Array<AasTypes.LangString> | null = null;
+  let valueFormat: string | null = null;
+  let valueList: AasTypes.ValueList | null = null;
+  let value: string | null = null;
+  let levelType: AasTypes.LevelType | null = null;
+
+  const projected = projectedProperties(options, "DataSpecificationIec61360");
+
+  for (const key in jsonable) {
+    if (projected !== null && !projected.has(key)) {
+      continue;
+    }
+
+    const jsonableValue = jsonable[key];
+
+    switch (key) {
+      case "preferredName": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.DataSpecificationIec61360>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.LangString>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = langStringFromJsonable(jsonableItem, options);
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.DataSpecificationIec61360>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        preferredName = items;
+        break;
+      }
+
+      case "shortName": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.DataSpecificationIec61360>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.LangString>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = langStringFromJsonable(jsonableItem, options);
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.DataSpecificationIec61360>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        shortName = items;
+        break;
+      }
+
+      case "unit": {
+        const parsedOrError = stringFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.DataSpecificationIec61360>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        unit = parsedOrError.mustValue();
+        break;
+      }
+
+      case "unitId": {
+        const parsedOrError = referenceFromJsonable(jsonableValue, options);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.DataSpecificationIec61360>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        unitId = parsedOrError.mustValue();
+        break;
+      }
+
+      case "sourceOfDefinition": {
+        const parsedOrError = stringFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.DataSpecificationIec61360>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        sourceOfDefinition = parsedOrError.mustValue();
+        break;
+      }
+
+      case "symbol": {
+        const parsedOrError = stringFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.DataSpecificationIec61360>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        symbol = parsedOrError.mustValue();
+        break;
+      }
+
+      case "dataType": {
+        const parsedOrError =
+          AasJsonization.dataTypeIec61360FromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.DataSpecificationIec61360>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        dataType = parsedOrError.mustValue();
+        break;
+      }
+
+      case "definition": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.DataSpecificationIec61360>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.LangString>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = langStringFromJsonable(jsonableItem, options);
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.DataSpecificationIec61360>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        definition = items;
+        break;
+      }
+
+      case "valueFormat": {
+        const parsedOrError = stringFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.DataSpecificationIec61360>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        valueFormat = parsedOrError.mustValue();
+        break;
+      }
+
+      case "valueList": {
+        const parsedOrError = valueListFromJsonable(jsonableValue, options);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.DataSpecificationIec61360>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        valueList = parsedOrError.mustValue();
+        break;
+      }
+
+      case "value": {
+        const parsedOrError = stringFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.DataSpecificationIec61360>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        value = parsedOrError.mustValue();
+        break;
+      }
+
+      case "levelType": {
+        const parsedOrError = AasJsonization.levelTypeFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.DataSpecificationIec61360>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        levelType = parsedOrError.mustValue();
+        break;
+      }
+
+      default:
+        // NOTE (mristin, 2022-11-30):
+        // Since we conflate here a JavaScript object with a JSON object, we ignore
+        // properties which we do not know how to de-serialize and assume they are
+        // related to the *JavaScript* properties of the object or `Object` prototype.
+        // The property `modelType` is only relevant for the dispatch, so we skip it.
+        break;
+    }
+  }
+
+  if (preferredName === null) {
+    return newDeserializationError<AasTypes.DataSpecificationIec61360>(
+      "The required property 'preferredName' is missing"
+    );
+  }
+
+  return newDeserialized<AasTypes.DataSpecificationIec61360>(
+    new AasTypes.DataSpecificationIec61360(
+      preferredName,
+      shortName,
+      unit,
+      unitId,
+      sourceOfDefinition,
+      symbol,
+      dataType,
+      definition,
+      valueFormat,
+      valueList,
+      value,
+      levelType
+    ),
+    options
+  );
+}
+
+/**
+ * Parse an instance of {@link types!DataSpecificationPhysicalUnit} from the JSON-able
+ * structure `jsonable`.
+ *
+ * @param jsonable - structure to be parsed
+ * @param options - to control the de-serialization, if any
+ * @returns parsed instance of {@link types!DataSpecificationPhysicalUnit},
+ * or an error if any
+ */
+export function dataSpecificationPhysicalUnitFromJsonable(
+  jsonable: AasJsonization.JsonValue,
+  options: DeserializationOptions | null = null
+): AasCommon.Either<
+  AasTypes.DataSpecificationPhysicalUnit,
+  AasJsonization.DeserializationError
+> {
+  if (jsonable === null) {
+    return newDeserializationError<AasTypes.DataSpecificationPhysicalUnit>(
+      "Expected a JSON object, but got null"
+    );
+  }
+  if (Array.isArray(jsonable)) {
+    return newDeserializationError<AasTypes.DataSpecificationPhysicalUnit>(
+      "Expected a JSON object, but got a JSON array"
+    );
+  }
+  if (typeof jsonable !== "object") {
+    return newDeserializationError<AasTypes.DataSpecificationPhysicalUnit>(
+      `Expected a JSON object, but got: ${typeof jsonable}`
+    );
+  }
+
+  let unitName: string | null = null;
+  let unitSymbol: string | null = null;
+  let definition: Array<AasTypes.LangString> | null = null;
+  let siNotation: string | null = null;
+  let siName: string | null = null;
+  let dinNotation: string | null = null;
+  let eceName: string | null = null;
+  let eceCode: string | null = null;
+  let nistName: string | null = null;
+  let sourceOfDefinition: string | null = null;
+  let conversionFactor: string | null = null;
+  let registrationAuthorityId: string | null = null;
+  let supplier: string | null = null;
+
+  const projected = projectedProperties(options, "DataSpecificationPhysicalUnit");
+
+  for (const key in jsonable) {
+    if (projected !== null && !projected.has(key)) {
+      continue;
+    }
+
+    const jsonableValue = jsonable[key];
+
+    switch (key) {
+      case "unitName": {
+        const parsedOrError = stringFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.DataSpecificationPhysicalUnit>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        unitName = parsedOrError.mustValue();
+        break;
+      }
+
+      case "unitSymbol": {
+        const parsedOrError = stringFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.DataSpecificationPhysicalUnit>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        unitSymbol = parsedOrError.mustValue();
+        break;
+      }
+
+      case "definition": {
+        const iterableOrError = iterableFromJsonable(jsonableValue);
+        if (iterableOrError.error !== null) {
+          return propagatePropertyError<AasTypes.DataSpecificationPhysicalUnit>(
+            iterableOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        const iterable = iterableOrError.mustValue();
+
+        const items = new Array<AasTypes.LangString>();
+
+        let i = 0;
+        for (const jsonableItem of iterable) {
+          const itemOrError = langStringFromJsonable(jsonableItem, options);
+          if (itemOrError.error !== null) {
+            itemOrError.error.path.prepend(
+              new AasJsonization.IndexSegment(iterable, i)
+            );
+            return propagatePropertyError<AasTypes.DataSpecificationPhysicalUnit>(
+              itemOrError.error,
+              <AasJsonization.JsonObject>jsonable,
+              key
+            );
+          }
+
+          items.push(itemOrError.mustValue());
+          i++;
+        }
+
+        definition = items;
+        break;
+      }
+
+      case "siNotation": {
+        const parsedOrError = stringFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.DataSpecificationPhysicalUnit>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        siNotation = parsedOrError.mustValue();
+        break;
+      }
+
+      case "siName": {
+        const parsedOrError = stringFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.DataSpecificationPhysicalUnit>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        siName = parsedOrError.mustValue();
+        break;
+      }
+
+      case "dinNotation": {
+        const parsedOrError = stringFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.DataSpecificationPhysicalUnit>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        dinNotation = parsedOrError.mustValue();
+        break;
+      }
+
+      case "eceName": {
+        const parsedOrError = stringFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.DataSpecificationPhysicalUnit>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        eceName = parsedOrError.mustValue();
+        break;
+      }
+
+      case "eceCode": {
+        const parsedOrError = stringFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.DataSpecificationPhysicalUnit>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        eceCode = parsedOrError.mustValue();
+        break;
+      }
+
+      case "nistName": {
+        const parsedOrError = stringFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.DataSpecificationPhysicalUnit>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        nistName = parsedOrError.mustValue();
+        break;
+      }
+
+      case "sourceOfDefinition": {
+        const parsedOrError = stringFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.DataSpecificationPhysicalUnit>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        sourceOfDefinition = parsedOrError.mustValue();
+        break;
+      }
+
+      case "conversionFactor": {
+        const parsedOrError = stringFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.DataSpecificationPhysicalUnit>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        conversionFactor = parsedOrError.mustValue();
+        break;
+      }
+
+      case "registrationAuthorityId": {
+        const parsedOrError = stringFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.DataSpecificationPhysicalUnit>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        registrationAuthorityId = parsedOrError.mustValue();
+        break;
+      }
+
+      case "supplier": {
+        const parsedOrError = stringFromJsonable(jsonableValue);
+        if (parsedOrError.error !== null) {
+          return propagatePropertyError<AasTypes.DataSpecificationPhysicalUnit>(
+            parsedOrError.error,
+            <AasJsonization.JsonObject>jsonable,
+            key
+          );
+        }
+        supplier = parsedOrError.mustValue();
+        break;
+      }
+
+      default:
+        // NOTE (mristin, 2022-11-30):
+        // Since we conflate here a JavaScript object with a JSON object, we ignore
+        // properties which we do not know how to de-serialize and assume they are
+        // related to the *JavaScript* properties of the object or `Object` prototype.
+        // The property `modelType` is only relevant for the dispatch, so we skip it.
+        break;
+    }
+  }
+
+  if (unitName === null) {
+    return newDeserializationError<AasTypes.DataSpecificationPhysicalUnit>(
+      "The required property 'unitName' is missing"
+    );
+  }
+
+  if (unitSymbol === null) {
+    return newDeserializationError<AasTypes.DataSpecificationPhysicalUnit>(
+      "The required property 'unitSymbol' is missing"
+    );
+  }
+
+  if (definition === null) {
+    return newDeserializationError<AasTypes.DataSpecificationPhysicalUnit>(
+      "The required property 'definition' is missing"
+    );
+  }
+
+  return newDeserialized<AasTypes.DataSpecificationPhysicalUnit>(
+    new AasTypes.DataSpecificationPhysicalUnit(
+      unitName,
+      unitSymbol,
+      definition,
+      siNotation,
+      siName,
+      dinNotation,
+      eceName,
+      eceCode,
+      nistName,
+      sourceOfDefinition,
+      conversionFactor,
+      registrationAuthorityId,
+      supplier
+    ),
+    options
+  );
+}
+
+const HAS_SEMANTICS_FROM_JSONABLE_DISPATCH = /*@__PURE__*/ new Map<
+  string,
+  (
+    jsonable: AasJsonization.JsonValue,
+    options: DeserializationOptions | null
+  ) => AasCommon.Either<AasTypes.IHasSemantics, AasJsonization.DeserializationError>
+>([
+  ["RelationshipElement", relationshipElementFromJsonableWithoutDispatch],
+  ["AnnotatedRelationshipElement", annotatedRelationshipElementFromJsonable],
+  ["BasicEventElement", basicEventElementFromJsonable],
+  ["Blob", blobFromJsonable],
+  ["Capability", capabilityFromJsonable],
+  ["Entity", entityFromJsonable],
+  ["Extension", extensionFromJsonable],
+  ["File", fileFromJsonable],
+  ["MultiLanguageProperty", multiLanguagePropertyFromJsonable],
+  ["Operation", operationFromJsonable],
+  ["Property", propertyFromJsonable],
+  ["Qualifier", qualifierFromJsonable],
+  ["Range", rangeFromJsonable],
+  ["ReferenceElement", referenceElementFromJsonable],
+  ["SpecificAssetId", specificAssetIdFromJsonable],
+  ["Submodel", submodelFromJsonable],
+  ["SubmodelElementCollection", submodelElementCollectionFromJsonable],
+  ["SubmodelElementList", submodelElementListFromJsonable]
+]);
+
+const HAS_EXTENSIONS_FROM_JSONABLE_DISPATCH = /*@__PURE__*/ new Map<
+  string,
+  (
+    jsonable: AasJsonization.JsonValue,
+    options: DeserializationOptions | null
+  ) => AasCommon.Either<AasTypes.IHasExtensions, AasJsonization.DeserializationError>
+>([
+  ["RelationshipElement", relationshipElementFromJsonableWithoutDispatch],
+  ["AnnotatedRelationshipElement", annotatedRelationshipElementFromJsonable],
+  ["AssetAdministrationShell", assetAdministrationShellFromJsonable],
+  ["BasicEventElement", basicEventElementFromJsonable],
+  ["Blob", blobFromJsonable],
+  ["Capability", capabilityFromJsonable],
+  ["ConceptDescription", conceptDescriptionFromJsonable],
+  ["Entity", entityFromJsonable],
+  ["File", fileFromJsonable],
+  ["MultiLanguageProperty", multiLanguagePropertyFromJsonable],
+  ["Operation", operationFromJsonable],
+  ["Property", propertyFromJsonable],
+  ["Range", rangeFromJsonable],
+  ["ReferenceElement", referenceElementFromJsonable],
+  ["Submodel", submodelFromJsonable],
+  ["SubmodelElementCollection", submodelElementCollectionFromJsonable],
+  ["SubmodelElementList", submodelElementListFromJsonable]
+]);
+
+const REFERABLE_FROM_JSONABLE_DISPATCH = /*@__PURE__*/ new Map<
+  string,
+  (
+    jsonable: AasJsonization.JsonValue,
+    options: DeserializationOptions | null
+  ) => AasCommon.Either<AasTypes.IReferable, AasJsonization.DeserializationError>
+>([
+  ["RelationshipElement", relationshipElementFromJsonableWithoutDispatch],
+  ["AnnotatedRelationshipElement", annotatedRelationshipElementFromJsonable],
+  ["AssetAdministrationShell", assetAdministrationShellFromJsonable],
+  ["BasicEventElement", basicEventElementFromJsonable],
+  ["Blob", blobFromJsonable],
+  ["Capability", capabilityFromJsonable],
+  ["ConceptDescription", conceptDescriptionFromJsonable],
+  ["Entity", entityFromJsonable],
+  ["File", fileFromJsonable],
+  ["MultiLanguageProperty", multiLanguagePropertyFromJsonable],
+  ["Operation", operationFromJsonable],
+  ["Property", propertyFromJsonable],
+  ["Range", rangeFromJsonable],
+  ["ReferenceElement", referenceElementFromJsonable],
+  ["Submodel", submodelFromJsonable],
+  ["SubmodelElementCollection", submodelElementCollectionFromJsonable],
+  ["SubmodelElementList", submodelElementListFromJsonable]
+]);
+
+const IDENTIFIABLE_FROM_JSONABLE_DISPATCH = /*@__PURE__*/ new Map<
+  string,
+  (
+    jsonable: AasJsonization.JsonValue,
+    options: DeserializationOptions | null
+  ) => AasCommon.Either<AasTypes.IIdentifiable, AasJsonization.DeserializationError>
+>([
+  ["AssetAdministrationShell", assetAdministrationShellFromJsonable],
+  ["ConceptDescription", conceptDescriptionFromJsonable],
+  ["Submodel", submodelFromJsonable]
+]);
+
+const HAS_KIND_FROM_JSONABLE_DISPATCH = /*@__PURE__*/ new Map<
+  string,
+  (
+    jsonable: AasJsonization.JsonValue,
+    options: DeserializationOptions | null
+  ) => AasCommon.Either<AasTypes.IHasKind, AasJsonization.DeserializationError>
+>([
+  ["RelationshipElement", relationshipElementFromJsonableWithoutDispatch],
+  ["AnnotatedRelationshipElement", annotatedRelationshipElementFromJsonable],
+  ["BasicEventElement", basicEventElementFromJsonable],
+  ["Blob", blobFromJsonable],
+  ["Capability", capabilityFromJsonable],
+  ["Entity", entityFromJsonable],
+  ["File", fileFromJsonable],
+  ["MultiLanguageProperty", multiLanguagePropertyFromJsonable],
+  ["Operation", operationFromJsonable],
+  ["Property", propertyFromJsonable],
+  ["Range", rangeFromJsonable],
+  ["ReferenceElement", referenceElementFromJsonable],
+  ["Submodel", submodelFromJsonable],
+  ["SubmodelElementCollection", submodelElementCollectionFromJsonable],
+  ["SubmodelElementList", submodelElementListFromJsonable]
+]);
+
+const HAS_DATA_SPECIFICATION_FROM_JSONABLE_DISPATCH = /*@__PURE__*/ new Map<
+  string,
+  (
+    jsonable: AasJsonization.JsonValue,
+    options: DeserializationOptions | null
+  ) => AasCommon.Either<
+    AasTypes.IHasDataSpecification,
+    AasJsonization.DeserializationError
+  >
+>([
+  ["AdministrativeInformation", administrativeInformationFromJsonable],
+  ["RelationshipElement", relationshipElementFromJsonableWithoutDispatch],
+  ["AnnotatedRelationshipElement", annotatedRelationshipElementFromJsonable],
+  ["AssetAdministrationShell", assetAdministrationShellFromJsonable],
+  ["BasicEventElement", basicEventElementFromJsonable],
+  ["Blob", blobFromJsonable],
+  ["Capability", capabilityFromJsonable],
+  ["ConceptDescription", conceptDescriptionFromJsonable],
+  ["Entity", entityFromJsonable],
+  ["File", fileFromJsonable],
+  ["MultiLanguageProperty", multiLanguagePropertyFromJsonable],
+  ["Operation", operationFromJsonable],
+  ["Property", propertyFromJsonable],
+  ["Range", rangeFromJsonable],
+  ["ReferenceElement", referenceElementFromJsonable],
+  ["Submodel", submodelFromJsonable],
+  ["SubmodelElementCollection", submodelElementCollectionFromJsonable],
+  ["SubmodelElementList", submodelElementListFromJsonable]
+]);
+
+const QUALIFIABLE_FROM_JSONABLE_DISPATCH = /*@__PURE__*/ new Map<
+  string,
+  (
+    jsonable: AasJsonization.JsonValue,
+    options: DeserializationOptions | null
+  ) => AasCommon.Either<AasTypes.IQualifiable, AasJsonization.DeserializationError>
+>([
+  ["RelationshipElement", relationshipElementFromJsonableWithoutDispatch],
+  ["AnnotatedRelationshipElement", annotatedRelationshipElementFromJsonable],
+  ["BasicEventElement", basicEventElementFromJsonable],
+  ["Blob", blobFromJsonable],
+  ["Capability", capabilityFromJsonable],
+  ["Entity", entityFromJsonable],
+  ["File", fileFromJsonable],
+  ["MultiLanguageProperty", multiLanguagePropertyFromJsonable],
+  ["Operation", operationFromJsonable],
+  ["Property", propertyFromJsonable],
+  ["Range", rangeFromJsonable],
+  ["ReferenceElement", referenceElementFromJsonable],
+  ["Submodel", submodelFromJsonable],
+  ["SubmodelElementCollection", submodelElementCollectionFromJsonable],
+  ["SubmodelElementList", submodelElementListFromJsonable]
+]);
+
+const SUBMODEL_ELEMENT_FROM_JSONABLE_DISPATCH = /*@__PURE__*/ new Map<
+  string,
+  (
+    jsonable: AasJsonization.JsonValue,
+    options: DeserializationOptions | null
+  ) => AasCommon.Either<AasTypes.ISubmodelElement, AasJsonization.DeserializationError>
+>([
+  ["RelationshipElement", relationshipElementFromJsonableWithoutDispatch],
+  ["AnnotatedRelationshipElement", annotatedRelationshipElementFromJsonable],
+  ["BasicEventElement", basicEventElementFromJsonable],
+  ["Blob", blobFromJsonable],
+  ["Capability", capabilityFromJsonable],
+  ["Entity", entityFromJsonable],
+  ["File", fileFromJsonable],
+  ["MultiLanguageProperty", multiLanguagePropertyFromJsonable],
+  ["Operation", operationFromJsonable],
+  ["Property", propertyFromJsonable],
+  ["Range", rangeFromJsonable],
+  ["ReferenceElement", referenceElementFromJsonable],
+  ["SubmodelElementCollection", submodelElementCollectionFromJsonable],
+  ["SubmodelElementList", submodelElementListFromJsonable]
+]);
+
+const RELATIONSHIP_ELEMENT_FROM_JSONABLE_DISPATCH = /*@__PURE__*/ new Map<
+  string,
+  (
+    jsonable: AasJsonization.JsonValue,
+    options: DeserializationOptions | null
+  ) => AasCommon.Either<
+    AasTypes.IRelationshipElement,
+    AasJsonization.DeserializationError
+  >
+>([
+  ["AnnotatedRelationshipElement", annotatedRelationshipElementFromJsonable],
+  ["RelationshipElement", relationshipElementFromJsonableWithoutDispatch]
+]);
+
+const DATA_ELEMENT_FROM_JSONABLE_DISPATCH = /*@__PURE__*/ new Map<
+  string,
+  (
+    jsonable: AasJsonization.JsonValue,
+    options: DeserializationOptions | null
+  ) => AasCommon.Either<AasTypes.IDataElement, AasJsonization.DeserializationError>
+>([
+  ["Blob", blobFromJsonable],
+  ["File", fileFromJsonable],
+  ["MultiLanguageProperty", multiLanguagePropertyFromJsonable],
+  ["Property", propertyFromJsonable],
+  ["Range", rangeFromJsonable],
+  ["ReferenceElement", referenceElementFromJsonable]
+]);
+
+const EVENT_ELEMENT_FROM_JSONABLE_DISPATCH = /*@__PURE__*/ new Map<
+  string,
+  (
+    jsonable: AasJsonization.JsonValue,
+    options: DeserializationOptions | null
+  ) => AasCommon.Either<AasTypes.IEventElement, AasJsonization.DeserializationError>
+>([["BasicEventElement", basicEventElementFromJsonable]]);
+
+const DATA_SPECIFICATION_CONTENT_FROM_JSONABLE_DISPATCH = /*@__PURE__*/ new Map<
+  string,
+  (
+    jsonable: AasJsonization.JsonValue,
+    options: DeserializationOptions | null
+  ) => AasCommon.Either<
+    AasTypes.IDataSpecificationContent,
+    AasJsonization.DeserializationError
+  >
+>([
+  ["DataSpecificationIEC61360", dataSpecificationIec61360FromJsonable],
+  ["DataSpecificationPhysicalUnit", dataSpecificationPhysicalUnitFromJsonable]
+]);
+
+/**
+ * Parse `jsonable` as a JSON object.
+ *
+ * @param jsonable - to be parsed
+ * @returns the JSON object, or an error
+ */
+function jsonObjectFromJsonable(
+  jsonable: AasJsonization.JsonValue
+): AasCommon.Either<AasJsonization.JsonObject, AasJsonization.DeserializationError> {
+  if (jsonable === null) {
+    return newDeserializationError<AasJsonization.JsonObject>(
+      "Expected a JSON object, but got null"
+    );
+  }
+  if (Array.isArray(jsonable)) {
+    return newDeserializationError<AasJsonization.JsonObject>(
+      "Expected a JSON object, but got a JSON array"
+    );
+  }
+  if (typeof jsonable !== "object") {
+    return newDeserializationError<AasJsonization.JsonObject>(
+      `Expected a JSON object, but got: ${typeof jsonable}`
+    );
+  }
+
+  return new AasCommon.Either<
+    AasJsonization.JsonObject,
+    AasJsonization.DeserializationError
+  >(
+    <AasJsonization.JsonObject>jsonable,
+    null
+  );
+}
+
+/**
+ * Prepend the property `key` of `container` to the path of `error`.
+ *
+ * @returns `error` for convenience
+ */
+function withPropertySegment(
+  error: AasJsonization.DeserializationError,
+  container: AasJsonization.JsonObject,
+  key: string
+): AasJsonization.DeserializationError {
+  error.path.prepend(new AasJsonization.PropertySegment(container, key));
+  return error;
+}
+
+/**
+ * Check whether the values of `valueType` are integers.
+ */
+function isIntegerXsdType(valueType: AasTypes.DataTypeDefXsd): boolean {
+  switch (valueType) {
+    case AasTypes.DataTypeDefXsd.Integer:
+    case AasTypes.DataTypeDefXsd.Long:
+    case AasTypes.DataTypeDefXsd.Int:
+    case AasTypes.DataTypeDefXsd.Short:
+    case AasTypes.DataTypeDefXsd.Byte:
+    case AasTypes.DataTypeDefXsd.NonNegativeInteger:
+    case AasTypes.DataTypeDefXsd.PositiveInteger:
+    case AasTypes.DataTypeDefXsd.UnsignedLong:
+    case AasTypes.DataTypeDefXsd.UnsignedInt:
+    case AasTypes.DataTypeDefXsd.UnsignedShort:
+    case AasTypes.DataTypeDefXsd.UnsignedByte:
+    case AasTypes.DataTypeDefXsd.NonPositiveInteger:
+    case AasTypes.DataTypeDefXsd.NegativeInteger:
+      return true;
+    default:
+      return false;
+  }
+}
+
+/**
+ * Check whether the values of `valueType` are numbers.
+ */
+function isNumericXsdType(valueType: AasTypes.DataTypeDefXsd): boolean {
+  switch (valueType) {
+    case AasTypes.DataTypeDefXsd.Decimal:
+    case AasTypes.DataTypeDefXsd.Double:
+    case AasTypes.DataTypeDefXsd.Float:
+      return true;
+    default:
+      return isIntegerXsdType(valueType);
+  }
+}
+
+/**
+ * Match a number in the decimal notation with an optional exponent.
+ *
+ * @remarks
+ * We need to check the notation ourselves, since `Number` accepts more, *e.g.*,
+ * hexadecimal numbers.
+ */
+const DECIMAL_NOTATION = /^[+-]?(\d+(\.\d*)?|\.\d+)([eE][+-]?\d+)?$/;
+
+/**
+ * Represent the `value` of the type `valueType` in the ValueOnly format.
+ *
+ * @remarks
+ * The booleans and the numbers are represented as JSON booleans and numbers,
+ * respectively. The integers outside of the safe range of JavaScript are kept as
+ * text so that they do not lose precision. The invalid values are kept as text
+ * as well.
+ *
+ * The serialization to the ValueOnly representation uses the function as well,
+ * and the patching uses it to tell whether a value actually changes.
+ *
+ * @param value - text representation of the value
+ * @param valueType - type of the value
+ * @returns JSON-able representation
+ */
+export function xsdValueToValueOnly(
+  value: string,
+  valueType: AasTypes.DataTypeDefXsd
+): AasJsonization.JsonValue {
+  if (valueType === AasTypes.DataTypeDefXsd.Boolean) {
+    if (value === "true" || value === "1") {
+      return true;
+    }
+    if (value === "false" || value === "0") {
+      return false;
+    }
+    return value;
+  }
+
+  if (isNumericXsdType(valueType) && DECIMAL_NOTATION.test(value)) {
+    const number = Number(value);
+    if (
+      isIntegerXsdType(valueType)
+        ? Number.isSafeInteger(number)
+        : Number.isFinite(number)
+    ) {
+      return number;
+    }
+  }
+
+  return value;
+}
+
+/**
+ * Check whether the ValueOnly representation `jsonable` stands for the `value`
+ * of the type `valueType`.
+ *
+ * @remarks
+ * Different texts have the same ValueOnly representation, *e.g.*, both `1` and
+ * `true` of the type `xs:boolean` are represented as `true`. The patching leaves
+ * such values alone so that a round trip does not change their text.
+ *
+ * @param jsonable - ValueOnly representation of the new value
+ * @param value - text representation of the current value, if any
+ * @param valueType - type of the value
+ * @returns `true` if the current value is represented by `jsonable`
+ */
+function representsXsdValue(
+  jsonable: AasJsonization.JsonValue,
+  value: string | null,
+  valueType: AasTypes.DataTypeDefXsd
+): boolean {
+  return value !== null && xsdValueToValueOnly(value, valueType) === jsonable;
+}
+
+/**
+ * Parse `jsonable` as the ValueOnly representation of a value of an XSD type.
+ *
+ * @remarks
+ * The JSON booleans and numbers are converted to their text representation.
+ *
+ * @param jsonable - to be parsed
+ * @returns text representation of the value, or an error
+ */
+function xsdValueFromValueOnly(
+  jsonable: AasJsonization.JsonValue
+): AasCommon.Either<string, AasJsonization.DeserializationError> {
+  if (
+    typeof jsonable === "string" ||
+    typeof jsonable === "number" ||
+    typeof jsonable === "boolean"
+  ) {
+    return new AasCommon.Either<string, AasJsonization.DeserializationError>(
+      `${jsonable}`,
+      null
+    );
+  }
+
+  return newDeserializationError<string>(
+    "Expected a string, a number or a boolean, " +
+      `but got: ${jsonable === null ? "null" : typeof jsonable}`
+  );
+}
+
+/**
+ * Parse `jsonable` as the ValueOnly representation of a value of an XSD type,
+ * or `null`.
+ *
+ * @param jsonable - to be parsed
+ * @returns text representation of the value, `null`, or an error
+ */
+function optionalXsdValueFromValueOnly(
+  jsonable: AasJsonization.JsonValue
+): AasCommon.Either<string | null, AasJsonization.DeserializationError> {
+  if (jsonable === null) {
+    return new AasCommon.Either<string | null, AasJsonization.DeserializationError>(
+      null,
+      null
+    );
+  }
+  return xsdValueFromValueOnly(jsonable);
+}
+
+/**
+ * Collect the patches of the values from their ValueOnly representation.
+ *
+ * @remarks
+ * The patches are only collected during the transformation. They are applied
+ * all at once in the end so that an invalid representation leaves the instances
+ * untouched.
+ *
+ * The context is the ValueOnly representation of the transformed instance.
+ */
+class ValueOnlyPatcher extends AasTypes.AbstractTransformerWithContext<
+  AasJsonization.JsonValue,
+  AasJsonization.DeserializationError | null
+> {
+  /**
+   * Patches to be applied once the whole representation has been parsed
+   */
+  readonly patches = new Array<() => void>();
+
+  /**
+   * Patch the `elements` from an object keyed by their `idShort`'s.
+   *
+   * @param elements - to be patched
+   * @param jsonable - ValueOnly representation of the elements
+   * @returns an error, if any
+   */
+  patchElementsByIdShort(
+    elements: Array<AasTypes.ISubmodelElement> | null,
+    jsonable: AasJsonization.JsonValue
+  ): AasJsonization.DeserializationError | null {
+    const containerOrError = jsonObjectFromJsonable(jsonable);
+    if (containerOrError.error !== null) {
+      return containerOrError.error;
+    }
+    const container = containerOrError.mustValue();
+
+    const elementsByIdShort = new Map<string, AasTypes.ISubmodelElement>();
+    if (elements !== null) {
+      for (const element of elements) {
+        if (element.idShort !== null) {
+          elementsByIdShort.set(element.idShort, element);
+        }
+      }
+    }
+
+    for (const key in container) {
+      const element = elementsByIdShort.get(key);
+      if (element === undefined) {
+        return withPropertySegment(
+          new AasJsonization.DeserializationError(
+            `Expected a submodel element with the idShort ${key}, but found none`
+          ),
+          container,
+          key
+        );
+      }
+
+      const error = this.transformWithContext(element, container[key]);
+      if (error !== null) {
+        return withPropertySegment(error, container, key);
+      }
+    }
+
+    return null;
+  }
+
+  /**
+   * Patch the `first` and the `second` reference of `that` from `container`.
+   *
+   * @param that - to be patched
+   * @param container - ValueOnly representation of `that`
+   * @returns an error, if any
+   */
+  patchRelationship(
+    that: AasTypes.IRelationshipElement,
+    container: AasJsonization.JsonObject
+  ): AasJsonization.DeserializationError | null {
+    const jsonableFirst = container["first"];
+    if (jsonableFirst !== undefined) {
+      const firstOrError = referenceFromJsonable(jsonableFirst);
+      if (firstOrError.error !== null) {
+        return withPropertySegment(firstOrError.error, container, "first");
+      }
+      const first = firstOrError.mustValue();
+
+      this.patches.push(() => {
+        that.first = first;
+      });
+    }
+
+    const jsonableSecond = container["second"];
+    if (jsonableSecond !== undefined) {
+      const secondOrError = referenceFromJsonable(jsonableSecond);
+      if (secondOrError.error !== null) {
+        return withPropertySegment(secondOrError.error, container, "second");
+      }
+      const second = secondOrError.mustValue();
+
+      this.patches.push(() => {
+        that.second = second;
+      });
+    }
+
+    return null;
+  }
+
+  /**
+   * Patch the content type of `that` from `container`.
+   *
+   * @param that - to be patched
+   * @param container - ValueOnly representation of `that`
+   * @returns an error, if any
+   */
+  patchContentType(
+    that: AasTypes.Blob | AasTypes.File,
+    container: AasJsonization.JsonObject
+  ): AasJsonization.DeserializationError | null {
+    const jsonableContentType = container["contentType"];
+    if (jsonableContentType === undefined) {
+      return null;
+    }
+
+    const contentTypeOrError = stringFromJsonable(jsonableContentType);
+    if (contentTypeOrError.error !== null) {
+      return withPropertySegment(contentTypeOrError.error, container, "contentType");
+    }
+    const contentType = contentTypeOrError.mustValue();
+
+    this.patches.push(() => {
+      that.contentType = contentType;
+    });
+    return null;
+  }
+
+  /* eslint-disable @typescript-eslint/no-unused-vars */
+  transformExtensionWithContext(
+    that: AasTypes.Extension,
+    context: AasJsonization.JsonValue
+  ): AasJsonization.DeserializationError | null {
+    return new AasJsonization.DeserializationError(
+      "Expected a submodel or a submodel element, but got an instance of Extension"
+    );
+  }
+  /* eslint-enable @typescript-eslint/no-unused-vars */
+
+  /* eslint-disable @typescript-eslint/no-unused-vars */
+  transformAdministrativeInformationWithContext(
+    that: AasTypes.AdministrativeInformation,
+    context: AasJsonization.JsonValue
+  ): AasJsonization.DeserializationError | null {
+    return new AasJsonization.DeserializationError(
+      "Expected a submodel or a submodel element, " +
+        "but got an instance of AdministrativeInformation"
+    );
+  }
+  /* eslint-enable @typescript-eslint/no-unused-vars */
+
+  /* eslint-disable @typescript-eslint/no-unused-vars */
+  transformQualifierWithContext(
+    that: AasTypes.Qualifier,
+    context: AasJsonization.JsonValue
+  ): AasJsonization.DeserializationError | null {
+    return new AasJsonization.DeserializationError(
+      "Expected a submodel or a submodel element, but got an instance of Qualifier"
+    );
+  }
+  /* eslint-enable @typescript-eslint/no-unused-vars */
+
+  /* eslint-disable @typescript-eslint/no-unused-vars */
+  transformAssetAdministrationShellWithContext(
+    that: AasTypes.AssetAdministrationShell,
+    context: AasJsonization.JsonValue
+  ): AasJsonization.DeserializationError | null {
+    return new AasJsonization.DeserializationError(
+      "Expected a submodel or a submodel element, " +
+        "but got an instance of AssetAdministrationShell"
+    );
+  }
+  /* eslint-enable @typescript-eslint/no-unused-vars */
+
+  /* eslint-disable @typescript-eslint/no-unused-vars */
+  transformAssetInformationWithContext(
+    that: AasTypes.AssetInformation,
+    context: AasJsonization.JsonValue
+  ): AasJsonization.DeserializationError | null {
+    return new AasJsonization.DeserializationError(
+      "Expected a submodel or a submodel element, " +
+        "but got an instance of AssetInformation"
+    );
+  }
+  /* eslint-enable @typescript-eslint/no-unused-vars */
+
+  /* eslint-disable @typescript-eslint/no-unused-vars */
+  transformResourceWithContext(
+    that: AasTypes.Resource,
+    context: AasJsonization.JsonValue
+  ): AasJsonization.DeserializationError | null {
+    return new AasJsonization.DeserializationError(
+      "Expected a submodel or a submodel element, but got an instance of Resource"
+    );
+  }
+  /* eslint-enable @typescript-eslint/no-unused-vars */
+
+  /* eslint-disable @typescript-eslint/no-unused-vars */
+  transformSpecificAssetIdWithContext(
+    that: AasTypes.SpecificAssetId,
+    context: AasJsonization.JsonValue
+  ): AasJsonization.DeserializationError | null {
+    return new AasJsonization.DeserializationError(
+      "Expected a submodel or a submodel element, " +
+        "but got an instance of SpecificAssetId"
+    );
+  }
+  /* eslint-enable @typescript-eslint/no-unused-vars */
+
+  transformSubmodelWithContext(
+    that: AasTypes.Submodel,
+    context: AasJsonization.JsonValue
+  ): AasJsonization.DeserializationError | null {
+    return this.patchElementsByIdShort(that.submodelElements, context);
+  }
+
+  transformRelationshipElementWithContext(
+    that: AasTypes.RelationshipElement,
+    context: AasJsonization.JsonValue
+  ): AasJsonization.DeserializationError | null {
+    const containerOrError = jsonObjectFromJsonable(context);
+    if (containerOrError.error !== null) {
+      return containerOrError.error;
+    }
+    const container = containerOrError.mustValue();
+
+    return this.patchRelationship(that, container);
+  }
+
+  transformSubmodelElementListWithContext(
+    that: AasTypes.SubmodelElementList,
+    context: AasJsonization.JsonValue
+  ): AasJsonization.DeserializationError | null {
+    const iterableOrError = iterableFromJsonable(context);
+    if (iterableOrError.error !== null) {
+      return iterableOrError.error;
+    }
+    const iterable = iterableOrError.mustValue();
+
+    const items = that.value !== null ? that.value : [];
+
+    let i = 0;
+    for (const jsonableItem of iterable) {
+      if (i >= items.length) {
+        return new AasJsonization.DeserializationError(
+          `Expected at most ${items.length} item(s), but got more`
+        );
+      }
+
+      const error = this.transformWithContext(items[i], jsonableItem);
+      if (error !== null) {
+        error.path.prepend(new AasJsonization.IndexSegment(iterable, i));
+        return error;
+      }
+      i++;
+    }
+
+    // The lists below the depth are serialized as empty arrays, so we leave
+    // the items as-is.
+    if (i !== 0 && i !== items.length) {
+      return new AasJsonization.DeserializationError(
+        `Expected ${items.length} item(s), but got: ${i}`
+      );
+    }
+
+    return null;
+  }
+
+  transformSubmodelElementCollectionWithContext(
+    that: AasTypes.SubmodelElementCollection,
+    context: AasJsonization.JsonValue
+  ): AasJsonization.DeserializationError | null {
+    return this.patchElementsByIdShort(that.value, context);
+  }
+
+  transformPropertyWithContext(
+    that: AasTypes.Property,
+    context: AasJsonization.JsonValue
+  ): AasJsonization.DeserializationError | null {
+    if (context === null) {
+      this.patches.push(() => {
+        that.value = null;
+      });
+      return null;
+    }
+
+    const textOrError = xsdValueFromValueOnly(context);
+    if (textOrError.error !== null) {
+      return textOrError.error;
+    }
+    const text = textOrError.mustValue();
+
+    if (!representsXsdValue(context, that.value, that.valueType)) {
+      this.patches.push(() => {
+        that.value = text;
+      });
+    }
+    return null;
+  }
+
+  transformMultiLanguagePropertyWithContext(
+    that: AasTypes.MultiLanguageProperty,
+    context: AasJsonization.JsonValue
+  ): AasJsonization.DeserializationError | null {
+    if (context === null) {
+      this.patches.push(() => {
+        that.value = null;
+      });
+      return null;
+    }
+
+    const iterableOrError = iterableFromJsonable(context);
+    if (iterableOrError.error !== null) {
+      return iterableOrError.error;
+    }
+    const iterable = iterableOrError.mustValue();
+
+    const langStrings = new Array<AasTypes.LangString>();
+
+    let i = 0;
+    for (const jsonableItem of iterable) {
+      const itemOrError = jsonObjectFromJsonable(jsonableItem);
+      if (itemOrError.error !== null) {
+        itemOrError.error.path.prepend(new AasJsonization.IndexSegment(iterable, i));
+        return itemOrError.error;
+      }
+      const item = itemOrError.mustValue();
+
+      for (const language in item) {
+        const textOrError = stringFromJsonable(item[language]);
+        if (textOrError.error !== null) {
+          textOrError.error.path.prepend(
+            new AasJsonization.PropertySegment(item, language)
+          );
+          textOrError.error.path.prepend(new AasJsonization.IndexSegment(iterable, i));
+          return textOrError.error;
+        }
+
+        langStrings.push(new AasTypes.LangString(language, textOrError.mustValue()));
+      }
+      i++;
+    }
+
+    this.patches.push(() => {
+      that.value = langStrings;
+    });
+    return null;
+  }
+
+  transformRangeWithContext(
+    that: AasTypes.Range,
+    context: AasJsonization.JsonValue
+  ): AasJsonization.DeserializationError | null {
+    const containerOrError = jsonObjectFromJsonable(context);
+    if (containerOrError.error !== null) {
+      return containerOrError.error;
+    }
+    const container = containerOrError.mustValue();
+
+    const jsonableMin = container["min"];
+    if (jsonableMin !== undefined) {
+      const minOrError = optionalXsdValueFromValueOnly(jsonableMin);
+      if (minOrError.error !== null) {
+        return withPropertySegment(minOrError.error, container, "min");
+      }
+      const min = minOrError.mustValue();
+
+      if (!representsXsdValue(jsonableMin, that.min, that.valueType)) {
+        this.patches.push(() => {
+          that.min = min;
+        });
+      }
+    }
+
+    const jsonableMax = container["max"];
+    if (jsonableMax !== undefined) {
+      const maxOrError = optionalXsdValueFromValueOnly(jsonableMax);
+      if (maxOrError.error !== null) {
+        return withPropertySegment(maxOrError.error, container, "max");
+      }
+      const max = maxOrError.mustValue();
+
+      if (!representsXsdValue(jsonableMax, that.max, that.valueType)) {
+        this.patches.push(() => {
+          that.max = max;
+        });
+      }
+    }
+
+    return null;
+  }
+
+  transformReferenceElementWithContext(
+    that: AasTypes.ReferenceElement,
+    context: AasJsonization.JsonValue
+  ): AasJsonization.DeserializationError | null {
+    if (context === null) {
+      this.patches.push(() => {
+        that.value = null;
+      });
+      return null;
+    }
+
+    const referenceOrError = referenceFromJsonable(context);
+    if (referenceOrError.error !== null) {
+      return referenceOrError.error;
+    }
+    const reference = referenceOrError.mustValue();
+
+    this.patches.push(() => {
+      that.value = reference;
+    });
+    return null;
+  }
+
+  transformBlobWithContext(
+    that: AasTypes.Blob,
+    context: AasJsonization.JsonValue
+  ): AasJsonization.DeserializationError | null {
+    const containerOrError = jsonObjectFromJsonable(context);
+    if (containerOrError.error !== null) {
+      return containerOrError.error;
+    }
+    const container = containerOrError.mustValue();
+
+    const error = this.patchContentType(that, container);
+    if (error !== null) {
+      return error;
+    }
+
+    const jsonableValue = container["value"];
+    if (jsonableValue !== undefined) {
+      let value: Uint8Array | null = null;
+      if (jsonableValue !== null) {
+        const valueOrError = bytesFromJsonable(jsonableValue);
+        if (valueOrError.error !== null) {
+          return withPropertySegment(valueOrError.error, container, "value");
+        }
+        value = valueOrError.mustValue();
+      }
+
+      this.patches.push(() => {
+        that.value = value;
+      });
+    }
+
+    return null;
+  }
+
+  transformFileWithContext(
+    that: AasTypes.File,
+    context: AasJsonization.JsonValue
+  ): AasJsonization.DeserializationError | null {
+    const containerOrError = jsonObjectFromJsonable(context);
+    if (containerOrError.error !== null) {
+      return containerOrError.error;
+    }
+    const container = containerOrError.mustValue();
+
+    const error = this.patchContentType(that, container);
+    if (error !== null) {
+      return error;
+    }
+
+    const jsonableValue = container["value"];
+    if (jsonableValue !== undefined) {
+      let value: string | null = null;
+      if (jsonableValue !== null) {
+        const valueOrError = stringFromJsonable(jsonableValue);
+        if (valueOrError.error !== null) {
+          return withPropertySegment(valueOrError.error, container, "value");
+        }
+        value = valueOrError.mustValue();
+      }
+
+      this.patches.push(() => {
+        that.value = value;
+      });
+    }
+
+    return null;
+  }
+
+  transformAnnotatedRelationshipElementWithContext(
+    that: AasTypes.AnnotatedRelationshipElement,
+    context: AasJsonization.JsonValue
+  ): AasJsonization.DeserializationError | null {
+    const containerOrError = jsonObjectFromJsonable(context);
+    if (containerOrError.error !== null) {
+      return containerOrError.error;
+    }
+    const container = containerOrError.mustValue();
+
+    const error = this.patchRelationship(that, container);
+    if (error !== null) {
+      return error;
+    }
+
+    const jsonableAnnotations = container["annotations"];
+    if (jsonableAnnotations === undefined) {
+      return null;
+    }
+
+    const iterableOrError = iterableFromJsonable(jsonableAnnotations);
+    if (iterableOrError.error !== null) {
+      return withPropertySegment(iterableOrError.error, container, "annotations");
+    }
+    const iterable = iterableOrError.mustValue();
+
+    let i = 0;
+    for (const jsonableItem of iterable) {
+      const error = this.patchElementsByIdShort(that.annotations, jsonableItem);
+      if (error !== null) {
+        error.path.prepend(new AasJsonization.IndexSegment(iterable, i));
+        return withPropertySegment(error, container, "annotations");
+      }
+      i++;
+    }
+
+    return null;
+  }
+
+  transformEntityWithContext(
+    that: AasTypes.Entity,
+    context: AasJsonization.JsonValue
+  ): AasJsonization.DeserializationError | null {
+    const containerOrError = jsonObjectFromJsonable(context);
+    if (containerOrError.error !== null) {
+      return containerOrError.error;
+    }
+    const container = containerOrError.mustValue();
+
+    const jsonableStatements = container["statements"];
+    if (jsonableStatements !== undefined) {
+      const error = this.patchElementsByIdShort(that.statements, jsonableStatements);
+      if (error !== null) {
+        return withPropertySegment(error, container, "statements");
+      }
+    }
+
+    const jsonableEntityType = container["entityType"];
+    if (jsonableEntityType !== undefined) {
+      const entityTypeOrError =
+        AasJsonization.entityTypeFromJsonable(jsonableEntityType);
+      if (entityTypeOrError.error !== null) {
+        return withPropertySegment(entityTypeOrError.error, container, "entityType");
+      }
+      const entityType = entityTypeOrError.mustValue();
+
+      this.patches.push(() => {
+        that.entityType = entityType;
+      });
+    }
+
+    const jsonableGlobalAssetId = container["globalAssetId"];
+    if (jsonableGlobalAssetId !== undefined) {
+      let globalAssetId: AasTypes.Reference | null = null;
+      if (jsonableGlobalAssetId !== null) {
+        const globalAssetIdOrError = referenceFromJsonable(jsonableGlobalAssetId);
+        if (globalAssetIdOrError.error !== null) {
+          return withPropertySegment(
+            globalAssetIdOrError.error,
+            container,
+            "globalAssetId"
+          );
+        }
+        globalAssetId = globalAssetIdOrError.mustValue();
+      }
+
+      this.patches.push(() => {
+        that.globalAssetId = globalAssetId;
+      });
+    }
+
+    const jsonableSpecificAssetId = container["specificAssetId"];
+    if (jsonableSpecificAssetId !== undefined) {
+      let specificAssetId: AasTypes.SpecificAssetId | null = null;
+      if (jsonableSpecificAssetId !== null) {
+        const specificAssetIdOrError = specificAssetIdFromJsonable(
+          jsonableSpecificAssetId
+        );
+        if (specificAssetIdOrError.error !== null) {
+          return withPropertySegment(
+            specificAssetIdOrError.error,
+            container,
+            "specificAssetId"
+          );
+        }
+        specificAssetId = specificAssetIdOrError.mustValue();
+      }
+
+      this.patches.push(() => {
+        that.specificAssetId = specificAssetId;
+      });
+    }
+
+    return null;
+  }
+
+  /* eslint-disable @typescript-eslint/no-unused-vars */
+  transformEventPayloadWithContext(
+    that: AasTypes.EventPayload,
+    context: AasJsonization.JsonValue
+  ): AasJsonization.DeserializationError | null {
+    return new AasJsonization.DeserializationError(
+      "Expected a submodel or a submodel element, but got an instance of EventPayload"
+    );
+  }
+  /* eslint-enable @typescript-eslint/no-unused-vars */
+
+  transformBasicEventElementWithContext(
+    that: AasTypes.BasicEventElement,
+    context: AasJsonization.JsonValue
+  ): AasJsonization.DeserializationError | null {
+    const containerOrError = jsonObjectFromJsonable(context);
+    if (containerOrError.error !== null) {
+      return containerOrError.error;
+    }
+    const container = containerOrError.mustValue();
+
+    const jsonableObserved = container["observed"];
+    if (jsonableObserved !== undefined) {
+      const observedOrError = referenceFromJsonable(jsonableObserved);
+      if (observedOrError.error !== null) {
+        return withPropertySegment(observedOrError.error, container, "observed");
+      }
+      const observed = observedOrError.mustValue();
+
+      this.patches.push(() => {
+        that.observed = observed;
+      });
+    }
+
+    return null;
+  }
+
+  transformOperationWithContext(
+    that: AasTypes.Operation,
+    context: AasJsonization.JsonValue
+  ): AasJsonization.DeserializationError | null {
+    if (context === null) {
+      return null;
+    }
+
+    return new AasJsonization.DeserializationError(
+      `Expected no value for an operation, but got: ${typeof context}`
+    );
+  }
+
+  /* eslint-disable @typescript-eslint/no-unused-vars */
+  transformOperationVariableWithContext(
+    that: AasTypes.OperationVariable,
+    context: AasJsonization.JsonValue
+  ): AasJsonization.DeserializationError | null {
+    return new AasJsonization.DeserializationError(
+      "Expected a submodel or a submodel element, " +
+        "but got an instance of OperationVariable"
+    );
+  }
+  /* eslint-enable @typescript-eslint/no-unused-vars */
+
+  transformCapabilityWithContext(
+    that: AasTypes.Capability,
+    context: AasJsonization.JsonValue
+  ): AasJsonization.DeserializationError | null {
+    if (context === null) {
+      return null;
+    }
+
+    return new AasJsonization.DeserializationError(
+      `Expected no value for a capability, but got: ${typeof context}`
+    );
+  }
+
+  /* eslint-disable @typescript-eslint/no-unused-vars */
+  transformConceptDescriptionWithContext(
+    that: AasTypes.ConceptDescription,
+    context: AasJsonization.JsonValue
+  ): AasJsonization.DeserializationError | null {
+    return new AasJsonization.DeserializationError(
+      "Expected a submodel or a submodel element, " +
+        "but got an instance of ConceptDescription"
+    );
+  }
+  /* eslint-enable @typescript-eslint/no-unused-vars */
+
+  /* eslint-disable @typescript-eslint/no-unused-vars */
+  transformReferenceWithContext(
+    that: AasTypes.Reference,
+    context: AasJsonization.JsonValue
+  ): AasJsonization.DeserializationError | null {
+    return new AasJsonization.DeserializationError(
+      "Expected a submodel or a submodel element, but got an instance of Reference"
+    );
+  }
+  /* eslint-enable @typescript-eslint/no-unused-vars */
+
+  /* eslint-disable @typescript-eslint/no-unused-vars */
+  transformKeyWithContext(
+    that: AasTypes.Key,
+    context: AasJsonization.JsonValue
+  ): AasJsonization.DeserializationError | null {
+    return new AasJsonization.DeserializationError(
+      "Expected a submodel or a submodel element, but got an instance of Key"
+    );
+  }
+  /* eslint-enable @typescript-eslint/no-unused-vars */
+
+  /* eslint-disable @typescript-eslint/no-unused-vars */
+  transformLangStringWithContext(
+    that: AasTypes.LangString,
+    context: AasJsonization.JsonValue
+  ): AasJsonization.DeserializationError | null {
+    return new AasJsonization.DeserializationError(
+      "Expected a submodel or a submodel element, but got an instance of LangString"
+    );
+  }
+  /* eslint-enable @typescript-eslint/no-unused-vars */
+
+  /* eslint-disable @typescript-eslint/no-unused-vars */
+  transformEnvironmentWithContext(
+    that: AasTypes.Environment,
+    context: AasJsonization.JsonValue
+  ): AasJsonization.DeserializationError | null {
+    return new AasJsonization.DeserializationError(
+      "Expected a submodel or a submodel element, but got an instance of Environment"
+    );
+  }
+  /* eslint-enable @typescript-eslint/no-unused-vars */
+
+  /* eslint-disable @typescript-eslint/no-unused-vars */
+  transformEmbeddedDataSpecificationWithContext(
+    that: AasTypes.EmbeddedDataSpecification,
+    context: AasJsonization.JsonValue
+  ): AasJsonization.DeserializationError | null {
+    return new AasJsonization.DeserializationError(
+      "Expected a submodel or a submodel element, " +
+        "but got an instance of EmbeddedDataSpecification"
+    );
+  }
+  /* eslint-enable @typescript-eslint/no-unused-vars */
+
+  /* eslint-disable @typescript-eslint/no-unused-vars */
+  transformValueReferencePairWithContext(
+    that: AasTypes.ValueReferencePair,
+    context: AasJsonization.JsonValue
+  ): AasJsonization.DeserializationError | null {
+    return new AasJsonization.DeserializationError(
+      "Expected a submodel or a submodel element, " +
+        "but got an instance of ValueReferencePair"
+    );
+  }
+  /* eslint-enable @typescript-eslint/no-unused-vars */
+
+  /* eslint-disable @typescript-eslint/no-unused-vars */
+  transformValueListWithContext(
+    that: AasTypes.ValueList,
+    context: AasJsonization.JsonValue
+  ): AasJsonization.DeserializationError | null {
+    return new AasJsonization.DeserializationError(
+      "Expected a submodel or a submodel element, but got an instance of ValueList"
+    );
+  }
+  /* eslint-enable @typescript-eslint/no-unused-vars */
+
+  /* eslint-disable @typescript-eslint/no-unused-vars */
+  transformDataSpecificationIec61360WithContext(
+    that: AasTypes.DataSpecificationIec61360,
+    context: AasJsonization.JsonValue
+  ): AasJsonization.DeserializationError | null {
+    return new AasJsonization.DeserializationError(
+      "Expected a submodel or a submodel element, " +
+        "but got an instance of DataSpecificationIec61360"
+    );
+  }
+  /* eslint-enable @typescript-eslint/no-unused-vars */
+
+  /* eslint-disable @typescript-eslint/no-unused-vars */
+  transformDataSpecificationPhysicalUnitWithContext(
+    that: AasTypes.DataSpecificationPhysicalUnit,
+    context: AasJsonization.JsonValue
+  ): AasJsonization.DeserializationError | null {
+    return new AasJsonization.DeserializationError(
+      "Expected a submodel or a submodel element, " +
+        "but got an instance of DataSpecificationPhysicalUnit"
+    );
+  }
+  /* eslint-enable @typescript-eslint/no-unused-vars */
+}
+
+/**
+ * Patch the values of `target` from their ValueOnly representation (`$value`) as
+ * defined in Part 2 of the AAS specification.
+ *
+ * @remarks
+ * Only the values given in `jsonable` are patched, and the rest of `target` is
+ * left as-is. The submodel elements are matched by their `idShort`'s, and by
+ * their positions in {@link types!SubmodelElementList}'s. An empty array leaves
+ * the items of a list as-is, since the lists below the
+ * {@link serialization!SerializationOptions.depth} are serialized as empty arrays.
+ *
+ * If `jsonable` is invalid, `target` is not changed at all.
+ *
+ * @param target - to be patched in place
+ * @param jsonable - ValueOnly representation of the values
+ * @returns an error, if any
+ */
+export function patchFromValueOnlyJsonable(
+  target: AasTypes.Submodel | AasTypes.ISubmodelElement,
+  jsonable: AasJsonization.JsonValue
+): AasJsonization.DeserializationError | null {
+  const patcher = new ValueOnlyPatcher();
+
+  const error = patcher.transformWithContext(target, jsonable);
+  if (error !== null) {
+    return error;
+  }
+
+  for (const patch of patcher.patches) {
+    patch();
+  }
+  return null;
+}
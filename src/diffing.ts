@@ -0,0 +1,1215 @@
+/**
+ * Compute the structural difference between two environments, and patch
+ * an environment with it, either in place or copy-on-write.
+ *
+ * @remarks
+ * The difference is a list of {@link Change}'s. Only the changed identifiables
+ * and submodel elements end up in the changes, so you can sync large environments
+ * by sending the changes instead of the whole environment.
+ *
+ * The diff descends into the containers of the model: the lists of
+ * the environment, {@link types!Submodel.submodelElements},
+ * {@link types!SubmodelElementCollection.value},
+ * {@link types!SubmodelElementList.value}, {@link types!Entity.statements} and
+ * {@link types!AnnotatedRelationshipElement.annotations}. The items of these lists
+ * are identified by their `id` if they are identifiable, by their `idShort`
+ * otherwise, and by their position in {@link types!SubmodelElementList}'s or where
+ * the items can not be identified unambiguously.
+ *
+ * Any other change replaces the item as a whole. For example, if you change
+ * the description of a submodel, the whole submodel is replaced.
+ *
+ * The sub-trees which the two environments share by reference are skipped
+ * without looking into them. If you derive the new environment from the old one
+ * by replacing only the changed parts, the diff takes time proportional to
+ * the change rather than to the environment. The other sub-trees are compared
+ * with {@link equality!deepEquals}.
+ *
+ * {@link applyPatchCopyOnWrite} and {@link updateCopyOnWrite} produce exactly such
+ * derived environments. See also {@link snapshots!SnapshotStore}.
+ */
+
+import * as AasCommon from "./common";
+import * as AasCopying from "./copying";
+import * as AasEquality from "./equality";
+import * as AasJsonization from "./jsonization";
+import * as AasStringification from "./stringification";
+import * as AasTypes from "./types";
+
+/**
+ * Enumerate the kinds of the changes.
+ */
+export enum ChangeKind {
+  /**
+   * Insert an item into a list
+   */
+  Add,
+  /**
+   * Remove an item from a list
+   */
+  Remove,
+  /**
+   * Replace an item of a list, or a list as a whole
+   */
+  Replace
+}
+
+/**
+ * Represent a single change of an environment.
+ *
+ * @remarks
+ * The path starts at the environment and alternates between the name of a list
+ * property and the key of an item in that list, where the key is the identifier,
+ * the `idShort` or the position of the item. For example,
+ * `["submodels", "urn:something", "submodelElements", "someList", "value", 3]`
+ * points to the fourth item of the list `someList` in the submodel `urn:something`.
+ *
+ * * {@link ChangeKind.Add} inserts the {@link value} at the position given as
+ *   the last segment of the path.
+ * * {@link ChangeKind.Remove} removes the item at the path.
+ * * {@link ChangeKind.Replace} replaces the item at the path with
+ *   the {@link value}. If the path ends with the name of a list property,
+ *   the whole list is replaced, which only happens if the list is `null` before
+ *   or after the change.
+ *
+ * The changes are meant to be applied in order, so the path of a change assumes
+ * that all the changes before it have already been applied.
+ */
+export class Change {
+  /**
+   * Kind of the change
+   */
+  readonly kind: ChangeKind;
+
+  /**
+   * Path to the changed item or list
+   */
+  readonly path: Array<string | number>;
+
+  /**
+   * New item or list, or `null` if removed
+   */
+  readonly value: AasTypes.Class | Array<AasTypes.Class> | null;
+
+  constructor(
+    kind: ChangeKind,
+    path: Array<string | number>,
+    value: AasTypes.Class | Array<AasTypes.Class> | null = null
+  ) {
+    this.kind = kind;
+    this.path = path;
+    this.value = value;
+  }
+}
+
+/**
+ * List the names of the list properties of `that` which the diff descends into.
+ */
+function listPropertiesOf(that: AasTypes.Class): Array<string> {
+  if (AasTypes.isEnvironment(that)) {
+    return ["assetAdministrationShells", "submodels", "conceptDescriptions"];
+  } else if (AasTypes.isSubmodel(that)) {
+    return ["submodelElements"];
+  } else if (
+    AasTypes.isSubmodelElementCollection(that) ||
+    AasTypes.isSubmodelElementList(that)
+  ) {
+    return ["value"];
+  } else if (AasTypes.isEntity(that)) {
+    return ["statements"];
+  } else if (AasTypes.isAnnotatedRelationshipElement(that)) {
+    return ["annotations"];
+  }
+  return [];
+}
+
+/**
+ * Get the list property `name` of `that` container.
+ *
+ * @returns the list, or `undefined` if `that` has no such list property
+ */
+function itemsOf(
+  that: AasTypes.Class,
+  name: string
+): Array<AasTypes.Class> | null | undefined {
+  if (AasTypes.isEnvironment(that)) {
+    switch (name) {
+      case "assetAdministrationShells":
+        return that.assetAdministrationShells;
+      case "submodels":
+        return that.submodels;
+      case "conceptDescriptions":
+        return that.conceptDescriptions;
+    }
+  } else if (AasTypes.isSubmodel(that)) {
+    if (name === "submodelElements") {
+      return that.submodelElements;
+    }
+  } else if (
+    AasTypes.isSubmodelElementCollection(that) ||
+    AasTypes.isSubmodelElementList(that)
+  ) {
+    if (name === "value") {
+      return that.value;
+    }
+  } else if (AasTypes.isEntity(that)) {
+    if (name === "statements") {
+      return that.statements;
+    }
+  } else if (AasTypes.isAnnotatedRelationshipElement(that)) {
+    if (name === "annotations") {
+      return that.annotations;
+    }
+  }
+  return undefined;
+}
+
+/**
+ * Get the check of the items of the list property `name` of `that` container.
+ *
+ * @returns the check, or `null` if `that` has no such list property
+ */
+function itemCheckOf(
+  that: AasTypes.Class,
+  name: string
+): ((item: AasTypes.Class) => boolean) | null {
+  if (AasTypes.isEnvironment(that)) {
+    switch (name) {
+      case "assetAdministrationShells":
+        return AasTypes.isAssetAdministrationShell;
+      case "submodels":
+        return AasTypes.isSubmodel;
+      case "conceptDescriptions":
+        return AasTypes.isConceptDescription;
+    }
+  } else if (AasTypes.isSubmodel(that)) {
+    if (name === "submodelElements") {
+      return AasTypes.isSubmodelElement;
+    }
+  } else if (
+    AasTypes.isSubmodelElementCollection(that) ||
+    AasTypes.isSubmodelElementList(that)
+  ) {
+    if (name === "value") {
+      return AasTypes.isSubmodelElement;
+    }
+  } else if (AasTypes.isEntity(that)) {
+    if (name === "statements") {
+      return AasTypes.isSubmodelElement;
+    }
+  } else if (AasTypes.isAnnotatedRelationshipElement(that)) {
+    if (name === "annotations") {
+      return AasTypes.isDataElement;
+    }
+  }
+  return null;
+}
+
+/**
+ * Set the list property `name` of `that` container to `items`.
+ *
+ * @remarks
+ * The caller needs to check the items with {@link itemCheckOf} beforehand.
+ */
+function setItemsOf(
+  that: AasTypes.Class,
+  name: string,
+  items: Array<AasTypes.Class> | null
+): void {
+  if (AasTypes.isEnvironment(that)) {
+    switch (name) {
+      case "assetAdministrationShells":
+        that.assetAdministrationShells = <Array<AasTypes.AssetAdministrationShell>>(
+          items
+        );
+        return;
+      case "submodels":
+        that.submodels = <Array<AasTypes.Submodel>>items;
+        return;
+      case "conceptDescriptions":
+        that.conceptDescriptions = <Array<AasTypes.ConceptDescription>>items;
+        return;
+    }
+  } else if (AasTypes.isSubmodel(that)) {
+    that.submodelElements = <Array<AasTypes.ISubmodelElement>>items;
+    return;
+  } else if (
+    AasTypes.isSubmodelElementCollection(that) ||
+    AasTypes.isSubmodelElementList(that)
+  ) {
+    that.value = <Array<AasTypes.ISubmodelElement>>items;
+    return;
+  } else if (AasTypes.isEntity(that)) {
+    that.statements = <Array<AasTypes.ISubmodelElement>>items;
+    return;
+  } else if (AasTypes.isAnnotatedRelationshipElement(that)) {
+    that.annotations = <Array<AasTypes.IDataElement>>items;
+    return;
+  }
+
+  throw new Error(
+    `Unexpected list property ${name} of ` +
+      AasStringification.mustModelTypeToString(that)
+  );
+}
+
+/**
+ * Get the key which identifies `that` item in its list.
+ *
+ * @returns the identifier, the `idShort`, or `null` if there is none
+ */
+function keyOf(that: AasTypes.Class): string | null {
+  if (AasTypes.isIdentifiable(that)) {
+    return that.id;
+  } else if (AasTypes.isReferable(that)) {
+    return that.idShort;
+  }
+  return null;
+}
+
+/**
+ * Get the keys of the `items`.
+ *
+ * @returns the keys, or `null` if some item has no key, or a key repeats
+ */
+function keysOf(items: Array<AasTypes.Class>): Array<string> | null {
+  const keys = new Array<string>(items.length);
+  const seen = new Set<string>();
+  for (let i = 0; i < items.length; i++) {
+    const key = keyOf(items[i]);
+    if (key === null || seen.has(key)) {
+      return null;
+    }
+    seen.add(key);
+    keys[i] = key;
+  }
+  return keys;
+}
+
+/**
+ * Find the longest strictly increasing subsequence of the `values`.
+ *
+ * @returns indices of the subsequence in `values`
+ */
+function longestIncreasingSubsequence(values: Array<number>): Array<number> {
+  // Index of the smallest tail of an increasing subsequence of each length
+  const tails = new Array<number>();
+
+  // Index of the predecessor of each value in its subsequence
+  const predecessors = new Array<number>(values.length);
+
+  for (let i = 0; i < values.length; i++) {
+    let low = 0;
+    let high = tails.length;
+    while (low < high) {
+      const middle = (low + high) >>> 1;
+      if (values[tails[middle]] < values[i]) {
+        low = middle + 1;
+      } else {
+        high = middle;
+      }
+    }
+
+    predecessors[i] = low > 0 ? tails[low - 1] : -1;
+    tails[low] = i;
+  }
+
+  const result = new Array<number>(tails.length);
+  let index = tails.length > 0 ? tails[tails.length - 1] : -1;
+  for (let i = tails.length - 1; i >= 0; i--) {
+    result[i] = index;
+    index = predecessors[index];
+  }
+  return result;
+}
+
+/**
+ * Collect the changes between two instances.
+ */
+class Differ {
+  /**
+   * Changes collected so far
+   */
+  readonly changes = new Array<Change>();
+
+  /**
+   * Hashes of the instances to be passed on to {@link equality!deepEquals}
+   */
+  private readonly memo: WeakMap<AasTypes.Class, number> | null;
+
+  constructor(memo: WeakMap<AasTypes.Class, number> | null = null) {
+    this.memo = memo;
+  }
+
+  /**
+   * Compare `that` instance against the `other` instance, if any.
+   */
+  optionalEquals(that: AasTypes.Class | null, other: AasTypes.Class | null): boolean {
+    if (that === other) {
+      return true;
+    }
+    if (that === null || other === null) {
+      return false;
+    }
+    return AasEquality.deepEquals(that, other, this.memo);
+  }
+
+  /**
+   * Compare the `items` against the `other` items in order, if any.
+   */
+  arraysEqual(
+    items: Array<AasTypes.Class> | null,
+    other: Array<AasTypes.Class> | null
+  ): boolean {
+    if (items === other) {
+      return true;
+    }
+    if (items === null || other === null || items.length !== other.length) {
+      return false;
+    }
+
+    for (let i = 0; i < items.length; i++) {
+      if (!this.optionalEquals(items[i], other[i])) {
+        return false;
+      }
+    }
+    return true;
+  }
+
+  /**
+   * Compare the properties of `that` container against the `other` container
+   * except for the list properties which the diff descends into.
+   *
+   * @param that - container to be compared
+   * @param other - container to compare against
+   * @returns `true` if the two are equal save for the nested items
+   */
+  ownPropertiesEqual(that: AasTypes.Class, other: AasTypes.Class): boolean {
+    if (AasTypes.isEnvironment(that)) {
+      return AasTypes.isEnvironment(other);
+    }
+
+    if (AasTypes.isSubmodel(that)) {
+      if (!AasTypes.isSubmodel(other)) {
+        return false;
+      }
+
+      return (
+        that.category === other.category &&
+        that.idShort === other.idShort &&
+        that.checksum === other.checksum &&
+        that.id === other.id &&
+        that.kind === other.kind &&
+        this.arraysEqual(that.extensions, other.extensions) &&
+        this.arraysEqual(that.displayName, other.displayName) &&
+        this.arraysEqual(that.description, other.description) &&
+        this.optionalEquals(that.administration, other.administration) &&
+        this.optionalEquals(that.semanticId, other.semanticId) &&
+        this.arraysEqual(that.supplementalSemanticIds, other.supplementalSemanticIds) &&
+        this.arraysEqual(that.qualifiers, other.qualifiers) &&
+        this.arraysEqual(
+          that.embeddedDataSpecifications,
+          other.embeddedDataSpecifications
+        )
+      );
+    }
+
+    if (AasTypes.isSubmodelElementCollection(that)) {
+      if (!AasTypes.isSubmodelElementCollection(other)) {
+        return false;
+      }
+
+      return (
+        that.category === other.category &&
+        that.idShort === other.idShort &&
+        that.checksum === other.checksum &&
+        that.kind === other.kind &&
+        this.arraysEqual(that.extensions, other.extensions) &&
+        this.arraysEqual(that.displayName, other.displayName) &&
+        this.arraysEqual(that.description, other.description) &&
+        this.optionalEquals(that.semanticId, other.semanticId) &&
+        this.arraysEqual(that.supplementalSemanticIds, other.supplementalSemanticIds) &&
+        this.arraysEqual(that.qualifiers, other.qualifiers) &&
+        this.arraysEqual(
+          that.embeddedDataSpecifications,
+          other.embeddedDataSpecifications
+        )
+      );
+    }
+
+    if (AasTypes.isSubmodelElementList(that)) {
+      if (!AasTypes.isSubmodelElementList(other)) {
+        return false;
+      }
+
+      return (
+        that.category === other.category &&
+        that.idShort === other.idShort &&
+        that.checksum === other.checksum &&
+        that.kind === other.kind &&
+        that.orderRelevant === other.orderRelevant &&
+        that.typeValueListElement === other.typeValueListElement &&
+        that.valueTypeListElement === other.valueTypeListElement &&
+        this.arraysEqual(that.extensions, other.extensions) &&
+        this.arraysEqual(that.displayName, other.displayName) &&
+        this.arraysEqual(that.description, other.description) &&
+        this.optionalEquals(that.semanticId, other.semanticId) &&
+        this.arraysEqual(that.supplementalSemanticIds, other.supplementalSemanticIds) &&
+        this.arraysEqual(that.qualifiers, other.qualifiers) &&
+        this.arraysEqual(
+          that.embeddedDataSpecifications,
+          other.embeddedDataSpecifications
+        ) &&
+        this.optionalEquals(that.semanticIdListElement, other.semanticIdListElement)
+      );
+    }
+
+    if (AasTypes.isEntity(that)) {
+      if (!AasTypes.isEntity(other)) {
+        return false;
+      }
+
+      return (
+        that.category === other.category &&
+        that.idShort === other.idShort &&
+        that.checksum === other.checksum &&
+        that.kind === other.kind &&
+        that.entityType === other.entityType &&
+        this.arraysEqual(that.extensions, other.extensions) &&
+        this.arraysEqual(that.displayName, other.displayName) &&
+        this.arraysEqual(that.description, other.description) &&
+        this.optionalEquals(that.semanticId, other.semanticId) &&
+        this.arraysEqual(that.supplementalSemanticIds, other.supplementalSemanticIds) &&
+        this.arraysEqual(that.qualifiers, other.qualifiers) &&
+        this.arraysEqual(
+          that.embeddedDataSpecifications,
+          other.embeddedDataSpecifications
+        ) &&
+        this.optionalEquals(that.globalAssetId, other.globalAssetId) &&
+        this.optionalEquals(that.specificAssetId, other.specificAssetId)
+      );
+    }
+
+    if (AasTypes.isAnnotatedRelationshipElement(that)) {
+      if (!AasTypes.isAnnotatedRelationshipElement(other)) {
+        return false;
+      }
+
+      return (
+        that.category === other.category &&
+        that.idShort === other.idShort &&
+        that.checksum === other.checksum &&
+        that.kind === other.kind &&
+        this.arraysEqual(that.extensions, other.extensions) &&
+        this.arraysEqual(that.displayName, other.displayName) &&
+        this.arraysEqual(that.description, other.description) &&
+        this.optionalEquals(that.semanticId, other.semanticId) &&
+        this.arraysEqual(that.supplementalSemanticIds, other.supplementalSemanticIds) &&
+        this.arraysEqual(that.qualifiers, other.qualifiers) &&
+        this.arraysEqual(
+          that.embeddedDataSpecifications,
+          other.embeddedDataSpecifications
+        ) &&
+        this.optionalEquals(that.first, other.first) &&
+        this.optionalEquals(that.second, other.second)
+      );
+    }
+
+    return false;
+  }
+
+  /**
+   * Collect the changes between `that` item and the `other` item with the same
+   * key.
+   *
+   * @param that - old item
+   * @param other - new item
+   * @param path - to the item
+   */
+  diffInstances(
+    that: AasTypes.Class,
+    other: AasTypes.Class,
+    path: Array<string | number>
+  ): void {
+    if (that === other) {
+      return;
+    }
+
+    const names = listPropertiesOf(that);
+    if (names.length === 0 || !this.ownPropertiesEqual(that, other)) {
+      if (!AasEquality.deepEquals(that, other, this.memo)) {
+        this.changes.push(new Change(ChangeKind.Replace, path, other));
+      }
+      return;
+    }
+
+    for (const name of names) {
+      const items = itemsOf(that, name);
+      const otherItems = itemsOf(other, name);
+      if (items === undefined || otherItems === undefined) {
+        throw new Error(`Unexpected list property ${name} without items`);
+      }
+
+      this.diffLists(
+        items,
+        otherItems,
+        [...path, name],
+        AasTypes.isSubmodelElementList(that)
+      );
+    }
+  }
+
+  /**
+   * Collect the changes between the `items` and the `other` items.
+   *
+   * @param items - old list
+   * @param otherItems - new list
+   * @param path - to the list
+   * @param positional - if set, identify the items by their positions
+   */
+  diffLists(
+    items: Array<AasTypes.Class> | null,
+    otherItems: Array<AasTypes.Class> | null,
+    path: Array<string | number>,
+    positional: boolean
+  ): void {
+    if (items === otherItems) {
+      return;
+    }
+
+    if (items === null || otherItems === null) {
+      this.changes.push(new Change(ChangeKind.Replace, path, otherItems));
+      return;
+    }
+
+    if (!positional) {
+      const keys = keysOf(items);
+      const otherKeys = keysOf(otherItems);
+      if (keys !== null && otherKeys !== null) {
+        this.diffByKeys(items, keys, otherItems, otherKeys, path);
+        return;
+      }
+    }
+
+    this.diffByPositions(items, otherItems, path);
+  }
+
+  /**
+   * Collect the changes between the items identified by their positions.
+   */
+  diffByPositions(
+    items: Array<AasTypes.Class>,
+    otherItems: Array<AasTypes.Class>,
+    path: Array<string | number>
+  ): void {
+    const common = Math.min(items.length, otherItems.length);
+    for (let i = 0; i < common; i++) {
+      this.diffInstances(items[i], otherItems[i], [...path, i]);
+    }
+
+    for (let i = items.length - 1; i >= otherItems.length; i--) {
+      this.changes.push(new Change(ChangeKind.Remove, [...path, i]));
+    }
+
+    for (let i = items.length; i < otherItems.length; i++) {
+      this.changes.push(new Change(ChangeKind.Add, [...path, i], otherItems[i]));
+    }
+  }
+
+  /**
+   * Collect the changes between the items identified by their keys.
+   *
+   * @remarks
+   * We keep the largest set of the items which stay in the same order, and
+   * remove and add the other items anew.
+   */
+  diffByKeys(
+    items: Array<AasTypes.Class>,
+    keys: Array<string>,
+    otherItems: Array<AasTypes.Class>,
+    otherKeys: Array<string>,
+    path: Array<string | number>
+  ): void {
+    const otherPositions = new Map<string, number>();
+    for (let i = 0; i < otherKeys.length; i++) {
+      otherPositions.set(otherKeys[i], i);
+    }
+
+    // Positions in the new list of the kept items in their old order
+    const kept = new Array<number>();
+    for (const key of keys) {
+      const otherPosition = otherPositions.get(key);
+      if (otherPosition !== undefined) {
+        kept.push(otherPosition);
+      }
+    }
+
+    const stable = new Set<number>();
+    for (const i of longestIncreasingSubsequence(kept)) {
+      stable.add(kept[i]);
+    }
+
+    for (let i = 0; i < items.length; i++) {
+      const otherPosition = otherPositions.get(keys[i]);
+      if (otherPosition === undefined || !stable.has(otherPosition)) {
+        this.changes.push(new Change(ChangeKind.Remove, [...path, keys[i]]));
+      } else {
+        this.diffInstances(items[i], otherItems[otherPosition], [...path, keys[i]]);
+      }
+    }
+
+    // After the removals, the stable items are in the right order, so we can
+    // insert the other items at their final positions one after another.
+    for (let i = 0; i < otherItems.length; i++) {
+      if (!stable.has(i)) {
+        this.changes.push(new Change(ChangeKind.Add, [...path, i], otherItems[i]));
+      }
+    }
+  }
+}
+
+/**
+ * Compute the changes which turn `that` environment into the `other` one.
+ *
+ * @remarks
+ * The changes refer to the instances of `other` instead of copying them.
+ *
+ * @param that - old environment
+ * @param other - new environment
+ * @param memo - hashes of the instances to be passed on to
+ * {@link equality!deepEquals}, if any
+ * @returns list of the changes, empty if the environments are deeply equal
+ */
+export function diff(
+  that: AasTypes.Environment,
+  other: AasTypes.Environment,
+  memo: WeakMap<AasTypes.Class, number> | null = null
+): Array<Change> {
+  const differ = new Differ(memo);
+  differ.diffInstances(that, other, []);
+  return differ.changes;
+}
+
+/**
+ * Represent an error which occurred when applying a change.
+ */
+export class PatchError {
+  /**
+   * Human-readable description of the error
+   */
+  readonly message: string;
+
+  /**
+   * Index of the change which could not be applied
+   */
+  readonly index: number;
+
+  constructor(message: string, index: number) {
+    this.message = message;
+    this.index = index;
+  }
+}
+
+/**
+ * Find the position of the item identified by `key` in the `items`.
+ *
+ * @returns the position, or -1 if there is no such item
+ */
+function positionOf(items: Array<AasTypes.Class>, key: string | number): number {
+  if (typeof key === "number") {
+    return Number.isInteger(key) && key >= 0 && key < items.length ? key : -1;
+  }
+
+  for (let i = 0; i < items.length; i++) {
+    if (keyOf(items[i]) === key) {
+      return i;
+    }
+  }
+  return -1;
+}
+
+/**
+ * Walk `path` up to `end` starting from `that` and return the instance
+ * at which the walk ends.
+ *
+ * @remarks
+ * If `copied` is given, the instances along the path which are not in it yet are
+ * replaced with their shallow copies in their parents, and the copies are added to
+ * `copied`. The caller must make sure that `that` is already in `copied`.
+ *
+ * @param that - instance to start from
+ * @param path - segments to follow in pairs of a list property and an item key
+ * @param end - index of the segment where the walk stops, always even
+ * @param copied - instances which can be modified in place, if any
+ * @returns the instance, or an error message
+ */
+function resolve(
+  that: AasTypes.Class,
+  path: Array<string | number>,
+  end: number,
+  copied: Set<AasTypes.Class> | null
+): AasTypes.Class | string {
+  let container: AasTypes.Class = that;
+  for (let i = 0; i < end; i += 2) {
+    const items = itemsOf(container, `${path[i]}`);
+    if (items === undefined) {
+      return `Expected a list property at ${i}, but got: ${path[i]}`;
+    }
+
+    const position = items !== null ? positionOf(items, path[i + 1]) : -1;
+    if (items === null || position === -1) {
+      return `Expected an item at ${i + 1}, but found none: ${path[i + 1]}`;
+    }
+
+    let item = items[position];
+    if (copied !== null && !copied.has(item)) {
+      // The list belongs to a copy, so we can replace the item in place.
+      item = AasCopying.shallowCopy(item);
+      items[position] = item;
+      copied.add(item);
+    }
+    container = item;
+  }
+  return container;
+}
+
+/**
+ * Apply a single `change` to `that` environment.
+ *
+ * @remarks
+ * See {@link resolve} for `copied`.
+ *
+ * @returns error message, if any
+ */
+function applyChange(
+  that: AasTypes.Environment,
+  change: Change,
+  copied: Set<AasTypes.Class> | null
+): string | null {
+  const path = change.path;
+  const listEnd = path.length % 2 === 1 ? path.length - 1 : path.length - 2;
+  if (listEnd < 0) {
+    return "Expected a path to an item or a list, but got an empty path";
+  }
+
+  const container = resolve(that, path, listEnd, copied);
+  if (typeof container === "string") {
+    return container;
+  }
+
+  const name = `${path[listEnd]}`;
+  const check = itemCheckOf(container, name);
+  const items = itemsOf(container, name);
+  if (check === null || items === undefined) {
+    return `Expected a list property at ${listEnd}, but got: ${name}`;
+  }
+
+  const value = change.value;
+
+  if (listEnd === path.length - 1) {
+    if (change.kind !== ChangeKind.Replace) {
+      return (
+        "Expected a path to an item for an addition or a removal, " +
+        "but got a path to a list"
+      );
+    }
+    if (value !== null && !(Array.isArray(value) && value.every(check))) {
+      return `Expected a list of the items of ${name} or null as the value`;
+    }
+
+    // The later changes might modify the list, so we must not take it over
+    // from the caller if we are not supposed to modify anything in place.
+    setItemsOf(
+      container,
+      name,
+      copied !== null && value !== null ? value.slice() : value
+    );
+    return null;
+  }
+
+  const key = path[path.length - 1];
+
+  switch (change.kind) {
+    case ChangeKind.Add: {
+      if (value === null || Array.isArray(value) || !check(value)) {
+        return `Expected an item of ${name} as the value`;
+      }
+
+      const length = items !== null ? items.length : 0;
+      if (
+        typeof key !== "number" ||
+        !Number.isInteger(key) ||
+        key < 0 ||
+        key > length
+      ) {
+        return (
+          `Expected a position between 0 and ${length} as the last segment, ` +
+          `but got: ${key}`
+        );
+      }
+
+      if (items === null) {
+        setItemsOf(container, name, [value]);
+      } else {
+        items.splice(key, 0, value);
+      }
+      return null;
+    }
+
+    case ChangeKind.Remove: {
+      const position = items !== null ? positionOf(items, key) : -1;
+      if (items === null || position === -1) {
+        return `Expected an item to be removed, but found none: ${key}`;
+      }
+
+      items.splice(position, 1);
+      return null;
+    }
+
+    case ChangeKind.Replace: {
+      if (value === null || Array.isArray(value) || !check(value)) {
+        return `Expected an item of ${name} as the value`;
+      }
+
+      const position = items !== null ? positionOf(items, key) : -1;
+      if (items === null || position === -1) {
+        return `Expected an item to be replaced, but found none: ${key}`;
+      }
+
+      items[position] = value;
+      return null;
+    }
+
+    default:
+      return `Unexpected kind of the change: ${change.kind}`;
+  }
+}
+
+/**
+ * Apply the `changes` to `that` environment in place.
+ *
+ * @remarks
+ * The changes are applied in order. If a change can not be applied, we stop
+ * there and report it. The changes before it remain applied.
+ *
+ * The values of the changes are inserted as-is, not copied.
+ *
+ * @param that - environment to be patched
+ * @param changes - to be applied
+ * @returns error, if any
+ */
+export function applyPatch(
+  that: AasTypes.Environment,
+  changes: Iterable<Change>
+): PatchError | null {
+  let index = 0;
+  for (const change of changes) {
+    const message = applyChange(that, change, null);
+    if (message !== null) {
+      return new PatchError(message, index);
+    }
+    index++;
+  }
+  return null;
+}
+
+/**
+ * Apply the `changes` to a copy of `that` environment, leaving it intact.
+ *
+ * @remarks
+ * Only the instances on the paths of the changes are copied (shallowly).
+ * All the other instances are shared between `that` environment and
+ * the result. Hence the cost is proportional to the changes, not to the size of
+ * the environment.
+ *
+ * Since the instances are shared, neither `that` environment nor the result
+ * may be modified in place afterwards. Use this function or
+ * {@link updateCopyOnWrite} again instead.
+ *
+ * The values of the changes are inserted as-is, not copied.
+ *
+ * @param that - environment to be patched
+ * @param changes - to be applied
+ * @returns the patched copy, or the error
+ */
+export function applyPatchCopyOnWrite(
+  that: AasTypes.Environment,
+  changes: Iterable<Change>
+): AasCommon.Either<AasTypes.Environment, PatchError> {
+  const result = AasCopying.shallowCopy(that);
+  const copied = new Set<AasTypes.Class>([result]);
+
+  let index = 0;
+  for (const change of changes) {
+    const message = applyChange(result, change, copied);
+    if (message !== null) {
+      return new AasCommon.Either<AasTypes.Environment, PatchError>(
+        null,
+        new PatchError(message, index)
+      );
+    }
+    index++;
+  }
+  return new AasCommon.Either<AasTypes.Environment, PatchError>(result, null);
+}
+
+/**
+ * Edit the item at `path` in a copy of `that` environment, leaving it intact.
+ *
+ * @remarks
+ * The item and its ancestors are copied shallowly; all the other instances are
+ * shared, see {@link applyPatchCopyOnWrite}.
+ *
+ * The `edit` receives the copy of the item. It may set the properties of
+ * the copy and re-arrange its lists, but it must not modify the instances
+ * referenced by the copy in place, as they are shared with `that` environment.
+ *
+ * @param that - environment to be edited
+ * @param path - path to the item, in pairs of a list property and an item key
+ * as in {@link Change.path}; empty for the environment itself
+ * @param edit - modification of the copy of the item
+ * @returns the edited copy, or the error
+ */
+export function updateCopyOnWrite(
+  that: AasTypes.Environment,
+  path: Array<string | number>,
+  edit: (copy: AasTypes.Class) => void
+): AasCommon.Either<AasTypes.Environment, PatchError> {
+  if (path.length % 2 !== 0) {
+    return new AasCommon.Either<AasTypes.Environment, PatchError>(
+      null,
+      new PatchError("Expected a path to an item, but got a path to a list", 0)
+    );
+  }
+
+  const result = AasCopying.shallowCopy(that);
+  const copied = new Set<AasTypes.Class>([result]);
+
+  const item = resolve(result, path, path.length, copied);
+  if (typeof item === "string") {
+    return new AasCommon.Either<AasTypes.Environment, PatchError>(
+      null,
+      new PatchError(item, 0)
+    );
+  }
+
+  edit(item);
+  return new AasCommon.Either<AasTypes.Environment, PatchError>(result, null);
+}
+
+/**
+ * Map the kinds of the changes to their names in JSON.
+ */
+const CHANGE_KIND_TO_JSON = /*@__PURE__*/ new Map<ChangeKind, string>([
+  [ChangeKind.Add, "add"],
+  [ChangeKind.Remove, "remove"],
+  [ChangeKind.Replace, "replace"]
+]);
+
+/**
+ * Map the names of the kinds of the changes in JSON to the kinds.
+ */
+const CHANGE_KIND_FROM_JSON = /*@__PURE__*/ new Map<string, ChangeKind>([
+  ["add", ChangeKind.Add],
+  ["remove", ChangeKind.Remove],
+  ["replace", ChangeKind.Replace]
+]);
+
+/**
+ * Convert the `changes` to a JSON-able structure.
+ *
+ * @remarks
+ * Each change is represented as an object with the properties `op`, `path` and,
+ * unless removed, `value`, similar to JSON Patch (RFC 6902).
+ *
+ * @param changes - to be converted
+ * @returns JSON-able structure
+ */
+export function changesToJsonable(changes: Iterable<Change>): AasJsonization.JsonArray {
+  const result = new Array<AasJsonization.JsonValue>();
+  for (const change of changes) {
+    const kind = CHANGE_KIND_TO_JSON.get(change.kind);
+    if (kind === undefined) {
+      throw new Error(`Unexpected kind of the change: ${change.kind}`);
+    }
+
+    const jsonable: AasJsonization.JsonObject = { op: kind, path: change.path };
+    if (change.kind !== ChangeKind.Remove) {
+      const value = change.value;
+      if (value === null) {
+        // JSON values do not include null in their type, but the list of
+        // a removed list is null in JSON as well.
+        jsonable["value"] = <AasJsonization.JsonValue>(<unknown>null);
+      } else if (Array.isArray(value)) {
+        jsonable["value"] = value.map((item) => AasJsonization.toJsonable(item));
+      } else {
+        jsonable["value"] = AasJsonization.toJsonable(value);
+      }
+    }
+    result.push(jsonable);
+  }
+  return result;
+}
+
+/**
+ * De-serialize an item of a list at the `path` from `jsonable`.
+ */
+function itemFromJsonable(
+  jsonable: AasJsonization.JsonValue,
+  path: Array<string | number>
+): AasCommon.Either<AasTypes.Class, AasJsonization.DeserializationError> {
+  if (path.length <= 2) {
+    switch (path[0]) {
+      case "assetAdministrationShells":
+        return AasJsonization.assetAdministrationShellFromJsonable(jsonable);
+      case "submodels":
+        return AasJsonization.submodelFromJsonable(jsonable);
+      case "conceptDescriptions":
+        return AasJsonization.conceptDescriptionFromJsonable(jsonable);
+      default:
+        return new AasCommon.Either<
+          AasTypes.Class,
+          AasJsonization.DeserializationError
+        >(
+          null,
+          new AasJsonization.DeserializationError(
+            `Expected a list property of an environment, but got: ${path[0]}`
+          )
+        );
+    }
+  }
+
+  return AasJsonization.submodelElementFromJsonable(jsonable);
+}
+
+/**
+ * De-serialize a single change from `jsonable`.
+ */
+function changeFromJsonable(
+  jsonable: AasJsonization.JsonValue
+): AasCommon.Either<Change, AasJsonization.DeserializationError> {
+  const fail = (message: string, property: string | null = null) => {
+    const error = new AasJsonization.DeserializationError(message);
+    if (property !== null) {
+      const container = <AasJsonization.JsonObject>jsonable;
+      error.path.prepend(new AasJsonization.PropertySegment(container, property));
+    }
+    return new AasCommon.Either<Change, AasJsonization.DeserializationError>(
+      null,
+      error
+    );
+  };
+
+  if (jsonable === null || typeof jsonable !== "object" || Array.isArray(jsonable)) {
+    return fail("Expected a JSON object");
+  }
+  const container = <AasJsonization.JsonObject>jsonable;
+
+  const kind = CHANGE_KIND_FROM_JSON.get(<string>container["op"]);
+  if (kind === undefined) {
+    return fail("Expected one of add, remove or replace", "op");
+  }
+
+  const jsonablePath = container["path"];
+  if (
+    !Array.isArray(jsonablePath) ||
+    !jsonablePath.every(
+      (segment) => typeof segment === "string" || typeof segment === "number"
+    )
+  ) {
+    return fail("Expected an array of strings and numbers", "path");
+  }
+  const path = <Array<string | number>>jsonablePath;
+
+  if (kind === ChangeKind.Remove) {
+    return new AasCommon.Either<Change, AasJsonization.DeserializationError>(
+      new Change(kind, path),
+      null
+    );
+  }
+
+  const jsonableValue = container["value"];
+  if (jsonableValue === undefined) {
+    return fail("Expected the property value, but found none");
+  }
+
+  let value: AasTypes.Class | Array<AasTypes.Class> | null = null;
+  if (path.length % 2 === 1) {
+    if (jsonableValue !== null) {
+      if (!Array.isArray(jsonableValue)) {
+        return fail("Expected an array or null", "value");
+      }
+
+      const items = new Array<AasTypes.Class>();
+      for (let i = 0; i < jsonableValue.length; i++) {
+        const itemOrError = itemFromJsonable(jsonableValue[i], [...path, i]);
+        if (itemOrError.error !== null) {
+          itemOrError.error.path.prepend(
+            new AasJsonization.IndexSegment(jsonableValue, i)
+          );
+          itemOrError.error.path.prepend(
+            new AasJsonization.PropertySegment(container, "value")
+          );
+          return new AasCommon.Either<Change, AasJsonization.DeserializationError>(
+            null,
+            itemOrError.error
+          );
+        }
+        items.push(itemOrError.mustValue());
+      }
+      value = items;
+    }
+  } else {
+    const itemOrError = itemFromJsonable(jsonableValue, path);
+    if (itemOrError.error !== null) {
+      itemOrError.error.path.prepend(
+        new AasJsonization.PropertySegment(container, "value")
+      );
+      return new AasCommon.Either<Change, AasJsonization.DeserializationError>(
+        null,
+        itemOrError.error
+      );
+    }
+    value = itemOrError.mustValue();
+  }
+
+  return new AasCommon.Either<Change, AasJsonization.DeserializationError>(
+    new Change(kind, path, value),
+    null
+  );
+}
+
+/**
+ * De-serialize the changes from `jsonable`.
+ *
+ * @param jsonable - as produced by {@link changesToJsonable}
+ * @returns the changes, or an error
+ */
+export function changesFromJsonable(
+  jsonable: AasJsonization.JsonValue
+): AasCommon.Either<Array<Change>, AasJsonization.DeserializationError> {
+  if (!Array.isArray(jsonable)) {
+    return new AasCommon.Either<Array<Change>, AasJsonization.DeserializationError>(
+      null,
+      new AasJsonization.DeserializationError("Expected a JSON array")
+    );
+  }
+
+  const changes = new Array<Change>();
+  for (let i = 0; i < jsonable.length; i++) {
+    const changeOrError = changeFromJsonable(jsonable[i]);
+    if (changeOrError.error !== null) {
+      changeOrError.error.path.prepend(new AasJsonization.IndexSegment(jsonable, i));
+      return new AasCommon.Either<Array<Change>, AasJsonization.DeserializationError>(
+        null,
+        changeOrError.error
+      );
+    }
+    changes.push(changeOrError.mustValue());
+  }
+
+  return new AasCommon.Either<Array<Change>, AasJsonization.DeserializationError>(
+    changes,
+    null
+  );
+}
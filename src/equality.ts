@@ -0,0 +1,1498 @@
+/**
+ * Compare AAS instances structurally and hash them consistently with the comparison.
+ *
+ * @remarks
+ * Two instances are deeply equal if they are of the same class and all their
+ * properties are equal, recursively. The strings are compared by their code units,
+ * the literals of enumerations by their values and the byte arrays byte by byte.
+ * The order of the items in the lists matters.
+ *
+ * Deeply equal instances always have the same hash. The hashes are 32-bit
+ * integers, so different instances will sometimes share a hash as well.
+ *
+ * If you hash or compare the same large instances over and over, such as when
+ * you de-duplicate or detect changes in an environment, pass in a memo. The memo
+ * keeps the hash of every instance hashed so far, and the comparison with a memo
+ * rejects unequal instances by their hashes. Since the memo does not notice when
+ * an instance changes, use it only as long as the instances stay as they are,
+ * or delete the changed instances together with all their ancestors from it.
+ */
+
+import * as AasTypes from "./types";
+
+/**
+ * Hash of the absent values
+ */
+const NULL_HASH = 0x9e3779b9 | 0;
+
+/**
+ * Mix the hash `value` into the hash `seed`.
+ */
+function combine(seed: number, value: number): number {
+  return (Math.imul(seed, 31) + value) | 0;
+}
+
+/**
+ * Hash the `text` with FNV-1a over its code units.
+ */
+function hashString(text: string | null): number {
+  if (text === null) {
+    return NULL_HASH;
+  }
+
+  let result = 0x811c9dc5 | 0;
+  for (let i = 0; i < text.length; i++) {
+    result = Math.imul(result ^ text.charCodeAt(i), 0x01000193);
+  }
+  return result;
+}
+
+/**
+ * Hash the `bytes` with FNV-1a.
+ */
+function hashBytes(bytes: Uint8Array | null): number {
+  if (bytes === null) {
+    return NULL_HASH;
+  }
+
+  let result = 0x811c9dc5 | 0;
+  for (let i = 0; i < bytes.length; i++) {
+    result = Math.imul(result ^ bytes[i], 0x01000193);
+  }
+  return result;
+}
+
+/**
+ * Hash the `value` of a boolean.
+ */
+function hashBoolean(value: boolean | null): number {
+  if (value === null) {
+    return NULL_HASH;
+  }
+  return value ? 1231 : 1237;
+}
+
+/**
+ * Hash the numeric `value` of a literal of an enumeration.
+ */
+function hashLiteral(value: number | null): number {
+  return value !== null ? value : NULL_HASH;
+}
+
+/**
+ * Compare the `bytes` against the `other` bytes byte by byte.
+ */
+function bytesEqual(bytes: Uint8Array | null, other: Uint8Array | null): boolean {
+  if (bytes === other) {
+    return true;
+  }
+  if (bytes === null || other === null || bytes.length !== other.length) {
+    return false;
+  }
+
+  for (let i = 0; i < bytes.length; i++) {
+    if (bytes[i] !== other[i]) {
+      return false;
+    }
+  }
+  return true;
+}
+
+/**
+ * Hash the instances structurally.
+ *
+ * @remarks
+ * The hash of each class starts from the hash of the class name so that
+ * the instances of different classes with the same property values hash
+ * differently.
+ */
+class Hasher extends AasTypes.AbstractTransformer<number> {
+  /**
+   * Hashes of the instances computed so far, if memoized
+   */
+  private readonly memo: WeakMap<AasTypes.Class, number> | null;
+
+  constructor(memo: WeakMap<AasTypes.Class, number> | null = null) {
+    super();
+    this.memo = memo;
+  }
+
+  /**
+   * Hash `that` instance, or look up its hash in the memo.
+   *
+   * @param that - instance to be hashed, if any
+   * @returns hash of `that`
+   */
+  hashOf(that: AasTypes.Class | null): number {
+    if (that === null) {
+      return NULL_HASH;
+    }
+
+    if (this.memo === null) {
+      return this.transform(that);
+    }
+
+    let result = this.memo.get(that);
+    if (result === undefined) {
+      result = this.transform(that);
+      this.memo.set(that, result);
+    }
+    return result;
+  }
+
+  /**
+   * Hash the `items` in order.
+   *
+   * @param items - instances to be hashed, if any
+   * @returns hash of `items`
+   */
+  hashOfArray(items: Array<AasTypes.Class> | null): number {
+    if (items === null) {
+      return NULL_HASH;
+    }
+
+    let result = items.length;
+    for (const item of items) {
+      result = combine(result, this.hashOf(item));
+    }
+    return result;
+  }
+
+  transformExtension(that: AasTypes.Extension): number {
+    let result = 0x96c3723a | 0;
+    result = combine(result, this.hashOf(that.semanticId));
+    result = combine(result, this.hashOfArray(that.supplementalSemanticIds));
+    result = combine(result, hashString(that.name));
+    result = combine(result, hashLiteral(that.valueType));
+    result = combine(result, hashString(that.value));
+    result = combine(result, this.hashOf(that.refersTo));
+    return result;
+  }
+
+  transformAdministrativeInformation(that: AasTypes.AdministrativeInformation): number {
+    let result = 0x59cc0273 | 0;
+    result = combine(result, this.hashOfArray(that.embeddedDataSpecifications));
+    result = combine(result, hashString(that.version));
+    result = combine(result, hashString(that.revision));
+    return result;
+  }
+
+  transformQualifier(that: AasTypes.Qualifier): number {
+    let result = 0xbf645adf | 0;
+    result = combine(result, this.hashOf(that.semanticId));
+    result = combine(result, this.hashOfArray(that.supplementalSemanticIds));
+    result = combine(result, hashLiteral(that.kind));
+    result = combine(result, hashString(that.type));
+    result = combine(result, hashLiteral(that.valueType));
+    result = combine(result, hashString(that.value));
+    result = combine(result, this.hashOf(that.valueId));
+    return result;
+  }
+
+  transformAssetAdministrationShell(that: AasTypes.AssetAdministrationShell): number {
+    let result = 0x0d69d2dd | 0;
+    result = combine(result, this.hashOfArray(that.extensions));
+    result = combine(result, hashString(that.category));
+    result = combine(result, hashString(that.idShort));
+    result = combine(result, this.hashOfArray(that.displayName));
+    result = combine(result, this.hashOfArray(that.description));
+    result = combine(result, hashString(that.checksum));
+    result = combine(result, this.hashOf(that.administration));
+    result = combine(result, hashString(that.id));
+    result = combine(result, this.hashOfArray(that.embeddedDataSpecifications));
+    result = combine(result, this.hashOf(that.derivedFrom));
+    result = combine(result, this.hashOf(that.assetInformation));
+    result = combine(result, this.hashOfArray(that.submodels));
+    return result;
+  }
+
+  transformAssetInformation(that: AasTypes.AssetInformation): number {
+    let result = 0xa174d51f | 0;
+    result = combine(result, hashLiteral(that.assetKind));
+    result = combine(result, this.hashOf(that.globalAssetId));
+    result = combine(result, this.hashOfArray(that.specificAssetIds));
+    result = combine(result, this.hashOf(that.defaultThumbnail));
+    return result;
+  }
+
+  transformResource(that: AasTypes.Resource): number {
+    let result = 0x23b0d815 | 0;
+    result = combine(result, hashString(that.path));
+    result = combine(result, hashString(that.contentType));
+    return result;
+  }
+
+  transformSpecificAssetId(that: AasTypes.SpecificAssetId): number {
+    let result = 0xb0b4a50a | 0;
+    result = combine(result, this.hashOf(that.semanticId));
+    result = combine(result, this.hashOfArray(that.supplementalSemanticIds));
+    result = combine(result, hashString(that.name));
+    result = combine(result, hashString(that.value));
+    result = combine(result, this.hashOf(that.externalSubjectId));
+    return result;
+  }
+
+  transformSubmodel(that: AasTypes.Submodel): number {
+    let result = 0x0d5acc2a | 0;
+    result = combine(result, this.hashOfArray(that.extensions));
+    result = combine(result, hashString(that.category));
+    result = combine(result, hashString(that.idShort));
+    result = combine(result, this.hashOfArray(that.displayName));
+    result = combine(result, this.hashOfArray(that.description));
+    result = combine(result, hashString(that.checksum));
+    result = combine(result, this.hashOf(that.administration));
+    result = combine(result, hashString(that.id));
+    result = combine(result, hashLiteral(that.kind));
+    result = combine(result, this.hashOf(that.semanticId));
+    result = combine(result, this.hashOfArray(that.supplementalSemanticIds));
+    result = combine(result, this.hashOfArray(that.qualifiers));
+    result = combine(result, this.hashOfArray(that.embeddedDataSpecifications));
+    result = combine(result, this.hashOfArray(that.submodelElements));
+    return result;
+  }
+
+  transformRelationshipElement(that: AasTypes.RelationshipElement): number {
+    let result = 0x91f4f70d | 0;
+    result = combine(result, this.hashOfArray(that.extensions));
+    result = combine(result, hashString(that.category));
+    result = combine(result, hashString(that.idShort));
+    result = combine(result, this.hashOfArray(that.displayName));
+    result = combine(result, this.hashOfArray(that.description));
+    result = combine(result, hashString(that.checksum));
+    result = combine(result, hashLiteral(that.kind));
+    result = combine(result, this.hashOf(that.semanticId));
+    result = combine(result, this.hashOfArray(that.supplementalSemanticIds));
+    result = combine(result, this.hashOfArray(that.qualifiers));
+    result = combine(result, this.hashOfArray(that.embeddedDataSpecifications));
+    result = combine(result, this.hashOf(that.first));
+    result = combine(result, this.hashOf(that.second));
+    return result;
+  }
+
+  transformSubmodelElementList(that: AasTypes.SubmodelElementList): number {
+    let result = 0xf56fe21e | 0;
+    result = combine(result, this.hashOfArray(that.extensions));
+    result = combine(result, hashString(that.category));
+    result = combine(result, hashString(that.idShort));
+    result = combine(result, this.hashOfArray(that.displayName));
+    result = combine(result, this.hashOfArray(that.description));
+    result = combine(result, hashString(that.checksum));
+    result = combine(result, hashLiteral(that.kind));
+    result = combine(result, this.hashOf(that.semanticId));
+    result = combine(result, this.hashOfArray(that.supplementalSemanticIds));
+    result = combine(result, this.hashOfArray(that.qualifiers));
+    result = combine(result, this.hashOfArray(that.embeddedDataSpecifications));
+    result = combine(result, hashBoolean(that.orderRelevant));
+    result = combine(result, this.hashOfArray(that.value));
+    result = combine(result, this.hashOf(that.semanticIdListElement));
+    result = combine(result, hashLiteral(that.typeValueListElement));
+    result = combine(result, hashLiteral(that.valueTypeListElement));
+    return result;
+  }
+
+  transformSubmodelElementCollection(that: AasTypes.SubmodelElementCollection): number {
+    let result = 0x6c442372 | 0;
+    result = combine(result, this.hashOfArray(that.extensions));
+    result = combine(result, hashString(that.category));
+    result = combine(result, hashString(that.idShort));
+    result = combine(result, this.hashOfArray(that.displayName));
+    result = combine(result, this.hashOfArray(that.description));
+    result = combine(result, hashString(that.checksum));
+    result = combine(result, hashLiteral(that.kind));
+    result = combine(result, this.hashOf(that.semanticId));
+    result = combine(result, this.hashOfArray(that.supplementalSemanticIds));
+    result = combine(result, this.hashOfArray(that.qualifiers));
+    result = combine(result, this.hashOfArray(that.embeddedDataSpecifications));
+    result = combine(result, this.hashOfArray(that.value));
+    return result;
+  }
+
+  transformProperty(that: AasTypes.Property): number {
+    let result = 0x5221f9e8 | 0;
+    result = combine(result, this.hashOfArray(that.extensions));
+    result = combine(result, hashString(that.category));
+    result = combine(result, hashString(that.idShort));
+    result = combine(result, this.hashOfArray(that.displayName));
+    result = combine(result, this.hashOfArray(that.description));
+    result = combine(result, hashString(that.checksum));
+    result = combine(result, hashLiteral(that.kind));
+    result = combine(result, this.hashOf(that.semanticId));
+    result = combine(result, this.hashOfArray(that.supplementalSemanticIds));
+    result = combine(result, this.hashOfArray(that.qualifiers));
+    result = combine(result, this.hashOfArray(that.embeddedDataSpecifications));
+    result = combine(result, hashLiteral(that.valueType));
+    result = combine(result, hashString(that.value));
+    result = combine(result, this.hashOf(that.valueId));
+    return result;
+  }
+
+  transformMultiLanguageProperty(that: AasTypes.MultiLanguageProperty): number {
+    let result = 0x53c55169 | 0;
+    result = combine(result, this.hashOfArray(that.extensions));
+    result = combine(result, hashString(that.category));
+    result = combine(result, hashString(that.idShort));
+    result = combine(result, this.hashOfArray(that.displayName));
+    result = combine(result, this.hashOfArray(that.description));
+    result = combine(result, hashString(that.checksum));
+    result = combine(result, hashLiteral(that.kind));
+    result = combine(result, this.hashOf(that.semanticId));
+    result = combine(result, this.hashOfArray(that.supplementalSemanticIds));
+    result = combine(result, this.hashOfArray(that.qualifiers));
+    result = combine(result, this.hashOfArray(that.embeddedDataSpecifications));
+    result = combine(result, this.hashOfArray(that.value));
+    result = combine(result, this.hashOf(that.valueId));
+    return result;
+  }
+
+  transformRange(that: AasTypes.Range): number {
+    let result = 0xa311e772 | 0;
+    result = combine(result, this.hashOfArray(that.extensions));
+    result = combine(result, hashString(that.category));
+    result = combine(result, hashString(that.idShort));
+    result = combine(result, this.hashOfArray(that.displayName));
+    result = combine(result, this.hashOfArray(that.description));
+    result = combine(result, hashString(that.checksum));
+    result = combine(result, hashLiteral(that.kind));
+    result = combine(result, this.hashOf(that.semanticId));
+    result = combine(result, this.hashOfArray(that.supplementalSemanticIds));
+    result = combine(result, this.hashOfArray(that.qualifiers));
+    result = combine(result, this.hashOfArray(that.embeddedDataSpecifications));
+    result = combine(result, hashLiteral(that.valueType));
+    result = combine(result, hashString(that.min));
+    result = combine(result, hashString(that.max));
+    return result;
+  }
+
+  transformReferenceElement(that: AasTypes.ReferenceElement): number {
+    let result = 0x210e82d2 | 0;
+    result = combine(result, this.hashOfArray(that.extensions));
+    result = combine(result, hashString(that.category));
+    result = combine(result, hashString(that.idShort));
+    result = combine(result, this.hashOfArray(that.displayName));
+    result = combine(result, this.hashOfArray(that.description));
+    result = combine(result, hashString(that.checksum));
+    result = combine(result, hashLiteral(that.kind));
+    result = combine(result, this.hashOf(that.semanticId));
+    result = combine(result, this.hashOfArray(that.supplementalSemanticIds));
+    result = combine(result, this.hashOfArray(that.qualifiers));
+    result = combine(result, this.hashOfArray(that.embeddedDataSpecifications));
+    result = combine(result, this.hashOf(that.value));
+    return result;
+  }
+
+  transformBlob(that: AasTypes.Blob): number {
+    let result = 0xca9c47ca | 0;
+    result = combine(result, this.hashOfArray(that.extensions));
+    result = combine(result, hashString(that.category));
+    result = combine(result, hashString(that.idShort));
+    result = combine(result, this.hashOfArray(that.displayName));
+    result = combine(result, this.hashOfArray(that.description));
+    result = combine(result, hashString(that.checksum));
+    result = combine(result, hashLiteral(that.kind));
+    result = combine(result, this.hashOf(that.semanticId));
+    result = combine(result, this.hashOfArray(that.supplementalSemanticIds));
+    result = combine(result, this.hashOfArray(that.qualifiers));
+    result = combine(result, this.hashOfArray(that.embeddedDataSpecifications));
+    result = combine(result, hashBytes(that.value));
+    result = combine(result, hashString(that.contentType));
+    return result;
+  }
+
+  transformFile(that: AasTypes.File): number {
+    let result = 0x2b183663 | 0;
+    result = combine(result, this.hashOfArray(that.extensions));
+    result = combine(result, hashString(that.category));
+    result = combine(result, hashString(that.idShort));
+    result = combine(result, this.hashOfArray(that.displayName));
+    result = combine(result, this.hashOfArray(that.description));
+    result = combine(result, hashString(that.checksum));
+    result = combine(result, hashLiteral(that.kind));
+    result = combine(result, this.hashOf(that.semanticId));
+    result = combine(result, this.hashOfArray(that.supplementalSemanticIds));
+    result = combine(result, this.hashOfArray(that.qualifiers));
+    result = combine(result, this.hashOfArray(that.embeddedDataSpecifications));
+    result = combine(result, hashString(that.value));
+    result = combine(result, hashString(that.contentType));
+    return result;
+  }
+
+  transformAnnotatedRelationshipElement(
+    that: AasTypes.AnnotatedRelationshipElement
+  ): number {
+    let result = 0x041ec1df | 0;
+    result = combine(result, this.hashOfArray(that.extensions));
+    result = combine(result, hashString(that.category));
+    result = combine(result, hashString(that.idShort));
+    result = combine(result, this.hashOfArray(that.displayName));
+    result = combine(result, this.hashOfArray(that.description));
+    result = combine(result, hashString(that.checksum));
+    result = combine(result, hashLiteral(that.kind));
+    result = combine(result, this.hashOf(that.semanticId));
+    result = combine(result, this.hashOfArray(that.supplementalSemanticIds));
+    result = combine(result, this.hashOfArray(that.qualifiers));
+    result = combine(result, this.hashOfArray(that.embeddedDataSpecifications));
+    result = combine(result, this.hashOf(that.first));
+    result = combine(result, this.hashOf(that.second));
+    result = combine(result, this.hashOfArray(that.annotations));
+    return result;
+  }
+
+  transformEntity(that: AasTypes.Entity): number {
+    let result = 0xc09b32fa | 0;
+    result = combine(result, this.hashOfArray(that.extensions));
+    result = combine(result, hashString(that.category));
+    result = combine(result, hashString(that.idShort));
+    result = combine(result, this.hashOfArray(that.displayName));
+    result = combine(result, this.hashOfArray(that.description));
+    result = combine(result, hashString(that.checksum));
+    result = combine(result, hashLiteral(that.kind));
+    result = combine(result, this.hashOf(that.semanticId));
+    result = combine(result, this.hashOfArray(that.supplementalSemanticIds));
+    result = combine(result, this.hashOfArray(that.qualifiers));
+    result = combine(result, this.hashOfArray(that.embeddedDataSpecifications));
+    result = combine(result, this.hashOfArray(that.statements));
+    result = combine(result, hashLiteral(that.entityType));
+    result = combine(result, this.hashOf(that.globalAssetId));
+    result = combine(result, this.hashOf(that.specificAssetId));
+    return result;
+  }
+
+  transformEventPayload(that: AasTypes.EventPayload): number {
+    let result = 0x988b940f | 0;
+    result = combine(result, this.hashOf(that.source));
+    result = combine(result, this.hashOf(that.sourceSemanticId));
+    result = combine(result, this.hashOf(that.observableReference));
+    result = combine(result, this.hashOf(that.observableSemanticId));
+    result = combine(result, hashString(that.topic));
+    result = combine(result, this.hashOf(that.subjectId));
+    result = combine(result, hashString(that.timeStamp));
+    result = combine(result, hashString(that.payload));
+    return result;
+  }
+
+  transformBasicEventElement(that: AasTypes.BasicEventElement): number {
+    let result = 0xe2625d19 | 0;
+    result = combine(result, this.hashOfArray(that.extensions));
+    result = combine(result, hashString(that.category));
+    result = combine(result, hashString(that.idShort));
+    result = combine(result, this.hashOfArray(that.displayName));
+    result = combine(result, this.hashOfArray(that.description));
+    result = combine(result, hashString(that.checksum));
+    result = combine(result, hashLiteral(that.kind));
+    result = combine(result, this.hashOf(that.semanticId));
+    result = combine(result, this.hashOfArray(that.supplementalSemanticIds));
+    result = combine(result, this.hashOfArray(that.qualifiers));
+    result = combine(result, this.hashOfArray(that.embeddedDataSpecifications));
+    result = combine(result, this.hashOf(that.observed));
+    result = combine(result, hashLiteral(that.direction));
+    result = combine(result, hashLiteral(that.state));
+    result = combine(result, hashString(that.messageTopic));
+    result = combine(result, this.hashOf(that.messageBroker));
+    result = combine(result, hashString(that.lastUpdate));
+    result = combine(result, hashString(that.minInterval));
+    result = combine(result, hashString(that.maxInterval));
+    return result;
+  }
+
+  transformOperation(that: AasTypes.Operation): number {
+    let result = 0x218e02a6 | 0;
+    result = combine(result, this.hashOfArray(that.extensions));
+    result = combine(result, hashString(that.category));
+    result = combine(result, hashString(that.idShort));
+    result = combine(result, this.hashOfArray(that.displayName));
+    result = combine(result, this.hashOfArray(that.description));
+    result = combine(result, hashString(that.checksum));
+    result = combine(result, hashLiteral(that.kind));
+    result = combine(result, this.hashOf(that.semanticId));
+    result = combine(result, this.hashOfArray(that.supplementalSemanticIds));
+    result = combine(result, this.hashOfArray(that.qualifiers));
+    result = combine(result, this.hashOfArray(that.embeddedDataSpecifications));
+    result = combine(result, this.hashOfArray(that.inputVariables));
+    result = combine(result, this.hashOfArray(that.outputVariables));
+    result = combine(result, this.hashOfArray(that.inoutputVariables));
+    return result;
+  }
+
+  transformOperationVariable(that: AasTypes.OperationVariable): number {
+    let result = 0x019af6b2 | 0;
+    result = combine(result, this.hashOf(that.value));
+    return result;
+  }
+
+  transformCapability(that: AasTypes.Capability): number {
+    let result = 0xa1c8bc47 | 0;
+    result = combine(result, this.hashOfArray(that.extensions));
+    result = combine(result, hashString(that.category));
+    result = combine(result, hashString(that.idShort));
+    result = combine(result, this.hashOfArray(that.displayName));
+    result = combine(result, this.hashOfArray(that.description));
+    result = combine(result, hashString(that.checksum));
+    result = combine(result, hashLiteral(that.kind));
+    result = combine(result, this.hashOf(that.semanticId));
+    result = combine(result, this.hashOfArray(that.supplementalSemanticIds));
+    result = combine(result, this.hashOfArray(that.qualifiers));
+    result = combine(result, this.hashOfArray(that.embeddedDataSpecifications));
+    return result;
+  }
+
+  transformConceptDescription(that: AasTypes.ConceptDescription): number {
+    let result = 0x7b6124e7 | 0;
+    result = combine(result, this.hashOfArray(that.extensions));
+    result = combine(result, hashString(that.category));
+    result = combine(result, hashString(that.idShort));
+    result = combine(result, this.hashOfArray(that.displayName));
+    result = combine(result, this.hashOfArray(that.description));
+    result = combine(result, hashString(that.checksum));
+    result = combine(result, this.hashOf(that.administration));
+    result = combine(result, hashString(that.id));
+    result = combine(result, this.hashOfArray(that.embeddedDataSpecifications));
+    result = combine(result, this.hashOfArray(that.isCaseOf));
+    return result;
+  }
+
+  transformReference(that: AasTypes.Reference): number {
+    let result = 0xadc8c33a | 0;
+    result = combine(result, hashLiteral(that.type));
+    result = combine(result, this.hashOf(that.referredSemanticId));
+    result = combine(result, this.hashOfArray(that.keys));
+    return result;
+  }
+
+  transformKey(that: AasTypes.Key): number {
+    let result = 0xcd1ac90c | 0;
+    result = combine(result, hashLiteral(that.type));
+    result = combine(result, hashString(that.value));
+    return result;
+  }
+
+  transformLangString(that: AasTypes.LangString): number {
+    let result = 0x8a628368 | 0;
+    result = combine(result, hashString(that.language));
+    result = combine(result, hashString(that.text));
+    return result;
+  }
+
+  transformEnvironment(that: AasTypes.Environment): number {
+    let result = 0x07245a9a | 0;
+    result = combine(result, this.hashOfArray(that.assetAdministrationShells));
+    result = combine(result, this.hashOfArray(that.submodels));
+    result = combine(result, this.hashOfArray(that.conceptDescriptions));
+    return result;
+  }
+
+  transformEmbeddedDataSpecification(that: AasTypes.EmbeddedDataSpecification): number {
+    let result = 0x2a449fe0 | 0;
+    result = combine(result, this.hashOf(that.dataSpecification));
+    result = combine(result, this.hashOf(that.dataSpecificationContent));
+    return result;
+  }
+
+  transformValueReferencePair(that: AasTypes.ValueReferencePair): number {
+    let result = 0xd1ee0cef | 0;
+    result = combine(result, hashString(that.value));
+    result = combine(result, this.hashOf(that.valueId));
+    return result;
+  }
+
+  transformValueList(that: AasTypes.ValueList): number {
+    let result = 0xb921b186 | 0;
+    result = combine(result, this.hashOfArray(that.valueReferencePairs));
+    return result;
+  }
+
+  transformDataSpecificationIec61360(that: AasTypes.DataSpecificationIec61360): number {
+    let result = 0xcff55477 | 0;
+    result = combine(result, this.hashOfArray(that.preferredName));
+    result = combine(result, this.hashOfArray(that.shortName));
+    result = combine(result, hashString(that.unit));
+    result = combine(result, this.hashOf(that.unitId));
+    result = combine(result, hashString(that.sourceOfDefinition));
+    result = combine(result, hashString(that.symbol));
+    result = combine(result, hashLiteral(that.dataType));
+    result = combine(result, this.hashOfArray(that.definition));
+    result = combine(result, hashString(that.valueFormat));
+    result = combine(result, this.hashOf(that.valueList));
+    result = combine(result, hashString(that.value));
+    result = combine(result, hashLiteral(that.levelType));
+    return result;
+  }
+
+  transformDataSpecificationPhysicalUnit(
+    that: AasTypes.DataSpecificationPhysicalUnit
+  ): number {
+    let result = 0x318a00cd | 0;
+    result = combine(result, hashString(that.unitName));
+    result = combine(result, hashString(that.unitSymbol));
+    result = combine(result, this.hashOfArray(that.definition));
+    result = combine(result, hashString(that.siNotation));
+    result = combine(result, hashString(that.siName));
+    result = combine(result, hashString(that.dinNotation));
+    result = combine(result, hashString(that.eceName));
+    result = combine(result, hashString(that.eceCode));
+    result = combine(result, hashString(that.nistName));
+    result = combine(result, hashString(that.sourceOfDefinition));
+    result = combine(result, hashString(that.conversionFactor));
+    result = combine(result, hashString(that.registrationAuthorityId));
+    result = combine(result, hashString(that.supplier));
+    return result;
+  }
+}
+
+const HASHER = /*@__PURE__*/ new Hasher();
+
+/**
+ * Compare the instances structurally.
+ *
+ * @remarks
+ * The context is the other instance to compare against.
+ */
+class Comparer extends AasTypes.AbstractTransformerWithContext<
+  AasTypes.Class,
+  boolean
+> {
+  /**
+   * Hasher with a memo to reject the unequal instances early, if memoized
+   */
+  private readonly hasher: Hasher | null;
+
+  constructor(memo: WeakMap<AasTypes.Class, number> | null = null) {
+    super();
+    this.hasher = memo !== null ? new Hasher(memo) : null;
+  }
+
+  /**
+   * Compare `that` instance against the `other` instance.
+   *
+   * @param that - instance to be compared, if any
+   * @param other - instance to compare against, if any
+   * @returns `true` if the two are deeply equal
+   */
+  equals(that: AasTypes.Class | null, other: AasTypes.Class | null): boolean {
+    if (that === other) {
+      return true;
+    }
+    if (that === null || other === null) {
+      return false;
+    }
+
+    if (
+      this.hasher !== null &&
+      this.hasher.hashOf(that) !== this.hasher.hashOf(other)
+    ) {
+      return false;
+    }
+
+    return this.transformWithContext(that, other);
+  }
+
+  /**
+   * Compare the `items` against the `other` items in order.
+   *
+   * @param items - instances to be compared, if any
+   * @param other - instances to compare against, if any
+   * @returns `true` if the two are deeply equal
+   */
+  arraysEqual(
+    items: Array<AasTypes.Class> | null,
+    other: Array<AasTypes.Class> | null
+  ): boolean {
+    if (items === other) {
+      return true;
+    }
+    if (items === null || other === null || items.length !== other.length) {
+      return false;
+    }
+
+    for (let i = 0; i < items.length; i++) {
+      if (!this.equals(items[i], other[i])) {
+        return false;
+      }
+    }
+    return true;
+  }
+
+  transformExtensionWithContext(
+    that: AasTypes.Extension,
+    other: AasTypes.Class
+  ): boolean {
+    if (!AasTypes.isExtension(other)) {
+      return false;
+    }
+
+    return (
+      that.name === other.name &&
+      that.valueType === other.valueType &&
+      that.value === other.value &&
+      this.equals(that.semanticId, other.semanticId) &&
+      this.arraysEqual(that.supplementalSemanticIds, other.supplementalSemanticIds) &&
+      this.equals(that.refersTo, other.refersTo)
+    );
+  }
+
+  transformAdministrativeInformationWithContext(
+    that: AasTypes.AdministrativeInformation,
+    other: AasTypes.Class
+  ): boolean {
+    if (!AasTypes.isAdministrativeInformation(other)) {
+      return false;
+    }
+
+    return (
+      that.version === other.version &&
+      that.revision === other.revision &&
+      this.arraysEqual(
+        that.embeddedDataSpecifications,
+        other.embeddedDataSpecifications
+      )
+    );
+  }
+
+  transformQualifierWithContext(
+    that: AasTypes.Qualifier,
+    other: AasTypes.Class
+  ): boolean {
+    if (!AasTypes.isQualifier(other)) {
+      return false;
+    }
+
+    return (
+      that.kind === other.kind &&
+      that.type === other.type &&
+      that.valueType === other.valueType &&
+      that.value === other.value &&
+      this.equals(that.semanticId, other.semanticId) &&
+      this.arraysEqual(that.supplementalSemanticIds, other.supplementalSemanticIds) &&
+      this.equals(that.valueId, other.valueId)
+    );
+  }
+
+  transformAssetAdministrationShellWithContext(
+    that: AasTypes.AssetAdministrationShell,
+    other: AasTypes.Class
+  ): boolean {
+    if (!AasTypes.isAssetAdministrationShell(other)) {
+      return false;
+    }
+
+    return (
+      that.category === other.category &&
+      that.idShort === other.idShort &&
+      that.checksum === other.checksum &&
+      that.id === other.id &&
+      this.arraysEqual(that.extensions, other.extensions) &&
+      this.arraysEqual(that.displayName, other.displayName) &&
+      this.arraysEqual(that.description, other.description) &&
+      this.equals(that.administration, other.administration) &&
+      this.arraysEqual(
+        that.embeddedDataSpecifications,
+        other.embeddedDataSpecifications
+      ) &&
+      this.equals(that.derivedFrom, other.derivedFrom) &&
+      this.equals(that.assetInformation, other.assetInformation) &&
+      this.arraysEqual(that.submodels, other.submodels)
+    );
+  }
+
+  transformAssetInformationWithContext(
+    that: AasTypes.AssetInformation,
+    other: AasTypes.Class
+  ): boolean {
+    if (!AasTypes.isAssetInformation(other)) {
+      return false;
+    }
+
+    return (
+      that.assetKind === other.assetKind &&
+      this.equals(that.globalAssetId, other.globalAssetId) &&
+      this.arraysEqual(that.specificAssetIds, other.specificAssetIds) &&
+      this.equals(that.defaultThumbnail, other.defaultThumbnail)
+    );
+  }
+
+  transformResourceWithContext(
+    that: AasTypes.Resource,
+    other: AasTypes.Class
+  ): boolean {
+    if (!AasTypes.isResource(other)) {
+      return false;
+    }
+
+    return that.path === other.path && that.contentType === other.contentType;
+  }
+
+  transformSpecificAssetIdWithContext(
+    that: AasTypes.SpecificAssetId,
+    other: AasTypes.Class
+  ): boolean {
+    if (!AasTypes.isSpecificAssetId(other)) {
+      return false;
+    }
+
+    return (
+      that.name === other.name &&
+      that.value === other.value &&
+      this.equals(that.semanticId, other.semanticId) &&
+      this.arraysEqual(that.supplementalSemanticIds, other.supplementalSemanticIds) &&
+      this.equals(that.externalSubjectId, other.externalSubjectId)
+    );
+  }
+
+  transformSubmodelWithContext(
+    that: AasTypes.Submodel,
+    other: AasTypes.Class
+  ): boolean {
+    if (!AasTypes.isSubmodel(other)) {
+      return false;
+    }
+
+    return (
+      that.category === other.category &&
+      that.idShort === other.idShort &&
+      that.checksum === other.checksum &&
+      that.id === other.id &&
+      that.kind === other.kind &&
+      this.arraysEqual(that.extensions, other.extensions) &&
+      this.arraysEqual(that.displayName, other.displayName) &&
+      this.arraysEqual(that.description, other.description) &&
+      this.equals(that.administration, other.administration) &&
+      this.equals(that.semanticId, other.semanticId) &&
+      this.arraysEqual(that.supplementalSemanticIds, other.supplementalSemanticIds) &&
+      this.arraysEqual(that.qualifiers, other.qualifiers) &&
+      this.arraysEqual(
+        that.embeddedDataSpecifications,
+        other.embeddedDataSpecifications
+      ) &&
+      this.arraysEqual(that.submodelElements, other.submodelElements)
+    );
+  }
+
+  transformRelationshipElementWithContext(
+    that: AasTypes.RelationshipElement,
+    other: AasTypes.Class
+  ): boolean {
+    // NOTE: AasTypes.isRelationshipElement also accepts the annotated relationship
+    // elements, so we check for the exact class.
+    if (!(other instanceof AasTypes.RelationshipElement)) {
+      return false;
+    }
+
+    return (
+      that.category === other.category &&
+      that.idShort === other.idShort &&
+      that.checksum === other.checksum &&
+      that.kind === other.kind &&
+      this.arraysEqual(that.extensions, other.extensions) &&
+      this.arraysEqual(that.displayName, other.displayName) &&
+      this.arraysEqual(that.description, other.description) &&
+      this.equals(that.semanticId, other.semanticId) &&
+      this.arraysEqual(that.supplementalSemanticIds, other.supplementalSemanticIds) &&
+      this.arraysEqual(that.qualifiers, other.qualifiers) &&
+      this.arraysEqual(
+        that.embeddedDataSpecifications,
+        other.embeddedDataSpecifications
+      ) &&
+      this.equals(that.first, other.first) &&
+      this.equals(that.second, other.second)
+    );
+  }
+
+  transformSubmodelElementListWithContext(
+    that: AasTypes.SubmodelElementList,
+    other: AasTypes.Class
+  ): boolean {
+    if (!AasTypes.isSubmodelElementList(other)) {
+      return false;
+    }
+
+    return (
+      that.category === other.category &&
+      that.idShort === other.idShort &&
+      that.checksum === other.checksum &&
+      that.kind === other.kind &&
+      that.orderRelevant === other.orderRelevant &&
+      that.typeValueListElement === other.typeValueListElement &&
+      that.valueTypeListElement === other.valueTypeListElement &&
+      this.arraysEqual(that.extensions, other.extensions) &&
+      this.arraysEqual(that.displayName, other.displayName) &&
+      this.arraysEqual(that.description, other.description) &&
+      this.equals(that.semanticId, other.semanticId) &&
+      this.arraysEqual(that.supplementalSemanticIds, other.supplementalSemanticIds) &&
+      this.arraysEqual(that.qualifiers, other.qualifiers) &&
+      this.arraysEqual(
+        that.embeddedDataSpecifications,
+        other.embeddedDataSpecifications
+      ) &&
+      this.arraysEqual(that.value, other.value) &&
+      this.equals(that.semanticIdListElement, other.semanticIdListElement)
+    );
+  }
+
+  transformSubmodelElementCollectionWithContext(
+    that: AasTypes.SubmodelElementCollection,
+    other: AasTypes.Class
+  ): boolean {
+    if (!AasTypes.isSubmodelElementCollection(other)) {
+      return false;
+    }
+
+    return (
+      that.category === other.category &&
+      that.idShort === other.idShort &&
+      that.checksum === other.checksum &&
+      that.kind === other.kind &&
+      this.arraysEqual(that.extensions, other.extensions) &&
+      this.arraysEqual(that.displayName, other.displayName) &&
+      this.arraysEqual(that.description, other.description) &&
+      this.equals(that.semanticId, other.semanticId) &&
+      this.arraysEqual(that.supplementalSemanticIds, other.supplementalSemanticIds) &&
+      this.arraysEqual(that.qualifiers, other.qualifiers) &&
+      this.arraysEqual(
+        that.embeddedDataSpecifications,
+        other.embeddedDataSpecifications
+      ) &&
+      this.arraysEqual(that.value, other.value)
+    );
+  }
+
+  transformPropertyWithContext(
+    that: AasTypes.Property,
+    other: AasTypes.Class
+  ): boolean {
+    if (!AasTypes.isProperty(other)) {
+      return false;
+    }
+
+    return (
+      that.category === other.category &&
+      that.idShort === other.idShort &&
+      that.checksum === other.checksum &&
+      that.kind === other.kind &&
+      that.valueType === other.valueType &&
+      that.value === other.value &&
+      this.arraysEqual(that.extensions, other.extensions) &&
+      this.arraysEqual(that.displayName, other.displayName) &&
+      this.arraysEqual(that.description, other.description) &&
+      this.equals(that.semanticId, other.semanticId) &&
+      this.arraysEqual(that.supplementalSemanticIds, other.supplementalSemanticIds) &&
+      this.arraysEqual(that.qualifiers, other.qualifiers) &&
+      this.arraysEqual(
+        that.embeddedDataSpecifications,
+        other.embeddedDataSpecifications
+      ) &&
+      this.equals(that.valueId, other.valueId)
+    );
+  }
+
+  transformMultiLanguagePropertyWithContext(
+    that: AasTypes.MultiLanguageProperty,
+    other: AasTypes.Class
+  ): boolean {
+    if (!AasTypes.isMultiLanguageProperty(other)) {
+      return false;
+    }
+
+    return (
+      that.category === other.category &&
+      that.idShort === other.idShort &&
+      that.checksum === other.checksum &&
+      that.kind === other.kind &&
+      this.arraysEqual(that.extensions, other.extensions) &&
+      this.arraysEqual(that.displayName, other.displayName) &&
+      this.arraysEqual(that.description, other.description) &&
+      this.equals(that.semanticId, other.semanticId) &&
+      this.arraysEqual(that.supplementalSemanticIds, other.supplementalSemanticIds) &&
+      this.arraysEqual(that.qualifiers, other.qualifiers) &&
+      this.arraysEqual(
+        that.embeddedDataSpecifications,
+        other.embeddedDataSpecifications
+      ) &&
+      this.arraysEqual(that.value, other.value) &&
+      this.equals(that.valueId, other.valueId)
+    );
+  }
+
+  transformRangeWithContext(that: AasTypes.Range, other: AasTypes.Class): boolean {
+    if (!AasTypes.isRange(other)) {
+      return false;
+    }
+
+    return (
+      that.category === other.category &&
+      that.idShort === other.idShort &&
+      that.checksum === other.checksum &&
+      that.kind === other.kind &&
+      that.valueType === other.valueType &&
+      that.min === other.min &&
+      that.max === other.max &&
+      this.arraysEqual(that.extensions, other.extensions) &&
+      this.arraysEqual(that.displayName, other.displayName) &&
+      this.arraysEqual(that.description, other.description) &&
+      this.equals(that.semanticId, other.semanticId) &&
+      this.arraysEqual(that.supplementalSemanticIds, other.supplementalSemanticIds) &&
+      this.arraysEqual(that.qualifiers, other.qualifiers) &&
+      this.arraysEqual(
+        that.embeddedDataSpecifications,
+        other.embeddedDataSpecifications
+      )
+    );
+  }
+
+  transformReferenceElementWithContext(
+    that: AasTypes.ReferenceElement,
+    other: AasTypes.Class
+  ): boolean {
+    if (!AasTypes.isReferenceElement(other)) {
+      return false;
+    }
+
+    return (
+      that.category === other.category &&
+      that.idShort === other.idShort &&
+      that.checksum === other.checksum &&
+      that.kind === other.kind &&
+      this.arraysEqual(that.extensions, other.extensions) &&
+      this.arraysEqual(that.displayName, other.displayName) &&
+      this.arraysEqual(that.description, other.description) &&
+      this.equals(that.semanticId, other.semanticId) &&
+      this.arraysEqual(that.supplementalSemanticIds, other.supplementalSemanticIds) &&
+      this.arraysEqual(that.qualifiers, other.qualifiers) &&
+      this.arraysEqual(
+        that.embeddedDataSpecifications,
+        other.embeddedDataSpecifications
+      ) &&
+      this.equals(that.value, other.value)
+    );
+  }
+
+  transformBlobWithContext(that: AasTypes.Blob, other: AasTypes.Class): boolean {
+    if (!AasTypes.isBlob(other)) {
+      return false;
+    }
+
+    return (
+      that.category === other.category &&
+      that.idShort === other.idShort &&
+      that.checksum === other.checksum &&
+      that.kind === other.kind &&
+      that.contentType === other.contentType &&
+      this.arraysEqual(that.extensions, other.extensions) &&
+      this.arraysEqual(that.displayName, other.displayName) &&
+      this.arraysEqual(that.description, other.description) &&
+      this.equals(that.semanticId, other.semanticId) &&
+      this.arraysEqual(that.supplementalSemanticIds, other.supplementalSemanticIds) &&
+      this.arraysEqual(that.qualifiers, other.qualifiers) &&
+      this.arraysEqual(
+        that.embeddedDataSpecifications,
+        other.embeddedDataSpecifications
+      ) &&
+      bytesEqual(that.value, other.value)
+    );
+  }
+
+  transformFileWithContext(that: AasTypes.File, other: AasTypes.Class): boolean {
+    if (!AasTypes.isFile(other)) {
+      return false;
+    }
+
+    return (
+      that.category === other.category &&
+      that.idShort === other.idShort &&
+      that.checksum === other.checksum &&
+      that.kind === other.kind &&
+      that.value === other.value &&
+      that.contentType === other.contentType &&
+      this.arraysEqual(that.extensions, other.extensions) &&
+      this.arraysEqual(that.displayName, other.displayName) &&
+      this.arraysEqual(that.description, other.description) &&
+      this.equals(that.semanticId, other.semanticId) &&
+      this.arraysEqual(that.supplementalSemanticIds, other.supplementalSemanticIds) &&
+      this.arraysEqual(that.qualifiers, other.qualifiers) &&
+      this.arraysEqual(
+        that.embeddedDataSpecifications,
+        other.embeddedDataSpecifications
+      )
+    );
+  }
+
+  transformAnnotatedRelationshipElementWithContext(
+    that: AasTypes.AnnotatedRelationshipElement,
+    other: AasTypes.Class
+  ): boolean {
+    if (!AasTypes.isAnnotatedRelationshipElement(other)) {
+      return false;
+    }
+
+    return (
+      that.category === other.category &&
+      that.idShort === other.idShort &&
+      that.checksum === other.checksum &&
+      that.kind === other.kind &&
+      this.arraysEqual(that.extensions, other.extensions) &&
+      this.arraysEqual(that.displayName, other.displayName) &&
+      this.arraysEqual(that.description, other.description) &&
+      this.equals(that.semanticId, other.semanticId) &&
+      this.arraysEqual(that.supplementalSemanticIds, other.supplementalSemanticIds) &&
+      this.arraysEqual(that.qualifiers, other.qualifiers) &&
+      this.arraysEqual(
+        that.embeddedDataSpecifications,
+        other.embeddedDataSpecifications
+      ) &&
+      this.equals(that.first, other.first) &&
+      this.equals(that.second, other.second) &&
+      this.arraysEqual(that.annotations, other.annotations)
+    );
+  }
+
+  transformEntityWithContext(that: AasTypes.Entity, other: AasTypes.Class): boolean {
+    if (!AasTypes.isEntity(other)) {
+      return false;
+    }
+
+    return (
+      that.category === other.category &&
+      that.idShort === other.idShort &&
+      that.checksum === other.checksum &&
+      that.kind === other.kind &&
+      that.entityType === other.entityType &&
+      this.arraysEqual(that.extensions, other.extensions) &&
+      this.arraysEqual(that.displayName, other.displayName) &&
+      this.arraysEqual(that.description, other.description) &&
+      this.equals(that.semanticId, other.semanticId) &&
+      this.arraysEqual(that.supplementalSemanticIds, other.supplementalSemanticIds) &&
+      this.arraysEqual(that.qualifiers, other.qualifiers) &&
+      this.arraysEqual(
+        that.embeddedDataSpecifications,
+        other.embeddedDataSpecifications
+      ) &&
+      this.arraysEqual(that.statements, other.statements) &&
+      this.equals(that.globalAssetId, other.globalAssetId) &&
+      this.equals(that.specificAssetId, other.specificAssetId)
+    );
+  }
+
+  transformEventPayloadWithContext(
+    that: AasTypes.EventPayload,
+    other: AasTypes.Class
+  ): boolean {
+    if (!AasTypes.isEventPayload(other)) {
+      return false;
+    }
+
+    return (
+      that.topic === other.topic &&
+      that.timeStamp === other.timeStamp &&
+      that.payload === other.payload &&
+      this.equals(that.source, other.source) &&
+      this.equals(that.sourceSemanticId, other.sourceSemanticId) &&
+      this.equals(that.observableReference, other.observableReference) &&
+      this.equals(that.observableSemanticId, other.observableSemanticId) &&
+      this.equals(that.subjectId, other.subjectId)
+    );
+  }
+
+  transformBasicEventElementWithContext(
+    that: AasTypes.BasicEventElement,
+    other: AasTypes.Class
+  ): boolean {
+    if (!AasTypes.isBasicEventElement(other)) {
+      return false;
+    }
+
+    return (
+      that.category === other.category &&
+      that.idShort === other.idShort &&
+      that.checksum === other.checksum &&
+      that.kind === other.kind &&
+      that.direction === other.direction &&
+      that.state === other.state &&
+      that.messageTopic === other.messageTopic &&
+      that.lastUpdate === other.lastUpdate &&
+      that.minInterval === other.minInterval &&
+      that.maxInterval === other.maxInterval &&
+      this.arraysEqual(that.extensions, other.extensions) &&
+      this.arraysEqual(that.displayName, other.displayName) &&
+      this.arraysEqual(that.description, other.description) &&
+      this.equals(that.semanticId, other.semanticId) &&
+      this.arraysEqual(that.supplementalSemanticIds, other.supplementalSemanticIds) &&
+      this.arraysEqual(that.qualifiers, other.qualifiers) &&
+      this.arraysEqual(
+        that.embeddedDataSpecifications,
+        other.embeddedDataSpecifications
+      ) &&
+      this.equals(that.observed, other.observed) &&
+      this.equals(that.messageBroker, other.messageBroker)
+    );
+  }
+
+  transformOperationWithContext(
+    that: AasTypes.Operation,
+    other: AasTypes.Class
+  ): boolean {
+    if (!AasTypes.isOperation(other)) {
+      return false;
+    }
+
+    return (
+      that.category === other.category &&
+      that.idShort === other.idShort &&
+      that.checksum === other.checksum &&
+      that.kind === other.kind &&
+      this.arraysEqual(that.extensions, other.extensions) &&
+      this.arraysEqual(that.displayName, other.displayName) &&
+      this.arraysEqual(that.description, other.description) &&
+      this.equals(that.semanticId, other.semanticId) &&
+      this.arraysEqual(that.supplementalSemanticIds, other.supplementalSemanticIds) &&
+      this.arraysEqual(that.qualifiers, other.qualifiers) &&
+      this.arraysEqual(
+        that.embeddedDataSpecifications,
+        other.embeddedDataSpecifications
+      ) &&
+      this.arraysEqual(that.inputVariables, other.inputVariables) &&
+      this.arraysEqual(that.outputVariables, other.outputVariables) &&
+      this.arraysEqual(that.inoutputVariables, other.inoutputVariables)
+    );
+  }
+
+  transformOperationVariableWithContext(
+    that: AasTypes.OperationVariable,
+    other: AasTypes.Class
+  ): boolean {
+    if (!AasTypes.isOperationVariable(other)) {
+      return false;
+    }
+
+    return this.equals(that.value, other.value);
+  }
+
+  transformCapabilityWithContext(
+    that: AasTypes.Capability,
+    other: AasTypes.Class
+  ): boolean {
+    if (!AasTypes.isCapability(other)) {
+      return false;
+    }
+
+    return (
+      that.category === other.category &&
+      that.idShort === other.idShort &&
+      that.checksum === other.checksum &&
+      that.kind === other.kind &&
+      this.arraysEqual(that.extensions, other.extensions) &&
+      this.arraysEqual(that.displayName, other.displayName) &&
+      this.arraysEqual(that.description, other.description) &&
+      this.equals(that.semanticId, other.semanticId) &&
+      this.arraysEqual(that.supplementalSemanticIds, other.supplementalSemanticIds) &&
+      this.arraysEqual(that.qualifiers, other.qualifiers) &&
+      this.arraysEqual(
+        that.embeddedDataSpecifications,
+        other.embeddedDataSpecifications
+      )
+    );
+  }
+
+  transformConceptDescriptionWithContext(
+    that: AasTypes.ConceptDescription,
+    other: AasTypes.Class
+  ): boolean {
+    if (!AasTypes.isConceptDescription(other)) {
+      return false;
+    }
+
+    return (
+      that.category === other.category &&
+      that.idShort === other.idShort &&
+      that.checksum === other.checksum &&
+      that.id === other.id &&
+      this.arraysEqual(that.extensions, other.extensions) &&
+      this.arraysEqual(that.displayName, other.displayName) &&
+      this.arraysEqual(that.description, other.description) &&
+      this.equals(that.administration, other.administration) &&
+      this.arraysEqual(
+        that.embeddedDataSpecifications,
+        other.embeddedDataSpecifications
+      ) &&
+      this.arraysEqual(that.isCaseOf, other.isCaseOf)
+    );
+  }
+
+  transformReferenceWithContext(
+    that: AasTypes.Reference,
+    other: AasTypes.Class
+  ): boolean {
+    if (!AasTypes.isReference(other)) {
+      return false;
+    }
+
+    return (
+      that.type === other.type &&
+      this.equals(that.referredSemanticId, other.referredSemanticId) &&
+      this.arraysEqual(that.keys, other.keys)
+    );
+  }
+
+  transformKeyWithContext(that: AasTypes.Key, other: AasTypes.Class): boolean {
+    if (!AasTypes.isKey(other)) {
+      return false;
+    }
+
+    return that.type === other.type && that.value === other.value;
+  }
+
+  transformLangStringWithContext(
+    that: AasTypes.LangString,
+    other: AasTypes.Class
+  ): boolean {
+    if (!AasTypes.isLangString(other)) {
+      return false;
+    }
+
+    return that.language === other.language && that.text === other.text;
+  }
+
+  transformEnvironmentWithContext(
+    that: AasTypes.Environment,
+    other: AasTypes.Class
+  ): boolean {
+    if (!AasTypes.isEnvironment(other)) {
+      return false;
+    }
+
+    return (
+      this.arraysEqual(
+        that.assetAdministrationShells,
+        other.assetAdministrationShells
+      ) &&
+      this.arraysEqual(that.submodels, other.submodels) &&
+      this.arraysEqual(that.conceptDescriptions, other.conceptDescriptions)
+    );
+  }
+
+  transformEmbeddedDataSpecificationWithContext(
+    that: AasTypes.EmbeddedDataSpecification,
+    other: AasTypes.Class
+  ): boolean {
+    if (!AasTypes.isEmbeddedDataSpecification(other)) {
+      return false;
+    }
+
+    return (
+      this.equals(that.dataSpecification, other.dataSpecification) &&
+      this.equals(that.dataSpecificationContent, other.dataSpecificationContent)
+    );
+  }
+
+  transformValueReferencePairWithContext(
+    that: AasTypes.ValueReferencePair,
+    other: AasTypes.Class
+  ): boolean {
+    if (!AasTypes.isValueReferencePair(other)) {
+      return false;
+    }
+
+    return that.value === other.value && this.equals(that.valueId, other.valueId);
+  }
+
+  transformValueListWithContext(
+    that: AasTypes.ValueList,
+    other: AasTypes.Class
+  ): boolean {
+    if (!AasTypes.isValueList(other)) {
+      return false;
+    }
+
+    return this.arraysEqual(that.valueReferencePairs, other.valueReferencePairs);
+  }
+
+  transformDataSpecificationIec61360WithContext(
+    that: AasTypes.DataSpecificationIec61360,
+    other: AasTypes.Class
+  ): boolean {
+    if (!AasTypes.isDataSpecificationIec61360(other)) {
+      return false;
+    }
+
+    return (
+      that.unit === other.unit &&
+      that.sourceOfDefinition === other.sourceOfDefinition &&
+      that.symbol === other.symbol &&
+      that.dataType === other.dataType &&
+      that.valueFormat === other.valueFormat &&
+      that.value === other.value &&
+      that.levelType === other.levelType &&
+      this.arraysEqual(that.preferredName, other.preferredName) &&
+      this.arraysEqual(that.shortName, other.shortName) &&
+      this.equals(that.unitId, other.unitId) &&
+      this.arraysEqual(that.definition, other.definition) &&
+      this.equals(that.valueList, other.valueList)
+    );
+  }
+
+  transformDataSpecificationPhysicalUnitWithContext(
+    that: AasTypes.DataSpecificationPhysicalUnit,
+    other: AasTypes.Class
+  ): boolean {
+    if (!AasTypes.isDataSpecificationPhysicalUnit(other)) {
+      return false;
+    }
+
+    return (
+      that.unitName === other.unitName &&
+      that.unitSymbol === other.unitSymbol &&
+      that.siNotation === other.siNotation &&
+      that.siName === other.siName &&
+      that.dinNotation === other.dinNotation &&
+      that.eceName === other.eceName &&
+      that.eceCode === other.eceCode &&
+      that.nistName === other.nistName &&
+      that.sourceOfDefinition === other.sourceOfDefinition &&
+      that.conversionFactor === other.conversionFactor &&
+      that.registrationAuthorityId === other.registrationAuthorityId &&
+      that.supplier === other.supplier &&
+      this.arraysEqual(that.definition, other.definition)
+    );
+  }
+}
+
+const COMPARER = /*@__PURE__*/ new Comparer();
+
+/**
+ * Hash `that` instance structurally.
+ *
+ * @remarks
+ * The hash is consistent with {@link deepEquals}, *i.e.*, deeply equal instances
+ * have the same hash.
+ *
+ * @param that - instance to be hashed
+ * @param memo - hashes of the instances computed so far, if any
+ * @returns 32-bit hash
+ */
+export function hash(
+  that: AasTypes.Class,
+  memo: WeakMap<AasTypes.Class, number> | null = null
+): number {
+  if (memo === null) {
+    return HASHER.transform(that);
+  }
+
+  return new Hasher(memo).hashOf(that);
+}
+
+/**
+ * Compare `that` instance against the `other` instance structurally.
+ *
+ * @param that - instance to be compared
+ * @param other - instance to compare against
+ * @param memo - hashes of the instances computed so far, if any
+ * @returns `true` if the two instances are deeply equal
+ */
+export function deepEquals(
+  that: AasTypes.Class,
+  other: AasTypes.Class,
+  memo: WeakMap<AasTypes.Class, number> | null = null
+): boolean {
+  if (memo === null) {
+    return COMPARER.equals(that, other);
+  }
+
+  return new Comparer(memo).equals(that, other);
+}
@@ -4,9 +4,23 @@
  * @packageDocumentation
  */
 
+export * as asyncDeserialization from "./asyncDeserialization";
+export * as binarization from "./binarization";
+export * as canonicalization from "./canonicalization";
 export * as common from "./common";
 export * as constants from "./constants";
+export * as copying from "./copying";
+export * as deserialization from "./deserialization";
+export * as diffing from "./diffing";
+export * as equality from "./equality";
+export * as ingestion from "./ingestion";
 export * as jsonization from "./jsonization";
+export * as ndjson from "./ndjson";
+export * as parsing from "./parsing";
+export * as persistence from "./persistence";
+export * as serialization from "./serialization";
+export * as snapshots from "./snapshots";
 export * as stringification from "./stringification";
+export * as tracking from "./tracking";
 export * as types from "./types";
 export * as verification from "./verification";
@@ -0,0 +1,114 @@
+/**
+ * De-serialize and verify an inbound document in a single pass.
+ *
+ * @remarks
+ * Calling {@link jsonization!environmentFromJsonable} and then
+ * {@link verification!verify} walks the model twice. Here we check each instance
+ * right after it has been de-serialized instead, and walk the model again only
+ * down to the instances which violate any invariant, if there are any at all.
+ * See {@link verification!ConstructionVerifier} for the details.
+ *
+ * The verification errors are exactly the same, with the same paths and in
+ * the same order, as if you had verified the de-serialized instance separately.
+ */
+
+import * as AasCommon from "./common";
+import * as AasDeserialization from "./deserialization";
+import * as AasJsonization from "./jsonization";
+import * as AasTypes from "./types";
+import * as AasVerification from "./verification";
+
+/**
+ * Represent an instance which has been de-serialized and verified.
+ */
+export class Ingested<ClassT extends AasTypes.Class> {
+  /**
+   * De-serialized instance
+   */
+  readonly instance: ClassT;
+
+  /**
+   * Errors of the recursive verification of {@link instance}, empty if valid
+   */
+  readonly errors: Array<AasVerification.VerificationError>;
+
+  constructor(instance: ClassT, errors: Array<AasVerification.VerificationError>) {
+    this.instance = instance;
+    this.errors = errors;
+  }
+}
+
+/**
+ * Parse `jsonable` with `parse`, and verify the result on the fly.
+ *
+ * @remarks
+ * {@link deserialization!DeserializationOptions.lazySubmodelElements} is ignored,
+ * as the verification needs all the submodel elements anyway.
+ *
+ * @param jsonable - to be parsed
+ * @param parse - function parsing the expected class,
+ * *e.g.*, {@link deserialization!submodelFromJsonable}
+ * @param options - to control the de-serialization, if any
+ * @param cache - if set, memoize the expensive checks of values in it
+ * @returns the verified instance, or the de-serialization error
+ * @typeParam ClassT - expected class of the instance
+ */
+export function ingest<ClassT extends AasTypes.Class>(
+  jsonable: AasJsonization.JsonValue,
+  parse: (
+    jsonable: AasJsonization.JsonValue,
+    options: AasDeserialization.DeserializationOptions | null
+  ) => AasCommon.Either<ClassT, AasJsonization.DeserializationError>,
+  options: AasDeserialization.DeserializationOptions | null = null,
+  cache: AasVerification.VerificationCache | null = null
+): AasCommon.Either<Ingested<ClassT>, AasJsonization.DeserializationError> {
+  const verifier = new AasVerification.ConstructionVerifier(cache);
+
+  const onInstance = options !== null ? options.onInstance : undefined;
+
+  const instanceOrError = parse(jsonable, {
+    ...options,
+    lazySubmodelElements: false,
+    onInstance:
+      onInstance === undefined
+        ? (instance) => verifier.check(instance)
+        : (instance) => {
+            onInstance(instance);
+            verifier.check(instance);
+          }
+  });
+  if (instanceOrError.error !== null) {
+    return new AasCommon.Either<Ingested<ClassT>, AasJsonization.DeserializationError>(
+      null,
+      instanceOrError.error
+    );
+  }
+
+  const instance = instanceOrError.mustValue();
+  return new AasCommon.Either<Ingested<ClassT>, AasJsonization.DeserializationError>(
+    new Ingested<ClassT>(instance, Array.from(verifier.errors(instance))),
+    null
+  );
+}
+
+/**
+ * Parse `jsonable` as an environment, and verify it on the fly.
+ *
+ * @remarks
+ * See {@link ingest} for the details.
+ *
+ * @param jsonable - to be parsed
+ * @param options - to control the de-serialization, if any
+ * @param cache - if set, memoize the expensive checks of values in it
+ * @returns the verified environment, or the de-serialization error
+ */
+export function environmentFromJsonable(
+  jsonable: AasJsonization.JsonValue,
+  options: AasDeserialization.DeserializationOptions | null = null,
+  cache: AasVerification.VerificationCache | null = null
+): AasCommon.Either<
+  Ingested<AasTypes.Environment>,
+  AasJsonization.DeserializationError
+> {
+  return ingest(jsonable, AasDeserialization.environmentFromJsonable, options, cache);
+}
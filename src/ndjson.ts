@@ -0,0 +1,257 @@
+/**
+ * De/serialize streams of AAS instances as newline-delimited JSON (NDJSON).
+ *
+ * @remarks
+ * Each line of the stream holds the JSON serialization of a single instance.
+ * The instances are read and written one line at a time, so the memory stays
+ * bounded by the longest line regardless of the length of the stream.
+ *
+ * The readers accept any async iterable of text or byte chunks. For example, you
+ * can pass in a node.js `Readable` directly, or a web `ReadableStream` in the
+ * environments where these are async-iterable. The byte chunks are decoded as
+ * UTF-8 with `TextDecoder`.
+ *
+ * See: https://github.com/ndjson/ndjson-spec
+ */
+
+import * as AasCommon from "./common";
+import * as AasDeserialization from "./deserialization";
+import * as AasJsonization from "./jsonization";
+import * as AasTypes from "./types";
+
+/**
+ * Represent an error on a line of the stream.
+ */
+export class LineError {
+  /**
+   * Number of the erroneous line, starting at 1
+   */
+  readonly line: number;
+
+  /**
+   * Error which occurred during the parsing or de-serialization of the line
+   */
+  readonly error: AasJsonization.DeserializationError;
+
+  constructor(line: number, error: AasJsonization.DeserializationError) {
+    this.line = line;
+    this.error = error;
+  }
+}
+
+/**
+ * Decode UTF-8 bytes chunk by chunk.
+ *
+ * @remarks
+ * This is the part of the `TextDecoder` interface that we need.
+ */
+interface Utf8Decoder {
+  decode(bytes?: Uint8Array, options?: { stream: boolean }): string;
+}
+
+/**
+ * Expect `TextDecoder` in the global scope.
+ *
+ * @remarks
+ * `TextDecoder` is not part of the ES2015 library which we compile against, but
+ * is available in node.js and in the browsers.
+ */
+type GlobalWithTextDecoder = { TextDecoder?: new (label: string) => Utf8Decoder };
+
+/**
+ * Create a decoder of UTF-8 bytes.
+ *
+ * @throws an {@link Error} if `TextDecoder` is not available
+ */
+function newUtf8Decoder(): Utf8Decoder {
+  const scope = <GlobalWithTextDecoder>(<unknown>globalThis);
+  if (scope.TextDecoder === undefined) {
+    throw new Error(
+      "TextDecoder is not available to decode the bytes, please pass in " +
+        "the chunks as text instead"
+    );
+  }
+
+  return new scope.TextDecoder("utf-8");
+}
+
+/**
+ * Split the `chunks` into lines.
+ *
+ * @remarks
+ * The line breaks are not included in the lines. The carriage returns preceding
+ * the line breaks are kept and need to be dealt with by the caller.
+ *
+ * @param chunks - of text or UTF-8 bytes
+ * @returns lines of text
+ */
+async function* overLines(
+  chunks: AsyncIterable<string | Uint8Array>
+): AsyncIterableIterator<string> {
+  let decoder: Utf8Decoder | null = null;
+
+  // Start of the current line which spans over the previous chunks
+  let pending = "";
+
+  for await (const chunk of chunks) {
+    let text: string;
+    if (typeof chunk === "string") {
+      text = chunk;
+    } else {
+      if (decoder === null) {
+        decoder = newUtf8Decoder();
+      }
+      text = decoder.decode(chunk, { stream: true });
+    }
+
+    let end = text.indexOf("\n");
+    if (end === -1) {
+      pending += text;
+      continue;
+    }
+
+    yield pending + text.substring(0, end);
+    pending = "";
+
+    let start = end + 1;
+    end = text.indexOf("\n", start);
+    while (end !== -1) {
+      yield text.substring(start, end);
+      start = end + 1;
+      end = text.indexOf("\n", start);
+    }
+
+    pending = text.substring(start);
+  }
+
+  if (decoder !== null) {
+    pending += decoder.decode();
+  }
+
+  if (pending.length > 0) {
+    yield pending;
+  }
+}
+
+/**
+ * Check that the `line` contains only whitespace, if anything at all.
+ */
+function isBlank(line: string): boolean {
+  for (let i = 0; i < line.length; i++) {
+    const character = line[i];
+    if (
+      character !== " " &&
+      character !== "\t" &&
+      character !== "\r" &&
+      character !== "\n"
+    ) {
+      return false;
+    }
+  }
+  return true;
+}
+
+/**
+ * De-serialize the instances from a stream of NDJSON line by line.
+ *
+ * @remarks
+ * Blank lines are skipped, but still counted in the line numbers.
+ *
+ * An error on a line does not stop the de-serialization, so that you can decide
+ * yourself whether to skip the erroneous lines or to stop.
+ *
+ * @param chunks - of the stream as text or UTF-8 bytes
+ * @param deserialize - function to de-serialize a single instance from a line
+ * @returns for every non-blank line, either the instance or the error
+ */
+export async function* fromNdjson<T>(
+  chunks: AsyncIterable<string | Uint8Array>,
+  deserialize: (
+    jsonable: AasJsonization.JsonValue
+  ) => AasCommon.Either<T, AasJsonization.DeserializationError>
+): AsyncIterableIterator<AasCommon.Either<T, LineError>> {
+  let lineNumber = 0;
+  for await (const line of overLines(chunks)) {
+    lineNumber++;
+
+    if (isBlank(line)) {
+      continue;
+    }
+
+    let jsonable: AasJsonization.JsonValue;
+    try {
+      jsonable = JSON.parse(line);
+    } catch (error) {
+      yield new AasCommon.Either<T, LineError>(
+        null,
+        new LineError(
+          lineNumber,
+          new AasJsonization.DeserializationError(
+            `Expected a valid JSON, but got a syntax error: ${error.message}`
+          )
+        )
+      );
+      continue;
+    }
+
+    const instanceOrError = deserialize(jsonable);
+    if (instanceOrError.error !== null) {
+      yield new AasCommon.Either<T, LineError>(
+        null,
+        new LineError(lineNumber, instanceOrError.error)
+      );
+    } else {
+      yield new AasCommon.Either<T, LineError>(instanceOrError.value, null);
+    }
+  }
+}
+
+/**
+ * De-serialize instances of {@link types!Submodel} from a stream of NDJSON.
+ *
+ * @param chunks - of the stream as text or UTF-8 bytes
+ * @param options - to control the de-serialization, if any
+ * @returns for every non-blank line, either the submodel or the error
+ */
+export function submodelsFromNdjson(
+  chunks: AsyncIterable<string | Uint8Array>,
+  options: AasDeserialization.DeserializationOptions | null = null
+): AsyncIterableIterator<AasCommon.Either<AasTypes.Submodel, LineError>> {
+  return fromNdjson(chunks, (jsonable) =>
+    AasDeserialization.submodelFromJsonable(jsonable, options)
+  );
+}
+
+/**
+ * De-serialize instances of {@link types!ISubmodelElement} from a stream of NDJSON.
+ *
+ * @param chunks - of the stream as text or UTF-8 bytes
+ * @param options - to control the de-serialization, if any
+ * @returns for every non-blank line, either the submodel element or the error
+ */
+export function submodelElementsFromNdjson(
+  chunks: AsyncIterable<string | Uint8Array>,
+  options: AasDeserialization.DeserializationOptions | null = null
+): AsyncIterableIterator<AasCommon.Either<AasTypes.ISubmodelElement, LineError>> {
+  return fromNdjson(chunks, (jsonable) =>
+    AasDeserialization.submodelElementFromJsonable(jsonable, options)
+  );
+}
+
+/**
+ * Serialize the `instances` to NDJSON, one line at a time.
+ *
+ * @remarks
+ * In node.js, you can pipe the result to a file or a socket with
+ * `Readable.from(toNdjson(instances)).pipe(destination)`.
+ *
+ * @param instances - to be serialized
+ * @returns lines of NDJSON, each including the line break
+ */
+export async function* toNdjson(
+  instances: Iterable<AasTypes.Class> | AsyncIterable<AasTypes.Class>
+): AsyncIterableIterator<string> {
+  for await (const instance of instances) {
+    yield JSON.stringify(AasJsonization.toJsonable(instance)) + "\n";
+  }
+}
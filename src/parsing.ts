@@ -0,0 +1,2947 @@
+/**
+ * Parse JSON text directly into AAS instances.
+ *
+ * @remarks
+ * {@link jsonization} de-serializes the output of `JSON.parse`. The text is thus
+ * first parsed into generic JSON objects and arrays, which are then walked once
+ * more to construct the instances.
+ *
+ * The parser in this module skips the intermediate JSON objects. It reads the
+ * tokens of the text and constructs the instances on the go, since the class of
+ * each value is known from the meta-model. Only where an interface is expected,
+ * *e.g.*, for the submodel elements, the concrete class is looked up in
+ * the property `modelType` ahead of parsing the object. While looking ahead, we
+ * also remember the model types of all the nested objects so that the text is
+ * looked ahead at most once.
+ *
+ * The parser accepts exactly the texts which {@link jsonization} accepts after
+ * `JSON.parse`, and results in the same instances. The unknown properties are
+ * skipped. If the text is invalid, we fall back to `JSON.parse` and
+ * {@link jsonization} to report exactly the same error.
+ *
+ * The parser does not support {@link deserialization!DeserializationOptions}. Use
+ * {@link deserialization} if you need them.
+ */
+
+import * as AasCommon from "./common";
+import * as AasJsonization from "./jsonization";
+import * as AasStringification from "./stringification";
+import * as AasTypes from "./types";
+
+/**
+ * Signal that the text can not be parsed on the fast path.
+ *
+ * @remarks
+ * We never report this error. The text is de-serialized with
+ * {@link jsonization} instead to find out what the actual error is.
+ */
+class Mismatch extends Error {}
+
+/**
+ * Match a JSON number.
+ */
+const NUMBER_RE = /-?(?:0|[1-9][0-9]*)(?:\.[0-9]+)?(?:[eE][+-]?[0-9]+)?/y;
+
+/**
+ * Read the tokens of a JSON text.
+ *
+ * @remarks
+ * All the reads skip the whitespace in front of the token, and throw
+ * a {@link Mismatch} if the expected token is not there.
+ */
+class Scanner {
+  private readonly text: string;
+  private position = 0;
+
+  /**
+   * Map the start positions of the objects, which have been skipped over,
+   * to their `modelType`, or to an empty string if it is not a string
+   */
+  private readonly modelTypes = new Map<number, string>();
+
+  constructor(text: string) {
+    this.text = text;
+  }
+
+  private skipWhitespace(): void {
+    const text = this.text;
+    let position = this.position;
+    while (position < text.length) {
+      const code = text.charCodeAt(position);
+      if (code !== 0x20 && code !== 0x0a && code !== 0x0d && code !== 0x09) {
+        break;
+      }
+      position++;
+    }
+    this.position = position;
+  }
+
+  /**
+   * Consume the character `code`.
+   */
+  private expect(code: number): void {
+    this.skipWhitespace();
+    if (this.text.charCodeAt(this.position) !== code) {
+      throw new Mismatch();
+    }
+    this.position++;
+  }
+
+  /**
+   * Consume the character `code` if it comes next.
+   *
+   * @returns whether the character has been consumed
+   */
+  private consume(code: number): boolean {
+    this.skipWhitespace();
+    if (this.text.charCodeAt(this.position) !== code) {
+      return false;
+    }
+    this.position++;
+    return true;
+  }
+
+  /**
+   * Check that nothing but whitespace is left.
+   */
+  expectEnd(): void {
+    this.skipWhitespace();
+    if (this.position !== this.text.length) {
+      throw new Mismatch();
+    }
+  }
+
+  /**
+   * Start reading an object.
+   *
+   * @returns the first key, or null if the object is empty
+   */
+  firstKey(): string | null {
+    this.expect(0x7b);
+    if (this.consume(0x7d)) {
+      return null;
+    }
+    return this.readKey();
+  }
+
+  /**
+   * Continue reading an object after a value.
+   *
+   * @returns the next key, or null if the object ended
+   */
+  nextKey(): string | null {
+    if (this.consume(0x2c)) {
+      return this.readKey();
+    }
+    this.expect(0x7d);
+    return null;
+  }
+
+  private readKey(): string {
+    const key = this.readString();
+    this.expect(0x3a);
+    return key;
+  }
+
+  /**
+   * Start reading an array.
+   *
+   * @returns whether an item comes next
+   */
+  firstItem(): boolean {
+    this.expect(0x5b);
+    return !this.consume(0x5d);
+  }
+
+  /**
+   * Continue reading an array after an item.
+   *
+   * @returns whether another item comes next
+   */
+  nextItem(): boolean {
+    if (this.consume(0x2c)) {
+      return true;
+    }
+    this.expect(0x5d);
+    return false;
+  }
+
+  readString(): string {
+    this.skipWhitespace();
+
+    const text = this.text;
+    let position = this.position;
+    if (text.charCodeAt(position) !== 0x22) {
+      throw new Mismatch();
+    }
+    position++;
+
+    const start = position;
+    while (position < text.length) {
+      const code = text.charCodeAt(position);
+      if (code === 0x22) {
+        this.position = position + 1;
+        return text.slice(start, position);
+      }
+      if (code === 0x5c) {
+        return this.readEscapedString(start, position);
+      }
+      if (code < 0x20) {
+        throw new Mismatch();
+      }
+      position++;
+    }
+
+    throw new Mismatch();
+  }
+
+  /**
+   * Continue reading a string at its first escape.
+   *
+   * @param start - of the string content, right after the opening quote
+   * @param position - of the first backslash
+   */
+  private readEscapedString(start: number, position: number): string {
+    const text = this.text;
+    const parts = [text.slice(start, position)];
+
+    while (position < text.length) {
+      const code = text.charCodeAt(position);
+      if (code === 0x22) {
+        this.position = position + 1;
+        return parts.join("");
+      }
+      if (code < 0x20) {
+        throw new Mismatch();
+      }
+
+      if (code !== 0x5c) {
+        let end = position + 1;
+        while (end < text.length) {
+          const other = text.charCodeAt(end);
+          if (other === 0x22 || other === 0x5c || other < 0x20) {
+            break;
+          }
+          end++;
+        }
+        parts.push(text.slice(position, end));
+        position = end;
+        continue;
+      }
+
+      switch (text.charCodeAt(position + 1)) {
+        case 0x22:
+          parts.push('"');
+          break;
+        case 0x5c:
+          parts.push("\\");
+          break;
+        case 0x2f:
+          parts.push("/");
+          break;
+        case 0x62:
+          parts.push("\b");
+          break;
+        case 0x66:
+          parts.push("\f");
+          break;
+        case 0x6e:
+          parts.push("\n");
+          break;
+        case 0x72:
+          parts.push("\r");
+          break;
+        case 0x74:
+          parts.push("\t");
+          break;
+        case 0x75:
+          parts.push(String.fromCharCode(hexQuad(text, position + 2)));
+          position += 4;
+          break;
+        default:
+          throw new Mismatch();
+      }
+      position += 2;
+    }
+
+    throw new Mismatch();
+  }
+
+  readBoolean(): boolean {
+    this.skipWhitespace();
+    if (this.text.startsWith("true", this.position)) {
+      this.position += 4;
+      return true;
+    }
+    if (this.text.startsWith("false", this.position)) {
+      this.position += 5;
+      return false;
+    }
+    throw new Mismatch();
+  }
+
+  /**
+   * Read a base64-encoded string.
+   */
+  readBytes(): Uint8Array {
+    const bytesOrError = AasCommon.base64Decode(this.readString());
+    if (bytesOrError.error !== null) {
+      throw new Mismatch();
+    }
+    return bytesOrError.mustValue();
+  }
+
+  /**
+   * Look up the property `modelType` of the object which comes next, without
+   * consuming the object.
+   */
+  peekModelType(): string {
+    this.skipWhitespace();
+
+    const start = this.position;
+    let modelType = this.modelTypes.get(start);
+    if (modelType === undefined) {
+      this.skipValue();
+      this.position = start;
+      modelType = this.modelTypes.get(start);
+    }
+
+    if (modelType === undefined || modelType === "") {
+      throw new Mismatch();
+    }
+    return modelType;
+  }
+
+  /**
+   * Skip over the value which comes next, checking only its syntax.
+   */
+  skipValue(): void {
+    this.skipWhitespace();
+
+    const text = this.text;
+    switch (text.charCodeAt(this.position)) {
+      case 0x22:
+        this.skipString();
+        return;
+      case 0x7b:
+        this.skipObject();
+        return;
+      case 0x5b:
+        this.position++;
+        if (this.consume(0x5d)) {
+          return;
+        }
+        do {
+          this.skipValue();
+        } while (this.nextItem());
+        return;
+      case 0x74:
+        this.skipLiteral("true");
+        return;
+      case 0x66:
+        this.skipLiteral("false");
+        return;
+      case 0x6e:
+        this.skipLiteral("null");
+        return;
+      default:
+        NUMBER_RE.lastIndex = this.position;
+        if (!NUMBER_RE.test(text)) {
+          throw new Mismatch();
+        }
+        this.position = NUMBER_RE.lastIndex;
+    }
+  }
+
+  private skipLiteral(literal: string): void {
+    if (!this.text.startsWith(literal, this.position)) {
+      throw new Mismatch();
+    }
+    this.position += literal.length;
+  }
+
+  /**
+   * Skip over a string at the opening quote.
+   *
+   * @returns whether the string contains escapes
+   */
+  private skipString(): boolean {
+    const text = this.text;
+    let position = this.position + 1;
+    let escaped = false;
+
+    while (position < text.length) {
+      const code = text.charCodeAt(position);
+      if (code === 0x22) {
+        this.position = position + 1;
+        return escaped;
+      }
+      if (code < 0x20) {
+        throw new Mismatch();
+      }
+      if (code === 0x5c) {
+        escaped = true;
+        const escape = text.charCodeAt(position + 1);
+        if (escape === 0x75) {
+          hexQuad(text, position + 2);
+          position += 6;
+          continue;
+        }
+        if (
+          escape !== 0x22 &&
+          escape !== 0x5c &&
+          escape !== 0x2f &&
+          escape !== 0x62 &&
+          escape !== 0x66 &&
+          escape !== 0x6e &&
+          escape !== 0x72 &&
+          escape !== 0x74
+        ) {
+          throw new Mismatch();
+        }
+        position += 2;
+        continue;
+      }
+      position++;
+    }
+
+    throw new Mismatch();
+  }
+
+  /**
+   * Skip over an object at the opening brace, and remember its `modelType`.
+   */
+  private skipObject(): void {
+    const text = this.text;
+    const start = this.position;
+    this.position++;
+
+    if (this.consume(0x7d)) {
+      return;
+    }
+
+    for (;;) {
+      this.skipWhitespace();
+      if (text.charCodeAt(this.position) !== 0x22) {
+        throw new Mismatch();
+      }
+
+      const keyStart = this.position;
+      let isModelType: boolean;
+      if (this.skipString()) {
+        this.position = keyStart;
+        isModelType = this.readString() === "modelType";
+      } else {
+        isModelType =
+          this.position - keyStart === 11 && text.startsWith("modelType", keyStart + 1);
+      }
+
+      this.expect(0x3a);
+
+      if (isModelType) {
+        this.skipWhitespace();
+        if (text.charCodeAt(this.position) === 0x22) {
+          this.modelTypes.set(start, this.readString());
+        } else {
+          this.skipValue();
+          this.modelTypes.set(start, "");
+        }
+      } else {
+        this.skipValue();
+      }
+
+      if (!this.consume(0x2c)) {
+        this.expect(0x7d);
+        return;
+      }
+    }
+  }
+}
+
+/**
+ * Parse four hexadecimal digits of a `\u` escape.
+ *
+ * @param text - containing the digits
+ * @param position - of the first digit
+ * @returns the parsed code unit
+ */
+function hexQuad(text: string, position: number): number {
+  let result = 0;
+  for (let i = position; i < position + 4; i++) {
+    const code = text.charCodeAt(i);
+    let digit: number;
+    if (code >= 0x30 && code <= 0x39) {
+      digit = code - 0x30;
+    } else if (code >= 0x61 && code <= 0x66) {
+      digit = code - 0x57;
+    } else if (code >= 0x41 && code <= 0x46) {
+      digit = code - 0x37;
+    } else {
+      throw new Mismatch();
+    }
+    result = (result << 4) | digit;
+  }
+  return result;
+}
+
+/**
+ * Read a string as a literal of an enumeration.
+ *
+ * @param scanner - to read from
+ * @param fromString - to parse the literal
+ * @typeParam T - type of the enumeration
+ */
+function readLiteral<T>(scanner: Scanner, fromString: (text: string) => T | null): T {
+  const literal = fromString(scanner.readString());
+  if (literal === null) {
+    throw new Mismatch();
+  }
+  return literal;
+}
+
+/**
+ * Read an array of items.
+ *
+ * @param scanner - to read from
+ * @param parseItem - to parse a single item
+ * @typeParam T - type of the items
+ */
+function readList<T>(scanner: Scanner, parseItem: (scanner: Scanner) => T): Array<T> {
+  const items = new Array<T>();
+  if (scanner.firstItem()) {
+    do {
+      items.push(parseItem(scanner));
+    } while (scanner.nextItem());
+  }
+  return items;
+}
+
+/**
+ * Parse an instance of {@link types!ISubmodelElement} by its `modelType`.
+ */
+function parseSubmodelElement(scanner: Scanner): AasTypes.ISubmodelElement {
+  switch (scanner.peekModelType()) {
+    case "RelationshipElement":
+      return parseRelationshipElement(scanner);
+    case "AnnotatedRelationshipElement":
+      return parseAnnotatedRelationshipElement(scanner);
+    case "BasicEventElement":
+      return parseBasicEventElement(scanner);
+    case "Blob":
+      return parseBlob(scanner);
+    case "Capability":
+      return parseCapability(scanner);
+    case "Entity":
+      return parseEntity(scanner);
+    case "File":
+      return parseFile(scanner);
+    case "MultiLanguageProperty":
+      return parseMultiLanguageProperty(scanner);
+    case "Operation":
+      return parseOperation(scanner);
+    case "Property":
+      return parseProperty(scanner);
+    case "Range":
+      return parseRange(scanner);
+    case "ReferenceElement":
+      return parseReferenceElement(scanner);
+    case "SubmodelElementCollection":
+      return parseSubmodelElementCollection(scanner);
+    case "SubmodelElementList":
+      return parseSubmodelElementList(scanner);
+    default:
+      throw new Mismatch();
+  }
+}
+
+/**
+ * Parse an instance of {@link types!IDataElement} by its `modelType`.
+ */
+function parseDataElement(scanner: Scanner): AasTypes.IDataElement {
+  switch (scanner.peekModelType()) {
+    case "Blob":
+      return parseBlob(scanner);
+    case "File":
+      return parseFile(scanner);
+    case "MultiLanguageProperty":
+      return parseMultiLanguageProperty(scanner);
+    case "Property":
+      return parseProperty(scanner);
+    case "Range":
+      return parseRange(scanner);
+    case "ReferenceElement":
+      return parseReferenceElement(scanner);
+    default:
+      throw new Mismatch();
+  }
+}
+
+/**
+ * Parse an instance of {@link types!IDataSpecificationContent} by its `modelType`.
+ */
+function parseDataSpecificationContent(
+  scanner: Scanner
+): AasTypes.IDataSpecificationContent {
+  switch (scanner.peekModelType()) {
+    case "DataSpecificationIEC61360":
+      return parseDataSpecificationIec61360(scanner);
+    case "DataSpecificationPhysicalUnit":
+      return parseDataSpecificationPhysicalUnit(scanner);
+    default:
+      throw new Mismatch();
+  }
+}
+
+/**
+ * Parse an instance of {@link types!Extension}.
+ */
+function parseExtension(scanner: Scanner): AasTypes.Extension {
+  let semanticId: AasTypes.Reference | null = null;
+  let supplementalSemanticIds: Array<AasTypes.Reference> | null = null;
+  let name: string | null = null;
+  let valueType: AasTypes.DataTypeDefXsd | null = null;
+  let value: string | null = null;
+  let refersTo: AasTypes.Reference | null = null;
+
+  for (let key = scanner.firstKey(); key !== null; key = scanner.nextKey()) {
+    switch (key) {
+      case "semanticId":
+        semanticId = parseReference(scanner);
+        break;
+      case "supplementalSemanticIds":
+        supplementalSemanticIds = readList(scanner, parseReference);
+        break;
+      case "name":
+        name = scanner.readString();
+        break;
+      case "valueType":
+        valueType = readLiteral(scanner, AasStringification.dataTypeDefXsdFromString);
+        break;
+      case "value":
+        value = scanner.readString();
+        break;
+      case "refersTo":
+        refersTo = parseReference(scanner);
+        break;
+      default:
+        scanner.skipValue();
+        break;
+    }
+  }
+
+  if (name === null) {
+    throw new Mismatch();
+  }
+
+  return new AasTypes.Extension(
+    name,
+    semanticId,
+    supplementalSemanticIds,
+    valueType,
+    value,
+    refersTo
+  );
+}
+
+/**
+ * Parse an instance of {@link types!AdministrativeInformation}.
+ */
+function parseAdministrativeInformation(
+  scanner: Scanner
+): AasTypes.AdministrativeInformation {
+  let embeddedDataSpecifications: Array<AasTypes.EmbeddedDataSpecification> | null =
+    null;
+  let version: string | null = null;
+  let revision: string | null = null;
+
+  for (let key = scanner.firstKey(); key !== null; key = scanner.nextKey()) {
+    switch (key) {
+      case "embeddedDataSpecifications":
+        embeddedDataSpecifications = readList(scanner, parseEmbeddedDataSpecification);
+        break;
+      case "version":
+        version = scanner.readString();
+        break;
+      case "revision":
+        revision = scanner.readString();
+        break;
+      default:
+        scanner.skipValue();
+        break;
+    }
+  }
+
+  return new AasTypes.AdministrativeInformation(
+    embeddedDataSpecifications,
+    version,
+    revision
+  );
+}
+
+/**
+ * Parse an instance of {@link types!Qualifier}.
+ */
+function parseQualifier(scanner: Scanner): AasTypes.Qualifier {
+  let semanticId: AasTypes.Reference | null = null;
+  let supplementalSemanticIds: Array<AasTypes.Reference> | null = null;
+  let kind: AasTypes.QualifierKind | null = null;
+  let type: string | null = null;
+  let valueType: AasTypes.DataTypeDefXsd | null = null;
+  let value: string | null = null;
+  let valueId: AasTypes.Reference | null = null;
+
+  for (let key = scanner.firstKey(); key !== null; key = scanner.nextKey()) {
+    switch (key) {
+      case "semanticId":
+        semanticId = parseReference(scanner);
+        break;
+      case "supplementalSemanticIds":
+        supplementalSemanticIds = readList(scanner, parseReference);
+        break;
+      case "kind":
+        kind = readLiteral(scanner, AasStringification.qualifierKindFromString);
+        break;
+      case "type":
+        type = scanner.readString();
+        break;
+      case "valueType":
+        valueType = readLiteral(scanner, AasStringification.dataTypeDefXsdFromString);
+        break;
+      case "value":
+        value = scanner.readString();
+        break;
+      case "valueId":
+        valueId = parseReference(scanner);
+        break;
+      default:
+        scanner.skipValue();
+        break;
+    }
+  }
+
+  if (type === null || valueType === null) {
+    throw new Mismatch();
+  }
+
+  return new AasTypes.Qualifier(
+    type,
+    valueType,
+    semanticId,
+    supplementalSemanticIds,
+    kind,
+    value,
+    valueId
+  );
+}
+
+/**
+ * Parse an instance of {@link types!AssetAdministrationShell}.
+ */
+function parseAssetAdministrationShell(
+  scanner: Scanner
+): AasTypes.AssetAdministrationShell {
+  let extensions: Array<AasTypes.Extension> | null = null;
+  let category: string | null = null;
+  let idShort: string | null = null;
+  let displayName: Array<AasTypes.LangString> | null = null;
+  let description: Array<AasTypes.LangString> | null = null;
+  let checksum: string | null = null;
+  let administration: AasTypes.AdministrativeInformation | null = null;
+  let id: string | null = null;
+  let embeddedDataSpecifications: Array<AasTypes.EmbeddedDataSpecification> | null =
+    null;
+  let derivedFrom: AasTypes.Reference | null = null;
+  let assetInformation: AasTypes.AssetInformation | null = null;
+  let submodels: Array<AasTypes.Reference> | null = null;
+
+  for (let key = scanner.firstKey(); key !== null; key = scanner.nextKey()) {
+    switch (key) {
+      case "extensions":
+        extensions = readList(scanner, parseExtension);
+        break;
+      case "category":
+        category = scanner.readString();
+        break;
+      case "idShort":
+        idShort = scanner.readString();
+        break;
+      case "displayName":
+        displayName = readList(scanner, parseLangString);
+        break;
+      case "description":
+        description = readList(scanner, parseLangString);
+        break;
+      case "checksum":
+        checksum = scanner.readString();
+        break;
+      case "administration":
+        administration = parseAdministrativeInformation(scanner);
+        break;
+      case "id":
+        id = scanner.readString();
+        break;
+      case "embeddedDataSpecifications":
+        embeddedDataSpecifications = readList(scanner, parseEmbeddedDataSpecification);
+        break;
+      case "derivedFrom":
+        derivedFrom = parseReference(scanner);
+        break;
+      case "assetInformation":
+        assetInformation = parseAssetInformation(scanner);
+        break;
+      case "submodels":
+        submodels = readList(scanner, parseReference);
+        break;
+      default:
+        scanner.skipValue();
+        break;
+    }
+  }
+
+  if (id === null || assetInformation === null) {
+    throw new Mismatch();
+  }
+
+  return new AasTypes.AssetAdministrationShell(
+    id,
+    assetInformation,
+    extensions,
+    category,
+    idShort,
+    displayName,
+    description,
+    checksum,
+    administration,
+    embeddedDataSpecifications,
+    derivedFrom,
+    submodels
+  );
+}
+
+/**
+ * Parse an instance of {@link types!AssetInformation}.
+ */
+function parseAssetInformation(scanner: Scanner): AasTypes.AssetInformation {
+  let assetKind: AasTypes.AssetKind | null = null;
+  let globalAssetId: AasTypes.Reference | null = null;
+  let specificAssetIds: Array<AasTypes.SpecificAssetId> | null = null;
+  let defaultThumbnail: AasTypes.Resource | null = null;
+
+  for (let key = scanner.firstKey(); key !== null; key = scanner.nextKey()) {
+    switch (key) {
+      case "assetKind":
+        assetKind = readLiteral(scanner, AasStringification.assetKindFromString);
+        break;
+      case "globalAssetId":
+        globalAssetId = parseReference(scanner);
+        break;
+      case "specificAssetIds":
+        specificAssetIds = readList(scanner, parseSpecificAssetId);
+        break;
+      case "defaultThumbnail":
+        defaultThumbnail = parseResource(scanner);
+        break;
+      default:
+        scanner.skipValue();
+        break;
+    }
+  }
+
+  if (assetKind === null) {
+    throw new Mismatch();
+  }
+
+  return new AasTypes.AssetInformation(
+    assetKind,
+    globalAssetId,
+    specificAssetIds,
+    defaultThumbnail
+  );
+}
+
+/**
+ * Parse an instance of {@link types!Resource}.
+ */
+function parseResource(scanner: Scanner): AasTypes.Resource {
+  let path: string | null = null;
+  let contentType: string | null = null;
+
+  for (let key = scanner.firstKey(); key !== null; key = scanner.nextKey()) {
+    switch (key) {
+      case "path":
+        path = scanner.readString();
+        break;
+      case "contentType":
+        contentType = scanner.readString();
+        break;
+      default:
+        scanner.skipValue();
+        break;
+    }
+  }
+
+  if (path === null) {
+    throw new Mismatch();
+  }
+
+  return new AasTypes.Resource(path, contentType);
+}
+
+/**
+ * Parse an instance of {@link types!SpecificAssetId}.
+ */
+function parseSpecificAssetId(scanner: Scanner): AasTypes.SpecificAssetId {
+  let semanticId: AasTypes.Reference | null = null;
+  let supplementalSemanticIds: Array<AasTypes.Reference> | null = null;
+  let name: string | null = null;
+  let value: string | null = null;
+  let externalSubjectId: AasTypes.Reference | null = null;
+
+  for (let key = scanner.firstKey(); key !== null; key = scanner.nextKey()) {
+    switch (key) {
+      case "semanticId":
+        semanticId = parseReference(scanner);
+        break;
+      case "supplementalSemanticIds":
+        supplementalSemanticIds = readList(scanner, parseReference);
+        break;
+      case "name":
+        name = scanner.readString();
+        break;
+      case "value":
+        value = scanner.readString();
+        break;
+      case "externalSubjectId":
+        externalSubjectId = parseReference(scanner);
+        break;
+      default:
+        scanner.skipValue();
+        break;
+    }
+  }
+
+  if (name === null || value === null || externalSubjectId === null) {
+    throw new Mismatch();
+  }
+
+  return new AasTypes.SpecificAssetId(
+    name,
+    value,
+    externalSubjectId,
+    semanticId,
+    supplementalSemanticIds
+  );
+}
+
+/**
+ * Parse an instance of {@link types!Submodel}.
+ */
+function parseSubmodel(scanner: Scanner): AasTypes.Submodel {
+  let extensions: Array<AasTypes.Extension> | null = null;
+  let category: string | null = null;
+  let idShort: string | null = null;
+  let displayName: Array<AasTypes.LangString> | null = null;
+  let description: Array<AasTypes.LangString> | null = null;
+  let checksum: string | null = null;
+  let administration: AasTypes.AdministrativeInformation | null = null;
+  let id: string | null = null;
+  let kind: AasTypes.ModelingKind | null = null;
+  let semanticId: AasTypes.Reference | null = null;
+  let supplementalSemanticIds: Array<AasTypes.Reference> | null = null;
+  let qualifiers: Array<AasTypes.Qualifier> | null = null;
+  let embeddedDataSpecifications: Array<AasTypes.EmbeddedDataSpecification> | null =
+    null;
+  let submodelElements: Array<AasTypes.ISubmodelElement> | null = null;
+
+  for (let key = scanner.firstKey(); key !== null; key = scanner.nextKey()) {
+    switch (key) {
+      case "extensions":
+        extensions = readList(scanner, parseExtension);
+        break;
+      case "category":
+        category = scanner.readString();
+        break;
+      case "idShort":
+        idShort = scanner.readString();
+        break;
+      case "displayName":
+        displayName = readList(scanner, parseLangString);
+        break;
+      case "description":
+        description = readList(scanner, parseLangString);
+        break;
+      case "checksum":
+        checksum = scanner.readString();
+        break;
+      case "administration":
+        administration = parseAdministrativeInformation(scanner);
+        break;
+      case "id":
+        id = scanner.readString();
+        break;
+      case "kind":
+        kind = readLiteral(scanner, AasStringification.modelingKindFromString);
+        break;
+      case "semanticId":
+        semanticId = parseReference(scanner);
+        break;
+      case "supplementalSemanticIds":
+        supplementalSemanticIds = readList(scanner, parseReference);
+        break;
+      case "qualifiers":
+        qualifiers = readList(scanner, parseQualifier);
+        break;
+      case "embeddedDataSpecifications":
+        embeddedDataSpecifications = readList(scanner, parseEmbeddedDataSpecification);
+        break;
+      case "submodelElements":
+        submodelElements = readList(scanner, parseSubmodelElement);
+        break;
+      default:
+        scanner.skipValue();
+        break;
+    }
+  }
+
+  if (id === null) {
+    throw new Mismatch();
+  }
+
+  return new AasTypes.Submodel(
+    id,
+    extensions,
+    category,
+    idShort,
+    displayName,
+    description,
+    checksum,
+    administration,
+    kind,
+    semanticId,
+    supplementalSemanticIds,
+    qualifiers,
+    embeddedDataSpecifications,
+    submodelElements
+  );
+}
+
+/**
+ * Parse an instance of {@link types!RelationshipElement}.
+ */
+function parseRelationshipElement(scanner: Scanner): AasTypes.RelationshipElement {
+  let extensions: Array<AasTypes.Extension> | null = null;
+  let category: string | null = null;
+  let idShort: string | null = null;
+  let displayName: Array<AasTypes.LangString> | null = null;
+  let description: Array<AasTypes.LangString> | null = null;
+  let checksum: string | null = null;
+  let kind: AasTypes.ModelingKind | null = null;
+  let semanticId: AasTypes.Reference | null = null;
+  let supplementalSemanticIds: Array<AasTypes.Reference> | null = null;
+  let qualifiers: Array<AasTypes.Qualifier> | null = null;
+  let embeddedDataSpecifications: Array<AasTypes.EmbeddedDataSpecification> | null =
+    null;
+  let first: AasTypes.Reference | null = null;
+  let second: AasTypes.Reference | null = null;
+
+  for (let key = scanner.firstKey(); key !== null; key = scanner.nextKey()) {
+    switch (key) {
+      case "extensions":
+        extensions = readList(scanner, parseExtension);
+        break;
+      case "category":
+        category = scanner.readString();
+        break;
+      case "idShort":
+        idShort = scanner.readString();
+        break;
+      case "displayName":
+        displayName = readList(scanner, parseLangString);
+        break;
+      case "description":
+        description = readList(scanner, parseLangString);
+        break;
+      case "checksum":
+        checksum = scanner.readString();
+        break;
+      case "kind":
+        kind = readLiteral(scanner, AasStringification.modelingKindFromString);
+        break;
+      case "semanticId":
+        semanticId = parseReference(scanner);
+        break;
+      case "supplementalSemanticIds":
+        supplementalSemanticIds = readList(scanner, parseReference);
+        break;
+      case "qualifiers":
+        qualifiers = readList(scanner, parseQualifier);
+        break;
+      case "embeddedDataSpecifications":
+        embeddedDataSpecifications = readList(scanner, parseEmbeddedDataSpecification);
+        break;
+      case "first":
+        first = parseReference(scanner);
+        break;
+      case "second":
+        second = parseReference(scanner);
+        break;
+      default:
+        scanner.skipValue();
+        break;
+    }
+  }
+
+  if (first === null || second === null) {
+    throw new Mismatch();
+  }
+
+  return new AasTypes.RelationshipElement(
+    first,
+    second,
+    extensions,
+    category,
+    idShort,
+    displayName,
+    description,
+    checksum,
+    kind,
+    semanticId,
+    supplementalSemanticIds,
+    qualifiers,
+    embeddedDataSpecifications
+  );
+}
+
+/**
+ * Parse an instance of {@link types!SubmodelElementList}.
+ */
+function parseSubmodelElementList(scanner: Scanner): AasTypes.SubmodelElementList {
+  let extensions: Array<AasTypes.Extension> | null = null;
+  let category: string | null = null;
+  let idShort: string | null = null;
+  let displayName: Array<AasTypes.LangString> | null = null;
+  let description: Array<AasTypes.LangString> | null = null;
+  let checksum: string | null = null;
+  let kind: AasTypes.ModelingKind | null = null;
+  let semanticId: AasTypes.Reference | null = null;
+  let supplementalSemanticIds: Array<AasTypes.Reference> | null = null;
+  let qualifiers: Array<AasTypes.Qualifier> | null = null;
+  let embeddedDataSpecifications: Array<AasTypes.EmbeddedDataSpecification> | null =
+    null;
+  let orderRelevant: boolean | null = null;
+  let value: Array<AasTypes.ISubmodelElement> | null = null;
+  let semanticIdListElement: AasTypes.Reference | null = null;
+  let typeValueListElement: AasTypes.AasSubmodelElements | null = null;
+  let valueTypeListElement: AasTypes.DataTypeDefXsd | null = null;
+
+  for (let key = scanner.firstKey(); key !== null; key = scanner.nextKey()) {
+    switch (key) {
+      case "extensions":
+        extensions = readList(scanner, parseExtension);
+        break;
+      case "category":
+        category = scanner.readString();
+        break;
+      case "idShort":
+        idShort = scanner.readString();
+        break;
+      case "displayName":
+        displayName = readList(scanner, parseLangString);
+        break;
+      case "description":
+        description = readList(scanner, parseLangString);
+        break;
+      case "checksum":
+        checksum = scanner.readString();
+        break;
+      case "kind":
+        kind = readLiteral(scanner, AasStringification.modelingKindFromString);
+        break;
+      case "semanticId":
+        semanticId = parseReference(scanner);
+        break;
+      case "supplementalSemanticIds":
+        supplementalSemanticIds = readList(scanner, parseReference);
+        break;
+      case "qualifiers":
+        qualifiers = readList(scanner, parseQualifier);
+        break;
+      case "embeddedDataSpecifications":
+        embeddedDataSpecifications = readList(scanner, parseEmbeddedDataSpecification);
+        break;
+      case "orderRelevant":
+        orderRelevant = scanner.readBoolean();
+        break;
+      case "value":
+        value = readList(scanner, parseSubmodelElement);
+        break;
+      case "semanticIdListElement":
+        semanticIdListElement = parseReference(scanner);
+        break;
+      case "typeValueListElement":
+        typeValueListElement = readLiteral(
+          scanner,
+          AasStringification.aasSubmodelElementsFromString
+        );
+        break;
+      case "valueTypeListElement":
+        valueTypeListElement = readLiteral(
+          scanner,
+          AasStringification.dataTypeDefXsdFromString
+        );
+        break;
+      default:
+        scanner.skipValue();
+        break;
+    }
+  }
+
+  if (typeValueListElement === null) {
+    throw new Mismatch();
+  }
+
+  return new AasTypes.SubmodelElementList(
+    typeValueListElement,
+    extensions,
+    category,
+    idShort,
+    displayName,
+    description,
+    checksum,
+    kind,
+    semanticId,
+    supplementalSemanticIds,
+    qualifiers,
+    embeddedDataSpecifications,
+    orderRelevant,
+    value,
+    semanticIdListElement,
+    valueTypeListElement
+  );
+}
+
+/**
+ * Parse an instance of {@link types!SubmodelElementCollection}.
+ */
+function parseSubmodelElementCollection(
+  scanner: Scanner
+): AasTypes.SubmodelElementCollection {
+  let extensions: Array<AasTypes.Extension> | null = null;
+  let category: string | null = null;
+  let idShort: string | null = null;
+  let displayName: Array<AasTypes.LangString> | null = null;
+  let description: Array<AasTypes.LangString> | null = null;
+  let checksum: string | null = null;
+  let kind: AasTypes.ModelingKind | null = null;
+  let semanticId: AasTypes.Reference | null = null;
+  let supplementalSemanticIds: Array<AasTypes.Reference> | null = null;
+  let qualifiers: Array<AasTypes.Qualifier> | null = null;
+  let embeddedDataSpecifications: Array<AasTypes.EmbeddedDataSpecification> | null =
+    null;
+  let value: Array<AasTypes.ISubmodelElement> | null = null;
+
+  for (let key = scanner.firstKey(); key !== null; key = scanner.nextKey()) {
+    switch (key) {
+      case "extensions":
+        extensions = readList(scanner, parseExtension);
+        break;
+      case "category":
+        category = scanner.readString();
+        break;
+      case "idShort":
+        idShort = scanner.readString();
+        break;
+      case "displayName":
+        displayName = readList(scanner, parseLangString);
+        break;
+      case "description":
+        description = readList(scanner, parseLangString);
+        break;
+      case "checksum":
+        checksum = scanner.readString();
+        break;
+      case "kind":
+        kind = readLiteral(scanner, AasStringification.modelingKindFromString);
+        break;
+      case "semanticId":
+        semanticId = parseReference(scanner);
+        break;
+      case "supplementalSemanticIds":
+        supplementalSemanticIds = readList(scanner, parseReference);
+        break;
+      case "qualifiers":
+        qualifiers = readList(scanner, parseQualifier);
+        break;
+      case "embeddedDataSpecifications":
+        embeddedDataSpecifications = readList(scanner, parseEmbeddedDataSpecification);
+        break;
+      case "value":
+        value = readList(scanner, parseSubmodelElement);
+        break;
+      default:
+        scanner.skipValue();
+        break;
+    }
+  }
+
+  return new AasTypes.SubmodelElementCollection(
+    extensions,
+    category,
+    idShort,
+    displayName,
+    description,
+    checksum,
+    kind,
+    semanticId,
+    supplementalSemanticIds,
+    qualifiers,
+    embeddedDataSpecifications,
+    value
+  );
+}
+
+/**
+ * Parse an instance of {@link types!Property}.
+ */
+function parseProperty(scanner: Scanner): AasTypes.Property {
+  let extensions: Array<AasTypes.Extension> | null = null;
+  let category: string | null = null;
+  let idShort: string | null = null;
+  let displayName: Array<AasTypes.LangString> | null = null;
+  let description: Array<AasTypes.LangString> | null = null;
+  let checksum: string | null = null;
+  let kind: AasTypes.ModelingKind | null = null;
+  let semanticId: AasTypes.Reference | null = null;
+  let supplementalSemanticIds: Array<AasTypes.Reference> | null = null;
+  let qualifiers: Array<AasTypes.Qualifier> | null = null;
+  let embeddedDataSpecifications: Array<AasTypes.EmbeddedDataSpecification> | null =
+    null;
+  let valueType: AasTypes.DataTypeDefXsd | null = null;
+  let value: string | null = null;
+  let valueId: AasTypes.Reference | null = null;
+
+  for (let key = scanner.firstKey(); key !== null; key = scanner.nextKey()) {
+    switch (key) {
+      case "extensions":
+        extensions = readList(scanner, parseExtension);
+        break;
+      case "category":
+        category = scanner.readString();
+        break;
+      case "idShort":
+        idShort = scanner.readString();
+        break;
+      case "displayName":
+        displayName = readList(scanner, parseLangString);
+        break;
+      case "description":
+        description = readList(scanner, parseLangString);
+        break;
+      case "checksum":
+        checksum = scanner.readString();
+        break;
+      case "kind":
+        kind = readLiteral(scanner, AasStringification.modelingKindFromString);
+        break;
+      case "semanticId":
+        semanticId = parseReference(scanner);
+        break;
+      case "supplementalSemanticIds":
+        supplementalSemanticIds = readList(scanner, parseReference);
+        break;
+      case "qualifiers":
+        qualifiers = readList(scanner, parseQualifier);
+        break;
+      case "embeddedDataSpecifications":
+        embeddedDataSpecifications = readList(scanner, parseEmbeddedDataSpecification);
+        break;
+      case "valueType":
+        valueType = readLiteral(scanner, AasStringification.dataTypeDefXsdFromString);
+        break;
+      case "value":
+        value = scanner.readString();
+        break;
+      case "valueId":
+        valueId = parseReference(scanner);
+        break;
+      default:
+        scanner.skipValue();
+        break;
+    }
+  }
+
+  if (valueType === null) {
+    throw new Mismatch();
+  }
+
+  return new AasTypes.Property(
+    valueType,
+    extensions,
+    category,
+    idShort,
+    displayName,
+    description,
+    checksum,
+    kind,
+    semanticId,
+    supplementalSemanticIds,
+    qualifiers,
+    embeddedDataSpecifications,
+    value,
+    valueId
+  );
+}
+
+/**
+ * Parse an instance of {@link types!MultiLanguageProperty}.
+ */
+function parseMultiLanguageProperty(scanner: Scanner): AasTypes.MultiLanguageProperty {
+  let extensions: Array<AasTypes.Extension> | null = null;
+  let category: string | null = null;
+  let idShort: string | null = null;
+  let displayName: Array<AasTypes.LangString> | null = null;
+  let description: Array<AasTypes.LangString> | null = null;
+  let checksum: string | null = null;
+  let kind: AasTypes.ModelingKind | null = null;
+  let semanticId: AasTypes.Reference | null = null;
+  let supplementalSemanticIds: Array<AasTypes.Reference> | null = null;
+  let qualifiers: Array<AasTypes.Qualifier> | null = null;
+  let embeddedDataSpecifications: Array<AasTypes.EmbeddedDataSpecification> | null =
+    null;
+  let value: Array<AasTypes.LangString> | null = null;
+  let valueId: AasTypes.Reference | null = null;
+
+  for (let key = scanner.firstKey(); key !== null; key = scanner.nextKey()) {
+    switch (key) {
+      case "extensions":
+        extensions = readList(scanner, parseExtension);
+        break;
+      case "category":
+        category = scanner.readString();
+        break;
+      case "idShort":
+        idShort = scanner.readString();
+        break;
+      case "displayName":
+        displayName = readList(scanner, parseLangString);
+        break;
+      case "description":
+        description = readList(scanner, parseLangString);
+        break;
+      case "checksum":
+        checksum = scanner.readString();
+        break;
+      case "kind":
+        kind = readLiteral(scanner, AasStringification.modelingKindFromString);
+        break;
+      case "semanticId":
+        semanticId = parseReference(scanner);
+        break;
+      case "supplementalSemanticIds":
+        supplementalSemanticIds = readList(scanner, parseReference);
+        break;
+      case "qualifiers":
+        qualifiers = readList(scanner, parseQualifier);
+        break;
+      case "embeddedDataSpecifications":
+        embeddedDataSpecifications = readList(scanner, parseEmbeddedDataSpecification);
+        break;
+      case "value":
+        value = readList(scanner, parseLangString);
+        break;
+      case "valueId":
+        valueId = parseReference(scanner);
+        break;
+      default:
+        scanner.skipValue();
+        break;
+    }
+  }
+
+  return new AasTypes.MultiLanguageProperty(
+    extensions,
+    category,
+    idShort,
+    displayName,
+    description,
+    checksum,
+    kind,
+    semanticId,
+    supplementalSemanticIds,
+    qualifiers,
+    embeddedDataSpecifications,
+    value,
+    valueId
+  );
+}
+
+/**
+ * Parse an instance of {@link types!Range}.
+ */
+function parseRange(scanner: Scanner): AasTypes.Range {
+  let extensions: Array<AasTypes.Extension> | null = null;
+  let category: string | null = null;
+  let idShort: string | null = null;
+  let displayName: Array<AasTypes.LangString> | null = null;
+  let description: Array<AasTypes.LangString> | null = null;
+  let checksum: string | null = null;
+  let kind: AasTypes.ModelingKind | null = null;
+  let semanticId: AasTypes.Reference | null = null;
+  let supplementalSemanticIds: Array<AasTypes.Reference> | null = null;
+  let qualifiers: Array<AasTypes.Qualifier> | null = null;
+  let embeddedDataSpecifications: Array<AasTypes.EmbeddedDataSpecification> | null =
+    null;
+  let valueType: AasTypes.DataTypeDefXsd | null = null;
+  let min: string | null = null;
+  let max: string | null = null;
+
+  for (let key = scanner.firstKey(); key !== null; key = scanner.nextKey()) {
+    switch (key) {
+      case "extensions":
+        extensions = readList(scanner, parseExtension);
+        break;
+      case "category":
+        category = scanner.readString();
+        break;
+      case "idShort":
+        idShort = scanner.readString();
+        break;
+      case "displayName":
+        displayName = readList(scanner, parseLangString);
+        break;
+      case "description":
+        description = readList(scanner, parseLangString);
+        break;
+      case "checksum":
+        checksum = scanner.readString();
+        break;
+      case "kind":
+        kind = readLiteral(scanner, AasStringification.modelingKindFromString);
+        break;
+      case "semanticId":
+        semanticId = parseReference(scanner);
+        break;
+      case "supplementalSemanticIds":
+        supplementalSemanticIds = readList(scanner, parseReference);
+        break;
+      case "qualifiers":
+        qualifiers = readList(scanner, parseQualifier);
+        break;
+      case "embeddedDataSpecifications":
+        embeddedDataSpecifications = readList(scanner, parseEmbeddedDataSpecification);
+        break;
+      case "valueType":
+        valueType = readLiteral(scanner, AasStringification.dataTypeDefXsdFromString);
+        break;
+      case "min":
+        min = scanner.readString();
+        break;
+      case "max":
+        max = scanner.readString();
+        break;
+      default:
+        scanner.skipValue();
+        break;
+    }
+  }
+
+  if (valueType === null) {
+    throw new Mismatch();
+  }
+
+  return new AasTypes.Range(
+    valueType,
+    extensions,
+    category,
+    idShort,
+    displayName,
+    description,
+    checksum,
+    kind,
+    semanticId,
+    supplementalSemanticIds,
+    qualifiers,
+    embeddedDataSpecifications,
+    min,
+    max
+  );
+}
+
+/**
+ * Parse an instance of {@link types!ReferenceElement}.
+ */
+function parseReferenceElement(scanner: Scanner): AasTypes.ReferenceElement {
+  let extensions: Array<AasTypes.Extension> | null = null;
+  let category: string | null = null;
+  let idShort: string | null = null;
+  let displayName: Array<AasTypes.LangString> | null = null;
+  let description: Array<AasTypes.LangString> | null = null;
+  let checksum: string | null = null;
+  let kind: AasTypes.ModelingKind | null = null;
+  let semanticId: AasTypes.Reference | null = null;
+  let supplementalSemanticIds: Array<AasTypes.Reference> | null = null;
+  let qualifiers: Array<AasTypes.Qualifier> | null = null;
+  let embeddedDataSpecifications: Array<AasTypes.EmbeddedDataSpecification> | null =
+    null;
+  let value: AasTypes.Reference | null = null;
+
+  for (let key = scanner.firstKey(); key !== null; key = scanner.nextKey()) {
+    switch (key) {
+      case "extensions":
+        extensions = readList(scanner, parseExtension);
+        break;
+      case "category":
+        category = scanner.readString();
+        break;
+      case "idShort":
+        idShort = scanner.readString();
+        break;
+      case "displayName":
+        displayName = readList(scanner, parseLangString);
+        break;
+      case "description":
+        description = readList(scanner, parseLangString);
+        break;
+      case "checksum":
+        checksum = scanner.readString();
+        break;
+      case "kind":
+        kind = readLiteral(scanner, AasStringification.modelingKindFromString);
+        break;
+      case "semanticId":
+        semanticId = parseReference(scanner);
+        break;
+      case "supplementalSemanticIds":
+        supplementalSemanticIds = readList(scanner, parseReference);
+        break;
+      case "qualifiers":
+        qualifiers = readList(scanner, parseQualifier);
+        break;
+      case "embeddedDataSpecifications":
+        embeddedDataSpecifications = readList(scanner, parseEmbeddedDataSpecification);
+        break;
+      case "value":
+        value = parseReference(scanner);
+        break;
+      default:
+        scanner.skipValue();
+        break;
+    }
+  }
+
+  return new AasTypes.ReferenceElement(
+    extensions,
+    category,
+    idShort,
+    displayName,
+    description,
+    checksum,
+    kind,
+    semanticId,
+    supplementalSemanticIds,
+    qualifiers,
+    embeddedDataSpecifications,
+    value
+  );
+}
+
+/**
+ * Parse an instance of {@link types!Blob}.
+ */
+function parseBlob(scanner: Scanner): AasTypes.Blob {
+  let extensions: Array<AasTypes.Extension> | null = null;
+  let category: string | null = null;
+  let idShort: string | null = null;
+  let displayName: Array<AasTypes.LangString> | null = null;
+  let description: Array<AasTypes.LangString> | null = null;
+  let checksum: string | null = null;
+  let kind: AasTypes.ModelingKind | null = null;
+  let semanticId: AasTypes.Reference | null = null;
+  let supplementalSemanticIds: Array<AasTypes.Reference> | null = null;
+  let qualifiers: Array<AasTypes.Qualifier> | null = null;
+  let embeddedDataSpecifications: Array<AasTypes.EmbeddedDataSpecification> | null =
+    null;
+  let value: Uint8Array | null = null;
+  let contentType: string | null = null;
+
+  for (let key = scanner.firstKey(); key !== null; key = scanner.nextKey()) {
+    switch (key) {
+      case "extensions":
+        extensions = readList(scanner, parseExtension);
+        break;
+      case "category":
+        category = scanner.readString();
+        break;
+      case "idShort":
+        idShort = scanner.readString();
+        break;
+      case "displayName":
+        displayName = readList(scanner, parseLangString);
+        break;
+      case "description":
+        description = readList(scanner, parseLangString);
+        break;
+      case "checksum":
+        checksum = scanner.readString();
+        break;
+      case "kind":
+        kind = readLiteral(scanner, AasStringification.modelingKindFromString);
+        break;
+      case "semanticId":
+        semanticId = parseReference(scanner);
+        break;
+      case "supplementalSemanticIds":
+        supplementalSemanticIds = readList(scanner, parseReference);
+        break;
+      case "qualifiers":
+        qualifiers = readList(scanner, parseQualifier);
+        break;
+      case "embeddedDataSpecifications":
+        embeddedDataSpecifications = readList(scanner, parseEmbeddedDataSpecification);
+        break;
+      case "value":
+        value = scanner.readBytes();
+        break;
+      case "contentType":
+        contentType = scanner.readString();
+        break;
+      default:
+        scanner.skipValue();
+        break;
+    }
+  }
+
+  if (contentType === null) {
+    throw new Mismatch();
+  }
+
+  return new AasTypes.Blob(
+    contentType,
+    extensions,
+    category,
+    idShort,
+    displayName,
+    description,
+    checksum,
+    kind,
+    semanticId,
+    supplementalSemanticIds,
+    qualifiers,
+    embeddedDataSpecifications,
+    value
+  );
+}
+
+/**
+ * Parse an instance of {@link types!File}.
+ */
+function parseFile(scanner: Scanner): AasTypes.File {
+  let extensions: Array<AasTypes.Extension> | null = null;
+  let category: string | null = null;
+  let idShort: string | null = null;
+  let displayName: Array<AasTypes.LangString> | null = null;
+  let description: Array<AasTypes.LangString> | null = null;
+  let checksum: string | null = null;
+  let kind: AasTypes.ModelingKind | null = null;
+  let semanticId: AasTypes.Reference | null = null;
+  let supplementalSemanticIds: Array<AasTypes.Reference> | null = null;
+  let qualifiers: Array<AasTypes.Qualifier> | null = null;
+  let embeddedDataSpecifications: Array<AasTypes.EmbeddedDataSpecification> | null =
+    null;
+  let value: string | null = null;
+  let contentType: string | null = null;
+
+  for (let key = scanner.firstKey(); key !== null; key = scanner.nextKey()) {
+    switch (key) {
+      case "extensions":
+        extensions = readList(scanner, parseExtension);
+        break;
+      case "category":
+        category = scanner.readString();
+        break;
+      case "idShort":
+        idShort = scanner.readString();
+        break;
+      case "displayName":
+        displayName = readList(scanner, parseLangString);
+        break;
+      case "description":
+        description = readList(scanner, parseLangString);
+        break;
+      case "checksum":
+        checksum = scanner.readString();
+        break;
+      case "kind":
+        kind = readLiteral(scanner, AasStringification.modelingKindFromString);
+        break;
+      case "semanticId":
+        semanticId = parseReference(scanner);
+        break;
+      case "supplementalSemanticIds":
+        supplementalSemanticIds = readList(scanner, parseReference);
+        break;
+      case "qualifiers":
+        qualifiers = readList(scanner, parseQualifier);
+        break;
+      case "embeddedDataSpecifications":
+        embeddedDataSpecifications = readList(scanner, parseEmbeddedDataSpecification);
+        break;
+      case "value":
+        value = scanner.readString();
+        break;
+      case "contentType":
+        contentType = scanner.readString();
+        break;
+      default:
+        scanner.skipValue();
+        break;
+    }
+  }
+
+  if (contentType === null) {
+    throw new Mismatch();
+  }
+
+  return new AasTypes.File(
+    contentType,
+    extensions,
+    category,
+    idShort,
+    displayName,
+    description,
+    checksum,
+    kind,
+    semanticId,
+    supplementalSemanticIds,
+    qualifiers,
+    embeddedDataSpecifications,
+    value
+  );
+}
+
+/**
+ * Parse an instance of {@link types!AnnotatedRelationshipElement}.
+ */
+function parseAnnotatedRelationshipElement(
+  scanner: Scanner
+): AasTypes.AnnotatedRelationshipElement {
+  let extensions: Array<AasTypes.Extension> | null = null;
+  let category: string | null = null;
+  let idShort: string | null = null;
+  let displayName: Array<AasTypes.LangString> | null = null;
+  let description: Array<AasTypes.LangString> | null = null;
+  let checksum: string | null = null;
+  let kind: AasTypes.ModelingKind | null = null;
+  let semanticId: AasTypes.Reference | null = null;
+  let supplementalSemanticIds: Array<AasTypes.Reference> | null = null;
+  let qualifiers: Array<AasTypes.Qualifier> | null = null;
+  let embeddedDataSpecifications: Array<AasTypes.EmbeddedDataSpecification> | null =
+    null;
+  let first: AasTypes.Reference | null = null;
+  let second: AasTypes.Reference | null = null;
+  let annotations: Array<AasTypes.IDataElement> | null = null;
+
+  for (let key = scanner.firstKey(); key !== null; key = scanner.nextKey()) {
+    switch (key) {
+      case "extensions":
+        extensions = readList(scanner, parseExtension);
+        break;
+      case "category":
+        category = scanner.readString();
+        break;
+      case "idShort":
+        idShort = scanner.readString();
+        break;
+      case "displayName":
+        displayName = readList(scanner, parseLangString);
+        break;
+      case "description":
+        description = readList(scanner, parseLangString);
+        break;
+      case "checksum":
+        checksum = scanner.readString();
+        break;
+      case "kind":
+        kind = readLiteral(scanner, AasStringification.modelingKindFromString);
+        break;
+      case "semanticId":
+        semanticId = parseReference(scanner);
+        break;
+      case "supplementalSemanticIds":
+        supplementalSemanticIds = readList(scanner, parseReference);
+        break;
+      case "qualifiers":
+        qualifiers = readList(scanner, parseQualifier);
+        break;
+      case "embeddedDataSpecifications":
+        embeddedDataSpecifications = readList(scanner, parseEmbeddedDataSpecification);
+        break;
+      case "first":
+        first = parseReference(scanner);
+        break;
+      case "second":
+        second = parseReference(scanner);
+        break;
+      case "annotations":
+        annotations = readList(scanner, parseDataElement);
+        break;
+      default:
+        scanner.skipValue();
+        break;
+    }
+  }
+
+  if (first === null || second === null) {
+    throw new Mismatch();
+  }
+
+  return new AasTypes.AnnotatedRelationshipElement(
+    first,
+    second,
+    extensions,
+    category,
+    idShort,
+    displayName,
+    description,
+    checksum,
+    kind,
+    semanticId,
+    supplementalSemanticIds,
+    qualifiers,
+    embeddedDataSpecifications,
+    annotations
+  );
+}
+
+/**
+ * Parse an instance of {@link types!Entity}.
+ */
+function parseEntity(scanner: Scanner): AasTypes.Entity {
+  let extensions: Array<AasTypes.Extension> | null = null;
+  let category: string | null = null;
+  let idShort: string | null = null;
+  let displayName: Array<AasTypes.LangString> | null = null;
+  let description: Array<AasTypes.LangString> | null = null;
+  let checksum: string | null = null;
+  let kind: AasTypes.ModelingKind | null = null;
+  let semanticId: AasTypes.Reference | null = null;
+  let supplementalSemanticIds: Array<AasTypes.Reference> | null = null;
+  let qualifiers: Array<AasTypes.Qualifier> | null = null;
+  let embeddedDataSpecifications: Array<AasTypes.EmbeddedDataSpecification> | null =
+    null;
+  let statements: Array<AasTypes.ISubmodelElement> | null = null;
+  let entityType: AasTypes.EntityType | null = null;
+  let globalAssetId: AasTypes.Reference | null = null;
+  let specificAssetId: AasTypes.SpecificAssetId | null = null;
+
+  for (let key = scanner.firstKey(); key !== null; key = scanner.nextKey()) {
+    switch (key) {
+      case "extensions":
+        extensions = readList(scanner, parseExtension);
+        break;
+      case "category":
+        category = scanner.readString();
+        break;
+      case "idShort":
+        idShort = scanner.readString();
+        break;
+      case "displayName":
+        displayName = readList(scanner, parseLangString);
+        break;
+      case "description":
+        description = readList(scanner, parseLangString);
+        break;
+      case "checksum":
+        checksum = scanner.readString();
+        break;
+      case "kind":
+        kind = readLiteral(scanner, AasStringification.modelingKindFromString);
+        break;
+      case "semanticId":
+        semanticId = parseReference(scanner);
+        break;
+      case "supplementalSemanticIds":
+        supplementalSemanticIds = readList(scanner, parseReference);
+        break;
+      case "qualifiers":
+        qualifiers = readList(scanner, parseQualifier);
+        break;
+      case "embeddedDataSpecifications":
+        embeddedDataSpecifications = readList(scanner, parseEmbeddedDataSpecification);
+        break;
+      case "statements":
+        statements = readList(scanner, parseSubmodelElement);
+        break;
+      case "entityType":
+        entityType = readLiteral(scanner, AasStringification.entityTypeFromString);
+        break;
+      case "globalAssetId":
+        globalAssetId = parseReference(scanner);
+        break;
+      case "specificAssetId":
+        specificAssetId = parseSpecificAssetId(scanner);
+        break;
+      default:
+        scanner.skipValue();
+        break;
+    }
+  }
+
+  if (entityType === null) {
+    throw new Mismatch();
+  }
+
+  return new AasTypes.Entity(
+    entityType,
+    extensions,
+    category,
+    idShort,
+    displayName,
+    description,
+    checksum,
+    kind,
+    semanticId,
+    supplementalSemanticIds,
+    qualifiers,
+    embeddedDataSpecifications,
+    statements,
+    globalAssetId,
+    specificAssetId
+  );
+}
+
+/**
+ * Parse an instance of {@link types!EventPayload}.
+ */
+function parseEventPayload(scanner: Scanner): AasTypes.EventPayload {
+  let source: AasTypes.Reference | null = null;
+  let sourceSemanticId: AasTypes.Reference | null = null;
+  let observableReference: AasTypes.Reference | null = null;
+  let observableSemanticId: AasTypes.Reference | null = null;
+  let topic: string | null = null;
+  let subjectId: AasTypes.Reference | null = null;
+  let timeStamp: string | null = null;
+  let payload: string | null = null;
+
+  for (let key = scanner.firstKey(); key !== null; key = scanner.nextKey()) {
+    switch (key) {
+      case "source":
+        source = parseReference(scanner);
+        break;
+      case "sourceSemanticId":
+        sourceSemanticId = parseReference(scanner);
+        break;
+      case "observableReference":
+        observableReference = parseReference(scanner);
+        break;
+      case "observableSemanticId":
+        observableSemanticId = parseReference(scanner);
+        break;
+      case "topic":
+        topic = scanner.readString();
+        break;
+      case "subjectId":
+        subjectId = parseReference(scanner);
+        break;
+      case "timeStamp":
+        timeStamp = scanner.readString();
+        break;
+      case "payload":
+        payload = scanner.readString();
+        break;
+      default:
+        scanner.skipValue();
+        break;
+    }
+  }
+
+  if (source === null || observableReference === null || timeStamp === null) {
+    throw new Mismatch();
+  }
+
+  return new AasTypes.EventPayload(
+    source,
+    observableReference,
+    timeStamp,
+    sourceSemanticId,
+    observableSemanticId,
+    topic,
+    subjectId,
+    payload
+  );
+}
+
+/**
+ * Parse an instance of {@link types!BasicEventElement}.
+ */
+function parseBasicEventElement(scanner: Scanner): AasTypes.BasicEventElement {
+  let extensions: Array<AasTypes.Extension> | null = null;
+  let category: string | null = null;
+  let idShort: string | null = null;
+  let displayName: Array<AasTypes.LangString> | null = null;
+  let description: Array<AasTypes.LangString> | null = null;
+  let checksum: string | null = null;
+  let kind: AasTypes.ModelingKind | null = null;
+  let semanticId: AasTypes.Reference | null = null;
+  let supplementalSemanticIds: Array<AasTypes.Reference> | null = null;
+  let qualifiers: Array<AasTypes.Qualifier> | null = null;
+  let embeddedDataSpecifications: Array<AasTypes.EmbeddedDataSpecification> | null =
+    null;
+  let observed: AasTypes.Reference | null = null;
+  let direction: AasTypes.Direction | null = null;
+  let state: AasTypes.StateOfEvent | null = null;
+  let messageTopic: string | null = null;
+  let messageBroker: AasTypes.Reference | null = null;
+  let lastUpdate: string | null = null;
+  let minInterval: string | null = null;
+  let maxInterval: string | null = null;
+
+  for (let key = scanner.firstKey(); key !== null; key = scanner.nextKey()) {
+    switch (key) {
+      case "extensions":
+        extensions = readList(scanner, parseExtension);
+        break;
+      case "category":
+        category = scanner.readString();
+        break;
+      case "idShort":
+        idShort = scanner.readString();
+        break;
+      case "displayName":
+        displayName = readList(scanner, parseLangString);
+        break;
+      case "description":
+        description = readList(scanner, parseLangString);
+        break;
+      case "checksum":
+        checksum = scanner.readString();
+        break;
+      case "kind":
+        kind = readLiteral(scanner, AasStringification.modelingKindFromString);
+        break;
+      case "semanticId":
+        semanticId = parseReference(scanner);
+        break;
+      case "supplementalSemanticIds":
+        supplementalSemanticIds = readList(scanner, parseReference);
+        break;
+      case "qualifiers":
+        qualifiers = readList(scanner, parseQualifier);
+        break;
+      case "embeddedDataSpecifications":
+        embeddedDataSpecifications = readList(scanner, parseEmbeddedDataSpecification);
+        break;
+      case "observed":
+        observed = parseReference(scanner);
+        break;
+      case "direction":
+        direction = readLiteral(scanner, AasStringification.directionFromString);
+        break;
+      case "state":
+        state = readLiteral(scanner, AasStringification.stateOfEventFromString);
+        break;
+      case "messageTopic":
+        messageTopic = scanner.readString();
+        break;
+      case "messageBroker":
+        messageBroker = parseReference(scanner);
+        break;
+      case "lastUpdate":
+        lastUpdate = scanner.readString();
+        break;
+      case "minInterval":
+        minInterval = scanner.readString();
+        break;
+      case "maxInterval":
+        maxInterval = scanner.readString();
+        break;
+      default:
+        scanner.skipValue();
+        break;
+    }
+  }
+
+  if (observed === null || direction === null || state === null) {
+    throw new Mismatch();
+  }
+
+  return new AasTypes.BasicEventElement(
+    observed,
+    direction,
+    state,
+    extensions,
+    category,
+    idShort,
+    displayName,
+    description,
+    checksum,
+    kind,
+    semanticId,
+    supplementalSemanticIds,
+    qualifiers,
+    embeddedDataSpecifications,
+    messageTopic,
+    messageBroker,
+    lastUpdate,
+    minInterval,
+    maxInterval
+  );
+}
+
+/**
+ * Parse an instance of {@link types!Operation}.
+ */
+function parseOperation(scanner: Scanner): AasTypes.Operation {
+  let extensions: Array<AasTypes.Extension> | null = null;
+  let category: string | null = null;
+  let idShort: string | null = null;
+  let displayName: Array<AasTypes.LangString> | null = null;
+  let description: Array<AasTypes.LangString> | null = null;
+  let checksum: string | null = null;
+  let kind: AasTypes.ModelingKind | null = null;
+  let semanticId: AasTypes.Reference | null = null;
+  let supplementalSemanticIds: Array<AasTypes.Reference> | null = null;
+  let qualifiers: Array<AasTypes.Qualifier> | null = null;
+  let embeddedDataSpecifications: Array<AasTypes.EmbeddedDataSpecification> | null =
+    null;
+  let inputVariables: Array<AasTypes.OperationVariable> | null = null;
+  let outputVariables: Array<AasTypes.OperationVariable> | null = null;
+  let inoutputVariables: Array<AasTypes.OperationVariable> | null = null;
+
+  for (let key = scanner.firstKey(); key !== null; key = scanner.nextKey()) {
+    switch (key) {
+      case "extensions":
+        extensions = readList(scanner, parseExtension);
+        break;
+      case "category":
+        category = scanner.readString();
+        break;
+      case "idShort":
+        idShort = scanner.readString();
+        break;
+      case "displayName":
+        displayName = readList(scanner, parseLangString);
+        break;
+      case "description":
+        description = readList(scanner, parseLangString);
+        break;
+      case "checksum":
+        checksum = scanner.readString();
+        break;
+      case "kind":
+        kind = readLiteral(scanner, AasStringification.modelingKindFromString);
+        break;
+      case "semanticId":
+        semanticId = parseReference(scanner);
+        break;
+      case "supplementalSemanticIds":
+        supplementalSemanticIds = readList(scanner, parseReference);
+        break;
+      case "qualifiers":
+        qualifiers = readList(scanner, parseQualifier);
+        break;
+      case "embeddedDataSpecifications":
+        embeddedDataSpecifications = readList(scanner, parseEmbeddedDataSpecification);
+        break;
+      case "inputVariables":
+        inputVariables = readList(scanner, parseOperationVariable);
+        break;
+      case "outputVariables":
+        outputVariables = readList(scanner, parseOperationVariable);
+        break;
+      case "inoutputVariables":
+        inoutputVariables = readList(scanner, parseOperationVariable);
+        break;
+      default:
+        scanner.skipValue();
+        break;
+    }
+  }
+
+  return new AasTypes.Operation(
+    extensions,
+    category,
+    idShort,
+    displayName,
+    description,
+    checksum,
+    kind,
+    semanticId,
+    supplementalSemanticIds,
+    qualifiers,
+    embeddedDataSpecifications,
+    inputVariables,
+    outputVariables,
+    inoutputVariables
+  );
+}
+
+/**
+ * Parse an instance of {@link types!OperationVariable}.
+ */
+function parseOperationVariable(scanner: Scanner): AasTypes.OperationVariable {
+  let value: AasTypes.ISubmodelElement | null = null;
+
+  for (let key = scanner.firstKey(); key !== null; key = scanner.nextKey()) {
+    switch (key) {
+      case "value":
+        value = parseSubmodelElement(scanner);
+        break;
+      default:
+        scanner.skipValue();
+        break;
+    }
+  }
+
+  if (value === null) {
+    throw new Mismatch();
+  }
+
+  return new AasTypes.OperationVariable(value);
+}
+
+/**
+ * Parse an instance of {@link types!Capability}.
+ */
+function parseCapability(scanner: Scanner): AasTypes.Capability {
+  let extensions: Array<AasTypes.Extension> | null = null;
+  let category: string | null = null;
+  let idShort: string | null = null;
+  let displayName: Array<AasTypes.LangString> | null = null;
+  let description: Array<AasTypes.LangString> | null = null;
+  let checksum: string | null = null;
+  let kind: AasTypes.ModelingKind | null = null;
+  let semanticId: AasTypes.Reference | null = null;
+  let supplementalSemanticIds: Array<AasTypes.Reference> | null = null;
+  let qualifiers: Array<AasTypes.Qualifier> | null = null;
+  let embeddedDataSpecifications: Array<AasTypes.EmbeddedDataSpecification> | null =
+    null;
+
+  for (let key = scanner.firstKey(); key !== null; key = scanner.nextKey()) {
+    switch (key) {
+      case "extensions":
+        extensions = readList(scanner, parseExtension);
+        break;
+      case "category":
+        category = scanner.readString();
+        break;
+      case "idShort":
+        idShort = scanner.readString();
+        break;
+      case "displayName":
+        displayName = readList(scanner, parseLangString);
+        break;
+      case "description":
+        description = readList(scanner, parseLangString);
+        break;
+      case "checksum":
+        checksum = scanner.readString();
+        break;
+      case "kind":
+        kind = readLiteral(scanner, AasStringification.modelingKindFromString);
+        break;
+      case "semanticId":
+        semanticId = parseReference(scanner);
+        break;
+      case "supplementalSemanticIds":
+        supplementalSemanticIds = readList(scanner, parseReference);
+        break;
+      case "qualifiers":
+        qualifiers = readList(scanner, parseQualifier);
+        break;
+      case "embeddedDataSpecifications":
+        embeddedDataSpecifications = readList(scanner, parseEmbeddedDataSpecification);
+        break;
+      default:
+        scanner.skipValue();
+        break;
+    }
+  }
+
+  return new AasTypes.Capability(
+    extensions,
+    category,
+    idShort,
+    displayName,
+    description,
+    checksum,
+    kind,
+    semanticId,
+    supplementalSemanticIds,
+    qualifiers,
+    embeddedDataSpecifications
+  );
+}
+
+/**
+ * Parse an instance of {@link types!ConceptDescription}.
+ */
+function parseConceptDescription(scanner: Scanner): AasTypes.ConceptDescription {
+  let extensions: Array<AasTypes.Extension> | null = null;
+  let category: string | null = null;
+  let idShort: string | null = null;
+  let displayName: Array<AasTypes.LangString> | null = null;
+  let description: Array<AasTypes.LangString> | null = null;
+  let checksum: string | null = null;
+  let administration: AasTypes.AdministrativeInformation | null = null;
+  let id: string | null = null;
+  let embeddedDataSpecifications: Array<AasTypes.EmbeddedDataSpecification> | null =
+    null;
+  let isCaseOf: Array<AasTypes.Reference> | null = null;
+
+  for (let key = scanner.firstKey(); key !== null; key = scanner.nextKey()) {
+    switch (key) {
+      case "extensions":
+        extensions = readList(scanner, parseExtension);
+        break;
+      case "category":
+        category = scanner.readString();
+        break;
+      case "idShort":
+        idShort = scanner.readString();
+        break;
+      case "displayName":
+        displayName = readList(scanner, parseLangString);
+        break;
+      case "description":
+        description = readList(scanner, parseLangString);
+        break;
+      case "checksum":
+        checksum = scanner.readString();
+        break;
+      case "administration":
+        administration = parseAdministrativeInformation(scanner);
+        break;
+      case "id":
+        id = scanner.readString();
+        break;
+      case "embeddedDataSpecifications":
+        embeddedDataSpecifications = readList(scanner, parseEmbeddedDataSpecification);
+        break;
+      case "isCaseOf":
+        isCaseOf = readList(scanner, parseReference);
+        break;
+      default:
+        scanner.skipValue();
+        break;
+    }
+  }
+
+  if (id === null) {
+    throw new Mismatch();
+  }
+
+  return new AasTypes.ConceptDescription(
+    id,
+    extensions,
+    category,
+    idShort,
+    displayName,
+    description,
+    checksum,
+    administration,
+    embeddedDataSpecifications,
+    isCaseOf
+  );
+}
+
+/**
+ * Parse an instance of {@link types!Reference}.
+ */
+function parseReference(scanner: Scanner): AasTypes.Reference {
+  let type: AasTypes.ReferenceTypes | null = null;
+  let referredSemanticId: AasTypes.Reference | null = null;
+  let keys: Array<AasTypes.Key> | null = null;
+
+  for (let key = scanner.firstKey(); key !== null; key = scanner.nextKey()) {
+    switch (key) {
+      case "type":
+        type = readLiteral(scanner, AasStringification.referenceTypesFromString);
+        break;
+      case "referredSemanticId":
+        referredSemanticId = parseReference(scanner);
+        break;
+      case "keys":
+        keys = readList(scanner, parseKey);
+        break;
+      default:
+        scanner.skipValue();
+        break;
+    }
+  }
+
+  if (type === null || keys === null) {
+    throw new Mismatch();
+  }
+
+  return new AasTypes.Reference(type, keys, referredSemanticId);
+}
+
+/**
+ * Parse an instance of {@link types!Key}.
+ */
+function parseKey(scanner: Scanner): AasTypes.Key {
+  let type: AasTypes.KeyTypes | null = null;
+  let value: string | null = null;
+
+  for (let key = scanner.firstKey(); key !== null; key = scanner.nextKey()) {
+    switch (key) {
+      case "type":
+        type = readLiteral(scanner, AasStringification.keyTypesFromString);
+        break;
+      case "value":
+        value = scanner.readString();
+        break;
+      default:
+        scanner.skipValue();
+        break;
+    }
+  }
+
+  if (type === null || value === null) {
+    throw new Mismatch();
+  }
+
+  return new AasTypes.Key(type, value);
+}
+
+/**
+ * Parse an instance of {@link types!LangString}.
+ */
+function parseLangString(scanner: Scanner): AasTypes.LangString {
+  let language: string | null = null;
+  let text: string | null = null;
+
+  for (let key = scanner.firstKey(); key !== null; key = scanner.nextKey()) {
+    switch (key) {
+      case "language":
+        language = scanner.readString();
+        break;
+      case "text":
+        text = scanner.readString();
+        break;
+      default:
+        scanner.skipValue();
+        break;
+    }
+  }
+
+  if (language === null || text === null) {
+    throw new Mismatch();
+  }
+
+  return new AasTypes.LangString(language, text);
+}
+
+/**
+ * Parse an instance of {@link types!Environment}.
+ */
+function parseEnvironment(scanner: Scanner): AasTypes.Environment {
+  let assetAdministrationShells: Array<AasTypes.AssetAdministrationShell> | null = null;
+  let submodels: Array<AasTypes.Submodel> | null = null;
+  let conceptDescriptions: Array<AasTypes.ConceptDescription> | null = null;
+
+  for (let key = scanner.firstKey(); key !== null; key = scanner.nextKey()) {
+    switch (key) {
+      case "assetAdministrationShells":
+        assetAdministrationShells = readList(scanner, parseAssetAdministrationShell);
+        break;
+      case "submodels":
+        submodels = readList(scanner, parseSubmodel);
+        break;
+      case "conceptDescriptions":
+        conceptDescriptions = readList(scanner, parseConceptDescription);
+        break;
+      default:
+        scanner.skipValue();
+        break;
+    }
+  }
+
+  return new AasTypes.Environment(
+    assetAdministrationShells,
+    submodels,
+    conceptDescriptions
+  );
+}
+
+/**
+ * Parse an instance of {@link types!EmbeddedDataSpecification}.
+ */
+function parseEmbeddedDataSpecification(
+  scanner: Scanner
+): AasTypes.EmbeddedDataSpecification {
+  let dataSpecification: AasTypes.Reference | null = null;
+  let dataSpecificationContent: AasTypes.IDataSpecificationContent | null = null;
+
+  for (let key = scanner.firstKey(); key !== null; key = scanner.nextKey()) {
+    switch (key) {
+      case "dataSpecification":
+        dataSpecification = parseReference(scanner);
+        break;
+      case "dataSpecificationContent":
+        dataSpecificationContent = parseDataSpecificationContent(scanner);
+        break;
+      default:
+        scanner.skipValue();
+        break;
+    }
+  }
+
+  if (dataSpecification === null || dataSpecificationContent === null) {
+    throw new Mismatch();
+  }
+
+  return new AasTypes.EmbeddedDataSpecification(
+    dataSpecification,
+    dataSpecificationContent
+  );
+}
+
+/**
+ * Parse an instance of {@link types!ValueReferencePair}.
+ */
+function parseValueReferencePair(scanner: Scanner): AasTypes.ValueReferencePair {
+  let value: string | null = null;
+  let valueId: AasTypes.Reference | null = null;
+
+  for (let key = scanner.firstKey(); key !== null; key = scanner.nextKey()) {
+    switch (key) {
+      case "value":
+        value = scanner.readString();
+        break;
+      case "valueId":
+        valueId = parseReference(scanner);
+        break;
+      default:
+        scanner.skipValue();
+        break;
+    }
+  }
+
+  if (value === null || valueId === null) {
+    throw new Mismatch();
+  }
+
+  return new AasTypes.ValueReferencePair(value, valueId);
+}
+
+/**
+ * Parse an instance of {@link types!ValueList}.
+ */
+function parseValueList(scanner: Scanner): AasTypes.ValueList {
+  let valueReferencePairs: Array<AasTypes.ValueReferencePair> | null = null;
+
+  for (let key = scanner.firstKey(); key !== null; key = scanner.nextKey()) {
+    switch (key) {
+      case "valueReferencePairs":
+        valueReferencePairs = readList(scanner, parseValueReferencePair);
+        break;
+      default:
+        scanner.skipValue();
+        break;
+    }
+  }
+
+  if (valueReferencePairs === null) {
+    throw new Mismatch();
+  }
+
+  return new AasTypes.ValueList(valueReferencePairs);
+}
+
+/**
+ * Parse an instance of {@link types!DataSpecificationIec61360}.
+ */
+function parseDataSpecificationIec61360(
+  scanner: Scanner
+): AasTypes.DataSpecificationIec61360 {
+  let preferredName: Array<AasTypes.LangString> | null = null;
+  let shortName: Array<AasTypes.LangString> | null = null;
+  let unit: string | null = null;
+  let unitId: AasTypes.Reference | null = null;
+  let sourceOfDefinition: string | null = null;
+  let symbol: string | null = null;
+  let dataType: AasTypes.DataTypeIec61360 | null = null;
+  let definition: Array<AasTypes.LangString> | null = null;
+  let valueFormat: string | null = null;
+  let valueList: AasTypes.ValueList | null = null;
+  let value: string | null = null;
+  let levelType: AasTypes.LevelType | null = null;
+
+  for (let key = scanner.firstKey(); key !== null; key = scanner.nextKey()) {
+    switch (key) {
+      case "preferredName":
+        preferredName = readList(scanner, parseLangString);
+        break;
+      case "shortName":
+        shortName = readList(scanner, parseLangString);
+        break;
+      case "unit":
+        unit = scanner.readString();
+        break;
+      case "unitId":
+        unitId = parseReference(scanner);
+        break;
+      case "sourceOfDefinition":
+        sourceOfDefinition = scanner.readString();
+        break;
+      case "symbol":
+        symbol = scanner.readString();
+        break;
+      case "dataType":
+        dataType = readLiteral(scanner, AasStringification.dataTypeIec61360FromString);
+        break;
+      case "definition":
+        definition = readList(scanner, parseLangString);
+        break;
+      case "valueFormat":
+        valueFormat = scanner.readString();
+        break;
+      case "valueList":
+        valueList = parseValueList(scanner);
+        break;
+      case "value":
+        value = scanner.readString();
+        break;
+      case "levelType":
+        levelType = readLiteral(scanner, AasStringification.levelTypeFromString);
+        break;
+      default:
+        scanner.skipValue();
+        break;
+    }
+  }
+
+  if (preferredName === null) {
+    throw new Mismatch();
+  }
+
+  return new AasTypes.DataSpecificationIec61360(
+    preferredName,
+    shortName,
+    unit,
+    unitId,
+    sourceOfDefinition,
+    symbol,
+    dataType,
+    definition,
+    valueFormat,
+    valueList,
+    value,
+    levelType
+  );
+}
+
+/**
+ * Parse an instance of {@link types!DataSpecificationPhysicalUnit}.
+ */
+function parseDataSpecificationPhysicalUnit(
+  scanner: Scanner
+): AasTypes.DataSpecificationPhysicalUnit {
+  let unitName: string | null = null;
+  let unitSymbol: string | null = null;
+  let definition: Array<AasTypes.LangString> | null = null;
+  let siNotation: string | null = null;
+  let siName: string | null = null;
+  let dinNotation: string | null = null;
+  let eceName: string | null = null;
+  let eceCode: string | null = null;
+  let nistName: string | null = null;
+  let sourceOfDefinition: string | null = null;
+  let conversionFactor: string | null = null;
+  let registrationAuthorityId: string | null = null;
+  let supplier: string | null = null;
+
+  for (let key = scanner.firstKey(); key !== null; key = scanner.nextKey()) {
+    switch (key) {
+      case "unitName":
+        unitName = scanner.readString();
+        break;
+      case "unitSymbol":
+        unitSymbol = scanner.readString();
+        break;
+      case "definition":
+        definition = readList(scanner, parseLangString);
+        break;
+      case "siNotation":
+        siNotation = scanner.readString();
+        break;
+      case "siName":
+        siName = scanner.readString();
+        break;
+      case "dinNotation":
+        dinNotation = scanner.readString();
+        break;
+      case "eceName":
+        eceName = scanner.readString();
+        break;
+      case "eceCode":
+        eceCode = scanner.readString();
+        break;
+      case "nistName":
+        nistName = scanner.readString();
+        break;
+      case "sourceOfDefinition":
+        sourceOfDefinition = scanner.readString();
+        break;
+      case "conversionFactor":
+        conversionFactor = scanner.readString();
+        break;
+      case "registrationAuthorityId":
+        registrationAuthorityId = scanner.readString();
+        break;
+      case "supplier":
+        supplier = scanner.readString();
+        break;
+      default:
+        scanner.skipValue();
+        break;
+    }
+  }
+
+  if (unitName === null || unitSymbol === null || definition === null) {
+    throw new Mismatch();
+  }
+
+  return new AasTypes.DataSpecificationPhysicalUnit(
+    unitName,
+    unitSymbol,
+    definition,
+    siNotation,
+    siName,
+    dinNotation,
+    eceName,
+    eceCode,
+    nistName,
+    sourceOfDefinition,
+    conversionFactor,
+    registrationAuthorityId,
+    supplier
+  );
+}
+
+/**
+ * Parse `text` on the fast path, or fall back to `JSON.parse` and
+ * {@link jsonization} to report the error.
+ *
+ * @param text - JSON text to be parsed
+ * @param parseInstance - to parse the instance on the fast path
+ * @param fromJsonable - to de-serialize the instance if the fast path fails
+ * @returns parsed instance, or an error if `text` is invalid
+ * @typeParam T - type of the instance
+ */
+function parse<T>(
+  text: string,
+  parseInstance: (scanner: Scanner) => T,
+  fromJsonable: (
+    jsonable: AasJsonization.JsonValue
+  ) => AasCommon.Either<T, AasJsonization.DeserializationError>
+): AasCommon.Either<T, AasJsonization.DeserializationError> {
+  try {
+    const scanner = new Scanner(text);
+    const instance = parseInstance(scanner);
+    scanner.expectEnd();
+    return new AasCommon.Either<T, AasJsonization.DeserializationError>(
+      instance,
+      null
+    );
+  } catch (error) {
+    if (!(error instanceof Mismatch)) {
+      throw error;
+    }
+  }
+
+  let jsonable: AasJsonization.JsonValue;
+  try {
+    jsonable = JSON.parse(text);
+  } catch (error) {
+    return new AasCommon.Either<T, AasJsonization.DeserializationError>(
+      null,
+      new AasJsonization.DeserializationError(
+        `Expected a valid JSON, but got a syntax error: ${error.message}`
+      )
+    );
+  }
+
+  return fromJsonable(jsonable);
+}
+
+/**
+ * Parse an instance of {@link types!Environment} from the JSON `text`.
+ *
+ * @remarks
+ * This is equivalent to `JSON.parse` followed by
+ * {@link jsonization!environmentFromJsonable}, but without
+ * the intermediate JSON objects.
+ *
+ * @param text - JSON text to be parsed
+ * @returns parsed instance, or an error if `text` is invalid
+ */
+export function environmentFromText(
+  text: string
+): AasCommon.Either<AasTypes.Environment, AasJsonization.DeserializationError> {
+  return parse(text, parseEnvironment, AasJsonization.environmentFromJsonable);
+}
+
+/**
+ * Parse an instance of {@link types!AssetAdministrationShell} from the JSON `text`.
+ *
+ * @remarks
+ * This is equivalent to `JSON.parse` followed by
+ * {@link jsonization!assetAdministrationShellFromJsonable}, but without
+ * the intermediate JSON objects.
+ *
+ * @param text - JSON text to be parsed
+ * @returns parsed instance, or an error if `text` is invalid
+ */
+export function assetAdministrationShellFromText(
+  text: string
+): AasCommon.Either<
+  AasTypes.AssetAdministrationShell,
+  AasJsonization.DeserializationError
+> {
+  return parse(
+    text,
+    parseAssetAdministrationShell,
+    AasJsonization.assetAdministrationShellFromJsonable
+  );
+}
+
+/**
+ * Parse an instance of {@link types!Submodel} from the JSON `text`.
+ *
+ * @remarks
+ * This is equivalent to `JSON.parse` followed by
+ * {@link jsonization!submodelFromJsonable}, but without
+ * the intermediate JSON objects.
+ *
+ * @param text - JSON text to be parsed
+ * @returns parsed instance, or an error if `text` is invalid
+ */
+export function submodelFromText(
+  text: string
+): AasCommon.Either<AasTypes.Submodel, AasJsonization.DeserializationError> {
+  return parse(text, parseSubmodel, AasJsonization.submodelFromJsonable);
+}
+
+/**
+ * Parse an instance of {@link types!ConceptDescription} from the JSON `text`.
+ *
+ * @remarks
+ * This is equivalent to `JSON.parse` followed by
+ * {@link jsonization!conceptDescriptionFromJsonable}, but without
+ * the intermediate JSON objects.
+ *
+ * @param text - JSON text to be parsed
+ * @returns parsed instance, or an error if `text` is invalid
+ */
+export function conceptDescriptionFromText(
+  text: string
+): AasCommon.Either<AasTypes.ConceptDescription, AasJsonization.DeserializationError> {
+  return parse(
+    text,
+    parseConceptDescription,
+    AasJsonization.conceptDescriptionFromJsonable
+  );
+}
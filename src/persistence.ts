@@ -0,0 +1,353 @@
+/**
+ * Remember the verification results of the identifiables across the runs.
+ *
+ * @remarks
+ * The same submodels are often verified over and over again, *e.g.*, in CI or
+ * when the same files are ingested repeatedly. {@link verify} keys
+ * the verification result of each top-level identifiable of an environment by
+ * the SHA-256 digest of its canonical JSON serialization together with
+ * the version of the SDK. If an identifiable is found in the {@link ResultStore},
+ * its errors are replayed instead of verifying it again.
+ *
+ * The store is pluggable. We provide {@link MemoryResultStore} and
+ * {@link AppendOnlyResultStore}. The latter keeps the results in an append-only
+ * text file. We do not access the file system ourselves so that the SDK stays
+ * independent of Node. You pass in the reading and the appending of the file
+ * instead, see {@link AppendOnlyFile}.
+ */
+
+import * as AasCanonicalization from "./canonicalization";
+import * as AasCommon from "./common";
+import * as AasTypes from "./types";
+import * as AasVerification from "./verification";
+
+/**
+ * Version of the SDK, part of the keys so that the results of an older version
+ * are never replayed
+ *
+ * @remarks
+ * Keep this in sync with `package.json`.
+ */
+export const SDK_VERSION = "1.0.0-rc.6";
+
+/**
+ * Represent a verification error in a store.
+ */
+export interface StoredError {
+  /**
+   * Human-readable description of the error
+   */
+  readonly message: string;
+
+  /**
+   * Path to the erroneous value relative to the identifiable, as names of
+   * the properties and indices of the items
+   */
+  readonly path: Array<string | number>;
+}
+
+/**
+ * Store the verification results by their keys.
+ */
+export interface ResultStore {
+  /**
+   * Get the errors stored under `key`.
+   *
+   * @returns the errors, empty if the identifiable is valid, or `undefined`
+   * if nothing has been stored under `key`
+   */
+  get(key: string): Array<StoredError> | undefined;
+
+  /**
+   * Store the `errors` under `key`, replacing any earlier ones.
+   */
+  set(key: string, errors: Array<StoredError>): void;
+}
+
+/**
+ * Keep the verification results in memory.
+ */
+export class MemoryResultStore implements ResultStore {
+  private readonly results = new Map<string, Array<StoredError>>();
+
+  /**
+   * Number of the stored results
+   */
+  get size(): number {
+    return this.results.size;
+  }
+
+  get(key: string): Array<StoredError> | undefined {
+    return this.results.get(key);
+  }
+
+  set(key: string, errors: Array<StoredError>): void {
+    this.results.set(key, errors);
+  }
+}
+
+/**
+ * Read and append to a text file.
+ *
+ * @remarks
+ * For example, on Node:
+ *
+ * ```ts
+ * const file: AppendOnlyFile = {
+ *   read: () => (fs.existsSync(path) ? fs.readFileSync(path, "utf-8") : null),
+ *   append: (text) => fs.appendFileSync(path, text)
+ * };
+ * ```
+ */
+export interface AppendOnlyFile {
+  /**
+   * Read the whole file.
+   *
+   * @returns the content, or null if the file does not exist yet
+   */
+  read(): string | null;
+
+  /**
+   * Append `text` at the end of the file, creating the file if needed.
+   */
+  append(text: string): void;
+}
+
+/**
+ * Keep the verification results in an append-only file, one JSON object per
+ * line.
+ *
+ * @remarks
+ * The file is read once on construction. Each new result is appended as
+ * a line of its own. If the same key appears multiple times, the last line wins.
+ * The lines which can not be parsed, *e.g.*, a line truncated by a crash, are
+ * skipped.
+ */
+export class AppendOnlyResultStore implements ResultStore {
+  private readonly memory = new MemoryResultStore();
+  private readonly file: AppendOnlyFile;
+
+  /**
+   * Load the results from the `file`.
+   *
+   * @param file - to read the results from and append the new ones to
+   */
+  constructor(file: AppendOnlyFile) {
+    this.file = file;
+
+    const content = file.read();
+    if (content === null) {
+      return;
+    }
+
+    for (const line of content.split("\n")) {
+      if (line.length === 0) {
+        continue;
+      }
+
+      let jsonable: unknown;
+      try {
+        jsonable = JSON.parse(line);
+      } catch (error) {
+        continue;
+      }
+
+      const entry = storedEntryFromJsonable(jsonable);
+      if (entry !== null) {
+        this.memory.set(entry[0], entry[1]);
+      }
+    }
+  }
+
+  /**
+   * Number of the stored results
+   */
+  get size(): number {
+    return this.memory.size;
+  }
+
+  get(key: string): Array<StoredError> | undefined {
+    return this.memory.get(key);
+  }
+
+  set(key: string, errors: Array<StoredError>): void {
+    this.memory.set(key, errors);
+
+    // We start each line with a new line so that a line truncated by a crash
+    // does not swallow the next one.
+    this.file.append("\n" + JSON.stringify({ key, errors }));
+  }
+}
+
+/**
+ * Parse `jsonable` as a line of {@link AppendOnlyResultStore}.
+ *
+ * @returns the key and the errors, or null if `jsonable` is invalid
+ */
+function storedEntryFromJsonable(
+  jsonable: unknown
+): [string, Array<StoredError>] | null {
+  if (jsonable === null || typeof jsonable !== "object" || Array.isArray(jsonable)) {
+    return null;
+  }
+
+  const entry = <Record<string, unknown>>jsonable;
+  const key = entry["key"];
+  const errors = entry["errors"];
+  if (typeof key !== "string" || !Array.isArray(errors)) {
+    return null;
+  }
+
+  for (const error of errors) {
+    if (
+      error === null ||
+      typeof error !== "object" ||
+      typeof error["message"] !== "string" ||
+      !Array.isArray(error["path"]) ||
+      !error["path"].every(
+        (segment: unknown) => typeof segment === "string" || typeof segment === "number"
+      )
+    ) {
+      return null;
+    }
+  }
+
+  return [key, <Array<StoredError>>errors];
+}
+
+/**
+ * Compute the key of `that` identifiable in a {@link ResultStore}.
+ *
+ * @param that - identifiable to be keyed
+ * @returns hexadecimal SHA-256 digest of the SDK version and the canonical JSON
+ * of `that`
+ */
+export function keyOf(that: AasTypes.IIdentifiable): string {
+  const prefix = AasCommon.utf8Encode(SDK_VERSION + "\n");
+  const json = AasCanonicalization.toCanonicalJson(that);
+
+  const bytes = new Uint8Array(prefix.length + json.length);
+  bytes.set(prefix);
+  bytes.set(json, prefix.length);
+
+  return AasCommon.hexEncode(AasCommon.sha256(bytes));
+}
+
+/**
+ * Convert `that` error to be stored.
+ */
+function toStoredError(that: AasVerification.VerificationError): StoredError {
+  return {
+    message: that.message,
+    path: that.path.segments.map((segment) =>
+      segment instanceof AasVerification.PropertySegment ? segment.name : segment.index
+    )
+  };
+}
+
+/**
+ * Convert `that` stored error back, resolving its path against `identifiable`.
+ *
+ * @returns the error, or null if the path can not be resolved
+ */
+function fromStoredError(
+  that: StoredError,
+  identifiable: AasTypes.IIdentifiable
+): AasVerification.VerificationError | null {
+  const path = new AasVerification.Path();
+
+  let value: unknown = identifiable;
+  for (const segment of that.path) {
+    if (typeof segment === "string") {
+      if (!(value instanceof AasTypes.Class)) {
+        return null;
+      }
+      path.segments.push(new AasVerification.PropertySegment(value, segment));
+      value = (<Record<string, unknown>>(<unknown>value))[segment];
+    } else {
+      if (!Array.isArray(value) || segment < 0 || segment >= value.length) {
+        return null;
+      }
+      path.segments.push(new AasVerification.IndexSegment(value, segment));
+      value = value[segment];
+    }
+  }
+
+  return new AasVerification.VerificationError(that.message, path);
+}
+
+/**
+ * Verify `that` identifiable, or replay its errors from the `store`.
+ *
+ * @returns errors relative to `that`
+ */
+function verifyIdentifiable(
+  that: AasTypes.IIdentifiable,
+  store: ResultStore,
+  cache: AasVerification.VerificationCache | null
+): Array<AasVerification.VerificationError> {
+  const key = keyOf(that);
+
+  const stored = store.get(key);
+  if (stored !== undefined) {
+    const errors = new Array<AasVerification.VerificationError>();
+    for (const storedError of stored) {
+      const error = fromStoredError(storedError, that);
+      if (error === null) {
+        break;
+      }
+      errors.push(error);
+    }
+
+    if (errors.length === stored.length) {
+      return errors;
+    }
+  }
+
+  const errors = Array.from(AasVerification.verify(that, true, cache));
+  store.set(key, errors.map(toStoredError));
+  return errors;
+}
+
+/**
+ * Verify the constraints of `that` environment recursively, and skip
+ * the identifiables whose results are in the `store`.
+ *
+ * @remarks
+ * The errors and their order are exactly the same as in
+ * {@link verification!verify}. The results of the newly verified identifiables
+ * are added to the `store`.
+ *
+ * @param that - environment to be verified
+ * @param store - of the verification results
+ * @param cache - if set, memoize the expensive checks of values in it
+ * @returns a stream of verification errors
+ */
+export function* verify(
+  that: AasTypes.Environment,
+  store: ResultStore,
+  cache: AasVerification.VerificationCache | null = null
+): IterableIterator<AasVerification.VerificationError> {
+  yield* AasVerification.verify(that, false, cache);
+
+  // The order of the lists follows the recursion in verification.verify().
+  const lists: Array<[string, Array<AasTypes.IIdentifiable> | null]> = [
+    ["assetAdministrationShells", that.assetAdministrationShells],
+    ["submodels", that.submodels],
+    ["conceptDescriptions", that.conceptDescriptions]
+  ];
+
+  for (const [name, items] of lists) {
+    if (items === null) {
+      continue;
+    }
+
+    for (let i = 0; i < items.length; i++) {
+      for (const error of verifyIdentifiable(items[i], store, cache)) {
+        error.path.prepend(new AasVerification.IndexSegment(items, i));
+        error.path.prepend(new AasVerification.PropertySegment(that, name));
+        yield error;
+      }
+    }
+  }
+}
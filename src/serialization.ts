@@ -0,0 +1,2792 @@
+/**
+ * Serialize AAS instances to JSON with options, and to the ValueOnly and
+ * Metadata representations.
+ *
+ * @remarks
+ * {@link toJsonable} gives the same result as its counterpart in the module
+ * `jsonization` when no options are given. In addition, it accepts
+ * {@link SerializationOptions} to limit the depth of the nested submodel
+ * elements and to leave out the blob values during the serialization itself,
+ * instead of pruning the full JSON afterwards.
+ *
+ * The module `jsonization` is generated from the meta-model, so we write this
+ * module by hand on top of it and re-use its types.
+ */
+
+import * as AasCommon from "./common";
+import * as AasDeserialization from "./deserialization";
+import * as AasJsonization from "./jsonization";
+import * as AasStringification from "./stringification";
+import * as AasTypes from "./types";
+
+/**
+ * Control how the JSON serialization is performed.
+ *
+ * @remarks
+ * All the options are optional. If an option is not specified, the
+ * serialization behaves as if no options were given at all.
+ *
+ * The options correspond to the query parameters `level` and `extent` of
+ * the AAS HTTP API.
+ */
+export interface SerializationOptions {
+  /**
+   * Number of levels of the nested submodel elements to be serialized below
+   * the serialized instance.
+   *
+   * @remarks
+   * The nested submodel elements are the ones in
+   * {@link types!Submodel.submodelElements},
+   * {@link types!SubmodelElementList.value},
+   * {@link types!SubmodelElementCollection.value},
+   * {@link types!AnnotatedRelationshipElement.annotations},
+   * {@link types!Entity.statements}, as well as the values of
+   * {@link types!Operation.inputVariables}, {@link types!Operation.outputVariables}
+   * and {@link types!Operation.inoutputVariables}. The properties below the given
+   * depth are omitted, *i.e.*, neither serialized nor even visited.
+   *
+   * Depth 1 corresponds to `level=core`. If not set, all the levels are
+   * serialized, which corresponds to `level=deep`.
+   */
+  readonly depth?: number;
+
+  /**
+   * If set, {@link types!Blob.value} is omitted, which corresponds to
+   * `extent=withoutBlobValue`.
+   */
+  readonly withoutBlobValue?: boolean;
+}
+
+/**
+ * Determine the maximum depth of the nested submodel elements.
+ *
+ * @param options - of the serialization
+ * @returns the maximum depth, or `null` if unlimited
+ * @throws an {@link Error} if the depth is not a non-negative integer
+ */
+function maxDepthFrom(options: SerializationOptions | null): number | null {
+  const depth = options !== null ? options.depth : undefined;
+  if (depth === undefined) {
+    return null;
+  }
+
+  if (!(Number.isInteger(depth) && depth >= 0)) {
+    throw new Error(`Expected a non-negative integer as depth, but got: ${depth}`);
+  }
+  return depth;
+}
+
+/**
+ * Transform the instance to its JSON-able representation.
+ */
+class Serializer extends AasTypes.AbstractTransformer<AasJsonization.JsonObject> {
+  /**
+   * Levels of the nested submodel elements to be serialized, or `null` if
+   * all the levels are to be serialized
+   */
+  private readonly maxDepth: number | null;
+
+  /**
+   * If set, {@link types!Blob.value} is omitted
+   */
+  private readonly withoutBlobValue: boolean;
+
+  /**
+   * Level of the nested submodel elements being currently serialized
+   */
+  private depth = 0;
+
+  constructor(options: SerializationOptions | null = null) {
+    super();
+    this.maxDepth = maxDepthFrom(options);
+    this.withoutBlobValue = options !== null && options.withoutBlobValue === true;
+  }
+
+  /**
+   * Check whether the nested submodel elements at the current level are to be
+   * serialized.
+   */
+  private includesNestedElements(): boolean {
+    return this.maxDepth === null || this.depth < this.maxDepth;
+  }
+
+  /**
+   * Serialize `that` to a JSON-able representation.
+   *
+   * @param that - instance to be serialization
+   * @returns JSON-able representation
+   */
+  transformExtension(that: AasTypes.Extension): AasJsonization.JsonObject {
+    const jsonable: AasJsonization.JsonObject = {};
+
+    if (that.semanticId !== null) {
+      jsonable["semanticId"] = this.transform(that.semanticId);
+    }
+
+    if (that.supplementalSemanticIds !== null) {
+      const supplementalSemanticIdsArray = new Array<AasJsonization.JsonObject>();
+      for (const item of that.supplementalSemanticIds) {
+        supplementalSemanticIdsArray.push(this.transform(item));
+      }
+      jsonable["supplementalSemanticIds"] = supplementalSemanticIdsArray;
+    }
+
+    jsonable["name"] = that.name;
+
+    if (that.valueType !== null) {
+      jsonable["valueType"] = AasStringification.mustDataTypeDefXsdToString(
+        that.valueType
+      );
+    }
+
+    if (that.value !== null) {
+      jsonable["value"] = that.value;
+    }
+
+    if (that.refersTo !== null) {
+      jsonable["refersTo"] = this.transform(that.refersTo);
+    }
+
+    return jsonable;
+  }
+
+  /**
+   * Serialize `that` to a JSON-able representation.
+   *
+   * @param that - instance to be serialization
+   * @returns JSON-able representation
+   */
+  transformAdministrativeInformation(
+    that: AasTypes.AdministrativeInformation
+  ): AasJsonization.JsonObject {
+    const jsonable: AasJsonization.JsonObject = {};
+
+    if (that.embeddedDataSpecifications !== null) {
+      const embeddedDataSpecificationsArray = new Array<AasJsonization.JsonObject>();
+      for (const item of that.embeddedDataSpecifications) {
+        embeddedDataSpecificationsArray.push(this.transform(item));
+      }
+      jsonable["embeddedDataSpecifications"] = embeddedDataSpecificationsArray;
+    }
+
+    if (that.version !== null) {
+      jsonable["version"] = that.version;
+    }
+
+    if (that.revision !== null) {
+      jsonable["revision"] = that.revision;
+    }
+
+    return jsonable;
+  }
+
+  /**
+   * Serialize `that` to a JSON-able representation.
+   *
+   * @param that - instance to be serialization
+   * @returns JSON-able representation
+   */
+  transformQualifier(that: AasTypes.Qualifier): AasJsonization.JsonObject {
+    const jsonable: AasJsonization.JsonObject = {};
+
+    if (that.semanticId !== null) {
+      jsonable["semanticId"] = this.transform(that.semanticId);
+    }
+
+    if (that.supplementalSemanticIds !== null) {
+      const supplementalSemanticIdsArray = new Array<AasJsonization.JsonObject>();
+      for (const item of that.supplementalSemanticIds) {
+        supplementalSemanticIdsArray.push(this.transform(item));
+      }
+      jsonable["supplementalSemanticIds"] = supplementalSemanticIdsArray;
+    }
+
+    if (that.kind !== null) {
+      jsonable["kind"] = AasStringification.mustQualifierKindToString(that.kind);
+    }
+
+    jsonable["type"] = that.type;
+
+    jsonable["valueType"] = AasStringification.mustDataTypeDefXsdToString(
+      that.valueType
+    );
+
+    if (that.value !== null) {
+      jsonable["value"] = that.value;
+    }
+
+    if (that.valueId !== null) {
+      jsonable["valueId"] = this.transform(that.valueId);
+    }
+
+    return jsonable;
+  }
+
+  /**
+   * Serialize `that` to a JSON-able representation.
+   *
+   * @param that - instance to be serialization
+   * @returns JSON-able representation
+   */
+  transformAssetAdministrationShell(
+    that: AasTypes.AssetAdministrationShell
+  ): AasJsonization.JsonObject {
+    const jsonable: AasJsonization.JsonObject = {};
+
+    if (that.extensions !== null) {
+      const extensionsArray = new Array<AasJsonization.JsonObject>();
+      for (const item of that.extensions) {
+        extensionsArray.push(this.transform(item));
+      }
+      jsonable["extensions"] = extensionsArray;
+    }
+
+    if (that.category !== null) {
+      jsonable["category"] = that.category;
+    }
+
+    if (that.idShort !== null) {
+      jsonable["idShort"] = that.idShort;
+    }
+
+    if (that.displayName !== null) {
+      const displayNameArray = new Array<AasJsonization.JsonObject>();
+      for (const item of that.displayName) {
+        displayNameArray.push(this.transform(item));
+      }
+      jsonable["displayName"] = displayNameArray;
+    }
+
+    if (that.description !== null) {
+      const descriptionArray = new Array<AasJsonization.JsonObject>();
+      for (const item of that.description) {
+        descriptionArray.push(this.transform(item));
+      }
+      jsonable["description"] = descriptionArray;
+    }
+
+    if (that.checksum !== null) {
+      jsonable["checksum"] = that.checksum;
+    }
+
+    if (that.administration !== null) {
+      jsonable["administration"] = this.transform(that.administration);
+    }
+
+    jsonable["id"] = that.id;
+
+    if (that.embeddedDataSpecifications !== null) {
+      const embeddedDataSpecificationsArray = new Array<AasJsonization.JsonObject>();
+      for (const item of that.embeddedDataSpecifications) {
+        embeddedDataSpecificationsArray.push(this.transform(item));
+      }
+      jsonable["embeddedDataSpecifications"] = embeddedDataSpecificationsArray;
+    }
+
+    if (that.derivedFrom !== null) {
+      jsonable["derivedFrom"] = this.transform(that.derivedFrom);
+    }
+
+    jsonable["assetInformation"] = this.transform(that.assetInformation);
+
+    if (that.submodels !== null) {
+      const submodelsArray = new Array<AasJsonization.JsonObject>();
+      for (const item of that.submodels) {
+        submodelsArray.push(this.transform(item));
+      }
+      jsonable["submodels"] = submodelsArray;
+    }
+
+    jsonable["modelType"] = "AssetAdministrationShell";
+
+    return jsonable;
+  }
+
+  /**
+   * Serialize `that` to a JSON-able representation.
+   *
+   * @param that - instance to be serialization
+   * @returns JSON-able representation
+   */
+  transformAssetInformation(
+    that: AasTypes.AssetInformation
+  ): AasJsonization.JsonObject {
+    const jsonable: AasJsonization.JsonObject = {};
+
+    jsonable["assetKind"] = AasStringification.mustAssetKindToString(that.assetKind);
+
+    if (that.globalAssetId !== null) {
+      jsonable["globalAssetId"] = this.transform(that.globalAssetId);
+    }
+
+    if (that.specificAssetIds !== null) {
+      const specificAssetIdsArray = new Array<AasJsonization.JsonObject>();
+      for (const item of that.specificAssetIds) {
+        specificAssetIdsArray.push(this.transform(item));
+      }
+      jsonable["specificAssetIds"] = specificAssetIdsArray;
+    }
+
+    if (that.defaultThumbnail !== null) {
+      jsonable["defaultThumbnail"] = this.transform(that.defaultThumbnail);
+    }
+
+    return jsonable;
+  }
+
+  /**
+   * Serialize `that` to a JSON-able representation.
+   *
+   * @param that - instance to be serialization
+   * @returns JSON-able representation
+   */
+  transformResource(that: AasTypes.Resource): AasJsonization.JsonObject {
+    const jsonable: AasJsonization.JsonObject = {};
+
+    jsonable["path"] = that.path;
+
+    if (that.contentType !== null) {
+      jsonable["contentType"] = that.contentType;
+    }
+
+    return jsonable;
+  }
+
+  /**
+   * Serialize `that` to a JSON-able representation.
+   *
+   * @param that - instance to be serialization
+   * @returns JSON-able representation
+   */
+  transformSpecificAssetId(that: AasTypes.SpecificAssetId): AasJsonization.JsonObject {
+    const jsonable: AasJsonization.JsonObject = {};
+
+    if (that.semanticId !== null) {
+      jsonable["semanticId"] = this.transform(that.semanticId);
+    }
+
+    if (that.supplementalSemanticIds !== null) {
+      const supplementalSemanticIdsArray = new Array<AasJsonization.JsonObject>();
+      for (const item of that.supplementalSemanticIds) {
+        supplementalSemanticIdsArray.push(this.transform(item));
+      }
+      jsonable["supplementalSemanticIds"] = supplementalSemanticIdsArray;
+    }
+
+    jsonable["name"] = that.name;
+
+    jsonable["value"] = that.value;
+
+    jsonable["externalSubjectId"] = this.transform(that.externalSubjectId);
+
+    return jsonable;
+  }
+
+  /**
+   * Serialize `that` to a JSON-able representation.
+   *
+   * @param that - instance to be serialization
+   * @returns JSON-able representation
+   */
+  transformSubmodel(that: AasTypes.Submodel): AasJsonization.JsonObject {
+    const jsonable: AasJsonization.JsonObject = {};
+
+    if (that.extensions !== null) {
+      const extensionsArray = new Array<AasJsonization.JsonObject>();
+      for (const item of that.extensions) {
+        extensionsArray.push(this.transform(item));
+      }
+      jsonable["extensions"] = extensionsArray;
+    }
+
+    if (that.category !== null) {
+      jsonable["category"] = that.category;
+    }
+
+    if (that.idShort !== null) {
+      jsonable["idShort"] = that.idShort;
+    }
+
+    if (that.displayName !== null) {
+      const displayNameArray = new Array<AasJsonization.JsonObject>();
+      for (const item of that.displayName) {
+        displayNameArray.push(this.transform(item));
+      }
+      jsonable["displayName"] = displayNameArray;
+    }
+
+    if (that.description !== null) {
+      const descriptionArray = new Array<AasJsonization.JsonObject>();
+      for (const item of that.description) {
+        descriptionArray.push(this.transform(item));
+      }
+      jsonable["description"] = descriptionArray;
+    }
+
+    if (that.checksum !== null) {
+      jsonable["checksum"] = that.checksum;
+    }
+
+    if (that.administration !== null) {
+      jsonable["administration"] = this.transform(that.administration);
+    }
+
+    jsonable["id"] = that.id;
+
+    if (that.kind !== null) {
+      jsonable["kind"] = AasStringification.mustModelingKindToString(that.kind);
+    }
+
+    if (that.semanticId !== null) {
+      jsonable["semanticId"] = this.transform(that.semanticId);
+    }
+
+    if (that.supplementalSemanticIds !== null) {
+      const supplementalSemanticIdsArray = new Array<AasJsonization.JsonObject>();
+      for (const item of that.supplementalSemanticIds) {
+        supplementalSemanticIdsArray.push(this.transform(item));
+      }
+      jsonable["supplementalSemanticIds"] = supplementalSemanticIdsArray;
+    }
+
+    if (that.qualifiers !== null) {
+      const qualifiersArray = new Array<AasJsonization.JsonObject>();
+      for (const item of that.qualifiers) {
+        qualifiersArray.push(this.transform(item));
+      }
+      jsonable["qualifiers"] = qualifiersArray;
+    }
+
+    if (that.embeddedDataSpecifications !== null) {
+      const embeddedDataSpecificationsArray = new Array<AasJsonization.JsonObject>();
+      for (const item of that.embeddedDataSpecifications) {
+        embeddedDataSpecificationsArray.push(this.transform(item));
+      }
+      jsonable["embeddedDataSpecifications"] = embeddedDataSpecificationsArray;
+    }
+
+    if (this.includesNestedElements() && that.submodelElements !== null) {
+      const submodelElementsArray = new Array<AasJsonization.JsonObject>();
+      this.depth++;
+      for (const item of that.submodelElements) {
+        submodelElementsArray.push(this.transform(item));
+      }
+      this.depth--;
+      jsonable["submodelElements"] = submodelElementsArray;
+    }
+
+    jsonable["modelType"] = "Submodel";
+
+    return jsonable;
+  }
+
+  /**
+   * Serialize `that` to a JSON-able representation.
+   *
+   * @param that - instance to be serialization
+   * @returns JSON-able representation
+   */
+  transformRelationshipElement(
+    that: AasTypes.RelationshipElement
+  ): AasJsonization.JsonObject {
+    const jsonable: AasJsonization.JsonObject = {};
+
+    if (that.extensions !== null) {
+      const extensionsArray = new Array<AasJsonization.JsonObject>();
+      for (const item of that.extensions) {
+        extensionsArray.push(this.transform(item));
+      }
+      jsonable["extensions"] = extensionsArray;
+    }
+
+    if (that.category !== null) {
+      jsonable["category"] = that.category;
+    }
+
+    if (that.idShort !== null) {
+      jsonable["idShort"] = that.idShort;
+    }
+
+    if (that.displayName !== null) {
+      const displayNameArray = new Array<AasJsonization.JsonObject>();
+      for (const item of that.displayName) {
+        displayNameArray.push(this.transform(item));
+      }
+      jsonable["displayName"] = displayNameArray;
+    }
+
+    if (that.description !== null) {
+      const descriptionArray = new Array<AasJsonization.JsonObject>();
+      for (const item of that.description) {
+        descriptionArray.push(this.transform(item));
+      }
+      jsonable["description"] = descriptionArray;
+    }
+
+    if (that.checksum !== null) {
+      jsonable["checksum"] = that.checksum;
+    }
+
+    if (that.kind !== null) {
+      jsonable["kind"] = AasStringification.mustModelingKindToString(that.kind);
+    }
+
+    if (that.semanticId !== null) {
+      jsonable["semanticId"] = this.transform(that.semanticId);
+    }
+
+    if (that.supplementalSemanticIds !== null) {
+      const supplementalSemanticIdsArray = new Array<AasJsonization.JsonObject>();
+      for (const item of that.supplementalSemanticIds) {
+        supplementalSemanticIdsArray.push(this.transform(item));
+      }
+      jsonable["supplementalSemanticIds"] = supplementalSemanticIdsArray;
+    }
+
+    if (that.qualifiers !== null) {
+      const qualifiersArray = new Array<AasJsonization.JsonObject>();
+      for (const item of that.qualifiers) {
+        qualifiersArray.push(this.transform(item));
+      }
+      jsonable["qualifiers"] = qualifiersArray;
+    }
+
+    if (that.embeddedDataSpecifications !== null) {
+      const embeddedDataSpecificationsArray = new Array<AasJsonization.JsonObject>();
+      for (const item of that.embeddedDataSpecifications) {
+        embeddedDataSpecificationsArray.push(this.transform(item));
+      }
+      jsonable["embeddedDataSpecifications"] = embeddedDataSpecificationsArray;
+    }
+
+    jsonable["first"] = this.transform(that.first);
+
+    jsonable["second"] = this.transform(that.second);
+
+    jsonable["modelType"] = "RelationshipElement";
+
+    return jsonable;
+  }
+
+  /**
+   * Serialize `that` to a JSON-able representation.
+   *
+   * @param that - instance to be serialization
+   * @returns JSON-able representation
+   */
+  transformSubmodelElementList(
+    that: AasTypes.SubmodelElementList
+  ): AasJsonization.JsonObject {
+    const jsonable: AasJsonization.JsonObject = {};
+
+    if (that.extensions !== null) {
+      const extensionsArray = new Array<AasJsonization.JsonObject>();
+      for (const item of that.extensions) {
+        extensionsArray.push(this.transform(item));
+      }
+      jsonable["extensions"] = extensionsArray;
+    }
+
+    if (that.category !== null) {
+      jsonable["category"] = that.category;
+    }
+
+    if (that.idShort !== null) {
+      jsonable["idShort"] = that.idShort;
+    }
+
+    if (that.displayName !== null) {
+      const displayNameArray = new Array<AasJsonization.JsonObject>();
+      for (const item of that.displayName) {
+        displayNameArray.push(this.transform(item));
+      }
+      jsonable["displayName"] = displayNameArray;
+    }
+
+    if (that.description !== null) {
+      const descriptionArray = new Array<AasJsonization.JsonObject>();
+      for (const item of that.description) {
+        descriptionArray.push(this.transform(item));
+      }
+      jsonable["description"] = descriptionArray;
+    }
+
+    if (that.checksum !== null) {
+      jsonable["checksum"] = that.checksum;
+    }
+
+    if (that.kind !== null) {
+      jsonable["kind"] = AasStringification.mustModelingKindToString(that.kind);
+    }
+
+    if (that.semanticId !== null) {
+      jsonable["semanticId"] = this.transform(that.semanticId);
+    }
+
+    if (that.supplementalSemanticIds !== null) {
+      const supplementalSemanticIdsArray = new Array<AasJsonization.JsonObject>();
+      for (const item of that.supplementalSemanticIds) {
+        supplementalSemanticIdsArray.push(this.transform(item));
+      }
+      jsonable["supplementalSemanticIds"] = supplementalSemanticIdsArray;
+    }
+
+    if (that.qualifiers !== null) {
+      const qualifiersArray = new Array<AasJsonization.JsonObject>();
+      for (const item of that.qualifiers) {
+        qualifiersArray.push(this.transform(item));
+      }
+      jsonable["qualifiers"] = qualifiersArray;
+    }
+
+    if (that.embeddedDataSpecifications !== null) {
+      const embeddedDataSpecificationsArray = new Array<AasJsonization.JsonObject>();
+      for (const item of that.embeddedDataSpecifications) {
+        embeddedDataSpecificationsArray.push(this.transform(item));
+      }
+      jsonable["embeddedDataSpecifications"] = embeddedDataSpecificationsArray;
+    }
+
+    if (that.orderRelevant !== null) {
+      jsonable["orderRelevant"] = that.orderRelevant;
+    }
+
+    if (this.includesNestedElements() && that.value !== null) {
+      const valueArray = new Array<AasJsonization.JsonObject>();
+      this.depth++;
+      for (const item of that.value) {
+        valueArray.push(this.transform(item));
+      }
+      this.depth--;
+      jsonable["value"] = valueArray;
+    }
+
+    if (that.semanticIdListElement !== null) {
+      jsonable["semanticIdListElement"] = this.transform(that.semanticIdListElement);
+    }
+
+    jsonable["typeValueListElement"] =
+      AasStringification.mustAasSubmodelElementsToString(that.typeValueListElement);
+
+    if (that.valueTypeListElement !== null) {
+      jsonable["valueTypeListElement"] = AasStringification.mustDataTypeDefXsdToString(
+        that.valueTypeListElement
+      );
+    }
+
+    jsonable["modelType"] = "SubmodelElementList";
+
+    return jsonable;
+  }
+
+  /**
+   * Serialize `that` to a JSON-able representation.
+   *
+   * @param that - instance to be serialization
+   * @returns JSON-able representation
+   */
+  transformSubmodelElementCollection(
+    that: AasTypes.SubmodelElementCollection
+  ): AasJsonization.JsonObject {
+    const jsonable: AasJsonization.JsonObject = {};
+
+    if (that.extensions !== null) {
+      const extensionsArray = new Array<AasJsonization.JsonObject>();
+      for (const item of that.extensions) {
+        extensionsArray.push(this.transform(item));
+      }
+      jsonable["extensions"] = extensionsArray;
+    }
+
+    if (that.category !== null) {
+      jsonable["category"] = that.category;
+    }
+
+    if (that.idShort !== null) {
+      jsonable["idShort"] = that.idShort;
+    }
+
+    if (that.displayName !== null) {
+      const displayNameArray = new Array<AasJsonization.JsonObject>();
+      for (const item of that.displayName) {
+        displayNameArray.push(this.transform(item));
+      }
+      jsonable["displayName"] = displayNameArray;
+    }
+
+    if (that.description !== null) {
+      const descriptionArray = new Array<AasJsonization.JsonObject>();
+      for (const item of that.description) {
+        descriptionArray.push(this.transform(item));
+      }
+      jsonable["description"] = descriptionArray;
+    }
+
+    if (that.checksum !== null) {
+      jsonable["checksum"] = that.checksum;
+    }
+
+    if (that.kind !== null) {
+      jsonable["kind"] = AasStringification.mustModelingKindToString(that.kind);
+    }
+
+    if (that.semanticId !== null) {
+      jsonable["semanticId"] = this.transform(that.semanticId);
+    }
+
+    if (that.supplementalSemanticIds !== null) {
+      const supplementalSemanticIdsArray = new Array<AasJsonization.JsonObject>();
+      for (const item of that.supplementalSemanticIds) {
+        supplementalSemanticIdsArray.push(this.transform(item));
+      }
+      jsonable["supplementalSemanticIds"] = supplementalSemanticIdsArray;
+    }
+
+    if (that.qualifiers !== null) {
+      const qualifiersArray = new Array<AasJsonization.JsonObject>();
+      for (const item of that.qualifiers) {
+        qualifiersArray.push(this.transform(item));
+      }
+      jsonable["qualifiers"] = qualifiersArray;
+    }
+
+    if (that.embeddedDataSpecifications !== null) {
+      const embeddedDataSpecificationsArray = new Array<AasJsonization.JsonObject>();
+      for (const item of that.embeddedDataSpecifications) {
+        embeddedDataSpecificationsArray.push(this.transform(item));
+      }
+      jsonable["embeddedDataSpecifications"] = embeddedDataSpecificationsArray;
+    }
+
+    if (this.includesNestedElements() && that.value !== null) {
+      const valueArray = new Array<AasJsonization.JsonObject>();
+      this.depth++;
+      for (const item of that.value) {
+        valueArray.push(this.transform(item));
+      }
+      this.depth--;
+      jsonable["value"] = valueArray;
+    }
+
+    jsonable["modelType"] = "SubmodelElementCollection";
+
+    return jsonable;
+  }
+
+  /**
+   * Serialize `that` to a JSON-able representation.
+   *
+   * @param that - instance to be serialization
+   * @returns JSON-able representation
+   */
+  transformProperty(that: AasTypes.Property): AasJsonization.JsonObject {
+    const jsonable: AasJsonization.JsonObject = {};
+
+    if (that.extensions !== null) {
+      const extensionsArray = new Array<AasJsonization.JsonObject>();
+      for (const item of that.extensions) {
+        extensionsArray.push(this.transform(item));
+      }
+      jsonable["extensions"] = extensionsArray;
+    }
+
+    if (that.category !== null) {
+      jsonable["category"] = that.category;
+    }
+
+    if (that.idShort !== null) {
+      jsonable["idShort"] = that.idShort;
+    }
+
+    if (that.displayName !== null) {
+      const displayNameArray = new Array<AasJsonization.JsonObject>();
+      for (const item of that.displayName) {
+        displayNameArray.push(this.transform(item));
+      }
+      jsonable["displayName"] = displayNameArray;
+    }
+
+    if (that.description !== null) {
+      const descriptionArray = new Array<AasJsonization.JsonObject>();
+      for (const item of that.description) {
+        descriptionArray.push(this.transform(item));
+      }
+      jsonable["description"] = descriptionArray;
+    }
+
+    if (that.checksum !== null) {
+      jsonable["checksum"] = that.checksum;
+    }
+
+    if (that.kind !== null) {
+      jsonable["kind"] = AasStringification.mustModelingKindToString(that.kind);
+    }
+
+    if (that.semanticId !== null) {
+      jsonable["semanticId"] = this.transform(that.semanticId);
+    }
+
+    if (that.supplementalSemanticIds !== null) {
+      const supplementalSemanticIdsArray = new Array<AasJsonization.JsonObject>();
+      for (const item of that.supplementalSemanticIds) {
+        supplementalSemanticIdsArray.push(this.transform(item));
+      }
+      jsonable["supplementalSemanticIds"] = supplementalSemanticIdsArray;
+    }
+
+    if (that.qualifiers !== null) {
+      const qualifiersArray = new Array<AasJsonization.JsonObject>();
+      for (const item of that.qualifiers) {
+        qualifiersArray.push(this.transform(item));
+      }
+      jsonable["qualifiers"] = qualifiersArray;
+    }
+
+    if (that.embeddedDataSpecifications !== null) {
+      const embeddedDataSpecificationsArray = new Array<AasJsonization.JsonObject>();
+      for (const item of that.embeddedDataSpecifications) {
+        embeddedDataSpecificationsArray.push(this.transform(item));
+      }
+      jsonable["embeddedDataSpecifications"] = embeddedDataSpecificationsArray;
+    }
+
+    jsonable["valueType"] = AasStringification.mustDataTypeDefXsdToString(
+      that.valueType
+    );
+
+    if (that.value !== null) {
+      jsonable["value"] = that.value;
+    }
+
+    if (that.valueId !== null) {
+      jsonable["valueId"] = this.transform(that.valueId);
+    }
+
+    jsonable["modelType"] = "Property";
+
+    return jsonable;
+  }
+
+  /**
+   * Serialize `that` to a JSON-able representation.
+   *
+   * @param that - instance to be serialization
+   * @returns JSON-able representation
+   */
+  transformMultiLanguageProperty(
+    that: AasTypes.MultiLanguageProperty
+  ): AasJsonization.JsonObject {
+    const jsonable: AasJsonization.JsonObject = {};
+
+    if (that.extensions !== null) {
+      const extensionsArray = new Array<AasJsonization.JsonObject>();
+      for (const item of that.extensions) {
+        extensionsArray.push(this.transform(item));
+      }
+      jsonable["extensions"] = extensionsArray;
+    }
+
+    if (that.category !== null) {
+      jsonable["category"] = that.category;
+    }
+
+    if (that.idShort !== null) {
+      jsonable["idShort"] = that.idShort;
+    }
+
+    if (that.displayName !== null) {
+      const displayNameArray = new Array<AasJsonization.JsonObject>();
+      for (const item of that.displayName) {
+        displayNameArray.push(this.transform(item));
+      }
+      jsonable["displayName"] = displayNameArray;
+    }
+
+    if (that.description !== null) {
+      const descriptionArray = new Array<AasJsonization.JsonObject>();
+      for (const item of that.description) {
+        descriptionArray.push(this.transform(item));
+      }
+      jsonable["description"] = descriptionArray;
+    }
+
+    if (that.checksum !== null) {
+      jsonable["checksum"] = that.checksum;
+    }
+
+    if (that.kind !== null) {
+      jsonable["kind"] = AasStringification.mustModelingKindToString(that.kind);
+    }
+
+    if (that.semanticId !== null) {
+      jsonable["semanticId"] = this.transform(that.semanticId);
+    }
+
+    if (that.supplementalSemanticIds !== null) {
+      const supplementalSemanticIdsArray = new Array<AasJsonization.JsonObject>();
+      for (const item of that.supplementalSemanticIds) {
+        supplementalSemanticIdsArray.push(this.transform(item));
+      }
+      jsonable["supplementalSemanticIds"] = supplementalSemanticIdsArray;
+    }
+
+    if (that.qualifiers !== null) {
+      const qualifiersArray = new Array<AasJsonization.JsonObject>();
+      for (const item of that.qualifiers) {
+        qualifiersArray.push(this.transform(item));
+      }
+      jsonable["qualifiers"] = qualifiersArray;
+    }
+
+    if (that.embeddedDataSpecifications !== null) {
+      const embeddedDataSpecificationsArray = new Array<AasJsonization.JsonObject>();
+      for (const item of that.embeddedDataSpecifications) {
+        embeddedDataSpecificationsArray.push(this.transform(item));
+      }
+      jsonable["embeddedDataSpecifications"] = embeddedDataSpecificationsArray;
+    }
+
+    if (that.value !== null) {
+      const valueArray = new Array<AasJsonization.JsonObject>();
+      for (const item of that.value) {
+        valueArray.push(this.transform(item));
+      }
+      jsonable["value"] = valueArray;
+    }
+
+    if (that.valueId !== null) {
+      jsonable["valueId"] = this.transform(that.valueId);
+    }
+
+    jsonable["modelType"] = "MultiLanguageProperty";
+
+    return jsonable;
+  }
+
+  /**
+   * Serialize `that` to a JSON-able representation.
+   *
+   * @param that - instance to be serialization
+   * @returns JSON-able representation
+   */
+  transformRange(that: AasTypes.Range): AasJsonization.JsonObject {
+    const jsonable: AasJsonization.JsonObject = {};
+
+    if (that.extensions !== null) {
+      const extensionsArray = new Array<AasJsonization.JsonObject>();
+      for (const item of that.extensions) {
+        extensionsArray.push(this.transform(item));
+      }
+      jsonable["extensions"] = extensionsArray;
+    }
+
+    if (that.category !== null) {
+      jsonable["category"] = that.category;
+    }
+
+    if (that.idShort !== null) {
+      jsonable["idShort"] = that.idShort;
+    }
+
+    if (that.displayName !== null) {
+      const displayNameArray = new Array<AasJsonization.JsonObject>();
+      for (const item of that.displayName) {
+        displayNameArray.push(this.transform(item));
+      }
+      jsonable["displayName"] = displayNameArray;
+    }
+
+    if (that.description !== null) {
+      const descriptionArray = new Array<AasJsonization.JsonObject>();
+      for (const item of that.description) {
+        descriptionArray.push(this.transform(item));
+      }
+      jsonable["description"] = descriptionArray;
+    }
+
+    if (that.checksum !== null) {
+      jsonable["checksum"] = that.checksum;
+    }
+
+    if (that.kind !== null) {
+      jsonable["kind"] = AasStringification.mustModelingKindToString(that.kind);
+    }
+
+    if (that.semanticId !== null) {
+      jsonable["semanticId"] = this.transform(that.semanticId);
+    }
+
+    if (that.supplementalSemanticIds !== null) {
+      const supplementalSemanticIdsArray = new Array<AasJsonization.JsonObject>();
+      for (const item of that.supplementalSemanticIds) {
+        supplementalSemanticIdsArray.push(this.transform(item));
+      }
+      jsonable["supplementalSemanticIds"] = supplementalSemanticIdsArray;
+    }
+
+    if (that.qualifiers !== null) {
+      const qualifiersArray = new Array<AasJsonization.JsonObject>();
+      for (const item of that.qualifiers) {
+        qualifiersArray.push(this.transform(item));
+      }
+      jsonable["qualifiers"] = qualifiersArray;
+    }
+
+    if (that.embeddedDataSpecifications !== null) {
+      const embeddedDataSpecificationsArray = new Array<AasJsonization.JsonObject>();
+      for (const item of that.embeddedDataSpecifications) {
+        embeddedDataSpecificationsArray.push(this.transform(item));
+      }
+      jsonable["embeddedDataSpecifications"] = embeddedDataSpecificationsArray;
+    }
+
+    jsonable["valueType"] = AasStringification.mustDataTypeDefXsdToString(
+      that.valueType
+    );
+
+    if (that.min !== null) {
+      jsonable["min"] = that.min;
+    }
+
+    if (that.max !== null) {
+      jsonable["max"] = that.max;
+    }
+
+    jsonable["modelType"] = "Range";
+
+    return jsonable;
+  }
+
+  /**
+   * Serialize `that` to a JSON-able representation.
+   *
+   * @param that - instance to be serialization
+   * @returns JSON-able representation
+   */
+  transformReferenceElement(
+    that: AasTypes.ReferenceElement
+  ): AasJsonization.JsonObject {
+    const jsonable: AasJsonization.JsonObject = {};
+
+    if (that.extensions !== null) {
+      const extensionsArray = new Array<AasJsonization.JsonObject>();
+      for (const item of that.extensions) {
+        extensionsArray.push(this.transform(item));
+      }
+      jsonable["extensions"] = extensionsArray;
+    }
+
+    if (that.category !== null) {
+      jsonable["category"] = that.category;
+    }
+
+    if (that.idShort !== null) {
+      jsonable["idShort"] = that.idShort;
+    }
+
+    if (that.displayName !== null) {
+      const displayNameArray = new Array<AasJsonization.JsonObject>();
+      for (const item of that.displayName) {
+        displayNameArray.push(this.transform(item));
+      }
+      jsonable["displayName"] = displayNameArray;
+    }
+
+    if (that.description !== null) {
+      const descriptionArray = new Array<AasJsonization.JsonObject>();
+      for (const item of that.description) {
+        descriptionArray.push(this.transform(item));
+      }
+      jsonable["description"] = descriptionArray;
+    }
+
+    if (that.checksum !== null) {
+      jsonable["checksum"] = that.checksum;
+    }
+
+    if (that.kind !== null) {
+      jsonable["kind"] = AasStringification.mustModelingKindToString(that.kind);
+    }
+
+    if (that.semanticId !== null) {
+      jsonable["semanticId"] = this.transform(that.semanticId);
+    }
+
+    if (that.supplementalSemanticIds !== null) {
+      const supplementalSemanticIdsArray = new Array<AasJsonization.JsonObject>();
+      for (const item of that.supplementalSemanticIds) {
+        supplementalSemanticIdsArray.push(this.transform(item));
+      }
+      jsonable["supplementalSemanticIds"] = supplementalSemanticIdsArray;
+    }
+
+    if (that.qualifiers !== null) {
+      const qualifiersArray = new Array<AasJsonization.JsonObject>();
+      for (const item of that.qualifiers) {
+        qualifiersArray.push(this.transform(item));
+      }
+      jsonable["qualifiers"] = qualifiersArray;
+    }
+
+    if (that.embeddedDataSpecifications !== null) {
+      const embeddedDataSpecificationsArray = new Array<AasJsonization.JsonObject>();
+      for (const item of that.embeddedDataSpecifications) {
+        embeddedDataSpecificationsArray.push(this.transform(item));
+      }
+      jsonable["embeddedDataSpecifications"] = embeddedDataSpecificationsArray;
+    }
+
+    if (that.value !== null) {
+      jsonable["value"] = this.transform(that.value);
+    }
+
+    jsonable["modelType"] = "ReferenceElement";
+
+    return jsonable;
+  }
+
+  /**
+   * Serialize `that` to a JSON-able representation.
+   *
+   * @param that - instance to be serialization
+   * @returns JSON-able representation
+   */
+  transformBlob(that: AasTypes.Blob): AasJsonization.JsonObject {
+    const jsonable: AasJsonization.JsonObject = {};
+
+    if (that.extensions !== null) {
+      const extensionsArray = new Array<AasJsonization.JsonObject>();
+      for (const item of that.extensions) {
+        extensionsArray.push(this.transform(item));
+      }
+      jsonable["extensions"] = extensionsArray;
+    }
+
+    if (that.category !== null) {
+      jsonable["category"] = that.category;
+    }
+
+    if (that.idShort !== null) {
+      jsonable["idShort"] = that.idShort;
+    }
+
+    if (that.displayName !== null) {
+      const displayNameArray = new Array<AasJsonization.JsonObject>();
+      for (const item of that.displayName) {
+        displayNameArray.push(this.transform(item));
+      }
+      jsonable["displayName"] = displayNameArray;
+    }
+
+    if (that.description !== null) {
+      const descriptionArray = new Array<AasJsonization.JsonObject>();
+      for (const item of that.description) {
+        descriptionArray.push(this.transform(item));
+      }
+      jsonable["description"] = descriptionArray;
+    }
+
+    if (that.checksum !== null) {
+      jsonable["checksum"] = that.checksum;
+    }
+
+    if (that.kind !== null) {
+      jsonable["kind"] = AasStringification.mustModelingKindToString(that.kind);
+    }
+
+    if (that.semanticId !== null) {
+      jsonable["semanticId"] = this.transform(that.semanticId);
+    }
+
+    if (that.supplementalSemanticIds !== null) {
+      const supplementalSemanticIdsArray = new Array<AasJsonization.JsonObject>();
+      for (const item of that.supplementalSemanticIds) {
+        supplementalSemanticIdsArray.push(this.transform(item));
+      }
+      jsonable["supplementalSemanticIds"] = supplementalSemanticIdsArray;
+    }
+
+    if (that.qualifiers !== null) {
+      const qualifiersArray = new Array<AasJsonization.JsonObject>();
+      for (const item of that.qualifiers) {
+        qualifiersArray.push(this.transform(item));
+      }
+      jsonable["qualifiers"] = qualifiersArray;
+    }
+
+    if (that.embeddedDataSpecifications !== null) {
+      const embeddedDataSpecificationsArray = new Array<AasJsonization.JsonObject>();
+      for (const item of that.embeddedDataSpecifications) {
+        embeddedDataSpecificationsArray.push(this.transform(item));
+      }
+      jsonable["embeddedDataSpecifications"] = embeddedDataSpecificationsArray;
+    }
+
+    if (!this.withoutBlobValue) {
+      // We reuse the original text if the value has not been decoded yet so that
+      // we do not have to decode and encode it again.
+      const encodedValue = AasDeserialization.encodedBlobValue(that);
+      if (encodedValue !== null) {
+        jsonable["value"] = encodedValue;
+      } else if (that.value !== null) {
+        jsonable["value"] = AasCommon.base64Encode(that.value);
+      }
+    }
+
+    jsonable["contentType"] = that.contentType;
+
+    jsonable["modelType"] = "Blob";
+
+    return jsonable;
+  }
+
+  /**
+   * Serialize `that` to a JSON-able representation.
+   *
+   * @param that - instance to be serialization
+   * @returns JSON-able representation
+   */
+  transformFile(that: AasTypes.File): AasJsonization.JsonObject {
+    const jsonable: AasJsonization.JsonObject = {};
+
+    if (that.extensions !== null) {
+      const extensionsArray = new Array<AasJsonization.JsonObject>();
+      for (const item of that.extensions) {
+        extensionsArray.push(this.transform(item));
+      }
+      jsonable["extensions"] = extensionsArray;
+    }
+
+    if (that.category !== null) {
+      jsonable["category"] = that.category;
+    }
+
+    if (that.idShort !== null) {
+      jsonable["idShort"] = that.idShort;
+    }
+
+    if (that.displayName !== null) {
+      const displayNameArray = new Array<AasJsonization.JsonObject>();
+      for (const item of that.displayName) {
+        displayNameArray.push(this.transform(item));
+      }
+      jsonable["displayName"] = displayNameArray;
+    }
+
+    if (that.description !== null) {
+      const descriptionArray = new Array<AasJsonization.JsonObject>();
+      for (const item of that.description) {
+        descriptionArray.push(this.transform(item));
+      }
+      jsonable["description"] = descriptionArray;
+    }
+
+    if (that.checksum !== null) {
+      jsonable["checksum"] = that.checksum;
+    }
+
+    if (that.kind !== null) {
+      jsonable["kind"] = AasStringification.mustModelingKindToString(that.kind);
+    }
+
+    if (that.semanticId !== null) {
+      jsonable["semanticId"] = this.transform(that.semanticId);
+    }
+
+    if (that.supplementalSemanticIds !== null) {
+      const supplementalSemanticIdsArray = new Array<AasJsonization.JsonObject>();
+      for (const item of that.supplementalSemanticIds) {
+        supplementalSemanticIdsArray.push(this.transform(item));
+      }
+      jsonable["supplementalSemanticIds"] = supplementalSemanticIdsArray;
+    }
+
+    if (that.qualifiers !== null) {
+      const qualifiersArray = new Array<AasJsonization.JsonObject>();
+      for (const item of that.qualifiers) {
+        qualifiersArray.push(this.transform(item));
+      }
+      jsonable["qualifiers"] = qualifiersArray;
+    }
+
+    if (that.embeddedDataSpecifications !== null) {
+      const embeddedDataSpecificationsArray = new Array<AasJsonization.JsonObject>();
+      for (const item of that.embeddedDataSpecifications) {
+        embeddedDataSpecificationsArray.push(this.transform(item));
+      }
+      jsonable["embeddedDataSpecifications"] = embeddedDataSpecificationsArray;
+    }
+
+    if (that.value !== null) {
+      jsonable["value"] = that.value;
+    }
+
+    jsonable["contentType"] = that.contentType;
+
+    jsonable["modelType"] = "File";
+
+    return jsonable;
+  }
+
+  /**
+   * Serialize `that` to a JSON-able representation.
+   *
+   * @param that - instance to be serialization
+   * @returns JSON-able representation
+   */
+  transformAnnotatedRelationshipElement(
+    that: AasTypes.AnnotatedRelationshipElement
+  ): AasJsonization.JsonObject {
+    const jsonable: AasJsonization.JsonObject = {};
+
+    if (that.extensions !== null) {
+      const extensionsArray = new Array<AasJsonization.JsonObject>();
+      for (const item of that.extensions) {
+        extensionsArray.push(this.transform(item));
+      }
+      jsonable["extensions"] = extensionsArray;
+    }
+
+    if (that.category !== null) {
+      jsonable["category"] = that.category;
+    }
+
+    if (that.idShort !== null) {
+      jsonable["idShort"] = that.idShort;
+    }
+
+    if (that.displayName !== null) {
+      const displayNameArray = new Array<AasJsonization.JsonObject>();
+      for (const item of that.displayName) {
+        displayNameArray.push(this.transform(item));
+      }
+      jsonable["displayName"] = displayNameArray;
+    }
+
+    if (that.description !== null) {
+      const descriptionArray = new Array<AasJsonization.JsonObject>();
+      for (const item of that.description) {
+        descriptionArray.push(this.transform(item));
+      }
+      jsonable["description"] = descriptionArray;
+    }
+
+    if (that.checksum !== null) {
+      jsonable["checksum"] = that.checksum;
+    }
+
+    if (that.kind !== null) {
+      jsonable["kind"] = AasStringification.mustModelingKindToString(that.kind);
+    }
+
+    if (that.semanticId !== null) {
+      jsonable["semanticId"] = this.transform(that.semanticId);
+    }
+
+    if (that.supplementalSemanticIds !== null) {
+      const supplementalSemanticIdsArray = new Array<AasJsonization.JsonObject>();
+      for (const item of that.supplementalSemanticIds) {
+        supplementalSemanticIdsArray.push(this.transform(item));
+      }
+      jsonable["supplementalSemanticIds"] = supplementalSemanticIdsArray;
+    }
+
+    if (that.qualifiers !== null) {
+      const qualifiersArray = new Array<AasJsonization.JsonObject>();
+      for (const item of that.qualifiers) {
+        qualifiersArray.push(this.transform(item));
+      }
+      jsonable["qualifiers"] = qualifiersArray;
+    }
+
+    if (that.embeddedDataSpecifications !== null) {
+      const embeddedDataSpecificationsArray = new Array<AasJsonization.JsonObject>();
+      for (const item of that.embeddedDataSpecifications) {
+        embeddedDataSpecificationsArray.push(this.transform(item));
+      }
+      jsonable["embeddedDataSpecifications"] = embeddedDataSpecificationsArray;
+    }
+
+    jsonable["first"] = this.transform(that.first);
+
+    jsonable["second"] = this.transform(that.second);
+
+    if (this.includesNestedElements() && that.annotations !== null) {
+      const annotationsArray = new Array<AasJsonization.JsonObject>();
+      this.depth++;
+      for (const item of that.annotations) {
+        annotationsArray.push(this.transform(item));
+      }
+      this.depth--;
+      jsonable["annotations"] = annotationsArray;
+    }
+
+    jsonable["modelType"] = "AnnotatedRelationshipElement";
+
+    return jsonable;
+  }
+
+  /**
+   * Serialize `that` to a JSON-able representation.
+   *
+   * @param that - instance to be serialization
+   * @returns JSON-able representation
+   */
+  transformEntity(that: AasTypes.Entity): AasJsonization.JsonObject {
+    const jsonable: AasJsonization.JsonObject = {};
+
+    if (that.extensions !== null) {
+      const extensionsArray = new Array<AasJsonization.JsonObject>();
+      for (const item of that.extensions) {
+        extensionsArray.push(this.transform(item));
+      }
+      jsonable["extensions"] = extensionsArray;
+    }
+
+    if (that.category !== null) {
+      jsonable["category"] = that.category;
+    }
+
+    if (that.idShort !== null) {
+      jsonable["idShort"] = that.idShort;
+    }
+
+    if (that.displayName !== null) {
+      const displayNameArray = new Array<AasJsonization.JsonObject>();
+      for (const item of that.displayName) {
+        displayNameArray.push(this.transform(item));
+      }
+      jsonable["displayName"] = displayNameArray;
+    }
+
+    if (that.description !== null) {
+      const descriptionArray = new Array<AasJsonization.JsonObject>();
+      for (const item of that.description) {
+        descriptionArray.push(this.transform(item));
+      }
+      jsonable["description"] = descriptionArray;
+    }
+
+    if (that.checksum !== null) {
+      jsonable["checksum"] = that.checksum;
+    }
+
+    if (that.kind !== null) {
+      jsonable["kind"] = AasStringification.mustModelingKindToString(that.kind);
+    }
+
+    if (that.semanticId !== null) {
+      jsonable["semanticId"] = this.transform(that.semanticId);
+    }
+
+    if (that.supplementalSemanticIds !== null) {
+      const supplementalSemanticIdsArray = new Array<AasJsonization.JsonObject>();
+      for (const item of that.supplementalSemanticIds) {
+        supplementalSemanticIdsArray.push(this.transform(item));
+      }
+      jsonable["supplementalSemanticIds"] = supplementalSemanticIdsArray;
+    }
+
+    if (that.qualifiers !== null) {
+      const qualifiersArray = new Array<AasJsonization.JsonObject>();
+      for (const item of that.qualifiers) {
+        qualifiersArray.push(this.transform(item));
+      }
+      jsonable["qualifiers"] = qualifiersArray;
+    }
+
+    if (that.embeddedDataSpecifications !== null) {
+      const embeddedDataSpecificationsArray = new Array<AasJsonization.JsonObject>();
+      for (const item of that.embeddedDataSpecifications) {
+        embeddedDataSpecificationsArray.push(this.transform(item));
+      }
+      jsonable["embeddedDataSpecifications"] = embeddedDataSpecificationsArray;
+    }
+
+    if (this.includesNestedElements() && that.statements !== null) {
+      const statementsArray = new Array<AasJsonization.JsonObject>();
+      this.depth++;
+      for (const item of that.statements) {
+        statementsArray.push(this.transform(item));
+      }
+      this.depth--;
+      jsonable["statements"] = statementsArray;
+    }
+
+    jsonable["entityType"] = AasStringification.mustEntityTypeToString(that.entityType);
+
+    if (that.globalAssetId !== null) {
+      jsonable["globalAssetId"] = this.transform(that.globalAssetId);
+    }
+
+    if (that.specificAssetId !== null) {
+      jsonable["specificAssetId"] = this.transform(that.specificAssetId);
+    }
+
+    jsonable["modelType"] = "Entity";
+
+    return jsonable;
+  }
+
+  /**
+   * Serialize `that` to a JSON-able representation.
+   *
+   * @param that - instance to be serialization
+   * @returns JSON-able representation
+   */
+  transformEventPayload(that: AasTypes.EventPayload): AasJsonization.JsonObject {
+    const jsonable: AasJsonization.JsonObject = {};
+
+    jsonable["source"] = this.transform(that.source);
+
+    if (that.sourceSemanticId !== null) {
+      jsonable["sourceSemanticId"] = this.transform(that.sourceSemanticId);
+    }
+
+    jsonable["observableReference"] = this.transform(that.observableReference);
+
+    if (that.observableSemanticId !== null) {
+      jsonable["observableSemanticId"] = this.transform(that.observableSemanticId);
+    }
+
+    if (that.topic !== null) {
+      jsonable["topic"] = that.topic;
+    }
+
+    if (that.subjectId !== null) {
+      jsonable["subjectId"] = this.transform(that.subjectId);
+    }
+
+    jsonable["timeStamp"] = that.timeStamp;
+
+    if (that.payload !== null) {
+      jsonable["payload"] = that.payload;
+    }
+
+    return jsonable;
+  }
+
+  /**
+   * Serialize `that` to a JSON-able representation.
+   *
+   * @param that - instance to be serialization
+   * @returns JSON-able representation
+   */
+  transformBasicEventElement(
+    that: AasTypes.BasicEventElement
+  ): AasJsonization.JsonObject {
+    const jsonable: AasJsonization.JsonObject = {};
+
+    if (that.extensions !== null) {
+      const extensionsArray = new Array<AasJsonization.JsonObject>();
+      for (const item of that.extensions) {
+        extensionsArray.push(this.transform(item));
+      }
+      jsonable["extensions"] = extensionsArray;
+    }
+
+    if (that.category !== null) {
+      jsonable["category"] = that.category;
+    }
+
+    if (that.idShort !== null) {
+      jsonable["idShort"] = that.idShort;
+    }
+
+    if (that.displayName !== null) {
+      const displayNameArray = new Array<AasJsonization.JsonObject>();
+      for (const item of that.displayName) {
+        displayNameArray.push(this.transform(item));
+      }
+      jsonable["displayName"] = displayNameArray;
+    }
+
+    if (that.description !== null) {
+      const descriptionArray = new Array<AasJsonization.JsonObject>();
+      for (const item of that.description) {
+        descriptionArray.push(this.transform(item));
+      }
+      jsonable["description"] = descriptionArray;
+    }
+
+    if (that.checksum !== null) {
+      jsonable["checksum"] = that.checksum;
+    }
+
+    if (that.kind !== null) {
+      jsonable["kind"] = AasStringification.mustModelingKindToString(that.kind);
+    }
+
+    if (that.semanticId !== null) {
+      jsonable["semanticId"] = this.transform(that.semanticId);
+    }
+
+    if (that.supplementalSemanticIds !== null) {
+      const supplementalSemanticIdsArray = new Array<AasJsonization.JsonObject>();
+      for (const item of that.supplementalSemanticIds) {
+        supplementalSemanticIdsArray.push(this.transform(item));
+      }
+      jsonable["supplementalSemanticIds"] = supplementalSemanticIdsArray;
+    }
+
+    if (that.qualifiers !== null) {
+      const qualifiersArray = new Array<AasJsonization.JsonObject>();
+      for (const item of that.qualifiers) {
+        qualifiersArray.push(this.transform(item));
+      }
+      jsonable["qualifiers"] = qualifiersArray;
+    }
+
+    if (that.embeddedDataSpecifications !== null) {
+      const embeddedDataSpecificationsArray = new Array<AasJsonization.JsonObject>();
+      for (const item of that.embeddedDataSpecifications) {
+        embeddedDataSpecificationsArray.push(this.transform(item));
+      }
+      jsonable["embeddedDataSpecifications"] = embeddedDataSpecificationsArray;
+    }
+
+    jsonable["observed"] = this.transform(that.observed);
+
+    jsonable["direction"] = AasStringification.mustDirectionToString(that.direction);
+
+    jsonable["state"] = AasStringification.mustStateOfEventToString(that.state);
+
+    if (that.messageTopic !== null) {
+      jsonable["messageTopic"] = that.messageTopic;
+    }
+
+    if (that.messageBroker !== null) {
+      jsonable["messageBroker"] = this.transform(that.messageBroker);
+    }
+
+    if (that.lastUpdate !== null) {
+      jsonable["lastUpdate"] = that.lastUpdate;
+    }
+
+    if (that.minInterval !== null) {
+      jsonable["minInterval"] = that.minInterval;
+    }
+
+    if (that.maxInterval !== null) {
+      jsonable["maxInterval"] = that.maxInterval;
+    }
+
+    jsonable["modelType"] = "BasicEventElement";
+
+    return jsonable;
+  }
+
+  /**
+   * Serialize `that` to a JSON-able representation.
+   *
+   * @param that - instance to be serialization
+   * @returns JSON-able representation
+   */
+  transformOperation(that: AasTypes.Operation): AasJsonization.JsonObject {
+    const jsonable: AasJsonization.JsonObject = {};
+
+    if (that.extensions !== null) {
+      const extensionsArray = new Array<AasJsonization.JsonObject>();
+      for (const item of that.extensions) {
+        extensionsArray.push(this.transform(item));
+      }
+      jsonable["extensions"] = extensionsArray;
+    }
+
+    if (that.category !== null) {
+      jsonable["category"] = that.category;
+    }
+
+    if (that.idShort !== null) {
+      jsonable["idShort"] = that.idShort;
+    }
+
+    if (that.displayName !== null) {
+      const displayNameArray = new Array<AasJsonization.JsonObject>();
+      for (const item of that.displayName) {
+        displayNameArray.push(this.transform(item));
+      }
+      jsonable["displayName"] = displayNameArray;
+    }
+
+    if (that.description !== null) {
+      const descriptionArray = new Array<AasJsonization.JsonObject>();
+      for (const item of that.description) {
+        descriptionArray.push(this.transform(item));
+      }
+      jsonable["description"] = descriptionArray;
+    }
+
+    if (that.checksum !== null) {
+      jsonable["checksum"] = that.checksum;
+    }
+
+    if (that.kind !== null) {
+      jsonable["kind"] = AasStringification.mustModelingKindToString(that.kind);
+    }
+
+    if (that.semanticId !== null) {
+      jsonable["semanticId"] = this.transform(that.semanticId);
+    }
+
+    if (that.supplementalSemanticIds !== null) {
+      const supplementalSemanticIdsArray = new Array<AasJsonization.JsonObject>();
+      for (const item of that.supplementalSemanticIds) {
+        supplementalSemanticIdsArray.push(this.transform(item));
+      }
+      jsonable["supplementalSemanticIds"] = supplementalSemanticIdsArray;
+    }
+
+    if (that.qualifiers !== null) {
+      const qualifiersArray = new Array<AasJsonization.JsonObject>();
+      for (const item of that.qualifiers) {
+        qualifiersArray.push(this.transform(item));
+      }
+      jsonable["qualifiers"] = qualifiersArray;
+    }
+
+    if (that.embeddedDataSpecifications !== null) {
+      const embeddedDataSpecificationsArray = new Array<AasJsonization.JsonObject>();
+      for (const item of that.embeddedDataSpecifications) {
+        embeddedDataSpecificationsArray.push(this.transform(item));
+      }
+      jsonable["embeddedDataSpecifications"] = embeddedDataSpecificationsArray;
+    }
+
+    if (this.includesNestedElements() && that.inputVariables !== null) {
+      const inputVariablesArray = new Array<AasJsonization.JsonObject>();
+      this.depth++;
+      for (const item of that.inputVariables) {
+        inputVariablesArray.push(this.transform(item));
+      }
+      this.depth--;
+      jsonable["inputVariables"] = inputVariablesArray;
+    }
+
+    if (this.includesNestedElements() && that.outputVariables !== null) {
+      const outputVariablesArray = new Array<AasJsonization.JsonObject>();
+      this.depth++;
+      for (const item of that.outputVariables) {
+        outputVariablesArray.push(this.transform(item));
+      }
+      this.depth--;
+      jsonable["outputVariables"] = outputVariablesArray;
+    }
+
+    if (this.includesNestedElements() && that.inoutputVariables !== null) {
+      const inoutputVariablesArray = new Array<AasJsonization.JsonObject>();
+      this.depth++;
+      for (const item of that.inoutputVariables) {
+        inoutputVariablesArray.push(this.transform(item));
+      }
+      this.depth--;
+      jsonable["inoutputVariables"] = inoutputVariablesArray;
+    }
+
+    jsonable["modelType"] = "Operation";
+
+    return jsonable;
+  }
+
+  /**
+   * Serialize `that` to a JSON-able representation.
+   *
+   * @param that - instance to be serialization
+   * @returns JSON-able representation
+   */
+  transformOperationVariable(
+    that: AasTypes.OperationVariable
+  ): AasJsonization.JsonObject {
+    const jsonable: AasJsonization.JsonObject = {};
+
+    jsonable["value"] = this.transform(that.value);
+
+    return jsonable;
+  }
+
+  /**
+   * Serialize `that` to a JSON-able representation.
+   *
+   * @param that - instance to be serialization
+   * @returns JSON-able representation
+   */
+  transformCapability(that: AasTypes.Capability): AasJsonization.JsonObject {
+    const jsonable: AasJsonization.JsonObject = {};
+
+    if (that.extensions !== null) {
+      const extensionsArray = new Array<AasJsonization.JsonObject>();
+      for (const item of that.extensions) {
+        extensionsArray.push(this.transform(item));
+      }
+      jsonable["extensions"] = extensionsArray;
+    }
+
+    if (that.category !== null) {
+      jsonable["category"] = that.category;
+    }
+
+    if (that.idShort !== null) {
+      jsonable["idShort"] = that.idShort;
+    }
+
+    if (that.displayName !== null) {
+      const displayNameArray = new Array<AasJsonization.JsonObject>();
+      for (const item of that.displayName) {
+        displayNameArray.push(this.transform(item));
+      }
+      jsonable["displayName"] = displayNameArray;
+    }
+
+    if (that.description !== null) {
+      const descriptionArray = new Array<AasJsonization.JsonObject>();
+      for (const item of that.description) {
+        descriptionArray.push(this.transform(item));
+      }
+      jsonable["description"] = descriptionArray;
+    }
+
+    if (that.checksum !== null) {
+      jsonable["checksum"] = that.checksum;
+    }
+
+    if (that.kind !== null) {
+      jsonable["kind"] = AasStringification.mustModelingKindToString(that.kind);
+    }
+
+    if (that.semanticId !== null) {
+      jsonable["semanticId"] = this.transform(that.semanticId);
+    }
+
+    if (that.supplementalSemanticIds !== null) {
+      const supplementalSemanticIdsArray = new Array<AasJsonization.JsonObject>();
+      for (const item of that.supplementalSemanticIds) {
+        supplementalSemanticIdsArray.push(this.transform(item));
+      }
+      jsonable["supplementalSemanticIds"] = supplementalSemanticIdsArray;
+    }
+
+    if (that.qualifiers !== null) {
+      const qualifiersArray = new Array<AasJsonization.JsonObject>();
+      for (const item of that.qualifiers) {
+        qualifiersArray.push(this.transform(item));
+      }
+      jsonable["qualifiers"] = qualifiersArray;
+    }
+
+    if (that.embeddedDataSpecifications !== null) {
+      const embeddedDataSpecificationsArray = new Array<AasJsonization.JsonObject>();
+      for (const item of that.embeddedDataSpecifications) {
+        embeddedDataSpecificationsArray.push(this.transform(item));
+      }
+      jsonable["embeddedDataSpecifications"] = embeddedDataSpecificationsArray;
+    }
+
+    jsonable["modelType"] = "Capability";
+
+    return jsonable;
+  }
+
+  /**
+   * Serialize `that` to a JSON-able representation.
+   *
+   * @param that - instance to be serialization
+   * @returns JSON-able representation
+   */
+  transformConceptDescription(
+    that: AasTypes.ConceptDescription
+  ): AasJsonization.JsonObject {
+    const jsonable: AasJsonization.JsonObject = {};
+
+    if (that.extensions !== null) {
+      const extensionsArray = new Array<AasJsonization.JsonObject>();
+      for (const item of that.extensions) {
+        extensionsArray.push(this.transform(item));
+      }
+      jsonable["extensions"] = extensionsArray;
+    }
+
+    if (that.category !== null) {
+      jsonable["category"] = that.category;
+    }
+
+    if (that.idShort !== null) {
+      jsonable["idShort"] = that.idShort;
+    }
+
+    if (that.displayName !== null) {
+      const displayNameArray = new Array<AasJsonization.JsonObject>();
+      for (const item of that.displayName) {
+        displayNameArray.push(this.transform(item));
+      }
+      jsonable["displayName"] = displayNameArray;
+    }
+
+    if (that.description !== null) {
+      const descriptionArray = new Array<AasJsonization.JsonObject>();
+      for (const item of that.description) {
+        descriptionArray.push(this.transform(item));
+      }
+      jsonable["description"] = descriptionArray;
+    }
+
+    if (that.checksum !== null) {
+      jsonable["checksum"] = that.checksum;
+    }
+
+    if (that.administration !== null) {
+      jsonable["administration"] = this.transform(that.administration);
+    }
+
+    jsonable["id"] = that.id;
+
+    if (that.embeddedDataSpecifications !== null) {
+      const embeddedDataSpecificationsArray = new Array<AasJsonization.JsonObject>();
+      for (const item of that.embeddedDataSpecifications) {
+        embeddedDataSpecificationsArray.push(this.transform(item));
+      }
+      jsonable["embeddedDataSpecifications"] = embeddedDataSpecificationsArray;
+    }
+
+    if (that.isCaseOf !== null) {
+      const isCaseOfArray = new Array<AasJsonization.JsonObject>();
+      for (const item of that.isCaseOf) {
+        isCaseOfArray.push(this.transform(item));
+      }
+      jsonable["isCaseOf"] = isCaseOfArray;
+    }
+
+    jsonable["modelType"] = "ConceptDescription";
+
+    return jsonable;
+  }
+
+  /**
+   * Serialize `that` to a JSON-able representation.
+   *
+   * @param that - instance to be serialization
+   * @returns JSON-able representation
+   */
+  transformReference(that: AasTypes.Reference): AasJsonization.JsonObject {
+    const jsonable: AasJsonization.JsonObject = {};
+
+    jsonable["type"] = AasStringification.mustReferenceTypesToString(that.type);
+
+    if (that.referredSemanticId !== null) {
+      jsonable["referredSemanticId"] = this.transform(that.referredSemanticId);
+    }
+
+    const keysArray = new Array<AasJsonization.JsonObject>();
+    for (const item of that.keys) {
+      keysArray.push(this.transform(item));
+    }
+    jsonable["keys"] = keysArray;
+
+    return jsonable;
+  }
+
+  /**
+   * Serialize `that` to a JSON-able representation.
+   *
+   * @param that - instance to be serialization
+   * @returns JSON-able representation
+   */
+  transformKey(that: AasTypes.Key): AasJsonization.JsonObject {
+    const jsonable: AasJsonization.JsonObject = {};
+
+    jsonable["type"] = AasStringification.mustKeyTypesToString(that.type);
+
+    jsonable["value"] = that.value;
+
+    return jsonable;
+  }
+
+  /**
+   * Serialize `that` to a JSON-able representation.
+   *
+   * @param that - instance to be serialization
+   * @returns JSON-able representation
+   */
+  transformLangString(that: AasTypes.LangString): AasJsonization.JsonObject {
+    const jsonable: AasJsonization.JsonObject = {};
+
+    jsonable["language"] = that.language;
+
+    jsonable["text"] = that.text;
+
+    return jsonable;
+  }
+
+  /**
+   * Serialize `that` to a JSON-able representation.
+   *
+   * @param that - instance to be serialization
+   * @returns JSON-able representation
+   */
+  transformEnvironment(that: AasTypes.Environment): AasJsonization.JsonObject {
+    const jsonable: AasJsonization.JsonObject = {};
+
+    if (that.assetAdministrationShells !== null) {
+      const assetAdministrationShellsArray = new Array<AasJsonization.JsonObject>();
+      for (const item of that.assetAdministrationShells) {
+        assetAdministrationShellsArray.push(this.transform(item));
+      }
+      jsonable["assetAdministrationShells"] = assetAdministrationShellsArray;
+    }
+
+    if (that.submodels !== null) {
+      const submodelsArray = new Array<AasJsonization.JsonObject>();
+      for (const item of that.submodels) {
+        submodelsArray.push(this.transform(item));
+      }
+      jsonable["submodels"] = submodelsArray;
+    }
+
+    if (that.conceptDescriptions !== null) {
+      const conceptDescriptionsArray = new Array<AasJsonization.JsonObject>();
+      for (const item of that.conceptDescriptions) {
+        conceptDescriptionsArray.push(this.transform(item));
+      }
+      jsonable["conceptDescriptions"] = conceptDescriptionsArray;
+    }
+
+    return jsonable;
+  }
+
+  /**
+   * Serialize `that` to a JSON-able representation.
+   *
+   * @param that - instance to be serialization
+   * @returns JSON-able representation
+   */
+  transformEmbeddedDataSpecification(
+    that: AasTypes.EmbeddedDataSpecification
+  ): AasJsonization.JsonObject {
+    const jsonable: AasJsonization.JsonObject = {};
+
+    jsonable["dataSpecification"] = this.transform(that.dataSpecification);
+
+    jsonable["dataSpecificationContent"] = this.transform(
+      that.dataSpecificationContent
+    );
+
+    return jsonable;
+  }
+
+  /**
+   * Serialize `that` to a JSON-able representation.
+   *
+   * @param that - instance to be serialization
+   * @returns JSON-able representation
+   */
+  transformValueReferencePair(
+    that: AasTypes.ValueReferencePair
+  ): AasJsonization.JsonObject {
+    const jsonable: AasJsonization.JsonObject = {};
+
+    jsonable["value"] = that.value;
+
+    jsonable["valueId"] = this.transform(that.valueId);
+
+    return jsonable;
+  }
+
+  /**
+   * Serialize `that` to a JSON-able representation.
+   *
+   * @param that - instance to be serialization
+   * @returns JSON-able representation
+   */
+  transformValueList(that: AasTypes.ValueList): AasJsonization.JsonObject {
+    const jsonable: AasJsonization.JsonObject = {};
+
+    const valueReferencePairsArray = new Array<AasJsonization.JsonObject>();
+    for (const item of that.valueReferencePairs) {
+      valueReferencePairsArray.push(this.transform(item));
+    }
+    jsonable["valueReferencePairs"] = valueReferencePairsArray;
+
+    return jsonable;
+  }
+
+  /**
+   * Serialize `that` to a JSON-able representation.
+   *
+   * @param that - instance to be serialization
+   * @returns JSON-able representation
+   */
+  transformDataSpecificationIec61360(
+    that: AasTypes.DataSpecificationIec61360
+  ): AasJsonization.JsonObject {
+    const jsonable: AasJsonization.JsonObject = {};
+
+    const preferredNameArray = new Array<AasJsonization.JsonObject>();
+    for (const item of that.preferredName) {
+      preferredNameArray.push(this.transform(item));
+    }
+    jsonable["preferredName"] = preferredNameArray;
+
+    if (that.shortName !== null) {
+      const shortNameArray = new Array<AasJsonization.JsonObject>();
+      for (const item of that.shortName) {
+        shortNameArray.push(this.transform(item));
+      }
+      jsonable["shortName"] = shortNameArray;
+    }
+
+    if (that.unit !== null) {
+      jsonable["unit"] = that.unit;
+    }
+
+    if (that.unitId !== null) {
+      jsonable["unitId"] = this.transform(that.unitId);
+    }
+
+    if (that.sourceOfDefinition !== null) {
+      jsonable["sourceOfDefinition"] = that.sourceOfDefinition;
+    }
+
+    if (that.symbol !== null) {
+      jsonable["symbol"] = that.symbol;
+    }
+
+    if (that.dataType !== null) {
+      jsonable["dataType"] = AasStringification.mustDataTypeIec61360ToString(
+        that.dataType
+      );
+    }
+
+    if (that.definition !== null) {
+      const definitionArray = new Array<AasJsonization.JsonObject>();
+      for (const item of that.definition) {
+        definitionArray.push(this.transform(item));
+      }
+      jsonable["definition"] = definitionArray;
+    }
+
+    if (that.valueFormat !== null) {
+      jsonable["valueFormat"] = that.valueFormat;
+    }
+
+    if (that.valueList !== null) {
+      jsonable["valueList"] = this.transform(that.valueList);
+    }
+
+    if (that.value !== null) {
+      jsonable["value"] = that.value;
+    }
+
+    if (that.levelType !== null) {
+      jsonable["levelType"] = AasStringification.mustLevelTypeToString(that.levelType);
+    }
+
+    jsonable["modelType"] = "DataSpecificationIEC61360";
+
+    return jsonable;
+  }
+
+  /**
+   * Serialize `that` to a JSON-able representation.
+   *
+   * @param that - instance to be serialization
+   * @returns JSON-able representation
+   */
+  transformDataSpecificationPhysicalUnit(
+    that: AasTypes.DataSpecificationPhysicalUnit
+  ): AasJsonization.JsonObject {
+    const jsonable: AasJsonization.JsonObject = {};
+
+    jsonable["unitName"] = that.unitName;
+
+    jsonable["unitSymbol"] = that.unitSymbol;
+
+    const definitionArray = new Array<AasJsonization.JsonObject>();
+    for (const item of that.definition) {
+      definitionArray.push(this.transform(item));
+    }
+    jsonable["definition"] = definitionArray;
+
+    if (that.siNotation !== null) {
+      jsonable["siNotation"] = that.siNotation;
+    }
+
+    if (that.siName !== null) {
+      jsonable["siName"] = that.siName;
+    }
+
+    if (that.dinNotation !== null) {
+      jsonable["dinNotation"] = that.dinNotation;
+    }
+
+    if (that.eceName !== null) {
+      jsonable["eceName"] = that.eceName;
+    }
+
+    if (that.eceCode !== null) {
+      jsonable["eceCode"] = that.eceCode;
+    }
+
+    if (that.nistName !== null) {
+      jsonable["nistName"] = that.nistName;
+    }
+
+    if (that.sourceOfDefinition !== null) {
+      jsonable["sourceOfDefinition"] = that.sourceOfDefinition;
+    }
+
+    if (that.conversionFactor !== null) {
+      jsonable["conversionFactor"] = that.conversionFactor;
+    }
+
+    if (that.registrationAuthorityId !== null) {
+      jsonable["registrationAuthorityId"] = that.registrationAuthorityId;
+    }
+
+    if (that.supplier !== null) {
+      jsonable["supplier"] = that.supplier;
+    }
+
+    jsonable["modelType"] = "DataSpecificationPhysicalUnit";
+
+    return jsonable;
+  }
+}
+
+const SERIALIZER = /*@__PURE__*/ new Serializer();
+
+/**
+ * Convert `that` to a JSON-able structure.
+ *
+ * @param that - AAS data to be recursively converted to a JSON-able structure
+ * @param options - to control the serialization, if any
+ * @returns
+ * JSON-able structure which can be further processed with, say,
+ * {@link https://developer.mozilla.org/en-US/docs/Web/JavaScript/Reference/Global_Objects/JSON/stringify|JSON.stringify})
+ */
+export function toJsonable(
+  that: AasTypes.Class,
+  options: SerializationOptions | null = null
+): AasJsonization.JsonObject {
+  if (options === null) {
+    return SERIALIZER.transform(that);
+  }
+
+  return new Serializer(options).transform(that);
+}
+
+/**
+ * Transform the submodels and the submodel elements to their ValueOnly
+ * representation as defined in Part 2 of the AAS specification.
+ *
+ * @remarks
+ * The instances without a value, such as operations and capabilities, are
+ * transformed to `null`, and left out from the representation of their parents.
+ * All other classes are transformed to `null` as well.
+ */
+class ValueOnlySerializer extends AasTypes.AbstractTransformer<
+  AasJsonization.JsonValue | null
+> {
+  /**
+   * Levels of the nested submodel elements to be serialized, or `null` if
+   * all the levels are to be serialized
+   */
+  private readonly maxDepth: number | null;
+
+  /**
+   * If set, {@link types!Blob.value} is omitted
+   */
+  private readonly withoutBlobValue: boolean;
+
+  /**
+   * Level of the nested submodel elements being currently serialized
+   */
+  private depth = 0;
+
+  constructor(options: SerializationOptions | null = null) {
+    super();
+    this.maxDepth = maxDepthFrom(options);
+    this.withoutBlobValue = options !== null && options.withoutBlobValue === true;
+  }
+
+  /**
+   * Check whether the nested submodel elements at the current level are to be
+   * serialized.
+   */
+  private includesNestedElements(): boolean {
+    return this.maxDepth === null || this.depth < this.maxDepth;
+  }
+
+  /**
+   * Serialize the `elements` as an object keyed by their `idShort`'s.
+   *
+   * @param elements - to be serialized
+   * @returns JSON-able representation
+   */
+  transformElementsByIdShort(
+    elements: Array<AasTypes.ISubmodelElement>
+  ): AasJsonization.JsonObject {
+    const jsonable: AasJsonization.JsonObject = {};
+    this.depth++;
+    for (const element of elements) {
+      const value = this.transform(element);
+      if (value !== null && element.idShort !== null) {
+        jsonable[element.idShort] = value;
+      }
+    }
+    this.depth--;
+    return jsonable;
+  }
+
+  /**
+   * Serialize the `elements` one at a time as the entries of a JSON object
+   * keyed by their `idShort`'s.
+   *
+   * @param elements - to be serialized
+   * @returns JSON text of each entry
+   */
+  *overElementsByIdShort(
+    elements: Array<AasTypes.ISubmodelElement>
+  ): IterableIterator<string> {
+    this.depth++;
+    for (const element of elements) {
+      const value = this.transform(element);
+      if (value !== null && element.idShort !== null) {
+        yield `${JSON.stringify(element.idShort)}:${JSON.stringify(value)}`;
+      }
+    }
+    this.depth--;
+  }
+
+  /* eslint-disable @typescript-eslint/no-unused-vars */
+  transformExtension(that: AasTypes.Extension): AasJsonization.JsonValue | null {
+    return null;
+  }
+  /* eslint-enable @typescript-eslint/no-unused-vars */
+
+  /* eslint-disable @typescript-eslint/no-unused-vars */
+  transformAdministrativeInformation(
+    that: AasTypes.AdministrativeInformation
+  ): AasJsonization.JsonValue | null {
+    return null;
+  }
+  /* eslint-enable @typescript-eslint/no-unused-vars */
+
+  /* eslint-disable @typescript-eslint/no-unused-vars */
+  transformQualifier(that: AasTypes.Qualifier): AasJsonization.JsonValue | null {
+    return null;
+  }
+  /* eslint-enable @typescript-eslint/no-unused-vars */
+
+  /* eslint-disable @typescript-eslint/no-unused-vars */
+  transformAssetAdministrationShell(
+    that: AasTypes.AssetAdministrationShell
+  ): AasJsonization.JsonValue | null {
+    return null;
+  }
+  /* eslint-enable @typescript-eslint/no-unused-vars */
+
+  /* eslint-disable @typescript-eslint/no-unused-vars */
+  transformAssetInformation(
+    that: AasTypes.AssetInformation
+  ): AasJsonization.JsonValue | null {
+    return null;
+  }
+  /* eslint-enable @typescript-eslint/no-unused-vars */
+
+  /* eslint-disable @typescript-eslint/no-unused-vars */
+  transformResource(that: AasTypes.Resource): AasJsonization.JsonValue | null {
+    return null;
+  }
+  /* eslint-enable @typescript-eslint/no-unused-vars */
+
+  /* eslint-disable @typescript-eslint/no-unused-vars */
+  transformSpecificAssetId(
+    that: AasTypes.SpecificAssetId
+  ): AasJsonization.JsonValue | null {
+    return null;
+  }
+  /* eslint-enable @typescript-eslint/no-unused-vars */
+
+  transformSubmodel(that: AasTypes.Submodel): AasJsonization.JsonValue | null {
+    if (that.submodelElements === null || !this.includesNestedElements()) {
+      return {};
+    }
+    return this.transformElementsByIdShort(that.submodelElements);
+  }
+
+  transformRelationshipElement(
+    that: AasTypes.RelationshipElement
+  ): AasJsonization.JsonValue | null {
+    return {
+      first: SERIALIZER.transform(that.first),
+      second: SERIALIZER.transform(that.second)
+    };
+  }
+
+  transformSubmodelElementList(
+    that: AasTypes.SubmodelElementList
+  ): AasJsonization.JsonValue | null {
+    if (that.value === null || !this.includesNestedElements()) {
+      return [];
+    }
+
+    const jsonable = new Array<AasJsonization.JsonValue>();
+    this.depth++;
+    for (const item of that.value) {
+      // The items without a value are kept as null so that the positions of
+      // the other items are preserved.
+      const value = this.transform(item);
+      jsonable.push(value !== null ? value : <AasJsonization.JsonValue>(<unknown>null));
+    }
+    this.depth--;
+    return jsonable;
+  }
+
+  transformSubmodelElementCollection(
+    that: AasTypes.SubmodelElementCollection
+  ): AasJsonization.JsonValue | null {
+    if (that.value === null || !this.includesNestedElements()) {
+      return {};
+    }
+    return this.transformElementsByIdShort(that.value);
+  }
+
+  transformProperty(that: AasTypes.Property): AasJsonization.JsonValue | null {
+    return that.value !== null
+      ? AasDeserialization.xsdValueToValueOnly(that.value, that.valueType)
+      : null;
+  }
+
+  transformMultiLanguageProperty(
+    that: AasTypes.MultiLanguageProperty
+  ): AasJsonization.JsonValue | null {
+    if (that.value === null) {
+      return null;
+    }
+
+    const jsonable = new Array<AasJsonization.JsonObject>();
+    for (const langString of that.value) {
+      jsonable.push({ [langString.language]: langString.text });
+    }
+    return jsonable;
+  }
+
+  transformRange(that: AasTypes.Range): AasJsonization.JsonValue | null {
+    const jsonable: AasJsonization.JsonObject = {};
+    if (that.min !== null) {
+      jsonable["min"] = AasDeserialization.xsdValueToValueOnly(
+        that.min,
+        that.valueType
+      );
+    }
+    if (that.max !== null) {
+      jsonable["max"] = AasDeserialization.xsdValueToValueOnly(
+        that.max,
+        that.valueType
+      );
+    }
+    return jsonable;
+  }
+
+  transformReferenceElement(
+    that: AasTypes.ReferenceElement
+  ): AasJsonization.JsonValue | null {
+    return that.value !== null ? SERIALIZER.transform(that.value) : null;
+  }
+
+  transformBlob(that: AasTypes.Blob): AasJsonization.JsonValue | null {
+    const jsonable: AasJsonization.JsonObject = { contentType: that.contentType };
+
+    if (!this.withoutBlobValue) {
+      // See Serializer.transformBlob on the reuse of the original text.
+      const encodedValue = AasDeserialization.encodedBlobValue(that);
+      if (encodedValue !== null) {
+        jsonable["value"] = encodedValue;
+      } else if (that.value !== null) {
+        jsonable["value"] = AasCommon.base64Encode(that.value);
+      }
+    }
+
+    return jsonable;
+  }
+
+  transformFile(that: AasTypes.File): AasJsonization.JsonValue | null {
+    const jsonable: AasJsonization.JsonObject = { contentType: that.contentType };
+    if (that.value !== null) {
+      jsonable["value"] = that.value;
+    }
+    return jsonable;
+  }
+
+  transformAnnotatedRelationshipElement(
+    that: AasTypes.AnnotatedRelationshipElement
+  ): AasJsonization.JsonValue | null {
+    const jsonable: AasJsonization.JsonObject = {
+      first: SERIALIZER.transform(that.first),
+      second: SERIALIZER.transform(that.second)
+    };
+
+    if (that.annotations !== null && this.includesNestedElements()) {
+      const annotations = new Array<AasJsonization.JsonObject>();
+      this.depth++;
+      for (const annotation of that.annotations) {
+        const value = this.transform(annotation);
+        if (value !== null && annotation.idShort !== null) {
+          annotations.push({ [annotation.idShort]: value });
+        }
+      }
+      this.depth--;
+      jsonable["annotations"] = annotations;
+    }
+
+    return jsonable;
+  }
+
+  transformEntity(that: AasTypes.Entity): AasJsonization.JsonValue | null {
+    const jsonable: AasJsonization.JsonObject = {};
+
+    if (that.statements !== null && this.includesNestedElements()) {
+      jsonable["statements"] = this.transformElementsByIdShort(that.statements);
+    }
+
+    jsonable["entityType"] = AasStringification.mustEntityTypeToString(
+      that.entityType
+    );
+
+    if (that.globalAssetId !== null) {
+      jsonable["globalAssetId"] = SERIALIZER.transform(that.globalAssetId);
+    }
+
+    if (that.specificAssetId !== null) {
+      jsonable["specificAssetId"] = SERIALIZER.transform(that.specificAssetId);
+    }
+
+    return jsonable;
+  }
+
+  /* eslint-disable @typescript-eslint/no-unused-vars */
+  transformEventPayload(that: AasTypes.EventPayload): AasJsonization.JsonValue | null {
+    return null;
+  }
+  /* eslint-enable @typescript-eslint/no-unused-vars */
+
+  transformBasicEventElement(
+    that: AasTypes.BasicEventElement
+  ): AasJsonization.JsonValue | null {
+    return { observed: SERIALIZER.transform(that.observed) };
+  }
+
+  /* eslint-disable @typescript-eslint/no-unused-vars */
+  transformOperation(that: AasTypes.Operation): AasJsonization.JsonValue | null {
+    return null;
+  }
+  /* eslint-enable @typescript-eslint/no-unused-vars */
+
+  /* eslint-disable @typescript-eslint/no-unused-vars */
+  transformOperationVariable(
+    that: AasTypes.OperationVariable
+  ): AasJsonization.JsonValue | null {
+    return null;
+  }
+  /* eslint-enable @typescript-eslint/no-unused-vars */
+
+  /* eslint-disable @typescript-eslint/no-unused-vars */
+  transformCapability(that: AasTypes.Capability): AasJsonization.JsonValue | null {
+    return null;
+  }
+  /* eslint-enable @typescript-eslint/no-unused-vars */
+
+  /* eslint-disable @typescript-eslint/no-unused-vars */
+  transformConceptDescription(
+    that: AasTypes.ConceptDescription
+  ): AasJsonization.JsonValue | null {
+    return null;
+  }
+  /* eslint-enable @typescript-eslint/no-unused-vars */
+
+  /* eslint-disable @typescript-eslint/no-unused-vars */
+  transformReference(that: AasTypes.Reference): AasJsonization.JsonValue | null {
+    return null;
+  }
+  /* eslint-enable @typescript-eslint/no-unused-vars */
+
+  /* eslint-disable @typescript-eslint/no-unused-vars */
+  transformKey(that: AasTypes.Key): AasJsonization.JsonValue | null {
+    return null;
+  }
+  /* eslint-enable @typescript-eslint/no-unused-vars */
+
+  /* eslint-disable @typescript-eslint/no-unused-vars */
+  transformLangString(that: AasTypes.LangString): AasJsonization.JsonValue | null {
+    return null;
+  }
+  /* eslint-enable @typescript-eslint/no-unused-vars */
+
+  /* eslint-disable @typescript-eslint/no-unused-vars */
+  transformEnvironment(that: AasTypes.Environment): AasJsonization.JsonValue | null {
+    return null;
+  }
+  /* eslint-enable @typescript-eslint/no-unused-vars */
+
+  /* eslint-disable @typescript-eslint/no-unused-vars */
+  transformEmbeddedDataSpecification(
+    that: AasTypes.EmbeddedDataSpecification
+  ): AasJsonization.JsonValue | null {
+    return null;
+  }
+  /* eslint-enable @typescript-eslint/no-unused-vars */
+
+  /* eslint-disable @typescript-eslint/no-unused-vars */
+  transformValueReferencePair(
+    that: AasTypes.ValueReferencePair
+  ): AasJsonization.JsonValue | null {
+    return null;
+  }
+  /* eslint-enable @typescript-eslint/no-unused-vars */
+
+  /* eslint-disable @typescript-eslint/no-unused-vars */
+  transformValueList(that: AasTypes.ValueList): AasJsonization.JsonValue | null {
+    return null;
+  }
+  /* eslint-enable @typescript-eslint/no-unused-vars */
+
+  /* eslint-disable @typescript-eslint/no-unused-vars */
+  transformDataSpecificationIec61360(
+    that: AasTypes.DataSpecificationIec61360
+  ): AasJsonization.JsonValue | null {
+    return null;
+  }
+  /* eslint-enable @typescript-eslint/no-unused-vars */
+
+  /* eslint-disable @typescript-eslint/no-unused-vars */
+  transformDataSpecificationPhysicalUnit(
+    that: AasTypes.DataSpecificationPhysicalUnit
+  ): AasJsonization.JsonValue | null {
+    return null;
+  }
+  /* eslint-enable @typescript-eslint/no-unused-vars */
+}
+
+const VALUE_ONLY_SERIALIZER = /*@__PURE__*/ new ValueOnlySerializer();
+
+/**
+ * Convert `that` to its ValueOnly representation (`$value`) as defined in
+ * Part 2 of the AAS specification.
+ *
+ * @remarks
+ * The ValueOnly representation contains only the values of the submodel elements,
+ * keyed by their `idShort`'s, and leaves out all the other properties.
+ *
+ * @param that - to be converted
+ * @param options - to control the serialization, if any
+ * @returns JSON-able structure, or `null` if `that` has no value, such as
+ * an operation or a capability
+ */
+export function toValueOnlyJsonable(
+  that: AasTypes.Submodel | AasTypes.ISubmodelElement,
+  options: SerializationOptions | null = null
+): AasJsonization.JsonValue | null {
+  if (options === null) {
+    return VALUE_ONLY_SERIALIZER.transform(that);
+  }
+
+  return new ValueOnlySerializer(options).transform(that);
+}
+
+/**
+ * Serialize `that` to the JSON text of its ValueOnly representation
+ * chunk by chunk.
+ *
+ * @remarks
+ * The submodel elements directly beneath `that` are serialized one at a time,
+ * so only one of them needs to be held in memory as a JSON-able structure.
+ * In node.js, you can pipe the chunks to a response with
+ * `Readable.from(toValueOnlyText(submodel)).pipe(response)`.
+ *
+ * @param that - to be serialized
+ * @param options - to control the serialization, if any
+ * @returns chunks of the JSON text
+ */
+export function* toValueOnlyText(
+  that: AasTypes.Submodel | AasTypes.ISubmodelElement,
+  options: SerializationOptions | null = null
+): IterableIterator<string> {
+  let elements: Array<AasTypes.ISubmodelElement> | null = null;
+  if (maxDepthFrom(options) !== 0) {
+    if (AasTypes.isSubmodel(that)) {
+      elements = that.submodelElements;
+    } else if (AasTypes.isSubmodelElementCollection(that)) {
+      elements = that.value;
+    }
+  }
+
+  if (elements === null) {
+    yield JSON.stringify(toValueOnlyJsonable(that, options));
+    return;
+  }
+
+  // We need a serializer of our own, since the caller might interleave
+  // the chunks of different serializations.
+  const serializer = new ValueOnlySerializer(options);
+
+  yield "{";
+  let first = true;
+  for (const chunk of serializer.overElementsByIdShort(elements)) {
+    yield first ? chunk : "," + chunk;
+    first = false;
+  }
+  yield "}";
+}
+
+/**
+ * List the properties which make up the ValueOnly representation, and are hence
+ * left out from the Metadata representation.
+ */
+const VALUE_PROPERTIES = /*@__PURE__*/ new Map<string, Array<string>>([
+  ["Submodel", ["submodelElements"]],
+  ["RelationshipElement", ["first", "second"]],
+  ["SubmodelElementList", ["value"]],
+  ["SubmodelElementCollection", ["value"]],
+  ["Property", ["value"]],
+  ["MultiLanguageProperty", ["value"]],
+  ["Range", ["min", "max"]],
+  ["ReferenceElement", ["value"]],
+  ["Blob", ["contentType", "value"]],
+  ["File", ["contentType", "value"]],
+  ["AnnotatedRelationshipElement", ["first", "second", "annotations"]],
+  ["Entity", ["statements", "entityType", "globalAssetId", "specificAssetId"]],
+  ["BasicEventElement", ["observed"]]
+]);
+
+// The nested submodel elements and the blob values are left out anyhow, so we
+// do not even serialize them.
+const METADATA_SERIALIZER = /*@__PURE__*/ new Serializer({
+  depth: 0,
+  withoutBlobValue: true
+});
+
+/**
+ * Convert `that` to its Metadata representation (`$metadata`) as defined in
+ * Part 2 of the AAS specification.
+ *
+ * @remarks
+ * The Metadata representation contains all the properties of `that` except
+ * the ones which make up its ValueOnly representation, including the nested
+ * submodel elements.
+ *
+ * @param that - to be converted
+ * @returns JSON-able structure
+ */
+export function toMetadataJsonable(
+  that: AasTypes.Submodel | AasTypes.ISubmodelElement
+): AasJsonization.JsonObject {
+  const jsonable = METADATA_SERIALIZER.transform(that);
+
+  const valueProperties = VALUE_PROPERTIES.get(<string>jsonable["modelType"]);
+  if (valueProperties !== undefined) {
+    for (const name of valueProperties) {
+      delete jsonable[name];
+    }
+  }
+
+  return jsonable;
+}
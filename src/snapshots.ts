@@ -0,0 +1,121 @@
+/**
+ * Keep immutable snapshots of an environment which is being edited.
+ *
+ * @remarks
+ * A {@link SnapshotStore} holds the current version of an environment. Each edit
+ * produces a new version by copying only the instances on the path to the edited
+ * item, see {@link diffing!applyPatchCopyOnWrite}. All the other instances are
+ * shared between the versions.
+ *
+ * The readers take the {@link SnapshotStore.current} version and can keep on
+ * reading it while the store moves on, without copying and without locking.
+ * This matters when the readers are asynchronous: the edits which happen while
+ * a reader awaits do not change the snapshot under its feet. An old snapshot is
+ * garbage-collected once no reader refers to it anymore.
+ *
+ * Since the versions share their instances, nobody may modify a snapshot in
+ * place. All the edits must go through the store.
+ */
+
+import * as AasDiffing from "./diffing";
+import * as AasTypes from "./types";
+
+/**
+ * Hold the current snapshot of an environment and produce the new ones
+ * copy-on-write.
+ */
+export class SnapshotStore {
+  private _current: AasTypes.Environment;
+  private _version = 0;
+
+  /**
+   * Current snapshot
+   *
+   * @remarks
+   * The snapshot must not be modified in place.
+   */
+  get current(): AasTypes.Environment {
+    return this._current;
+  }
+
+  /**
+   * Number of the edits applied so far
+   */
+  get version(): number {
+    return this._version;
+  }
+
+  /**
+   * Initialize with the `initial` environment.
+   *
+   * @remarks
+   * The store takes over the `initial` environment, so you must not modify it
+   * in place afterwards.
+   *
+   * @param initial - first snapshot
+   */
+  constructor(initial: AasTypes.Environment) {
+    this._current = initial;
+  }
+
+  /**
+   * Edit the item at `path` in a new snapshot.
+   *
+   * @remarks
+   * See {@link diffing!updateCopyOnWrite} for what `edit` may do.
+   *
+   * If the item can not be found, the current snapshot stays as it is.
+   *
+   * @param path - path to the item, as in {@link diffing!Change.path}
+   * @param edit - modification of the copy of the item
+   * @returns error, if any
+   */
+  update(
+    path: Array<string | number>,
+    edit: (copy: AasTypes.Class) => void
+  ): AasDiffing.PatchError | null {
+    const result = AasDiffing.updateCopyOnWrite(this._current, path, edit);
+    if (result.error !== null) {
+      return result.error;
+    }
+
+    this._current = result.mustValue();
+    this._version++;
+    return null;
+  }
+
+  /**
+   * Apply the `changes` in a new snapshot.
+   *
+   * @remarks
+   * Either all the changes are applied or, if one of them can not be applied,
+   * none of them.
+   *
+   * @param changes - to be applied
+   * @returns error, if any
+   */
+  applyPatch(changes: Iterable<AasDiffing.Change>): AasDiffing.PatchError | null {
+    const result = AasDiffing.applyPatchCopyOnWrite(this._current, changes);
+    if (result.error !== null) {
+      return result.error;
+    }
+
+    this._current = result.mustValue();
+    this._version++;
+    return null;
+  }
+
+  /**
+   * Compute the changes from the `snapshot` to the current one.
+   *
+   * @remarks
+   * If the `snapshot` was taken from this store, the diff skips the shared
+   * sub-trees and takes time proportional to the edits since.
+   *
+   * @param snapshot - earlier snapshot
+   * @returns changes which turn the `snapshot` into the current one
+   */
+  changesSince(snapshot: AasTypes.Environment): Array<AasDiffing.Change> {
+    return AasDiffing.diff(snapshot, this._current);
+  }
+}
@@ -7,7 +7,7 @@
 
 import * as AasTypes from "./types";
 
-const MODELING_KIND_FROM_STRING = new Map<string, AasTypes.ModelingKind>([
+const MODELING_KIND_FROM_STRING = /*@__PURE__*/ new Map<string, AasTypes.ModelingKind>([
   ["Template", AasTypes.ModelingKind.Template],
   ["Instance", AasTypes.ModelingKind.Instance]
 ]);
@@ -23,7 +23,7 @@ export function modelingKindFromString(text: string): AasTypes.ModelingKind | nu
   return result !== undefined ? result : null;
 }
 
-const MODELING_KIND_TO_STRING = new Map<AasTypes.ModelingKind, string>([
+const MODELING_KIND_TO_STRING = /*@__PURE__*/ new Map<AasTypes.ModelingKind, string>([
   [AasTypes.ModelingKind.Template, "Template"],
   [AasTypes.ModelingKind.Instance, "Instance"]
 ]);
@@ -56,7 +56,10 @@ export function mustModelingKindToString(value: AasTypes.ModelingKind): string {
   return result;
 }
 
-const QUALIFIER_KIND_FROM_STRING = new Map<string, AasTypes.QualifierKind>([
+const QUALIFIER_KIND_FROM_STRING = /*@__PURE__*/ new Map<
+  string,
+  AasTypes.QualifierKind
+>([
   ["ValueQualifier", AasTypes.QualifierKind.ValueQualifier],
   ["ConceptQualifier", AasTypes.QualifierKind.ConceptQualifier],
   ["TemplateQualifier", AasTypes.QualifierKind.TemplateQualifier]
@@ -73,7 +76,7 @@ export function qualifierKindFromString(text: string): AasTypes.QualifierKind |
   return result !== undefined ? result : null;
 }
 
-const QUALIFIER_KIND_TO_STRING = new Map<AasTypes.QualifierKind, string>([
+const QUALIFIER_KIND_TO_STRING = /*@__PURE__*/ new Map<AasTypes.QualifierKind, string>([
   [AasTypes.QualifierKind.ValueQualifier, "ValueQualifier"],
   [AasTypes.QualifierKind.ConceptQualifier, "ConceptQualifier"],
   [AasTypes.QualifierKind.TemplateQualifier, "TemplateQualifier"]
@@ -107,7 +110,7 @@ export function mustQualifierKindToString(value: AasTypes.QualifierKind): string
   return result;
 }
 
-const ASSET_KIND_FROM_STRING = new Map<string, AasTypes.AssetKind>([
+const ASSET_KIND_FROM_STRING = /*@__PURE__*/ new Map<string, AasTypes.AssetKind>([
   ["Type", AasTypes.AssetKind.Type],
   ["Instance", AasTypes.AssetKind.Instance]
 ]);
@@ -123,7 +126,7 @@ export function assetKindFromString(text: string): AasTypes.AssetKind | null {
   return result !== undefined ? result : null;
 }
 
-const ASSET_KIND_TO_STRING = new Map<AasTypes.AssetKind, string>([
+const ASSET_KIND_TO_STRING = /*@__PURE__*/ new Map<AasTypes.AssetKind, string>([
   [AasTypes.AssetKind.Type, "Type"],
   [AasTypes.AssetKind.Instance, "Instance"]
 ]);
@@ -156,33 +159,34 @@ export function mustAssetKindToString(value: AasTypes.AssetKind): string {
   return result;
 }
 
-const AAS_SUBMODEL_ELEMENTS_FROM_STRING = new Map<string, AasTypes.AasSubmodelElements>(
+const AAS_SUBMODEL_ELEMENTS_FROM_STRING = /*@__PURE__*/ new Map<
+  string,
+  AasTypes.AasSubmodelElements
+>([
   [
-    [
-      "AnnotatedRelationshipElement",
-      AasTypes.AasSubmodelElements.AnnotatedRelationshipElement
-    ],
-    ["BasicEventElement", AasTypes.AasSubmodelElements.BasicEventElement],
-    ["Blob", AasTypes.AasSubmodelElements.Blob],
-    ["Capability", AasTypes.AasSubmodelElements.Capability],
-    ["DataElement", AasTypes.AasSubmodelElements.DataElement],
-    ["Entity", AasTypes.AasSubmodelElements.Entity],
-    ["EventElement", AasTypes.AasSubmodelElements.EventElement],
-    ["File", AasTypes.AasSubmodelElements.File],
-    ["MultiLanguageProperty", AasTypes.AasSubmodelElements.MultiLanguageProperty],
-    ["Operation", AasTypes.AasSubmodelElements.Operation],
-    ["Property", AasTypes.AasSubmodelElements.Property],
-    ["Range", AasTypes.AasSubmodelElements.Range],
-    ["ReferenceElement", AasTypes.AasSubmodelElements.ReferenceElement],
-    ["RelationshipElement", AasTypes.AasSubmodelElements.RelationshipElement],
-    ["SubmodelElement", AasTypes.AasSubmodelElements.SubmodelElement],
-    ["SubmodelElementList", AasTypes.AasSubmodelElements.SubmodelElementList],
-    [
-      "SubmodelElementCollection",
-      AasTypes.AasSubmodelElements.SubmodelElementCollection
-    ]
+    "AnnotatedRelationshipElement",
+    AasTypes.AasSubmodelElements.AnnotatedRelationshipElement
+  ],
+  ["BasicEventElement", AasTypes.AasSubmodelElements.BasicEventElement],
+  ["Blob", AasTypes.AasSubmodelElements.Blob],
+  ["Capability", AasTypes.AasSubmodelElements.Capability],
+  ["DataElement", AasTypes.AasSubmodelElements.DataElement],
+  ["Entity", AasTypes.AasSubmodelElements.Entity],
+  ["EventElement", AasTypes.AasSubmodelElements.EventElement],
+  ["File", AasTypes.AasSubmodelElements.File],
+  ["MultiLanguageProperty", AasTypes.AasSubmodelElements.MultiLanguageProperty],
+  ["Operation", AasTypes.AasSubmodelElements.Operation],
+  ["Property", AasTypes.AasSubmodelElements.Property],
+  ["Range", AasTypes.AasSubmodelElements.Range],
+  ["ReferenceElement", AasTypes.AasSubmodelElements.ReferenceElement],
+  ["RelationshipElement", AasTypes.AasSubmodelElements.RelationshipElement],
+  ["SubmodelElement", AasTypes.AasSubmodelElements.SubmodelElement],
+  ["SubmodelElementList", AasTypes.AasSubmodelElements.SubmodelElementList],
+  [
+    "SubmodelElementCollection",
+    AasTypes.AasSubmodelElements.SubmodelElementCollection
   ]
-);
+]);
 
 /**
  * Parse `text` as a string representation of {@link types!AasSubmodelElements}.
@@ -197,7 +201,10 @@ export function aasSubmodelElementsFromString(
   return result !== undefined ? result : null;
 }
 
-const AAS_SUBMODEL_ELEMENTS_TO_STRING = new Map<AasTypes.AasSubmodelElements, string>([
+const AAS_SUBMODEL_ELEMENTS_TO_STRING = /*@__PURE__*/ new Map<
+  AasTypes.AasSubmodelElements,
+  string
+>([
   [
     AasTypes.AasSubmodelElements.AnnotatedRelationshipElement,
     "AnnotatedRelationshipElement"
@@ -252,7 +259,7 @@ export function mustAasSubmodelElementsToString(
   return result;
 }
 
-const ENTITY_TYPE_FROM_STRING = new Map<string, AasTypes.EntityType>([
+const ENTITY_TYPE_FROM_STRING = /*@__PURE__*/ new Map<string, AasTypes.EntityType>([
   ["CoManagedEntity", AasTypes.EntityType.CoManagedEntity],
   ["SelfManagedEntity", AasTypes.EntityType.SelfManagedEntity]
 ]);
@@ -268,7 +275,7 @@ export function entityTypeFromString(text: string): AasTypes.EntityType | null {
   return result !== undefined ? result : null;
 }
 
-const ENTITY_TYPE_TO_STRING = new Map<AasTypes.EntityType, string>([
+const ENTITY_TYPE_TO_STRING = /*@__PURE__*/ new Map<AasTypes.EntityType, string>([
   [AasTypes.EntityType.CoManagedEntity, "CoManagedEntity"],
   [AasTypes.EntityType.SelfManagedEntity, "SelfManagedEntity"]
 ]);
@@ -301,7 +308,7 @@ export function mustEntityTypeToString(value: AasTypes.EntityType): string {
   return result;
 }
 
-const DIRECTION_FROM_STRING = new Map<string, AasTypes.Direction>([
+const DIRECTION_FROM_STRING = /*@__PURE__*/ new Map<string, AasTypes.Direction>([
   ["input", AasTypes.Direction.Input],
   ["output", AasTypes.Direction.Output]
 ]);
@@ -317,7 +324,7 @@ export function directionFromString(text: string): AasTypes.Direction | null {
   return result !== undefined ? result : null;
 }
 
-const DIRECTION_TO_STRING = new Map<AasTypes.Direction, string>([
+const DIRECTION_TO_STRING = /*@__PURE__*/ new Map<AasTypes.Direction, string>([
   [AasTypes.Direction.Input, "input"],
   [AasTypes.Direction.Output, "output"]
 ]);
@@ -350,7 +357,10 @@ export function mustDirectionToString(value: AasTypes.Direction): string {
   return result;
 }
 
-const STATE_OF_EVENT_FROM_STRING = new Map<string, AasTypes.StateOfEvent>([
+const STATE_OF_EVENT_FROM_STRING = /*@__PURE__*/ new Map<
+  string,
+  AasTypes.StateOfEvent
+>([
   ["on", AasTypes.StateOfEvent.On],
   ["off", AasTypes.StateOfEvent.Off]
 ]);
@@ -366,7 +376,7 @@ export function stateOfEventFromString(text: string): AasTypes.StateOfEvent | nu
   return result !== undefined ? result : null;
 }
 
-const STATE_OF_EVENT_TO_STRING = new Map<AasTypes.StateOfEvent, string>([
+const STATE_OF_EVENT_TO_STRING = /*@__PURE__*/ new Map<AasTypes.StateOfEvent, string>([
   [AasTypes.StateOfEvent.On, "on"],
   [AasTypes.StateOfEvent.Off, "off"]
 ]);
@@ -399,7 +409,10 @@ export function mustStateOfEventToString(value: AasTypes.StateOfEvent): string {
   return result;
 }
 
-const REFERENCE_TYPES_FROM_STRING = new Map<string, AasTypes.ReferenceTypes>([
+const REFERENCE_TYPES_FROM_STRING = /*@__PURE__*/ new Map<
+  string,
+  AasTypes.ReferenceTypes
+>([
   ["GlobalReference", AasTypes.ReferenceTypes.GlobalReference],
   ["ModelReference", AasTypes.ReferenceTypes.ModelReference]
 ]);
@@ -415,7 +428,10 @@ export function referenceTypesFromString(text: string): AasTypes.ReferenceTypes
   return result !== undefined ? result : null;
 }
 
-const REFERENCE_TYPES_TO_STRING = new Map<AasTypes.ReferenceTypes, string>([
+const REFERENCE_TYPES_TO_STRING = /*@__PURE__*/ new Map<
+  AasTypes.ReferenceTypes,
+  string
+>([
   [AasTypes.ReferenceTypes.GlobalReference, "GlobalReference"],
   [AasTypes.ReferenceTypes.ModelReference, "ModelReference"]
 ]);
@@ -448,7 +464,7 @@ export function mustReferenceTypesToString(value: AasTypes.ReferenceTypes): stri
   return result;
 }
 
-const KEY_TYPES_FROM_STRING = new Map<string, AasTypes.KeyTypes>([
+const KEY_TYPES_FROM_STRING = /*@__PURE__*/ new Map<string, AasTypes.KeyTypes>([
   ["FragmentReference", AasTypes.KeyTypes.FragmentReference],
   ["GlobalReference", AasTypes.KeyTypes.GlobalReference],
   ["AnnotatedRelationshipElement", AasTypes.KeyTypes.AnnotatedRelationshipElement],
@@ -486,7 +502,7 @@ export function keyTypesFromString(text: string): AasTypes.KeyTypes | null {
   return result !== undefined ? result : null;
 }
 
-const KEY_TYPES_TO_STRING = new Map<AasTypes.KeyTypes, string>([
+const KEY_TYPES_TO_STRING = /*@__PURE__*/ new Map<AasTypes.KeyTypes, string>([
   [AasTypes.KeyTypes.FragmentReference, "FragmentReference"],
   [AasTypes.KeyTypes.GlobalReference, "GlobalReference"],
   [AasTypes.KeyTypes.AnnotatedRelationshipElement, "AnnotatedRelationshipElement"],
@@ -541,7 +557,10 @@ export function mustKeyTypesToString(value: AasTypes.KeyTypes): string {
   return result;
 }
 
-const DATA_TYPE_DEF_XSD_FROM_STRING = new Map<string, AasTypes.DataTypeDefXsd>([
+const DATA_TYPE_DEF_XSD_FROM_STRING = /*@__PURE__*/ new Map<
+  string,
+  AasTypes.DataTypeDefXsd
+>([
   ["xs:anyURI", AasTypes.DataTypeDefXsd.AnyUri],
   ["xs:base64Binary", AasTypes.DataTypeDefXsd.Base64Binary],
   ["xs:boolean", AasTypes.DataTypeDefXsd.Boolean],
@@ -588,7 +607,10 @@ export function dataTypeDefXsdFromString(text: string): AasTypes.DataTypeDefXsd
   return result !== undefined ? result : null;
 }
 
-const DATA_TYPE_DEF_XSD_TO_STRING = new Map<AasTypes.DataTypeDefXsd, string>([
+const DATA_TYPE_DEF_XSD_TO_STRING = /*@__PURE__*/ new Map<
+  AasTypes.DataTypeDefXsd,
+  string
+>([
   [AasTypes.DataTypeDefXsd.AnyUri, "xs:anyURI"],
   [AasTypes.DataTypeDefXsd.Base64Binary, "xs:base64Binary"],
   [AasTypes.DataTypeDefXsd.Boolean, "xs:boolean"],
@@ -652,7 +674,10 @@ export function mustDataTypeDefXsdToString(value: AasTypes.DataTypeDefXsd): stri
   return result;
 }
 
-const DATA_TYPE_IEC_61360_FROM_STRING = new Map<string, AasTypes.DataTypeIec61360>([
+const DATA_TYPE_IEC_61360_FROM_STRING = /*@__PURE__*/ new Map<
+  string,
+  AasTypes.DataTypeIec61360
+>([
   ["DATE", AasTypes.DataTypeIec61360.Date],
   ["STRING", AasTypes.DataTypeIec61360.String],
   ["STRING_TRANSLATABLE", AasTypes.DataTypeIec61360.StringTranslatable],
@@ -687,7 +712,10 @@ export function dataTypeIec61360FromString(
   return result !== undefined ? result : null;
 }
 
-const DATA_TYPE_IEC_61360_TO_STRING = new Map<AasTypes.DataTypeIec61360, string>([
+const DATA_TYPE_IEC_61360_TO_STRING = /*@__PURE__*/ new Map<
+  AasTypes.DataTypeIec61360,
+  string
+>([
   [AasTypes.DataTypeIec61360.Date, "DATE"],
   [AasTypes.DataTypeIec61360.String, "STRING"],
   [AasTypes.DataTypeIec61360.StringTranslatable, "STRING_TRANSLATABLE"],
@@ -739,7 +767,7 @@ export function mustDataTypeIec61360ToString(value: AasTypes.DataTypeIec61360):
   return result;
 }
 
-const LEVEL_TYPE_FROM_STRING = new Map<string, AasTypes.LevelType>([
+const LEVEL_TYPE_FROM_STRING = /*@__PURE__*/ new Map<string, AasTypes.LevelType>([
   ["Min", AasTypes.LevelType.Min],
   ["Max", AasTypes.LevelType.Max],
   ["Nom", AasTypes.LevelType.Nom],
@@ -757,7 +785,7 @@ export function levelTypeFromString(text: string): AasTypes.LevelType | null {
   return result !== undefined ? result : null;
 }
 
-const LEVEL_TYPE_TO_STRING = new Map<AasTypes.LevelType, string>([
+const LEVEL_TYPE_TO_STRING = /*@__PURE__*/ new Map<AasTypes.LevelType, string>([
   [AasTypes.LevelType.Min, "Min"],
   [AasTypes.LevelType.Max, "Max"],
   [AasTypes.LevelType.Nom, "Nom"],
@@ -792,5 +820,74 @@ export function mustLevelTypeToString(value: AasTypes.LevelType): string {
   return result;
 }
 
+const MODEL_TYPE_TO_STRING = /*@__PURE__*/ new Map<object, string>([
+  [AasTypes.Extension, "Extension"],
+  [AasTypes.AdministrativeInformation, "AdministrativeInformation"],
+  [AasTypes.Qualifier, "Qualifier"],
+  [AasTypes.AssetAdministrationShell, "AssetAdministrationShell"],
+  [AasTypes.AssetInformation, "AssetInformation"],
+  [AasTypes.Resource, "Resource"],
+  [AasTypes.SpecificAssetId, "SpecificAssetId"],
+  [AasTypes.Submodel, "Submodel"],
+  [AasTypes.RelationshipElement, "RelationshipElement"],
+  [AasTypes.SubmodelElementList, "SubmodelElementList"],
+  [AasTypes.SubmodelElementCollection, "SubmodelElementCollection"],
+  [AasTypes.Property, "Property"],
+  [AasTypes.MultiLanguageProperty, "MultiLanguageProperty"],
+  [AasTypes.Range, "Range"],
+  [AasTypes.ReferenceElement, "ReferenceElement"],
+  [AasTypes.Blob, "Blob"],
+  [AasTypes.File, "File"],
+  [AasTypes.AnnotatedRelationshipElement, "AnnotatedRelationshipElement"],
+  [AasTypes.Entity, "Entity"],
+  [AasTypes.EventPayload, "EventPayload"],
+  [AasTypes.BasicEventElement, "BasicEventElement"],
+  [AasTypes.Operation, "Operation"],
+  [AasTypes.OperationVariable, "OperationVariable"],
+  [AasTypes.Capability, "Capability"],
+  [AasTypes.ConceptDescription, "ConceptDescription"],
+  [AasTypes.Reference, "Reference"],
+  [AasTypes.Key, "Key"],
+  [AasTypes.LangString, "LangString"],
+  [AasTypes.Environment, "Environment"],
+  [AasTypes.EmbeddedDataSpecification, "EmbeddedDataSpecification"],
+  [AasTypes.ValueReferencePair, "ValueReferencePair"],
+  [AasTypes.ValueList, "ValueList"],
+  [AasTypes.DataSpecificationIec61360, "DataSpecificationIec61360"],
+  [AasTypes.DataSpecificationPhysicalUnit, "DataSpecificationPhysicalUnit"]
+]);
+
+/**
+ * Translate the concrete class of `that` instance to its model type.
+ *
+ * @remarks
+ * Use the model type instead of `that.constructor.name` in the messages, since
+ * the class names are mangled in the minified bundles.
+ *
+ * @param that - instance whose class is to be stringified
+ * @returns model type of `that` instance, if its class is known, and `null` otherwise
+ */
+export function modelTypeToString(that: AasTypes.Class): string | null {
+  const result = MODEL_TYPE_TO_STRING.get(that.constructor);
+  return result !== undefined ? result : null;
+}
+
+/**
+ * Translate the concrete class of `that` instance to its model type.
+ *
+ * @param that - instance whose class is to be stringified
+ * @returns model type of `that` instance
+ * @throws
+ * {@link https://developer.mozilla.org/en-US/docs/Web/JavaScript/Reference/Global_Objects/Error|Error}
+ * if the class of `that` instance is unknown
+ */
+export function mustModelTypeToString(that: AasTypes.Class): string {
+  const result = MODEL_TYPE_TO_STRING.get(that.constructor);
+  if (result === undefined) {
+    throw new Error("Invalid instance of an unknown class");
+  }
+  return result;
+}
+
 // This code has been automatically generated by aas-core-codegen.
 // Do NOT edit or append.
@@ -0,0 +1,318 @@
+/**
+ * Track the modifications of a model, and notify about them.
+ *
+ * @remarks
+ * The properties of the classes in {@link types} are plain properties, so nobody
+ * notices when they change. If you keep structures derived from a model, such as
+ * an index of the identifiables by their IDs or the serialized JSON of
+ * the submodels, you either have to tell them what changed, or rebuild them over
+ * the whole model.
+ *
+ * A {@link ChangeTracker} keeps the parent of each instance of a model. After you
+ * modify an instance, you let the tracker know with
+ * {@link ChangeTracker.markDirty}, or you modify it through
+ * {@link ChangeTracker.set} in the first place. The tracker marks the instance and
+ * its ancestors as dirty, adopts the sub-trees which have been attached to it,
+ * forgets the ones which have been detached, and emits a {@link MutationEvent} to
+ * the listeners.
+ *
+ * The tracking is opt-in, so the models which are not tracked pay nothing for it.
+ * On the flip side, the tracker does not notice the modifications which it is not
+ * told about.
+ *
+ * The tracker expects a tree: each instance has at most one parent. Hence you
+ * can not track the snapshots of {@link snapshots}, which share their instances.
+ * The same goes for the models de-serialized with
+ * an {@link deserialization!InterningPool}, see {@link ChangeTracker}.
+ */
+
+import * as AasStringification from "./stringification";
+import * as AasTypes from "./types";
+
+/**
+ * Describe a modification of an instance of the tracked model.
+ */
+export class MutationEvent {
+  /**
+   * Modified instance
+   */
+  readonly instance: AasTypes.Class;
+
+  /**
+   * Name of the modified property, if known
+   */
+  readonly property: string | null;
+
+  /**
+   * Roots of the sub-trees which have been attached to the instance
+   *
+   * @remarks
+   * A sub-tree which has been moved from another parent in the model is reported
+   * as attached to its new parent, but not as detached from the old one.
+   */
+  readonly attached: Array<AasTypes.Class>;
+
+  /**
+   * Roots of the sub-trees which have been detached from the instance
+   */
+  readonly detached: Array<AasTypes.Class>;
+
+  constructor(
+    instance: AasTypes.Class,
+    property: string | null,
+    attached: Array<AasTypes.Class>,
+    detached: Array<AasTypes.Class>
+  ) {
+    this.instance = instance;
+    this.property = property;
+    this.attached = attached;
+    this.detached = detached;
+  }
+}
+
+/**
+ * Receive the modifications of the tracked model.
+ */
+export type MutationListener = (event: MutationEvent) => void;
+
+/**
+ * Track the modifications of the model under {@link root}.
+ *
+ * @remarks
+ * The tracker keeps a single parent for each instance. If an instance appears
+ * several times in the model, only the parent seen last is recorded. This is
+ * the case for the instances of {@link types!Reference}, {@link types!Key} and
+ * {@link types!LangString} shared by an {@link deserialization!InterningPool}:
+ * when you modify such an instance in place and mark it dirty, only the last of
+ * its parents and the ancestors of that parent are marked dirty, while the change
+ * shows up under all the other parents as well.
+ *
+ * De-serialize the tracked models without a pool, or copy them with
+ * {@link copying!deepCopy} before you start tracking them. Alternatively, replace
+ * the shared instances as a whole through {@link set} instead of modifying them
+ * in place.
+ */
+export class ChangeTracker {
+  /**
+   * Root of the tracked model
+   */
+  readonly root: AasTypes.Class;
+
+  /**
+   * Map each tracked instance, except for the root, to its parent
+   */
+  private readonly parents = new WeakMap<AasTypes.Class, AasTypes.Class>();
+
+  /**
+   * Map each tracked instance to its children as of the last time we looked
+   */
+  private readonly children = new WeakMap<AasTypes.Class, Array<AasTypes.Class>>();
+
+  private dirty = new Set<AasTypes.Class>();
+
+  private readonly listeners = new Array<MutationListener>();
+
+  /**
+   * Start tracking the model under `root`.
+   *
+   * @remarks
+   * This walks over the whole model once. None of the instances is dirty
+   * initially.
+   *
+   * @param root - of the model to be tracked
+   */
+  constructor(root: AasTypes.Class) {
+    this.root = root;
+    this.adopt(root, null, false);
+  }
+
+  /**
+   * Register the sub-tree under `that` as a child of `parent`.
+   *
+   * @param that - root of the sub-tree
+   * @param parent - of `that`, null if `that` is the root of the model
+   * @param markDirty - if set, mark all the instances of the sub-tree dirty
+   */
+  private adopt(
+    that: AasTypes.Class,
+    parent: AasTypes.Class | null,
+    markDirty: boolean
+  ): void {
+    if (parent !== null) {
+      this.parents.set(that, parent);
+    }
+
+    const stack = [that];
+    for (let instance = stack.pop(); instance !== undefined; instance = stack.pop()) {
+      if (markDirty) {
+        this.dirty.add(instance);
+      }
+
+      const children = Array.from(instance.descendOnce());
+      this.children.set(instance, children);
+
+      for (const child of children) {
+        this.parents.set(child, instance);
+        stack.push(child);
+      }
+    }
+  }
+
+  /**
+   * Forget the sub-tree under `that`.
+   */
+  private forget(that: AasTypes.Class): void {
+    this.parents.delete(that);
+
+    const stack = [that];
+    for (let instance = stack.pop(); instance !== undefined; instance = stack.pop()) {
+      this.dirty.delete(instance);
+
+      for (const child of this.children.get(instance) ?? []) {
+        // The child might have been moved to another parent in the meanwhile.
+        if (this.parents.get(child) === instance) {
+          this.parents.delete(child);
+          stack.push(child);
+        }
+      }
+      this.children.delete(instance);
+    }
+  }
+
+  /**
+   * Check whether `that` instance belongs to the tracked model.
+   */
+  isTracked(that: AasTypes.Class): boolean {
+    return that === this.root || this.parents.has(that);
+  }
+
+  /**
+   * Get the parent of `that` instance in the tracked model.
+   *
+   * @returns the parent, or null if `that` is the root or is not tracked
+   */
+  parentOf(that: AasTypes.Class): AasTypes.Class | null {
+    return this.parents.get(that) ?? null;
+  }
+
+  /**
+   * Check whether `that` instance has been modified, attached or is an ancestor
+   * of such an instance since the last {@link takeDirty}.
+   */
+  isDirty(that: AasTypes.Class): boolean {
+    return this.dirty.has(that);
+  }
+
+  /**
+   * Get the dirty instances, and start over with none.
+   *
+   * @remarks
+   * The dirty instances are the modified ones, all the instances of the attached
+   * sub-trees, and all their ancestors.
+   *
+   * @returns dirty instances since the last call
+   */
+  takeDirty(): Set<AasTypes.Class> {
+    const result = this.dirty;
+    this.dirty = new Set<AasTypes.Class>();
+    return result;
+  }
+
+  /**
+   * Call `listener` on each modification from now on.
+   *
+   * @returns function which stops the calls
+   */
+  subscribe(listener: MutationListener): () => void {
+    this.listeners.push(listener);
+
+    return () => {
+      const index = this.listeners.indexOf(listener);
+      if (index !== -1) {
+        this.listeners.splice(index, 1);
+      }
+    };
+  }
+
+  /**
+   * Record that `that` instance has been modified in place.
+   *
+   * @remarks
+   * We compare the children of the instance against the ones we saw last time to
+   * find the attached and the detached sub-trees. This takes time proportional to
+   * the number of the children, plus the size of the attached sub-trees.
+   *
+   * @param that - modified instance of the tracked model
+   * @param property - name of the modified property, if known
+   * @throws an `Error` if `that` instance is not tracked
+   */
+  markDirty(that: AasTypes.Class, property: string | null = null): void {
+    if (!this.isTracked(that)) {
+      throw new Error(
+        "Expected an instance of the tracked model, but got an untracked " +
+          AasStringification.mustModelTypeToString(that)
+      );
+    }
+
+    const before = this.children.get(that) ?? [];
+    const after = Array.from(that.descendOnce());
+
+    const afterSet = new Set<AasTypes.Class>(after);
+    const detached = before.filter(
+      (child) => !afterSet.has(child) && this.parents.get(child) === that
+    );
+    for (const child of detached) {
+      this.forget(child);
+    }
+
+    const attached = after.filter((child) => this.parents.get(child) !== that);
+    for (const child of attached) {
+      this.adopt(child, that, true);
+    }
+
+    this.children.set(that, after);
+
+    // The ancestors of a dirty instance are already dirty, so we can stop there.
+    for (
+      let instance: AasTypes.Class | undefined = that;
+      instance !== undefined && !this.dirty.has(instance);
+      instance = this.parents.get(instance)
+    ) {
+      this.dirty.add(instance);
+    }
+
+    if (this.listeners.length > 0) {
+      const event = new MutationEvent(that, property, attached, detached);
+
+      // The listeners might unsubscribe while we notify them.
+      for (const listener of this.listeners.slice()) {
+        listener(event);
+      }
+    }
+  }
+
+  /**
+   * Set the `property` of `that` instance to `value`, and record it with
+   * {@link markDirty}.
+   *
+   * @param that - instance of the tracked model
+   * @param property - to be set
+   * @param value - to be set
+   * @throws an `Error` if `that` instance is not tracked
+   */
+  set<ClassT extends AasTypes.Class, KeyT extends keyof ClassT & string>(
+    that: ClassT,
+    property: KeyT,
+    value: ClassT[KeyT]
+  ): void {
+    if (!this.isTracked(that)) {
+      throw new Error(
+        "Expected an instance of the tracked model, but got an untracked " +
+          AasStringification.mustModelTypeToString(that)
+      );
+    }
+
+    that[property] = value;
+    this.markDirty(that, property);
+  }
+}
@@ -14044,7 +14044,7 @@ class AsHasSemanticsTransformer extends AbstractTransformer<IHasSemantics | null
   /* eslint-enable @typescript-eslint/no-unused-vars */
 }
 
-const AS_HAS_SEMANTICS_TRANSFORMER = new AsHasSemanticsTransformer();
+const AS_HAS_SEMANTICS_TRANSFORMER = /*@__PURE__*/ new AsHasSemanticsTransformer();
 
 /**
  * Try to cast `that` instance to
@@ -14277,7 +14277,7 @@ class AsHasExtensionsTransformer extends AbstractTransformer<IHasExtensions | nu
   /* eslint-enable @typescript-eslint/no-unused-vars */
 }
 
-const AS_HAS_EXTENSIONS_TRANSFORMER = new AsHasExtensionsTransformer();
+const AS_HAS_EXTENSIONS_TRANSFORMER = /*@__PURE__*/ new AsHasExtensionsTransformer();
 
 /**
  * Try to cast `that` instance to
@@ -14487,7 +14487,7 @@ class AsReferableTransformer extends AbstractTransformer<IReferable | null> {
   /* eslint-enable @typescript-eslint/no-unused-vars */
 }
 
-const AS_REFERABLE_TRANSFORMER = new AsReferableTransformer();
+const AS_REFERABLE_TRANSFORMER = /*@__PURE__*/ new AsReferableTransformer();
 
 /**
  * Try to cast `that` instance to
@@ -14727,7 +14727,7 @@ class AsIdentifiableTransformer extends AbstractTransformer<IIdentifiable | null
   /* eslint-enable @typescript-eslint/no-unused-vars */
 }
 
-const AS_IDENTIFIABLE_TRANSFORMER = new AsIdentifiableTransformer();
+const AS_IDENTIFIABLE_TRANSFORMER = /*@__PURE__*/ new AsIdentifiableTransformer();
 
 /**
  * Try to cast `that` instance to
@@ -14933,7 +14933,7 @@ class AsHasKindTransformer extends AbstractTransformer<IHasKind | null> {
   /* eslint-enable @typescript-eslint/no-unused-vars */
 }
 
-const AS_HAS_KIND_TRANSFORMER = new AsHasKindTransformer();
+const AS_HAS_KIND_TRANSFORMER = /*@__PURE__*/ new AsHasKindTransformer();
 
 /**
  * Try to cast `that` instance to
@@ -15149,7 +15149,8 @@ class AsHasDataSpecificationTransformer extends AbstractTransformer<IHasDataSpec
   /* eslint-enable @typescript-eslint/no-unused-vars */
 }
 
-const AS_HAS_DATA_SPECIFICATION_TRANSFORMER = new AsHasDataSpecificationTransformer();
+const AS_HAS_DATA_SPECIFICATION_TRANSFORMER =
+  /*@__PURE__*/ new AsHasDataSpecificationTransformer();
 
 /**
  * Try to cast `that` instance to
@@ -15392,7 +15393,7 @@ class AsQualifiableTransformer extends AbstractTransformer<IQualifiable | null>
   /* eslint-enable @typescript-eslint/no-unused-vars */
 }
 
-const AS_QUALIFIABLE_TRANSFORMER = new AsQualifiableTransformer();
+const AS_QUALIFIABLE_TRANSFORMER = /*@__PURE__*/ new AsQualifiableTransformer();
 
 /**
  * Try to cast `that` instance to
@@ -15742,7 +15743,8 @@ class AsSubmodelElementTransformer extends AbstractTransformer<ISubmodelElement
   /* eslint-enable @typescript-eslint/no-unused-vars */
 }
 
-const AS_SUBMODEL_ELEMENT_TRANSFORMER = new AsSubmodelElementTransformer();
+const AS_SUBMODEL_ELEMENT_TRANSFORMER =
+  /*@__PURE__*/ new AsSubmodelElementTransformer();
 
 /**
  * Try to cast `that` instance to
@@ -15986,7 +15988,8 @@ class AsRelationshipElementTransformer extends AbstractTransformer<IRelationship
   /* eslint-enable @typescript-eslint/no-unused-vars */
 }
 
-const AS_RELATIONSHIP_ELEMENT_TRANSFORMER = new AsRelationshipElementTransformer();
+const AS_RELATIONSHIP_ELEMENT_TRANSFORMER =
+  /*@__PURE__*/ new AsRelationshipElementTransformer();
 
 /**
  * Try to cast `that` instance to
@@ -16268,7 +16271,7 @@ class AsDataElementTransformer extends AbstractTransformer<IDataElement | null>
   /* eslint-enable @typescript-eslint/no-unused-vars */
 }
 
-const AS_DATA_ELEMENT_TRANSFORMER = new AsDataElementTransformer();
+const AS_DATA_ELEMENT_TRANSFORMER = /*@__PURE__*/ new AsDataElementTransformer();
 
 /**
  * Try to cast `that` instance to
@@ -16707,7 +16710,7 @@ class AsEventElementTransformer extends AbstractTransformer<IEventElement | null
   /* eslint-enable @typescript-eslint/no-unused-vars */
 }
 
-const AS_EVENT_ELEMENT_TRANSFORMER = new AsEventElementTransformer();
+const AS_EVENT_ELEMENT_TRANSFORMER = /*@__PURE__*/ new AsEventElementTransformer();
 
 /**
  * Try to cast `that` instance to
@@ -17153,7 +17156,7 @@ class AsDataSpecificationContentTransformer extends AbstractTransformer<IDataSpe
 }
 
 const AS_DATA_SPECIFICATION_CONTENT_TRANSFORMER =
-  new AsDataSpecificationContentTransformer();
+  /*@__PURE__*/ new AsDataSpecificationContentTransformer();
 
 /**
  * Try to cast `that` instance to
@@ -17551,7 +17554,7 @@ class TypeMatcher extends AbstractTransformerWithContext<Readonly<Class>, boolea
   /* eslint-enable @typescript-eslint/no-unused-vars */
 }
 
-const TYPE_MATCHER = new TypeMatcher();
+const TYPE_MATCHER = /*@__PURE__*/ new TypeMatcher();
 
 /**
  * Check whether the type of `that` matches the type of `other` instance.
@@ -120,19 +120,171 @@ export class VerificationError {
   }
 }
 
+/**
+ * Memoize the results of the expensive checks of values, such as
+ * the pattern matching or the consistency of a value with an XSD type.
+ *
+ * @remarks
+ * Real-world environments repeat the same values over and over again, *e.g.*,
+ * units, language tags, MIME types and booleans. The cache remembers
+ * the results for the most recently checked values and evicts the least
+ * recently used ones once the `capacity` is reached.
+ *
+ * Pass the cache to {@link verify} to use it. You can re-use the same cache
+ * over multiple verifications.
+ */
+export class VerificationCache {
+  /**
+   * Maximum number of the memoized results
+   */
+  readonly capacity: number;
+
+  /**
+   * Number of lookups which found a memoized result
+   */
+  hits: number;
+
+  /**
+   * Number of lookups which did not find a memoized result
+   */
+  misses: number;
+
+  /**
+   * Map keys to results in the order from least to most recently used
+   */
+  private readonly entries: Map<string, boolean>;
+
+  constructor(capacity = 4096) {
+    if (capacity < 1) {
+      throw new Error(`Expected a positive capacity, but got: ${capacity}`);
+    }
+
+    this.capacity = capacity;
+    this.hits = 0;
+    this.misses = 0;
+    this.entries = new Map<string, boolean>();
+  }
+
+  /**
+   * Number of the memoized results
+   */
+  get size(): number {
+    return this.entries.size;
+  }
+
+  /**
+   * Look up the memoized result and mark it as the most recently used.
+   *
+   * @param key - identifying the check and the checked value
+   * @returns the memoized result, or `undefined` if there is none
+   */
+  get(key: string): boolean | undefined {
+    const result = this.entries.get(key);
+    if (result === undefined) {
+      this.misses++;
+      return undefined;
+    }
+
+    this.hits++;
+
+    // JavaScript maps keep the insertion order, so we re-insert the key
+    // to mark it as the most recently used.
+    this.entries.delete(key);
+    this.entries.set(key, result);
+
+    return result;
+  }
+
+  /**
+   * Memoize the `result`, and evict the least recently used result
+   * if the capacity is exceeded.
+   *
+   * @param key - identifying the check and the checked value
+   * @param result - of the check
+   */
+  set(key: string, result: boolean): void {
+    this.entries.set(key, result);
+
+    if (this.entries.size > this.capacity) {
+      const leastRecentlyUsed = this.entries.keys().next();
+      if (leastRecentlyUsed.done !== true) {
+        this.entries.delete(leastRecentlyUsed.value);
+      }
+    }
+  }
+
+  /**
+   * Forget all the memoized results and reset the counters.
+   */
+  clear(): void {
+    this.entries.clear();
+    this.hits = 0;
+    this.misses = 0;
+  }
+}
+
+/**
+ * Cache used by the running verification, if any
+ */
+let activeVerificationCache: VerificationCache | null = null;
+
+/**
+ * Run `regexp` on `text`, or look up the result in the active cache.
+ *
+ * @param name - of the check, used as part of the key
+ * @param regexp - to be run
+ * @param text - to be checked
+ * @returns `true` if `text` matches `regexp`
+ */
+function testMemoized(name: string, regexp: RegExp, text: string): boolean {
+  const cache = activeVerificationCache;
+  if (cache === null) {
+    return regexp.test(text);
+  }
+
+  const key = `${name}:${text}`;
+  let result = cache.get(key);
+  if (result === undefined) {
+    result = regexp.test(text);
+    cache.set(key, result);
+  }
+  return result;
+}
+
+/**
+ * Compile the regular expression with `construct` on the first call, and
+ * return the compiled one on all the further calls.
+ *
+ * @remarks
+ * The patterns are compiled on first use so that importing the module
+ * does not pay for all of them up front.
+ *
+ * @param construct - to compile the regular expression
+ * @returns getter of the compiled regular expression
+ */
+function lazyRegExp(construct: () => RegExp): () => RegExp {
+  let regexp: RegExp | null = null;
+  return () => {
+    if (regexp === null) {
+      regexp = construct();
+    }
+    return regexp;
+  };
+}
+
 function constructMatchesIdShort(): RegExp {
   const pattern = "^[a-zA-Z][a-zA-Z0-9_]+$";
 
   return new RegExp(pattern, "u");
 }
 
-const REGEXP_MATCHES_ID_SHORT = constructMatchesIdShort();
+const REGEXP_MATCHES_ID_SHORT = /*@__PURE__*/ lazyRegExp(constructMatchesIdShort);
 
 /**
  * Check that `text` is a valid short ID.
  */
 export function matchesIdShort(text: string): boolean {
-  return REGEXP_MATCHES_ID_SHORT.test(text);
+  return REGEXP_MATCHES_ID_SHORT().test(text);
 }
 
 function constructMatchesXsDateTimeStampUtc(): RegExp {
@@ -151,7 +303,9 @@ function constructMatchesXsDateTimeStampUtc(): RegExp {
   return new RegExp(pattern, "u");
 }
 
-const REGEXP_MATCHES_XS_DATE_TIME_STAMP_UTC = constructMatchesXsDateTimeStampUtc();
+const REGEXP_MATCHES_XS_DATE_TIME_STAMP_UTC = /*@__PURE__*/ lazyRegExp(
+  constructMatchesXsDateTimeStampUtc
+);
 
 /**
  * Check that `text` conforms to the pattern of an `xs:dateTimeStamp`.
@@ -169,7 +323,7 @@ const REGEXP_MATCHES_XS_DATE_TIME_STAMP_UTC = constructMatchesXsDateTimeStampUtc
  * @returns True if the `text` conforms to the pattern
  */
 export function matchesXsDateTimeStampUtc(text: string): boolean {
-  return REGEXP_MATCHES_XS_DATE_TIME_STAMP_UTC.test(text);
+  return REGEXP_MATCHES_XS_DATE_TIME_STAMP_UTC().test(text);
 }
 
 /**
@@ -180,12 +334,17 @@ export function matchesXsDateTimeStampUtc(text: string): boolean {
  * @returns `true` if `value` is a valid `xs:dateTimeStamp` with the UTC time zone
  */
 export function isXsDateTimeStampUtc(value: string): boolean {
-  if (!matchesXsDateTimeStampUtc(value)) {
+  const endOfDate = endOfXsDatePart(value);
+  if (endOfDate === -1 || value.charCodeAt(endOfDate) !== CHAR_CODE_UPPER_T) {
     return false;
   }
 
-  const date = value.split("T", 1)[0];
-  return isXsDate(date);
+  const end = endOfXsTimePart(value, endOfDate + 1);
+  return (
+    end !== -1 &&
+    end === value.length - 1 &&
+    value.charCodeAt(end) === CHAR_CODE_UPPER_Z
+  );
 }
 
 function constructMatchesMimeType(): RegExp {
@@ -204,7 +363,7 @@ function constructMatchesMimeType(): RegExp {
   return new RegExp(mediaType, "u");
 }
 
-const REGEXP_MATCHES_MIME_TYPE = constructMatchesMimeType();
+const REGEXP_MATCHES_MIME_TYPE = /*@__PURE__*/ lazyRegExp(constructMatchesMimeType);
 
 /**
  * Check that `text` conforms to the pattern of MIME type.
@@ -221,7 +380,7 @@ const REGEXP_MATCHES_MIME_TYPE = constructMatchesMimeType();
  * @returns True if the `text` conforms to the pattern
  */
 export function matchesMimeType(text: string): boolean {
-  return REGEXP_MATCHES_MIME_TYPE.test(text);
+  return testMemoized("matchesMimeType", REGEXP_MATCHES_MIME_TYPE(), text);
 }
 
 function constructMatchesRfc8089Path(): RegExp {
@@ -252,7 +411,9 @@ function constructMatchesRfc8089Path(): RegExp {
   return new RegExp(pattern, "u");
 }
 
-const REGEXP_MATCHES_RFC_8089_PATH = constructMatchesRfc8089Path();
+const REGEXP_MATCHES_RFC_8089_PATH = /*@__PURE__*/ lazyRegExp(
+  constructMatchesRfc8089Path
+);
 
 /**
  * Check that `text` is a path conforming to the pattern of RFC 8089.
@@ -267,7 +428,7 @@ const REGEXP_MATCHES_RFC_8089_PATH = constructMatchesRfc8089Path();
  * @returns True if the `text` conforms to the pattern
  */
 export function matchesRfc8089Path(text: string): boolean {
-  return REGEXP_MATCHES_RFC_8089_PATH.test(text);
+  return testMemoized("matchesRfc8089Path", REGEXP_MATCHES_RFC_8089_PATH(), text);
 }
 
 function constructMatchesBcp47(): RegExp {
@@ -292,7 +453,7 @@ function constructMatchesBcp47(): RegExp {
   return new RegExp(pattern, "u");
 }
 
-const REGEXP_MATCHES_BCP_47 = constructMatchesBcp47();
+const REGEXP_MATCHES_BCP_47 = /*@__PURE__*/ lazyRegExp(constructMatchesBcp47);
 
 /**
  * Check that `text` is a valid BCP 47 language tag.
@@ -302,7 +463,7 @@ const REGEXP_MATCHES_BCP_47 = constructMatchesBcp47();
  * See: https://en.wikipedia.org/wiki/IETF_language_tag
  */
 export function matchesBcp47(text: string): boolean {
-  return REGEXP_MATCHES_BCP_47.test(text);
+  return testMemoized("matchesBcp47", REGEXP_MATCHES_BCP_47(), text);
 }
 
 /**
@@ -393,7 +554,7 @@ function constructMatchesXsAnyUri(): RegExp {
   return new RegExp(pattern, "u");
 }
 
-const REGEXP_MATCHES_XS_ANY_URI = constructMatchesXsAnyUri();
+const REGEXP_MATCHES_XS_ANY_URI = /*@__PURE__*/ lazyRegExp(constructMatchesXsAnyUri);
 
 /**
  * Check that `text` conforms to the pattern of an `xs:anyURI`.
@@ -408,7 +569,7 @@ const REGEXP_MATCHES_XS_ANY_URI = constructMatchesXsAnyUri();
  * @returns True if the `text` conforms to the pattern
  */
 export function matchesXsAnyUri(text: string): boolean {
-  return REGEXP_MATCHES_XS_ANY_URI.test(text);
+  return testMemoized("matchesXsAnyUri", REGEXP_MATCHES_XS_ANY_URI(), text);
 }
 
 function constructMatchesXsBase64Binary(): RegExp {
@@ -429,7 +590,9 @@ function constructMatchesXsBase64Binary(): RegExp {
   return new RegExp(pattern, "u");
 }
 
-const REGEXP_MATCHES_XS_BASE_64_BINARY = constructMatchesXsBase64Binary();
+const REGEXP_MATCHES_XS_BASE_64_BINARY = /*@__PURE__*/ lazyRegExp(
+  constructMatchesXsBase64Binary
+);
 
 /**
  * Check that `text` conforms to the pattern of an `xs:base64Binary`.
@@ -443,7 +606,7 @@ const REGEXP_MATCHES_XS_BASE_64_BINARY = constructMatchesXsBase64Binary();
  * @returns True if the `text` conforms to the pattern
  */
 export function matchesXsBase64Binary(text: string): boolean {
-  return REGEXP_MATCHES_XS_BASE_64_BINARY.test(text);
+  return REGEXP_MATCHES_XS_BASE_64_BINARY().test(text);
 }
 
 function constructMatchesXsBoolean(): RegExp {
@@ -452,7 +615,7 @@ function constructMatchesXsBoolean(): RegExp {
   return new RegExp(pattern, "u");
 }
 
-const REGEXP_MATCHES_XS_BOOLEAN = constructMatchesXsBoolean();
+const REGEXP_MATCHES_XS_BOOLEAN = /*@__PURE__*/ lazyRegExp(constructMatchesXsBoolean);
 
 /**
  * Check that `text` conforms to the pattern of an `xs:boolean`.
@@ -466,7 +629,7 @@ const REGEXP_MATCHES_XS_BOOLEAN = constructMatchesXsBoolean();
  * @returns True if the `text` conforms to the pattern
  */
 export function matchesXsBoolean(text: string): boolean {
-  return REGEXP_MATCHES_XS_BOOLEAN.test(text);
+  return REGEXP_MATCHES_XS_BOOLEAN().test(text);
 }
 
 function constructMatchesXsDate(): RegExp {
@@ -482,7 +645,7 @@ function constructMatchesXsDate(): RegExp {
   return new RegExp(pattern, "u");
 }
 
-const REGEXP_MATCHES_XS_DATE = constructMatchesXsDate();
+const REGEXP_MATCHES_XS_DATE = /*@__PURE__*/ lazyRegExp(constructMatchesXsDate);
 
 /**
  * Check that `text` conforms to the pattern of an `xs:date`.
@@ -496,7 +659,7 @@ const REGEXP_MATCHES_XS_DATE = constructMatchesXsDate();
  * @returns True if the `text` conforms to the pattern
  */
 export function matchesXsDate(text: string): boolean {
-  return REGEXP_MATCHES_XS_DATE.test(text);
+  return REGEXP_MATCHES_XS_DATE().test(text);
 }
 
 function constructMatchesXsDateTime(): RegExp {
@@ -515,7 +678,9 @@ function constructMatchesXsDateTime(): RegExp {
   return new RegExp(pattern, "u");
 }
 
-const REGEXP_MATCHES_XS_DATE_TIME = constructMatchesXsDateTime();
+const REGEXP_MATCHES_XS_DATE_TIME = /*@__PURE__*/ lazyRegExp(
+  constructMatchesXsDateTime
+);
 
 /**
  * Check that `text` conforms to the pattern of an `xs:dateTime`.
@@ -529,7 +694,7 @@ const REGEXP_MATCHES_XS_DATE_TIME = constructMatchesXsDateTime();
  * @returns True if the `text` conforms to the pattern
  */
 export function matchesXsDateTime(text: string): boolean {
-  return REGEXP_MATCHES_XS_DATE_TIME.test(text);
+  return REGEXP_MATCHES_XS_DATE_TIME().test(text);
 }
 
 function constructMatchesXsDateTimeStamp(): RegExp {
@@ -548,7 +713,9 @@ function constructMatchesXsDateTimeStamp(): RegExp {
   return new RegExp(pattern, "u");
 }
 
-const REGEXP_MATCHES_XS_DATE_TIME_STAMP = constructMatchesXsDateTimeStamp();
+const REGEXP_MATCHES_XS_DATE_TIME_STAMP = /*@__PURE__*/ lazyRegExp(
+  constructMatchesXsDateTimeStamp
+);
 
 /**
  * Check that `text` conforms to the pattern of an `xs:dateTimeStamp`.
@@ -562,7 +729,7 @@ const REGEXP_MATCHES_XS_DATE_TIME_STAMP = constructMatchesXsDateTimeStamp();
  * @returns True if the `text` conforms to the pattern
  */
 export function matchesXsDateTimeStamp(text: string): boolean {
-  return REGEXP_MATCHES_XS_DATE_TIME_STAMP.test(text);
+  return REGEXP_MATCHES_XS_DATE_TIME_STAMP().test(text);
 }
 
 function constructMatchesXsDecimal(): RegExp {
@@ -578,7 +745,7 @@ function constructMatchesXsDecimal(): RegExp {
   return new RegExp(pattern, "u");
 }
 
-const REGEXP_MATCHES_XS_DECIMAL = constructMatchesXsDecimal();
+const REGEXP_MATCHES_XS_DECIMAL = /*@__PURE__*/ lazyRegExp(constructMatchesXsDecimal);
 
 /**
  * Check that `text` conforms to the pattern of an `xs:decimal`.
@@ -592,7 +759,7 @@ const REGEXP_MATCHES_XS_DECIMAL = constructMatchesXsDecimal();
  * @returns True if the `text` conforms to the pattern
  */
 export function matchesXsDecimal(text: string): boolean {
-  return REGEXP_MATCHES_XS_DECIMAL.test(text);
+  return REGEXP_MATCHES_XS_DECIMAL().test(text);
 }
 
 function constructMatchesXsDouble(): RegExp {
@@ -603,7 +770,7 @@ function constructMatchesXsDouble(): RegExp {
   return new RegExp(pattern, "u");
 }
 
-const REGEXP_MATCHES_XS_DOUBLE = constructMatchesXsDouble();
+const REGEXP_MATCHES_XS_DOUBLE = /*@__PURE__*/ lazyRegExp(constructMatchesXsDouble);
 
 /**
  * Check that `text` conforms to the pattern of an `xs:double`.
@@ -617,7 +784,7 @@ const REGEXP_MATCHES_XS_DOUBLE = constructMatchesXsDouble();
  * @returns True if the `text` conforms to the pattern
  */
 export function matchesXsDouble(text: string): boolean {
-  return REGEXP_MATCHES_XS_DOUBLE.test(text);
+  return REGEXP_MATCHES_XS_DOUBLE().test(text);
 }
 
 function constructMatchesXsDuration(): RegExp {
@@ -628,7 +795,7 @@ function constructMatchesXsDuration(): RegExp {
   return new RegExp(pattern, "u");
 }
 
-const REGEXP_MATCHES_XS_DURATION = constructMatchesXsDuration();
+const REGEXP_MATCHES_XS_DURATION = /*@__PURE__*/ lazyRegExp(constructMatchesXsDuration);
 
 /**
  * Check that `text` conforms to the pattern of an `xs:duration`.
@@ -642,7 +809,7 @@ const REGEXP_MATCHES_XS_DURATION = constructMatchesXsDuration();
  * @returns True if the `text` conforms to the pattern
  */
 export function matchesXsDuration(text: string): boolean {
-  return REGEXP_MATCHES_XS_DURATION.test(text);
+  return REGEXP_MATCHES_XS_DURATION().test(text);
 }
 
 function constructMatchesXsFloat(): RegExp {
@@ -653,7 +820,7 @@ function constructMatchesXsFloat(): RegExp {
   return new RegExp(pattern, "u");
 }
 
-const REGEXP_MATCHES_XS_FLOAT = constructMatchesXsFloat();
+const REGEXP_MATCHES_XS_FLOAT = /*@__PURE__*/ lazyRegExp(constructMatchesXsFloat);
 
 /**
  * Check that `text` conforms to the pattern of an `xs:float`.
@@ -667,7 +834,7 @@ const REGEXP_MATCHES_XS_FLOAT = constructMatchesXsFloat();
  * @returns True if the `text` conforms to the pattern
  */
 export function matchesXsFloat(text: string): boolean {
-  return REGEXP_MATCHES_XS_FLOAT.test(text);
+  return REGEXP_MATCHES_XS_FLOAT().test(text);
 }
 
 function constructMatchesXsGDay(): RegExp {
@@ -678,7 +845,7 @@ function constructMatchesXsGDay(): RegExp {
   return new RegExp(pattern, "u");
 }
 
-const REGEXP_MATCHES_XS_G_DAY = constructMatchesXsGDay();
+const REGEXP_MATCHES_XS_G_DAY = /*@__PURE__*/ lazyRegExp(constructMatchesXsGDay);
 
 /**
  * Check that `text` conforms to the pattern of an `xs:gDay`.
@@ -692,7 +859,7 @@ const REGEXP_MATCHES_XS_G_DAY = constructMatchesXsGDay();
  * @returns True if the `text` conforms to the pattern
  */
 export function matchesXsGDay(text: string): boolean {
-  return REGEXP_MATCHES_XS_G_DAY.test(text);
+  return REGEXP_MATCHES_XS_G_DAY().test(text);
 }
 
 function constructMatchesXsGMonth(): RegExp {
@@ -703,7 +870,7 @@ function constructMatchesXsGMonth(): RegExp {
   return new RegExp(pattern, "u");
 }
 
-const REGEXP_MATCHES_XS_G_MONTH = constructMatchesXsGMonth();
+const REGEXP_MATCHES_XS_G_MONTH = /*@__PURE__*/ lazyRegExp(constructMatchesXsGMonth);
 
 /**
  * Check that `text` conforms to the pattern of an `xs:gMonth`.
@@ -717,7 +884,7 @@ const REGEXP_MATCHES_XS_G_MONTH = constructMatchesXsGMonth();
  * @returns True if the `text` conforms to the pattern
  */
 export function matchesXsGMonth(text: string): boolean {
-  return REGEXP_MATCHES_XS_G_MONTH.test(text);
+  return REGEXP_MATCHES_XS_G_MONTH().test(text);
 }
 
 function constructMatchesXsGMonthDay(): RegExp {
@@ -728,7 +895,9 @@ function constructMatchesXsGMonthDay(): RegExp {
   return new RegExp(pattern, "u");
 }
 
-const REGEXP_MATCHES_XS_G_MONTH_DAY = constructMatchesXsGMonthDay();
+const REGEXP_MATCHES_XS_G_MONTH_DAY = /*@__PURE__*/ lazyRegExp(
+  constructMatchesXsGMonthDay
+);
 
 /**
  * Check that `text` conforms to the pattern of an `xs:gMonthDay`.
@@ -742,7 +911,7 @@ const REGEXP_MATCHES_XS_G_MONTH_DAY = constructMatchesXsGMonthDay();
  * @returns True if the `text` conforms to the pattern
  */
 export function matchesXsGMonthDay(text: string): boolean {
-  return REGEXP_MATCHES_XS_G_MONTH_DAY.test(text);
+  return REGEXP_MATCHES_XS_G_MONTH_DAY().test(text);
 }
 
 function constructMatchesXsGYear(): RegExp {
@@ -753,7 +922,7 @@ function constructMatchesXsGYear(): RegExp {
   return new RegExp(pattern, "u");
 }
 
-const REGEXP_MATCHES_XS_G_YEAR = constructMatchesXsGYear();
+const REGEXP_MATCHES_XS_G_YEAR = /*@__PURE__*/ lazyRegExp(constructMatchesXsGYear);
 
 /**
  * Check that `text` conforms to the pattern of an `xs:gYear`.
@@ -767,7 +936,7 @@ const REGEXP_MATCHES_XS_G_YEAR = constructMatchesXsGYear();
  * @returns True if the `text` conforms to the pattern
  */
 export function matchesXsGYear(text: string): boolean {
-  return REGEXP_MATCHES_XS_G_YEAR.test(text);
+  return REGEXP_MATCHES_XS_G_YEAR().test(text);
 }
 
 function constructMatchesXsGYearMonth(): RegExp {
@@ -778,7 +947,9 @@ function constructMatchesXsGYearMonth(): RegExp {
   return new RegExp(pattern, "u");
 }
 
-const REGEXP_MATCHES_XS_G_YEAR_MONTH = constructMatchesXsGYearMonth();
+const REGEXP_MATCHES_XS_G_YEAR_MONTH = /*@__PURE__*/ lazyRegExp(
+  constructMatchesXsGYearMonth
+);
 
 /**
  * Check that `text` conforms to the pattern of an `xs:gYearMonth`.
@@ -792,7 +963,7 @@ const REGEXP_MATCHES_XS_G_YEAR_MONTH = constructMatchesXsGYearMonth();
  * @returns True if the `text` conforms to the pattern
  */
 export function matchesXsGYearMonth(text: string): boolean {
-  return REGEXP_MATCHES_XS_G_YEAR_MONTH.test(text);
+  return REGEXP_MATCHES_XS_G_YEAR_MONTH().test(text);
 }
 
 function constructMatchesXsHexBinary(): RegExp {
@@ -802,7 +973,9 @@ function constructMatchesXsHexBinary(): RegExp {
   return new RegExp(pattern, "u");
 }
 
-const REGEXP_MATCHES_XS_HEX_BINARY = constructMatchesXsHexBinary();
+const REGEXP_MATCHES_XS_HEX_BINARY = /*@__PURE__*/ lazyRegExp(
+  constructMatchesXsHexBinary
+);
 
 /**
  * Check that `text` conforms to the pattern of an `xs:hexBinary`.
@@ -816,7 +989,7 @@ const REGEXP_MATCHES_XS_HEX_BINARY = constructMatchesXsHexBinary();
  * @returns True if the `text` conforms to the pattern
  */
 export function matchesXsHexBinary(text: string): boolean {
-  return REGEXP_MATCHES_XS_HEX_BINARY.test(text);
+  return REGEXP_MATCHES_XS_HEX_BINARY().test(text);
 }
 
 function constructMatchesXsTime(): RegExp {
@@ -827,7 +1000,7 @@ function constructMatchesXsTime(): RegExp {
   return new RegExp(pattern, "u");
 }
 
-const REGEXP_MATCHES_XS_TIME = constructMatchesXsTime();
+const REGEXP_MATCHES_XS_TIME = /*@__PURE__*/ lazyRegExp(constructMatchesXsTime);
 
 /**
  * Check that `text` conforms to the pattern of an `xs:time`.
@@ -841,7 +1014,7 @@ const REGEXP_MATCHES_XS_TIME = constructMatchesXsTime();
  * @returns True if the `text` conforms to the pattern
  */
 export function matchesXsTime(text: string): boolean {
-  return REGEXP_MATCHES_XS_TIME.test(text);
+  return REGEXP_MATCHES_XS_TIME().test(text);
 }
 
 function constructMatchesXsDayTimeDuration(): RegExp {
@@ -852,7 +1025,9 @@ function constructMatchesXsDayTimeDuration(): RegExp {
   return new RegExp(pattern, "u");
 }
 
-const REGEXP_MATCHES_XS_DAY_TIME_DURATION = constructMatchesXsDayTimeDuration();
+const REGEXP_MATCHES_XS_DAY_TIME_DURATION = /*@__PURE__*/ lazyRegExp(
+  constructMatchesXsDayTimeDuration
+);
 
 /**
  * Check that `text` conforms to the pattern of an `xs:dayTimeDuration`.
@@ -866,7 +1041,7 @@ const REGEXP_MATCHES_XS_DAY_TIME_DURATION = constructMatchesXsDayTimeDuration();
  * @returns True if the `text` conforms to the pattern
  */
 export function matchesXsDayTimeDuration(text: string): boolean {
-  return REGEXP_MATCHES_XS_DAY_TIME_DURATION.test(text);
+  return REGEXP_MATCHES_XS_DAY_TIME_DURATION().test(text);
 }
 
 function constructMatchesXsYearMonthDuration(): RegExp {
@@ -876,7 +1051,9 @@ function constructMatchesXsYearMonthDuration(): RegExp {
   return new RegExp(pattern, "u");
 }
 
-const REGEXP_MATCHES_XS_YEAR_MONTH_DURATION = constructMatchesXsYearMonthDuration();
+const REGEXP_MATCHES_XS_YEAR_MONTH_DURATION = /*@__PURE__*/ lazyRegExp(
+  constructMatchesXsYearMonthDuration
+);
 
 /**
  * Check that `text` conforms to the pattern of an `xs:yearMonthDuration`.
@@ -890,7 +1067,7 @@ const REGEXP_MATCHES_XS_YEAR_MONTH_DURATION = constructMatchesXsYearMonthDuratio
  * @returns True if the `text` conforms to the pattern
  */
 export function matchesXsYearMonthDuration(text: string): boolean {
-  return REGEXP_MATCHES_XS_YEAR_MONTH_DURATION.test(text);
+  return REGEXP_MATCHES_XS_YEAR_MONTH_DURATION().test(text);
 }
 
 function constructMatchesXsInteger(): RegExp {
@@ -900,7 +1077,7 @@ function constructMatchesXsInteger(): RegExp {
   return new RegExp(pattern, "u");
 }
 
-const REGEXP_MATCHES_XS_INTEGER = constructMatchesXsInteger();
+const REGEXP_MATCHES_XS_INTEGER = /*@__PURE__*/ lazyRegExp(constructMatchesXsInteger);
 
 /**
  * Check that `text` conforms to the pattern of an `xs:integer`.
@@ -914,7 +1091,7 @@ const REGEXP_MATCHES_XS_INTEGER = constructMatchesXsInteger();
  * @returns True if the `text` conforms to the pattern
  */
 export function matchesXsInteger(text: string): boolean {
-  return REGEXP_MATCHES_XS_INTEGER.test(text);
+  return REGEXP_MATCHES_XS_INTEGER().test(text);
 }
 
 function constructMatchesXsLong(): RegExp {
@@ -924,7 +1101,7 @@ function constructMatchesXsLong(): RegExp {
   return new RegExp(pattern, "u");
 }
 
-const REGEXP_MATCHES_XS_LONG = constructMatchesXsLong();
+const REGEXP_MATCHES_XS_LONG = /*@__PURE__*/ lazyRegExp(constructMatchesXsLong);
 
 /**
  * Check that `text` conforms to the pattern of an `xs:long`.
@@ -938,7 +1115,7 @@ const REGEXP_MATCHES_XS_LONG = constructMatchesXsLong();
  * @returns True if the `text` conforms to the pattern
  */
 export function matchesXsLong(text: string): boolean {
-  return REGEXP_MATCHES_XS_LONG.test(text);
+  return REGEXP_MATCHES_XS_LONG().test(text);
 }
 
 function constructMatchesXsInt(): RegExp {
@@ -948,7 +1125,7 @@ function constructMatchesXsInt(): RegExp {
   return new RegExp(pattern, "u");
 }
 
-const REGEXP_MATCHES_XS_INT = constructMatchesXsInt();
+const REGEXP_MATCHES_XS_INT = /*@__PURE__*/ lazyRegExp(constructMatchesXsInt);
 
 /**
  * Check that `text` conforms to the pattern of an `xs:int`.
@@ -962,7 +1139,7 @@ const REGEXP_MATCHES_XS_INT = constructMatchesXsInt();
  * @returns True if the `text` conforms to the pattern
  */
 export function matchesXsInt(text: string): boolean {
-  return REGEXP_MATCHES_XS_INT.test(text);
+  return REGEXP_MATCHES_XS_INT().test(text);
 }
 
 function constructMatchesXsShort(): RegExp {
@@ -972,7 +1149,7 @@ function constructMatchesXsShort(): RegExp {
   return new RegExp(pattern, "u");
 }
 
-const REGEXP_MATCHES_XS_SHORT = constructMatchesXsShort();
+const REGEXP_MATCHES_XS_SHORT = /*@__PURE__*/ lazyRegExp(constructMatchesXsShort);
 
 /**
  * Check that `text` conforms to the pattern of an `xs:short`.
@@ -986,7 +1163,7 @@ const REGEXP_MATCHES_XS_SHORT = constructMatchesXsShort();
  * @returns True if the `text` conforms to the pattern
  */
 export function matchesXsShort(text: string): boolean {
-  return REGEXP_MATCHES_XS_SHORT.test(text);
+  return REGEXP_MATCHES_XS_SHORT().test(text);
 }
 
 function constructMatchesXsByte(): RegExp {
@@ -996,7 +1173,7 @@ function constructMatchesXsByte(): RegExp {
   return new RegExp(pattern, "u");
 }
 
-const REGEXP_MATCHES_XS_BYTE = constructMatchesXsByte();
+const REGEXP_MATCHES_XS_BYTE = /*@__PURE__*/ lazyRegExp(constructMatchesXsByte);
 
 /**
  * Check that `text` conforms to the pattern of an `xs:byte`.
@@ -1010,7 +1187,7 @@ const REGEXP_MATCHES_XS_BYTE = constructMatchesXsByte();
  * @returns True if the `text` conforms to the pattern
  */
 export function matchesXsByte(text: string): boolean {
-  return REGEXP_MATCHES_XS_BYTE.test(text);
+  return REGEXP_MATCHES_XS_BYTE().test(text);
 }
 
 function constructMatchesXsNonNegativeInteger(): RegExp {
@@ -1020,7 +1197,9 @@ function constructMatchesXsNonNegativeInteger(): RegExp {
   return new RegExp(pattern, "u");
 }
 
-const REGEXP_MATCHES_XS_NON_NEGATIVE_INTEGER = constructMatchesXsNonNegativeInteger();
+const REGEXP_MATCHES_XS_NON_NEGATIVE_INTEGER = /*@__PURE__*/ lazyRegExp(
+  constructMatchesXsNonNegativeInteger
+);
 
 /**
  * Check that `text` conforms to the pattern of an `xs:nonNegativeInteger`.
@@ -1034,7 +1213,7 @@ const REGEXP_MATCHES_XS_NON_NEGATIVE_INTEGER = constructMatchesXsNonNegativeInte
  * @returns True if the `text` conforms to the pattern
  */
 export function matchesXsNonNegativeInteger(text: string): boolean {
-  return REGEXP_MATCHES_XS_NON_NEGATIVE_INTEGER.test(text);
+  return REGEXP_MATCHES_XS_NON_NEGATIVE_INTEGER().test(text);
 }
 
 function constructMatchesXsPositiveInteger(): RegExp {
@@ -1044,7 +1223,9 @@ function constructMatchesXsPositiveInteger(): RegExp {
   return new RegExp(pattern, "u");
 }
 
-const REGEXP_MATCHES_XS_POSITIVE_INTEGER = constructMatchesXsPositiveInteger();
+const REGEXP_MATCHES_XS_POSITIVE_INTEGER = /*@__PURE__*/ lazyRegExp(
+  constructMatchesXsPositiveInteger
+);
 
 /**
  * Check that `text` conforms to the pattern of an `xs:positiveInteger`.
@@ -1058,7 +1239,7 @@ const REGEXP_MATCHES_XS_POSITIVE_INTEGER = constructMatchesXsPositiveInteger();
  * @returns True if the `text` conforms to the pattern
  */
 export function matchesXsPositiveInteger(text: string): boolean {
-  return REGEXP_MATCHES_XS_POSITIVE_INTEGER.test(text);
+  return REGEXP_MATCHES_XS_POSITIVE_INTEGER().test(text);
 }
 
 function constructMatchesXsUnsignedLong(): RegExp {
@@ -1068,7 +1249,9 @@ function constructMatchesXsUnsignedLong(): RegExp {
   return new RegExp(pattern, "u");
 }
 
-const REGEXP_MATCHES_XS_UNSIGNED_LONG = constructMatchesXsUnsignedLong();
+const REGEXP_MATCHES_XS_UNSIGNED_LONG = /*@__PURE__*/ lazyRegExp(
+  constructMatchesXsUnsignedLong
+);
 
 /**
  * Check that `text` conforms to the pattern of an `xs:unsignedLong`.
@@ -1082,7 +1265,7 @@ const REGEXP_MATCHES_XS_UNSIGNED_LONG = constructMatchesXsUnsignedLong();
  * @returns True if the `text` conforms to the pattern
  */
 export function matchesXsUnsignedLong(text: string): boolean {
-  return REGEXP_MATCHES_XS_UNSIGNED_LONG.test(text);
+  return REGEXP_MATCHES_XS_UNSIGNED_LONG().test(text);
 }
 
 function constructMatchesXsUnsignedInt(): RegExp {
@@ -1092,7 +1275,9 @@ function constructMatchesXsUnsignedInt(): RegExp {
   return new RegExp(pattern, "u");
 }
 
-const REGEXP_MATCHES_XS_UNSIGNED_INT = constructMatchesXsUnsignedInt();
+const REGEXP_MATCHES_XS_UNSIGNED_INT = /*@__PURE__*/ lazyRegExp(
+  constructMatchesXsUnsignedInt
+);
 
 /**
  * Check that `text` conforms to the pattern of an `xs:unsignedInt`.
@@ -1106,7 +1291,7 @@ const REGEXP_MATCHES_XS_UNSIGNED_INT = constructMatchesXsUnsignedInt();
  * @returns True if the `text` conforms to the pattern
  */
 export function matchesXsUnsignedInt(text: string): boolean {
-  return REGEXP_MATCHES_XS_UNSIGNED_INT.test(text);
+  return REGEXP_MATCHES_XS_UNSIGNED_INT().test(text);
 }
 
 function constructMatchesXsUnsignedShort(): RegExp {
@@ -1116,7 +1301,9 @@ function constructMatchesXsUnsignedShort(): RegExp {
   return new RegExp(pattern, "u");
 }
 
-const REGEXP_MATCHES_XS_UNSIGNED_SHORT = constructMatchesXsUnsignedShort();
+const REGEXP_MATCHES_XS_UNSIGNED_SHORT = /*@__PURE__*/ lazyRegExp(
+  constructMatchesXsUnsignedShort
+);
 
 /**
  * Check that `text` conforms to the pattern of an `xs:unsignedShort`.
@@ -1130,7 +1317,7 @@ const REGEXP_MATCHES_XS_UNSIGNED_SHORT = constructMatchesXsUnsignedShort();
  * @returns True if the `text` conforms to the pattern
  */
 export function matchesXsUnsignedShort(text: string): boolean {
-  return REGEXP_MATCHES_XS_UNSIGNED_SHORT.test(text);
+  return REGEXP_MATCHES_XS_UNSIGNED_SHORT().test(text);
 }
 
 function constructMatchesXsUnsignedByte(): RegExp {
@@ -1140,7 +1327,9 @@ function constructMatchesXsUnsignedByte(): RegExp {
   return new RegExp(pattern, "u");
 }
 
-const REGEXP_MATCHES_XS_UNSIGNED_BYTE = constructMatchesXsUnsignedByte();
+const REGEXP_MATCHES_XS_UNSIGNED_BYTE = /*@__PURE__*/ lazyRegExp(
+  constructMatchesXsUnsignedByte
+);
 
 /**
  * Check that `text` conforms to the pattern of an `xs:unsignedByte`.
@@ -1154,7 +1343,7 @@ const REGEXP_MATCHES_XS_UNSIGNED_BYTE = constructMatchesXsUnsignedByte();
  * @returns True if the `text` conforms to the pattern
  */
 export function matchesXsUnsignedByte(text: string): boolean {
-  return REGEXP_MATCHES_XS_UNSIGNED_BYTE.test(text);
+  return REGEXP_MATCHES_XS_UNSIGNED_BYTE().test(text);
 }
 
 function constructMatchesXsNonPositiveInteger(): RegExp {
@@ -1164,7 +1353,9 @@ function constructMatchesXsNonPositiveInteger(): RegExp {
   return new RegExp(pattern, "u");
 }
 
-const REGEXP_MATCHES_XS_NON_POSITIVE_INTEGER = constructMatchesXsNonPositiveInteger();
+const REGEXP_MATCHES_XS_NON_POSITIVE_INTEGER = /*@__PURE__*/ lazyRegExp(
+  constructMatchesXsNonPositiveInteger
+);
 
 /**
  * Check that `text` conforms to the pattern of an `xs:nonPositiveInteger`.
@@ -1178,7 +1369,7 @@ const REGEXP_MATCHES_XS_NON_POSITIVE_INTEGER = constructMatchesXsNonPositiveInte
  * @returns True if the `text` conforms to the pattern
  */
 export function matchesXsNonPositiveInteger(text: string): boolean {
-  return REGEXP_MATCHES_XS_NON_POSITIVE_INTEGER.test(text);
+  return REGEXP_MATCHES_XS_NON_POSITIVE_INTEGER().test(text);
 }
 
 function constructMatchesXsNegativeInteger(): RegExp {
@@ -1188,7 +1379,9 @@ function constructMatchesXsNegativeInteger(): RegExp {
   return new RegExp(pattern, "u");
 }
 
-const REGEXP_MATCHES_XS_NEGATIVE_INTEGER = constructMatchesXsNegativeInteger();
+const REGEXP_MATCHES_XS_NEGATIVE_INTEGER = /*@__PURE__*/ lazyRegExp(
+  constructMatchesXsNegativeInteger
+);
 
 /**
  * Check that `text` conforms to the pattern of an `xs:negativeInteger`.
@@ -1202,7 +1395,7 @@ const REGEXP_MATCHES_XS_NEGATIVE_INTEGER = constructMatchesXsNegativeInteger();
  * @returns True if the `text` conforms to the pattern
  */
 export function matchesXsNegativeInteger(text: string): boolean {
-  return REGEXP_MATCHES_XS_NEGATIVE_INTEGER.test(text);
+  return REGEXP_MATCHES_XS_NEGATIVE_INTEGER().test(text);
 }
 
 function constructMatchesXsString(): RegExp {
@@ -1211,7 +1404,7 @@ function constructMatchesXsString(): RegExp {
   return new RegExp(pattern, "u");
 }
 
-const REGEXP_MATCHES_XS_STRING = constructMatchesXsString();
+const REGEXP_MATCHES_XS_STRING = /*@__PURE__*/ lazyRegExp(constructMatchesXsString);
 
 /**
  * Check that `text` conforms to the pattern of an `xs:string`.
@@ -1225,7 +1418,7 @@ const REGEXP_MATCHES_XS_STRING = constructMatchesXsString();
  * @returns True if the `text` conforms to the pattern
  */
 export function matchesXsString(text: string): boolean {
-  return REGEXP_MATCHES_XS_STRING.test(text);
+  return REGEXP_MATCHES_XS_STRING().test(text);
 }
 
 /**
@@ -1266,78 +1459,333 @@ export function isLeapYear(year: number): boolean {
   return true;
 }
 
-const DAYS_IN_MONTH = new Map<number, number>([
-  [1, 31],
-  // Please use isLeapYear if you need to check
-  // whether a concrete February has 28 or 29 days.
-  [2, 29],
-  [3, 31],
-  [4, 30],
-  [5, 31],
-  [6, 30],
-  [7, 31],
-  [8, 31],
-  [9, 30],
-  [10, 31],
-  [11, 30],
-  [12, 31]
-]);
+// The checks below are hand-written scanners over the character codes instead of
+// the regular expressions from the `matches*` functions followed by parsing.
+// The scanners do not allocate and pass over the value only once. The regular
+// expressions are kept as the reference, and the scanners are tested against them.
 
-const DATE_PREFIX_RE = new RegExp("^(-?[0-9]+)-([0-9]{2})-([0-9]{2})");
+const CHAR_CODE_PLUS = 43;
+const CHAR_CODE_MINUS = 45;
+const CHAR_CODE_DOT = 46;
+const CHAR_CODE_ZERO = 48;
+const CHAR_CODE_NINE = 57;
+const CHAR_CODE_COLON = 58;
+const CHAR_CODE_UPPER_E = 69;
+const CHAR_CODE_UPPER_T = 84;
+const CHAR_CODE_UPPER_Z = 90;
+const CHAR_CODE_LOWER_E = 101;
 
 /**
- * Check that `value` is a valid `xs:date`.
+ * Compute the digit at `index` of `text`.
+ *
+ * @param text - to be scanned
+ * @param index - of the character
+ * @returns the digit, or -1 if the character is not an ASCII digit or
+ * `index` is out of bounds
+ */
+function digitAt(text: string, index: number): number {
+  // `charCodeAt` returns `NaN` if `index` is out of bounds, and
+  // all the comparisons with `NaN` are false.
+  const charCode = text.charCodeAt(index);
+  if (charCode >= CHAR_CODE_ZERO && charCode <= CHAR_CODE_NINE) {
+    return charCode - CHAR_CODE_ZERO;
+  }
+  return -1;
+}
+
+/**
+ * Compute the maximum number of days in the `month`.
+ *
+ * @param month - between 1 and 12
+ * @param leapYear - if set, February has 29 days
+ * @returns maximum number of days
+ */
+function maxDaysInMonth(month: number, leapYear: boolean): number {
+  if (month === 2) {
+    return leapYear ? 29 : 28;
+  }
+  return month === 4 || month === 6 || month === 9 || month === 11 ? 30 : 31;
+}
+
+/**
+ * Scan the date part `-?YYYY-MM-DD` of an `xs:date` or `xs:dateTime`
+ * at the beginning of `value`.
  *
  * @remarks
- * Year 1 BCE is the last leap BCE year.
- * See https://www.w3.org/TR/xmlschema-2/#dateTime.
+ * Apart from the lexical check, we check that the year is not zero and that
+ * the day exists in the month.
  *
- * @param value - to be be checked
- * @returns `true` if `value` is a valid `xs:date`
+ * @param value - to be scanned
+ * @returns index right after the date part, or -1 if the date is invalid
  */
-export function isXsDate(value: string): boolean {
-  // NOTE (mristin, 2022-11-23):
-  // We can not use date functions from the standard library as it does not
-  // handle years BCE (*e.g.*, `-0003-01-02`).
+function endOfXsDatePart(value: string): number {
+  let index = 0;
 
-  if (!matchesXsDate(value)) {
-    return false;
+  const negative = value.charCodeAt(0) === CHAR_CODE_MINUS;
+  if (negative) {
+    index++;
   }
 
-  // NOTE (mristin, 2022-11-23):
-  // We need to match the prefix as zone offsets are allowed in the dates. Optimally,
-  // we would re-use the pattern matching from `matchesXsDate`, but this
-  // would make the code generation and constraint inference for schemas much more
-  // difficult. Hence, we sacrifice the efficiency a bit for the clearer code & code
-  // generation.
+  // We compute the year modulo 400 so that we do not overflow for
+  // large years. This is enough to determine the leap years.
+  const yearStart = index;
+  let yearModulo400 = 0;
+  let yearIsZero = true;
+  for (;;) {
+    const digit = digitAt(value, index);
+    if (digit === -1) {
+      break;
+    }
+    yearModulo400 = (yearModulo400 * 10 + digit) % 400;
+    if (digit !== 0) {
+      yearIsZero = false;
+    }
+    index++;
+  }
 
-  const match = DATE_PREFIX_RE.exec(value);
+  const yearLength = index - yearStart;
+  if (yearLength < 4) {
+    return -1;
+  }
 
-  const year = parseInt(match[1], 10);
-  const month = parseInt(match[2], 10);
-  const day = parseInt(match[3], 10);
+  // A year with more than four digits must not start with a zero.
+  if (yearLength > 4 && value.charCodeAt(yearStart) === CHAR_CODE_ZERO) {
+    return -1;
+  }
 
   // We do not accept year zero,
   // see the note at: https://www.w3.org/TR/xmlschema-2/#dateTime
-  if (year === 0) {
-    return false;
+  if (yearIsZero) {
+    return -1;
   }
 
-  if (day <= 0) {
-    return false;
+  if (value.charCodeAt(index) !== CHAR_CODE_MINUS) {
+    return -1;
+  }
+  index++;
+
+  const month0 = digitAt(value, index);
+  const month1 = digitAt(value, index + 1);
+  if (month0 === -1 || month1 === -1) {
+    return -1;
+  }
+  const month = month0 * 10 + month1;
+  if (month < 1 || month > 12) {
+    return -1;
+  }
+  index += 2;
+
+  if (value.charCodeAt(index) !== CHAR_CODE_MINUS) {
+    return -1;
+  }
+  index++;
+
+  const day0 = digitAt(value, index);
+  const day1 = digitAt(value, index + 1);
+  if (day0 === -1 || day1 === -1) {
+    return -1;
+  }
+  const day = day0 * 10 + day1;
+
+  // We consider the years B.C. to be one-off, see isLeapYear.
+  const astronomicalYearModulo400 = negative
+    ? (yearModulo400 + 399) % 400
+    : yearModulo400;
+
+  const leapYear =
+    astronomicalYearModulo400 % 4 === 0 &&
+    (astronomicalYearModulo400 % 100 !== 0 || astronomicalYearModulo400 === 0);
+
+  if (day < 1 || day > maxDaysInMonth(month, leapYear)) {
+    return -1;
+  }
+  index += 2;
+
+  return index;
+}
+
+/**
+ * Scan the time part `hh:mm:ss(.s+)?` of an `xs:dateTime` at `start`.
+ *
+ * @param value - to be scanned
+ * @param start - index where the time part starts
+ * @returns index right after the time part, or -1 if the time is invalid
+ */
+function endOfXsTimePart(value: string, start: number): number {
+  const hour0 = digitAt(value, start);
+  const hour1 = digitAt(value, start + 1);
+  if (hour0 === -1 || hour1 === -1) {
+    return -1;
+  }
+  const hour = hour0 * 10 + hour1;
+  if (hour > 24) {
+    return -1;
+  }
+
+  if (
+    value.charCodeAt(start + 2) !== CHAR_CODE_COLON ||
+    value.charCodeAt(start + 5) !== CHAR_CODE_COLON
+  ) {
+    return -1;
+  }
+
+  const minute0 = digitAt(value, start + 3);
+  const second0 = digitAt(value, start + 6);
+  if (
+    minute0 === -1 ||
+    minute0 > 5 ||
+    digitAt(value, start + 4) === -1 ||
+    second0 === -1 ||
+    second0 > 5 ||
+    digitAt(value, start + 7) === -1
+  ) {
+    return -1;
+  }
+
+  let index = start + 8;
+
+  // The end of the day is only allowed as 24:00:00(.0+)?.
+  const endOfDay = hour === 24;
+  if (endOfDay && value.substring(start + 3, start + 8) !== "00:00") {
+    return -1;
+  }
+
+  if (value.charCodeAt(index) === CHAR_CODE_DOT) {
+    index++;
+
+    const fractionStart = index;
+    for (;;) {
+      const digit = digitAt(value, index);
+      if (digit === -1 || (endOfDay && digit !== 0)) {
+        break;
+      }
+      index++;
+    }
+
+    if (index === fractionStart) {
+      return -1;
+    }
   }
 
-  if (month <= 0 || month >= 13) {
+  return index;
+}
+
+/**
+ * Check that `value` ends with a valid time part and an optional time zone offset
+ * as in an `xs:dateTime`.
+ *
+ * @param value - to be checked
+ * @param start - index where the time part starts
+ * @param offsetRequired - if set, the time zone offset must be given
+ * @returns `true` if the time and the offset are valid
+ */
+function isXsTimeWithTimezoneOffset(
+  value: string,
+  start: number,
+  offsetRequired: boolean
+): boolean {
+  const end = endOfXsTimePart(value, start);
+  if (end === -1) {
     return false;
   }
 
-  const maxDays = month === 2 ? (isLeapYear(year) ? 29 : 28) : DAYS_IN_MONTH.get(month);
+  if (end === value.length) {
+    return !offsetRequired;
+  }
+
+  if (endOfTimezoneOffset(value, end, false) === value.length) {
+    return true;
+  }
+
+  // The pattern allows for the unsigned offset `14:00`, see endOfTimezoneOffset.
+  // The regular expression backtracks into the fraction of the seconds to find
+  // it, so we need to do the same. At least one digit of the fraction must remain.
+  return (
+    end === value.length - 3 &&
+    value.substring(end) === ":00" &&
+    value.substring(end - 2, end) === "14" &&
+    end - 2 > start + 9
+  );
+}
+
+/**
+ * Scan the time zone offset at `start`.
+ *
+ * @remarks
+ * The patterns of `xs:date`, `xs:dateTime` and `xs:dateTimeStamp` allow
+ * the offset `14:00` *without* a sign, and do not allow `+14:00` and `-14:00`.
+ * This is probably a glitch in the grouping of the pattern. We follow
+ * the pattern here nevertheless so that the scanners and the patterns agree.
+ *
+ * @param value - to be scanned
+ * @param start - index where the time zone offset starts
+ * @param signedFourteen - if set, `+14:00` and `-14:00` are accepted instead of
+ * `14:00`
+ * @returns index right after the offset, or -1 if there is no valid offset
+ */
+function endOfTimezoneOffset(
+  value: string,
+  start: number,
+  signedFourteen: boolean
+): number {
+  const first = value.charCodeAt(start);
 
-  if (day > maxDays) {
+  if (first === CHAR_CODE_UPPER_Z) {
+    return start + 1;
+  }
+
+  if (first === CHAR_CODE_PLUS || first === CHAR_CODE_MINUS) {
+    const hour0 = digitAt(value, start + 1);
+    const hour1 = digitAt(value, start + 2);
+
+    if (
+      ((hour0 === 0 && hour1 !== -1) || (hour0 === 1 && hour1 !== -1 && hour1 <= 3)) &&
+      value.charCodeAt(start + 3) === CHAR_CODE_COLON
+    ) {
+      const minute0 = digitAt(value, start + 4);
+      if (minute0 !== -1 && minute0 <= 5 && digitAt(value, start + 5) !== -1) {
+        return start + 6;
+      }
+      return -1;
+    }
+
+    if (signedFourteen && value.substring(start + 1, start + 6) === "14:00") {
+      return start + 6;
+    }
+
+    return -1;
+  }
+
+  if (!signedFourteen && value.substring(start, start + 5) === "14:00") {
+    return start + 5;
+  }
+
+  return -1;
+}
+
+/**
+ * Check that `value` is a valid `xs:date`.
+ *
+ * @remarks
+ * Year 1 BCE is the last leap BCE year.
+ * See https://www.w3.org/TR/xmlschema-2/#dateTime.
+ *
+ * @param value - to be be checked
+ * @returns `true` if `value` is a valid `xs:date`
+ */
+export function isXsDate(value: string): boolean {
+  // NOTE (mristin, 2022-11-23):
+  // We can not use date functions from the standard library as it does not
+  // handle years BCE (*e.g.*, `-0003-01-02`).
+
+  const end = endOfXsDatePart(value);
+  if (end === -1) {
     return false;
   }
 
-  return true;
+  return (
+    end === value.length || endOfTimezoneOffset(value, end, false) === value.length
+  );
 }
 
 /**
@@ -1355,12 +1803,12 @@ export function isXsDateTime(value: string): boolean {
   // We can not use date functions from the standard library as it does not
   // handle years BCE (*e.g.*, `-0003-01-02`).
 
-  if (!matchesXsDateTime(value)) {
+  const endOfDate = endOfXsDatePart(value);
+  if (endOfDate === -1 || value.charCodeAt(endOfDate) !== CHAR_CODE_UPPER_T) {
     return false;
   }
 
-  const date = value.split("T", 1)[0];
-  return isXsDate(date);
+  return isXsTimeWithTimezoneOffset(value, endOfDate + 1, false);
 }
 
 /**
@@ -1374,82 +1822,142 @@ export function isXsDateTime(value: string): boolean {
  * @returns `true` if `value` is a valid `xs:dateTimeStamp`
  */
 export function isXsDateTimeStamp(value: string): boolean {
-  if (!matchesXsDateTimeStamp(value)) {
+  const endOfDate = endOfXsDatePart(value);
+  if (endOfDate === -1 || value.charCodeAt(endOfDate) !== CHAR_CODE_UPPER_T) {
     return false;
   }
 
-  const date = value.split("T", 1)[0];
-  return isXsDate(date);
+  return isXsTimeWithTimezoneOffset(value, endOfDate + 1, true);
 }
 
 /**
- * Check that `value` is a valid `xs:double`.
+ * Check that `value` is a valid `xs:double` or `xs:float`.
  *
  * @param value - to be be checked
- * @returns `true` if `value` is a valid `xs:double`
+ * @param maxDigitsSurelyFinite - maximum number of significant integer digits of
+ * a number without an exponent which surely fits in the target type
+ * @param isFiniteInTarget - check whether the parsed number fits in the target type
+ * @returns `true` if `value` is valid
  */
-export function isXsDouble(value: string): boolean {
-  // NOTE (mristin, 2022-11-23):
-  // We need to check explicitly for the regular expression since
-  // `parseFloat` expects `Infinity`  instead of `INF`.
-  if (!matchesXsDouble(value)) {
-    return false;
+function isXsFloatingPoint(
+  value: string,
+  maxDigitsSurelyFinite: number,
+  isFiniteInTarget: (converted: number) => boolean
+): boolean {
+  if (value === "INF" || value === "-INF" || value === "NaN") {
+    return true;
   }
 
-  if (value !== "INF" && value !== "-INF" && value !== "NaN") {
-    // NOTE (mristin, 2022-11-23):
-    // Check that the value is not too big to be represented as a double-precision
-    // floating point number.
-    //
-    // For example, `parseFloat("1e400")` gives `Infinity`.
-    const converted = parseFloat(value);
+  let index = 0;
 
-    if (!isFinite(converted)) {
-      return false;
+  const first = value.charCodeAt(0);
+  if (first === CHAR_CODE_PLUS || first === CHAR_CODE_MINUS) {
+    index++;
+  }
+
+  let integerDigits = 0;
+  let significantIntegerDigits = 0;
+  for (;;) {
+    const digit = digitAt(value, index);
+    if (digit === -1) {
+      break;
     }
+    if (digit !== 0 || significantIntegerDigits > 0) {
+      significantIntegerDigits++;
+    }
+    integerDigits++;
+    index++;
   }
 
-  return true;
-}
+  let fractionDigits = 0;
+  if (value.charCodeAt(index) === CHAR_CODE_DOT) {
+    index++;
+    while (digitAt(value, index) !== -1) {
+      fractionDigits++;
+      index++;
+    }
+  }
 
-/**
- * Check that `value` is a valid `xs:float`.
- *
- * @param value - to be be checked
- * @returns `true` if `value` is a valid `xs:float`
- */
-export function isXsFloat(value: string): boolean {
-  // NOTE (mristin, 2022-11-23):
-  // We need to check explicitly for the regular expression since
-  // `parseFloat` expects `Infinity`  instead of `INF`.
-  if (!matchesXsFloat(value)) {
+  if (integerDigits === 0 && fractionDigits === 0) {
     return false;
   }
 
-  if (value !== "INF" && value !== "-INF" && value !== "NaN") {
-    // NOTE (mristin, 2022-11-23):
-    // Check that the value is not too big to be represented as a double-precision
-    // floating point number.
-    //
-    // For example, `parseFloat("1e400")` gives `Infinity`.
-    const converted = parseFloat(value);
+  let hasExponent = false;
+  const exponentMarker = value.charCodeAt(index);
+  if (exponentMarker === CHAR_CODE_UPPER_E || exponentMarker === CHAR_CODE_LOWER_E) {
+    hasExponent = true;
+    index++;
 
-    if (!isFinite(converted)) {
-      return false;
+    const exponentSign = value.charCodeAt(index);
+    if (exponentSign === CHAR_CODE_PLUS || exponentSign === CHAR_CODE_MINUS) {
+      index++;
+    }
+
+    const exponentStart = index;
+    while (digitAt(value, index) !== -1) {
+      index++;
     }
 
-    // NOTE (mristin, 2022-11-23):
-    // TypeScript represents numbers as 64-bit floating point numbers. While there
-    // is no easy way to deal with the precision, as precision is silently
-    // gutted during the parsing, we can still check if the number is too large
-    // to fit in a 32-bit float.
-    const rounded = Math.fround(converted);
-    if (!isFinite(rounded)) {
+    if (index === exponentStart) {
       return false;
     }
   }
 
-  return true;
+  if (index !== value.length) {
+    return false;
+  }
+
+  if (!hasExponent && significantIntegerDigits <= maxDigitsSurelyFinite) {
+    return true;
+  }
+
+  // NOTE (mristin, 2022-11-23):
+  // Check that the value is not too big to be represented as a floating point
+  // number. For example, `parseFloat("1e400")` gives `Infinity`.
+  return isFiniteInTarget(parseFloat(value));
+}
+
+/**
+ * Check that `converted` is a finite double-precision number.
+ */
+function isFiniteDouble(converted: number): boolean {
+  return isFinite(converted);
+}
+
+/**
+ * Check that `converted` fits in a finite single-precision number.
+ */
+function isFiniteFloat(converted: number): boolean {
+  // NOTE (mristin, 2022-11-23):
+  // TypeScript represents numbers as 64-bit floating point numbers. While there
+  // is no easy way to deal with the precision, as precision is silently
+  // gutted during the parsing, we can still check if the number is too large
+  // to fit in a 32-bit float.
+  return isFinite(converted) && isFinite(Math.fround(converted));
+}
+
+/**
+ * Check that `value` is a valid `xs:double`.
+ *
+ * @param value - to be be checked
+ * @returns `true` if `value` is a valid `xs:double`
+ */
+export function isXsDouble(value: string): boolean {
+  // The largest double is about 1.8e308, so any integer part with at most
+  // 308 digits fits.
+  return isXsFloatingPoint(value, 308, isFiniteDouble);
+}
+
+/**
+ * Check that `value` is a valid `xs:float`.
+ *
+ * @param value - to be be checked
+ * @returns `true` if `value` is a valid `xs:float`
+ */
+export function isXsFloat(value: string): boolean {
+  // The largest float is about 3.4e38, so any integer part with at most
+  // 38 digits fits.
+  return isXsFloatingPoint(value, 38, isFiniteFloat);
 }
 
 /**
@@ -1459,53 +1967,96 @@ export function isXsFloat(value: string): boolean {
  * @returns `true` if `value` is a valid `xs:gMonthDay`
  */
 export function isXsGMonthDay(value: string): boolean {
-  if (!matchesXsGMonthDay(value)) {
+  if (
+    value.charCodeAt(0) !== CHAR_CODE_MINUS ||
+    value.charCodeAt(1) !== CHAR_CODE_MINUS ||
+    value.charCodeAt(4) !== CHAR_CODE_MINUS
+  ) {
     return false;
   }
 
-  const month = parseInt(value.substring(2, 4), 10);
-  const day = parseInt(value.substring(5, 7), 10);
-
-  const maxDays = DAYS_IN_MONTH.get(month);
-  return day <= maxDays;
-}
+  const month0 = digitAt(value, 2);
+  const month1 = digitAt(value, 3);
+  const day0 = digitAt(value, 5);
+  const day1 = digitAt(value, 6);
+  if (month0 === -1 || month1 === -1 || day0 === -1 || day1 === -1) {
+    return false;
+  }
 
-const LONG_RE = new RegExp("^([-+])?0*([0-9]{1,20})$");
+  const month = month0 * 10 + month1;
+  const day = day0 * 10 + day1;
+  if (month < 1 || month > 12 || day < 1 || day > maxDaysInMonth(month, true)) {
+    return false;
+  }
 
-const SMALLEST_LONG_WITHOUT_SIGN_AS_STRING = "9223372036854775808";
-const LARGEST_LONG_AS_STRING = "9223372036854775807";
+  return value.length === 7 || endOfTimezoneOffset(value, 7, true) === value.length;
+}
 
 /**
- * Check that `value` is a valid `xs:long`.
+ * Check that `value` is a valid decimal integer within the limits.
  *
- * @param value - to be be checked
- * @returns `true` if `value` is a valid `xs:long`
+ * @remarks
+ * We need to operate on the value as string since TypeScript represents numbers as
+ * 64-bit floating-point numbers which can not capture 64-bit integers.
+ *
+ * @param value - to be checked
+ * @param smallestWithoutSign - absolute value of the smallest allowed integer as
+ * a string, or `null` if only non-negative integers are allowed
+ * @param largest - largest allowed integer as a string
+ * @returns `true` if `value` is a valid integer within the limits
  */
-export function isXsLong(value: string): boolean {
-  // NOTE (mristin, 2022-11-23):
-  // We need to operate on the value as string since TypeScript represents numbers as
-  // 64-bit floating-point numbers which can not capture 64-bit integers.
+function isIntegerWithin(
+  value: string,
+  smallestWithoutSign: string | null,
+  largest: string
+): boolean {
+  let index = 0;
+  let negative = false;
+
+  const first = value.charCodeAt(0);
+  if (first === CHAR_CODE_MINUS) {
+    if (smallestWithoutSign === null) {
+      // The unsigned types allow only for the negative zero.
+      return value === "-0";
+    }
+    negative = true;
+    index++;
+  } else if (first === CHAR_CODE_PLUS) {
+    index++;
+  }
 
-  const match = value.match(LONG_RE);
-  if (!match) {
+  if (index === value.length) {
     return false;
   }
 
-  const numberPart = match[2];
+  while (value.charCodeAt(index) === CHAR_CODE_ZERO) {
+    index++;
+  }
+
+  const significantStart = index;
+  while (index < value.length) {
+    if (digitAt(value, index) === -1) {
+      return false;
+    }
+    index++;
+  }
+
+  const significantLength = value.length - significantStart;
 
   const limit =
-    match[1] === "-" ? SMALLEST_LONG_WITHOUT_SIGN_AS_STRING : LARGEST_LONG_AS_STRING;
+    negative && smallestWithoutSign !== null ? smallestWithoutSign : largest;
 
-  if (numberPart.length < limit.length) {
+  if (significantLength < limit.length) {
     return true;
   }
 
-  if (numberPart.length > limit.length) {
+  if (significantLength > limit.length) {
     return false;
   }
 
-  for (let i = numberPart.length - 1; i >= 0; i--) {
-    const thisDigit = numberPart.charCodeAt(i);
+  // We compare the digits from the left as the numbers have the same length.
+  for (let i = 0; i < significantLength; i++) {
+    const thisDigit = value.charCodeAt(significantStart + i);
     const limitDigit = limit.charCodeAt(i);
 
     if (thisDigit > limitDigit) {
@@ -1521,6 +2072,16 @@ export function isXsLong(value: string): boolean {
   return true;
 }
 
+/**
+ * Check that `value` is a valid `xs:long`.
+ *
+ * @param value - to be be checked
+ * @returns `true` if `value` is a valid `xs:long`
+ */
+export function isXsLong(value: string): boolean {
+  return isIntegerWithin(value, "9223372036854775808", "9223372036854775807");
+}
+
 /**
  * Check that `value` is a valid `xs:int`.
  *
@@ -1528,12 +2089,7 @@ export function isXsLong(value: string): boolean {
  * @returns `true` if `value` is a valid `xs:int`
  */
 export function isXsInt(value: string): boolean {
-  if (!matchesXsInt(value)) {
-    return false;
-  }
-
-  const converted = parseInt(value, 10);
-  return -2147483648 <= converted && converted <= 2147483647;
+  return isIntegerWithin(value, "2147483648", "2147483647");
 }
 
 /**
@@ -1543,12 +2099,7 @@ export function isXsInt(value: string): boolean {
  * @returns `true` if `value` is a valid `xs:short`
  */
 export function isXsShort(value: string): boolean {
-  if (!matchesXsShort(value)) {
-    return false;
-  }
-
-  const converted = parseInt(value, 10);
-  return -32768 <= converted && converted <= 32767;
+  return isIntegerWithin(value, "32768", "32767");
 }
 
 /**
@@ -1558,18 +2109,9 @@ export function isXsShort(value: string): boolean {
  * @returns `true` if `value` is a valid `xs:byte`
  */
 export function isXsByte(value: string): boolean {
-  if (!matchesXsByte(value)) {
-    return false;
-  }
-
-  const converted = parseInt(value, 10);
-  return -128 <= converted && converted <= 127;
+  return isIntegerWithin(value, "128", "127");
 }
 
-const UNSIGNED_LONG_RE = new RegExp("^(-0|\\+?0*([0-9]{1,20}))$");
-
-const LARGEST_UNSIGNED_LONG_AS_STRING = "18446744073709551615";
-
 /**
  * Check that `value` is a valid `xs:unsignedLong`.
  *
@@ -1577,40 +2119,7 @@ const LARGEST_UNSIGNED_LONG_AS_STRING = "18446744073709551615";
  * @returns `true` if `value` is a valid `xs:unsignedLong`
  */
 export function isXsUnsignedLong(value: string): boolean {
-  // NOTE (mristin, 2022-11-23):
-  // We need to operate on the value as string since TypeScript represents numbers as
-  // 64-bit floating-point numbers which can not capture 64-bit integers.
-
-  const match = value.match(UNSIGNED_LONG_RE);
-  if (!match) {
-    return false;
-  }
-
-  const numberPart = match[2];
-
-  if (numberPart.length < LARGEST_UNSIGNED_LONG_AS_STRING.length) {
-    return true;
-  }
-
-  if (numberPart.length > LARGEST_UNSIGNED_LONG_AS_STRING.length) {
-    return false;
-  }
-
-  for (let i = numberPart.length - 1; i >= 0; i--) {
-    const thisDigit = numberPart.charCodeAt(i);
-    const limitDigit = LARGEST_UNSIGNED_LONG_AS_STRING.charCodeAt(i);
-
-    if (thisDigit > limitDigit) {
-      return false;
-    } else if (thisDigit < limitDigit) {
-      return true;
-    } else {
-      // Pass, we have to compare against the next digit from the left.
-    }
-  }
-
-  // The number is exactly the limit.
-  return true;
+  return isIntegerWithin(value, null, "18446744073709551615");
 }
 
 /**
@@ -1620,12 +2129,7 @@ export function isXsUnsignedLong(value: string): boolean {
  * @returns `true` if `value` is a valid `xs:unsignedInt`
  */
 export function isXsUnsignedInt(value: string): boolean {
-  if (!matchesXsUnsignedInt(value)) {
-    return false;
-  }
-
-  const converted = parseInt(value, 10);
-  return 0 <= converted && converted <= 4294967295;
+  return isIntegerWithin(value, null, "4294967295");
 }
 
 /**
@@ -1635,12 +2139,7 @@ export function isXsUnsignedInt(value: string): boolean {
  * @returns `true` if `value` is a valid `xs:unsignedShort`
  */
 export function isXsUnsignedShort(value: string): boolean {
-  if (!matchesXsUnsignedShort(value)) {
-    return false;
-  }
-
-  const converted = parseInt(value, 10);
-  return 0 <= converted && converted <= 65535;
+  return isIntegerWithin(value, null, "65535");
 }
 
 /**
@@ -1650,15 +2149,10 @@ export function isXsUnsignedShort(value: string): boolean {
  * @returns `true` if `value` is a valid `xs:unsignedByte`
  */
 export function isXsUnsignedByte(value: string): boolean {
-  if (!matchesXsUnsignedByte(value)) {
-    return false;
-  }
-
-  const converted = parseInt(value, 10);
-  return 0 <= converted && converted <= 255;
+  return isIntegerWithin(value, null, "255");
 }
 
-const DATA_TYPE_DEF_XSD_TO_VALUE_CONSISTENCY = new Map<
+const DATA_TYPE_DEF_XSD_TO_VALUE_CONSISTENCY = /*@__PURE__*/ new Map<
   AasTypes.DataTypeDefXsd,
   (string) => boolean
 >([
@@ -1697,18 +2191,6 @@ const DATA_TYPE_DEF_XSD_TO_VALUE_CONSISTENCY = new Map<
   [AasTypes.DataTypeDefXsd.NegativeInteger, matchesXsNegativeInteger]
 ]);
 
-function assertAllDataTypeDefXsdCovered() {
-  for (const literal of AasTypes.overDataTypeDefXsd()) {
-    if (!DATA_TYPE_DEF_XSD_TO_VALUE_CONSISTENCY.has(literal)) {
-      throw new Error(
-        `The enumeration key ${literal} of AasTypes.DataTypeDefXsd ` +
-          "is not covered in DATA_TYPE_DEF_XSD_TO_VALUE_CONSISTENCY"
-      );
-    }
-  }
-}
-assertAllDataTypeDefXsdCovered();
-
 /**
  * Check that `value` is consistent with the given `valueType`.
  *
@@ -1727,7 +2209,19 @@ export function valueConsistentWithXsdType(
         `but got: ${valueType}`
     );
   }
-  return verifier(value);
+
+  const cache = activeVerificationCache;
+  if (cache === null) {
+    return verifier(value);
+  }
+
+  const key = `valueConsistentWithXsdType:${valueType}:${value}`;
+  let result = cache.get(key);
+  if (result === undefined) {
+    result = verifier(value);
+    cache.set(key, result);
+  }
+  return result;
 }
 
 function constructMatchesGlobalAssetIdLiterally(): RegExp {
@@ -1736,8 +2230,9 @@ function constructMatchesGlobalAssetIdLiterally(): RegExp {
   return new RegExp(pattern, "u");
 }
 
-const REGEXP_MATCHES_GLOBAL_ASSET_ID_LITERALLY =
-  constructMatchesGlobalAssetIdLiterally();
+const REGEXP_MATCHES_GLOBAL_ASSET_ID_LITERALLY = /*@__PURE__*/ lazyRegExp(
+  constructMatchesGlobalAssetIdLiterally
+);
 
 /**
  * Check that the `text` matches `globalAssetId` case-insensitive.
@@ -1754,7 +2249,7 @@ const REGEXP_MATCHES_GLOBAL_ASSET_ID_LITERALLY =
  * @returns True if the `text` matches case-insensitive
  */
 export function matchesGlobalAssetIdLiterally(text: string): boolean {
-  return REGEXP_MATCHES_GLOBAL_ASSET_ID_LITERALLY.test(text);
+  return REGEXP_MATCHES_GLOBAL_ASSET_ID_LITERALLY().test(text);
 }
 
 /**
@@ -1861,7 +2356,7 @@ export function submodelElementsHaveIdenticalSemanticIds(
   return true;
 }
 
-const AAS_SUBMODEL_ELEMENTS_TO_IS = new Map<
+const AAS_SUBMODEL_ELEMENTS_TO_IS = /*@__PURE__*/ new Map<
   AasTypes.AasSubmodelElements,
   (that: AasTypes.Class) => boolean
 >([
@@ -1893,18 +2388,6 @@ const AAS_SUBMODEL_ELEMENTS_TO_IS = new Map<
   ]
 ]);
 
-function assertAllTypesCoveredInAasSubmodelElementsToIs() {
-  for (const literal of AasTypes.overAasSubmodelElements()) {
-    if (!AAS_SUBMODEL_ELEMENTS_TO_IS.has(literal)) {
-      throw new Error(
-        `The enumeration literal ${literal} of AasTypes.AasSubmodelElements ` +
-          "is not covered in AAS_SUBMODEL_ELEMENTS_TO_IS"
-      );
-    }
-  }
-}
-assertAllTypesCoveredInAasSubmodelElementsToIs();
-
 /**
  * Check that `element` is an instance of class corresponding to
  * `expectedType`.
@@ -2134,13 +2617,15 @@ function constructIsBcp47ForEnglish(): RegExp {
   return new RegExp(pattern, "u");
 }
 
-const REGEXP_IS_BCP_47_FOR_ENGLISH = constructIsBcp47ForEnglish();
+const REGEXP_IS_BCP_47_FOR_ENGLISH = /*@__PURE__*/ lazyRegExp(
+  constructIsBcp47ForEnglish
+);
 
 /**
  * Check that the `text` corresponds to a BCP47 code for english.
  */
 export function isBcp47ForEnglish(text: string): boolean {
-  return REGEXP_IS_BCP_47_FOR_ENGLISH.test(text);
+  return REGEXP_IS_BCP_47_FOR_ENGLISH().test(text);
 }
 
 /**
@@ -7575,20 +8060,347 @@ class Verifier extends AasTypes.AbstractTransformerWithContext<
   }
 }
 
-const VERIFIER = new Verifier();
+const VERIFIER = /*@__PURE__*/ new Verifier();
+
+/**
+ * Run the verification `iterator` with the `cache` active.
+ */
+function* iterateWithCache(
+  iterator: IterableIterator<VerificationError>,
+  cache: VerificationCache | null
+): IterableIterator<VerificationError> {
+  if (cache === null) {
+    yield* iterator;
+    return;
+  }
+
+  // The verification is lazy, so other code, including other
+  // verifications, might run between our steps. Hence, we activate the cache
+  // only for the duration of each single step.
+  for (;;) {
+    const previousCache = activeVerificationCache;
+    activeVerificationCache = cache;
+
+    let next: IteratorResult<VerificationError>;
+    try {
+      next = iterator.next();
+    } finally {
+      activeVerificationCache = previousCache;
+    }
+
+    if (next.done === true) {
+      return;
+    }
+
+    yield next.value;
+  }
+}
 
 /**
  * Verify the constraints of `that`.
  *
  * @param that - instance to be verified
  * @param recurse - if set, continue the verification recursively
+ * @param cache - if set, memoize the expensive checks of values in it
  * @returns a stream of verification errors
  */
 export function* verify(
   that: AasTypes.Class,
-  recurse = true
+  recurse = true,
+  cache: VerificationCache | null = null
 ): IterableIterator<VerificationError> {
-  yield* VERIFIER.transformWithContext(that, recurse);
+  yield* iterateWithCache(VERIFIER.transformWithContext(that, recurse), cache);
+}
+
+/**
+ * Mark the end of a time slice in the stream of verification errors.
+ *
+ * @remarks
+ * The marker never leaves this module.
+ */
+class EndOfSlice extends VerificationError {
+  constructor() {
+    super("End of a time slice");
+  }
+}
+
+/**
+ * Verify like {@link Verifier}, but signal the end of a time slice in
+ * between the instances.
+ */
+class SlicedVerifier extends Verifier {
+  private readonly slicer: AasCommon.TimeSlicer;
+
+  constructor(slicer: AasCommon.TimeSlicer) {
+    super();
+    this.slicer = slicer;
+  }
+
+  *transformWithContext(
+    that: AasTypes.Class,
+    context: boolean
+  ): IterableIterator<VerificationError> {
+    if (this.slicer.tick()) {
+      yield new EndOfSlice();
+    }
+
+    yield* super.transformWithContext(that, context);
+  }
+}
+
+/**
+ * Verify the constraints of `that` without blocking the event loop.
+ *
+ * @remarks
+ * The verification runs in time slices, and yields to the event loop in between.
+ * The errors and their order are exactly the same as in {@link verify}.
+ *
+ * @param that - instance to be verified
+ * @param recurse - if set, continue the verification recursively
+ * @param cache - if set, memoize the expensive checks of values in it
+ * @param slicing - to control the time slices and the abort, if any
+ * @returns a stream of verification errors
+ * @throws the reason of the abort, if the verification has been aborted
+ */
+export async function* verifyAsync(
+  that: AasTypes.Class,
+  recurse = true,
+  cache: VerificationCache | null = null,
+  slicing: AasCommon.TimeSlicingOptions | null = null
+): AsyncIterableIterator<VerificationError> {
+  const slicer = new AasCommon.TimeSlicer(slicing);
+  slicer.throwIfAborted();
+
+  // See iterateWithCache() on why we activate the cache only for each single step.
+  const iterator = new SlicedVerifier(slicer).transformWithContext(that, recurse);
+  for (;;) {
+    const previousCache = activeVerificationCache;
+    activeVerificationCache = cache;
+
+    let next: IteratorResult<VerificationError>;
+    try {
+      next = iterator.next();
+    } finally {
+      activeVerificationCache = previousCache;
+    }
+
+    if (next.done === true) {
+      return;
+    }
+
+    if (next.value instanceof EndOfSlice) {
+      await slicer.pause();
+      continue;
+    }
+
+    yield next.value;
+  }
+}
+
+/**
+ * Copy `that` error so that prepending to its path leaves `that` as it is.
+ */
+function copyVerificationError(that: VerificationError): VerificationError {
+  const path = new Path();
+  path.segments.push(...that.path.segments);
+  return new VerificationError(that.message, path);
+}
+
+/**
+ * Represent the absence of errors without allocating an array for each instance.
+ */
+const NO_VERIFICATION_ERRORS: Array<VerificationError> = [];
+
+/**
+ * Verify like {@link Verifier}, but remember the errors of each sub-tree, and
+ * replay them instead of verifying the sub-tree again.
+ */
+class CachingVerifier extends Verifier {
+  /**
+   * Map instances to the errors of their sub-trees, relative to the instances
+   */
+  results = new WeakMap<AasTypes.Class, Array<VerificationError>>();
+
+  *transformWithContext(
+    that: AasTypes.Class,
+    context: boolean
+  ): IterableIterator<VerificationError> {
+    if (context !== true) {
+      yield* super.transformWithContext(that, context);
+      return;
+    }
+
+    const cached = this.results.get(that);
+    if (cached !== undefined) {
+      for (const error of cached) {
+        yield copyVerificationError(error);
+      }
+      return;
+    }
+
+    // The callers prepend to the paths of the errors, so we keep copies.
+    const errors = new Array<VerificationError>();
+    for (const error of super.transformWithContext(that, context)) {
+      errors.push(copyVerificationError(error));
+      yield error;
+    }
+
+    // We get here only if the caller consumed all the errors, so we never
+    // remember an incomplete result.
+    this.results.set(that, errors.length > 0 ? errors : NO_VERIFICATION_ERRORS);
+  }
+}
+
+/**
+ * Verify a model over and over again as it changes, re-verifying only
+ * the changed parts.
+ *
+ * @remarks
+ * The verifier remembers the errors of each sub-tree it verified. When you
+ * verify again, it replays the remembered errors of the sub-trees which have not
+ * been invalidated in the meanwhile, and verifies the others.
+ *
+ * The errors and their order are exactly the same as in the recursive
+ * {@link verify}, provided that you invalidate every modified instance together
+ * with all its ancestors. The dirty instances of a
+ * {@link tracking!ChangeTracker} are exactly such a set:
+ *
+ * ```ts
+ * verifier.invalidate(tracker.takeDirty());
+ * for (const error of verifier.verify(environment)) {
+ *   // ...
+ * }
+ * ```
+ *
+ * The ancestors need to be verified again anyway, as many of their invariants,
+ * such as {@link idShortsAreUnique} or
+ * {@link submodelElementsHaveIdenticalSemanticIds}, depend on their children.
+ * Their other children are replayed.
+ *
+ * The instances are remembered weakly, so the removed parts of the model are
+ * garbage-collected as usual.
+ */
+export class IncrementalVerifier {
+  private readonly verifier = new CachingVerifier();
+
+  private readonly cache: VerificationCache | null;
+
+  /**
+   * Initialize with no remembered errors.
+   *
+   * @param cache - if set, memoize the expensive checks of values in it
+   */
+  constructor(cache: VerificationCache | null = null) {
+    this.cache = cache;
+  }
+
+  /**
+   * Forget the errors of the `instances`, so that they are verified again.
+   *
+   * @param instances - modified instances together with all their ancestors
+   */
+  invalidate(instances: Iterable<AasTypes.Class>): void {
+    for (const instance of instances) {
+      this.verifier.results.delete(instance);
+    }
+  }
+
+  /**
+   * Forget all the errors.
+   */
+  clear(): void {
+    this.verifier.results = new WeakMap<AasTypes.Class, Array<VerificationError>>();
+  }
+
+  /**
+   * Verify the constraints of `that` recursively.
+   *
+   * @param that - instance to be verified
+   * @returns a stream of verification errors
+   */
+  *verify(that: AasTypes.Class): IterableIterator<VerificationError> {
+    yield* iterateWithCache(this.verifier.transformWithContext(that, true), this.cache);
+  }
+}
+
+/**
+ * Verify the instances one by one as they are constructed, *e.g.*, during
+ * the de-serialization, and report the errors of the whole model at the end.
+ *
+ * @remarks
+ * Call {@link check} from {@link deserialization!DeserializationOptions.onInstance},
+ * so that each instance is checked right after its construction, children
+ * before parents. We only check whether the instance itself violates any
+ * invariant, and remember the sub-trees which are free of errors.
+ *
+ * {@link errors} then walks the model to report the errors with their paths.
+ * The sub-trees free of errors are skipped without walking them, so a valid
+ * model is not walked a second time at all. The errors and their order are
+ * exactly the same as in the recursive {@link verify}.
+ *
+ * The instances must not change between {@link check} and {@link errors}.
+ * If you de-serialize with
+ * {@link deserialization!DeserializationOptions.lazySubmodelElements}, checking
+ * a submodel de-serializes its elements.
+ */
+export class ConstructionVerifier {
+  private readonly verifier = new CachingVerifier();
+
+  private readonly cache: VerificationCache | null;
+
+  /**
+   * Initialize with no instances checked.
+   *
+   * @param cache - if set, memoize the expensive checks of values in it
+   */
+  constructor(cache: VerificationCache | null = null) {
+    this.cache = cache;
+  }
+
+  /**
+   * Check the invariants of `that` instance, but not of its children.
+   *
+   * @remarks
+   * The children must have been checked before.
+   *
+   * @param that - newly constructed instance
+   */
+  check(that: AasTypes.Class): void {
+    const previousCache = activeVerificationCache;
+    activeVerificationCache = this.cache;
+
+    let valid: boolean;
+    try {
+      // We only need to know whether there is any error, so we stop at
+      // the first one.
+      valid = VERIFIER.transformWithContext(that, false).next().done === true;
+    } finally {
+      activeVerificationCache = previousCache;
+    }
+
+    if (!valid) {
+      return;
+    }
+
+    const results = this.verifier.results;
+    for (const child of that.descendOnce()) {
+      if (!results.has(child)) {
+        return;
+      }
+    }
+
+    results.set(that, NO_VERIFICATION_ERRORS);
+  }
+
+  /**
+   * Report the errors of the model under `that`.
+   *
+   * @param that - root of the model whose instances have all been checked
+   * @returns a stream of verification errors
+   */
+  *errors(that: AasTypes.Class): IterableIterator<VerificationError> {
+    yield* iterateWithCache(this.verifier.transformWithContext(that, true), this.cache);
+  }
 }
 
 /**
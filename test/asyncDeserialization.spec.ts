@@ -0,0 +1,127 @@
+/**
+ * Test the time-sliced de-serialization.
+ */
+
+import * as path from "path";
+
+import * as AasAsyncDeserialization from "../src/asyncDeserialization";
+import * as AasDeserialization from "../src/deserialization";
+import * as AasJsonization from "../src/jsonization";
+import * as AasStringification from "../src/stringification";
+
+import * as TestCommon from "./common";
+import * as TestCommonJsonization from "./commonJsonization";
+
+/**
+ * Represent the result of a de-serialization so that it can be compared.
+ */
+function describeResult(
+  environmentOrError: ReturnType<typeof AasDeserialization.environmentFromJsonable>
+): AasJsonization.JsonValue {
+  if (environmentOrError.error !== null) {
+    return `${environmentOrError.error.path}: ${environmentOrError.error.message}`;
+  }
+  return AasJsonization.toJsonable(environmentOrError.mustValue());
+}
+
+test("the time-sliced de-serialization gives the same results", async () => {
+  const jsonDir = path.join(TestCommon.TEST_DATA_DIR, "Json", "ContainedInEnvironment");
+
+  let count = 0;
+  for (const aPath of TestCommon.findFilesBySuffixRecursively(jsonDir, ".json")) {
+    const jsonable = TestCommon.readJsonFromFileSync(aPath);
+
+    const expected = describeResult(
+      AasDeserialization.environmentFromJsonable(jsonable)
+    );
+
+    for (const nodeBudget of [1, 3, 1000]) {
+      const got = describeResult(
+        await AasAsyncDeserialization.environmentFromJsonableAsync(
+          jsonable,
+          null,
+          { nodeBudget }
+        )
+      );
+      expect(got).toEqual(expected);
+    }
+
+    count++;
+  }
+
+  expect(count).toBeGreaterThan(0);
+});
+
+test("the options are respected", async () => {
+  const jsonable = AasJsonization.toJsonable(
+    TestCommonJsonization.loadCompleteEnvironment()
+  );
+
+  for (const options of [
+    { lazyBlobValues: true },
+    { lazySubmodelElements: true },
+    { projection: { Environment: ["submodels"] } }
+  ]) {
+    expect(
+      describeResult(
+        await AasAsyncDeserialization.environmentFromJsonableAsync(
+          jsonable,
+          options,
+          { timeBudget: 0 }
+        )
+      )
+    ).toEqual(
+      describeResult(AasDeserialization.environmentFromJsonable(jsonable, options))
+    );
+  }
+});
+
+test("the instances are reported in the same order", async () => {
+  const jsonable = AasJsonization.toJsonable(
+    TestCommonJsonization.loadCompleteEnvironment()
+  );
+
+  const expected = new Array<string>();
+  AasDeserialization.environmentFromJsonable(jsonable, {
+    onInstance: (instance) =>
+      expected.push(AasStringification.mustModelTypeToString(instance))
+  }).mustValue();
+
+  const got = new Array<string>();
+  (
+    await AasAsyncDeserialization.environmentFromJsonableAsync(
+      jsonable,
+      {
+        onInstance: (instance) =>
+          got.push(AasStringification.mustModelTypeToString(instance))
+      },
+      { nodeBudget: 1 }
+    )
+  ).mustValue();
+
+  expect(got).toEqual(expected);
+  expect(got[got.length - 1]).toEqual("Environment");
+});
+
+test("the de-serialization can be aborted", async () => {
+  const jsonable = AasJsonization.toJsonable(
+    TestCommonJsonization.loadCompleteEnvironment()
+  );
+
+  const controller = new AbortController();
+  controller.abort();
+  await expect(
+    AasAsyncDeserialization.environmentFromJsonableAsync(jsonable, null, {
+      signal: controller.signal
+    })
+  ).rejects.toBeDefined();
+
+  const anotherController = new AbortController();
+  const promise = AasAsyncDeserialization.environmentFromJsonableAsync(
+    jsonable,
+    null,
+    { nodeBudget: 1, signal: anotherController.signal }
+  );
+  anotherController.abort(new Error("Stop"));
+  await expect(promise).rejects.toThrow("Stop");
+});
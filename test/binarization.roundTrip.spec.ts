@@ -0,0 +1,166 @@
+/**
+ * Test the binary de/serialization against JSON.
+ */
+
+import * as AasBinarization from "../src/binarization";
+import * as AasJsonization from "../src/jsonization";
+import * as AasTypes from "../src/types";
+
+import * as TestCommon from "./common";
+
+test("JSON to binary and back gives the original JSON", () => {
+  for (const aPath of TestCommon.overExpectedJsonPaths()) {
+    const jsonable = TestCommon.readJsonFromFileSync(aPath);
+    const environment = TestCommon.mustEnvironmentFromJsonable(jsonable, aPath);
+
+    const bytes = AasBinarization.toBinary(environment);
+
+    const decodedOrError = AasBinarization.environmentFromBinary(bytes);
+    if (decodedOrError.error !== null) {
+      throw new Error(
+        `Failed to decode the binary of ${aPath} ` +
+          `at ${decodedOrError.error.offset}: ${decodedOrError.error.message}`
+      );
+    }
+
+    const inequalityError = TestCommon.checkJsonablesEqual(
+      jsonable,
+      AasJsonization.toJsonable(decodedOrError.mustValue())
+    );
+    if (inequalityError !== null) {
+      throw new Error(
+        `The original JSON from ${aPath} is unequal the JSON after the binary ` +
+          `round trip: ${inequalityError.path}: ${inequalityError.message}`
+      );
+    }
+  }
+});
+
+test("the binary is smaller than the JSON", () => {
+  for (const aPath of TestCommon.overExpectedJsonPaths()) {
+    const jsonable = TestCommon.readJsonFromFileSync(aPath);
+    const environment = TestCommon.mustEnvironmentFromJsonable(jsonable, aPath);
+
+    expect(AasBinarization.toBinary(environment).length).toBeLessThan(
+      JSON.stringify(jsonable).length
+    );
+  }
+});
+
+test("an instance other than an environment round-trips", () => {
+  const property = new AasTypes.Property(AasTypes.DataTypeDefXsd.Int);
+  property.idShort = "someProperty";
+  property.value = "1234";
+
+  const decodedOrError = AasBinarization.fromBinary(AasBinarization.toBinary(property));
+  expect(decodedOrError.error).toBeNull();
+  expect(decodedOrError.mustValue()).toEqual(property);
+
+  const environmentOrError = AasBinarization.environmentFromBinary(
+    AasBinarization.toBinary(property)
+  );
+  expect(environmentOrError.error?.message).toBe(
+    "Expected an Environment, but got an instance of Property"
+  );
+});
+
+test("strings are not altered", () => {
+  for (const text of [
+    "",
+    "plain ASCII",
+    "Grüße, 世界",
+    "emoji 😀",
+    "unpaired \ud83d surrogate",
+    "reversed \ude00\ud83d surrogates",
+    "x".repeat(100000) + "é"
+  ]) {
+    const langString = new AasTypes.LangString("en", text);
+
+    const decoded = AasBinarization.fromBinary(
+      AasBinarization.toBinary(langString)
+    ).mustValue();
+    expect((<AasTypes.LangString>decoded).text).toBe(text);
+  }
+});
+
+test("blob values are written as raw bytes", () => {
+  const value = new Uint8Array(1000);
+  for (let i = 0; i < value.length; i++) {
+    value[i] = (i * 7) % 256;
+  }
+
+  const blob = new AasTypes.Blob("application/octet-stream");
+  blob.value = value;
+
+  const bytes = AasBinarization.toBinary(blob);
+  expect(bytes.length).toBeLessThan(value.length + blob.contentType.length + 16);
+
+  const decoded = AasBinarization.fromBinary(bytes).mustValue();
+  expect((<AasTypes.Blob>decoded).value).toEqual(value);
+});
+
+function encodedEnvironment(): Uint8Array {
+  const aPath = TestCommon.overExpectedJsonPaths().next().value;
+  if (aPath === undefined) {
+    throw new Error("Expected at least one JSON file in the test data");
+  }
+  return AasBinarization.toBinary(
+    TestCommon.mustEnvironmentFromJsonable(
+      TestCommon.readJsonFromFileSync(aPath),
+      aPath
+    )
+  );
+}
+
+test("every truncation is reported as an error", () => {
+  const bytes = encodedEnvironment();
+  for (let end = 0; end < bytes.length; end++) {
+    const decodedOrError = AasBinarization.fromBinary(bytes.subarray(0, end));
+    expect(decodedOrError.error).not.toBeNull();
+  }
+});
+
+test("trailing bytes are reported as an error", () => {
+  const bytes = encodedEnvironment();
+  const extended = new Uint8Array(bytes.length + 1);
+  extended.set(bytes);
+
+  const decodedOrError = AasBinarization.fromBinary(extended);
+  expect(decodedOrError.error?.message).toBe(
+    "Unexpected 1 trailing byte(s) after the instance"
+  );
+  expect(decodedOrError.error?.offset).toBe(bytes.length);
+});
+
+test("wrong magic bytes and version are reported as errors", () => {
+  const bytes = encodedEnvironment();
+
+  const wrongMagic = bytes.slice();
+  wrongMagic[0] = 0x7b;
+  expect(AasBinarization.fromBinary(wrongMagic).error?.message).toBe(
+    "Expected the magic bytes of the binary format at the start"
+  );
+
+  const wrongVersion = bytes.slice();
+  wrongVersion[4] = 0x7f;
+  expect(AasBinarization.fromBinary(wrongVersion).error?.message).toBe(
+    "Expected the format version 1, but got: 127"
+  );
+});
+
+test("an invalid enumeration literal is reported as an error", () => {
+  const key = new AasTypes.Key(AasTypes.KeyTypes.Submodel, "something");
+  const bytes = AasBinarization.toBinary(key);
+
+  // The key is written as the header, the class tag and the type of the key
+  // followed by the value.
+  const typeOffset = 6;
+  expect(bytes[typeOffset]).toBe(AasTypes.KeyTypes.Submodel);
+  bytes[typeOffset] = 0x7f;
+
+  const decodedOrError = AasBinarization.fromBinary(bytes);
+  expect(decodedOrError.error?.message).toBe(
+    "Expected a literal of KeyTypes, but got: 127"
+  );
+  expect(decodedOrError.error?.offset).toBe(typeOffset);
+});
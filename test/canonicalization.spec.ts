@@ -0,0 +1,123 @@
+/**
+ * Test the canonical JSON serialization.
+ */
+
+import * as path from "path";
+
+import * as AasCanonicalization from "../src/canonicalization";
+import * as AasCommon from "../src/common";
+import * as AasJsonization from "../src/jsonization";
+import * as AasTypes from "../src/types";
+
+import * as TestCommon from "./common";
+
+function canonicalText(jsonable: AasJsonization.JsonValue): string {
+  return Buffer.from(AasCanonicalization.canonicalize(jsonable)).toString("utf-8");
+}
+
+/**
+ * Re-create `jsonable` with the properties of all the objects in reverse order.
+ */
+function reversed(jsonable: AasJsonization.JsonValue): AasJsonization.JsonValue {
+  if (typeof jsonable !== "object" || jsonable === null) {
+    return jsonable;
+  }
+
+  if (Array.isArray(jsonable)) {
+    return jsonable.map(reversed);
+  }
+
+  const jsonObject = <AasJsonization.JsonObject>jsonable;
+  const result: AasJsonization.JsonObject = {};
+  for (const key of Object.keys(jsonObject).reverse()) {
+    result[key] = reversed(jsonObject[key]);
+  }
+  return result;
+}
+
+// The following examples come from:
+// https://www.rfc-editor.org/rfc/rfc8785#section-3.2.2
+
+test("the example of RFC 8785", () => {
+  const jsonable = {
+    numbers: [333333333.33333329, 1e30, 4.5, 2e-3, 0.000000000000000000000000001],
+    string: "€$\u000F\nA'B\"\\\\\"/",
+    literals: [null, true, false]
+  };
+
+  expect(canonicalText(<AasJsonization.JsonValue>(<unknown>jsonable))).toEqual(
+    String.raw`{"literals":[null,true,false],` +
+      String.raw`"numbers":[333333333.3333333,1e+30,4.5,0.002,1e-27],` +
+      String.raw`"string":"€$\u000f\nA'B\"\\\\\"/"}`
+  );
+});
+
+test("the properties are sorted by the UTF-16 code units", () => {
+  const jsonable: AasJsonization.JsonObject = {
+    "€": "Euro Sign",
+    "\r": "Carriage Return",
+    "\ufb33": "Hebrew Letter Dalet With Dagesh",
+    "1": "One",
+    "😀": "Emoji: Grinning Face",
+    "\u0080": "Control",
+    ö: "Latin Small Letter O With Diaeresis"
+  };
+
+  const keys = new Array<string>();
+  const text = canonicalText(jsonable);
+  const keyRe = /"([^"]*)":/g;
+  for (let match = keyRe.exec(text); match !== null; match = keyRe.exec(text)) {
+    keys.push(match[1]);
+  }
+
+  expect(keys).toEqual(["\\r", "1", "\u0080", "ö", "€", "😀", "\ufb33"]);
+});
+
+test("the numbers are written as in ECMAScript", () => {
+  expect(canonicalText([0, -0, 1e21, 1e-7, 5e-324, -1.5, 100])).toEqual(
+    "[0,0,1e+21,1e-7,5e-324,-1.5,100]"
+  );
+});
+
+test("the non-finite numbers are rejected", () => {
+  expect(() => AasCanonicalization.canonicalize([NaN])).toThrow();
+  expect(() => AasCanonicalization.canonicalize([Infinity])).toThrow();
+});
+
+test("the strings are escaped as by JSON.stringify", () => {
+  let text = "";
+  for (let code = 0; code < 0x100; code++) {
+    text += String.fromCharCode(code);
+  }
+  text += "😀 \ud800 \udc00";
+
+  expect(canonicalText(text)).toEqual(JSON.stringify(text));
+});
+
+test("the order of the properties does not change the canonical JSON", () => {
+  for (const aPath of TestCommon.findFilesBySuffixRecursively(
+    path.join(TestCommon.TEST_DATA_DIR, "Json", "ContainedInEnvironment", "Expected"),
+    ".json"
+  )) {
+    const jsonable = TestCommon.readJsonFromFileSync(aPath);
+
+    const text = canonicalText(jsonable);
+    expect(canonicalText(reversed(jsonable))).toEqual(text);
+    expect(JSON.parse(text)).toEqual(jsonable);
+  }
+});
+
+test("the digest is the one of the canonical JSON", () => {
+  const submodel = new AasTypes.Submodel("urn:something:submodel");
+  submodel.idShort = "something";
+
+  const digest = AasCanonicalization.digest(submodel);
+  expect(digest).toEqual(
+    AasCommon.hexEncode(
+      AasCommon.sha256(AasCanonicalization.toCanonicalJson(submodel))
+    )
+  );
+
+  submodel.idShort = "somethingElse";
+  expect(AasCanonicalization.digest(submodel)).not.toEqual(digest);
+});
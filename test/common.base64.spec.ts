@@ -210,3 +210,171 @@ test("table from rickkas7/Base64RK", () => {
     expect(decodedOrError.mustValue()).toEqual(bytes);
   }
 });
+
+test("validation agrees with decoding", () => {
+  const texts = ["", "Zg==", "Zm8=", "Zm9vYmFy", "SGVsbG9=", "Zm9v!mFy", "Zm9vYmFÿ"];
+
+  const encoded = "Zm9vYmFy";
+  for (let i = 0; i < encoded.length; i++) {
+    texts.push(encoded.substring(0, i) + "=" + encoded.substring(i + 1));
+  }
+
+  for (const text of texts) {
+    expect(AasCommon.base64Validate(text)).toEqual(AasCommon.base64Decode(text).error);
+  }
+});
+
+/**
+ * Generate deterministic pseudo-random bytes so that the tests are reproducible.
+ */
+function pseudoRandomBytes(length: number): Uint8Array {
+  const bytes = new Uint8Array(length);
+  let state = 1984;
+  for (let i = 0; i < length; i++) {
+    // Linear congruential generator from Numerical Recipes
+    state = (Math.imul(state, 1664525) + 1013904223) >>> 0;
+    bytes[i] = state >>> 24;
+  }
+  return bytes;
+}
+
+test("streaming encoder gives the same text as the encoder", () => {
+  for (const length of [0, 1, 2, 3, 4, 5, 17, 1024, 4099]) {
+    const bytes = pseudoRandomBytes(length);
+    const expected = AasCommon.base64Encode(bytes);
+
+    for (const chunkSize of [1, 2, 3, 4, 7, 1000]) {
+      const encoder = new AasCommon.Base64Encoder();
+
+      let encoded = "";
+      for (let i = 0; i < bytes.length; i += chunkSize) {
+        encoded += encoder.update(bytes.subarray(i, i + chunkSize));
+      }
+      encoded += encoder.finish();
+
+      expect(encoded).toEqual(expected);
+    }
+  }
+});
+
+test("streaming decoder gives the same bytes as the decoder", () => {
+  for (const length of [0, 1, 2, 3, 4, 5, 17, 1024, 4099]) {
+    const bytes = pseudoRandomBytes(length);
+    const text = AasCommon.base64Encode(bytes);
+
+    for (const chunkSize of [1, 2, 3, 4, 7, 1000]) {
+      const decoder = new AasCommon.Base64Decoder();
+
+      const decoded = new Array<number>();
+      for (let i = 0; i < text.length; i += chunkSize) {
+        const chunkOrError = decoder.update(text.substring(i, i + chunkSize));
+        expect(chunkOrError.error).toBeNull();
+        decoded.push(...chunkOrError.mustValue());
+      }
+
+      const lastOrError = decoder.finish();
+      expect(lastOrError.error).toBeNull();
+      decoded.push(...lastOrError.mustValue());
+
+      expect(new Uint8Array(decoded)).toEqual(bytes);
+    }
+  }
+});
+
+test("streaming decoder reports the index in the whole text", () => {
+  const encoded = "Zm9vYmFy";
+
+  for (let i = 0; i < encoded.length - 1; i++) {
+    const badEncoded =
+      encoded.substring(0, i) + "=" + encoded.substring(i + 1, encoded.length);
+
+    const decoder = new AasCommon.Base64Decoder();
+
+    let error: string | null = null;
+    for (let j = 0; j < badEncoded.length && error === null; j += 3) {
+      error = decoder.update(badEncoded.substring(j, j + 3)).error;
+    }
+    if (error === null) {
+      error = decoder.finish().error;
+    }
+
+    expect(error).toEqual(AasCommon.base64Decode(badEncoded).error);
+  }
+});
+
+test("streaming decoder expects the padding", () => {
+  const decoder = new AasCommon.Base64Decoder();
+  expect(decoder.update("Zm9vYg").error).toBeNull();
+  expect(decoder.finish().error).toEqual(
+    "Expected the length of a base64-encoded string to be divisible by 4, but got: 6"
+  );
+});
+
+/**
+ * Load the module `common` anew so that it picks its decoder from `globals`.
+ *
+ * @remarks
+ * The module checks for `Buffer`, `atob` and `btoa` only once on import, so we
+ * have to import it in an isolated registry to exercise the other decoders.
+ */
+function loadCommonWith(globals: Record<string, unknown>): typeof AasCommon {
+  // eslint-disable-next-line @typescript-eslint/no-explicit-any
+  const globalScope = <Record<string, any>>globalThis;
+
+  const saved = new Map<string, unknown>();
+  for (const [name, value] of Object.entries(globals)) {
+    saved.set(name, globalScope[name]);
+    globalScope[name] = value;
+  }
+
+  let result: typeof AasCommon | null = null;
+  try {
+    jest.isolateModules(() => {
+      // eslint-disable-next-line @typescript-eslint/no-var-requires
+      result = require("../src/common");
+    });
+  } finally {
+    for (const [name, value] of saved) {
+      globalScope[name] = value;
+    }
+  }
+
+  if (result === null) {
+    throw new Error("Expected the module common to be loaded");
+  }
+  return result;
+}
+
+test("malformed padding is rejected by all the decoders", () => {
+  const nodeAtob = (text: string) => Buffer.from(text, "base64").toString("latin1");
+  const nodeBtoa = (text: string) => Buffer.from(text, "latin1").toString("base64");
+
+  const decoders = [
+    AasCommon,
+    loadCommonWith({ Buffer: undefined, atob: nodeAtob, btoa: nodeBtoa }),
+    loadCommonWith({ Buffer: undefined, atob: undefined, btoa: undefined })
+  ];
+
+  const texts = ["B===", "A===", "Zg===", "Zm9vB===", "A", "Zm9vY", "Zm9vY=", "Zg="];
+
+  for (const Common of decoders) {
+    for (const text of texts) {
+      const error = Common.base64Decode(text).error;
+      expect(error).not.toBeNull();
+      expect(error).toEqual(Common.base64Validate(text));
+
+      const decoder = new Common.Base64Decoder();
+      const updateError = decoder.update(text).error;
+      expect(
+        updateError === null ? decoder.finish().error : updateError
+      ).not.toBeNull();
+    }
+
+    expect(Common.base64Decode("Zm9vYg==").mustValue()).toEqual(
+      new Uint8Array([102, 111, 111, 98])
+    );
+    expect(Common.base64Decode("Zm9vYg").mustValue()).toEqual(
+      new Uint8Array([102, 111, 111, 98])
+    );
+  }
+});
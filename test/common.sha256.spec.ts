@@ -0,0 +1,43 @@
+/**
+ * Test the UTF-8 encoding and the SHA-256 digest.
+ */
+
+import * as AasCommon from "../src/common";
+
+function sha256Hex(text: string): string {
+  return AasCommon.hexEncode(AasCommon.sha256(AasCommon.utf8Encode(text)));
+}
+
+test("the UTF-8 encoding covers all the code point lengths", () => {
+  expect(AasCommon.hexEncode(AasCommon.utf8Encode("äöü€𝄞"))).toEqual(
+    "c3a4c3b6c3bce282acf09d849e"
+  );
+  expect(AasCommon.utf8Encode("")).toEqual(new Uint8Array(0));
+});
+
+// The following vectors come from:
+// https://csrc.nist.gov/projects/cryptographic-standards-and-guidelines/example-values
+
+test("the digest of the empty input", () => {
+  expect(sha256Hex("")).toEqual(
+    "e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b855"
+  );
+});
+
+test("the digest of a single block", () => {
+  expect(sha256Hex("abc")).toEqual(
+    "ba7816bf8f01cfea414140de5dae2223b00361a396177a9cb410ff61f20015ad"
+  );
+});
+
+test("the digest of two blocks", () => {
+  expect(sha256Hex("abcdbcdecdefdefgefghfghighijhijkijkljklmklmnlmnomnopnopq")).toEqual(
+    "248d6a61d20638b8e5c026930c3e6039a33ce45964ff2167f6ecedd419db06c1"
+  );
+});
+
+test("the digest of a million characters", () => {
+  expect(sha256Hex("a".repeat(1000000))).toEqual(
+    "cdc76e5c9914fb9281a1c7e284d73e67f1809a48a497200e046d39ccc7112cd0"
+  );
+});
@@ -117,6 +117,22 @@ export function assertNoVerificationErrors(
   }
 }
 
+/**
+ * Represent the verification `errors` as strings so that they can be compared.
+ *
+ * @param errors - iterable of verification errors
+ * @returns the path and the message of each error
+ */
+export function errorsAsStrings(
+  errors: Iterable<AasVerification.VerificationError>
+): Array<string> {
+  const result = new Array<string>();
+  for (const error of errors) {
+    result.push(`${error.path}: ${error.message}`);
+  }
+  return result;
+}
+
 export const CAUSES_FOR_VERIFICATION_FAILURE = [
   "DateTimeStampUtcViolationOnFebruary29th",
   "MaxLengthViolation",
@@ -214,6 +230,70 @@ export function* findFilesBySuffixRecursively(
   }
 }
 
+/**
+ * Create a string property for the tests which build their models by hand.
+ *
+ * @param idShort - of the property
+ * @param value - of the property
+ * @returns the new property
+ */
+export function newProperty(idShort: string, value: string): AasTypes.Property {
+  const property = new AasTypes.Property(AasTypes.DataTypeDefXsd.String);
+  property.idShort = idShort;
+  property.value = value;
+  return property;
+}
+
+/**
+ * Iterate over the JSON files of the expected environments in the test data.
+ */
+export function* overExpectedJsonPaths(): IterableIterator<string> {
+  yield* findFilesBySuffixRecursively(
+    path.join(TEST_DATA_DIR, "Json", "ContainedInEnvironment", "Expected"),
+    ".json"
+  );
+}
+
+/**
+ * De-serialize an environment from `jsonable` which is expected to be valid.
+ *
+ * @param jsonable - to be de-serialized
+ * @param aPath - to the file `jsonable` has been read from
+ * @returns the de-serialized environment
+ * @throws an {@link Error} if the de-serialization failed
+ */
+export function mustEnvironmentFromJsonable(
+  jsonable: AasJsonization.JsonValue,
+  aPath: string
+): AasTypes.Environment {
+  const environmentOrError = AasJsonization.environmentFromJsonable(jsonable);
+  if (environmentOrError.error !== null) {
+    throw new Error(
+      `Failed to de-serialize ${aPath}: ` +
+        `${environmentOrError.error.path}: ${environmentOrError.error.message}`
+    );
+  }
+  return environmentOrError.mustValue();
+}
+
+/**
+ * Load all the environments which can be de-serialized from `directory`.
+ *
+ * @param directory - to iterate through recursively
+ */
+export function* loadEnvironments(
+  directory: string
+): IterableIterator<AasTypes.Environment> {
+  for (const aPath of findFilesBySuffixRecursively(directory, ".json")) {
+    const environmentOrError = AasJsonization.environmentFromJsonable(
+      readJsonFromFileSync(aPath)
+    );
+    if (environmentOrError.error === null) {
+      yield environmentOrError.mustValue();
+    }
+  }
+}
+
 /**
  * Signal that two JSON-able structures are unequal.
  */
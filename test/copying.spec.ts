@@ -0,0 +1,110 @@
+/**
+ * Test the deep copy.
+ */
+
+import * as AasCopying from "../src/copying";
+import * as AasEquality from "../src/equality";
+import * as AasTypes from "../src/types";
+
+import * as TestCommon from "./common";
+
+function isLeaf(that: AasTypes.Class): boolean {
+  return (
+    AasTypes.isKey(that) || AasTypes.isLangString(that) || AasTypes.isResource(that)
+  );
+}
+
+test("the copy is deeply equal and shares no instance", () => {
+  for (const aPath of TestCommon.overExpectedJsonPaths()) {
+    const environment = TestCommon.mustEnvironmentFromJsonable(
+      TestCommon.readJsonFromFileSync(aPath),
+      aPath
+    );
+
+    const copy = AasCopying.deepCopy(environment);
+    expect(AasEquality.deepEquals(environment, copy)).toBe(true);
+
+    const originals = new Set<AasTypes.Class>(environment.descend());
+    originals.add(environment);
+    for (const instance of copy.descend()) {
+      expect(originals.has(instance)).toBe(false);
+    }
+  }
+});
+
+test("the leaves are shared on request", () => {
+  for (const aPath of TestCommon.overExpectedJsonPaths()) {
+    const environment = TestCommon.mustEnvironmentFromJsonable(
+      TestCommon.readJsonFromFileSync(aPath),
+      aPath
+    );
+
+    const copy = AasCopying.deepCopy(environment, { shareLeaves: true });
+    expect(AasEquality.deepEquals(environment, copy)).toBe(true);
+
+    const originals = new Set<AasTypes.Class>(environment.descend());
+    for (const instance of copy.descend()) {
+      expect(originals.has(instance)).toBe(isLeaf(instance));
+    }
+  }
+});
+
+test("the blob values are copied on request", () => {
+  const blob = new AasTypes.Blob("application/octet-stream");
+  blob.value = new Uint8Array([1, 2, 3]);
+
+  const shared = AasCopying.deepCopy(blob);
+  expect(shared).not.toBe(blob);
+  expect(shared.value).toBe(blob.value);
+
+  const copied = AasCopying.deepCopy(blob, { copyBlobValues: true });
+  expect(copied.value).not.toBe(blob.value);
+  expect(copied.value).toEqual(blob.value);
+});
+
+test("modifying the copy leaves the original as it is", () => {
+  const property = new AasTypes.Property(AasTypes.DataTypeDefXsd.Int);
+  property.idShort = "someProperty";
+  property.value = "1";
+
+  const submodel = new AasTypes.Submodel("urn:something:submodel");
+  submodel.submodelElements = [property];
+
+  const copy = AasCopying.deepCopy(submodel);
+  (<AasTypes.Property>(copy.submodelElements ?? [])[0]).value = "2";
+  copy.submodelElements?.push(new AasTypes.Capability());
+
+  expect(property.value).toEqual("1");
+  expect(submodel.submodelElements).toHaveLength(1);
+});
+
+test("the shallow copy shares the properties, but not the lists", () => {
+  for (const aPath of TestCommon.overExpectedJsonPaths()) {
+    const environment = TestCommon.mustEnvironmentFromJsonable(
+      TestCommon.readJsonFromFileSync(aPath),
+      aPath
+    );
+
+    for (const instance of environment.descend()) {
+      const copy = AasCopying.shallowCopy(instance);
+      expect(copy).not.toBe(instance);
+      expect(AasEquality.deepEquals(instance, copy)).toBe(true);
+
+      const originals = new Set<AasTypes.Class>(instance.descendOnce());
+      for (const child of copy.descendOnce()) {
+        expect(originals.has(child)).toBe(true);
+      }
+    }
+  }
+});
+
+test("modifying the list of the shallow copy leaves the original as it is", () => {
+  const submodel = new AasTypes.Submodel("urn:something:submodel");
+  submodel.submodelElements = [new AasTypes.Capability()];
+
+  const copy = AasCopying.shallowCopy(submodel);
+  expect(copy.submodelElements).not.toBe(submodel.submodelElements);
+
+  copy.submodelElements?.push(new AasTypes.Capability());
+  expect(submodel.submodelElements).toHaveLength(1);
+});
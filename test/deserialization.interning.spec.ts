@@ -0,0 +1,115 @@
+/**
+ * Test the interning of references, keys and language strings during
+ * the de-serialization.
+ */
+
+import * as AasDeserialization from "../src/deserialization";
+import * as AasJsonization from "../src/jsonization";
+import * as AasTypes from "../src/types";
+
+import * as TestCommon from "./common";
+
+/**
+ * Create a property whose semantic ID and description repeat across the model.
+ */
+function newPropertyWithRepeatedParts(idShort: string): AasTypes.Property {
+  const property = TestCommon.newProperty(idShort, "1");
+  property.semanticId = new AasTypes.Reference(
+    AasTypes.ReferenceTypes.GlobalReference,
+    [new AasTypes.Key(AasTypes.KeyTypes.GlobalReference, "urn:something:semantics")]
+  );
+  property.description = [new AasTypes.LangString("en", "Some description")];
+  return property;
+}
+
+function newSubmodelJsonable(id: string): AasJsonization.JsonValue {
+  const submodel = new AasTypes.Submodel(id);
+  submodel.submodelElements = [
+    newPropertyWithRepeatedParts("first"),
+    newPropertyWithRepeatedParts("second")
+  ];
+  return AasJsonization.toJsonable(submodel);
+}
+
+test("the interning does not change the result", () => {
+  for (const aPath of TestCommon.overExpectedJsonPaths()) {
+    const jsonable = TestCommon.readJsonFromFileSync(aPath);
+
+    const environmentOrError = AasDeserialization.environmentFromJsonable(jsonable, {
+      interning: new AasDeserialization.InterningPool()
+    });
+    if (environmentOrError.error !== null) {
+      throw new Error(
+        `Failed to de-serialize ${aPath}: ` +
+          `${environmentOrError.error.path}: ${environmentOrError.error.message}`
+      );
+    }
+
+    const inequalityError = TestCommon.checkJsonablesEqual(
+      jsonable,
+      AasJsonization.toJsonable(environmentOrError.mustValue())
+    );
+    if (inequalityError !== null) {
+      throw new Error(
+        `The original JSON from ${aPath} is unequal the serialized JSON: ` +
+          `${inequalityError.path}: ${inequalityError.message}`
+      );
+    }
+  }
+});
+
+test("the repetitions are de-serialized as one instance", () => {
+  const pool = new AasDeserialization.InterningPool();
+
+  const submodel = AasDeserialization.submodelFromJsonable(
+    newSubmodelJsonable("urn:something:submodel"),
+    { interning: pool }
+  ).mustValue();
+
+  const [first, second] = submodel.submodelElements ?? [];
+  expect(first.semanticId).toBe(second.semanticId);
+  expect((first.description ?? [])[0]).toBe((second.description ?? [])[0]);
+
+  // One reference with one key and one language string, and their repetitions
+  expect(pool.size).toEqual(3);
+  expect(pool.hits).toEqual(3);
+});
+
+test("the instances are shared across the calls with the same pool only", () => {
+  const pool = new AasDeserialization.InterningPool();
+
+  const some = AasDeserialization.submodelFromJsonable(
+    newSubmodelJsonable("urn:something:some"),
+    { interning: pool }
+  ).mustValue();
+  const same = AasDeserialization.submodelFromJsonable(
+    newSubmodelJsonable("urn:something:same"),
+    { interning: pool }
+  ).mustValue();
+  const other = AasDeserialization.submodelFromJsonable(
+    newSubmodelJsonable("urn:something:other"),
+    { interning: new AasDeserialization.InterningPool() }
+  ).mustValue();
+
+  const semanticIdOf = (that: AasTypes.Submodel) =>
+    (that.submodelElements ?? [])[0].semanticId;
+
+  expect(semanticIdOf(some)).toBe(semanticIdOf(same));
+  expect(semanticIdOf(some)).not.toBe(semanticIdOf(other));
+});
+
+test("the references are told apart by their keys", () => {
+  const pool = new AasDeserialization.InterningPool();
+
+  const reference = (value: string) =>
+    AasDeserialization.referenceFromJsonable(
+      {
+        type: "GlobalReference",
+        keys: [{ type: "GlobalReference", value: value }]
+      },
+      { interning: pool }
+    ).mustValue();
+
+  expect(reference("urn:a")).toBe(reference("urn:a"));
+  expect(reference("urn:a")).not.toBe(reference("urn:b"));
+});
@@ -0,0 +1,119 @@
+/**
+ * Test the lazy de-serialization of {@link types.Blob.value}.
+ */
+
+import * as path from "path";
+
+import * as AasDeserialization from "../src/deserialization";
+import * as AasJsonization from "../src/jsonization";
+import * as AasSerialization from "../src/serialization";
+import * as AasTypes from "../src/types";
+
+import * as TestCommon from "./common";
+
+const LAZY: AasDeserialization.DeserializationOptions = { lazyBlobValues: true };
+
+function loadCompleteEnvironmentJsonable(): AasJsonization.JsonValue {
+  return TestCommon.readJsonFromFileSync(
+    path.join(
+      TestCommon.TEST_DATA_DIR,
+      "Json",
+      "ContainedInEnvironment",
+      "Expected",
+      "Blob",
+      "complete.json"
+    )
+  );
+}
+
+function mustDeserializeBlob(
+  jsonable: AasJsonization.JsonValue,
+  options: AasDeserialization.DeserializationOptions | null
+): AasTypes.Blob {
+  const environmentOrError = AasDeserialization.environmentFromJsonable(
+    jsonable,
+    options
+  );
+  expect(environmentOrError.error).toBeNull();
+
+  const blob = AasTypes.asBlob(
+    TestCommon.mustFind(environmentOrError.mustValue(), AasTypes.isBlob)
+  );
+  if (blob === null) {
+    throw new Error("Expected a blob in the environment");
+  }
+  return blob;
+}
+
+function blobJsonable(value: AasJsonization.JsonValue): AasJsonization.JsonValue {
+  return {
+    contentType: "application/octet-stream",
+    value: value,
+    modelType: "Blob"
+  };
+}
+
+test("lazily decoded value equals the eagerly decoded one", () => {
+  const jsonable = loadCompleteEnvironmentJsonable();
+
+  const eager = mustDeserializeBlob(jsonable, null);
+  const lazy = mustDeserializeBlob(jsonable, LAZY);
+
+  expect(lazy.value).toEqual(eager.value);
+  expect(lazy).toEqual(eager);
+});
+
+test("round-trip of the lazy blob gives the original JSON", () => {
+  const jsonable = loadCompleteEnvironmentJsonable();
+
+  const environmentOrError = AasDeserialization.environmentFromJsonable(jsonable, LAZY);
+  expect(environmentOrError.error).toBeNull();
+
+  const inequalityError = TestCommon.checkJsonablesEqual(
+    jsonable,
+    AasSerialization.toJsonable(environmentOrError.mustValue())
+  );
+  expect(inequalityError).toBeNull();
+});
+
+test("serialization reuses the original text if the value was not accessed", () => {
+  // The text has an inconsistent padding and decodes to "Hello". Re-encoding
+  // would give "SGVsbG8=", so we can see whether the original text is reused.
+  const blobOrError = AasDeserialization.blobFromJsonable(
+    blobJsonable("SGVsbG9="),
+    LAZY
+  );
+  const blob = blobOrError.mustValue();
+
+  expect(AasSerialization.toJsonable(blob)["value"]).toEqual("SGVsbG9=");
+
+  expect(blob.value).toEqual(new Uint8Array([72, 101, 108, 108, 111]));
+  expect(AasSerialization.toJsonable(blob)["value"]).toEqual("SGVsbG8=");
+});
+
+test("assigning the value discards the original text", () => {
+  const blob = AasDeserialization.blobFromJsonable(
+    blobJsonable("SGVsbG8="),
+    LAZY
+  ).mustValue();
+
+  blob.value = new Uint8Array([1, 2, 3]);
+
+  expect(blob.value).toEqual(new Uint8Array([1, 2, 3]));
+  expect(AasSerialization.toJsonable(blob)["value"]).toEqual("AQID");
+});
+
+test("invalid base64 is reported during the lazy de-serialization", () => {
+  for (const value of ["Zm9v=mFy", 1984]) {
+    const eagerOrError = AasDeserialization.blobFromJsonable(blobJsonable(value));
+    const lazyOrError = AasDeserialization.blobFromJsonable(blobJsonable(value), LAZY);
+
+    expect(eagerOrError.error).not.toBeNull();
+    expect(lazyOrError.error).not.toBeNull();
+
+    expect(lazyOrError.error?.message).toEqual(eagerOrError.error?.message);
+    expect(lazyOrError.error?.path.toString()).toEqual(
+      eagerOrError.error?.path.toString()
+    );
+  }
+});
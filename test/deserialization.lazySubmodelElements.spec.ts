@@ -0,0 +1,152 @@
+/**
+ * Test the lazy de-serialization of {@link types.Submodel.submodelElements}.
+ */
+
+import * as path from "path";
+
+import * as AasDeserialization from "../src/deserialization";
+import * as AasJsonization from "../src/jsonization";
+import * as AasTypes from "../src/types";
+
+import * as TestCommon from "./common";
+
+const LAZY: AasDeserialization.DeserializationOptions = { lazySubmodelElements: true };
+
+function environmentJsonable(
+  submodelElements: AasJsonization.JsonValue
+): AasJsonization.JsonValue {
+  return {
+    submodels: [
+      {
+        id: "urn:something:submodel0",
+        modelType: "Submodel"
+      },
+      {
+        id: "urn:something:submodel1",
+        submodelElements: submodelElements,
+        modelType: "Submodel"
+      }
+    ]
+  };
+}
+
+test("lazily de-serialized environments equal the eager ones", () => {
+  const jsonDir = path.join(
+    TestCommon.TEST_DATA_DIR,
+    "Json",
+    "ContainedInEnvironment",
+    "Expected"
+  );
+
+  for (const aPath of TestCommon.findFilesBySuffixRecursively(jsonDir, ".json")) {
+    const jsonable = TestCommon.readJsonFromFileSync(aPath);
+
+    const eager = AasDeserialization.environmentFromJsonable(jsonable).mustValue();
+    const lazy = AasDeserialization.environmentFromJsonable(jsonable, LAZY).mustValue();
+
+    expect(AasJsonization.toJsonable(lazy)).toEqual(AasJsonization.toJsonable(eager));
+  }
+});
+
+test("invalid elements are reported on the first access", () => {
+  const jsonable = environmentJsonable([
+    {
+      idShort: "something",
+      valueType: "xs:string",
+      modelType: "Property"
+    },
+    {
+      idShort: "somethingElse",
+      valueType: "xs:unexpected",
+      modelType: "Property"
+    }
+  ]);
+
+  expect(AasDeserialization.environmentFromJsonable(jsonable).error).not.toBeNull();
+
+  const environment = AasDeserialization.environmentFromJsonable(
+    jsonable,
+    LAZY
+  ).mustValue();
+
+  const submodels = environment.submodels;
+  if (submodels === null) {
+    throw new Error("Expected submodels");
+  }
+  expect(submodels[0].submodelElements).toBeNull();
+
+  let error: unknown = null;
+  try {
+    submodels[1].submodelElements?.length;
+  } catch (thrown) {
+    error = thrown;
+  }
+
+  expect(error).toBeInstanceOf(AasDeserialization.MaterializationError);
+  const materializationError = <AasDeserialization.MaterializationError>error;
+  expect(materializationError.error.path.toString()).toEqual(
+    "submodels[1].submodelElements[1].valueType"
+  );
+
+  const eagerError = AasDeserialization.environmentFromJsonable(jsonable).error;
+  expect(materializationError.error.path.toString()).toEqual(`${eagerError?.path}`);
+  expect(materializationError.error.message).toEqual(eagerError?.message);
+});
+
+test("the path is relative to the submodel if de-serialized on its own", () => {
+  const submodelJsonable = {
+    id: "urn:something:submodel",
+    submodelElements: "unexpected",
+    modelType: "Submodel"
+  };
+
+  const submodel = AasDeserialization.submodelFromJsonable(
+    submodelJsonable,
+    LAZY
+  ).mustValue();
+
+  expect(() => submodel.submodelElements).toThrow(
+    "submodelElements: Expected an iterable, but got: string"
+  );
+});
+
+test("the elements are de-serialized only once, on descend as well", () => {
+  const jsonable = environmentJsonable([
+    {
+      idShort: "something",
+      valueType: "xs:string",
+      modelType: "Property"
+    }
+  ]);
+
+  const environment = AasDeserialization.environmentFromJsonable(
+    jsonable,
+    LAZY
+  ).mustValue();
+
+  const properties = Array.from(environment.descend()).filter(AasTypes.isProperty);
+  expect(properties.length).toEqual(1);
+
+  const submodels = environment.submodels;
+  if (submodels === null) {
+    throw new Error("Expected submodels");
+  }
+  expect(submodels[1].submodelElements?.[0]).toBe(properties[0]);
+});
+
+test("setting the elements discards the JSON", () => {
+  const jsonable = environmentJsonable("unexpected");
+
+  const environment = AasDeserialization.environmentFromJsonable(
+    jsonable,
+    LAZY
+  ).mustValue();
+
+  const submodels = environment.submodels;
+  if (submodels === null) {
+    throw new Error("Expected submodels");
+  }
+
+  submodels[1].submodelElements = [];
+  expect(submodels[1].submodelElements).toEqual([]);
+});
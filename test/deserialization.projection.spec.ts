@@ -0,0 +1,66 @@
+/**
+ * Test the de-serialization of only the selected properties.
+ */
+
+import * as AasDeserialization from "../src/deserialization";
+import * as AasJsonization from "../src/jsonization";
+import * as AasTypes from "../src/types";
+
+import * as TestCommonJsonization from "./commonJsonization";
+
+test("only the selected properties are de-serialized", () => {
+  const jsonable = AasJsonization.toJsonable(
+    TestCommonJsonization.loadCompleteSubmodel()
+  );
+
+  const submodel = AasDeserialization.submodelFromJsonable(jsonable, {
+    projection: { Submodel: ["idShort", "semanticId"] }
+  }).mustValue();
+
+  const complete = AasDeserialization.submodelFromJsonable(jsonable).mustValue();
+
+  // The required properties are always de-serialized.
+  expect(submodel.id).toEqual(complete.id);
+
+  expect(submodel.idShort).toEqual(complete.idShort);
+  expect(submodel.semanticId).toEqual(complete.semanticId);
+
+  expect(submodel.submodelElements).toBeNull();
+  expect(submodel.description).toBeNull();
+  expect(submodel.extensions).toBeNull();
+});
+
+test("the skipped properties are not decoded", () => {
+  const jsonable = {
+    id: "urn:something:submodel",
+    idShort: "something",
+    submodelElements: "invalid, but never looked at",
+    modelType: "Submodel"
+  };
+
+  const submodelOrError = AasDeserialization.submodelFromJsonable(jsonable, {
+    projection: { Submodel: ["idShort"] }
+  });
+  expect(submodelOrError.error).toBeNull();
+  expect(submodelOrError.mustValue().idShort).toEqual("something");
+});
+
+test("the classes which are not projected are de-serialized in full", () => {
+  const jsonable = AasJsonization.toJsonable(
+    TestCommonJsonization.loadCompleteEnvironment()
+  );
+
+  const environment = AasDeserialization.environmentFromJsonable(jsonable, {
+    projection: { Submodel: ["semanticId"] }
+  }).mustValue();
+
+  for (const instance of environment.descend()) {
+    if (AasTypes.isSubmodel(instance)) {
+      expect(instance.submodelElements).toBeNull();
+    }
+  }
+
+  expect(AasJsonization.toJsonable(environment)["conceptDescriptions"]).toEqual(
+    jsonable["conceptDescriptions"]
+  );
+});
@@ -0,0 +1,72 @@
+/**
+ * Test that {@link deserialization} agrees with {@link jsonization} on the test data.
+ */
+
+import * as path from "path";
+
+import * as AasCommon from "../src/common";
+import * as AasDeserialization from "../src/deserialization";
+import * as AasJsonization from "../src/jsonization";
+import * as AasTypes from "../src/types";
+
+import * as TestCommon from "./common";
+
+/**
+ * Represent the result of a de-serialization so that it can be compared.
+ */
+function describeResult(
+  instanceOrError: AasCommon.Either<AasTypes.Class, AasJsonization.DeserializationError>
+): AasJsonization.JsonValue {
+  if (instanceOrError.error !== null) {
+    return `${instanceOrError.error.path}: ${instanceOrError.error.message}`;
+  }
+  return AasJsonization.toJsonable(instanceOrError.mustValue());
+}
+
+test("the de-serialization of the environments is the same", () => {
+  const jsonDir = path.join(TestCommon.TEST_DATA_DIR, "Json", "ContainedInEnvironment");
+
+  let count = 0;
+  for (const aPath of TestCommon.findFilesBySuffixRecursively(jsonDir, ".json")) {
+    const jsonable = TestCommon.readJsonFromFileSync(aPath);
+
+    expect(
+      describeResult(AasDeserialization.environmentFromJsonable(jsonable))
+    ).toEqual(describeResult(AasJsonization.environmentFromJsonable(jsonable)));
+
+    count++;
+  }
+
+  expect(count).toBeGreaterThan(0);
+});
+
+test("the de-serialization of the self-contained instances is the same", () => {
+  const jsonDir = path.join(TestCommon.TEST_DATA_DIR, "Json", "SelfContained");
+
+  let count = 0;
+  for (const aPath of TestCommon.findFilesBySuffixRecursively(jsonDir, ".json")) {
+    const jsonable = TestCommon.readJsonFromFileSync(aPath);
+
+    // The paths are either Expected/{class}/... or Unexpected/{cause}/{class}/...
+    const parts = path.relative(jsonDir, aPath).split(path.sep);
+    const className = parts[0] === "Expected" ? parts[1] : parts[2];
+    switch (className) {
+      case "Environment":
+        expect(
+          describeResult(AasDeserialization.environmentFromJsonable(jsonable))
+        ).toEqual(describeResult(AasJsonization.environmentFromJsonable(jsonable)));
+        break;
+      case "EventPayload":
+        expect(
+          describeResult(AasDeserialization.eventPayloadFromJsonable(jsonable))
+        ).toEqual(describeResult(AasJsonization.eventPayloadFromJsonable(jsonable)));
+        break;
+      default:
+        throw new Error(`Unexpected self-contained class: ${className}`);
+    }
+
+    count++;
+  }
+
+  expect(count).toBeGreaterThan(0);
+});
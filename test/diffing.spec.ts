@@ -0,0 +1,170 @@
+/**
+ * Test the structural diff and patch between environments.
+ */
+
+import * as AasDiffing from "../src/diffing";
+import * as AasEquality from "../src/equality";
+import * as AasTypes from "../src/types";
+
+import * as TestCommon from "./common";
+import * as TestCommonJsonization from "./commonJsonization";
+
+/**
+ * Patch `that` with the changes to `other` sent over JSON, and check that
+ * the result equals `other`.
+ */
+function assertPatchedEqualsOther(
+  that: AasTypes.Environment,
+  other: AasTypes.Environment
+): void {
+  const changes = AasDiffing.diff(that, other);
+
+  const jsonable = JSON.parse(JSON.stringify(AasDiffing.changesToJsonable(changes)));
+  const sentOrError = AasDiffing.changesFromJsonable(jsonable);
+  if (sentOrError.error !== null) {
+    throw new Error(`${sentOrError.error.path}: ${sentOrError.error.message}`);
+  }
+
+  const error = AasDiffing.applyPatch(that, sentOrError.mustValue());
+  if (error !== null) {
+    throw new Error(`Change ${error.index}: ${error.message}`);
+  }
+
+  expect(AasEquality.deepEquals(that, other)).toBe(true);
+  expect(AasDiffing.diff(that, other)).toEqual([]);
+}
+
+function newEnvironment(values: Array<string>): AasTypes.Environment {
+  const collection = new AasTypes.SubmodelElementCollection();
+  collection.idShort = "collection";
+  collection.value = values.map((value) => TestCommon.newProperty(value, value));
+
+  const list = new AasTypes.SubmodelElementList(
+    AasTypes.AasSubmodelElements.Property
+  );
+  list.idShort = "list";
+  list.value = values.map((value) => TestCommon.newProperty(value, value));
+
+  const submodel = new AasTypes.Submodel("urn:something:submodel");
+  submodel.submodelElements = [collection, list];
+
+  const other = new AasTypes.Submodel("urn:something:other");
+
+  return new AasTypes.Environment(null, [submodel, other]);
+}
+
+test("equal environments have no changes", () => {
+  for (const aPath of TestCommon.overExpectedJsonPaths()) {
+    const jsonable = TestCommon.readJsonFromFileSync(aPath);
+    expect(
+      AasDiffing.diff(
+        TestCommon.mustEnvironmentFromJsonable(jsonable, aPath),
+        TestCommon.mustEnvironmentFromJsonable(jsonable, aPath)
+      )
+    ).toEqual([]);
+  }
+});
+
+test("the minimal environment is patched into the complete one", () => {
+  assertPatchedEqualsOther(
+    TestCommonJsonization.loadMinimalEnvironment(),
+    TestCommonJsonization.loadCompleteEnvironment()
+  );
+  assertPatchedEqualsOther(
+    TestCommonJsonization.loadCompleteEnvironment(),
+    TestCommonJsonization.loadMinimalEnvironment()
+  );
+});
+
+test("a changed element is replaced alone", () => {
+  const that = newEnvironment(["a", "b", "c"]);
+  const other = newEnvironment(["a", "b", "c"]);
+
+  const submodel = (other.submodels ?? [])[0];
+  const collection = <AasTypes.SubmodelElementCollection>(
+    (submodel.submodelElements ?? [])[0]
+  );
+  const changed = TestCommon.newProperty("b", "changed");
+  (collection.value ?? [])[1] = changed;
+
+  const changes = AasDiffing.diff(that, other);
+  expect(changes).toEqual([
+    new AasDiffing.Change(
+      AasDiffing.ChangeKind.Replace,
+      [
+        "submodels",
+        "urn:something:submodel",
+        "submodelElements",
+        "collection",
+        "value",
+        "b"
+      ],
+      changed
+    )
+  ]);
+
+  assertPatchedEqualsOther(that, other);
+});
+
+test("the shared sub-trees are skipped", () => {
+  const that = newEnvironment(["a", "b", "c"]);
+  const other = new AasTypes.Environment(null, [...(that.submodels ?? [])]);
+
+  expect(AasDiffing.diff(that, other)).toEqual([]);
+});
+
+test("the items are added, removed and moved by keys", () => {
+  for (const [before, after] of [
+    [[], ["a"]],
+    [["a"], []],
+    [
+      ["a", "b", "c"],
+      ["c", "a", "b"]
+    ],
+    [
+      ["a", "b", "c", "d"],
+      ["d", "x", "b", "a"]
+    ],
+    [
+      ["a", "b"],
+      ["b", "y", "a", "z"]
+    ]
+  ]) {
+    assertPatchedEqualsOther(newEnvironment(before), newEnvironment(after));
+  }
+});
+
+test("the lists are replaced as a whole only from and to null", () => {
+  const that = newEnvironment(["a"]);
+  const other = newEnvironment(["a"]);
+  other.conceptDescriptions = [new AasTypes.ConceptDescription("urn:something:cd")];
+
+  const changes = AasDiffing.diff(that, other);
+  expect(changes.map((change) => change.path)).toEqual([["conceptDescriptions"]]);
+
+  assertPatchedEqualsOther(that, other);
+});
+
+test("an invalid change is reported", () => {
+  const that = newEnvironment(["a"]);
+
+  const error = AasDiffing.applyPatch(that, [
+    new AasDiffing.Change(AasDiffing.ChangeKind.Remove, [
+      "submodels",
+      "urn:something:submodel",
+      "submodelElements",
+      "collection",
+      "value",
+      "a"
+    ]),
+    new AasDiffing.Change(AasDiffing.ChangeKind.Remove, [
+      "submodels",
+      "urn:something:nonexisting"
+    ])
+  ]);
+
+  if (error === null) {
+    throw new Error("Expected an error, but got none");
+  }
+  expect(error.index).toEqual(1);
+});
@@ -0,0 +1,143 @@
+/**
+ * Test the structural hashing and comparison.
+ */
+
+import * as AasEquality from "../src/equality";
+import * as AasTypes from "../src/types";
+
+import * as TestCommon from "./common";
+import * as TestCommonJsonization from "./commonJsonization";
+
+test("the same JSON gives deeply equal instances with the same hash", () => {
+  for (const aPath of TestCommon.overExpectedJsonPaths()) {
+    const jsonable = TestCommon.readJsonFromFileSync(aPath);
+    const environment = TestCommon.mustEnvironmentFromJsonable(jsonable, aPath);
+    const other = TestCommon.mustEnvironmentFromJsonable(jsonable, aPath);
+
+    expect(AasEquality.deepEquals(environment, other)).toBe(true);
+    expect(AasEquality.hash(environment)).toEqual(AasEquality.hash(other));
+
+    const memo = new WeakMap<AasTypes.Class, number>();
+    expect(AasEquality.deepEquals(environment, other, memo)).toBe(true);
+    expect(AasEquality.hash(environment, memo)).toEqual(AasEquality.hash(other));
+  }
+});
+
+test("the complete and the minimal examples are unequal", () => {
+  const pairs: Array<[AasTypes.Class, AasTypes.Class]> = [
+    [
+      TestCommonJsonization.loadCompleteSubmodel(),
+      TestCommonJsonization.loadMinimalSubmodel()
+    ],
+    [
+      TestCommonJsonization.loadCompleteProperty(),
+      TestCommonJsonization.loadMinimalProperty()
+    ],
+    [
+      TestCommonJsonization.loadCompleteBlob(),
+      TestCommonJsonization.loadMinimalBlob()
+    ],
+    [
+      TestCommonJsonization.loadCompleteEnvironment(),
+      TestCommonJsonization.loadMinimalEnvironment()
+    ]
+  ];
+
+  for (const [complete, minimal] of pairs) {
+    expect(AasEquality.deepEquals(complete, minimal)).toBe(false);
+    expect(AasEquality.deepEquals(minimal, complete)).toBe(false);
+    expect(
+      AasEquality.deepEquals(complete, minimal, new WeakMap<AasTypes.Class, number>())
+    ).toBe(false);
+  }
+});
+
+test("the blob values are compared byte by byte", () => {
+  const blob = new AasTypes.Blob("application/octet-stream");
+  blob.value = new Uint8Array([1, 2, 3]);
+
+  const same = new AasTypes.Blob("application/octet-stream");
+  same.value = new Uint8Array([1, 2, 3]);
+
+  const different = new AasTypes.Blob("application/octet-stream");
+  different.value = new Uint8Array([1, 2, 4]);
+
+  const shorter = new AasTypes.Blob("application/octet-stream");
+  shorter.value = new Uint8Array([1, 2]);
+
+  const without = new AasTypes.Blob("application/octet-stream");
+
+  expect(AasEquality.deepEquals(blob, same)).toBe(true);
+  expect(AasEquality.hash(blob)).toEqual(AasEquality.hash(same));
+
+  expect(AasEquality.deepEquals(blob, different)).toBe(false);
+  expect(AasEquality.hash(blob)).not.toEqual(AasEquality.hash(different));
+
+  expect(AasEquality.deepEquals(blob, shorter)).toBe(false);
+  expect(AasEquality.deepEquals(blob, without)).toBe(false);
+});
+
+test("the literals are compared by their values", () => {
+  const property = new AasTypes.Property(AasTypes.DataTypeDefXsd.Int);
+  property.value = "1";
+
+  const same = new AasTypes.Property(AasTypes.DataTypeDefXsd.Int);
+  same.value = "1";
+
+  const different = new AasTypes.Property(AasTypes.DataTypeDefXsd.Long);
+  different.value = "1";
+
+  expect(AasEquality.deepEquals(property, same)).toBe(true);
+  expect(AasEquality.deepEquals(property, different)).toBe(false);
+  expect(AasEquality.hash(property)).not.toEqual(AasEquality.hash(different));
+});
+
+test("the instances of different classes are unequal", () => {
+  const collection = new AasTypes.SubmodelElementCollection();
+  const capability = new AasTypes.Capability();
+
+  expect(AasEquality.deepEquals(collection, capability)).toBe(false);
+  expect(AasEquality.hash(collection)).not.toEqual(AasEquality.hash(capability));
+});
+
+test("the relationship elements and the annotated ones are unequal", () => {
+  const first = new AasTypes.Reference(AasTypes.ReferenceTypes.ModelReference, [
+    new AasTypes.Key(AasTypes.KeyTypes.Submodel, "urn:something:first")
+  ]);
+  const second = new AasTypes.Reference(AasTypes.ReferenceTypes.ModelReference, [
+    new AasTypes.Key(AasTypes.KeyTypes.Submodel, "urn:something:second")
+  ]);
+
+  const relationship = new AasTypes.RelationshipElement(first, second);
+  const annotated = new AasTypes.AnnotatedRelationshipElement(first, second);
+
+  expect(AasEquality.deepEquals(relationship, annotated)).toBe(false);
+  expect(AasEquality.deepEquals(annotated, relationship)).toBe(false);
+  expect(
+    AasEquality.deepEquals(
+      relationship,
+      annotated,
+      new WeakMap<AasTypes.Class, number>()
+    )
+  ).toBe(false);
+  expect(AasEquality.hash(relationship)).not.toEqual(AasEquality.hash(annotated));
+});
+
+test("the memo keeps the hashes of the instances", () => {
+  const property = new AasTypes.Property(AasTypes.DataTypeDefXsd.Int);
+  property.value = "1";
+
+  const submodel = new AasTypes.Submodel("urn:something:submodel");
+  submodel.submodelElements = [property];
+
+  const memo = new WeakMap<AasTypes.Class, number>();
+  const submodelHash = AasEquality.hash(submodel, memo);
+
+  expect(memo.get(submodel)).toEqual(submodelHash);
+  expect(memo.get(property)).toEqual(AasEquality.hash(property));
+
+  // The memo does not notice the changes by design.
+  property.value = "2";
+  expect(AasEquality.hash(submodel, memo)).toEqual(submodelHash);
+  expect(AasEquality.hash(submodel)).not.toEqual(submodelHash);
+});
@@ -0,0 +1,104 @@
+/**
+ * Test the de-serialization and the verification in a single pass.
+ */
+
+import * as path from "path";
+
+import * as AasDeserialization from "../src/deserialization";
+import * as AasIngestion from "../src/ingestion";
+import * as AasJsonization from "../src/jsonization";
+import * as AasTypes from "../src/types";
+import * as AasVerification from "../src/verification";
+
+import * as TestCommon from "./common";
+
+test("the errors are the same as from the separate calls", () => {
+  const jsonDir = path.join(TestCommon.TEST_DATA_DIR, "Json", "ContainedInEnvironment");
+
+  const cache = new AasVerification.VerificationCache(16);
+
+  for (const directory of [
+    path.join(jsonDir, "Expected"),
+    path.join(jsonDir, "Unexpected", "PatternViolation"),
+    path.join(jsonDir, "Unexpected", "InvalidValueExample"),
+    path.join(jsonDir, "Unexpected", "ConstraintViolation")
+  ]) {
+    for (const aPath of TestCommon.findFilesBySuffixRecursively(directory, ".json")) {
+      const jsonable = TestCommon.readJsonFromFileSync(aPath);
+
+      const environmentOrError = AasJsonization.environmentFromJsonable(jsonable);
+      const ingestedOrError = AasIngestion.environmentFromJsonable(jsonable);
+
+      if (environmentOrError.error !== null) {
+        expect(ingestedOrError.error).toEqual(environmentOrError.error);
+        continue;
+      }
+
+      const expected = TestCommon.errorsAsStrings(
+        AasVerification.verify(environmentOrError.mustValue())
+      );
+
+      expect(TestCommon.errorsAsStrings(ingestedOrError.mustValue().errors)).toEqual(
+        expected
+      );
+
+      const cachedOrError = AasIngestion.environmentFromJsonable(jsonable, null, cache);
+      expect(TestCommon.errorsAsStrings(cachedOrError.mustValue().errors)).toEqual(
+        expected
+      );
+    }
+  }
+});
+
+test("the paths refer to the de-serialized instances", () => {
+  const ingested = AasIngestion.ingest(
+    {
+      id: "urn:something:submodel",
+      submodelElements: [
+        { idShort: "a", valueType: "xs:int", value: "1", modelType: "Property" },
+        {
+          idShort: "collection",
+          value: [
+            { idShort: "b", valueType: "xs:int", value: "x", modelType: "Property" }
+          ],
+          modelType: "SubmodelElementCollection"
+        }
+      ],
+      modelType: "Submodel"
+    },
+    AasDeserialization.submodelFromJsonable
+  ).mustValue();
+
+  expect(TestCommon.errorsAsStrings(ingested.errors)).toEqual(
+    TestCommon.errorsAsStrings(AasVerification.verify(ingested.instance))
+  );
+  expect(ingested.errors.length).toBeGreaterThan(0);
+
+  for (const error of ingested.errors) {
+    const segments = error.path.segments;
+    expect(segments[0].toString()).toEqual(".submodelElements");
+    expect((<AasVerification.PropertySegment>segments[0]).instance).toBe(
+      ingested.instance
+    );
+  }
+});
+
+test("the instances are still reported to the given callback", () => {
+  const reported = new Array<AasTypes.Class>();
+
+  const ingested = AasIngestion.ingest(
+    {
+      id: "urn:something:submodel",
+      submodelElements: [{ idShort: "capability", modelType: "Capability" }],
+      modelType: "Submodel"
+    },
+    AasDeserialization.submodelFromJsonable,
+    { onInstance: (instance) => reported.push(instance) }
+  ).mustValue();
+
+  expect(ingested.errors).toEqual([]);
+  expect(reported).toEqual([
+    (ingested.instance.submodelElements ?? [])[0],
+    ingested.instance
+  ]);
+});
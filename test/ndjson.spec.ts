@@ -0,0 +1,152 @@
+/**
+ * Test the de/serialization of NDJSON streams.
+ */
+
+import * as AasJsonization from "../src/jsonization";
+import * as AasNdjson from "../src/ndjson";
+import * as AasTypes from "../src/types";
+
+async function* overChunks<T>(chunks: Array<T>): AsyncIterableIterator<T> {
+  for (const chunk of chunks) {
+    yield chunk;
+  }
+}
+
+async function collect<T>(iterator: AsyncIterable<T>): Promise<Array<T>> {
+  const result = new Array<T>();
+  for await (const item of iterator) {
+    result.push(item);
+  }
+  return result;
+}
+
+function someSubmodels(): Array<AasTypes.Submodel> {
+  const result = new Array<AasTypes.Submodel>();
+  for (let i = 0; i < 3; i++) {
+    const property = new AasTypes.Property(AasTypes.DataTypeDefXsd.String);
+    property.idShort = `property${i}`;
+    property.value = `Grüße ${i} 😀`;
+
+    const submodel = new AasTypes.Submodel(`urn:something:submodel${i}`);
+    submodel.submodelElements = [property];
+
+    result.push(submodel);
+  }
+  return result;
+}
+
+/**
+ * Split the `text` in chunks of `size` UTF-8 bytes, cutting through the
+ * multi-byte sequences as well.
+ */
+function splitInByteChunks(text: string, size: number): Array<Uint8Array> {
+  const bytes = Buffer.from(text, "utf-8");
+  const result = new Array<Uint8Array>();
+  for (let start = 0; start < bytes.length; start += size) {
+    result.push(new Uint8Array(bytes.subarray(start, start + size)));
+  }
+  return result;
+}
+
+test("write and read submodels back", async () => {
+  const submodels = someSubmodels();
+
+  const lines = await collect(AasNdjson.toNdjson(submodels));
+  expect(lines.length).toBe(submodels.length);
+  for (const line of lines) {
+    expect(line.endsWith("\n")).toBe(true);
+    expect(line.indexOf("\n")).toBe(line.length - 1);
+  }
+
+  const got = await collect(AasNdjson.submodelsFromNdjson(overChunks(lines)));
+  expect(got.map((submodelOrError) => submodelOrError.error)).toEqual([
+    null,
+    null,
+    null
+  ]);
+  expect(got.map((submodelOrError) => submodelOrError.mustValue())).toEqual(submodels);
+});
+
+test("chunks of any size give the same result", async () => {
+  const submodels = someSubmodels();
+  const text = (await collect(AasNdjson.toNdjson(submodels))).join("");
+
+  for (let size = 1; size < 20; size++) {
+    const textChunks = new Array<string>();
+    for (let start = 0; start < text.length; start += size) {
+      textChunks.push(text.substring(start, start + size));
+    }
+
+    for (const chunks of [textChunks, splitInByteChunks(text, size)]) {
+      const got = await collect(
+        AasNdjson.submodelsFromNdjson(overChunks<string | Uint8Array>(chunks))
+      );
+      expect(got.map((submodelOrError) => submodelOrError.mustValue())).toEqual(
+        submodels
+      );
+    }
+  }
+});
+
+test("errors are reported with line numbers", async () => {
+  const property = new AasTypes.Property(AasTypes.DataTypeDefXsd.Int);
+  property.idShort = "someProperty";
+  const propertyLine = JSON.stringify(AasJsonization.toJsonable(property));
+
+  const text = [
+    propertyLine,
+    "",
+    "{ this is not JSON",
+    "   ",
+    '{"modelType": "Unknown"}',
+    propertyLine + "\r",
+    propertyLine
+  ].join("\n");
+
+  const got = await collect(AasNdjson.submodelElementsFromNdjson(overChunks([text])));
+
+  expect(got.map((elementOrError) => elementOrError.error?.line ?? null)).toEqual([
+    null,
+    3,
+    5,
+    null,
+    null
+  ]);
+
+  expect(got[1].error?.error.message).toMatch(
+    /^Expected a valid JSON, but got a syntax error: /
+  );
+  expect(got[2].error?.error.message).toBe(
+    "Unexpected model type for ISubmodelElement: Unknown"
+  );
+
+  for (const index of [0, 3, 4]) {
+    expect(got[index].mustValue()).toEqual(property);
+  }
+});
+
+test("reading is lazy", async () => {
+  let pulled = 0;
+  async function* endless(): AsyncIterableIterator<string> {
+    const line =
+      JSON.stringify(
+        AasJsonization.toJsonable(new AasTypes.Submodel("urn:something:submodel"))
+      ) + "\n";
+
+    for (;;) {
+      pulled++;
+      yield line;
+    }
+  }
+
+  let count = 0;
+  for await (const submodelOrError of AasNdjson.submodelsFromNdjson(endless())) {
+    expect(submodelOrError.error).toBeNull();
+    count++;
+    if (count === 10) {
+      break;
+    }
+  }
+
+  expect(pulled).toBeLessThanOrEqual(11);
+});
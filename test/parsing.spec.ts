@@ -0,0 +1,192 @@
+/**
+ * Test the parsing of JSON text against `JSON.parse` and the de-serialization.
+ */
+
+import * as fs from "fs";
+import * as path from "path";
+
+import * as AasCommon from "../src/common";
+import * as AasJsonization from "../src/jsonization";
+import * as AasParsing from "../src/parsing";
+import * as AasTypes from "../src/types";
+
+import * as TestCommon from "./common";
+
+/**
+ * De-serialize `text` in the reference way.
+ */
+function environmentFromTextWithJsonParse(
+  text: string
+): AasCommon.Either<AasTypes.Environment, AasJsonization.DeserializationError> {
+  let jsonable: AasJsonization.JsonValue;
+  try {
+    jsonable = JSON.parse(text);
+  } catch (error) {
+    return new AasCommon.Either<
+      AasTypes.Environment,
+      AasJsonization.DeserializationError
+    >(
+      null,
+      new AasJsonization.DeserializationError(
+        `Expected a valid JSON, but got a syntax error: ${error.message}`
+      )
+    );
+  }
+  return AasJsonization.environmentFromJsonable(jsonable);
+}
+
+/**
+ * Check that parsing `text` gives the same result as the reference way.
+ */
+function assertSameAsWithJsonParse(text: string, source: string): void {
+  const expected = environmentFromTextWithJsonParse(text);
+  const got = AasParsing.environmentFromText(text);
+
+  if (expected.error !== null) {
+    if (got.error === null) {
+      throw new Error(`Expected an error for ${source}, but got none`);
+    }
+    expect(`${got.error.path}: ${got.error.message}`).toEqual(
+      `${expected.error.path}: ${expected.error.message}`
+    );
+    return;
+  }
+
+  if (got.error !== null) {
+    throw new Error(
+      `Expected no error for ${source}, ` +
+        `but got: ${got.error.path}: ${got.error.message}`
+    );
+  }
+
+  const inequalityError = TestCommon.checkJsonablesEqual(
+    AasJsonization.toJsonable(expected.mustValue()),
+    AasJsonization.toJsonable(got.mustValue())
+  );
+  if (inequalityError !== null) {
+    throw new Error(
+      `The parsed environment from ${source} is unequal the de-serialized one: ` +
+        `${inequalityError.path}: ${inequalityError.message}`
+    );
+  }
+}
+
+/**
+ * Re-create `jsonable` with the properties of all the objects in reverse order.
+ */
+function reversed(jsonable: AasJsonization.JsonValue): AasJsonization.JsonValue {
+  if (typeof jsonable !== "object" || jsonable === null) {
+    return jsonable;
+  }
+
+  if (Array.isArray(jsonable)) {
+    return jsonable.map(reversed);
+  }
+
+  const jsonObject = <AasJsonization.JsonObject>jsonable;
+  const result: AasJsonization.JsonObject = {};
+  for (const key of Object.keys(jsonObject).reverse()) {
+    result[key] = reversed(jsonObject[key]);
+  }
+  return result;
+}
+
+test("parsing gives the same results as the de-serialization", () => {
+  for (const aPath of TestCommon.findFilesBySuffixRecursively(
+    path.join(TestCommon.TEST_DATA_DIR, "Json", "ContainedInEnvironment"),
+    ".json"
+  )) {
+    const text = fs.readFileSync(aPath, "utf-8");
+    assertSameAsWithJsonParse(text, aPath);
+
+    // We check the other order of the properties, so that the model types come
+    // first, and the text without any whitespace.
+    let jsonable: AasJsonization.JsonValue;
+    try {
+      jsonable = JSON.parse(text);
+    } catch (error) {
+      continue;
+    }
+    assertSameAsWithJsonParse(JSON.stringify(reversed(jsonable)), aPath);
+    assertSameAsWithJsonParse(JSON.stringify(jsonable), aPath);
+  }
+});
+
+test("the valid texts are parsed without falling back", () => {
+  const texts = new Array<[string, string]>();
+  for (const aPath of TestCommon.findFilesBySuffixRecursively(
+    path.join(TestCommon.TEST_DATA_DIR, "Json", "ContainedInEnvironment", "Expected"),
+    ".json"
+  )) {
+    const text = fs.readFileSync(aPath, "utf-8");
+    texts.push([text, aPath]);
+    texts.push([JSON.stringify(reversed(JSON.parse(text))), aPath]);
+  }
+
+  // The fallback is the only place where the text is given to JSON.parse.
+  const parse = jest.spyOn(JSON, "parse");
+  try {
+    for (const [text, aPath] of texts) {
+      const environmentOrError = AasParsing.environmentFromText(text);
+      if (environmentOrError.error !== null) {
+        throw new Error(
+          `Expected no error for ${aPath}, ` +
+            `but got: ${environmentOrError.error.path}: ` +
+            environmentOrError.error.message
+        );
+      }
+
+      if (parse.mock.calls.length > 0) {
+        throw new Error(`Expected the fast path for ${aPath}, but it fell back`);
+      }
+    }
+  } finally {
+    parse.mockRestore();
+  }
+});
+
+test("the unknown properties are skipped", () => {
+  const text = JSON.stringify({
+    something: { modelType: "Property", nested: [1, -2.5e3, true, null, "é"] },
+    submodels: [
+      {
+        id: "urn:something:submodel",
+        somethingElse: [{}, []],
+        submodelElements: [
+          {
+            modelType: "Property",
+            valueType: "xs:string",
+            value: "escaped \" \\ \n   😀"
+          }
+        ]
+      }
+    ]
+  });
+
+  assertSameAsWithJsonParse(text, "the text");
+
+  const parse = jest.spyOn(JSON, "parse");
+  try {
+    expect(AasParsing.environmentFromText(text).error).toBeNull();
+    expect(parse).not.toHaveBeenCalled();
+  } finally {
+    parse.mockRestore();
+  }
+});
+
+test("the invalid texts give the same errors", () => {
+  for (const text of [
+    "",
+    "null",
+    "[]",
+    '{"submodels": [{"id": "something"},]}',
+    '{"submodels": [{"id": 1}]}',
+    '{"submodels": [{}]}',
+    '{"submodels": [{"id": "x", "submodelElements": [{"value": "1"}]}]}',
+    '{"submodels": [{"id": "x", "submodelElements": [{"modelType": "Unknown"}]}]}',
+    '{"submodels": [{"id": "x", "kind": "Unknown"}]}',
+    '{"submodels": [{"id": "x"}]} trailing'
+  ]) {
+    assertSameAsWithJsonParse(text, JSON.stringify(text));
+  }
+});
@@ -0,0 +1,124 @@
+/**
+ * Test the verification with the persisted results.
+ */
+
+import * as fs from "fs";
+import * as path from "path";
+
+import * as AasPersistence from "../src/persistence";
+import * as AasTypes from "../src/types";
+import * as AasVerification from "../src/verification";
+
+import * as TestCommon from "./common";
+
+/**
+ * Keep the content of a file in memory.
+ */
+class InMemoryFile implements AasPersistence.AppendOnlyFile {
+  content: string | null = null;
+
+  read(): string | null {
+    return this.content;
+  }
+
+  append(text: string): void {
+    this.content = (this.content ?? "") + text;
+  }
+}
+
+/**
+ * Count the accesses to a store.
+ */
+class CountingStore implements AasPersistence.ResultStore {
+  readonly store = new AasPersistence.MemoryResultStore();
+  hits = 0;
+  misses = 0;
+
+  get(key: string): Array<AasPersistence.StoredError> | undefined {
+    const errors = this.store.get(key);
+    if (errors !== undefined) {
+      this.hits++;
+    } else {
+      this.misses++;
+    }
+    return errors;
+  }
+
+  set(key: string, errors: Array<AasPersistence.StoredError>): void {
+    this.store.set(key, errors);
+  }
+}
+
+test("the SDK version is the one of the package", () => {
+  const packageJson = JSON.parse(
+    fs.readFileSync(path.join(__dirname, "..", "package.json"), "utf-8")
+  );
+  expect(AasPersistence.SDK_VERSION).toEqual(packageJson["version"]);
+});
+
+test("the replayed errors are the same as the verified ones", () => {
+  const jsonDir = path.join(TestCommon.TEST_DATA_DIR, "Json", "ContainedInEnvironment");
+
+  const file = new InMemoryFile();
+
+  for (const directory of [
+    path.join(jsonDir, "Expected"),
+    path.join(jsonDir, "Unexpected", "PatternViolation"),
+    path.join(jsonDir, "Unexpected", "InvalidValueExample"),
+    path.join(jsonDir, "Unexpected", "ConstraintViolation")
+  ]) {
+    for (const environment of TestCommon.loadEnvironments(directory)) {
+      const expected = TestCommon.errorsAsStrings(AasVerification.verify(environment));
+
+      const store = new AasPersistence.AppendOnlyResultStore(file);
+      expect(
+        TestCommon.errorsAsStrings(AasPersistence.verify(environment, store))
+      ).toEqual(expected);
+
+      // We re-load the store from the file to replay the persisted results.
+      const reloaded = new AasPersistence.AppendOnlyResultStore(file);
+      expect(
+        TestCommon.errorsAsStrings(AasPersistence.verify(environment, reloaded))
+      ).toEqual(expected);
+    }
+  }
+});
+
+test("only the changed identifiables are verified again", () => {
+  const submodel = new AasTypes.Submodel("urn:something:submodel");
+  const other = new AasTypes.Submodel("urn:something:other");
+  const environment = new AasTypes.Environment(null, [submodel, other]);
+
+  const store = new CountingStore();
+  expect(Array.from(AasPersistence.verify(environment, store))).toEqual([]);
+  expect(store.misses).toEqual(2);
+
+  expect(Array.from(AasPersistence.verify(environment, store))).toEqual([]);
+  expect(store.hits).toEqual(2);
+
+  submodel.idShort = "not a valid ID-short";
+  const errors = TestCommon.errorsAsStrings(AasPersistence.verify(environment, store));
+  expect(errors).toEqual(
+    TestCommon.errorsAsStrings(AasVerification.verify(environment))
+  );
+  expect(errors).not.toEqual([]);
+  expect(store.hits).toEqual(3);
+  expect(store.misses).toEqual(3);
+});
+
+test("the corrupt lines of the file are skipped", () => {
+  const file = new InMemoryFile();
+  file.content =
+    '\n{"key":"a","errors":[]}' +
+    '\n{"key":"b","errors":[{"message":"Something","path":["idShort"]}]}' +
+    '\n{"key":"c","errors":[{"message":"Someth';
+
+  const store = new AasPersistence.AppendOnlyResultStore(file);
+  expect(store.size).toEqual(2);
+  expect(store.get("a")).toEqual([]);
+  expect(store.get("b")).toEqual([{ message: "Something", path: ["idShort"] }]);
+  expect(store.get("c")).toBeUndefined();
+
+  store.set("c", []);
+  expect(new AasPersistence.AppendOnlyResultStore(file).get("c")).toEqual([]);
+});
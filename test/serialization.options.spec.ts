@@ -0,0 +1,127 @@
+/**
+ * Test the serialization limited in depth and without the blob values.
+ */
+
+import * as AasSerialization from "../src/serialization";
+import * as AasTypes from "../src/types";
+
+function nestedSubmodel(): AasTypes.Submodel {
+  const blob = new AasTypes.Blob("application/octet-stream");
+  blob.idShort = "someBlob";
+  blob.value = new Uint8Array([1, 2, 3]);
+
+  const innerCollection = new AasTypes.SubmodelElementCollection();
+  innerCollection.idShort = "innerCollection";
+  innerCollection.value = [blob];
+
+  const outerCollection = new AasTypes.SubmodelElementCollection();
+  outerCollection.idShort = "outerCollection";
+  outerCollection.value = [innerCollection];
+
+  const submodel = new AasTypes.Submodel("urn:something:submodel");
+  submodel.submodelElements = [outerCollection, blob];
+  return submodel;
+}
+
+test("no options give the full serialization", () => {
+  const submodel = nestedSubmodel();
+  expect(AasSerialization.toJsonable(submodel, {})).toEqual(
+    AasSerialization.toJsonable(submodel)
+  );
+});
+
+test("the nested elements are cut at the depth", () => {
+  const submodel = nestedSubmodel();
+
+  expect(AasSerialization.toJsonable(submodel, { depth: 0 })).toEqual({
+    id: "urn:something:submodel",
+    modelType: "Submodel"
+  });
+
+  const core = AasSerialization.toJsonable(submodel, { depth: 1 });
+  expect(core["submodelElements"]).toEqual([
+    { idShort: "outerCollection", modelType: "SubmodelElementCollection" },
+    {
+      idShort: "someBlob",
+      value: "AQID",
+      contentType: "application/octet-stream",
+      modelType: "Blob"
+    }
+  ]);
+
+  const twoLevels = AasSerialization.toJsonable(submodel, { depth: 2 });
+  expect(twoLevels["submodelElements"]).toEqual([
+    {
+      idShort: "outerCollection",
+      value: [{ idShort: "innerCollection", modelType: "SubmodelElementCollection" }],
+      modelType: "SubmodelElementCollection"
+    },
+    {
+      idShort: "someBlob",
+      value: "AQID",
+      contentType: "application/octet-stream",
+      modelType: "Blob"
+    }
+  ]);
+
+  expect(AasSerialization.toJsonable(submodel, { depth: 3 })).toEqual(
+    AasSerialization.toJsonable(submodel)
+  );
+});
+
+test("the depth is relative to the serialized instance", () => {
+  const submodel = nestedSubmodel();
+  const outerCollection = (submodel.submodelElements ?? [])[0];
+
+  expect(AasSerialization.toJsonable(outerCollection, { depth: 1 })).toEqual({
+    idShort: "outerCollection",
+    value: [{ idShort: "innerCollection", modelType: "SubmodelElementCollection" }],
+    modelType: "SubmodelElementCollection"
+  });
+});
+
+test("the variables of an operation are cut at the depth", () => {
+  const property = new AasTypes.Property(AasTypes.DataTypeDefXsd.Int);
+  property.idShort = "someProperty";
+
+  const operation = new AasTypes.Operation();
+  operation.idShort = "someOperation";
+  operation.inputVariables = [new AasTypes.OperationVariable(property)];
+  operation.outputVariables = [new AasTypes.OperationVariable(property)];
+  operation.inoutputVariables = [new AasTypes.OperationVariable(property)];
+
+  const submodel = new AasTypes.Submodel("urn:something:submodel");
+  submodel.submodelElements = [operation];
+
+  const core = AasSerialization.toJsonable(submodel, { depth: 1 });
+  expect(core["submodelElements"]).toEqual([
+    { idShort: "someOperation", modelType: "Operation" }
+  ]);
+
+  expect(AasSerialization.toJsonable(submodel, { depth: 2 })).toEqual(
+    AasSerialization.toJsonable(submodel)
+  );
+});
+
+test("the blob values are omitted", () => {
+  const submodel = nestedSubmodel();
+
+  const jsonable = AasSerialization.toJsonable(submodel, {
+    depth: 1,
+    withoutBlobValue: true
+  });
+  expect(jsonable["submodelElements"]).toEqual([
+    { idShort: "outerCollection", modelType: "SubmodelElementCollection" },
+    {
+      idShort: "someBlob",
+      contentType: "application/octet-stream",
+      modelType: "Blob"
+    }
+  ]);
+});
+
+test("invalid depth is rejected", () => {
+  const submodel = nestedSubmodel();
+  expect(() => AasSerialization.toJsonable(submodel, { depth: -1 })).toThrow();
+  expect(() => AasSerialization.toJsonable(submodel, { depth: 1.5 })).toThrow();
+});
@@ -0,0 +1,317 @@
+/**
+ * Test the ValueOnly and the Metadata representations.
+ */
+
+import * as AasDeserialization from "../src/deserialization";
+import * as AasJsonization from "../src/jsonization";
+import * as AasSerialization from "../src/serialization";
+import * as AasTypes from "../src/types";
+
+function someReference(value: string): AasTypes.Reference {
+  return new AasTypes.Reference(AasTypes.ReferenceTypes.GlobalReference, [
+    new AasTypes.Key(AasTypes.KeyTypes.GlobalReference, value)
+  ]);
+}
+
+function someSubmodel(): AasTypes.Submodel {
+  const integer = new AasTypes.Property(AasTypes.DataTypeDefXsd.Int);
+  integer.idShort = "integer";
+  integer.value = "42";
+
+  const flag = new AasTypes.Property(AasTypes.DataTypeDefXsd.Boolean);
+  flag.idShort = "flag";
+  flag.value = "true";
+
+  const text = new AasTypes.Property(AasTypes.DataTypeDefXsd.String);
+  text.idShort = "text";
+  text.value = "something";
+
+  const empty = new AasTypes.Property(AasTypes.DataTypeDefXsd.String);
+  empty.idShort = "empty";
+
+  const title = new AasTypes.MultiLanguageProperty();
+  title.idShort = "title";
+  title.value = [
+    new AasTypes.LangString("en", "Title"),
+    new AasTypes.LangString("de", "Titel")
+  ];
+
+  const range = new AasTypes.Range(AasTypes.DataTypeDefXsd.Double);
+  range.idShort = "range";
+  range.min = "0.5";
+  range.max = "1.5";
+
+  const blob = new AasTypes.Blob("application/octet-stream");
+  blob.idShort = "blob";
+  blob.value = new Uint8Array([1, 2, 3]);
+
+  const file = new AasTypes.File("text/plain");
+  file.idShort = "file";
+  file.value = "/aasx/something.txt";
+
+  const listItem = new AasTypes.Property(AasTypes.DataTypeDefXsd.Int);
+  listItem.value = "1";
+
+  const list = new AasTypes.SubmodelElementList(
+    AasTypes.AasSubmodelElements.Property
+  );
+  list.idShort = "list";
+  list.value = [listItem];
+
+  const collection = new AasTypes.SubmodelElementCollection();
+  collection.idShort = "collection";
+  collection.value = [text, empty];
+
+  const reference = new AasTypes.ReferenceElement();
+  reference.idShort = "reference";
+  reference.value = someReference("urn:something:reference");
+
+  const relationship = new AasTypes.RelationshipElement(
+    someReference("urn:something:first"),
+    someReference("urn:something:second")
+  );
+  relationship.idShort = "relationship";
+
+  const entity = new AasTypes.Entity(AasTypes.EntityType.SelfManagedEntity);
+  entity.idShort = "entity";
+  entity.globalAssetId = someReference("urn:something:asset");
+
+  const submodel = new AasTypes.Submodel("urn:something:submodel");
+  submodel.idShort = "someSubmodel";
+  submodel.submodelElements = [
+    integer,
+    flag,
+    title,
+    range,
+    blob,
+    file,
+    list,
+    collection,
+    reference,
+    relationship,
+    entity
+  ];
+  return submodel;
+}
+
+test("the values are represented by idShort", () => {
+  expect(AasSerialization.toValueOnlyJsonable(someSubmodel())).toEqual({
+    integer: 42,
+    flag: true,
+    title: [{ en: "Title" }, { de: "Titel" }],
+    range: { min: 0.5, max: 1.5 },
+    blob: { contentType: "application/octet-stream", value: "AQID" },
+    file: { contentType: "text/plain", value: "/aasx/something.txt" },
+    list: [1],
+    collection: { text: "something" },
+    reference: AasSerialization.toJsonable(someReference("urn:something:reference")),
+    relationship: {
+      first: AasSerialization.toJsonable(someReference("urn:something:first")),
+      second: AasSerialization.toJsonable(someReference("urn:something:second"))
+    },
+    entity: {
+      entityType: "SelfManagedEntity",
+      globalAssetId: AasSerialization.toJsonable(someReference("urn:something:asset"))
+    }
+  });
+});
+
+test("the values which do not fit a JSON number are kept as text", () => {
+  const big = new AasTypes.Property(AasTypes.DataTypeDefXsd.Long);
+  big.value = "12345678901234567890";
+  expect(AasSerialization.toValueOnlyJsonable(big)).toEqual("12345678901234567890");
+
+  const infinite = new AasTypes.Property(AasTypes.DataTypeDefXsd.Double);
+  infinite.value = "INF";
+  expect(AasSerialization.toValueOnlyJsonable(infinite)).toEqual("INF");
+});
+
+test("the serialization options apply to the ValueOnly representation", () => {
+  const submodel = someSubmodel();
+
+  expect(AasSerialization.toValueOnlyJsonable(submodel, { depth: 0 })).toEqual({});
+
+  const shallow = <AasJsonization.JsonObject>(
+    AasSerialization.toValueOnlyJsonable(submodel, { depth: 1 })
+  );
+  expect(shallow["collection"]).toEqual({});
+  expect(shallow["list"]).toEqual([]);
+
+  const withoutBlobValue = <AasJsonization.JsonObject>(
+    AasSerialization.toValueOnlyJsonable(submodel, { withoutBlobValue: true })
+  );
+  expect(withoutBlobValue["blob"]).toEqual({
+    contentType: "application/octet-stream"
+  });
+});
+
+test("the chunks of the text make up the JSON", () => {
+  const submodel = someSubmodel();
+
+  for (const options of [null, { depth: 0 }, { depth: 1 }]) {
+    const chunks = Array.from(AasSerialization.toValueOnlyText(submodel, options));
+    expect(chunks.join("")).toEqual(
+      JSON.stringify(AasSerialization.toValueOnlyJsonable(submodel, options))
+    );
+  }
+
+  const property = (submodel.submodelElements ?? [])[0];
+  expect(Array.from(AasSerialization.toValueOnlyText(property)).join("")).toEqual("42");
+});
+
+test("the metadata leaves out the values", () => {
+  const submodel = someSubmodel();
+
+  const metadata = AasSerialization.toMetadataJsonable(submodel);
+  expect(metadata).toEqual({
+    idShort: "someSubmodel",
+    id: "urn:something:submodel",
+    modelType: "Submodel"
+  });
+
+  const range = (submodel.submodelElements ?? [])[3];
+  expect(AasSerialization.toMetadataJsonable(range)).toEqual({
+    idShort: "range",
+    valueType: "xs:double",
+    modelType: "Range"
+  });
+});
+
+test("the patch from the ValueOnly round-trips", () => {
+  const source = someSubmodel();
+  const target = someSubmodel();
+
+  for (const element of target.submodelElements ?? []) {
+    if (AasTypes.isProperty(element)) {
+      element.value = null;
+    }
+  }
+  expect(AasSerialization.toValueOnlyJsonable(target)).not.toEqual(
+    AasSerialization.toValueOnlyJsonable(source)
+  );
+
+  const jsonable = AasSerialization.toValueOnlyJsonable(source);
+  if (jsonable === null) {
+    throw new Error("Unexpected null");
+  }
+
+  const error = AasDeserialization.patchFromValueOnlyJsonable(target, jsonable);
+  expect(error).toBeNull();
+
+  expect(AasSerialization.toJsonable(target)).toEqual(
+    AasSerialization.toJsonable(source)
+  );
+});
+
+test("the patch from the depth-limited ValueOnly round-trips", () => {
+  const source = someSubmodel();
+  const target = someSubmodel();
+
+  for (const element of target.submodelElements ?? []) {
+    if (AasTypes.isProperty(element)) {
+      element.value = null;
+    }
+  }
+
+  const list = <AasTypes.SubmodelElementList>(target.submodelElements ?? [])[6];
+  const listItem = <AasTypes.Property>(list.value ?? [])[0];
+  listItem.value = "2";
+
+  const jsonable = AasSerialization.toValueOnlyJsonable(source, { depth: 1 });
+  if (jsonable === null) {
+    throw new Error("Unexpected null");
+  }
+
+  const error = AasDeserialization.patchFromValueOnlyJsonable(target, jsonable);
+  expect(error).toBeNull();
+
+  expect(AasSerialization.toValueOnlyJsonable(target, { depth: 1 })).toEqual(jsonable);
+
+  // The items of the list below the depth are left as they are.
+  expect(listItem.value).toEqual("2");
+});
+
+test("the patch leaves the values not given as they are", () => {
+  const submodel = someSubmodel();
+
+  const error = AasDeserialization.patchFromValueOnlyJsonable(submodel, {
+    collection: { empty: "now set" },
+    range: { max: 2.5 }
+  });
+  expect(error).toBeNull();
+
+  const jsonable = <AasJsonization.JsonObject>(
+    AasSerialization.toValueOnlyJsonable(submodel)
+  );
+  expect(jsonable["collection"]).toEqual({ text: "something", empty: "now set" });
+  expect(jsonable["range"]).toEqual({ min: 0.5, max: 2.5 });
+  expect(jsonable["integer"]).toEqual(42);
+});
+
+test("the patch keeps the text of the values which it does not change", () => {
+  const flag = new AasTypes.Property(AasTypes.DataTypeDefXsd.Boolean);
+  flag.idShort = "flag";
+  flag.value = "1";
+
+  const integer = new AasTypes.Property(AasTypes.DataTypeDefXsd.Int);
+  integer.idShort = "integer";
+  integer.value = "007";
+
+  const range = new AasTypes.Range(AasTypes.DataTypeDefXsd.Int);
+  range.idShort = "range";
+  range.min = "007";
+  range.max = "+8";
+
+  const submodel = new AasTypes.Submodel("urn:something:submodel");
+  submodel.submodelElements = [flag, integer, range];
+
+  const jsonable = AasSerialization.toValueOnlyJsonable(submodel);
+
+  const error = AasDeserialization.patchFromValueOnlyJsonable(submodel, jsonable);
+  expect(error).toBeNull();
+
+  expect(flag.value).toEqual("1");
+  expect(integer.value).toEqual("007");
+  expect(range.min).toEqual("007");
+  expect(range.max).toEqual("+8");
+
+  const patchError = AasDeserialization.patchFromValueOnlyJsonable(submodel, {
+    flag: false,
+    range: { min: 7, max: 9 }
+  });
+  expect(patchError).toBeNull();
+
+  expect(flag.value).toEqual("false");
+  expect(range.min).toEqual("007");
+  expect(range.max).toEqual("9");
+});
+
+test("an invalid patch changes nothing", () => {
+  const submodel = someSubmodel();
+  const before = AasSerialization.toJsonable(submodel);
+
+  const error = AasDeserialization.patchFromValueOnlyJsonable(submodel, {
+    integer: 43,
+    collection: { unknown: "something" }
+  });
+  if (error === null) {
+    throw new Error("Expected an error, but got none");
+  }
+
+  expect(error.path.toString()).toEqual("collection.unknown");
+  expect(AasSerialization.toJsonable(submodel)).toEqual(before);
+});
+
+test("the list is patched by position", () => {
+  const submodel = someSubmodel();
+
+  const error = AasDeserialization.patchFromValueOnlyJsonable(submodel, {
+    list: [1, 2]
+  });
+  if (error === null) {
+    throw new Error("Expected an error, but got none");
+  }
+
+  expect(error.path.toString()).toEqual("list");
+  expect(error.message).toEqual("Expected at most 1 item(s), but got more");
+});
@@ -0,0 +1,144 @@
+/**
+ * Test the copy-on-write snapshots.
+ */
+
+import * as AasDiffing from "../src/diffing";
+import * as AasJsonization from "../src/jsonization";
+import * as AasSnapshots from "../src/snapshots";
+import * as AasTypes from "../src/types";
+
+import * as TestCommon from "./common";
+import * as TestCommonJsonization from "./commonJsonization";
+
+function newEnvironment(): AasTypes.Environment {
+  const collection = new AasTypes.SubmodelElementCollection();
+  collection.idShort = "collection";
+  collection.value = [
+    TestCommon.newProperty("a", "a"),
+    TestCommon.newProperty("b", "b")
+  ];
+
+  const submodel = new AasTypes.Submodel("urn:something:submodel");
+  submodel.submodelElements = [collection, TestCommon.newProperty("c", "c")];
+
+  const other = new AasTypes.Submodel("urn:something:other");
+
+  return new AasTypes.Environment(null, [submodel, other]);
+}
+
+const PATH_TO_A = [
+  "submodels",
+  "urn:something:submodel",
+  "submodelElements",
+  "collection",
+  "value",
+  "a"
+];
+
+test("the update leaves the old snapshot as it is", () => {
+  const store = new AasSnapshots.SnapshotStore(newEnvironment());
+  const before = store.current;
+  const jsonableBefore = AasJsonization.toJsonable(before);
+
+  const error = store.update(PATH_TO_A, (copy) => {
+    (<AasTypes.Property>copy).value = "changed";
+  });
+  expect(error).toBeNull();
+  expect(store.version).toEqual(1);
+
+  expect(store.current).not.toBe(before);
+  expect(AasJsonization.toJsonable(before)).toEqual(jsonableBefore);
+  expect(AasJsonization.toJsonable(store.current)).not.toEqual(jsonableBefore);
+});
+
+test("the instances off the path are shared", () => {
+  const store = new AasSnapshots.SnapshotStore(newEnvironment());
+  const before = store.current;
+
+  store.update(PATH_TO_A, (copy) => {
+    (<AasTypes.Property>copy).value = "changed";
+  });
+  const after = store.current;
+
+  const [submodelBefore, otherBefore] = before.submodels ?? [];
+  const [submodelAfter, otherAfter] = after.submodels ?? [];
+  expect(otherAfter).toBe(otherBefore);
+  expect(submodelAfter).not.toBe(submodelBefore);
+
+  const [collectionBefore, cBefore] = submodelBefore.submodelElements ?? [];
+  const [collectionAfter, cAfter] = submodelAfter.submodelElements ?? [];
+  expect(cAfter).toBe(cBefore);
+  expect(collectionAfter).not.toBe(collectionBefore);
+
+  const [aBefore, bBefore] =
+    (<AasTypes.SubmodelElementCollection>collectionBefore).value ?? [];
+  const [aAfter, bAfter] =
+    (<AasTypes.SubmodelElementCollection>collectionAfter).value ?? [];
+  expect(bAfter).toBe(bBefore);
+  expect(aAfter).not.toBe(aBefore);
+});
+
+test("the changes since a snapshot are the edits", () => {
+  const store = new AasSnapshots.SnapshotStore(newEnvironment());
+  const before = store.current;
+
+  store.update(PATH_TO_A, (copy) => {
+    (<AasTypes.Property>copy).value = "changed";
+  });
+
+  const changes = store.changesSince(before);
+  expect(changes).toHaveLength(1);
+  expect(changes[0].kind).toEqual(AasDiffing.ChangeKind.Replace);
+  expect(changes[0].path).toEqual(PATH_TO_A);
+  expect((<AasTypes.Property>changes[0].value).value).toEqual("changed");
+});
+
+test("the patch is applied in a new snapshot", () => {
+  const store = new AasSnapshots.SnapshotStore(
+    TestCommonJsonization.loadMinimalEnvironment()
+  );
+  const before = store.current;
+  const jsonableBefore = AasJsonization.toJsonable(before);
+
+  const complete = TestCommonJsonization.loadCompleteEnvironment();
+  const error = store.applyPatch(AasDiffing.diff(before, complete));
+  expect(error).toBeNull();
+
+  expect(AasJsonization.toJsonable(store.current)).toEqual(
+    AasJsonization.toJsonable(complete)
+  );
+  expect(AasJsonization.toJsonable(before)).toEqual(jsonableBefore);
+});
+
+test("an invalid patch leaves the current snapshot as it is", () => {
+  const store = new AasSnapshots.SnapshotStore(newEnvironment());
+  const before = store.current;
+
+  const error = store.applyPatch([
+    new AasDiffing.Change(AasDiffing.ChangeKind.Remove, PATH_TO_A),
+    new AasDiffing.Change(AasDiffing.ChangeKind.Remove, [
+      "submodels",
+      "urn:something:nonexisting"
+    ])
+  ]);
+
+  if (error === null) {
+    throw new Error("Expected an error, but got none");
+  }
+  expect(error.index).toEqual(1);
+  expect(store.current).toBe(before);
+  expect(store.version).toEqual(0);
+});
+
+test("an update of a missing item is reported", () => {
+  const store = new AasSnapshots.SnapshotStore(newEnvironment());
+
+  const error = store.update(["submodels", "urn:something:nonexisting"], () => {
+    throw new Error("Unexpected call");
+  });
+
+  if (error === null) {
+    throw new Error("Expected an error, but got none");
+  }
+  expect(store.version).toEqual(0);
+});
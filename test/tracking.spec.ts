@@ -0,0 +1,138 @@
+/**
+ * Test the tracking of the modifications.
+ */
+
+import * as AasTracking from "../src/tracking";
+import * as AasTypes from "../src/types";
+
+import * as TestCommon from "./common";
+import * as TestCommonJsonization from "./commonJsonization";
+
+interface Model {
+  environment: AasTypes.Environment;
+  submodel: AasTypes.Submodel;
+  other: AasTypes.Submodel;
+  collection: AasTypes.SubmodelElementCollection;
+  a: AasTypes.Property;
+  b: AasTypes.Property;
+}
+
+function newModel(): Model {
+  const a = TestCommon.newProperty("a", "a");
+  const b = TestCommon.newProperty("b", "b");
+
+  const collection = new AasTypes.SubmodelElementCollection();
+  collection.idShort = "collection";
+  collection.value = [a, b];
+
+  const submodel = new AasTypes.Submodel("urn:something:submodel");
+  submodel.submodelElements = [collection];
+
+  const other = new AasTypes.Submodel("urn:something:other");
+
+  const environment = new AasTypes.Environment(null, [submodel, other]);
+
+  return { environment, submodel, other, collection, a, b };
+}
+
+test("nothing is dirty initially", () => {
+  const environment = TestCommonJsonization.loadCompleteEnvironment();
+  const tracker = new AasTracking.ChangeTracker(environment);
+
+  expect(tracker.isTracked(environment)).toBe(true);
+  for (const instance of environment.descend()) {
+    expect(tracker.isTracked(instance)).toBe(true);
+    expect(tracker.isDirty(instance)).toBe(false);
+  }
+  expect(tracker.takeDirty().size).toEqual(0);
+});
+
+test("the modified instance and its ancestors are dirty", () => {
+  const model = newModel();
+  const tracker = new AasTracking.ChangeTracker(model.environment);
+
+  tracker.set(model.a, "value", "changed");
+  expect(model.a.value).toEqual("changed");
+
+  expect(tracker.takeDirty()).toEqual(
+    new Set<AasTypes.Class>([
+      model.a,
+      model.collection,
+      model.submodel,
+      model.environment
+    ])
+  );
+  expect(tracker.isDirty(model.a)).toBe(false);
+});
+
+test("the attached and the detached sub-trees are reported", () => {
+  const model = newModel();
+  const tracker = new AasTracking.ChangeTracker(model.environment);
+
+  const events = new Array<AasTracking.MutationEvent>();
+  tracker.subscribe((event) => events.push(event));
+
+  const c = TestCommon.newProperty("c", "c");
+  c.semanticId = new AasTypes.Reference(AasTypes.ReferenceTypes.GlobalReference, [
+    new AasTypes.Key(AasTypes.KeyTypes.GlobalReference, "urn:something:c")
+  ]);
+  tracker.set(model.collection, "value", [model.a, c]);
+
+  expect(events).toEqual([
+    new AasTracking.MutationEvent(model.collection, "value", [c], [model.b])
+  ]);
+
+  expect(tracker.isTracked(model.b)).toBe(false);
+  expect(tracker.parentOf(c)).toBe(model.collection);
+  for (const instance of c.descend()) {
+    expect(tracker.isTracked(instance)).toBe(true);
+  }
+
+  const dirty = tracker.takeDirty();
+  expect(dirty.has(c)).toBe(true);
+  expect(dirty.has(model.a)).toBe(false);
+  expect(dirty.has(model.other)).toBe(false);
+});
+
+test("the modification in place is reported by markDirty", () => {
+  const model = newModel();
+  const tracker = new AasTracking.ChangeTracker(model.environment);
+
+  const events = new Array<AasTracking.MutationEvent>();
+  const unsubscribe = tracker.subscribe((event) => events.push(event));
+
+  model.collection.value?.splice(0, 1);
+  tracker.markDirty(model.collection);
+  expect(events).toEqual([
+    new AasTracking.MutationEvent(model.collection, null, [], [model.a])
+  ]);
+
+  unsubscribe();
+  model.collection.value?.push(model.a);
+  tracker.markDirty(model.collection, "value");
+  expect(events).toHaveLength(1);
+  expect(tracker.parentOf(model.a)).toBe(model.collection);
+});
+
+test("a moved sub-tree stays tracked", () => {
+  const model = newModel();
+  const tracker = new AasTracking.ChangeTracker(model.environment);
+
+  model.other.submodelElements = [model.collection];
+  tracker.markDirty(model.other);
+
+  model.submodel.submodelElements = null;
+  tracker.markDirty(model.submodel);
+
+  expect(tracker.parentOf(model.collection)).toBe(model.other);
+  expect(tracker.isTracked(model.a)).toBe(true);
+});
+
+test("an untracked instance is refused", () => {
+  const model = newModel();
+  const tracker = new AasTracking.ChangeTracker(model.environment);
+
+  expect(() => tracker.markDirty(TestCommon.newProperty("c", "c"))).toThrow(
+    "untracked Property"
+  );
+});
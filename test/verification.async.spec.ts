@@ -0,0 +1,93 @@
+/**
+ * Test the time-sliced verification.
+ */
+
+import * as path from "path";
+
+import * as AasTypes from "../src/types";
+import * as AasVerification from "../src/verification";
+
+import * as TestCommon from "./common";
+
+/**
+ * Collect the errors of an asynchronous verification in an array.
+ */
+async function collect(
+  errors: AsyncIterable<AasVerification.VerificationError>
+): Promise<Array<AasVerification.VerificationError>> {
+  const result = new Array<AasVerification.VerificationError>();
+  for await (const error of errors) {
+    result.push(error);
+  }
+  return result;
+}
+
+test("the time-sliced verification gives the same errors", async () => {
+  const jsonDir = path.join(TestCommon.TEST_DATA_DIR, "Json", "ContainedInEnvironment");
+
+  const cache = new AasVerification.VerificationCache(16);
+
+  for (const directory of [
+    path.join(jsonDir, "Expected"),
+    path.join(jsonDir, "Unexpected", "PatternViolation"),
+    path.join(jsonDir, "Unexpected", "InvalidValueExample"),
+    path.join(jsonDir, "Unexpected", "ConstraintViolation")
+  ]) {
+    for (const environment of TestCommon.loadEnvironments(directory)) {
+      const expected = TestCommon.errorsAsStrings(AasVerification.verify(environment));
+
+      for (const slicing of [{ nodeBudget: 1 }, { nodeBudget: 7 }, { timeBudget: 0 }]) {
+        expect(
+          TestCommon.errorsAsStrings(
+            await collect(AasVerification.verifyAsync(environment, true, null, slicing))
+          )
+        ).toEqual(expected);
+      }
+
+      expect(
+        TestCommon.errorsAsStrings(
+          await collect(
+            AasVerification.verifyAsync(environment, true, cache, { nodeBudget: 1 })
+          )
+        )
+      ).toEqual(expected);
+
+      expect(
+        TestCommon.errorsAsStrings(
+          await collect(AasVerification.verifyAsync(environment, false))
+        )
+      ).toEqual(TestCommon.errorsAsStrings(AasVerification.verify(environment, false)));
+    }
+  }
+});
+
+test("the verification can be aborted", async () => {
+  const submodel = new AasTypes.Submodel("urn:something:submodel");
+  submodel.submodelElements = [];
+  for (let i = 0; i < 10; i++) {
+    const property = new AasTypes.Property(AasTypes.DataTypeDefXsd.Int);
+    property.idShort = `property${i}`;
+    property.value = "not a number";
+    submodel.submodelElements.push(property);
+  }
+
+  const controller = new AbortController();
+  const errors = new Array<AasVerification.VerificationError>();
+
+  await expect(
+    (async () => {
+      for await (const error of AasVerification.verifyAsync(submodel, true, null, {
+        nodeBudget: 1,
+        signal: controller.signal
+      })) {
+        errors.push(error);
+        controller.abort(new Error("Stop"));
+      }
+    })()
+  ).rejects.toThrow("Stop");
+
+  expect(errors.length).toBeGreaterThan(0);
+  expect(errors.length).toBeLessThan(
+    Array.from(AasVerification.verify(submodel)).length
+  );
+});
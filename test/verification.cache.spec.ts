@@ -0,0 +1,135 @@
+/**
+ * Test the memoization of the verification checks.
+ */
+
+import * as path from "path";
+
+import * as AasTypes from "../src/types";
+import * as AasVerification from "../src/verification";
+
+import * as TestCommon from "./common";
+
+test("the least recently used result is evicted", () => {
+  const cache = new AasVerification.VerificationCache(2);
+
+  cache.set("a", true);
+  cache.set("b", false);
+  expect(cache.get("a")).toBe(true);
+
+  cache.set("c", true);
+  expect(cache.size).toEqual(2);
+
+  expect(cache.get("b")).toBeUndefined();
+  expect(cache.get("a")).toBe(true);
+  expect(cache.get("c")).toBe(true);
+
+  expect(cache.hits).toEqual(3);
+  expect(cache.misses).toEqual(1);
+
+  cache.clear();
+  expect(cache.size).toEqual(0);
+  expect(cache.hits).toEqual(0);
+  expect(cache.misses).toEqual(0);
+});
+
+test("non-positive capacity is rejected", () => {
+  expect(() => new AasVerification.VerificationCache(0)).toThrow();
+});
+
+test("verification with the cache gives the same errors", () => {
+  const jsonDir = path.join(TestCommon.TEST_DATA_DIR, "Json", "ContainedInEnvironment");
+
+  // We use a small cache on purpose so that the eviction kicks in.
+  const cache = new AasVerification.VerificationCache(16);
+
+  for (const directory of [
+    path.join(jsonDir, "Expected"),
+    path.join(jsonDir, "Unexpected", "PatternViolation"),
+    path.join(jsonDir, "Unexpected", "InvalidValueExample"),
+    path.join(jsonDir, "Unexpected", "DateTimeStampUtcViolationOnFebruary29th")
+  ]) {
+    for (const environment of TestCommon.loadEnvironments(directory)) {
+      const expected = TestCommon.errorsAsStrings(AasVerification.verify(environment));
+      const got = TestCommon.errorsAsStrings(
+        AasVerification.verify(environment, true, cache)
+      );
+
+      expect(got).toEqual(expected);
+    }
+  }
+
+  expect(cache.size).toBeLessThanOrEqual(16);
+  expect(cache.misses).toBeGreaterThan(0);
+});
+
+test("repeated values hit the cache", () => {
+  const cache = new AasVerification.VerificationCache();
+
+  const langStrings = [
+    new AasTypes.LangString("en-GB", "something"),
+    new AasTypes.LangString("en-GB", "something else")
+  ];
+  const instance = new AasTypes.MultiLanguageProperty(
+    null,
+    null,
+    "someIdShort",
+    langStrings
+  );
+
+  expect(
+    TestCommon.errorsAsStrings(AasVerification.verify(instance, true, cache))
+  ).toEqual(TestCommon.errorsAsStrings(AasVerification.verify(instance)));
+  expect(cache.hits).toBeGreaterThan(0);
+});
+
+test("the cache is only active during the verification", () => {
+  const cache = new AasVerification.VerificationCache();
+
+  const iterator = AasVerification.verify(
+    new AasTypes.LangString("invalid language tag", "something"),
+    true,
+    cache
+  );
+  const misses = cache.misses;
+
+  // The verification has not started yet, so the check must not be memoized.
+  expect(AasVerification.matchesBcp47("en")).toBe(true);
+  expect(cache.misses).toEqual(misses);
+
+  expect(TestCommon.errorsAsStrings(iterator).length).toBeGreaterThan(0);
+  expect(cache.misses).toBeGreaterThan(misses);
+});
+
+test("the same value of different types is memoized separately", () => {
+  const cache = new AasVerification.VerificationCache();
+
+  for (const valueType of [
+    AasTypes.DataTypeDefXsd.Decimal,
+    AasTypes.DataTypeDefXsd.Int,
+    AasTypes.DataTypeDefXsd.Decimal
+  ]) {
+    const instance = new AasTypes.Property(
+      valueType,
+      null,
+      null,
+      "someIdShort",
+      null,
+      null,
+      null,
+      null,
+      null,
+      null,
+      null,
+      null,
+      "1.5"
+    );
+
+    const expected = TestCommon.errorsAsStrings(AasVerification.verify(instance));
+    expect(expected.length).toEqual(valueType === AasTypes.DataTypeDefXsd.Int ? 1 : 0);
+    expect(
+      TestCommon.errorsAsStrings(AasVerification.verify(instance, true, cache))
+    ).toEqual(expected);
+  }
+
+  expect(cache.hits).toBeGreaterThan(0);
+});
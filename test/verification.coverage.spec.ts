@@ -0,0 +1,37 @@
+/**
+ * Test that the dispatch tables in the verification cover all the enumeration
+ * literals.
+ *
+ * @remarks
+ * These checks used to run on every import of the verification module. We run
+ * them here instead so that importing the library stays cheap.
+ */
+
+import * as AasTypes from "../src/types";
+import * as AasVerification from "../src/verification";
+
+test("all the literals of DataTypeDefXsd covered in value consistency", () => {
+  for (const literal of AasTypes.overDataTypeDefXsd()) {
+    expect(() => AasVerification.valueConsistentWithXsdType("", literal)).not.toThrow();
+  }
+});
+
+test("all the literals of AasSubmodelElements covered in type checks", () => {
+  const element = new AasTypes.Property(AasTypes.DataTypeDefXsd.String);
+
+  for (const literal of AasTypes.overAasSubmodelElements()) {
+    expect(() =>
+      AasVerification.submodelElementIsOfType(element, literal)
+    ).not.toThrow();
+  }
+
+  expect(
+    AasVerification.submodelElementIsOfType(
+      element,
+      AasTypes.AasSubmodelElements.Property
+    )
+  ).toBe(true);
+  expect(
+    AasVerification.submodelElementIsOfType(element, AasTypes.AasSubmodelElements.Blob)
+  ).toBe(false);
+});
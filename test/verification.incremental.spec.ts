@@ -0,0 +1,106 @@
+/**
+ * Test the incremental verification.
+ */
+
+import * as path from "path";
+
+import * as AasTracking from "../src/tracking";
+import * as AasTypes from "../src/types";
+import * as AasVerification from "../src/verification";
+
+import * as TestCommon from "./common";
+
+function newProperty(idShort: string): AasTypes.Property {
+  const property = new AasTypes.Property(AasTypes.DataTypeDefXsd.Int);
+  property.idShort = idShort;
+  property.value = "1";
+  return property;
+}
+
+function newEnvironment(): AasTypes.Environment {
+  const collection = new AasTypes.SubmodelElementCollection();
+  collection.idShort = "collection";
+  collection.value = [newProperty("first"), newProperty("second")];
+
+  const submodel = new AasTypes.Submodel("urn:something:submodel");
+  submodel.submodelElements = [collection, newProperty("third")];
+
+  const other = new AasTypes.Submodel("urn:something:other");
+  other.submodelElements = [newProperty("fourth")];
+
+  return new AasTypes.Environment(null, [submodel, other]);
+}
+
+test("the replayed errors are the same as the verified ones", () => {
+  const jsonDir = path.join(TestCommon.TEST_DATA_DIR, "Json", "ContainedInEnvironment");
+
+  for (const directory of [
+    path.join(jsonDir, "Expected"),
+    path.join(jsonDir, "Unexpected", "PatternViolation"),
+    path.join(jsonDir, "Unexpected", "InvalidValueExample"),
+    path.join(jsonDir, "Unexpected", "ConstraintViolation")
+  ]) {
+    for (const environment of TestCommon.loadEnvironments(directory)) {
+      const expected = TestCommon.errorsAsStrings(AasVerification.verify(environment));
+
+      const verifier = new AasVerification.IncrementalVerifier();
+      expect(TestCommon.errorsAsStrings(verifier.verify(environment))).toEqual(
+        expected
+      );
+      expect(TestCommon.errorsAsStrings(verifier.verify(environment))).toEqual(
+        expected
+      );
+    }
+  }
+});
+
+test("only the dirty instances are verified again", () => {
+  const environment = newEnvironment();
+  const tracker = new AasTracking.ChangeTracker(environment);
+  const verifier = new AasVerification.IncrementalVerifier();
+
+  expect(TestCommon.errorsAsStrings(verifier.verify(environment))).toEqual([]);
+
+  const submodel = (environment.submodels ?? [])[0];
+  const collection = <AasTypes.SubmodelElementCollection>(
+    (submodel.submodelElements ?? [])[0]
+  );
+  const other = (environment.submodels ?? [])[1];
+
+  // Break the uniqueness of the ID-shorts in the collection.
+  tracker.set((collection.value ?? [])[1], "idShort", "first");
+  verifier.invalidate(tracker.takeDirty());
+
+  const expected = TestCommon.errorsAsStrings(AasVerification.verify(environment));
+  expect(expected).not.toEqual([]);
+  expect(TestCommon.errorsAsStrings(verifier.verify(environment))).toEqual(expected);
+
+  // We do not tell the verifier about this one, so it replays the old result.
+  (<AasTypes.Property>(other.submodelElements ?? [])[0]).value = "not a number";
+  expect(TestCommon.errorsAsStrings(verifier.verify(environment))).toEqual(expected);
+
+  tracker.markDirty((other.submodelElements ?? [])[0], "value");
+  verifier.invalidate(tracker.takeDirty());
+  expect(TestCommon.errorsAsStrings(verifier.verify(environment))).toEqual(
+    TestCommon.errorsAsStrings(AasVerification.verify(environment))
+  );
+
+  verifier.clear();
+  expect(TestCommon.errorsAsStrings(verifier.verify(environment))).toEqual(
+    TestCommon.errorsAsStrings(AasVerification.verify(environment))
+  );
+});
+
+test("an interrupted verification is not remembered", () => {
+  const environment = newEnvironment();
+  const submodel = (environment.submodels ?? [])[0];
+  submodel.submodelElements = [newProperty("first"), newProperty("first")];
+
+  const verifier = new AasVerification.IncrementalVerifier();
+  const expected = TestCommon.errorsAsStrings(AasVerification.verify(environment));
+  expect(expected.length).toBeGreaterThan(0);
+
+  verifier.verify(environment).next();
+
+  expect(TestCommon.errorsAsStrings(verifier.verify(environment))).toEqual(expected);
+});
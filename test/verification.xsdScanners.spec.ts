@@ -0,0 +1,384 @@
+/**
+ * Test the scanners of the XSD values against the regular expressions.
+ *
+ * @remarks
+ * The checks such as {@link verification.isXsDate} are implemented as hand-written
+ * scanners. We generate random values by mutating the interesting examples, and
+ * compare the scanners against the reference implementation based on
+ * the patterns from the `matches*` functions.
+ */
+
+import * as AasVerification from "../src/verification";
+
+const DAYS_IN_MONTH = new Map<number, number>([
+  [1, 31],
+  [2, 29],
+  [3, 31],
+  [4, 30],
+  [5, 31],
+  [6, 30],
+  [7, 31],
+  [8, 31],
+  [9, 30],
+  [10, 31],
+  [11, 30],
+  [12, 31]
+]);
+
+const DATE_PREFIX_RE = new RegExp("^(-?[0-9]+)-([0-9]{2})-([0-9]{2})");
+
+function referenceIsXsDate(value: string): boolean {
+  if (!AasVerification.matchesXsDate(value)) {
+    return false;
+  }
+
+  const match = DATE_PREFIX_RE.exec(value);
+  if (match === null) {
+    return false;
+  }
+
+  const year = parseInt(match[1], 10);
+  const month = parseInt(match[2], 10);
+  const day = parseInt(match[3], 10);
+
+  if (year === 0 || day <= 0 || month <= 0 || month >= 13) {
+    return false;
+  }
+
+  const maxDays =
+    month === 2
+      ? AasVerification.isLeapYear(year)
+        ? 29
+        : 28
+      : DAYS_IN_MONTH.get(month) ?? 0;
+
+  return day <= maxDays;
+}
+
+function referenceIsXsFloatingPoint(
+  matches: (text: string) => boolean,
+  value: string,
+  single: boolean
+): boolean {
+  if (!matches(value)) {
+    return false;
+  }
+
+  if (value === "INF" || value === "-INF" || value === "NaN") {
+    return true;
+  }
+
+  const converted = parseFloat(value);
+  return isFinite(converted) && (!single || isFinite(Math.fround(converted)));
+}
+
+function referenceIsIntegerWithin(
+  matches: (text: string) => boolean,
+  value: string,
+  smallestWithoutSign: string | null,
+  largest: string
+): boolean {
+  if (!matches(value)) {
+    return false;
+  }
+
+  if (value === "-0") {
+    return true;
+  }
+
+  const negative = value[0] === "-";
+  const digits = value.replace(/^[-+]?0*/, "");
+  const limit =
+    negative && smallestWithoutSign !== null ? smallestWithoutSign : largest;
+
+  if (digits.length !== limit.length) {
+    return digits.length < limit.length;
+  }
+  return digits <= limit;
+}
+
+const REFERENCES = new Map<string, (value: string) => boolean>([
+  ["isXsDate", referenceIsXsDate],
+  [
+    "isXsDateTime",
+    (value) =>
+      AasVerification.matchesXsDateTime(value) &&
+      referenceIsXsDate(value.split("T", 1)[0])
+  ],
+  [
+    "isXsDateTimeStamp",
+    (value) =>
+      AasVerification.matchesXsDateTimeStamp(value) &&
+      referenceIsXsDate(value.split("T", 1)[0])
+  ],
+  [
+    "isXsDateTimeStampUtc",
+    (value) =>
+      AasVerification.matchesXsDateTimeStampUtc(value) &&
+      referenceIsXsDate(value.split("T", 1)[0])
+  ],
+  [
+    "isXsGMonthDay",
+    (value) =>
+      AasVerification.matchesXsGMonthDay(value) &&
+      parseInt(value.substring(5, 7), 10) <=
+        (DAYS_IN_MONTH.get(parseInt(value.substring(2, 4), 10)) ?? 0)
+  ],
+  [
+    "isXsDouble",
+    (value) => referenceIsXsFloatingPoint(AasVerification.matchesXsDouble, value, false)
+  ],
+  [
+    "isXsFloat",
+    (value) => referenceIsXsFloatingPoint(AasVerification.matchesXsFloat, value, true)
+  ],
+  [
+    "isXsLong",
+    (value) =>
+      referenceIsIntegerWithin(
+        AasVerification.matchesXsLong,
+        value,
+        "9223372036854775808",
+        "9223372036854775807"
+      )
+  ],
+  [
+    "isXsInt",
+    (value) =>
+      referenceIsIntegerWithin(
+        AasVerification.matchesXsInt,
+        value,
+        "2147483648",
+        "2147483647"
+      )
+  ],
+  [
+    "isXsShort",
+    (value) =>
+      referenceIsIntegerWithin(AasVerification.matchesXsShort, value, "32768", "32767")
+  ],
+  [
+    "isXsByte",
+    (value) =>
+      referenceIsIntegerWithin(AasVerification.matchesXsByte, value, "128", "127")
+  ],
+  [
+    "isXsUnsignedLong",
+    (value) =>
+      referenceIsIntegerWithin(
+        AasVerification.matchesXsUnsignedLong,
+        value,
+        null,
+        "18446744073709551615"
+      )
+  ],
+  [
+    "isXsUnsignedInt",
+    (value) =>
+      referenceIsIntegerWithin(
+        AasVerification.matchesXsUnsignedInt,
+        value,
+        null,
+        "4294967295"
+      )
+  ],
+  [
+    "isXsUnsignedShort",
+    (value) =>
+      referenceIsIntegerWithin(
+        AasVerification.matchesXsUnsignedShort,
+        value,
+        null,
+        "65535"
+      )
+  ],
+  [
+    "isXsUnsignedByte",
+    (value) =>
+      referenceIsIntegerWithin(
+        AasVerification.matchesXsUnsignedByte,
+        value,
+        null,
+        "255"
+      )
+  ]
+]);
+
+const SCANNERS = new Map<string, (value: string) => boolean>([
+  ["isXsDate", AasVerification.isXsDate],
+  ["isXsDateTime", AasVerification.isXsDateTime],
+  ["isXsDateTimeStamp", AasVerification.isXsDateTimeStamp],
+  ["isXsDateTimeStampUtc", AasVerification.isXsDateTimeStampUtc],
+  ["isXsGMonthDay", AasVerification.isXsGMonthDay],
+  ["isXsDouble", AasVerification.isXsDouble],
+  ["isXsFloat", AasVerification.isXsFloat],
+  ["isXsLong", AasVerification.isXsLong],
+  ["isXsInt", AasVerification.isXsInt],
+  ["isXsShort", AasVerification.isXsShort],
+  ["isXsByte", AasVerification.isXsByte],
+  ["isXsUnsignedLong", AasVerification.isXsUnsignedLong],
+  ["isXsUnsignedInt", AasVerification.isXsUnsignedInt],
+  ["isXsUnsignedShort", AasVerification.isXsUnsignedShort],
+  ["isXsUnsignedByte", AasVerification.isXsUnsignedByte]
+]);
+
+const DATES = [
+  "2022-02-28",
+  "2020-02-29",
+  "-0001-02-29",
+  "0001-01-01",
+  "12345-12-31Z",
+  "2022-01-01+13:59",
+  "2022-01-0114:00",
+  "2022-01-01-14:00",
+  "2000-02-29",
+  "1900-02-29",
+  "-0004-02-29"
+];
+
+const DATE_TIMES = [
+  "2022-02-28T12:34:56",
+  "2022-02-28T24:00:00.000",
+  "2022-02-28T23:59:59.123Z",
+  "2022-02-28T00:00:00.0114:00",
+  "2022-02-28T12:00:00+14:00",
+  "-0001-02-29T00:00:00-13:00"
+];
+
+const G_MONTH_DAYS = [
+  "--02-29",
+  "--04-31",
+  "--12-31Z",
+  "--01-01+14:00",
+  "--01-0114:00",
+  "--13-01"
+];
+
+const NUMBERS = [
+  "0",
+  "-0",
+  "+0",
+  "9223372036854775807",
+  "-9223372036854775808",
+  "9223372036854775799",
+  "18446744073709551615",
+  "2147483647",
+  "-2147483648",
+  "4294967295",
+  "32767",
+  "65535",
+  "127",
+  "-128",
+  "255",
+  "00000000000000000000000001",
+  "1.5e308",
+  "1.8e308",
+  "3.4e38",
+  "3.5e38",
+  "INF",
+  "-INF",
+  "NaN",
+  ".5",
+  "1.",
+  "1e-400",
+  "+.1E+5"
+];
+
+const EXAMPLES = new Map<string, Array<string>>([
+  ["isXsDate", DATES],
+  ["isXsDateTime", DATE_TIMES.concat(DATES)],
+  ["isXsDateTimeStamp", DATE_TIMES],
+  ["isXsDateTimeStampUtc", DATE_TIMES],
+  ["isXsGMonthDay", G_MONTH_DAYS],
+  ["isXsDouble", NUMBERS],
+  ["isXsFloat", NUMBERS],
+  ["isXsLong", NUMBERS],
+  ["isXsInt", NUMBERS],
+  ["isXsShort", NUMBERS],
+  ["isXsByte", NUMBERS],
+  ["isXsUnsignedLong", NUMBERS],
+  ["isXsUnsignedInt", NUMBERS],
+  ["isXsUnsignedShort", NUMBERS],
+  ["isXsUnsignedByte", NUMBERS]
+]);
+
+/**
+ * Generate pseudo-random numbers deterministically so that the failures are
+ * reproducible.
+ */
+class Random {
+  private state: number;
+
+  constructor(seed: number) {
+    this.state = seed;
+  }
+
+  /**
+   * @returns a pseudo-random integer in `[0, end)`
+   */
+  below(end: number): number {
+    // Linear congruential generator from Numerical Recipes. We use only the higher
+    // bits since the lower bits have short periods.
+    this.state = (Math.imul(this.state, 1664525) + 1013904223) >>> 0;
+    return (this.state >>> 8) % end;
+  }
+}
+
+const ALPHABET = "0123456789-+:.TZEeINF14 ";
+
+function mutate(text: string, random: Random): string {
+  const index = random.below(text.length + 1);
+  const character = ALPHABET[random.below(ALPHABET.length)];
+
+  switch (random.below(4)) {
+    case 0:
+      return text.substring(0, index) + character + text.substring(index);
+    case 1:
+      return text.substring(0, index) + text.substring(index + 1);
+    case 2:
+      return text.substring(0, index) + character + text.substring(index + 1);
+    default:
+      return (
+        text.substring(0, index) +
+        text.substring(index).replace(/[0-9]/, `${random.below(10)}`)
+      );
+  }
+}
+
+for (const [name, scanner] of SCANNERS) {
+  test(`${name} agrees with the reference on random values`, () => {
+    const reference = REFERENCES.get(name);
+    const examples = EXAMPLES.get(name);
+    if (reference === undefined || examples === undefined) {
+      throw new Error(`Unexpected no reference or examples for ${name}`);
+    }
+
+    const random = new Random(1984);
+
+    for (let i = 0; i < 20000; i++) {
+      let value = examples[random.below(examples.length)];
+
+      const mutations = random.below(4);
+      for (let j = 0; j < mutations; j++) {
+        value = mutate(value, random);
+      }
+
+      if (scanner(value) !== reference(value)) {
+        throw new Error(
+          `Expected ${name}(${JSON.stringify(value)}) to be ${reference(value)}, ` +
+            `but got ${scanner(value)}`
+        );
+      }
+    }
+  });
+}
+
+test("the digits of a long are compared from the left", () => {
+  expect(AasVerification.isXsLong("9223372036854775799")).toBe(true);
+  expect(AasVerification.isXsLong("-9223372036854775799")).toBe(true);
+  expect(AasVerification.isXsUnsignedLong("18446744073709551599")).toBe(true);
+});
+
+test("negative zero is a valid unsigned long", () => {
+  expect(AasVerification.isXsUnsignedLong("-0")).toBe(true);
+});